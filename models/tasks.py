@@ -144,6 +144,26 @@ def org_site_check(site_id, user_id=None):
         customise(site_id)
         db.commit()
 
+# -----------------------------------------------------------------------------
+# Reports: always-enabled
+# -----------------------------------------------------------------------------
+def report_aggregates_refresh(tablename, rebuild=False, user_id=None):
+    """
+        Refresh the materialized pivot table aggregates for a table
+
+        @param tablename: the table name
+        @param rebuild: rebuild the aggregates entirely rather than just
+                        refreshing the changed partitions
+        @param user_id: calling request's auth.user.id or None
+    """
+    if user_id:
+        # Authenticate
+        auth.s3_impersonate(user_id)
+    # Run the Task & return the result
+    result = s3base.PivotTableAggregates.refresh_all(tablename, rebuild=rebuild)
+    db.commit()
+    return result
+
 # -----------------------------------------------------------------------------
 tasks = {"dummy": dummy,
          "s3db_task": s3db_task,
@@ -152,6 +172,7 @@ tasks = {"dummy": dummy,
          "gis_download_kml": gis_download_kml,
          "gis_update_location_tree": gis_update_location_tree,
          "org_site_check": org_site_check,
+         "report_aggregates_refresh": report_aggregates_refresh,
          }
 
 # -----------------------------------------------------------------------------
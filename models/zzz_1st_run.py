@@ -369,6 +369,10 @@ if len(pop_list) > 0:
         # autovacuum should be on anyway so will run ANALYZE after 50 rows inserted/updated/deleted
         #db.executesql("VACUUM ANALYZE;")
 
+    if has_module("fin"):
+        # Index on voucher transactions (for chain verification)
+        s3db.fin_voucher_create_indexes()
+
     # =========================================================================
     info("\n*** FIRST RUN COMPLETE ***\n")
 
@@ -4141,6 +4141,7 @@ Please go to %(url)s to approve this user."""
             # Remove all permission rules for this role
             ptable = self.permission.table
             db(ptable.group_id == group_id).update(**data)
+            self.permission.expire_acl_cache()
 
             # Remove the role
             deleted_uuid = "%s-deleted-%s" % (uuid4().hex[-12:], role.uuid[:40])
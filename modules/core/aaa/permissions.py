@@ -28,6 +28,9 @@
 __all__ = ("S3Permission",
            )
 
+import hashlib
+import time
+
 from collections import OrderedDict
 
 from gluon import current, redirect, HTTP, URL
@@ -37,7 +40,7 @@ from s3dal import Field, Row, Table, original_tablename
 
 from ..model import MetaFields
 from ..errors import S3PermissionError
-from ..tools import s3_get_extension
+from ..tools import TableVersion, s3_get_extension
 
 # =============================================================================
 class S3Permission:
@@ -45,6 +48,18 @@ class S3Permission:
 
     TABLENAME = "s3_permission"
 
+    # Generation of the cross-request ACL cache in this process,
+    # incremented whenever ACLs or affiliations change
+    acl_generation = 0
+
+    # Tables of the realm hierarchy (besides the ACL table itself),
+    # which invalidate the cross-request ACL cache when changed
+    ACL_TABLES = ("pr_role",
+                  "pr_affiliation",
+                  "pr_person_user",
+                  "hrm_delegation",
+                  )
+
     CREATE = 0x0001     # Permission to create new records
     READ = 0x0002       # Permission to read records
     UPDATE = 0x0004     # Permission to update records
@@ -149,6 +164,19 @@ class S3Permission:
         self.permission_cache = {}
         self.query_cache = {}
 
+        # Cross-request cache for applicable ACLs
+        self.acl_cache = settings.get_security_acl_cache()
+        self._acl_version = None
+        self._realms_key = None
+
+        # Instrumentation
+        self.stats = {"checks": 0,
+                      "time": 0.0,
+                      "lookups": 0,
+                      "hits": 0,
+                      }
+        self._depth = 0
+
         # Pages which never require permission:
         # Make sure that any data access via these pages uses
         # accessible_query explicitly!
@@ -173,6 +201,84 @@ class S3Permission:
         self.permission_cache = {}
         self.query_cache = {}
 
+        # Re-check the ACL version for the cross-request cache
+        self._acl_version = None
+
+    # -------------------------------------------------------------------------
+    def expire_acl_cache(self):
+        """
+            Invalidate all ACLs cached across requests, to be called
+            whenever ACLs or affiliations change (other processes will
+            detect the change by the ACL version)
+        """
+
+        S3Permission.acl_generation += 1
+        self._acl_version = None
+
+    # -------------------------------------------------------------------------
+    def acl_version(self):
+        """
+            Get a version token for the ACLs and the realm hierarchy,
+            to key the cross-request cache of applicable ACLs; changes
+            whenever an ACL, an OU role, an affiliation, a person-user
+            link or a delegation is added, updated or deleted
+
+            Returns:
+                the version token (string)
+
+            Note:
+                Uses the table version counters (see TableVersion), so
+                changes in other processes are only detected if a shared
+                counter store is configured, otherwise when the cached
+                ACLs expire
+        """
+
+        version = self._acl_version
+        if version is None:
+            version = self._acl_version = TableVersion.token(self.ACL_TABLES + (self.tablename,))
+
+        return "%s|%s" % (self.acl_generation, version)
+
+    # -------------------------------------------------------------------------
+    def log_stats(self):
+        """
+            Log the number of and the time spent in permission checks
+            during the current request (debug-level)
+        """
+
+        stats = self.stats
+        if stats["checks"]:
+            current.log.debug("Permission checks: %(checks)s in %(time).3f sec, "
+                              "ACL cache hits: %(hits)s/%(lookups)s" % stats)
+
+    # -------------------------------------------------------------------------
+    def _start_timer(self):
+        """
+            Start timing a permission check, unless nested in another
+            permission check
+
+            Returns:
+                the start time, or None if nested
+        """
+
+        self._depth += 1
+        return time.perf_counter() if self._depth == 1 else None
+
+    # -------------------------------------------------------------------------
+    def _stop_timer(self, start):
+        """
+            Stop timing a permission check and update the stats
+
+            Args:
+                start: the start time as returned from _start_timer
+        """
+
+        self._depth -= 1
+        if start is not None:
+            stats = self.stats
+            stats["checks"] += 1
+            stats["time"] += time.perf_counter() - start
+
     # -------------------------------------------------------------------------
     def check_settings(self):
         """
@@ -326,6 +432,7 @@ class S3Permission:
         if "restricted_tables" in s3:
             del s3["restricted_tables"]
         self.clear_cache()
+        self.expire_acl_cache()
 
         if c is None and f is None and t is None:
             return None
@@ -937,6 +1044,21 @@ class S3Permission:
                 record: the record or record ID (None for any record)
         """
 
+        start = self._start_timer()
+        try:
+            permitted = self.__has_permission(method, c=c, f=f, t=t, record=record)
+        finally:
+            self._stop_timer(start)
+
+        return permitted
+
+    # -------------------------------------------------------------------------
+    def __has_permission(self, method, c=None, f=None, t=None, record=None):
+        """
+            Check permission to access a record with method (untimed),
+            see has_permission for args
+        """
+
         # Auth override
         auth = self.auth
         if auth.override:
@@ -1078,6 +1200,21 @@ class S3Permission:
                 f: function name (falls back to current request)
         """
 
+        start = self._start_timer()
+        try:
+            query = self.__accessible_query(method, table, c=c, f=f, deny=deny)
+        finally:
+            self._stop_timer(start)
+
+        return query
+
+    # -------------------------------------------------------------------------
+    def __accessible_query(self, method, table, c=None, f=None, deny=True):
+        """
+            Returns a query to select the accessible records for method
+            in table (untimed), see accessible_query for args
+        """
+
         # Get the table
         if not hasattr(table, "_tablename"):
             tablename = table
@@ -1382,6 +1519,77 @@ class S3Permission:
                 - None for no ACLs defined (allow), or
                 - [] for no ACLs applicable (deny), or
                 - list of applicable ACLs
+
+            Note:
+                If security.acl_cache is configured, the result is cached
+                across requests, keyed by the ACL version, the realms and
+                the access situation
+        """
+
+        ttl = self.acl_cache
+        if not ttl or not realms or not self.use_cacls:
+            return self.__applicable_acls(racl,
+                                          realms = realms,
+                                          c = c,
+                                          f = f,
+                                          t = t,
+                                          entity = entity,
+                                          )
+
+        c = c or self.controller
+        f = f or self.function
+        if hasattr(t, "_tablename"):
+            t = original_tablename(t)
+
+        # Digest of the realms (computed only once per request)
+        realms_key = self._realms_key
+        if realms_key is None or realms_key[0] is not realms:
+            items = sorted((role, sorted(entities) if entities is not None else None)
+                           for role, entities in realms.items())
+            digest = hashlib.sha1(repr(items).encode("utf-8")).hexdigest()
+            realms_key = self._realms_key = (realms, digest)
+
+        key = "s3_acls/%s/%s/%s/%s/%s/%s/%s/%s" % (self.policy,
+                                                   self.acl_version(),
+                                                   realms_key[1],
+                                                   racl,
+                                                   c,
+                                                   f,
+                                                   t,
+                                                   entity,
+                                                   )
+        stats = self.stats
+        stats["lookups"] += 1
+
+        missed = []
+        def lookup():
+            missed.append(key)
+            return self.__applicable_acls(racl,
+                                          realms = realms,
+                                          c = c,
+                                          f = f,
+                                          t = t,
+                                          entity = entity,
+                                          )
+
+        acls = current.cache.ram(key, lookup, time_expire=ttl)
+        if not missed:
+            stats["hits"] += 1
+
+        return acls
+
+    # -------------------------------------------------------------------------
+    def __applicable_acls(self, racl,
+                          realms = None,
+                          c = None,
+                          f = None,
+                          t = None,
+                          entity = None
+                          ):
+        """
+            Find all applicable ACLs for the specified situation for
+            the specified realms and delegations (uncached), see
+            applicable_acls for args
         """
 
         if not self.use_cacls:
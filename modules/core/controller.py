@@ -606,6 +606,9 @@ class CRUDRequest:
             # to be able to make use of it
             output["r"] = self
 
+        # Report permission check timing
+        current.auth.permission.log_stats()
+
         # Redirection
         # NB must re-read self.http/method here in case the have
         # been changed during prep, method handling or postp
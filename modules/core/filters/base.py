@@ -691,6 +691,10 @@ class FilterForm:
                 a list of form rows
         """
 
+        # Look up the options of all options filters at once
+        from .options import OptionsFilter
+        OptionsFilter.prefetch(self.widgets, resource)
+
         rows = []
         rappend = rows.append
         advanced = False
@@ -29,6 +29,7 @@ __all__ = ("OptionsFilter",
            "HierarchyFilter",
            )
 
+import hashlib
 import re
 
 from collections import OrderedDict
@@ -36,7 +37,7 @@ from collections import OrderedDict
 from gluon import current, DIV, INPUT, LABEL, SPAN, TAG, IS_IN_SET
 from gluon.storage import Storage
 
-from ..tools import s3_get_foreign_key, s3_str
+from ..tools import TableVersion, s3_get_foreign_key, s3_str
 from ..ui import S3CascadeSelectWidget, S3GroupedOptionsWidget, \
                  S3HierarchyWidget, S3MultiSelectWidget
 from ..resource import S3ResourceField, S3ResourceQuery, S3URLQuery
@@ -99,6 +100,9 @@ class OptionsFilter(FilterWidget):
 
     alternatives = ["anyof", "contains"]
 
+    # Option keys looked up in batch, tuple (resource, colname, opt_keys)
+    _prefetched = None
+
     # -------------------------------------------------------------------------
     def widget(self, resource, values):
         """
@@ -381,92 +385,58 @@ class OptionsFilter(FilterWidget):
                 list of options (keys only, no represent)
         """
 
-        colname, rows = None, None
+        # Looked up in batch?
+        prefetched = self._prefetched
+        if prefetched:
+            self._prefetched = None
+            if prefetched[0] is resource and prefetched[1] == rfield.colname:
+                return list(prefetched[2])
 
-        field = rfield.field
-        if field and self.opts.reverse_lookup is not False:
-            virtual = False
-
-            ktablename, key = s3_get_foreign_key(field, m2m=False)[:2]
-            if ktablename:
-                ktable = current.s3db.table(ktablename)
-                key_field = ktable[key]
-                colname = str(key_field)
+        return OptionsLookup(resource)(self, rfield)
 
-                # Try a reverse-lookup, i.e. select records from the
-                # referenced table that are linked to at least one
-                # record in the filtered table
-                query = resource.get_query()
-                rfilter = resource.rfilter
-                if rfilter:
-                    join = rfilter.get_joins()
-                    left = rfilter.get_joins(left=True)
-                else:
-                    join = left = None
+    # -------------------------------------------------------------------------
+    @classmethod
+    def prefetch(cls, widgets, resource):
+        """
+            Look up the options of all options filters in a filter form
+            at once, sharing the filtered query and the cache versions
 
-                query &= (key_field == field) & \
-                         current.auth.s3_accessible_query("read", ktable)
+            Args:
+                widgets: the filter widgets
+                resource: the CRUDResource to filter
 
-                # If the filter field is in a joined table itself,
-                # include the join for that table
-                joins = rfield.join
-                for tname in joins:
-                    query &= joins[tname]
+            Note:
+                Options are prefetched for the next rendering of each
+                widget with the same resource
+        """
 
-                opts = self.opts
+        if resource is None or not widgets:
+            return
 
-                # Filter options by location?
-                location_filter = opts.get("location_filter")
-                if location_filter and "location_id" in ktable:
-                    location = current.session.s3.location_filter
-                    if location:
-                        query &= (ktable.location_id == location)
+        lookup = None
+        for widget in widgets:
 
-                # Filter options by organisation?
-                org_filter = opts.get("org_filter")
-                if org_filter and "organisation_id" in ktable:
-                    root_org = current.auth.root_org()
-                    if root_org:
-                        query &= ((ktable.organisation_id == root_org) | \
-                                  (ktable.organisation_id == None))
+            if not isinstance(widget, cls) or \
+               type(widget)._lookup_options is not cls._lookup_options:
+                continue
 
-                rows = current.db(query).select(key_field,
-                                                resource._id.min(),
-                                                groupby = key_field,
-                                                join = join,
-                                                left = left,
-                                                )
-        else:
-            virtual = not bool(field)
+            opts = widget.opts
+            if opts.options is not None or opts.get("resource"):
+                continue
 
-        if rows is None:
-            # Fall back to regular forward-lookup, i.e. select all
-            # unique values in the filter field
-            multiple = rfield.ftype[:5] == "list:"
-            groupby = field if field and not multiple else None
-            rows = resource.select([rfield.selector],
-                                   limit = None,
-                                   groupby = groupby,
-                                   virtual = virtual,
-                                   as_rows = True,
-                                   )
-            colname = rfield.colname
-        else:
-            multiple = False
-
-        # Extract option keys from rows
-        opt_keys = set()
-        if rows:
-            for row in rows:
-                val = row[colname]
-                if virtual and callable(val):
-                    val = val()
-                if (multiple or virtual) and isinstance(val, (list, tuple, set)):
-                    opt_keys.update(val)
-                else:
-                    opt_keys.add(val)
+            selector = widget.field
+            if isinstance(selector, (tuple, list)):
+                selector = selector[0]
+            try:
+                rfield = S3ResourceField(resource, selector)
+            except (AttributeError, SyntaxError):
+                continue
+            if rfield.ftype == "boolean":
+                continue
 
-        return list(opt_keys)
+            if lookup is None:
+                lookup = OptionsLookup(resource)
+            widget._prefetched = (resource, rfield.colname, lookup(widget, rfield))
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -643,6 +613,196 @@ class OptionsFilter(FilterWidget):
 
         return []
 
+# =============================================================================
+class OptionsLookup:
+    """
+        Lookup of the option keys of options filters, with cross-request
+        caching of the results (search.filter_options_cache); the cache
+        entries are keyed by the filter query (incl. the realms of the
+        user) and the version counters of all tables involved (TableVersion),
+        so they expire when any of these tables is written to
+    """
+
+    def __init__(self, resource):
+        """
+            Args:
+                resource: the CRUDResource to filter
+        """
+
+        self.resource = resource
+        self.ttl = current.deployment_settings.get_search_filter_options_cache()
+
+        self._filter = None
+
+    # -------------------------------------------------------------------------
+    def __call__(self, widget, rfield):
+        """
+            Look up the option keys for a filter widget
+
+            Args:
+                widget: the OptionsFilter
+                rfield: the filter field (S3ResourceField)
+
+            Returns:
+                list of option keys
+        """
+
+        db = current.db
+
+        resource = self.resource
+        field = rfield.field
+        opts = widget.opts
+
+        lookup = None
+
+        if field and opts.reverse_lookup is not False:
+            virtual = False
+
+            ktablename, key = s3_get_foreign_key(field, m2m=False)[:2]
+            if ktablename:
+                ktable = current.s3db.table(ktablename)
+                key_field = ktable[key]
+                colname = str(key_field)
+
+                # Try a reverse-lookup, i.e. select records from the
+                # referenced table that are linked to at least one
+                # record in the filtered table
+                query, join, left, tablenames = self.filter()
+
+                query &= (key_field == field) & \
+                         current.auth.s3_accessible_query("read", ktable)
+
+                # If the filter field is in a joined table itself,
+                # include the join for that table
+                joins = rfield.join
+                for tname in joins:
+                    query &= joins[tname]
+
+                # Filter options by location?
+                location_filter = opts.get("location_filter")
+                if location_filter and "location_id" in ktable:
+                    location = current.session.s3.location_filter
+                    if location:
+                        query &= (ktable.location_id == location)
+
+                # Filter options by organisation?
+                org_filter = opts.get("org_filter")
+                if org_filter and "organisation_id" in ktable:
+                    root_org = current.auth.root_org()
+                    if root_org:
+                        query &= ((ktable.organisation_id == root_org) | \
+                                  (ktable.organisation_id == None))
+
+                lookup = lambda: db(query).select(key_field,
+                                                  resource._id.min(),
+                                                  groupby = key_field,
+                                                  join = join,
+                                                  left = left,
+                                                  )
+                multiple = False
+                signature = (query, join, left, colname)
+                tablenames = tablenames | {ktablename} | set(joins)
+        else:
+            virtual = not bool(field)
+
+        if lookup is None:
+            # Fall back to regular forward-lookup, i.e. select all
+            # unique values in the filter field
+            multiple = rfield.ftype[:5] == "list:"
+            groupby = field if field and not multiple else None
+            colname = rfield.colname
+            lookup = lambda: resource.select([rfield.selector],
+                                             limit = None,
+                                             groupby = groupby,
+                                             virtual = virtual,
+                                             as_rows = True,
+                                             )
+            if not virtual:
+                query, join, left, tablenames = self.filter()
+                signature = (query, join, left, colname, groupby)
+                tablenames = tablenames | set(rfield.join)
+
+        def extract():
+            # Extract option keys from rows
+            rows = lookup()
+            opt_keys = set()
+            if rows:
+                for row in rows:
+                    val = row[colname]
+                    if virtual and callable(val):
+                        val = val()
+                    if (multiple or virtual) and isinstance(val, (list, tuple, set)):
+                        opt_keys.update(val)
+                    else:
+                        opt_keys.add(val)
+            return list(opt_keys)
+
+        ttl = self.ttl
+        if not ttl or virtual:
+            return extract()
+
+        items = []
+        for item in signature:
+            if isinstance(item, list):
+                items.extend(str(i) for i in item)
+            else:
+                items.append(str(item))
+        items.append(self.version(tablenames))
+        digest = hashlib.sha1("|".join(items).encode("utf-8")).hexdigest()
+
+        return list(current.cache.ram("filter_options/%s" % digest,
+                                      extract,
+                                      time_expire = ttl,
+                                      ))
+
+    # -------------------------------------------------------------------------
+    def filter(self):
+        """
+            Get the query and joins of the filtered resource (computed
+            only once for all widgets)
+
+            Returns:
+                tuple (query, join, left, tablenames), tablenames being
+                the set of names of all tables involved
+        """
+
+        result = self._filter
+        if result is None:
+
+            resource = self.resource
+            query = resource.get_query()
+            tablenames = {resource.tablename}
+
+            rfilter = resource.rfilter
+            if rfilter:
+                join = rfilter.get_joins(as_list=False)
+                left = rfilter.get_joins(left=True, as_list=False)
+                tablenames.update(join)
+                tablenames.update(left)
+                join = [j for tn in join for j in join[tn]]
+                left = [j for tn in left for j in left[tn]]
+            else:
+                join = left = None
+
+            result = self._filter = (query, join, left, tablenames)
+
+        return result
+
+    # -------------------------------------------------------------------------
+    def version(self, tablenames):
+        """
+            Get a version token for the contents of tables, changes
+            whenever a record in any of the tables is written to
+
+            Args:
+                tablenames: the table names
+
+            Returns:
+                the version token (string)
+        """
+
+        return TableVersion.token(tablenames)
+
 # =============================================================================
 class HierarchyFilter(FilterWidget):
     """
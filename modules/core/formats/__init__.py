@@ -4,4 +4,4 @@ from .shp import SHPWriter
 from .svg import SVGWriter
 from .xls import XLSWriter
 from .xlsx import XLSXWriter, XLSXPivotTableWriter
-from .xml import S3XML, S3EntityResolver, S3XMLFormat
+from .xml import S3XML, S3EntityResolver, S3XMLFormat, XSLTCache
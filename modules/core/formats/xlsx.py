@@ -69,6 +69,9 @@ class XLSXWriter(FormatWriter):
                 even_odd: when using colors, render different background colors
                           for even/odd rows (boolean, default True)
                 as_stream: return BytesIO rather than bytes
+                chunk_size: extract and write the data from a CRUDResource
+                            in chunks of this size, and stream the output
+                            from a temporary file (see encode_chunked)
         """
 
         T = current.T
@@ -93,6 +96,31 @@ class XLSXWriter(FormatWriter):
             title = current.T("Report")
 
         list_fields = attr_get("list_fields")
+
+        # Chunked export (not with custom title rows, which require
+        # random access to the work sheet)
+        chunk_size = attr_get("chunk_size")
+        if chunk_size and \
+           not isinstance(resource, dict) and \
+           not callable(settings.get_xls_title_row()):
+            if not list_fields:
+                list_fields = resource.list_fields()
+            title, output = cls.encode_chunked(resource,
+                                               list_fields,
+                                               chunk_size,
+                                               use_color = attr_get("use_color", False),
+                                               even_odd = attr_get("even_odd", True),
+                                               )
+            if attr_get("as_stream", False):
+                return output
+
+            filename = "%s_%s.xlsx" % (request.env.server_name, title)
+            disposition = "attachment; filename=\"%s\"" % filename
+            response = current.response
+            response.headers["Content-Type"] = contenttype(".xlsx")
+            response.headers["Content-disposition"] = disposition
+            return response.stream(output, request=request)
+
         if isinstance(resource, dict):
             # Pre-extracted data dict
             headers = resource.get("headers", {})
@@ -224,7 +252,7 @@ class XLSXWriter(FormatWriter):
 
     # -------------------------------------------------------------------------
     @classmethod
-    def write_rows(cls, ws, batch, lfields, types, column_widths):
+    def write_rows(cls, ws, batch, lfields, types, column_widths, offset=0):
         """
             Write the data rows
 
@@ -234,6 +262,8 @@ class XLSXWriter(FormatWriter):
                 lfields: the column selectors
                 types: the column types
                 column_widths: mutable array of column widths
+                offset: the number of data rows already written to the
+                        worksheet (for even/odd styles)
         """
 
         settings = current.deployment_settings
@@ -292,7 +322,7 @@ class XLSXWriter(FormatWriter):
                         num_format = dtformats[ftype]
 
                 cell = Cell(ws, value=value)
-                cell.style = "odd" if i % 2 else "even"
+                cell.style = "odd" if (offset + i) % 2 else "even"
                 if num_format:
                     cell.number_format = num_format
                 outrow.append(cell)
@@ -337,8 +367,29 @@ class XLSXWriter(FormatWriter):
                                raw_data = True if expand_hierarchy else False,
                                )
 
-        rfields = data.rfields
-        rows = data.rows
+        types, lfields, heading = cls.columns(data.rfields,
+                                              data.rows,
+                                              expand_hierarchy,
+                                              )
+
+        return (title, types, lfields, heading, data.rows)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def columns(cls, rfields, rows, expand_hierarchy=None):
+        """
+            Determine the columns of the export, and expand hierarchical
+            foreign keys in the rows where required
+
+            Args:
+                rfields: the resource fields (S3ResourceField)
+                rows: the represented rows from ResourceData
+                expand_hierarchy: the xls_expand_hierarchy setting,
+                                  {field_selector: [LevelLabel, ...]}
+
+            Returns:
+                tuple (types, lfields, heading)
+        """
 
         types = []
         lfields = []
@@ -366,7 +417,157 @@ class XLSXWriter(FormatWriter):
                     else:
                         types.append(rfield.ftype)
 
-        return (title, types, lfields, heading, rows)
+        return types, lfields, heading
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def encode_chunked(cls,
+                       resource,
+                       list_fields,
+                       chunk_size,
+                       use_color = False,
+                       even_odd = True,
+                       ):
+        """
+            Export data from a CRUDResource as Microsoft Excel spreadsheet,
+            extracting and writing the records chunk by chunk into a
+            write-only workbook, so that memory use is independent of
+            the number of records
+
+            Args:
+                resource: the CRUDResource
+                list_fields: the fields to include
+                chunk_size: the number of records per chunk
+                use_color: use background colors in cells
+                even_odd: when using colors, render different background
+                          colors for even/odd rows
+
+            Returns:
+                tuple (title, file), where file is a temporary file
+                containing the workbook
+
+            Note:
+                - records are exported in primary key order
+                - column widths are determined from the column labels
+        """
+
+        from openpyxl import Workbook
+        from openpyxl.cell import Cell
+        from openpyxl.utils import get_column_letter
+
+        from ..resource import DataExporter
+
+        T = current.T
+        settings = current.deployment_settings
+
+        title = get_crud_string(resource.tablename, "title_list")
+
+        get_vars = dict(current.request.vars)
+        get_vars["iColumns"] = len(list_fields)
+        query, orderby, left = resource.datatable_filter(list_fields,
+                                                         get_vars,
+                                                         )
+        resource.add_filter(query)
+
+        # Hierarchical FK Expansion:
+        # setting = {field_selector: [LevelLabel, LevelLabel, ...]}
+        expand_hierarchy = resource.get_config("xls_expand_hierarchy")
+
+        # Determine the columns
+        rfields = resource.resolve_selectors(list_fields, extra_fields=False)[0]
+        types, lfields, headers = cls.columns(rfields, [], expand_hierarchy)
+        labels = []
+        for selector in lfields:
+            label = headers[selector]
+            if label in ("Id", "Sort"):
+                continue
+            labels.append(s3_str(label))
+        num_columns = len(labels)
+
+        # Create the workbook
+        wb = Workbook(write_only=True, iso_dates=True)
+        cls.add_styles(wb, use_color=use_color, even_odd=even_odd)
+
+        # Determine title row length and batch size
+        title_row = settings.get_xls_title_row()
+        title_row_length = 2 if title_row else 0
+        batch_size = ROWS_PER_SHEET - title_row_length - 1
+
+        # Characters /\?*[] not allowed in sheet names
+        sheet_name = " ".join(re.sub(r"[\\\/\?\*\[\]]", " ", s3_str(title)).split())
+
+        sheets = []
+        def add_sheet():
+            # Add a new work sheet with title and column labels
+            ws_title = "%s-%s" % (sheet_name[:28], len(sheets) + 1)
+            if len(sheets) == 1:
+                sheets[0].title = "%s-1" % sheet_name[:28]
+            ws = wb.create_sheet(title=ws_title if sheets else sheet_name[:31])
+            sheets.append(ws)
+
+            # Column widths must be set before writing any rows
+            for i, label in enumerate(labels):
+                width = max(len(label), 10)
+                ws.column_dimensions[get_column_letter(i + 1)].width = width * 1.23
+
+            # Freeze title and column labels (=scroll only data rows)
+            ws.freeze_panes = "A%d" % (title_row_length + 2)
+
+            if title_row:
+                # First row: title
+                top = Cell(ws, value=s3_str(title))
+                top.style = "large_header"
+                ws.append([top])
+
+                # Second row: export date/time
+                now = current.calendar.format_datetime(current.request.now, local=True)
+                sub = Cell(ws, value="%s: %s" % (T("Date Exported"), now))
+                sub.style = "header"
+                ws.append([sub])
+
+            # Column labels
+            label_row = []
+            for l in labels:
+                cell = Cell(ws, value=l)
+                cell.style = "label"
+                label_row.append(cell)
+            ws.append(label_row)
+
+            return ws
+
+        ws = add_sheet()
+        written = 0
+        column_widths = [0] * num_columns
+
+        chunks = DataExporter.chunks(resource,
+                                     list_fields,
+                                     chunk_size,
+                                     left = left,
+                                     represent = True,
+                                     show_links = False,
+                                     raw_data = True if expand_hierarchy else False,
+                                     )
+        for data in chunks:
+            rows = data.rows
+            if expand_hierarchy:
+                cls.columns(data.rfields, rows, expand_hierarchy)
+            while rows:
+                if written >= batch_size:
+                    ws = add_sheet()
+                    written = 0
+                batch = rows[:batch_size - written]
+                rows = rows[len(batch):]
+                cls.write_rows(ws, batch, lfields, types, column_widths, offset=written)
+                written += len(batch)
+
+        # Save workbook
+        from tempfile import NamedTemporaryFile
+        # NB file will be deleted when the streamer closes it
+        output = NamedTemporaryFile(suffix=".xlsx")
+        wb.save(output.name)
+        output.seek(0)
+
+        return title, output
 
     # -------------------------------------------------------------------------
     @staticmethod
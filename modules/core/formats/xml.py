@@ -29,6 +29,8 @@ import json
 import os
 import re
 import sys
+import threading
+import time
 
 from lxml import etree
 from urllib import parse as urlparse
@@ -248,16 +250,33 @@ class S3XML:
         else:
             _args = None
 
+        transformer = None
         if isinstance(stylesheet_path, (etree._ElementTree, etree._Element)):
             # Pre-parsed stylesheet
             stylesheet = stylesheet_path
+        elif isinstance(stylesheet_path, etree.XSLT):
+            # Pre-compiled stylesheet
+            stylesheet = transformer = stylesheet_path
         else:
-            stylesheet = self.parse(stylesheet_path)
+            try:
+                entry = XSLTCache.get(stylesheet_path)
+            except Exception:
+                e = sys.exc_info()[1]
+                self.error = e
+                current.log.error(e)
+                return None
+            if entry:
+                stylesheet = entry.tree
+                transformer = entry.transformer
+            else:
+                # Not a local file
+                stylesheet = self.parse(stylesheet_path)
 
         if stylesheet is not None:
             try:
-                ac = etree.XSLTAccessControl(read_file=True, read_network=True)
-                transformer = etree.XSLT(stylesheet, access_control=ac)
+                if transformer is None:
+                    ac = etree.XSLTAccessControl(read_file=True, read_network=True)
+                    transformer = etree.XSLT(stylesheet, access_control=ac)
                 if _args:
                     result = transformer(tree, **_args)
                 else:
@@ -276,6 +295,116 @@ class S3XML:
             # Error parsing the XSL stylesheet
             return None
 
+    # -------------------------------------------------------------------------
+    def transform_chunks(self, tree, stylesheet_path, chunk_size, workers=1, **args):
+        """
+            Transform a table-form element tree (as produced by csv2tree,
+            xls2tree or xlsx2tree) with XSLT in chunks of rows, optionally
+            in parallel worker processes
+
+            Args:
+                tree: the element tree (gets consumed, i.e. the rows are
+                      moved out of it chunk by chunk)
+                stylesheet_path: pathname of the XSLT stylesheet
+                chunk_size: the number of rows per chunk
+                workers: the number of worker processes
+                args: dict of arguments to pass to the stylesheet
+
+            Yields:
+                the transformation result (ElementTree) for each chunk,
+                in order of the chunks; stops and sets self.error if the
+                transformation fails
+
+            Note:
+                Worker processes are forked - where the fork start method
+                is unavailable, the chunks are transformed in-process
+        """
+
+        self.error = None
+
+        if args:
+            _args = dict((k, "'%s'" % args[k]) for k in args)
+        else:
+            _args = None
+
+        executor = None
+        if workers and workers > 1:
+            import multiprocessing
+            try:
+                context = multiprocessing.get_context("fork")
+            except ValueError:
+                pass
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(max_workers = workers,
+                                               mp_context = context,
+                                               )
+
+        chunks = self.split_table(tree, chunk_size)
+        parser = etree.XMLParser(huge_tree = True,
+                                 remove_blank_text = True,
+                                 resolve_entities = False,
+                                 )
+        try:
+            if executor:
+                # Keep only a limited number of chunks in flight, so that
+                # rows get serialized no faster than they are transformed
+                from collections import deque
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(transform_chunk,
+                                                   stylesheet_path,
+                                                   etree.tostring(chunk),
+                                                   _args,
+                                                   ))
+                    if len(pending) >= 2 * workers:
+                        result = pending.popleft().result()
+                        yield etree.ElementTree(etree.fromstring(result, parser))
+                while pending:
+                    result = pending.popleft().result()
+                    yield etree.ElementTree(etree.fromstring(result, parser))
+            else:
+                transformer = chunk_transformer(stylesheet_path)
+                for chunk in chunks:
+                    if _args:
+                        yield transformer(chunk, **_args)
+                    else:
+                        yield transformer(chunk)
+        except Exception:
+            e = sys.exc_info()[1]
+            self.error = e
+            current.log.error(e)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def split_table(cls, tree, size):
+        """
+            Split a table-form element tree into chunks of rows
+
+            Args:
+                tree: the element tree (gets consumed, i.e. the rows are
+                      moved out of it chunk by chunk)
+                size: the number of rows per chunk
+
+            Yields:
+                an ElementTree for each chunk, with a root element like
+                the original root, and size rows
+        """
+
+        if isinstance(tree, etree._ElementTree):
+            root = tree.getroot()
+        else:
+            root = tree
+
+        while len(root):
+            chunk = etree.Element(root.tag, dict(root.attrib))
+            for row in root[:size]:
+                chunk.append(row)
+            yield etree.ElementTree(chunk)
+
     # -------------------------------------------------------------------------
     def envelope(self, tree, stylesheet_path, **args):
         """
@@ -2934,6 +3063,172 @@ class S3XML:
             output = output[:-1] + ', "tree": %s}' % tree
         return output
 
+# =============================================================================
+class XSLTCache:
+    """
+        Process-level cache of compiled XSLT stylesheets, keyed by the
+        stylesheet pathname and its modification time, so that modified
+        stylesheets get re-compiled
+
+        Note:
+            Changes to stylesheets imported or included by the cached
+            stylesheet are not detected (requires a restart)
+    """
+
+    entries = {}
+    lock = threading.Lock()
+
+    # Metrics
+    compiled = 0        # number of compilations
+    hits = 0            # number of cache hits
+    compile_time = 0.0  # total compile time (seconds)
+    saved_time = 0.0    # compile time saved by cache hits (seconds)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get(cls, path):
+        """
+            Get the cache entry for a stylesheet, parses and compiles the
+            stylesheet if not cached yet (or modified since)
+
+            Args:
+                path: the pathname of the stylesheet
+
+            Returns:
+                the cache entry, a Storage with
+                    - tree: the parsed stylesheet (ElementTree)
+                    - transformer: the compiled stylesheet (XSLT)
+                    - compile_time: the time it took to compile (seconds)
+                    - fields: the s3:fields configuration (S3XMLFormat)
+                or None if path is not a local file
+
+            Raises:
+                XMLSyntaxError: if the stylesheet can not be parsed
+                XSLTParseError: if the stylesheet can not be compiled
+        """
+
+        if not isinstance(path, str):
+            return None
+        try:
+            mtime = os.stat(path).st_mtime
+        except (OSError, ValueError):
+            return None
+
+        entry = cls.entries.get(path)
+        if entry is not None and entry.mtime == mtime:
+            with cls.lock:
+                cls.hits += 1
+                cls.saved_time += entry.compile_time
+            return entry
+
+        start = time.time()
+
+        parser = etree.XMLParser(no_network = False,
+                                 remove_blank_text = True,
+                                 )
+        parser.resolvers.add(S3EntityResolver(path))
+        tree = etree.parse(path, parser)
+
+        ac = etree.XSLTAccessControl(read_file=True, read_network=True)
+        transformer = etree.XSLT(tree, access_control=ac)
+
+        duration = time.time() - start
+        entry = Storage(mtime = mtime,
+                        tree = tree,
+                        transformer = transformer,
+                        compile_time = duration,
+                        fields = None,
+                        )
+        with cls.lock:
+            cls.compiled += 1
+            cls.compile_time += duration
+            cls.entries[path] = entry
+
+        return entry
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def stats(cls):
+        """
+            Get the cache metrics
+
+            Returns:
+                a Storage {entries, compiled, hits, compile_time, saved_time},
+                with times in seconds
+        """
+
+        return Storage(entries = len(cls.entries),
+                       compiled = cls.compiled,
+                       hits = cls.hits,
+                       compile_time = cls.compile_time,
+                       saved_time = cls.saved_time,
+                       )
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def clear(cls):
+        """
+            Remove all entries from the cache, and reset the metrics
+        """
+
+        with cls.lock:
+            cls.entries = {}
+            cls.compiled = cls.hits = 0
+            cls.compile_time = cls.saved_time = 0.0
+
+# =============================================================================
+def chunk_transformer(stylesheet_path):
+    """
+        Get the compiled XSLT stylesheet for chunked transformation
+
+        Args:
+            stylesheet_path: pathname of the XSLT stylesheet
+
+        Returns:
+            the XSLT transformer
+    """
+
+    entry = XSLTCache.get(stylesheet_path)
+    if entry:
+        transformer = entry.transformer
+    else:
+        stylesheet = etree.parse(stylesheet_path)
+        ac = etree.XSLTAccessControl(read_file=True, read_network=True)
+        transformer = etree.XSLT(stylesheet, access_control=ac)
+
+    return transformer
+
+def transform_chunk(stylesheet_path, chunk, args=None):
+    """
+        Transform a chunk of rows (worker function for
+        S3XML.transform_chunks)
+
+        Args:
+            stylesheet_path: pathname of the XSLT stylesheet
+            chunk: the chunk, serialized table-form XML
+            args: the (quoted) arguments to pass to the stylesheet
+
+        Returns:
+            the transformation result, serialized
+
+        Raises:
+            RuntimeError: if the transformation fails
+    """
+
+    try:
+        parser = etree.XMLParser(huge_tree=True, resolve_entities=False)
+        tree = etree.fromstring(chunk, parser)
+        transformer = chunk_transformer(stylesheet_path)
+        if args:
+            result = transformer(tree, **args)
+        else:
+            result = transformer(tree)
+    except Exception as e:
+        # lxml errors are not picklable => re-raise as RuntimeError
+        raise RuntimeError("XSLT transformation failed: %s" % e)
+
+    return etree.tostring(result)
+
 # =============================================================================
 class S3EntityResolver(etree.Resolver):
     """ Safe entity resolver for S3XML.parse """
@@ -3012,10 +3307,20 @@ class S3XMLFormat:
                 stylesheet: the stylesheet (pathname or stream)
         """
 
-        self.tree = current.xml.parse(stylesheet)
-        if not self.tree:
-            current.log.error("%s parse error: %s" %
-                              (stylesheet, current.xml.error))
+        # Use the cached stylesheet if it is a local file
+        try:
+            entry = XSLTCache.get(stylesheet)
+        except Exception:
+            entry = None
+        self.entry = entry
+
+        if entry:
+            self.tree = entry.tree
+        else:
+            self.tree = current.xml.parse(stylesheet)
+            if not self.tree:
+                current.log.error("%s parse error: %s" %
+                                  (stylesheet, current.xml.error))
 
         self.select = None
         self.skip = None
@@ -3081,6 +3386,12 @@ class S3XMLFormat:
     def __inspect(self):
         """ Check the fields configuration in the stylesheet (if any) """
 
+        entry = self.entry
+        if entry and entry.fields:
+            # Already inspected
+            self.select, self.skip = entry.fields
+            return
+
         ALL = "ALL"
         ANY = "ANY"
 
@@ -3112,7 +3423,8 @@ class S3XMLFormat:
 
         self.select = select
         self.skip = skip
-        return
+        if entry:
+            entry.fields = (select, skip)
 
     # -------------------------------------------------------------------------
     def transform(self, tree, **args):
@@ -3128,6 +3440,9 @@ class S3XMLFormat:
             current.log.error("XMLFormat: no stylesheet available")
             return tree
 
-        return current.xml.transform(tree, self.tree, **args)
+        entry = self.entry
+        stylesheet = entry.transformer if entry else self.tree
+
+        return current.xml.transform(tree, stylesheet, **args)
 
 # End =========================================================================
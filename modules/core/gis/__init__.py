@@ -1,2 +1,3 @@
 from .base import GIS
+from .index import LocationIndex
 from .widgets import MAP, MAP2
@@ -2020,6 +2020,11 @@ class GIS:
             query &= (table.deleted == False)
         # @ToDo: Check AAA (do this as a resource filter?)
 
+        # Pre-select candidates using the spatial index
+        ids = self.get_location_ids_by_bbox(*polygon.bounds)
+        if ids is not None:
+            query &= locations.id.belongs(ids)
+
         features = db(query).select(locations.wkt,
                                     locations.lat,
                                     locations.lon,
@@ -2270,6 +2275,15 @@ class GIS:
             empty = (locations.lat != None) & (locations.lon != None)
             query = deleted & empty & query
 
+            # Pre-select candidates using the spatial index
+            ids = self.get_location_ids_by_bbox(bbox["lon_min"],
+                                                bbox["lat_min"],
+                                                bbox["lon_max"],
+                                                bbox["lat_max"],
+                                                )
+            if ids is not None:
+                query = locations.id.belongs(ids) & query
+
             if tablename:
                 # Lookup the resource
                 table = current.s3db[tablename]
@@ -4791,23 +4805,6 @@ page.render('%(filename)s', {format: 'jpeg', quality: '100'});''' % \
         update_location_tree = GIS.update_location_tree
         wkt_centroid = GIS.wkt_centroid
 
-        fields = (table.id,
-                  table.name,
-                  table.level,
-                  table.path,
-                  table.parent,
-                  table.L0,
-                  table.L1,
-                  table.L2,
-                  table.L3,
-                  table.L4,
-                  table.L5,
-                  table.lat,
-                  table.lon,
-                  table.wkt,
-                  table.inherited
-                  )
-
         # ---------------------------------------------------------------------
         def fixup(feature):
             """
@@ -4850,48 +4847,20 @@ page.render('%(filename)s', {format: 'jpeg', quality: '100'});''' % \
         # ---------------------------------------------------------------------
         def propagate(parent):
             """
-                Propagate Lat/Lon down to any Features which inherit from this one
+                Propagate Path, Lx names and Lat/Lon down to the descendants
+                of a Feature (only visiting subtrees which actually change)
 
                 Args:
                     parent: gis_location id of parent
             """
 
-            # No need to filter out deleted since the parent FK is None for these records
-            query = (table.parent == parent) & \
-                    (table.inherited == True)
-            rows = db(query).select(*fields)
-            for row in rows:
-                try:
-                    update_location_tree(row, propagating=True)
-                except RuntimeError:
-                    current.log.error("Cannot propagate inherited latlon to child %s of location ID %s: too much recursion" % \
-                        (row.id, parent))
-
+            GIS.update_location_subtree(parent)
 
+        # ---------------------------------------------------------------------
         if not feature:
-            # We are updating all locations.
-            all_locations = True
-            # Do in chunks to save memory and also do in correct order
-            all_fields = (table.id, table.name, table.gis_feature_type,
-                          table.L0, table.L1, table.L2, table.L3, table.L4,
-                          table.lat, table.lon, table.wkt, table.inherited,
-                          # Handle Countries which start with Bounds set, yet are Points
-                          table.lat_min, table.lon_min, table.lat_max, table.lon_max,
-                          table.path, table.parent)
-            for level in ("L0", "L1", "L2", "L3", "L4", "L5", None):
-                query = (table.level == level) & (table.deleted == False)
-                try:
-                    features = db(query).select(*all_fields)
-                except MemoryError:
-                    current.log.error("S3GIS: Unable to update Location Tree for level %s: MemoryError" % level)
-                else:
-                    for feature in features:
-                        feature["level"] = level
-                        wkt = feature["wkt"]
-                        if wkt and not wkt.startswith("POI"):
-                            # Polygons aren't inherited
-                            feature["inherited"] = False
-                        update_location_tree(feature)  # all_locations is False here
+            # We are updating all locations
+            # - level-by-level, with set-based queries
+            GIS.update_location_subtree()
             # All Done!
             return None
 
@@ -5903,6 +5872,318 @@ page.render('%(filename)s', {format: 'jpeg', quality: '100'});''' % \
 
         return _path
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def update_location_subtree(root=None, batch_size=500):
+        """
+            Update GIS Locations' Materialized path, Lx locations, Lat/Lon
+            & the_geom level-by-level, with set-based queries
+                - used to update the whole tree, and to propagate changes
+                  of a location down to its descendants
+
+            Args:
+                root: the gis_location record ID of the location whose
+                      descendants shall be updated (the location itself
+                      must have been updated before) - if omitted, the
+                      whole tree will be updated
+                batch_size: the maximum number of locations to process
+                            with a single query
+
+            Returns:
+                the number of updated locations
+
+            Notes:
+                - when updating the descendants of a location, only the
+                  subtrees below locations that have actually changed
+                  will be visited
+                - point geometries are generated right away, so that
+                  identical changes (e.g. inherited Lat/Lon, Lx names)
+                  can be applied to many locations with a single query;
+                  bounds/centroids are only computed from the WKT where
+                  they are missing
+        """
+
+        if GIS.disable_update_location_tree:
+            return 0
+
+        db = current.db
+        table = current.s3db.gis_location
+        tablename = table._tablename
+
+        spatialdb = current.deployment_settings.get_gis_spatialdb()
+
+        LEVELS = ("L0", "L1", "L2", "L3", "L4", "L5")
+
+        # Read only the start of the WKT: enough to tell points from
+        # other geometries, and to compare point WKTs
+        wkt_prefix = table.wkt[:64]
+        fields = [table.id,
+                  table.level,
+                  table.name,
+                  table.parent,
+                  table.path,
+                  table.inherited,
+                  table.lat,
+                  table.lon,
+                  table.lat_min,
+                  table.lat_max,
+                  table.lon_min,
+                  table.lon_max,
+                  wkt_prefix,
+                  ] + [table[level] for level in LEVELS]
+
+        # ---------------------------------------------------------------------
+        def select(query):
+            """
+                Select the locations matching a query, in batches
+
+                Args:
+                    query: the query
+
+                Yields:
+                    tuples (record, wkt_prefix)
+            """
+
+            query &= (table.deleted == False)
+            last_id = 0
+            while True:
+                rows = db(query & (table.id > last_id)).select(orderby = table.id,
+                                                               limitby = (0, batch_size),
+                                                               *fields)
+                for row in rows:
+                    yield row[tablename], row[wkt_prefix]
+                if len(rows) < batch_size:
+                    break
+                last_id = rows.last()[tablename].id
+
+        # ---------------------------------------------------------------------
+        def children(parent_ids):
+            """
+                Select the child locations of the parents, in batches
+
+                Args:
+                    parent_ids: the parent location IDs
+
+                Yields:
+                    tuples (record, wkt_prefix)
+            """
+
+            for i in range(0, len(parent_ids), batch_size):
+                query = table.parent.belongs(parent_ids[i:i+batch_size])
+                for item in select(query):
+                    yield item
+
+        # ---------------------------------------------------------------------
+        def node(record, path, names, lat, lon):
+            """
+                Data of a hierarchy location to pass down to its children
+            """
+
+            return Storage(level = record.level,
+                           path = path,
+                           names = names,
+                           lat = lat,
+                           lon = lon,
+                           )
+
+        # ---------------------------------------------------------------------
+        def changes(record, wkt, parent):
+            """
+                Determine the changes for a location
+
+                Args:
+                    record: the location record
+                    wkt: the start of its WKT
+                    parent: the data of its parent location (node), or None
+
+                Returns:
+                    tuple (changes, node, geometry), changes being a dict
+                    of the changed fields, node the data to pass down to
+                    the children, and geometry whether bounds/centroid
+                    must be computed from the WKT; or None if the location
+                    cannot be placed in the tree
+            """
+
+            level = record.level
+            depth = LEVELS.index(level) if level in LEVELS else len(LEVELS)
+
+            if level == "L0" or parent is None:
+                path = str(record.id)
+                names = [None] * len(LEVELS)
+                parent_lat = parent_lon = None
+            else:
+                if LEVELS.index(parent.level) >= depth:
+                    current.log.error("Parent of Location ID %s has invalid level: %s is %s" % \
+                                      (record.id, record.parent, parent.level))
+                    return None
+                path = "%s/%s" % (parent.path, record.id)
+                names = list(parent.names)
+                parent_lat, parent_lon = parent.lat, parent.lon
+            if level in LEVELS:
+                names[depth] = record.name
+
+            values = dict(zip(LEVELS, names))
+            values["path"] = path
+
+            polygon = bool(wkt) and not wkt.startswith("POI")
+            geometry = False
+
+            if level != "L0" and not polygon and \
+               (record.inherited or record.lat is None or record.lon is None):
+                # Inherit Lat/Lon (and a point geometry) from the parent
+                # - polygons are never inherited, but keep their WKT and
+                #   have their centroid computed from it (see below)
+                lat, lon = parent_lat, parent_lon
+                values.update(inherited = True,
+                              lat = lat,
+                              lon = lon,
+                              )
+                if lat is not None and lon is not None:
+                    values.update(wkt = "POINT (%s %s)" % (lon, lat),
+                                  lat_min = lat,
+                                  lat_max = lat,
+                                  lon_min = lon,
+                                  lon_max = lon,
+                                  )
+                else:
+                    values["wkt"] = None
+            else:
+                values["inherited"] = False
+                lat, lon = record.lat, record.lon
+                if polygon:
+                    if lat is None or lon is None or \
+                       None in (record.lat_min, record.lat_max, record.lon_min, record.lon_max):
+                        geometry = True
+                elif not wkt and lat is not None and lon is not None:
+                    # Generate the point geometry, retaining any bounds
+                    values["wkt"] = "POINT (%s %s)" % (lon, lat)
+                    for fn, value in (("lat_min", lat), ("lat_max", lat),
+                                      ("lon_min", lon), ("lon_max", lon)):
+                        if record[fn] is None:
+                            values[fn] = value
+
+            diff = {}
+            for fn, value in values.items():
+                if value != (wkt if fn == "wkt" else record[fn]):
+                    diff[fn] = value
+            if "wkt" in diff:
+                if diff["wkt"]:
+                    diff["gis_feature_type"] = 1
+                if spatialdb:
+                    diff["the_geom"] = diff["wkt"]
+
+            return diff, node(record, path, names, lat, lon), geometry
+
+        # ---------------------------------------------------------------------
+        def compute_geometry(location_ids):
+            """
+                Compute bounds and centroids from the WKT
+
+                Args:
+                    location_ids: the location IDs
+
+                Returns:
+                    dict {location_id: (lat, lon)}
+            """
+
+            wkt_centroid = GIS.wkt_centroid
+
+            centroids = {}
+            rows = db(table.id.belongs(location_ids)).select(table.id,
+                                                            table.wkt,
+                                                            )
+            for row in rows:
+                form = Storage(vars = Storage(wkt = row.wkt),
+                               errors = Storage(),
+                               )
+                wkt_centroid(form)
+                if form.errors:
+                    current.log.error("S3GIS: %s" % form.errors)
+                    continue
+                form_vars = form.vars
+                try:
+                    db(table.id == row.id).update(**form_vars)
+                except MemoryError:
+                    current.log.error("S3GIS: Unable to set bounds & centroid for feature %s: MemoryError" % row.id)
+                    continue
+                centroids[row.id] = (form_vars.lat, form_vars.lon)
+
+            return centroids
+
+        # ---------------------------------------------------------------------
+        # Start with the root location or the top-level locations
+        if root:
+            row = db(table.id == root).select(limitby = (0, 1),
+                                              *fields
+                                              ).first()
+            if not row:
+                return 0
+            record = row[tablename]
+            if not record.path or record.level not in LEVELS:
+                return 0
+            names = [record[level] for level in LEVELS]
+            depth = LEVELS.index(record.level)
+            names[depth:] = [record.name] + [None] * (len(LEVELS) - depth - 1)
+            parents = {record.id: node(record, record.path, names, record.lat, record.lon)}
+            items = children(list(parents))
+        else:
+            parents = {}
+            items = select(table.parent == None)
+
+        seen = set(parents)
+        updated = set()
+
+        while items is not None:
+
+            nodes = {}
+            updates = {}
+            geometries = []
+
+            for record, wkt in items:
+
+                record_id = record.id
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+
+                result = changes(record, wkt, parents.get(record.parent))
+                if result is None:
+                    continue
+                diff, data, geometry = result
+
+                if diff:
+                    key = tuple(sorted(diff.items()))
+                    updates.setdefault(key, []).append(record_id)
+                if geometry:
+                    geometries.append(record_id)
+
+                if record.level in LEVELS and \
+                   (not root or geometry or
+                    any(fn in diff for fn in ("path", "lat", "lon") + LEVELS)):
+                    # Descend into the subtree of this location
+                    nodes[record_id] = data
+
+            # Apply the changes, one query for each distinct set of changes
+            for key, location_ids in updates.items():
+                for i in range(0, len(location_ids), batch_size):
+                    db(table.id.belongs(location_ids[i:i+batch_size])).update(**dict(key))
+                updated.update(location_ids)
+
+            # Compute bounds/centroids where required, and pass them down
+            for i in range(0, len(geometries), batch_size):
+                centroids = compute_geometry(geometries[i:i+batch_size])
+                updated.update(centroids)
+                for location_id, (lat, lon) in centroids.items():
+                    data = nodes.get(location_id)
+                    if data:
+                        data.lat, data.lon = lat, lon
+
+            # Proceed with the next level
+            parents = nodes
+            items = children(list(nodes)) if nodes else None
+
+        return len(updated)
+
     # -------------------------------------------------------------------------
     @staticmethod
     def wkt_centroid(form):
@@ -6061,6 +6342,75 @@ page.render('%(filename)s', {format: 'jpeg', quality: '100'});''' % \
             # Also populate the spatial field
             form_vars.the_geom = form_vars.wkt
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_spatial_index():
+        """
+            Get the in-process spatial index of locations
+
+            Returns:
+                the LocationIndex, or None if not enabled (or not available,
+                or not needed because the database has spatial extensions)
+        """
+
+        settings = current.deployment_settings
+        if not settings.get_gis_spatial_index() or settings.get_gis_spatialdb():
+            return None
+
+        from .index import LocationIndex
+        return LocationIndex.get()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_location_ids_by_bbox(lon_min, lat_min, lon_max, lat_max, limit=10000):
+        """
+            Look up the IDs of all Locations whose bounds intersect the
+            given bounding box, using the in-process spatial index
+
+            Args:
+                lon_min: the minimum longitude of the bounding box
+                lat_min: the minimum latitude of the bounding box
+                lon_max: the maximum longitude of the bounding box
+                lat_max: the maximum latitude of the bounding box
+                limit: the maximum number of IDs to return - if there
+                       are more, a bounds query is more efficient than
+                       a lookup by ID
+
+            Returns:
+                set of gis_location record IDs (candidates, may include
+                deleted records), or None if the spatial index is not
+                available or there are more IDs than limit
+        """
+
+        index = current.gis.get_spatial_index()
+        if index is None:
+            return None
+
+        ids = index.query(float(lon_min),
+                          float(lat_min),
+                          float(lon_max),
+                          float(lat_max),
+                          )
+        if limit and len(ids) > limit:
+            return None
+
+        return ids
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def update_spatial_index(location_id):
+        """
+            Update the in-process spatial index for a changed location,
+            (if the index is used)
+
+            Args:
+                location_id: the gis_location record ID
+        """
+
+        index = current.gis.get_spatial_index()
+        if index is not None:
+            index.update_record(location_id)
+
     # -------------------------------------------------------------------------
     @staticmethod
     def query_features_by_bbox(lon_min, lat_min, lon_max, lat_max):
@@ -6073,6 +6423,16 @@ page.render('%(filename)s', {format: 'jpeg', quality: '100'});''' % \
                 (table.lat_max >= lat_min) & \
                 (table.lon_min <= lon_max) & \
                 (table.lon_max >= lon_min)
+
+        # Pre-select candidates using the spatial index
+        ids = current.gis.get_location_ids_by_bbox(lon_min,
+                                                   lat_min,
+                                                   lon_max,
+                                                   lat_max,
+                                                   )
+        if ids is not None:
+            query = table.id.belongs(ids) & query
+
         return query
 
     # -------------------------------------------------------------------------
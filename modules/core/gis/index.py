@@ -0,0 +1,514 @@
+"""
+    Spatial Index of Locations
+
+    Copyright: (c) 2022 Sahana Software Foundation
+
+    Permission is hereby granted, free of charge, to any person
+    obtaining a copy of this software and associated documentation
+    files (the "Software"), to deal in the Software without
+    restriction, including without limitation the rights to use,
+    copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following
+    conditions:
+
+    The above copyright notice and this permission notice shall be
+    included in all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+    EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+    OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+    NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+    OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+__all__ = ("LocationIndex",
+           )
+
+import datetime
+import os
+import pickle
+import threading
+import time
+
+from gluon import current
+
+try:
+    from shapely.geometry import box as shapely_box
+    from shapely.strtree import STRtree
+except ImportError:
+    STRtree = None
+
+# =============================================================================
+class LocationIndex:
+    """
+        In-process spatial index (STRtree) of the bounds of gis_location
+        records, for feature lookups in databases without spatial
+        extensions:
+
+            - built once per process (or loaded from disk), and saved to
+              disk whenever rebuilt
+            - STRtrees are static, so changed records are kept separately
+              and checked linearly, until there are too many of them and
+              the tree gets rebuilt
+            - changes are picked up from gis_location onaccept, and from
+              the database for changes by other processes: records with
+              a higher ID than previously seen, or modified since the last
+              synchronization (with an overlap of SYNC_OVERLAP seconds, to
+              catch transactions committed late)
+            - the number of records and the maximum record ID are checked
+              with every synchronization; if they have changed differently
+              than the picked-up records explain (e.g. an insert committed
+              after one with a higher ID, or hard deletes), the index is
+              rebuilt
+
+        The index only pre-selects candidates - it can be stale for up
+        to SYNC_INTERVAL seconds with regard to changes by other processes,
+        so the candidates must always be selected from the database with
+        the actual query.
+    """
+
+    # Rebuild the tree when this many records have changed
+    REBUILD_THRESHOLD = 1000
+
+    # Minimum interval between synchronizations with the database (seconds)
+    SYNC_INTERVAL = 10
+
+    # Overlap of the time window for synchronizations, to pick up changes
+    # committed after others with a later modified_on (seconds)
+    SYNC_OVERLAP = 300
+
+    # Process-level instance
+    instance = None
+    instance_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        """
+            Args:
+                path: the file path to save the index to (None to not
+                      persist the index)
+        """
+
+        self.path = path
+        self.lock = threading.RLock()
+
+        self.ids = []           # Record IDs in the tree, by tree position
+        self.boxes = []         # Bounds (Polygon) in the tree, by tree position
+        self.positions = None   # Tree positions by geometry (Shapely<2.0)
+        self.tree = None
+
+        self.changed = {}       # Records changed since the tree was built,
+                                # {record_id: bounds or None if removed}
+        self.unconfirmed = set()    # Records updated from onaccept, to be
+                                    # re-read after commit (next sync)
+
+        self.mtime = None       # Latest modified_on of indexed records
+        self.count = None       # Number of records in the table
+        self.max_id = None      # Maximum record ID in the table
+        self.synced = None      # Time of the last synchronization
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get(cls):
+        """
+            Get the process-level index instance
+
+            Returns:
+                the LocationIndex, or None if Shapely is not available
+        """
+
+        if STRtree is None:
+            return None
+
+        index = cls.instance
+        if index is None:
+            with cls.instance_lock:
+                index = cls.instance
+                if index is None:
+                    folder = os.path.join(current.request.folder, "cache")
+                    path = os.path.join(folder, "gis_location_index.pickle")
+                    index = cls.instance = cls(path=path)
+
+        return index
+
+    # -------------------------------------------------------------------------
+    def query(self, lon_min, lat_min, lon_max, lat_max):
+        """
+            Look up the locations whose bounds intersect a bounding box
+
+            Args:
+                lon_min: the minimum longitude of the bounding box
+                lat_min: the minimum latitude of the bounding box
+                lon_max: the maximum longitude of the bounding box
+                lat_max: the maximum latitude of the bounding box
+
+            Returns:
+                set of gis_location record IDs
+        """
+
+        with self.lock:
+
+            self.sync()
+
+            ids = set()
+            changed = self.changed
+
+            # Search the tree
+            tree = self.tree
+            if tree is not None:
+                record_ids = self.ids
+                found = tree.query(shapely_box(lon_min, lat_min, lon_max, lat_max))
+                if len(found) and hasattr(found[0], "geom_type"):
+                    # Shapely<2.0 returns geometries rather than positions
+                    positions = self.positions
+                    if positions is None:
+                        positions = self.positions = {id(b): i for i, b in enumerate(self.boxes)}
+                    found = (positions[id(geometry)] for geometry in found)
+                for position in found:
+                    record_id = record_ids[position]
+                    if record_id not in changed:
+                        ids.add(record_id)
+
+            # Check the changed records
+            for record_id, bounds in changed.items():
+                if bounds and \
+                   bounds[0] <= lon_max and bounds[2] >= lon_min and \
+                   bounds[1] <= lat_max and bounds[3] >= lat_min:
+                    ids.add(record_id)
+
+        return ids
+
+    # -------------------------------------------------------------------------
+    def sync(self, force=False):
+        """
+            Synchronize the index with the database, i.e. build or load
+            the index if not done yet, then pick up all records modified
+            since the last synchronization
+
+            Args:
+                force: synchronize even if the last synchronization was
+                       less than SYNC_INTERVAL seconds ago
+        """
+
+        now = time.time()
+        if not force and self.synced and now - self.synced < self.SYNC_INTERVAL:
+            return
+
+        with self.lock:
+            self.synced = now
+
+            if self.tree is None and self.mtime is None and not self.load():
+                self.build()
+                return
+
+            db = current.db
+            table = current.s3db.gis_location
+
+            # Check number of records and maximum ID first (so that
+            # any changes committed meanwhile are picked up next time)
+            count, max_id = self.stats(table)[:2]
+
+            # Pick up new records and records modified since the last
+            # synchronization (with overlap for late commits)
+            previous = self.max_id or 0
+            query = (table.id > previous)
+            mtime = self.mtime
+            if mtime:
+                overlap = datetime.timedelta(seconds=self.SYNC_OVERLAP)
+                query |= (table.modified_on >= mtime - overlap)
+            else:
+                query = (table.id > 0)
+            unconfirmed = self.unconfirmed
+            if unconfirmed:
+                # Re-read the records updated from onaccept, as their
+                # transactions may have been rolled back
+                query |= table.id.belongs(unconfirmed)
+            rows = db(query).select(*self.fields(table))
+
+            # Verify that all new records have been picked up
+            inserted = sum(1 for row in rows if previous < row.id <= max_id)
+            if self.count is None or count - self.count != inserted:
+                # Missed records (or hard deletes) => rebuild
+                self.build()
+                return
+
+            self.count, self.max_id = count, max_id
+            self.update(rows)
+
+            if unconfirmed:
+                # Records not found have never been committed
+                missing = unconfirmed - {row.id for row in rows}
+                for record_id in missing:
+                    self.changed[record_id] = None
+                self.unconfirmed = set()
+
+    # -------------------------------------------------------------------------
+    def update(self, rows, advance=True):
+        """
+            Update the index for changed records
+
+            Args:
+                rows: the changed gis_location records (iterable of Rows
+                      with the fields returned by fields())
+                advance: advance the synchronization time to the latest
+                         modified_on of the records (only for committed
+                         records)
+        """
+
+        with self.lock:
+
+            changed = self.changed
+            mtime = self.mtime
+            row_bounds = self.row_bounds
+
+            for row in rows:
+                changed[row.id] = None if row.deleted else row_bounds(row)
+                if not advance:
+                    continue
+                modified_on = row.modified_on
+                if modified_on and (mtime is None or modified_on > mtime):
+                    mtime = modified_on
+            self.mtime = mtime
+
+            if len(changed) > self.REBUILD_THRESHOLD:
+                self.merge()
+                self.save()
+
+    # -------------------------------------------------------------------------
+    def update_record(self, record_id):
+        """
+            Update the index for a changed record (e.g. onaccept); does
+            nothing if the index has not been built or loaded yet in this
+            process
+
+            Note:
+                The change is not committed yet at this point, so the
+                record is re-read with the next synchronization (and
+                does not advance its time window)
+
+            Args:
+                record_id: the gis_location record ID
+        """
+
+        if self.tree is None and self.mtime is None:
+            return
+
+        table = current.s3db.gis_location
+        query = (table.id == record_id)
+        rows = current.db(query).select(limitby=(0, 1), *self.fields(table))
+        if rows:
+            with self.lock:
+                self.update(rows, advance=False)
+                self.unconfirmed.add(record_id)
+
+    # -------------------------------------------------------------------------
+    def build(self):
+        """
+            Build the index from the database
+        """
+
+        db = current.db
+        table = current.s3db.gis_location
+
+        # Table stats before selecting the records, so that any changes
+        # committed meanwhile are picked up by the next synchronization
+        count, max_id, mtime = self.stats(table)
+
+        ids, bounds = [], []
+        row_bounds = self.row_bounds
+
+        query = (table.deleted == False)
+        rows = db(query).select(cacheable = True,
+                                *self.fields(table))
+        for row in rows:
+            b = row_bounds(row)
+            if b:
+                ids.append(row.id)
+                bounds.append(b)
+
+        with self.lock:
+            self.build_tree(ids, bounds)
+            self.changed = {}
+            self.mtime = mtime
+            self.count = count
+            self.max_id = max_id
+
+        self.save()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def stats(table):
+        """
+            Look up the number of records, the maximum record ID and the
+            latest modification date in the gis_location table
+
+            Args:
+                table: the gis_location table
+
+            Returns:
+                tuple (count, max_id, mtime)
+        """
+
+        count = table.id.count()
+        max_id = table.id.max()
+        mtime = table.modified_on.max()
+
+        row = current.db(table.id > 0).select(count, max_id, mtime).first()
+        if not row:
+            return 0, 0, None
+
+        return row[count], row[max_id] or 0, row[mtime]
+
+    # -------------------------------------------------------------------------
+    def build_tree(self, ids, bounds):
+        """
+            Build the STRtree
+
+            Args:
+                ids: the record IDs
+                bounds: the corresponding bounds, tuples
+                        (lon_min, lat_min, lon_max, lat_max)
+        """
+
+        boxes = [shapely_box(*b) for b in bounds]
+
+        self.ids = ids
+        self.boxes = boxes
+        self.positions = None
+        self.tree = STRtree(boxes) if boxes else None
+
+    # -------------------------------------------------------------------------
+    def merge(self):
+        """
+            Rebuild the tree with all changed records merged in
+        """
+
+        changed = self.changed
+
+        ids, bounds = [], []
+        for record_id, b in zip(self.ids, self.boxes):
+            if record_id not in changed:
+                ids.append(record_id)
+                bounds.append(b.bounds)
+        for record_id, b in changed.items():
+            if b:
+                ids.append(record_id)
+                bounds.append(b)
+
+        self.build_tree(ids, bounds)
+        self.changed = {}
+
+    # -------------------------------------------------------------------------
+    def save(self):
+        """
+            Save the index to disk; saves only the tree, so the index
+            must be saved right after it has been built or merged
+        """
+
+        path = self.path
+        if not path:
+            return
+
+        with self.lock:
+            data = {"db": current.db._uri_hash,
+                    "mtime": self.mtime,
+                    "count": self.count,
+                    "max_id": self.max_id,
+                    "ids": self.ids,
+                    "bounds": [b.bounds for b in self.boxes],
+                    }
+
+        # Write to a temporary file first, then replace (atomic)
+        tmp = "%s.%s" % (path, os.getpid())
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (IOError, OSError) as e:
+            current.log.error("LocationIndex: could not save index (%s)" % e)
+
+    # -------------------------------------------------------------------------
+    def load(self):
+        """
+            Load the index from disk
+
+            Returns:
+                True if successful, otherwise False
+        """
+
+        path = self.path
+        if not path or not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            current.log.error("LocationIndex: could not load index (%s)" % e)
+            return False
+
+        if data.get("db") != current.db._uri_hash or "max_id" not in data:
+            # Index from another database, or from a previous version
+            return False
+
+        with self.lock:
+            self.build_tree(data["ids"], data["bounds"])
+            self.changed = {}
+            self.mtime = data["mtime"]
+            self.count = data["count"]
+            self.max_id = data["max_id"]
+
+        return True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def fields(table):
+        """
+            The fields to select for the index
+
+            Args:
+                table: the gis_location table
+
+            Returns:
+                list of Fields
+        """
+
+        return [table.id,
+                table.lat,
+                table.lon,
+                table.lat_min,
+                table.lon_min,
+                table.lat_max,
+                table.lon_max,
+                table.deleted,
+                table.modified_on,
+                ]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def row_bounds(row):
+        """
+            Get the bounds of a gis_location record, or - if it has no
+            bounds - its lat/lon as point
+
+            Args:
+                row: the gis_location Row
+
+            Returns:
+                tuple (lon_min, lat_min, lon_max, lat_max), or None if the
+                record has neither bounds nor lat/lon
+        """
+
+        bounds = (row.lon_min, row.lat_min, row.lon_max, row.lat_max)
+        if None in bounds:
+            lat, lon = row.lat, row.lon
+            if lat is None or lon is None:
+                return None
+            bounds = (lon, lat, lon, lat)
+
+        return bounds
+
+# END =========================================================================
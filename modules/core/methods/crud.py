@@ -1174,6 +1174,9 @@ class S3CRUD(CRUDMethod):
 
         list_fields = get_config("list_fields", None)
 
+        # Chunk size for streaming exports
+        chunk_size = current.deployment_settings.get_base_export_chunk_size()
+
         representation = r.representation
         if representation in ("html", "iframe", "aadata", "dl", "popup"):
 
@@ -1349,7 +1352,9 @@ class S3CRUD(CRUDMethod):
             output = {"item": items}
 
         elif representation == "csv":
-            output = DataExporter.csv(resource)
+            output = DataExporter.csv(resource,
+                                      chunk_size = chunk_size,
+                                      )
 
         elif representation == "json":
 
@@ -1371,6 +1376,7 @@ class S3CRUD(CRUDMethod):
                                        limit = limit,
                                        represent = represent,
                                        tooltip = tooltip,
+                                       chunk_size = chunk_size,
                                        )
 
         elif representation == "pdf":
@@ -1406,6 +1412,7 @@ class S3CRUD(CRUDMethod):
         elif representation == "xlsx":
             output = DataExporter.xlsx(resource,
                                        list_fields = list_fields,
+                                       chunk_size = chunk_size,
                                        **attr)
 
         elif representation == "card":
@@ -1508,6 +1515,12 @@ class S3CRUD(CRUDMethod):
             else:
                 dt_pagination = False
 
+            # Keyset pagination for subsequent Ajax requests?
+            if dt_pagination and settings.get_ui_keyset_pagination():
+                cursor = ""
+            else:
+                cursor = None
+
             # Get the data table
             dt, totalrows = resource.datatable(fields = list_fields,
                                                start = start,
@@ -1516,6 +1529,7 @@ class S3CRUD(CRUDMethod):
                                                orderby = orderby,
                                                distinct = False,
                                                list_id = list_id,
+                                               cursor = cursor,
                                                )
             displayrows = totalrows
 
@@ -1569,6 +1583,12 @@ class S3CRUD(CRUDMethod):
             if orderby is None:
                 orderby = get_config("orderby", None)
 
+            # Keyset pagination?
+            if current.deployment_settings.get_ui_keyset_pagination():
+                cursor = get_vars.get("cursor", "")
+            else:
+                cursor = None
+
             # Get a data table
             if totalrows != 0:
                 dt, displayrows = resource.datatable(fields = list_fields,
@@ -1578,6 +1598,7 @@ class S3CRUD(CRUDMethod):
                                                      orderby = orderby,
                                                      distinct = False,
                                                      list_id = list_id,
+                                                     cursor = cursor,
                                                      )
             else:
                 dt, displayrows = None, 0
@@ -1674,8 +1695,14 @@ class S3CRUD(CRUDMethod):
             resource.add_filter(FS("id") == record_id)
             start = 0
             limit = 1
+            cursor = None
         else:
             start, limit = self._limits(get_vars)
+            # Keyset pagination?
+            if current.deployment_settings.get_ui_keyset_pagination():
+                cursor = get_vars.get("cursor", "")
+            else:
+                cursor = None
 
         # Initialize output
         output = {}
@@ -1709,6 +1736,7 @@ class S3CRUD(CRUDMethod):
                                                   orderby = orderby,
                                                   list_id = list_id,
                                                   layout = layout,
+                                                  cursor = cursor,
                                                   )
 
             if numrows == 0:
@@ -1723,7 +1751,7 @@ class S3CRUD(CRUDMethod):
             ajax_url = attr.get("list_ajaxurl", None)
             if not ajax_url:
                 ajax_vars = {k: v for k, v in r.get_vars.items()
-                                  if k not in ("start", "limit")}
+                                  if k not in ("start", "limit", "cursor")}
                 ajax_url = r.url(representation="dl", vars=ajax_vars)
 
             # Render the list (even if empty => Ajax-section is required
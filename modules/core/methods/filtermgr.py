@@ -33,6 +33,7 @@ import json
 from gluon import current
 from gluon.storage import Storage
 
+from ..filters import OptionsFilter
 from ..tools import JSONSEPARATORS
 
 from .base import CRUDMethod
@@ -121,6 +122,9 @@ class S3Filter(CRUDMethod):
                                               filter = current.response.s3.filter,
                                               )
 
+            # Look up the options of all options filters at once
+            OptionsFilter.prefetch(filter_widgets, fresource)
+
             for widget in filter_widgets:
                 if hasattr(widget, "ajax_options"):
                     opts = widget.ajax_options(fresource)
@@ -28,9 +28,11 @@
 __all__ = ("S3Report",
            "S3PivotTable",
            "S3ReportRepresent",
+           "PivotTableAggregates",
            )
 
 import datetime
+import hashlib
 import json
 import os
 import re
@@ -46,10 +48,12 @@ from gluon.sqlhtml import OptionsWidget
 from gluon.storage import Storage
 from gluon.validators import IS_IN_SET, IS_EMPTY_OR
 
+from s3dal import original_tablename
+
 from ..formats import S3XMLFormat
 from ..resource import FS, S3Joins
-from ..tools import IS_NUMBER, JSONERRORS, JSONSEPARATORS, \
-                    MarkupStripper, get_crud_string, s3_flatlist, \
+from ..tools import GroupedAggregate, IS_NUMBER, JSONERRORS, JSONSEPARATORS, \
+                    MarkupStripper, S3DateTime, get_crud_string, s3_flatlist, \
                     s3_has_foreign_key, s3_represent_value, s3_str
 
 from .base import CRUDMethod
@@ -162,6 +166,8 @@ class S3Report(CRUDMethod):
 
                 pivottable = S3PivotTable(resource, rows, cols, facts,
                                           precision = report_options.get("precision"),
+                                          aggregates = True,
+                                          groupby = self.groupby(resource),
                                           )
         else:
             pivottable = None
@@ -520,6 +526,8 @@ class S3Report(CRUDMethod):
                 if visible:
                     pivottable = S3PivotTable(resource, rows, cols, facts,
                                               precision = report_options.get("precision"),
+                                              aggregates = True,
+                                              groupby = self.groupby(resource),
                                               )
                 else:
                     pivottable = None
@@ -742,6 +750,23 @@ class S3Report(CRUDMethod):
         current.response.headers["Content-Type"] = "application/json"
         return json.dumps(output, separators=JSONSEPARATORS)
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def groupby(resource):
+        """
+            Whether to aggregate pivot tables for a resource in the database
+            (faster, but without cell drill-down)
+
+            Args:
+                resource: the CRUDResource
+
+            Returns:
+                boolean
+        """
+
+        default = current.deployment_settings.get_ui_report_groupby()
+        return bool(resource.get_config("report_groupby", default))
+
     # -------------------------------------------------------------------------
     @staticmethod
     def inject_d3():
@@ -1743,7 +1768,16 @@ class S3PivotTableFact:
 class S3PivotTable:
     """ Class representing a pivot table of a resource """
 
-    def __init__(self, resource, rows, cols, facts, strict=True, precision=None):
+    def __init__(self,
+                 resource,
+                 rows,
+                 cols,
+                 facts,
+                 strict = True,
+                 precision = None,
+                 aggregates = False,
+                 groupby = False,
+                 ):
         """
             Args:
                 resource: the CRUDResource
@@ -1754,6 +1788,10 @@ class S3PivotTable:
                         the resource filter
                 precision: maximum precision of aggregate computations,
                            a dict {selector: number_of_decimals}
+                aggregates: use materialized aggregates if available
+                            (see PivotTableAggregates)
+                groupby: aggregate in the database (GROUP BY) if the axes
+                         and facts allow, no cell drill-down available then
 
             Note:
                 Constructor extracts all unique records, generates a pivot
@@ -1827,6 +1865,13 @@ class S3PivotTable:
 
         self.values = {}
 
+        self.numrecords = None
+        """ The total number of records (when generated from aggregates) """
+        self.freshness = None
+        """ The time when the aggregates have last been refreshed (when
+            generated from aggregates)
+        """
+
         # Get the fields ------------------------------------------------------
         #
         tablename = resource.tablename
@@ -1841,6 +1886,11 @@ class S3PivotTable:
         rows = self.rows
         cols = self.cols
 
+        # Use materialized aggregates if possible -----------------------------
+        #
+        if aggregates and self._aggregate():
+            return
+
         # Exclude records with empty axis values ------------------------------
         #
         exclude_empty = current.s3db.get_config(tablename, "report_exclude_empty")
@@ -1855,6 +1905,11 @@ class S3PivotTable:
                 if axis in exclude_empty:
                     resource.add_filter(FS(axis) != None)
 
+        # Aggregate in the database if possible -------------------------------
+        #
+        if groupby and self._groupby(strict=strict):
+            return
+
         # Retrieve the records ------------------------------------------------
         #
         data = resource.select(list(self.rfields.keys()), limit=None)
@@ -1935,6 +1990,9 @@ class S3PivotTable:
     def __len__(self):
         """ Total number of records in the report """
 
+        if self.numrecords is not None:
+            return self.numrecords
+
         items = self.records
         if items is None:
             return 0
@@ -2405,6 +2463,12 @@ class S3PivotTable:
                             prefix(cols_dim) if cols_dim else None,
                             )
 
+        # Add freshness indicator when generated from aggregates
+        freshness = self.freshness
+        if freshness:
+            updated = S3DateTime.datetime_represent(freshness, utc=True)
+            output["freshness"] = s3_str(T("Data as of %(updated)s") % {"updated": updated})
+
         return output
 
     # -------------------------------------------------------------------------
@@ -2682,6 +2746,22 @@ class S3PivotTable:
                          for j in range(numrows)]
         cells = self.cell
 
+        # Extract the fact values of all records at once, to aggregate
+        # them with grouped reductions rather than cell by cell
+        # - not for count/list which count/list distinct values per cell
+        grouped = None
+        if fact.selector is not None and \
+           fact.method in ("sum", "min", "max", "avg") and \
+           GroupedAggregate.supports(fact.method):
+            record_ids = list(records.keys())
+            grouped = GroupedAggregate([extract(records[i], fact.selector)
+                                        for i in record_ids])
+            if grouped.valid:
+                index = {record_id: i for i, record_id in enumerate(record_ids)}
+                items, cell_groups, row_groups, col_groups = [], [], [], []
+            else:
+                grouped = None
+
         all_values = []
         for r in range(numrows):
 
@@ -2722,7 +2802,14 @@ class S3PivotTable:
                 col_records.extend(ids)
 
                 # Get the values
-                if fact.selector is None:
+                if grouped:
+                    items.extend(index[i] for i in ids)
+                    num = len(ids)
+                    cell_groups.extend([r * numcols + c] * num)
+                    row_groups.extend([r] * num)
+                    col_groups.extend([c] * num)
+                    continue
+                elif fact.selector is None:
                     fact.selector = pkey
                     values = ids
                     row_values = row_records
@@ -2748,12 +2835,22 @@ class S3PivotTable:
                 cell[layer] = value
 
             # Compute row total
-            row[layer] = fact.compute(row_values,
-                                      totals = True,
-                                      precision = precision,
-                                      )
+            if not grouped:
+                row[layer] = fact.compute(row_values,
+                                          totals = True,
+                                          precision = precision,
+                                          )
             del row[VALUES]
 
+        if grouped:
+            self._add_layer_grouped(grouped,
+                                    fact,
+                                    items,
+                                    (cell_groups, row_groups, col_groups),
+                                    precision = precision,
+                                    )
+            return
+
         # Compute column total
         for c in range(numcols):
             col = cols[c]
@@ -2770,6 +2867,337 @@ class S3PivotTable:
                                           )
         self.values[layer] = all_values
 
+    # -------------------------------------------------------------------------
+    def _add_layer_grouped(self, grouped, fact, items, groups, precision=None):
+        """
+            Compute the aggregates of a layer with grouped reductions,
+            sub-routine of _add_layer
+
+            Args:
+                grouped: the GroupedAggregate with the fact values
+                fact: the fact
+                items: the record indices (in grouped) of all cell entries
+                groups: tuple of group indices (cell, row, col) per entry
+                precision: number of decimals
+        """
+
+        layer = fact.layer
+        method = fact.method
+        empty = 0.0 if method == "avg" else None
+
+        numcols = len(self.col)
+        numrows = len(self.row)
+
+        def compute(group_index, size):
+            results = grouped.compute(method, items, group_index, size, empty=empty)
+            if precision is not None:
+                results = [round(v, precision) if type(v) is float else v
+                           for v in results]
+            return results
+
+        cell_groups, row_groups, col_groups = groups
+
+        results = compute(cell_groups, numrows * numcols)
+        cells = self.cell
+        for r in range(numrows):
+            row = cells[r]
+            offset = r * numcols
+            for c in range(numcols):
+                row[c][layer] = results[offset + c]
+
+        for row, value in zip(self.row, compute(row_groups, numrows)):
+            row[layer] = value
+
+        cols = self.col
+        for col, value in zip(cols, compute(col_groups, numcols)):
+            col[layer] = value
+            col.pop("values", None)
+
+        self.totals[layer] = compute([0] * len(items), 1)[0]
+
+        # All values (in the same order as when aggregating per cell)
+        values = grouped.values.tolist()
+        mask = grouped.mask.tolist()
+        self.values[layer] = [values[i] for i in items if mask[i]]
+
+    # -------------------------------------------------------------------------
+    def _aggregate(self):
+        """
+            Generate the pivot table from materialized aggregates
+
+            Returns:
+                True if successful, False if the pivot table must be
+                computed from the records
+        """
+
+        resource = self.resource
+
+        rows, cols, facts = self.rows, self.cols, self.facts
+
+        match = PivotTableAggregates.match(resource, rows, cols, facts)
+        if not match:
+            return False
+        aggregates, conditions = match
+
+        result = aggregates.extract(conditions, rows, cols)
+        if result is None:
+            return False
+        partials, self.freshness = result
+
+        self._compute_partials(partials, aggregates.compute)
+
+        return True
+
+    # -------------------------------------------------------------------------
+    def _compute_partials(self, partials, compute):
+        """
+            Generate rows, columns, cells and totals from partial aggregates
+
+            Args:
+                partials: the partial aggregates per cell, a dict
+                          {(row_value, col_value): partial}, see
+                          PivotTableAggregates.merge for format
+                compute: function to compute a fact value from a partial
+                         aggregate, compute(partial, fact, precision)
+        """
+
+        self.records = {}
+        self.numrecords = 0
+
+        if not partials:
+            self.empty = True
+            return
+
+        # Axis values
+        rindex, cindex = {}, {}
+        for rvalue, cvalue in partials:
+            if rvalue not in rindex:
+                rindex[rvalue] = len(rindex)
+            if cvalue not in cindex:
+                cindex[cvalue] = len(cindex)
+        self.row = [Storage(value=v, records=[]) for v in rindex]
+        self.col = [Storage(value=v, records=[]) for v in cindex]
+        numrows = self.numrows = len(self.row)
+        numcols = self.numcols = len(self.col)
+
+        # Cell partials and totals
+        merge = PivotTableAggregates.merge
+        matrix = [[None] * numcols for _ in range(numrows)]
+        rtotals = [None] * numrows
+        ctotals = [None] * numcols
+        total = {"records": 0, "data": {}}
+        for (rvalue, cvalue), partial in partials.items():
+            r, c = rindex[rvalue], cindex[cvalue]
+            matrix[r][c] = partial
+            for totals, i in ((rtotals, r), (ctotals, c)):
+                if totals[i] is None:
+                    totals[i] = {"records": 0, "data": {}}
+                merge(totals[i], partial)
+            merge(total, partial)
+        self.numrecords = total["records"]
+
+        # Compute the layers
+        cells = self.cell = [[Storage(records=[]) for _ in range(numcols)]
+                             for _ in range(numrows)]
+        for fact in self.facts:
+            layer = fact.layer
+            precision = self.precision.get(fact.selector)
+            for r in range(numrows):
+                for c in range(numcols):
+                    cells[r][c][layer] = compute(matrix[r][c], fact, precision)
+                self.row[r][layer] = compute(rtotals[r], fact, precision)
+            for c in range(numcols):
+                self.col[c][layer] = compute(ctotals[c], fact, precision)
+            self.totals[layer] = compute(total, fact, precision)
+
+    # -------------------------------------------------------------------------
+    def _groupby(self, strict=True):
+        """
+            Generate the pivot table with a single GROUP BY query rather
+            than extracting and aggregating all records in Python
+
+            Args:
+                strict: filter out dimension values which don't match
+                        the resource filter
+
+            Returns:
+                True if successful, False if the pivot table must be
+                computed from the records (i.e. if any axis or fact is
+                not a plain database column, or a list-type, or requires
+                aggregation methods that cannot be done in SQL)
+
+            Note:
+                Cell drill-down is not available in pivot tables generated
+                this way, as the records contributing to a cell are not
+                retrieved
+        """
+
+        resource = self.resource
+        if resource.parent or resource.linked is not None:
+            return False
+
+        # Virtual and extra filters require Python post-processing
+        rfilter = resource.rfilter
+        if resource.get_filter() or rfilter.get_extra_filters():
+            return False
+
+        db = current.db
+
+        table = resource.table
+        tablename = resource.tablename
+
+        rfields = self.rfields
+        facts = self.facts
+
+        # Selectors on the master table or reached by foreign keys only
+        # have one value per record, everything else may have multiple
+        master = "%s." % resource.alias
+        def single(selector):
+            return selector.startswith(master) and \
+                   "." not in selector[len(master):]
+
+        # Check the axes
+        axes = []
+        multiple = False
+        for selector in (self.rows, self.cols):
+            if not selector:
+                axes.append(None)
+                continue
+            rfield = rfields.get(selector)
+            if not rfield or rfield.field is None or \
+               rfield.ftype[:5] == "list:" or rfield.ftype in ("json", "blob"):
+                return False
+            if not single(selector):
+                multiple = True
+            axes.append(rfield)
+
+        # Check the facts
+        for fact in facts:
+            method = fact.method
+            rfield = rfields.get(fact.selector)
+            if method == "list" or \
+               not rfield or rfield.field is None or rfield.ftype[:5] == "list:":
+                return False
+            if method != "count":
+                # Numeric aggregates require a single value per record
+                # (otherwise joins would count records multiple times),
+                # and only int/float values are aggregated in Python
+                if multiple or not single(fact.selector) or \
+                   rfield.ftype not in ("integer", "double"):
+                    return False
+
+        # Left joins for axes and facts
+        aqueries = {}
+        left_joins = S3Joins(tablename)
+        for rfield in axes:
+            if rfield:
+                left_joins.extend(rfield.left)
+        for fact in facts:
+            left_joins.extend(rfields[fact.selector].left)
+
+        # The query
+        query = resource.get_query()
+        qdict = query.as_dict(flat=True) if strict and multiple else None
+
+        # Filters involving joined tables are applied as subselect (to
+        # prevent those joins from multiplying the records to aggregate)
+        ijoins = S3Joins(tablename)
+        ijoins.add(rfilter.get_joins(left=False))
+        ljoins = S3Joins(tablename)
+        ljoins.add(rfilter.get_joins(left=True))
+        if ijoins or ljoins:
+            subselect = db(query)._select(table._id,
+                                          join = ijoins.as_list(aqueries = aqueries,
+                                                                prefer = ljoins,
+                                                                ),
+                                          left = ljoins.as_list(aqueries = aqueries),
+                                          distinct = True,
+                                          )
+            query = table._id.belongs(subselect)
+        master_query = query
+
+        # Filter axis values of multi-value axes
+        if qdict:
+            for selector, rfield in zip((self.rows, self.cols), axes):
+                if not rfield or single(selector):
+                    continue
+                tablenames = list(rfield.left.keys())
+                tablenames.append(tablename)
+                af = S3AxisFilter(qdict, tablenames)
+                if af.op is not None:
+                    subquery = af.query()
+                    if subquery is not None:
+                        query &= subquery
+
+        # Expressions to select
+        groupby = [rfield.field for rfield in axes if rfield]
+        records = table._id.count(distinct=True)
+        expressions = {}
+        for fact in facts:
+            layer = fact.layer
+            field = rfields[fact.selector].field
+            if fact.method == "count":
+                expressions[layer] = (field.count(distinct=True),)
+            else:
+                expressions[layer] = (field.count(),
+                                      field.sum(),
+                                      field.min(),
+                                      field.max(),
+                                      )
+        fields = list(groupby)
+        fields.append(records)
+        for exprs in expressions.values():
+            fields.extend(exprs)
+
+        rows = db(query).select(*fields,
+                                left = left_joins.as_list(aqueries = aqueries),
+                                groupby = groupby,
+                                )
+
+        # Collect the partial aggregates
+        rows_field, cols_field = [rfield.field if rfield else None for rfield in axes]
+        partials = {}
+        for row in rows:
+            rvalue = row[rows_field] if rows_field else None
+            cvalue = row[cols_field] if cols_field else None
+            data = {}
+            for layer, exprs in expressions.items():
+                if len(exprs) == 1:
+                    data[layer] = [row[exprs[0]], 0, None, None]
+                else:
+                    number, total, minimum, maximum = [row[e] for e in exprs]
+                    data[layer] = [number, total or 0, minimum, maximum]
+            partials[(rvalue, cvalue)] = {"records": row[records],
+                                          "data": data,
+                                          }
+
+        def compute(partial, fact, precision=None):
+            values = partial["data"].get(fact.layer) if partial else None
+            number, total, minimum, maximum = values if values else (0, 0, None, None)
+            method = fact.method
+            if method == "count":
+                result = number
+            elif method == "sum":
+                result = total
+            elif method == "min":
+                result = minimum
+            elif method == "max":
+                result = maximum
+            else:
+                result = total / float(number) if number else 0.0
+            if type(result) is float and precision is not None:
+                result = round(result, precision)
+            return result
+
+        self._compute_partials(partials, compute)
+
+        # Records can contribute to multiple cells with multi-value axes,
+        # so the total number of records must be counted separately
+        if multiple and not self.empty:
+            self.numrecords = db(master_query).count(distinct=table._id)
+
+        return True
+
     # -------------------------------------------------------------------------
     def _get_fields(self, fields=None):
         """
@@ -3190,4 +3618,820 @@ class S3AxisFilter:
             return [], li
         return [], []
 
+# =============================================================================
+class PivotTableAggregates:
+    """
+        Materialized aggregates for pivot tables: partial aggregates (number
+        of records, and count/sum/min/max of the fact values) per partition
+        and combination of axis values, stored in s3_report_cube_cell, so
+        that pivot tables can be generated without extracting all records
+
+        Configured per table like:
+
+            s3db.configure(tablename,
+                           report_aggregates = [{"rows": "site_id$location_id$L2",
+                                                 "cols": "disease_id",
+                                                 "facts": ["sum(tests_total)",
+                                                           "count(id)",
+                                                           ],
+                                                 "partition": "date",
+                                                 },
+                                                ],
+                           )
+
+        Notes:
+            - aggregates serve pivot tables with the same axes (also swapped)
+              or a subset of them (rolled up), with count(id), or sum/min/
+              max/avg of the configured fact fields
+            - the optional partition field (a date field of the master table)
+              allows to filter by date ranges, and to refresh the aggregates
+              incrementally per partition when records are written (requires
+              attach()); without partition, any write requires a rebuild
+            - aggregates are only built and stored by refresh_all (scheduler
+              task); pivot tables never write to the database, but compute
+              partitions changed since the last refresh from the records
+            - pivot tables with other filters, by users with restricted read
+              permission, or with aggregates not yet built, fall back to the
+              live computation
+    """
+
+    # Aggregation methods that can be derived from partial aggregates
+    METHODS = ("count", "sum", "min", "max", "avg")
+
+    # Field types supported for axes
+    AXIS_TYPES = ("id", "integer", "string", "boolean")
+
+    # Maximum number of dirty partitions to compute on-the-fly
+    MAX_DIRTY = 31
+
+    def __init__(self, tablename, rows=None, cols=None, facts=None, partition=None):
+        """
+            Args:
+                tablename: the name of the table
+                rows: the rows axis selector
+                cols: the cols axis selector
+                facts: list of fact expressions, e.g. "sum(tests_total)"
+                partition: name of the partition field (date)
+        """
+
+        if not rows and not cols:
+            raise SyntaxError("No axes specified for report aggregates")
+
+        self.tablename = tablename
+
+        prefix = self.prefix
+        self.rows = prefix(rows)
+        self.cols = prefix(cols)
+        self.partition = partition
+
+        # Fact fields
+        fields = set()
+        for fact in S3PivotTableFact.parse(list(facts) if facts else []):
+            selector = prefix(fact.selector)
+            if selector != "~.id":
+                fields.add(selector)
+        self.fields = sorted(fields)
+
+        signature = json.dumps([self.rows, self.cols, partition, self.fields])
+        self.signature = hashlib.sha1(signature.encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def configured(cls, tablename):
+        """
+            Get the aggregates configured for a table
+
+            Args:
+                tablename: the table name
+
+            Returns:
+                list of PivotTableAggregates
+        """
+
+        config = current.s3db.get_config(tablename, "report_aggregates")
+        if not config:
+            return []
+        if isinstance(config, dict):
+            config = [config]
+
+        return [cls(tablename,
+                    rows = item.get("rows"),
+                    cols = item.get("cols"),
+                    facts = item.get("facts"),
+                    partition = item.get("partition"),
+                    ) for item in config]
+
+    # -------------------------------------------------------------------------
+    def prefix(self, selector):
+        """
+            Normalize a field selector (same as CRUDResource.prefix_selector
+            for the master table)
+
+            Args:
+                selector: the field selector
+
+            Returns:
+                the normalized selector
+        """
+
+        if not selector:
+            return None
+
+        head = selector.split("$", 1)[0]
+        if "." in head:
+            prefix = head.split(".", 1)[0]
+            if prefix == self.tablename:
+                return selector.replace("%s." % prefix, "~.", 1)
+            return selector
+        return "~.%s" % selector
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+    @classmethod
+    def match(cls, resource, rows, cols, facts):
+        """
+            Find aggregates to generate a pivot table from
+
+            Args:
+                resource: the CRUDResource
+                rows: the rows axis selector
+                cols: the cols axis selector
+                facts: the S3PivotTableFacts
+
+            Returns:
+                tuple (PivotTableAggregates, conditions), or None if no
+                matching aggregates are configured or the resource filter
+                is incompatible
+        """
+
+        get_config = resource.get_config
+        if resource.parent or \
+           not get_config("report_aggregates") or \
+           get_config("report_exclude_empty"):
+            return None
+
+        # Virtual or extra filters are not applicable to aggregates
+        query = resource.get_query()
+        if resource.get_filter() is not None or \
+           resource.rfilter.get_extra_filters():
+            return None
+
+        for aggregates in cls.configured(resource.tablename):
+            if not aggregates.serves(rows, cols, facts):
+                continue
+            conditions = aggregates.conditions(query)
+            if conditions is not None:
+                return aggregates, conditions
+
+        return None
+
+    # -------------------------------------------------------------------------
+    def serves(self, rows, cols, facts):
+        """
+            Check whether a pivot table can be generated from these
+            aggregates
+
+            Args:
+                rows: the rows axis selector
+                cols: the cols axis selector
+                facts: the S3PivotTableFacts
+
+            Returns:
+                True|False
+        """
+
+        prefix = self.prefix
+
+        axes = {self.rows, self.cols}
+        for axis in (rows, cols):
+            if axis and prefix(axis) not in axes:
+                return False
+
+        fields = self.fields
+        for fact in facts:
+            method = fact.method
+            if method not in self.METHODS:
+                return False
+            selector = prefix(fact.selector)
+            if selector == "~.id":
+                # Number of records
+                if method != "count":
+                    return False
+            elif method == "count" or selector not in fields:
+                # Count of distinct values can not be aggregated
+                return False
+
+        return True
+
+    # -------------------------------------------------------------------------
+    def conditions(self, query):
+        """
+            Convert the resource query into conditions for the partition
+
+            Args:
+                query: the resource query
+
+            Returns:
+                list of tuples (operator, date), or None if the query
+                contains other conditions than for the partition field
+        """
+
+        tablename = self.tablename
+        partition = self.partition
+
+        conditions = []
+        for item in self.conjuncts(query.as_dict(flat=True)):
+
+            first = item.get("first")
+            if not isinstance(first, dict) or \
+               first.get("tablename") != tablename:
+                return None
+            fieldname = first.get("fieldname")
+
+            op = (item.get("op") or "").upper().strip("_")
+            value = item.get("second")
+
+            if fieldname == "deleted" and \
+               (op == "EQ" and value is False or op == "NE" and value is True):
+                # Deleted-filter (always applied to aggregates)
+                continue
+
+            if fieldname == "id" and op == "GT" and value == 0:
+                # All records accessible
+                continue
+
+            if partition and fieldname == partition and \
+               op in ("EQ", "GT", "GE", "GTE", "LT", "LE", "LTE"):
+                try:
+                    value = datetime.date.fromisoformat(value)
+                except (TypeError, ValueError):
+                    return None
+                conditions.append((op, value))
+                continue
+
+            return None
+
+        return conditions
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def conjuncts(cls, qdict):
+        """
+            Split a query dict into its conjuncts
+
+            Args:
+                qdict: the query dict (from Query.as_dict(flat=True))
+
+            Returns:
+                list of query dicts
+        """
+
+        if not qdict:
+            return []
+
+        op = (qdict.get("op") or "").upper().strip("_")
+        if op == "AND":
+            return cls.conjuncts(qdict.get("first")) + \
+                   cls.conjuncts(qdict.get("second"))
+        else:
+            return [qdict]
+
+    # -------------------------------------------------------------------------
+    def extract(self, conditions, rows, cols):
+        """
+            Extract the aggregates for a pivot table; dirty partitions
+            are computed from the records, but not stored (i.e. does
+            not write to the database)
+
+            Args:
+                conditions: the partition conditions (from conditions())
+                rows: the rows axis selector
+                cols: the cols axis selector
+
+            Returns:
+                tuple (partials, refreshed_on), where partials is a dict
+                {(row_value, col_value): partial aggregate}, or None if
+                no (sufficiently fresh) aggregates are available
+        """
+
+        cube = self.cube()
+        if not cube or cube.rebuild:
+            return None
+
+        # Dirty partitions within the requested range
+        parts = set()
+        if self.partition:
+            parts = set(part for part in self.dirty(cube.id)[0]
+                        if self.in_range(part, conditions))
+            if len(parts) > self.MAX_DIRTY:
+                return None
+
+        db = current.db
+        table = current.s3db.s3_report_cube_cell
+
+        query = (table.cube_id == cube.id)
+        field = table.part
+        for op, value in conditions:
+            if op == "EQ":
+                query &= (field == value)
+            elif op == "GT":
+                query &= (field > value)
+            elif op in ("GE", "GTE"):
+                query &= (field >= value)
+            elif op == "LT":
+                query &= (field < value)
+            else:
+                query &= (field <= value)
+        if parts:
+            query &= ~(self.in_parts(field, parts))
+        stored = db(query).select(table.row_value,
+                                  table.col_value,
+                                  table.records,
+                                  table.data,
+                                  )
+        cells = [((json.loads(cell.row_value), json.loads(cell.col_value)),
+                  {"records": cell.records, "data": cell.data or {}},
+                  ) for cell in stored]
+
+        # Compute the dirty partitions from the records
+        if parts:
+            computed = self.compute_cells(self.in_parts(FS(self.partition), parts))
+            cells.extend(((rvalue, cvalue), partial)
+                         for (_, rvalue, cvalue), partial in computed.items())
+
+        # Map the axes
+        prefix = self.prefix
+        rows, cols = prefix(rows), prefix(cols)
+        if rows and rows == self.cols or cols and cols == self.rows:
+            swap = True
+        else:
+            swap = False
+
+        merge = self.merge
+        partials = {}
+        for values, partial in cells:
+            if swap:
+                values = values[::-1]
+            key = (values[0] if rows else None,
+                   values[1] if cols else None,
+                   )
+            if key in partials:
+                merge(partials[key], partial)
+            else:
+                partials[key] = partial
+
+        return partials, cube.refreshed_on
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def in_range(part, conditions):
+        """
+            Check whether a partition value matches the partition conditions
+
+            Args:
+                part: the partition value (date or None)
+                conditions: the partition conditions (from conditions())
+
+            Returns:
+                True|False
+        """
+
+        for op, value in conditions:
+            if part is None:
+                return False
+            if op == "EQ":
+                match = part == value
+            elif op == "GT":
+                match = part > value
+            elif op in ("GE", "GTE"):
+                match = part >= value
+            elif op == "LT":
+                match = part < value
+            else:
+                match = part <= value
+            if not match:
+                return False
+
+        return True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def in_parts(field, parts):
+        """
+            Construct a query for a set of partitions
+
+            Args:
+                field: the partition Field (or FS)
+                parts: the partition values
+
+            Returns:
+                the Query (or S3ResourceQuery)
+        """
+
+        dates = [p for p in parts if p is not None]
+        query = field.belongs(dates)
+        if None in parts:
+            query |= (field == None)
+        return query
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def merge(target, source):
+        """
+            Merge a partial aggregate into another
+
+            Args:
+                target: the partial aggregate to update
+                source: the partial aggregate to merge into target
+        """
+
+        target["records"] += source["records"]
+
+        data = target["data"] = dict(target["data"])
+        for selector, values in source["data"].items():
+            if selector not in data:
+                data[selector] = list(values)
+                continue
+            number, total, minimum, maximum = data[selector]
+            data[selector] = [number + values[0],
+                              total + values[1],
+                              minimum if values[2] is None else \
+                              values[2] if minimum is None else min(minimum, values[2]),
+                              maximum if values[3] is None else \
+                              values[3] if maximum is None else max(maximum, values[3]),
+                              ]
+
+    # -------------------------------------------------------------------------
+    def compute(self, partial, fact, precision=None):
+        """
+            Compute the value of a fact from a partial aggregate,
+            equivalent to S3PivotTableFact.compute
+
+            Args:
+                partial: the partial aggregate (or None if empty)
+                fact: the S3PivotTableFact
+                precision: number of decimals
+
+            Returns:
+                the value
+        """
+
+        method = fact.method
+
+        if method == "count":
+            result = partial["records"] if partial else 0
+        else:
+            data = partial["data"] if partial else {}
+            values = data.get(self.prefix(fact.selector))
+            number, total, minimum, maximum = values if values else (0, 0, None, None)
+            if method == "sum":
+                result = total
+            elif method == "min":
+                result = minimum
+            elif method == "max":
+                result = maximum
+            else:
+                result = total / float(number) if number else 0.0
+
+        if type(result) is float and precision is not None:
+            result = round(result, precision)
+        return result
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+    def cube(self, create=False):
+        """
+            Get the s3_report_cube record for these aggregates
+
+            Args:
+                create: create the record if it doesn't exist yet
+                        (marked for rebuild)
+
+            Returns:
+                the s3_report_cube Row, or None
+        """
+
+        db = current.db
+        table = current.s3db.s3_report_cube
+
+        query = (table.tablename == self.tablename) & \
+                (table.signature == self.signature)
+        fields = [table.id, table.rebuild, table.refreshed_on]
+
+        row = db(query).select(*fields, limitby=(0, 1)).first()
+        if not row and create:
+            table.insert(tablename = self.tablename,
+                         signature = self.signature,
+                         cube_rows = self.rows,
+                         cube_cols = self.cols,
+                         cube_partition = self.partition,
+                         facts = self.fields,
+                         rebuild = True,
+                         )
+            row = db(query).select(*fields, limitby=(0, 1)).first()
+        return row
+
+    # -------------------------------------------------------------------------
+    def dirty(self, cube_id):
+        """
+            Get the dirty partitions of a cube
+
+            Args:
+                cube_id: the s3_report_cube record ID
+
+            Returns:
+                tuple (parts, last), parts being the set of dirty partition
+                values and last the ID of the last dirty-entry read
+        """
+
+        table = current.s3db.s3_report_cube_dirty
+        rows = current.db(table.cube_id == cube_id).select(table.id,
+                                                           table.part,
+                                                           )
+        parts = set(row.part for row in rows)
+        last = max(row.id for row in rows) if rows else None
+
+        return parts, last
+
+    # -------------------------------------------------------------------------
+    def refresh(self, cube, parts=None, last=DEFAULT):
+        """
+            Re-compute the aggregates (entirely or for some partitions)
+
+            Args:
+                cube: the s3_report_cube Row
+                parts: the partitions to refresh, None for all
+                last: the ID of the last dirty-entry processed (default:
+                      all current dirty-entries when rebuilding)
+
+            Returns:
+                the updated s3_report_cube Row
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        if last is DEFAULT:
+            last = self.dirty(cube.id)[1]
+
+        # Partitions to refresh
+        in_parts = self.in_parts
+        if parts is not None:
+            query = in_parts(FS(self.partition), parts)
+        else:
+            query = None
+
+        # Compute the cells
+        cells = self.compute_cells(query)
+
+        # Replace the cells
+        table = s3db.s3_report_cube_cell
+        cquery = (table.cube_id == cube.id)
+        if parts is not None:
+            cquery &= in_parts(table.part, parts)
+        db(cquery).delete()
+        if cells:
+            table.bulk_insert([{"cube_id": cube.id,
+                                "part": part,
+                                "row_value": json.dumps(rvalue),
+                                "col_value": json.dumps(cvalue),
+                                "records": partial["records"],
+                                "data": partial["data"],
+                                } for (part, rvalue, cvalue), partial in cells.items()])
+
+        # Remove processed dirty-entries
+        if last is not None:
+            dtable = s3db.s3_report_cube_dirty
+            dquery = (dtable.cube_id == cube.id) & (dtable.id <= last)
+            if parts is not None:
+                dquery &= in_parts(dtable.part, parts)
+            db(dquery).delete()
+
+        # Update cube status
+        now = current.request.utcnow
+        cube.update_record(rebuild = False,
+                           refreshed_on = now,
+                           )
+        cube.rebuild = False
+        cube.refreshed_on = now
+
+        return cube
+
+    # -------------------------------------------------------------------------
+    def compute_cells(self, query=None):
+        """
+            Compute the partial aggregates from the records, regardless
+            of user permissions
+
+            Args:
+                query: filter query for the records (S3ResourceQuery)
+
+            Returns:
+                dict {(part, row_value, col_value): partial aggregate}
+        """
+
+        auth = current.auth
+        override = auth.override
+        auth.override = True
+        try:
+            cells = self.aggregate(query)
+        finally:
+            auth.override = override
+
+        return cells
+
+    # -------------------------------------------------------------------------
+    def aggregate(self, query=None):
+        """
+            Compute the partial aggregates from the records
+
+            Args:
+                query: filter query for the records (S3ResourceQuery)
+
+            Returns:
+                dict {(part, row_value, col_value): partial aggregate}
+        """
+
+        resource = current.s3db.resource(self.tablename, filter=query)
+
+        # Resolve the fields
+        partition = self.prefix(self.partition)
+        axes = (self.rows, self.cols)
+        selectors = [s for s in axes + (partition,) if s] + self.fields
+
+        colnames = {}
+        for selector in selectors:
+            rfield = resource.resolve_selector(selector)
+            ftype = str(rfield.ftype)
+            if selector in axes:
+                valid = rfield.field is not None and \
+                        (ftype in self.AXIS_TYPES or ftype[:9] == "reference")
+            elif selector == partition:
+                valid = rfield.tname == self.tablename and ftype == "date"
+            else:
+                valid = rfield.tname == self.tablename and \
+                        ftype in ("integer", "double")
+            if not valid:
+                raise SyntaxError("Invalid field for report aggregates: %s" % selector)
+            colnames[selector] = rfield.colname
+
+        rcol = colnames.get(self.rows)
+        ccol = colnames.get(self.cols)
+        pcol = colnames.get(partition)
+        fcols = [(selector, colnames[selector]) for selector in self.fields]
+
+        data = resource.select(list(colnames.keys()), limit=None)
+
+        cells = {}
+        for row in data.rows:
+
+            rvalue = row[rcol] if rcol else None
+            cvalue = row[ccol] if ccol else None
+            if type(rvalue) is list or type(cvalue) is list:
+                raise ValueError("Report aggregates require unique axis values per record")
+
+            key = (row[pcol] if pcol else None, rvalue, cvalue)
+            if key in cells:
+                cell = cells[key]
+            else:
+                cell = cells[key] = {"records": 0,
+                                     "data": {selector: [0, 0, None, None]
+                                              for selector in self.fields},
+                                     }
+            cell["records"] += 1
+
+            for selector, colname in fcols:
+                value = row[colname]
+                if not isinstance(value, (int, float)):
+                    continue
+                values = cell["data"][selector]
+                values[0] += 1
+                values[1] += value
+                if values[2] is None or value < values[2]:
+                    values[2] = value
+                if values[3] is None or value > values[3]:
+                    values[3] = value
+
+        return cells
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+    @classmethod
+    def refresh_all(cls, tablename, rebuild=False):
+        """
+            Refresh all aggregates configured for a table, to be run by
+            a scheduler task
+
+            Args:
+                tablename: the table name
+                rebuild: rebuild the aggregates entirely, rather than just
+                         refreshing the dirty partitions
+
+            Returns:
+                the number of aggregates refreshed
+        """
+
+        refreshed = 0
+        for aggregates in cls.configured(tablename):
+
+            cube = aggregates.cube(create=True)
+            if rebuild or cube.rebuild or not aggregates.partition:
+                aggregates.refresh(cube)
+            else:
+                parts, last = aggregates.dirty(cube.id)
+                if not parts:
+                    continue
+                aggregates.refresh(cube, parts=parts, last=last)
+            refreshed += 1
+
+        return refreshed
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def attach(cls, table):
+        """
+            Attach DAL hooks to a table, in order to mark the aggregates
+            dirty when records are written - also catches writes that
+            bypass onaccept/ondelete (e.g. totals updated by other
+            callbacks)
+
+            Args:
+                table: the Table
+        """
+
+        if getattr(table, "_report_aggregates", False):
+            return
+        tablename = original_tablename(table)
+
+        def before_update(dbset, fields):
+            cls.touch(tablename, dbset=dbset)
+            return False
+
+        def after_update(dbset, fields):
+            cls.touch(tablename, fields=fields)
+            return False
+
+        def after_insert(fields, record_id):
+            cls.touch(tablename, fields=fields)
+            return False
+
+        def before_delete(dbset):
+            cls.touch(tablename, dbset=dbset)
+            return False
+
+        table._before_update.append(before_update)
+        table._after_update.append(after_update)
+        table._after_insert.append(after_insert)
+        table._before_delete.append(before_delete)
+        table._report_aggregates = True
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def touch(cls, tablename, dbset=None, fields=None):
+        """
+            Mark the aggregates for a table dirty after a write
+
+            Args:
+                tablename: the table name
+                dbset: the Set of records to be updated/deleted
+                fields: the values written (insert/update)
+        """
+
+        db = current.db
+
+        for aggregates in cls.configured(tablename):
+
+            cube = aggregates.cube()
+            if not cube or cube.rebuild:
+                # Rebuild pending anyway
+                continue
+
+            partition = aggregates.partition
+            if not partition:
+                cube.update_record(rebuild=True)
+                continue
+
+            if fields is not None:
+                if partition not in fields:
+                    continue
+                value = fields[partition]
+                if isinstance(value, datetime.datetime):
+                    value = value.date()
+                elif isinstance(value, str):
+                    try:
+                        value = datetime.date.fromisoformat(value)
+                    except ValueError:
+                        value = None
+                parts = {value}
+            else:
+                field = db[tablename][partition]
+                parts = set(row[field] for row in dbset.select(field, distinct=True))
+
+            table = current.s3db.s3_report_cube_dirty
+            for part in parts:
+                table.insert(cube_id=cube.id, part=part)
+
 # END =========================================================================
@@ -677,6 +677,9 @@ class S3RoleManager(CRUDMethod):
                         # Add the rule
                         table.insert(**data)
 
+            # Invalidate cached ACLs
+            current.auth.permission.expire_acl_cache()
+
     # -------------------------------------------------------------------------
     @staticmethod
     def copy_role(r, **attr):
@@ -29,6 +29,8 @@ __all__ = ("DataModel",
            )
 
 import sys
+import threading
+import time
 
 from gluon import current, IS_EMPTY_OR, TAG
 from gluon.storage import Storage
@@ -36,7 +38,7 @@ from gluon.tools import callback
 
 from s3dal import Table, Field, original_tablename
 
-from ..tools import IS_ONE_OF
+from ..tools import IS_ONE_OF, RepresentCache, TableVersion
 from ..ui import S3ScriptItem
 
 from .dynamic import DynamicTableModel, DYNAMIC_PREFIX
@@ -55,12 +57,21 @@ class DataModel:
     LOAD = "eden_model_load"
     DELETED = "deleted"
 
+    # Process-wide indexes of model names, see get_model_index()
+    model_indexes = {}
+    model_indexes_lock = threading.Lock()
+
+    # Model load profile, see profile_report()
+    profile = {}
+    profile_lock = threading.Lock()
+    profile_stack = threading.local()
+
     def __init__(self, module=None):
 
         self.cache = (current.cache.ram, 60)
 
         self.classes = {}
-        self._module_map = None
+        self._model_index = None
 
         self._customised = {}
 
@@ -71,6 +82,7 @@ class DataModel:
                              "methods": {},
                              "cmethods": {},
                              "hierarchies": {},
+                             "fieldpaths": {},
                              }
 
         response = current.response
@@ -99,19 +111,20 @@ class DataModel:
             else:
                 if isinstance(env, dict):
                     response.s3.update(env)
+            settings = current.deployment_settings
             if module in mandatory_models or \
-               current.deployment_settings.has_module(module):
-                try:
-                    env = self.model()
-                except Exception:
-                    self.__unlock()
-                    raise
+               settings.has_module(module):
+                define = self.model
             else:
-                try:
-                    env = self.defaults()
-                except Exception:
-                    self.__unlock()
-                    raise
+                define = self.defaults
+            try:
+                if settings.get_base_model_profile():
+                    env = self.__profiled(define)
+                else:
+                    env = define()
+            except Exception:
+                self.__unlock()
+                raise
             if isinstance(env, dict):
                 response.s3.update(env)
             self.__loaded(True)
@@ -158,6 +171,36 @@ class DataModel:
                 del response[LOCK]
         return
 
+    # -------------------------------------------------------------------------
+    def __profiled(self, define):
+        """
+            Run a model definition function, and record its run time
+            in the model load profile
+
+            Args:
+                define: the function (model or defaults)
+
+            Returns:
+                the return value of the function
+        """
+
+        # Stack of nested model loads (to deduct their run time)
+        stack = self.profile_stack.__dict__.setdefault("loads", [])
+        stack.append(0.0)
+
+        start = time.perf_counter()
+        try:
+            env = define()
+        finally:
+            duration = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += duration
+
+        DataModel.record_profile(self.__class__, self.prefix, duration, duration - nested)
+
+        return env
+
     # -------------------------------------------------------------------------
     def __getattr__(self, name):
         """ Model auto-loader """
@@ -204,10 +247,18 @@ class DataModel:
             Map of modules by prefix, for faster access (lazy property)
         """
 
-        mmap = self._module_map
-        if mmap is None:
+        return self.model_index.modules
+
+    # -------------------------------------------------------------------------
+    @property
+    def model_index(self):
+        """
+            Index of the modules and names defined by the model packages
+            (lazy property)
+        """
 
-            mmap = self._module_map = {}
+        index = self._model_index
+        if index is None:
 
             # Package locations
             packages = ["s3db"]
@@ -220,21 +271,120 @@ class DataModel:
                         if isinstance(name, str) and name not in packages:
                             packages.append(name)
 
-            # Map all modules
-            for package in packages:
-                try:
-                    p = __import__(package, fromlist=("DEFAULT",))
-                except ImportError:
-                    current.log.error("DataModel cannot import package %s" % package)
-                    continue
+            index = self._model_index = self.get_model_index(packages)
 
-                for k, v in p.__dict__.items():
-                    if type(v) is MODULE_TYPE:
-                        if k not in mmap:
-                            mmap[k] = [v]
-                        else:
-                            mmap[k].append(v)
-        return mmap
+        return index
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get_model_index(cls, packages):
+        """
+            Get the process-wide index of the names defined by the model
+            packages; the index is built once per process, and only
+            rebuilt when modules have been (re-)imported since
+
+            Args:
+                packages: the names of the model packages
+
+            Returns:
+                Storage with
+                    - modules: dict {prefix: [module, ...]}
+                    - names: dict {name: [(module, global, model), ...]},
+                             global indicating whether the name is
+                             defined at module level, and model being
+                             the name of the DataModel class defining it
+        """
+
+        # Map all modules
+        mmap = {}
+        for package in packages:
+            try:
+                p = __import__(package, fromlist=("DEFAULT",))
+            except ImportError:
+                current.log.error("DataModel cannot import package %s" % package)
+                continue
+
+            for k, v in p.__dict__.items():
+                if type(v) is MODULE_TYPE:
+                    if k not in mmap:
+                        mmap[k] = [v]
+                    else:
+                        mmap[k].append(v)
+
+        # Modules are re-imported when changed (debug mode)
+        signature = tuple((k, tuple(id(module) for module in v)) for k, v in mmap.items())
+
+        key = tuple(packages)
+        index = cls.model_indexes.get(key)
+        if index is None or index.signature != signature:
+            with cls.model_indexes_lock:
+                index = cls.model_indexes.get(key)
+                if index is None or index.signature != signature:
+                    start = time.perf_counter()
+                    names = cls.index_names(mmap)
+                    duration = time.perf_counter() - start
+                    index = Storage(modules = mmap,
+                                    names = names,
+                                    signature = signature,
+                                    duration = duration,
+                                    )
+                    cls.model_indexes[key] = index
+
+        return index
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def index_names(mmap):
+        """
+            Index all names defined in modules
+
+            Args:
+                mmap: the module map {prefix: [module, ...]}
+
+            Returns:
+                dict {name: [(module, global, model), ...]}, see
+                get_model_index()
+
+            Note:
+                Names are found by their prefix, so names not matching
+                the prefix of their module are not indexed
+        """
+
+        index = {}
+
+        for prefix, modules in mmap.items():
+            for module in modules:
+
+                names = module.__all__
+                s3models = module.__dict__
+
+                # Names defined at module level
+                found = {name: [True, None] for name in names
+                         if name.split("_", 1)[0] == prefix
+                         }
+
+                # Names defined by DataModels (first one only)
+                for n in names:
+                    model = s3models[n]
+                    if hasattr(model, "_edenmodel") and \
+                       hasattr(model, "names"):
+                        for name in model.names:
+                            if name.split("_", 1)[0] != prefix:
+                                continue
+                            entry = found.get(name)
+                            if entry is None:
+                                found[name] = [False, n]
+                            elif entry[1] is None:
+                                entry[1] = n
+
+                for name, (is_global, model) in found.items():
+                    entry = (module, is_global, model)
+                    if name in index:
+                        index[name].append(entry)
+                    else:
+                        index[name] = [entry]
+
+        return index
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -299,23 +449,15 @@ class DataModel:
             except AttributeError:
                 pass
         else:
-            modules = s3db.module_map.get(prefix, "")
-            for module in modules:
-                names = module.__all__
-                s3models = module.__dict__
-                if not db_only and tablename in names:
+            entries = s3db.model_index.names.get(tablename, ())
+            for module, is_global, model in entries:
+                if not db_only and is_global:
                     # A name defined at module level (e.g. a class)
                     s3db.classes[tablename] = module
-                    found = s3models[tablename]
-                else:
+                    found = module.__dict__[tablename]
+                elif model:
                     # A name defined in a DataModel
-                    for n in names:
-                        model = s3models[n]
-                        if hasattr(model, "_edenmodel") and \
-                           hasattr(model, "names") and \
-                           tablename in model.names:
-                            model(prefix)
-                            break
+                    module.__dict__[model](prefix)
 
         if found:
             return found
@@ -366,20 +508,7 @@ class DataModel:
             except AttributeError:
                 pass
         else:
-            modules = s3db.module_map.get(prefix, "")
-            for module in modules:
-                names = module.__all__
-                if name in names:
-                    found = True
-                    break
-                s3models = module.__dict__
-                for n in names:
-                    model = s3models[n]
-                    if hasattr(model, "_edenmodel") and \
-                       hasattr(model, "names") and \
-                        name in model.names:
-                        found = True
-                        break
+            found = name in s3db.model_index.names
 
         return found
 
@@ -451,6 +580,99 @@ class DataModel:
         s3.load_all_models = False
         s3.all_models_loaded = True
 
+        if current.deployment_settings.get_base_model_profile():
+            current.log.info("Model load profile:\n%s" % cls.profile_report())
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def record_profile(cls, model, prefix, duration, exclusive):
+        """
+            Record the run time of a model load in the process-wide
+            model load profile
+
+            Args:
+                model: the DataModel class
+                prefix: the module prefix
+                duration: the run time of the model definition (seconds)
+                exclusive: the run time excluding nested model loads
+        """
+
+        key = "%s.%s" % (model.__module__, model.__name__)
+
+        with cls.profile_lock:
+            entry = cls.profile.get(key)
+            if entry is None:
+                cls.profile[key] = Storage(module = model.__module__,
+                                           model = model.__name__,
+                                           prefix = prefix,
+                                           loads = 1,
+                                           first = exclusive,
+                                           total = exclusive,
+                                           inclusive = duration,
+                                           )
+            else:
+                entry.loads += 1
+                entry.total += exclusive
+                entry.inclusive += duration
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def profile_report(cls):
+        """
+            Report of the model load cost per module (and per model),
+            from the model load profile (settings.base.model_profile)
+
+            Returns:
+                the report as str, with run times in milliseconds
+                    - first: the first load (i.e. process startup/first
+                             request)
+                    - total: all loads since process start
+                    excluding the run time of nested model loads
+        """
+
+        with cls.profile_lock:
+            entries = list(cls.profile.values())
+
+        # Group by module
+        modules = {}
+        for entry in entries:
+            module = modules.get(entry.module)
+            if module is None:
+                module = modules[entry.module] = Storage(loads = 0,
+                                                         first = 0.0,
+                                                         total = 0.0,
+                                                         models = [],
+                                                         )
+            module.loads += entry.loads
+            module.first += entry.first
+            module.total += entry.total
+            module.models.append(entry)
+
+        row = "%-60s %7s %10s %10s"
+        lines = [row % ("Module / Model", "Loads", "First", "Total")]
+        for name, module in sorted(modules.items(), key=lambda item: -item[1].first):
+            lines.append(row % (name,
+                                module.loads,
+                                "%.1f" % (module.first * 1000),
+                                "%.1f" % (module.total * 1000),
+                                ))
+            for entry in sorted(module.models, key=lambda entry: -entry.first):
+                lines.append(row % ("    %s" % entry.model,
+                                    entry.loads,
+                                    "%.1f" % (entry.first * 1000),
+                                    "%.1f" % (entry.total * 1000),
+                                    ))
+
+        first = sum(module.first for module in modules.values())
+        total = sum(module.total for module in modules.values())
+        lines.append(row % ("Total", "", "%.1f" % (first * 1000), "%.1f" % (total * 1000)))
+
+        for packages, index in cls.model_indexes.items():
+            lines.append("Name index %s: %s names, built in %.1f ms" % \
+                         (", ".join(packages), len(index.names), index.duration * 1000))
+
+        return "\n".join(lines)
+
     # -------------------------------------------------------------------------
     @staticmethod
     def define_table(tablename, *fields, meta=True, **args):
@@ -469,6 +691,10 @@ class DataModel:
             if meta:
                 fields = fields + MetaFields.all_meta_fields()
             table = db.define_table(tablename, *fields, **args)
+            if tablename in RepresentCache.tables:
+                RepresentCache.attach(table)
+            if tablename in TableVersion.tables:
+                TableVersion.attach(table)
         return table
 
     # -------------------------------------------------------------------------
@@ -531,6 +757,8 @@ class DataModel:
         if tn not in config:
             config[tn] = {}
         config[tn].update(attr)
+
+        cls.clear_fieldpaths()
         return
 
     # -------------------------------------------------------------------------
@@ -574,6 +802,21 @@ class DataModel:
                 for k in keys:
                     table_config.pop(k, None)
 
+        cls.clear_fieldpaths()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def clear_fieldpaths():
+        """
+            Clear the cache of resolved field paths (S3FieldPath), to be
+            called whenever the table configuration or the components
+            change
+        """
+
+        cache = current.model.get("fieldpaths")
+        if cache:
+            cache.clear()
+
     # -------------------------------------------------------------------------
     @classmethod
     def add_custom_callback(cls, tablename, hook, cb, method=None):
@@ -752,6 +995,8 @@ class DataModel:
         components = current.model["components"]
         load_all_models = current.response.s3.load_all_models
 
+        cls.clear_fieldpaths()
+
         master = master._tablename if type(master) is Table else master
 
         hooks = components.get(master)
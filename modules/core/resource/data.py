@@ -25,6 +25,9 @@
     OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import base64
+import datetime
+import hashlib
 import json
 
 from itertools import chain
@@ -60,7 +63,8 @@ class ResourceData:
                  as_rows = False,
                  represent = False,
                  show_links = True,
-                 raw_data = False
+                 raw_data = False,
+                 seek = None,
                  ):
         """
             Constructor, extracts (and represents) data from a resource
@@ -80,6 +84,9 @@ class ResourceData:
                 as_rows: return the rows (don't extract/represent)
                 represent: render field value representations
                 raw_data: include raw data in the result
+                seek: a Query restricting the extraction to the records
+                      following the last seen record (keyset pagination),
+                      implies scalability-optimized strategies
 
             Notes:
                 - as_rows / groupby prevent automatic splitting of
@@ -132,6 +139,8 @@ class ResourceData:
 
         # The query
         master_query = query = resource.get_query()
+        if seek is not None:
+            master_query = query & seek
 
         # Joins from filters
         # NB in components, rfilter is None until after get_query!
@@ -209,7 +218,8 @@ class ResourceData:
                 count_only = False
 
         # Shall we use scalability-optimized strategies?
-        bigtable = current.deployment_settings.get_base_bigtable()
+        bigtable = seek is not None or \
+                   current.deployment_settings.get_base_bigtable()
 
         # Filter Query:
         # If we need to determine the number and/or ids of all matching
@@ -228,6 +238,8 @@ class ResourceData:
                                                getids = not count_only,
                                                orderby = orderby_aggr,
                                                limitby = limitby,
+                                               seek = seek,
+                                               count = count,
                                                )
 
         # Simplify the master query if possible
@@ -281,7 +293,11 @@ class ResourceData:
                     # so we can not limit the master query
                     limitby = None
 
-        elif pagination and not (efilter or vfilter or count or getids):
+        elif pagination and \
+             not (efilter or vfilter or getids or \
+                  count and (seek is None or totalrows is None)):
+            # Limited master query (with seek, the total number of records
+            # is already known from the filter query)
 
             limitby = resource.limitby(start=start, limit=limit)
 
@@ -542,6 +558,9 @@ class ResourceData:
 
             self.rows = [results[record_id] for record_id in page]
 
+        # The record IDs in the result
+        self.page = page
+
         if rname:
             # Restore referee name
             db._referee_name = rname
@@ -729,6 +748,8 @@ class ResourceData:
                      getids = False,
                      limitby = None,
                      orderby = None,
+                     seek = None,
+                     count = True,
                      ):
         """
             Execute a query to determine the number/record IDs of all
@@ -742,6 +763,10 @@ class ResourceData:
                 limitby: tuple of indices (start, end) to extract only
                          a limited set of IDs
                 orderby: ORDERBY expression for the query
+                seek: seek predicate (keyset pagination) to extract only
+                      IDs of records following the last seen record
+                count: count all matching records also when seeking,
+                       otherwise the total number is None
 
             Returns:
                 tuple of (TotalNumberOfRecords, RecordIDs)
@@ -755,6 +780,22 @@ class ResourceData:
         vf = table.virtualfields
         osetattr(table, "virtualfields", [])
 
+        def count_all():
+            # Count all matching records (regardless of seek)
+            cnt = table._id.count(distinct=True)
+            row = db(query).select(cnt,
+                                   join = join,
+                                   left = left,
+                                   cacheable = True,
+                                   ).first()
+            return row[cnt]
+
+        # Query to extract IDs
+        if seek is not None:
+            idquery = query & seek
+        else:
+            idquery = query
+
         if getids and limitby:
             # Large result sets expected on average (settings.base.bigtable)
             # => effort almost independent of result size, much faster
@@ -771,28 +812,25 @@ class ResourceData:
 
             # Extract record IDs
             field = table._id
-            rows = db(query).select(field,
-                                    join = join,
-                                    left = left,
-                                    limitby = limitby_,
-                                    orderby = orderby,
-                                    groupby = field,
-                                    cacheable = True,
-                                    )
+            rows = db(idquery).select(field,
+                                      join = join,
+                                      left = left,
+                                      limitby = limitby_,
+                                      orderby = orderby,
+                                      groupby = field,
+                                      cacheable = True,
+                                      )
             pkey = str(field)
             results = rows[:limit] if limit else rows
             ids = [row[pkey] for row in results]
 
             totalids = len(rows)
-            if limit and totalids >= maxids or start != 0 and not totalids:
+            if seek is not None:
+                # Can't know how many records precede the seek position
+                totalrows = count_all() if count else None
+            elif limit and totalids >= maxids or start != 0 and not totalids:
                 # Count all matching records
-                cnt = table._id.count(distinct=True)
-                row = db(query).select(cnt,
-                                       join = join,
-                                       left = left,
-                                       cacheable = True,
-                                       ).first()
-                totalrows = row[cnt]
+                totalrows = count_all()
             else:
                 # We already know how many there are
                 totalrows = start + totalids
@@ -802,27 +840,24 @@ class ResourceData:
             # => effort proportional to result size, slightly faster
             #    than counting separately for small filter results
             field = table._id
-            rows = db(query).select(field,
-                                    join=join,
-                                    left=left,
-                                    orderby = orderby,
-                                    groupby = field,
-                                    cacheable = True,
-                                    )
+            rows = db(idquery).select(field,
+                                      join=join,
+                                      left=left,
+                                      orderby = orderby,
+                                      groupby = field,
+                                      cacheable = True,
+                                      )
             pkey = str(field)
             ids = [row[pkey] for row in rows]
-            totalrows = len(ids)
+            if seek is not None:
+                totalrows = count_all() if count else None
+            else:
+                totalrows = len(ids)
 
         else:
             # Only count, do not extract any IDs (constant effort)
-            field = table._id.count(distinct=True)
-            rows = db(query).select(field,
-                                    join = join,
-                                    left = left,
-                                    cacheable = True,
-                                    )
             ids = None
-            totalrows = rows.first()[field]
+            totalrows = count_all()
 
         # Restore the virtual fields
         osetattr(table, "virtualfields", vf)
@@ -1417,4 +1452,291 @@ class ResourceData:
             items = expr
         return items
 
+# =============================================================================
+class KeysetCursor:
+    """
+        Keyset ("seek") pagination helper: rather than skipping all
+        preceding rows (OFFSET), the next page is selected with a
+        predicate relative to the sort key of the last row delivered,
+        which keeps the effort per page independent of its position
+        in the result set
+
+        The cursor token passed to the client encodes the position
+        (start index) it is valid for, a signature of ordering and
+        filter, and the sort key values of the last row delivered.
+    """
+
+    # Field types that can be used in seek predicates
+    SEEKABLE = ("id",
+                "integer",
+                "bigint",
+                "double",
+                "string",
+                "text",
+                "date",
+                "datetime",
+                "time",
+                "boolean",
+                )
+
+    def __init__(self, resource, orderby=None):
+        """
+            Args:
+                resource: the CRUDResource
+                orderby: the orderby expression (string, Field or list)
+        """
+
+        self.resource = resource
+        self.table = resource.table
+
+        self.keys = self.resolve(orderby)
+
+    # -------------------------------------------------------------------------
+    @property
+    def seekable(self):
+        """
+            Whether the resource can be paginated with this cursor
+        """
+
+        return self.keys is not None
+
+    # -------------------------------------------------------------------------
+    @property
+    def orderby(self):
+        """
+            The orderby expression for keyset pagination (original order
+            plus primary key as tie-breaker), or None if not seekable
+        """
+
+        keys = self.keys
+        if keys is None:
+            return None
+
+        return [~field if desc else field for field, desc in keys]
+
+    # -------------------------------------------------------------------------
+    def resolve(self, orderby):
+        """
+            Resolve the orderby expression into a list of sort keys
+
+            Args:
+                orderby: the orderby expression
+
+            Returns:
+                list of tuples (Field, descending), or None if the
+                expression is not suitable for keyset pagination
+        """
+
+        resource = self.resource
+        table = self.table
+        tablename = table._tablename
+
+        # Post-filters (virtual or extra filters) break the correlation
+        # between sort key and position
+        rfilter = resource.rfilter
+        if rfilter is not None and \
+           (resource.get_filter() is not None or rfilter.get_extra_filters()):
+            return None
+
+        db = current.db
+        adapter = S3DAL()
+
+        keys = []
+        pkey = table._id
+        has_id = False
+
+        items = ResourceData.resolve_expression(orderby) if orderby else []
+        for item in items:
+
+            if type(item) is Expression:
+                if item.op != adapter.INVERT or \
+                   not isinstance(item.first, Field):
+                    return None
+                field, desc = item.first, True
+            elif isinstance(item, Field):
+                field, desc = item, False
+            elif isinstance(item, str):
+                fn, direction = (item.strip().split() + ["asc"])[:2]
+                tn, fn = ([tablename] + fn.split(".", 1))[-2:]
+                if tn != tablename:
+                    return None
+                try:
+                    field = db[tn][fn]
+                except (AttributeError, KeyError):
+                    return None
+                desc = direction.strip().lower()[:3] == "des"
+            else:
+                return None
+
+            # Only fields in the master table
+            if getattr(field, "tablename", None) != tablename:
+                return None
+
+            ftype = str(field.type)
+            if ftype[:9] == "reference":
+                ftype = "integer"
+            if ftype not in self.SEEKABLE:
+                return None
+
+            keys.append((field, desc))
+            if field.name == pkey.name:
+                has_id = True
+                break
+
+        # Primary key as tie-breaker to make the order unique
+        if not has_id:
+            keys.append((pkey, False))
+
+        return keys
+
+    # -------------------------------------------------------------------------
+    def signature(self):
+        """
+            Generate a signature for ordering and filter, so that a token
+            from a different query is never applied
+
+            Returns:
+                a hash string
+        """
+
+        spec = ["%s %s" % (field, "desc" if desc else "asc")
+                for field, desc in self.keys]
+        spec.append(str(self.resource.get_query()))
+
+        return hashlib.sha1(s3_str("|".join(spec)).encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    def encode(self, record_id, start):
+        """
+            Generate a cursor token for the position after a record
+
+            Args:
+                record_id: the ID of the last record delivered
+                start: the index of the next record
+
+            Returns:
+                the token (string), or None if not seekable
+        """
+
+        keys = self.keys
+        if keys is None or record_id is None:
+            return None
+
+        table = self.table
+        row = current.db(table._id == record_id).select(
+                                *[field for field, _ in keys],
+                                limitby = (0, 1),
+                                ).first()
+        if not row:
+            return None
+
+        values = []
+        for field, _ in keys:
+            value = row[field.name]
+            if isinstance(value, (datetime.date, datetime.time)):
+                value = value.isoformat()
+            values.append(value)
+
+        token = json.dumps([start, self.signature(), values],
+                           separators = (",", ":"),
+                           )
+        return base64.urlsafe_b64encode(token.encode("utf-8")).decode("ascii")
+
+    # -------------------------------------------------------------------------
+    def decode(self, token, start):
+        """
+            Decode a cursor token
+
+            Args:
+                token: the token
+                start: the index of the requested start record
+
+            Returns:
+                list of sort key values, or None if the token is
+                invalid or not applicable for start/ordering/filter
+        """
+
+        keys = self.keys
+        if keys is None or not token:
+            return None
+
+        try:
+            data = base64.urlsafe_b64decode(s3_str(token).encode("ascii"))
+            position, signature, values = json.loads(data.decode("utf-8"))
+        except (TypeError, ValueError):
+            return None
+
+        if position != start or \
+           signature != self.signature() or \
+           not isinstance(values, list) or len(values) != len(keys):
+            return None
+
+        parsed = []
+        for (field, _), value in zip(keys, values):
+            if value is not None:
+                ftype = str(field.type)
+                try:
+                    if ftype == "datetime":
+                        value = datetime.datetime.fromisoformat(value)
+                    elif ftype == "date":
+                        value = datetime.date.fromisoformat(value)
+                    elif ftype == "time":
+                        value = datetime.time.fromisoformat(value)
+                except (TypeError, ValueError):
+                    return None
+            parsed.append(value)
+
+        return parsed
+
+    # -------------------------------------------------------------------------
+    def seek(self, token, start):
+        """
+            Generate the seek predicate for a cursor token
+
+            Args:
+                token: the token
+                start: the index of the requested start record
+
+            Returns:
+                a Query selecting all records after the cursor position,
+                or None if the token is not applicable
+        """
+
+        values = self.decode(token, start)
+        if values is None:
+            return None
+
+        # PostgreSQL sorts NULL as larger than any value, SQLite/MySQL
+        # as smaller => whether NULLs come after all values depends on
+        # both the backend and the sort direction
+        nulls_large = current.db._adapter.dbengine == "postgres"
+
+        query = None
+        equal = None
+        for (field, desc), value in zip(self.keys, values):
+
+            nulls_after = nulls_large != desc
+
+            # Records after this value in sort direction
+            if value is None:
+                after = None if nulls_after else (field != None)
+            else:
+                after = (field < value) if desc else (field > value)
+                if nulls_after:
+                    after |= (field == None)
+
+            if after is not None:
+                subquery = after if equal is None else equal & after
+                query = subquery if query is None else query | subquery
+
+            # Records with the same value for this key
+            same = field == value
+            equal = same if equal is None else equal & same
+
+        if query is None:
+            # Last possible position => nothing follows
+            query = self.table._id < 0
+
+        return query
+
 # END =========================================================================
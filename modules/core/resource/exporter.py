@@ -27,6 +27,8 @@
 
 __all__ = ("DataExporter",)
 
+from io import StringIO
+
 from gluon import current
 
 # =============================================================================
@@ -36,13 +38,17 @@ class DataExporter:
     """
 
     # -------------------------------------------------------------------------
-    @staticmethod
-    def csv(resource):
+    @classmethod
+    def csv(cls, resource, chunk_size=None):
         """
             Export resource as CSV
 
             Args:
                 resource: the resource to export
+                chunk_size: extract the data in chunks of this size,
+                            and stream the output to the client (the
+                            records are then exported in primary key
+                            order)
 
             Note:
                 Export does not include components!
@@ -60,18 +66,44 @@ class DataExporter:
             response.headers["Content-Type"] = contenttype(".csv")
             response.headers["Content-disposition"] = "attachment; filename=%s" % filename
 
+        if chunk_size and response:
+            return cls.spool(cls.csv_chunks(resource, chunk_size))
+
         rows = resource.select(None, as_rows=True)
         return str(rows)
 
     # -------------------------------------------------------------------------
-    @staticmethod
-    def json(resource,
+    @classmethod
+    def csv_chunks(cls, resource, chunk_size):
+        """
+            Generator producing the CSV export of a resource chunk by chunk
+
+            Args:
+                resource: the resource to export
+                chunk_size: the number of records per chunk
+
+            Yields:
+                the CSV output for each chunk (str)
+        """
+
+        write_colnames = True
+        for data in cls.chunks(resource, None, chunk_size, as_rows=True):
+            output = StringIO()
+            data.rows.export_to_csv_file(output, write_colnames=write_colnames)
+            write_colnames = False
+            yield output.getvalue()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def json(cls,
+             resource,
              start=None,
              limit=None,
              fields=None,
              orderby=None,
              represent=False,
-             tooltip=None):
+             tooltip=None,
+             chunk_size=None):
         """
             Export a resource as JSON
 
@@ -91,6 +123,10 @@ class DataExporter:
                          to return a dict {k:tooltip} => used by
                          filterOptionsS3 to extract onhover-tooltips for
                          Ajax-update of options
+                chunk_size: extract the data in chunks of this size, and
+                            stream the output to the client (only for
+                            unlimited exports, the records are then
+                            exported in primary key order)
         """
 
         if fields is None:
@@ -124,92 +160,223 @@ class DataExporter:
                 if tooltip not in fields:
                     fields.append(tooltip)
 
-        # Get the data
-        _rows = resource.select(fields,
-                                start=start,
-                                limit=limit,
-                                orderby=orderby,
-                                represent=represent).rows
-
-        # Simplify to plain fieldnames for fields in this table
-        tn = "%s." % resource.tablename
-        rows = []
-        rappend = rows.append
-        for _row in _rows:
-            row = {}
-            for f in _row:
-                v = _row[f]
-                if tn in f:
-                    f = f.split(tn, 1)[1]
-                row[f] = v
-            rappend(row)
+        def prepare(_rows):
+            """
+                Simplify the rows and add tooltips
+            """
+
+            # Simplify to plain fieldnames for fields in this table
+            tn = "%s." % resource.tablename
+            rows = []
+            rappend = rows.append
+            for _row in _rows:
+                row = {}
+                for f in _row:
+                    v = _row[f]
+                    if tn in f:
+                        f = f.split(tn, 1)[1]
+                    row[f] = v
+                rappend(row)
+
+            if tooltip:
+                if tooltip_function:
+                    # Resolve key and value names against the resource
+                    try:
+                        krfield = resource.resolve_selector(kname)
+                        vrfield = resource.resolve_selector(vname)
+                    except (AttributeError, SyntaxError):
+                        import sys
+                        current.log.error(sys.exc_info()[1])
+                    else:
+                        # Extract key and value fields from each row and
+                        # build options dict for function call
+                        options = []
+                        items = {}
+                        for row in rows:
+                            try:
+                                k = krfield.extract(row)
+                            except KeyError:
+                                break
+                            try:
+                                v = vrfield.extract(row)
+                            except KeyError:
+                                break
+                            items[k] = row
+                            options.append((k, v))
+                        # Call tooltip rendering function
+                        try:
+                            tooltips = tooltip_function(options)
+                        except:
+                            import sys
+                            current.log.error(sys.exc_info()[1])
+                        else:
+                            # Add tooltips as "_tooltip" to the corresponding rows
+                            if isinstance(tooltips, dict):
+                                from ..tools import s3_str
+                                for k, v in tooltips.items():
+                                    if k in items:
+                                        items[k]["_tooltip"] = s3_str(v)
 
-        if tooltip:
-            if tooltip_function:
-                # Resolve key and value names against the resource
-                try:
-                    krfield = resource.resolve_selector(kname)
-                    vrfield = resource.resolve_selector(vname)
-                except (AttributeError, SyntaxError):
-                    import sys
-                    current.log.error(sys.exc_info()[1])
                 else:
-                    # Extract key and value fields from each row and
-                    # build options dict for function call
-                    options = []
-                    items = {}
-                    for row in rows:
-                        try:
-                            k = krfield.extract(row)
-                        except KeyError:
-                            break
-                        try:
-                            v = vrfield.extract(row)
-                        except KeyError:
-                            break
-                        items[k] = row
-                        options.append((k, v))
-                    # Call tooltip rendering function
+                    # Resolve the tooltip field name against the resource
                     try:
-                        tooltips = tooltip_function(options)
-                    except:
+                        tooltip_rfield = resource.resolve_selector(tooltip)
+                    except (AttributeError, SyntaxError):
                         import sys
                         current.log.error(sys.exc_info()[1])
                     else:
-                        # Add tooltips as "_tooltip" to the corresponding rows
-                        if isinstance(tooltips, dict):
-                            from ..tools import s3_str
-                            for k, v in tooltips.items():
-                                if k in items:
-                                    items[k]["_tooltip"] = s3_str(v)
+                        # Extract the tooltip field from each row
+                        # and add it as _tooltip
+                        from ..tools import s3_str
+                        for row in rows:
+                            try:
+                                value = tooltip_rfield.extract(row)
+                            except KeyError:
+                                break
+                            if value:
+                                row["_tooltip"] = s3_str(value)
+
+            return rows
 
-            else:
-                # Resolve the tooltip field name against the resource
-                try:
-                    tooltip_rfield = resource.resolve_selector(tooltip)
-                except (AttributeError, SyntaxError):
-                    import sys
-                    current.log.error(sys.exc_info()[1])
-                else:
-                    # Extract the tooltip field from each row
-                    # and add it as _tooltip
-                    from ..tools import s3_str
-                    for row in rows:
-                        try:
-                            value = tooltip_rfield.extract(row)
-                        except KeyError:
-                            break
-                        if value:
-                            row["_tooltip"] = s3_str(value)
+        response = current.response
+
+        from gluon.serializers import json as jsons
+
+        if chunk_size and response and start is None and limit is None:
+            # Stream the output chunk by chunk
+            response.headers["Content-Type"] = "application/json"
+            chunks = cls.chunks(resource,
+                                fields,
+                                chunk_size,
+                                represent = represent,
+                                )
+            def output():
+                yield "["
+                sep = ""
+                for data in chunks:
+                    rows = prepare(data.rows)
+                    if rows:
+                        yield sep + jsons(rows)[1:-1]
+                        sep = ","
+                yield "]"
+            return cls.spool(output())
+
+        # Get the data
+        rows = prepare(resource.select(fields,
+                                       start=start,
+                                       limit=limit,
+                                       orderby=orderby,
+                                       represent=represent).rows)
 
         # Return as JSON
-        response = current.response
         if response:
             response.headers["Content-Type"] = "application/json"
 
-        from gluon.serializers import json as jsons
         return jsons(rows)
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def chunks(resource,
+               fields,
+               chunk_size,
+               left = None,
+               as_rows = False,
+               represent = False,
+               show_links = True,
+               raw_data = False,
+               ):
+        """
+            Generator extracting the data from a resource in chunks of
+            limited size, using keyset pagination by primary key, so that
+            memory use is independent of the total number of records
+
+            Args:
+                resource: the resource
+                fields: the fields to extract (selector strings)
+                chunk_size: the maximum number of records per chunk
+                left: additional left joins required for filters
+                as_rows: extract bare Rows (don't extract/represent)
+                represent: render field value representations
+                show_links: render representations as links
+                raw_data: include raw data in the result
+
+            Yields:
+                a ResourceData instance for each chunk
+
+            Note:
+                The records will be extracted in primary key order
+        """
+
+        from ..tools import S3Represent
+        from .data import ResourceData
+
+        pkey = resource.table._id
+
+        renderers = None
+        last = 0
+        while True:
+            data = ResourceData(resource,
+                                fields,
+                                limit = chunk_size,
+                                left = left,
+                                orderby = pkey,
+                                as_rows = as_rows,
+                                represent = represent,
+                                show_links = show_links,
+                                raw_data = raw_data,
+                                seek = pkey > last,
+                                )
+            page = data.page
+            if not page:
+                break
+
+            yield data
+
+            if len(page) < chunk_size:
+                break
+            last = max(page)
+
+            # Release the lookups for the previous chunk
+            if represent:
+                if renderers is None:
+                    renderers = [rfield.field.represent for rfield in data.rfields
+                                 if rfield.field and
+                                    isinstance(rfield.field.represent, S3Represent)
+                                 ]
+                for renderer in renderers:
+                    renderer.clear()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def spool(chunks):
+        """
+            Writes output chunks into a temporary file, and streams that
+            file to the client
+
+            Args:
+                chunks: iterable of output chunks (str or bytes)
+
+            Returns:
+                the streamer for the response body
+
+            Note:
+                Response headers (e.g. Content-Type) must be set before
+                calling this method
+        """
+
+        from tempfile import NamedTemporaryFile
+
+        # NB file will be deleted when the streamer closes it
+        tmp = NamedTemporaryFile()
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            tmp.write(chunk)
+        tmp.flush()
+        tmp.seek(0)
+
+        return current.response.stream(tmp, request=current.request)
+
     # -------------------------------------------------------------------------
     @staticmethod
     def pdf(*args, **kwargs):
@@ -84,6 +84,9 @@ class XMLImporter:
         xml = current.xml
         tree = None
 
+        settings = current.deployment_settings
+        chunk_size = settings.get_base_import_chunk_size()
+
         if not isinstance(source, (list, tuple)):
             source = [source]
 
@@ -124,7 +127,15 @@ class XMLImporter:
                             name = name,
                             utcnow = s3_format_datetime(),
                             )
-                t = xml.transform(t, stylesheet, **args)
+                if chunk_size and isinstance(stylesheet, str) and \
+                   source_type in ("csv", "xls", "xlsx"):
+                    t = cls.transform_chunks(t,
+                                             stylesheet,
+                                             chunk_size,
+                                             workers = settings.get_base_import_workers(),
+                                             **args)
+                else:
+                    t = xml.transform(t, stylesheet, **args)
                 if not t:
                     raise SyntaxError(xml.error)
 
@@ -135,6 +146,73 @@ class XMLImporter:
 
         return tree
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def transform_chunks(tree, stylesheet, chunk_size, workers=1, **args):
+        """
+            Transform a table-form source tree in chunks of rows, and
+            merge the results into a single S3XML tree
+
+            Args:
+                tree: the source tree (table-form, gets consumed)
+                stylesheet: the pathname of the transformation stylesheet
+                chunk_size: the number of rows per chunk
+                workers: the number of worker processes
+                args: parameters to pass to the transformation stylesheet
+
+            Returns:
+                the S3XML element tree, or None on error (xml.error)
+
+            Note:
+                Resources with the same tuid or uuid are emitted once per
+                chunk by the stylesheet (e.g. referenced organisations),
+                only the first of them is retained in the merged tree, so
+                that references between chunks resolve to one element
+        """
+
+        xml = current.xml
+
+        ATTRIBUTE = xml.ATTRIBUTE
+        NAME = ATTRIBUTE.name
+        TUID = ATTRIBUTE.tuid
+        UID = xml.UID
+        RESOURCE = xml.TAG.resource
+
+        root = None
+        seen = set()
+
+        def keys(element):
+            name = element.get(NAME)
+            for attr in (TUID, UID):
+                value = element.get(attr)
+                if value:
+                    yield (name, attr, value)
+
+        for result in xml.transform_chunks(tree, stylesheet, chunk_size,
+                                           workers = workers,
+                                           **args):
+            chunk = result.getroot()
+            if root is None:
+                root = chunk
+                for element in root.iterchildren(RESOURCE):
+                    seen.update(keys(element))
+                continue
+            for element in list(chunk):
+                if element.tag == RESOURCE:
+                    ekeys = set(keys(element))
+                    if ekeys & seen:
+                        continue
+                    seen |= ekeys
+                root.append(element)
+
+        if xml.error:
+            return None
+        if root is None:
+            # No rows
+            root = etree.Element(xml.TAG.root)
+
+        return etree.ElementTree(root)
+
     # -------------------------------------------------------------------------
     @classmethod
     def import_tree(cls,
@@ -149,6 +227,7 @@ class XMLImporter:
                     select_items = None,
                     strategy = None,
                     sync_policy = None,
+                    bulk = False,
                     ):
         """
             Import data from an S3XML element tree.
@@ -169,6 +248,10 @@ class XMLImporter:
                                    (list of import item record IDs)
                 strategy: list of allowed import methods
                 sync_policy: the synchronization policy (SyncPolicy)
+                bulk: bulk mode, commit new records of the target table
+                      in chunks, faster for large imports - but commits
+                      the transaction after each chunk, so only effective
+                      if commit is True
         """
 
         db = current.db
@@ -203,6 +286,7 @@ class XMLImporter:
                                    files = files,
                                    strategy = strategy,
                                    sync_policy = sync_policy,
+                                   bulk = bulk,
                                    )
 
             # Add import items for matching elements
@@ -230,6 +314,7 @@ class XMLImporter:
                                        job_id = job_id,
                                        strategy = strategy,
                                        sync_policy = sync_policy,
+                                       bulk = bulk,
                                        )
             except SyntaxError:
                 return ImportResult(False, current.ERROR.BAD_SOURCE)
@@ -433,6 +518,9 @@ class ImportJob():
         Class to import an element tree into the database
     """
 
+    # Number of items per chunk in bulk mode
+    BULK_SIZE = 500
+
     def __init__(self,
                  table,
                  tree = None,
@@ -440,6 +528,7 @@ class ImportJob():
                  job_id = None,
                  strategy = None,
                  sync_policy = None,
+                 bulk = False,
                  ):
         """
             Args:
@@ -448,6 +537,8 @@ class ImportJob():
                 job_id: restore job from database (record ID or job_id)
                 strategy: the import strategy
                 sync_policy: the synchronization policy
+                bulk: commit new records of the target table in chunks
+                      (see commit_bulk)
         """
 
         self.error = None # the last error
@@ -475,6 +566,8 @@ class ImportJob():
 
         self.log = None
 
+        self.bulk = bulk
+
         # Import strategy
         if strategy is None:
             METHOD = ImportItem.METHOD
@@ -1087,10 +1180,44 @@ class ImportJob():
         tablename = self.table._tablename
 
         self.log = log_items
-        failed = False
-        for item_id in import_list:
+
+        # Bulk mode commits per chunk, so not for trial imports
+        bulk = self.bulk and not current.auth.rollback
+        progress = current.response.s3.import_progress
+        total = len(import_list)
+
+        results = []
+        rappend = results.append
+
+        pending = []
+        pending_ids = set()
+        def flush(done):
+            results.extend(self.commit_bulk(pending, ignore_errors=ignore_errors))
+            del pending[:]
+            pending_ids.clear()
+            if callable(progress):
+                progress(tablename, done, total)
+
+        for index, item_id in enumerate(import_list):
             item = items[item_id]
-            error = None
+
+            if bulk:
+                if item.tablename == tablename and \
+                   item.accepted is not False and \
+                   item.parent is None and not item.components:
+                    # Chunk must not contain items it references
+                    for reference in item.references:
+                        entry = reference.entry
+                        if entry and entry.item_id in pending_ids:
+                            flush(index)
+                            break
+                    pending.append(item)
+                    pending_ids.add(item_id)
+                    if len(pending) >= self.BULK_SIZE:
+                        flush(index + 1)
+                    continue
+                elif pending:
+                    flush(index)
 
             if item.accepted is not False:
                 logged = False
@@ -1099,6 +1226,13 @@ class ImportJob():
                 # Field validation failed
                 logged = True
                 success = ignore_errors
+            rappend((item, success, logged))
+
+        if pending:
+            flush(total)
+
+        failed = False
+        for item, success, logged in results:
 
             if not success:
                 failed = True
@@ -1139,6 +1273,110 @@ class ImportJob():
         self.deleted = deleted
         return True
 
+    # -------------------------------------------------------------------------
+    def commit_bulk(self, items, ignore_errors=False):
+        """
+            Commit a chunk of import items of the same table (bulk mode):
+                - looks up duplicates for all items at once (S3Duplicate)
+                - inserts all new records at once
+                - sets record owners (with one query to load the records)
+                - runs the post-processing (super-entity links, onaccept)
+                  for the chunk only after all records have been inserted
+            Items that can not be bulk-inserted (e.g. updates, invalid or
+            unauthorized items) are committed individually.
+
+            Args:
+                items: the import items (ImportItem)
+                ignore_errors: skip any items with errors
+
+            Returns:
+                list of tuples (item, success, logged), in item order
+
+            Note:
+                The database transaction is committed before and after
+                the chunk, so that a failure only rolls back the current
+                chunk, not all previous ones
+
+            Note:
+                On SQL adapters, pydal's bulk_insert still issues one
+                INSERT per row, i.e. the savings are in the per-item
+                processing (duplicate lookup, owners, post-processing)
+                rather than in the inserts themselves
+        """
+
+        db = current.db
+
+        table = items[0].table
+        tablename = table._tablename
+
+        db.commit()
+
+        # Resolve references
+        for item in items:
+            item.mtime = s3_utc(item.mtime)
+            item._resolve_references()
+
+        # Look up duplicates
+        resolve = current.s3db.get_config(tablename, "deduplicate")
+        if isinstance(resolve, S3Duplicate):
+            UID = current.xml.UID
+            synchronise_uuids = current.response.s3.synchronise_uuids
+            resolve.bulk([item for item in items
+                          if not item.id and item.data and \
+                             not item.data.deleted and \
+                             (synchronise_uuids or not item.data.get(UID))
+                          ])
+
+        # Validate and authorize, prepare the data
+        insert, rows, single = [], [], []
+        for item in items:
+            data = item.bulk_data()
+            if data is None:
+                single.append(item)
+            else:
+                insert.append(item)
+                rows.append(data)
+
+        if insert:
+            try:
+                record_ids = table.bulk_insert(rows)
+            except Exception:
+                current.log.error("Bulk import %s failed: %s" % (tablename, sys.exc_info()[1]))
+                record_ids = None
+            else:
+                if not record_ids or len(record_ids) != len(rows):
+                    # Vetoed by a _before_insert callback (returns 0)
+                    current.log.error("Bulk import %s failed: records not inserted" % tablename)
+                    record_ids = None
+
+            if record_ids is None:
+                # Commit all items of the chunk individually instead
+                db.rollback()
+                insert, single = [], items
+            else:
+                log = self.log
+                for item, record_id in zip(insert, record_ids):
+                    if callable(log):
+                        log(item)
+                    item.id = record_id
+                    item.committed = True
+
+                # Load the new records (to set the record owners)
+                records = db(table._id.belongs(record_ids)).select(table.ALL)
+                records = {record[table._id.name]: record for record in records}
+
+                for item in insert:
+                    item._postprocess(record = records.get(item.id))
+                    item._update_referencing()
+
+        success = {}
+        for item in single:
+            success[item.item_id] = item.commit(ignore_errors=ignore_errors)
+
+        db.commit()
+
+        return [(item, success.get(item.item_id, True), False) for item in items]
+
     # -------------------------------------------------------------------------
     def store(self):
         """
@@ -1314,6 +1552,13 @@ class ImportItem:
         self.parent = None
         self.skip = False
 
+        # Duplicate pre-fetched by bulk deduplication
+        # (None = not looked up, False = no duplicate)
+        self.duplicate = None
+        # Commit individually after the bulk insert (bulk mode), e.g.
+        # because it may duplicate another item of the same chunk
+        self.deferred = False
+
         # Conflict handling
         self.mci = 2
         self.mtime = datetime.datetime.utcnow()
@@ -1767,10 +2012,8 @@ class ImportItem:
 
         # Policies
         THIS = SyncPolicy.THIS
-        OTHER = SyncPolicy.OTHER
         NEWER = SyncPolicy.NEWER
         MASTER = SyncPolicy.MASTER
-        POLICY = {THIS, OTHER, NEWER, MASTER}
 
         # Constants
         UID = xml.UID
@@ -1876,20 +2119,7 @@ class ImportItem:
             data = Storage()
 
         # Update policy
-        if isinstance(self.update_policy, dict):
-            def update_policy(f):
-                setting = self.update_policy
-                p = setting.get(f,
-                    setting.get("__default__", THIS))
-                if p not in POLICY:
-                    return THIS
-                return p
-        else:
-            def update_policy(f):
-                p = self.update_policy
-                if p not in POLICY:
-                    return THIS
-                return p
+        update_policy = self._update_policy
 
         # Log this item
         if callable(job.log):
@@ -1990,7 +2220,7 @@ class ImportItem:
             if MCI in data:
                 del data[MCI]
 
-            for f in data:
+            for f in list(data.keys()):
                 if update_policy(f) == MASTER and self.mci != 1:
                     del data[f]
 
@@ -2100,86 +2330,220 @@ class ImportItem:
 
         # Audit + onaccept on successful commits
         if self.committed:
+            self._postprocess(enforce_realm_update = enforce_realm_update)
+
+        # Update referencing items
+        self._update_referencing()
+
+        return True
+
+    # -------------------------------------------------------------------------
+    def bulk_data(self):
+        """
+            Validates and authorizes this item for a bulk insert (bulk
+            mode of ImportJob), and prepares the data to insert; references
+            must have been resolved before
+
+            Returns:
+                the data to insert (dict), or None if this item can not be
+                bulk-inserted and must be committed individually instead
+                (e.g. updates, invalid or unauthorized items)
+        """
+
+        if self.committed or self.skip or self.deferred or \
+           self.components or self.parent is not None:
+            return None
+
+        # Validate (includes deduplication) and authorize
+        if not self.validate() or self.id or self.skip or \
+           self.data.deleted or not self.authorize():
+            return None
+
+        # Check if import method is allowed in strategy
+        method = self.method
+        strategy = self.strategy
+        if not isinstance(strategy, (list, tuple)):
+            strategy = [strategy]
+        if method != self.METHOD.CREATE or method not in strategy:
+            return None
+
+        xml = current.xml
+        UID = xml.UID
+        MCI = xml.MCI
+
+        table = self.table
+        data = table._filter_fields(self.data, id=True)
+
+        # Do not apply field policy to UID and MCI
+        data.pop(UID, None)
+        data.pop(MCI, None)
+
+        update_policy = self._update_policy
+        for f in list(data.keys()):
+            if update_policy(f) == SyncPolicy.MASTER and self.mci != 1:
+                del data[f]
+
+        if not data and not self.references:
+            # Nothing to create
+            return None
+
+        # Restore UID and MCI
+        if self.uid and UID in table.fields:
+            data[UID] = self.uid
+        if MCI in table.fields:
+            data[MCI] = self.mci
+
+        return data
+
+    # -------------------------------------------------------------------------
+    def _postprocess(self, enforce_realm_update=False, record=None):
+        """
+            Post-process a committed item: audit, update super-entity
+            links, set record owner (or update realm), and run onaccept
+
+            Args:
+                enforce_realm_update: update the realm entity of an
+                                      updated record even if the table
+                                      is not configured for it
+                record: the newly created record (Row), if already
+                        loaded, to set the record owner
+        """
+
+        s3db = current.s3db
+
+        METHOD = self.METHOD
+        method = self.method
 
-            # Create a pseudo-form for callbacks
-            form = Storage()
-            form.method = method
-            form.table = table
-            form.vars = self.data
-            prefix, name = tablename.split("_", 1)
-            if self.id:
-                form.vars.id = self.id
-
-            # Audit
-            current.audit(method, prefix, name,
-                          form = form,
-                          record = self.id,
-                          representation = "xml",
-                          )
-
-            # Prevent that record post-processing breaks time-delayed
-            # synchronization by implicitly updating "modified_on"
-            if MTIME in table.fields:
-                modified_on = table[MTIME]
-                modified_on_update = modified_on.update
-                modified_on.update = None
+        table = self.table
+        tablename = self.tablename
+
+        MTIME = current.xml.MTIME
+
+        # Create a pseudo-form for callbacks
+        form = Storage()
+        form.method = method
+        form.table = table
+        form.vars = self.data
+        prefix, name = tablename.split("_", 1)
+        if self.id:
+            form.vars.id = self.id
+
+        # Audit
+        current.audit(method, prefix, name,
+                      form = form,
+                      record = self.id,
+                      representation = "xml",
+                      )
+
+        # Prevent that record post-processing breaks time-delayed
+        # synchronization by implicitly updating "modified_on"
+        if MTIME in table.fields:
+            modified_on = table[MTIME]
+            modified_on_update = modified_on.update
+            modified_on.update = None
+        else:
+            modified_on_update = None
+
+        # Update super entity links
+        super_keys = Storage(id=self.id)
+        s3db.update_super(table, super_keys)
+        super_keys.pop("id")
+        form.vars.update(super_keys)
+        if record is not None:
+            # Pre-loaded record must have the new super-keys for
+            # setting the record owner (e.g. realm by pe_id/site_id)
+            record.update(super_keys)
+
+        if method == METHOD.CREATE:
+            # Set record owner
+            current.auth.s3_set_record_owner(table,
+                                             record if record else self.id,
+                                             )
+        elif method == METHOD.UPDATE:
+            # Update realm
+            update_realm = enforce_realm_update or \
+                           s3db.get_config(table, "update_realm")
+            if update_realm:
+                current.auth.set_realm_entity(table, self.id,
+                                              force_update = True,
+                                              )
+        # Onaccept
+        key = "%s_onaccept" % method
+        onaccept = current.deployment_settings.get_import_callback(tablename, key)
+        if onaccept:
+            callback(onaccept, form, tablename=tablename)
+
+        # Restore modified_on.update
+        if modified_on_update is not None:
+            modified_on.update = modified_on_update
+
+    # -------------------------------------------------------------------------
+    def _update_referencing(self):
+        """
+            Update the foreign keys in other import items (or their
+            already written records) that reference this item, after
+            this item has been committed (writeback hook for circular
+            references)
+        """
+
+        if not self.update or not self.id:
+            return
+
+        db = current.db
+        table = self.table
+
+        for u in self.update:
+
+            # The other import item that shall be updated
+            item = u.get("item")
+            if not item:
+                continue
+
+            # The field in the other item that shall be updated
+            field = u.get("field")
+            if isinstance(field, (list, tuple)):
+                # The field references something else than the
+                # primary key of this table => look it up
+                pkey, fkey = field
+                query = (table.id == self.id)
+                row = db(query).select(table[pkey], limitby=(0, 1)).first()
+                ref_id = row[pkey]
             else:
-                modified_on_update = None
-
-            # Update super entity links
-            s3db.update_super(table, form.vars)
-            if method == CREATE:
-                # Set record owner
-                current.auth.s3_set_record_owner(table, self.id)
-            elif method == UPDATE:
-                # Update realm
-                update_realm = enforce_realm_update or \
-                               s3db.get_config(table, "update_realm")
-                if update_realm:
-                    current.auth.set_realm_entity(table, self.id,
-                                                  force_update = True,
-                                                  )
-            # Onaccept
-            key = "%s_onaccept" % method
-            onaccept = current.deployment_settings.get_import_callback(tablename, key)
-            if onaccept:
-                callback(onaccept, form, tablename=tablename)
-
-            # Restore modified_on.update
-            if modified_on_update is not None:
-                modified_on.update = modified_on_update
+                # The field references the primary key of this table
+                pkey, fkey = None, field
+                ref_id = self.id
 
-        # Update referencing items
-        if self.update and self.id:
-            for u in self.update:
+            if "refkey" in u:
+                # Target field is a JSON object
+                item._update_objref(fkey, u["refkey"], ref_id)
+            else:
+                # Target field is a reference or list:reference
+                item._update_reference(fkey, ref_id)
 
-                # The other import item that shall be updated
-                item = u.get("item")
-                if not item:
-                    continue
+    # -------------------------------------------------------------------------
+    def _update_policy(self, fieldname):
+        """
+            Get the update policy for a field
 
-                # The field in the other item that shall be updated
-                field = u.get("field")
-                if isinstance(field, (list, tuple)):
-                    # The field references something else than the
-                    # primary key of this table => look it up
-                    pkey, fkey = field
-                    query = (table.id == self.id)
-                    row = db(query).select(table[pkey], limitby=(0, 1)).first()
-                    ref_id = row[pkey]
-                else:
-                    # The field references the primary key of this table
-                    pkey, fkey = None, field
-                    ref_id = self.id
+            Args:
+                fieldname: the field name (None for the record as a whole)
 
-                if "refkey" in u:
-                    # Target field is a JSON object
-                    item._update_objref(fkey, u["refkey"], ref_id)
-                else:
-                    # Target field is a reference or list:reference
-                    item._update_reference(fkey, ref_id)
+            Returns:
+                the SyncPolicy (THIS|OTHER|NEWER|MASTER)
+        """
 
-        return True
+        THIS = SyncPolicy.THIS
+
+        setting = self.update_policy
+        if isinstance(setting, dict):
+            policy = setting.get(fieldname, setting.get("__default__", THIS))
+        else:
+            policy = setting
+
+        if policy not in (THIS, SyncPolicy.OTHER, SyncPolicy.NEWER, SyncPolicy.MASTER):
+            policy = THIS
+
+        return policy
 
     # -------------------------------------------------------------------------
     def _dynamic_defaults(self, data):
@@ -2781,6 +3145,42 @@ class S3Duplicate:
         data = item.data
         table = item.table
 
+        duplicate = getattr(item, "duplicate", None)
+        if duplicate is None:
+            # Not pre-fetched => look up now
+            duplicate = self.lookup(table, data)
+        elif duplicate is False:
+            # Pre-fetched, but no match
+            duplicate = None
+
+        if duplicate:
+            # Match found: Update import item
+            item.id = duplicate[table._id]
+            if not data.deleted:
+                item.method = item.METHOD.UPDATE
+            if self.noupdate:
+                item.skip = True
+
+        # For uses outside of imports:
+        return duplicate
+
+    # -------------------------------------------------------------------------
+    def lookup(self, table, data):
+        """
+            Look up the duplicate for a record
+
+            Args:
+                table: the Table
+                data: the record data
+
+            Returns:
+                the duplicate Row if match found, otherwise None
+
+            Raises:
+                SyntaxError: if any of the query fields doesn't exist in
+                             the table
+        """
+
         query = None
         error = "Invalid field for duplicate detection: %s (%s)"
 
@@ -2814,20 +3214,142 @@ class S3Duplicate:
             query &= (table.deleted == False)
 
         # Find a match
-        duplicate = current.db(query).select(table._id,
-                                             limitby = (0, 1)
-                                             ).first()
+        return current.db(query).select(table._id,
+                                        limitby = (0, 1)
+                                        ).first()
 
-        if duplicate:
-            # Match found: Update import item
-            item.id = duplicate[table._id]
-            if not data.deleted:
-                item.method = item.METHOD.UPDATE
-            if self.noupdate:
-                item.skip = True
+    # -------------------------------------------------------------------------
+    def bulk(self, items):
+        """
+            Look up the duplicates for multiple import items of the same
+            table at once (bulk import), with one query for all items
+            rather than one per item; the duplicates are stored in the
+            items, so that subsequent deduplication of the individual
+            items need not query the database
 
-        # For uses outside of imports:
-        return duplicate
+            Args:
+                items: the import items (ImportItem)
+
+            Raises:
+                SyntaxError: if any of the query fields doesn't exist in
+                             the item table
+
+            Note:
+                Items with empty primary values or values that can not be
+                matched reliably outside of the database, as well as items
+                that match an earlier new item of the same chunk, are marked
+                as deferred, i.e. to be committed (and looked up) individually
+                after the bulk insert, so that they are matched with the
+                records of earlier items just like in a sequential import
+        """
+
+        if not items:
+            return
+
+        table = items[0].table
+        error = "Invalid field for duplicate detection: %s (%s)"
+
+        primary = sorted(self.primary)
+        secondary = sorted(self.secondary)
+
+        lower = set()
+        for fname in primary + secondary:
+            if fname not in table.fields:
+                raise SyntaxError(error % (fname, table))
+            ftype = str(table[fname].type)
+            if ftype in ("string", "text"):
+                if self.ignore_case:
+                    lower.add(fname)
+            elif ftype not in ("id", "integer", "bigint", "boolean") and \
+                 ftype[:9] != "reference":
+                # Can not match reliably in Python
+                for item in items:
+                    item.deferred = True
+                return
+
+        def key(fname, value):
+            if fname in lower:
+                return s3_str(value).lower() if value is not None else None
+            return value
+
+        # Collect the primary values
+        lookup = []
+        values = {fname: set() for fname in primary}
+        for item in items:
+            data = item.data
+            if not data:
+                continue
+            pkey = []
+            for fname in primary:
+                value = data.get(fname)
+                if value is None or \
+                   fname in lower and not hasattr(value, "lower"):
+                    item.deferred = True
+                    break
+                value = key(fname, value)
+                values[fname].add(value)
+                pkey.append(value)
+            else:
+                lookup.append((item, tuple(pkey)))
+        if not lookup:
+            return
+
+        # Look up all candidates
+        query = None
+        for fname in primary:
+            field = table[fname]
+            if fname in lower:
+                q = field.lower().belongs(values[fname])
+            else:
+                q = field.belongs(values[fname])
+            query = q if query is None else query & q
+        if self.ignore_deleted and "deleted" in table.fields:
+            query &= (table.deleted == False)
+
+        fields = [table._id] + [table[fname] for fname in primary + secondary]
+        rows = current.db(query).select(orderby = table._id, *fields)
+
+        candidates = {}
+        for row in rows:
+            pkey = tuple(key(fname, row[fname]) for fname in primary)
+            if pkey in candidates:
+                candidates[pkey].append(row)
+            else:
+                candidates[pkey] = [row]
+
+        # Match the items (first match by record ID, as in lookup)
+        created = {}
+        for item, pkey in lookup:
+            data = item.data
+            match = [(fname, key(fname, data[fname]))
+                     for fname in secondary if data.get(fname)]
+            duplicate = False
+            for row in candidates.get(pkey, ()):
+                for fname, value in match:
+                    if key(fname, row[fname]) != value:
+                        break
+                else:
+                    duplicate = row
+                    break
+            if duplicate is False:
+                # New record => check for matches with earlier new
+                # items in the chunk (=which would create that record)
+                earlier = created.get(pkey)
+                if earlier is None:
+                    created[pkey] = [item]
+                else:
+                    for other in earlier:
+                        odata = other.data
+                        for fname, value in match:
+                            if key(fname, odata.get(fname)) != value:
+                                break
+                        else:
+                            # Look up after the earlier item is committed
+                            item.deferred = True
+                            duplicate = None
+                            break
+                    earlier.append(item)
+            item.duplicate = duplicate
 
     # -------------------------------------------------------------------------
     def match(self, field, value):
@@ -40,13 +40,14 @@ import json
 import re
 import sys
 
+from copy import deepcopy
 from functools import reduce
 from urllib import parse as urlparse
 
 from gluon import current, IS_EMPTY_OR, IS_IN_SET
 from gluon.storage import Storage
 
-from s3dal import Field, Row
+from s3dal import Field, Query, Row
 
 from ..tools import S3RepresentLazy, S3TypeConverter, s3_get_foreign_key, s3_str
 
@@ -321,13 +322,81 @@ class S3FieldPath:
 
         if not selector:
             raise SyntaxError("Invalid selector: %s" % selector)
+
+        # Look up the field path from the cache
+        cache = key = None
+        if not tail:
+            model = getattr(current, "model", None)
+            cache = model.get("fieldpaths") if model else None
+            if cache is not None:
+                key = cls.cache_key(resource, selector)
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached.copy()
+
         tokens = re.split(r"(\.|\$)", selector)
         if tail:
             tokens.extend(tail)
         parser = cls(resource, None, tokens)
         parser.original = selector
+
+        # Cache the field path, unless it (or its field method) could not
+        # be resolved yet
+        if key is not None and parser.colname and \
+           (not parser.virtual or parser.method is not None):
+            cache[key] = parser.copy()
+
         return parser
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def cache_key(resource, selector):
+        """
+            Get the cache key for a field path
+
+            Args:
+                resource: the CRUDResource
+                selector: the field selector string
+
+            Returns:
+                the cache key (tuple)
+
+            Note:
+                The field path cache is per request cycle (as it holds
+                references to Table instances), and gets cleared whenever
+                the model configuration changes, so the key need not
+                represent the table configuration - but it must represent
+                the components exposed by the resource, as these can be
+                restricted per resource
+        """
+
+        parent = resource.parent
+        linked = resource.linked
+
+        return (resource.table._tablename,
+                resource.alias,
+                parent.table._tablename if parent is not None else None,
+                linked.alias if linked is not None else None,
+                frozenset(resource.components.exposed_aliases),
+                selector,
+                )
+
+    # -------------------------------------------------------------------------
+    def copy(self):
+        """
+            Get a copy of this field path (with its own joins dict), so
+            that the cached instance remains unaffected by changes
+
+            Returns:
+                S3FieldPath
+        """
+
+        fieldpath = object.__new__(self.__class__)
+        fieldpath.__dict__.update(self.__dict__)
+        fieldpath.joins = dict(self.joins)
+
+        return fieldpath
+
     # -------------------------------------------------------------------------
     def __init__(self, resource, table, tokens):
         """
@@ -1619,7 +1688,7 @@ class S3ResourceQuery:
                 r: the right operand
         """
 
-        hierarchy, field, nodeset, none = self._resolve_hierarchy(l, r)
+        hierarchy, field, nodeset, none = self._resolve_hierarchy(l, r, ranges=True)
         if not hierarchy:
             # Not a hierarchical query => use simple belongs
             return self._query_belongs(l, r)
@@ -1629,7 +1698,10 @@ class S3ResourceQuery:
 
         # Construct the subquery
         list_type = str(field.type)[:5] == "list:"
-        if nodeset:
+        if isinstance(nodeset, Query):
+            # Range query for nested-set intervals
+            q = nodeset
+        elif nodeset:
             if list_type:
                 q = (field.contains(list(nodeset)))
             elif len(nodeset) > 1:
@@ -1654,13 +1726,20 @@ class S3ResourceQuery:
 
     # -------------------------------------------------------------------------
     @classmethod
-    def _resolve_hierarchy(cls, l, r):
+    def _resolve_hierarchy(cls, l, r, ranges=False):
         """
             Resolve the hierarchical lookup in a typeof-query
 
             Args:
                 l: the left operand
                 r: the right operand
+                ranges: resolve into a range query rather than a node set
+                        if the hierarchy maintains nested-set intervals
+
+            Returns:
+                tuple (hierarchy, field, nodeset, none), where nodeset is
+                the set of matching node IDs, or - with ranges=True - can
+                be a range query for them
         """
 
         from ..tools import S3Hierarchy
@@ -1736,7 +1815,10 @@ class S3ResourceQuery:
                         continue
                     nodes.add(node_id)
             if hierarchy.config is not None:
-                nodeset = hierarchy.findall(nodes, inclusive=True)
+                if ranges and str(field.type)[:5] != "list:":
+                    nodeset = hierarchy.range_query(field, nodes)
+                if nodeset is None:
+                    nodeset = hierarchy.findall(nodes, inclusive=True)
             else:
                 nodeset = nodes
 
@@ -2233,6 +2315,11 @@ class S3URLQuery:
 
     FILTEROP = re.compile(r"__(?!link\.)([_a-z\!]+)$")
 
+    # Per-process caches for parsed filter keys and values
+    CACHE_SIZE = 2048
+    _expressions = {}
+    _values = {}
+
     # -------------------------------------------------------------------------
     @classmethod
     def parse(cls, resource, get_vars):
@@ -2408,18 +2495,27 @@ class S3URLQuery:
                 tuple ([field selectors], operator, invert)
         """
 
-        fs, op, invert = cls.parse_key(key)
+        cache = cls._expressions
+        parsed = cache.get(key)
+        if parsed is None:
+
+            fs, op, invert = cls.parse_key(key)
 
-        if "|" in fs:
-            selectors = [s for s in fs.split("|") if s]
+            if "|" in fs:
+                selectors = tuple(s for s in fs.split("|") if s)
+            else:
+                selectors = (fs,)
+
+            parsed = (selectors, op, invert)
+            cls.cache(cache, key, parsed)
         else:
-            selectors = [fs]
+            selectors, op, invert = parsed
 
-        return selectors, op, invert
+        return list(selectors), op, invert
 
     # -------------------------------------------------------------------------
-    @staticmethod
-    def parse_value(value):
+    @classmethod
+    def parse_value(cls, value):
         """
             Parse a URL query value
 
@@ -2430,6 +2526,55 @@ class S3URLQuery:
                 the parsed value
         """
 
+        if type(value) is str:
+            # Look up from cache
+            cache = cls._values
+            parsed = cache.get(value)
+            if parsed is None:
+                parsed = cls._parse_value(value)
+                if type(parsed) is list:
+                    cls.cache(cache, value, tuple(parsed))
+                else:
+                    cls.cache(cache, value, (parsed,))
+            elif len(parsed) == 1:
+                parsed = parsed[0]
+            else:
+                parsed = list(parsed)
+        else:
+            parsed = cls._parse_value(value)
+
+        return parsed
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def cache(cls, cache, key, value):
+        """
+            Add an item to a parser cache, clear the cache if it has
+            exceeded its maximum size
+
+            Args:
+                cache: the cache (dict)
+                key: the cache key
+                value: the value to cache
+        """
+
+        if len(cache) >= cls.CACHE_SIZE:
+            cache.clear()
+        cache[key] = value
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _parse_value(value):
+        """
+            Parse a URL query value (uncached)
+
+            Args:
+                value: the value
+
+            Returns:
+                the parsed value
+        """
+
         uquote = lambda w: w.replace('\\"', '\\"\\') \
                             .strip('"') \
                             .replace('\\"\\', '"')
@@ -2654,6 +2799,11 @@ combine = lambda x, y: x & y if x is not None else y
 class S3URLQueryParser:
     """ New-style URL Filter Parser """
 
+    # Per-process caches for the grammar and parsed expressions
+    CACHE_SIZE = 1024
+    _grammar = None
+    _expressions = {}
+
     def __init__(self):
         """ Constructor """
 
@@ -2674,6 +2824,15 @@ class S3URLQueryParser:
             current.log.error("Advanced filter syntax requires pyparsing, $filter ignored")
             return False
 
+        self.ParseResults = pp.ParseResults
+        self.ParseException = pp.ParseException
+
+        # Re-use the grammar if already defined
+        grammar = self.__class__._grammar
+        if grammar is not None:
+            self.parser = grammar
+            return True
+
         # Selector Syntax
         context = lambda s, l, t: t[0].replace("[", "(").replace("]", ")")
         selector = pp.Word(pp.alphas + "[]~", pp.alphanums + "_.$:[]")
@@ -2706,9 +2865,7 @@ class S3URLQueryParser:
                                             ("or", 2, pp.opAssoc.LEFT, ),
                                             ])
 
-        self.parser = parser
-        self.ParseResults = pp.ParseResults
-        self.ParseException = pp.ParseException
+        self.parser = self.__class__._grammar = parser
 
         return True
 
@@ -2731,6 +2888,12 @@ class S3URLQueryParser:
         if not expression or parser is None:
             return query
 
+        # Look up from cache
+        cache = self._expressions
+        if expression in cache:
+            # Return a copy (the queries are mutable)
+            return deepcopy(cache[expression])
+
         try:
             parsed = parser.parseString(expression)
         except self.ParseException:
@@ -2739,6 +2902,11 @@ class S3URLQueryParser:
         else:
             if parsed:
                 query = self.convert_expression(parsed[0])
+
+            if len(cache) >= self.CACHE_SIZE:
+                cache.clear()
+            cache[expression] = deepcopy(query)
+
         return query
 
     # -------------------------------------------------------------------------
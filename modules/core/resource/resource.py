@@ -49,7 +49,7 @@ from ..model import s3_all_meta_field_names
 from .components import S3Components
 from .query import FS, S3ResourceField, S3Joins
 from .rfilter import S3ResourceFilter
-from .data import ResourceData
+from .data import KeysetCursor, ResourceData
 
 #osetattr = object.__setattr__
 ogetattr = object.__getattribute__
@@ -463,6 +463,7 @@ class CRUDResource:
                represent = False,
                show_links = True,
                raw_data = False,
+               seek = None,
                ):
         """
             Extract data from this resource
@@ -481,6 +482,8 @@ class CRUDResource:
                 as_rows: return the rows (don't extract)
                 represent: render field value representations
                 raw_data: include raw data in the result
+                seek: a Query to continue the extraction after the last
+                      seen record (keyset pagination)
         """
 
         data = ResourceData(self,
@@ -498,6 +501,7 @@ class CRUDResource:
                             represent = represent,
                             show_links = show_links,
                             raw_data = raw_data,
+                            seek = seek,
                             )
         if as_rows:
             return data.rows
@@ -866,6 +870,7 @@ class CRUDResource:
                   orderby = None,
                   distinct = False,
                   list_id = None,
+                  cursor = None,
                   ):
         """
             Generate a data table of this resource
@@ -878,6 +883,9 @@ class CRUDResource:
                 orderby: orderby for DB query
                 distinct: distinct-flag for DB query
                 list_id: the datatable ID
+                cursor: use keyset pagination, the cursor token from
+                        the previous page (or empty string for the
+                        first page); None to use offset pagination
 
             Returns:
                 tuple (DataTable, numrows), where numrows represents
@@ -903,15 +911,17 @@ class CRUDResource:
         table_id.represent = None
 
         # Extract the data
+        keyset = self.keyset(cursor, start, limit, orderby, distinct)
         data = self.select(selectors,
-                           start = start,
+                           start = keyset.start if keyset else start,
                            limit = limit,
-                           orderby = orderby,
+                           orderby = keyset.orderby if keyset else orderby,
                            left = left,
                            distinct = distinct,
                            count = True,
                            getids = False,
                            represent = True,
+                           seek = keyset.seek if keyset else None,
                            )
 
         rows = data.rows
@@ -922,6 +932,8 @@ class CRUDResource:
         # Generate the data table
         rfields = data.rfields
         dt = DataTable(rfields, rows, list_id, orderby=orderby)
+        if keyset:
+            dt.cursor = self.keyset_next(keyset, data, start)
 
         return dt, data.numrows
 
@@ -935,6 +947,7 @@ class CRUDResource:
                  distinct = False,
                  list_id = None,
                  layout = None,
+                 cursor = None,
                  ):
         """
             Generate a data list of this resource
@@ -948,6 +961,9 @@ class CRUDResource:
                 distinct: distinct-flag for DB query
                 list_id: the list identifier
                 layout: custom renderer function (see S3DataList.render)
+                cursor: use keyset pagination, the cursor token from
+                        the previous page (or empty string for the
+                        first page); None to use offset pagination
 
             Returns:
                 tuple (S3DataList, numrows, ids), where numrows represents
@@ -968,16 +984,18 @@ class CRUDResource:
             selectors.insert(0, pkey)
 
         # Extract the data
+        keyset = self.keyset(cursor, start, limit, orderby, distinct)
         data = self.select(selectors,
-                           start = start,
+                           start = keyset.start if keyset else start,
                            limit = limit,
-                           orderby = orderby,
+                           orderby = keyset.orderby if keyset else orderby,
                            left = left,
                            distinct = distinct,
                            count = True,
                            getids = False,
                            raw_data = True,
                            represent = True,
+                           seek = keyset.seek if keyset else None,
                            )
 
         # Generate the data list
@@ -991,9 +1009,72 @@ class CRUDResource:
                         total = numrows,
                         layout = layout,
                         )
+        if keyset:
+            dl.cursor = self.keyset_next(keyset, data, start)
 
         return dl, numrows
 
+    # -------------------------------------------------------------------------
+    def keyset(self, cursor, start, limit, orderby, distinct=False):
+        """
+            Prepare keyset pagination for datatable/datalist
+
+            Args:
+                cursor: the cursor token from the client (None to
+                        use offset pagination)
+                start: the index of the first record requested
+                limit: the maximum number of records requested
+                orderby: the orderby expression
+                distinct: the distinct-flag for the query
+
+            Returns:
+                Storage(cursor, start, orderby, seek), or None if
+                keyset pagination is not applicable
+        """
+
+        if cursor is None or not limit or distinct:
+            return None
+
+        keyset = KeysetCursor(self, orderby)
+        if not keyset.seekable:
+            return None
+
+        start = start if start else 0
+        seek = keyset.seek(cursor, start) if start else None
+
+        return Storage(cursor = keyset,
+                       # With a valid seek predicate, the page starts
+                       # at the first row selected
+                       start = 0 if seek is not None else start,
+                       orderby = keyset.orderby,
+                       seek = seek,
+                       )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def keyset_next(keyset, data, start):
+        """
+            Generate the cursor for the page following a keyset page
+
+            Args:
+                keyset: the keyset pagination (from keyset())
+                data: the ResourceData for the current page
+                start: the index of the first record on the current page
+
+            Returns:
+                dict {"start": index of the next record,
+                      "key": the cursor token for it}
+        """
+
+        page = data.page
+        if not page:
+            return None
+
+        start = (start if start else 0) + len(page)
+        return {"start": start,
+                "key": keyset.cursor.encode(page[-1], start),
+                }
+
     # -------------------------------------------------------------------------
     def json(self,
              fields = None,
@@ -1588,6 +1669,7 @@ class CRUDResource:
                    select_items = None,
                    strategy = None,
                    sync_policy = None,
+                   bulk = False,
                    **args):
         """
             Import data
@@ -1606,6 +1688,8 @@ class CRUDResource:
                 select_items: items of the previous import job to select
                 strategy: allowed import methods
                 SyncPolicy sync_policy: the synchronization policy
+                bulk: bulk mode (commit new records in chunks, for
+                      large imports)
                 args: arguments for the transformation stylesheet
         """
 
@@ -1644,6 +1728,7 @@ class CRUDResource:
                                        select_items = select_items,
                                        strategy = strategy,
                                        sync_policy = sync_policy,
+                                       bulk = bulk,
                                        )
 
     # -------------------------------------------------------------------------
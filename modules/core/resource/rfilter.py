@@ -33,7 +33,7 @@ from functools import reduce
 from gluon import current
 from gluon.storage import Storage
 
-from s3dal import Rows
+from s3dal import Rows, original_tablename
 
 from .query import S3ResourceQuery, S3Joins, S3URLQuery
 
@@ -808,6 +808,16 @@ class S3ResourceFilter:
                                       (gtable.lat > float(minLat)) & \
                                       (gtable.lat < float(maxLat))
 
+                        # Pre-select candidates using the spatial index
+                        if original_tablename(gtable) == "gis_location":
+                            ids = current.gis.get_location_ids_by_bbox(minLon,
+                                                                       minLat,
+                                                                       maxLon,
+                                                                       maxLat,
+                                                                       )
+                            if ids is not None:
+                                bbox_filter = gtable.id.belongs(ids) & bbox_filter
+
                     # Add bbox filter to query
                     if query is None:
                         query = bbox_filter
@@ -1,3 +1,4 @@
+from .aggregate import *
 from .bi import *
 from .calendar import *
 from .convert import *
@@ -11,3 +12,4 @@ from .tracking import *
 #from .translate import *
 from .utils import *
 from .validators import *
+from .versions import *
@@ -0,0 +1,204 @@
+"""
+    Vectorised Aggregation
+
+    Copyright: 2022 (c) Sahana Software Foundation
+
+    Permission is hereby granted, free of charge, to any person
+    obtaining a copy of this software and associated documentation
+    files (the "Software"), to deal in the Software without
+    restriction, including without limitation the rights to use,
+    copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following
+    conditions:
+
+    The above copyright notice and this permission notice shall be
+    included in all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+    EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+    OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+    NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+    OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+__all__ = ("GroupedAggregate",
+           )
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# =============================================================================
+class GroupedAggregate:
+    """
+        Vectorised aggregation of a numeric fact column over groups of
+        items (e.g. pivot table cells, time plot rows/columns), using
+        NumPy if installed
+
+        Usage:
+            - extract the fact values of all items once:
+                  grouped = GroupedAggregate(values)
+            - if grouped.valid (i.e. NumPy is installed and the values
+              are suitable), compute aggregates for any number of groups:
+                  grouped.compute(method, items, groups, size)
+              ...otherwise fall back to aggregating the values per group
+    """
+
+    #: Aggregation methods that can be vectorised
+    METHODS = ("count", "sum", "min", "max", "avg")
+
+    def __init__(self, values, strict=False):
+        """
+            Args:
+                values: iterable of fact values, one per item
+                strict: treat non-numeric values as error rather than
+                        ignoring them (=not vectorisable)
+        """
+
+        self.valid = False
+
+        self.values = None
+        self.mask = None
+        self.floats = None
+
+        if np is None:
+            return
+
+        data = []
+        mask = []
+        floats = []
+        integer = True
+        for value in values:
+            vtype = type(value)
+            if value is None:
+                data.append(0)
+                mask.append(False)
+                floats.append(False)
+            elif vtype is int or vtype is bool:
+                data.append(value)
+                mask.append(True)
+                floats.append(False)
+            elif vtype is float:
+                data.append(value)
+                mask.append(True)
+                floats.append(True)
+                integer = False
+            elif strict or vtype is list or vtype is tuple:
+                # Cannot be vectorised
+                return
+            else:
+                # Not a number (e.g. virtual field returning "-")
+                data.append(0)
+                mask.append(False)
+                floats.append(False)
+
+        try:
+            self.values = np.array(data, dtype=np.int64 if integer else np.float64)
+        except OverflowError:
+            return
+        self.mask = np.array(mask, dtype=bool)
+        if not integer:
+            # Remember which values are floats, so that results for
+            # groups of only integers can be returned as integers
+            self.floats = np.array(floats, dtype=bool)
+
+        self.valid = True
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def supports(cls, method):
+        """
+            Check whether an aggregation method can be vectorised
+
+            Args:
+                method: the aggregation method
+
+            Returns:
+                boolean
+        """
+
+        return np is not None and method in cls.METHODS
+
+    # -------------------------------------------------------------------------
+    def compute(self, method, items, groups, size, empty=None):
+        """
+            Aggregate the values of items per group
+
+            Args:
+                method: the aggregation method
+                items: sequence of item indices
+                groups: sequence of group indices, one per item index
+                        (an item can appear in multiple groups)
+                size: the total number of groups
+                empty: the result for groups without values (min, max, avg)
+
+            Returns:
+                list of results (Python numbers), one per group
+        """
+
+        items = np.asarray(items, dtype=np.intp)
+        groups = np.asarray(groups, dtype=np.intp)
+
+        # Skip items without value
+        valid = self.mask[items]
+        items = items[valid]
+        values = self.values[items]
+        groups = groups[valid]
+
+        counts = np.bincount(groups, minlength=size)
+        if method == "count":
+            return counts.tolist()
+
+        # Groups with only integer values (like Python, the sum/min/max
+        # of only integers is an integer, even if other groups have floats)
+        floats = self.floats
+        if floats is not None:
+            integer = np.bincount(groups,
+                                  weights = floats[items],
+                                  minlength = size,
+                                  ) == 0
+            integer = integer.tolist()
+        else:
+            integer = None
+
+        # Sort values by group, and reduce each group slice
+        order = np.argsort(groups, kind="stable")
+        groups = groups[order]
+        values = values[order]
+
+        if len(groups):
+            starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+            keys = groups[starts]
+        else:
+            starts = keys = None
+
+        if method in ("sum", "avg"):
+            result = np.zeros(size, dtype=values.dtype)
+            if keys is not None:
+                result[keys] = np.add.reduceat(values, starts)
+            result = result.tolist()
+            if method == "sum":
+                if integer:
+                    result = [int(v) if integer[i] else v
+                              for i, v in enumerate(result)]
+                return result
+            return [result[i] / float(n) if n else empty
+                    for i, n in enumerate(counts.tolist())]
+
+        if method in ("min", "max"):
+            result = [empty] * size
+            if keys is not None:
+                reduce = np.minimum if method == "min" else np.maximum
+                reduced = reduce.reduceat(values, starts).tolist()
+                for key, value in zip(keys.tolist(), reduced):
+                    result[key] = int(value) if integer and integer[key] else value
+            return result
+
+        raise ValueError("Unsupported aggregation method: %s" % method)
+
+# END =========================================================================
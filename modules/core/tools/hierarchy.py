@@ -28,10 +28,16 @@
 __all__ = ("S3Hierarchy",
            )
 
-from gluon import current, LI, UL
+import threading
+
+from array import array
+
+from gluon import current, Field, LI, UL
 from gluon.storage import Storage
 from gluon.tools import callback
 
+from s3dal import original_tablename
+
 from .represent import S3Represent
 from .convert import s3_str
 
@@ -41,6 +47,12 @@ DEFAULT = lambda: None
 class S3Hierarchy:
     """ Class representing an object hierarchy """
 
+    # Names of the nested-set interval fields
+    INTERVALS = ("hierarchy_left", "hierarchy_right")
+
+    # Maximum number of records to update the intervals for per query
+    INTERVALS_BATCH_SIZE = 500
+
     # -------------------------------------------------------------------------
     def __init__(self,
                  tablename = None,
@@ -68,8 +80,7 @@ class S3Hierarchy:
         self.filter = filter
         self.leafonly = leafonly
 
-        self.__theset = None
-        self.__flags = None
+        self.__hierarchy = None
 
         self.__nodes = None
         self.__roots = None
@@ -82,6 +93,20 @@ class S3Hierarchy:
         self.__lkey = DEFAULT
         self.__left = DEFAULT
 
+    # -------------------------------------------------------------------------
+    @property
+    def tree(self):
+        """
+            The complete hierarchy (HierarchyTree), shared by all
+            requests in the process
+        """
+
+        if self.__hierarchy is None:
+            self.__connect()
+        if self.__status("dirty"):
+            self.read()
+        return self.__hierarchy["store"].snapshot()
+
     # -------------------------------------------------------------------------
     @property
     def theset(self):
@@ -92,22 +117,43 @@ class S3Hierarchy:
                              "c": <category>,
                              "s": set(child nodes)
                 }}
+
+            NB generated from the tree on demand, use the tree instead
+               where possible
         """
 
-        if self.__theset is None:
-            self.__connect()
-        if self.__status("dirty"):
-            self.read()
-        return self.__theset
+        tree = self.tree
+
+        hierarchy = self.__hierarchy
+        if hierarchy.get("tree") is not tree:
+            child_ids = tree.child_ids
+            hierarchy["nodes"] = {node_id: {"p": parent_id,
+                                            "c": category,
+                                            "s": set(child_ids(node_id)),
+                                            }
+                                  for node_id, parent_id, category in tree.items()
+                                  }
+            hierarchy["tree"] = tree
+
+        return hierarchy["nodes"]
 
     # -------------------------------------------------------------------------
     @property
     def flags(self):
         """ Dict of status flags """
 
-        if self.__flags is None:
-            theset = self.theset
-        return self.__flags
+        if self.__hierarchy is None:
+            self.__connect()
+        return self.__hierarchy["flags"]
+
+    # -------------------------------------------------------------------------
+    @property
+    def labels(self):
+        """ Dict of node labels {node_id: label}, per request """
+
+        if self.__hierarchy is None:
+            self.__connect()
+        return self.__hierarchy["labels"]
 
     # -------------------------------------------------------------------------
     @property
@@ -127,7 +173,7 @@ class S3Hierarchy:
     def nodes(self):
         """ The nodes in the subset """
 
-        theset = self.theset
+        tree = self.tree
         if self.__nodes is None:
             self.__subset()
         return self.__nodes
@@ -197,28 +243,67 @@ class S3Hierarchy:
             self.__keys()
         return self.__ckey
 
+    # -------------------------------------------------------------------------
+    @property
+    def intervals(self):
+        """
+            The nested-set interval fields of the hierarchical table,
+            tuple (left, right), or None if the table has no such fields
+        """
+
+        tablename = self.tablename
+        table = current.s3db.table(tablename) if tablename else None
+        if table is None:
+            return None
+
+        left, right = self.INTERVALS
+        if left in table.fields and right in table.fields:
+            return table[left], table[right]
+        return None
+
     # -------------------------------------------------------------------------
     def __connect(self):
         """ Connect this instance to the hierarchy """
 
         tablename = self.tablename
-        if tablename :
-            hierarchies = current.model["hierarchies"]
-            if tablename in hierarchies:
-                hierarchy = hierarchies[tablename]
-                self.__theset = hierarchy["nodes"]
-                self.__flags = hierarchy["flags"]
-            else:
-                self.__theset = dict()
-                self.__flags = dict()
+        if tablename:
+            hierarchy, created = self.__request_hierarchy(tablename)
+            self.__hierarchy = hierarchy
+            if created:
                 self.load()
-                hierarchy = {"nodes": self.__theset,
-                             "flags": self.__flags}
-                hierarchies[tablename] = hierarchy
         else:
-            self.__theset = dict()
-            self.__flags = dict()
-        return
+            self.__hierarchy = {"store": HierarchyStore(),
+                                "flags": {},
+                                "labels": {},
+                                }
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __request_hierarchy(tablename):
+        """
+            Get the hierarchy of a table for the current request
+
+            Args:
+                tablename: the tablename
+
+            Returns:
+                tuple (hierarchy, created), where hierarchy is a dict
+                {"store": HierarchyStore, "flags": dict, "labels": dict},
+                and created indicates whether it has been created by
+                this call
+        """
+
+        hierarchies = current.model["hierarchies"]
+        if tablename in hierarchies:
+            hierarchy, created = hierarchies[tablename], False
+        else:
+            hierarchy = {"store": HierarchyStore.get(tablename),
+                         "flags": {},
+                         "labels": {},
+                         }
+            hierarchies[tablename], created = hierarchy, True
+
+        return hierarchy, created
 
     # -------------------------------------------------------------------------
     def __status(self, flag=None, default=None, **attr):
@@ -247,7 +332,11 @@ class S3Hierarchy:
 
     # -------------------------------------------------------------------------
     def load(self):
-        """ Try loading the hierarchy from s3_hierarchy """
+        """
+            Try loading the hierarchy from s3_hierarchy; does not load
+            the stored hierarchy if the process-level store is up to
+            date with it
+        """
 
         if not self.config:
             return
@@ -258,74 +347,326 @@ class S3Hierarchy:
             self.__status(dirty=True)
             return
 
+        db = current.db
         htable = current.s3db.s3_hierarchy
         query = (htable.tablename == tablename)
-        row = current.db(query).select(htable.dirty,
-                                       htable.hierarchy,
+        row = db(query).select(htable.id,
+                               htable.dirty,
+                               htable.version,
+                               limitby = (0, 1)
+                               ).first()
+        version = (row.version or 0) if row else None
+
+        store = self.__hierarchy["store"]
+        if row and not row.dirty:
+            if store.version is None or store.version != version:
+                query = (htable.id == row.id)
+                row = db(query).select(htable.hierarchy,
                                        limitby = (0, 1)
                                        ).first()
-        if row and not row.dirty:
-            data = row.hierarchy
-            theset = self.__theset
-            theset.clear()
-            for node_id, item in data["nodes"].items():
-                theset[int(node_id)] = {"p": item["p"],
-                                        "c": item["c"],
-                                        "s": set(item["s"]) \
-                                             if item["s"] else set()}
+                data = row.hierarchy if row else None
+                nodes = {}
+                if data:
+                    for node_id, item in data["nodes"].items():
+                        nodes[int(node_id)] = (item["p"], item["c"])
+                store.replace(nodes,
+                              version = version,
+                              intervals = bool(data and data.get("intervals")),
+                              )
             self.__status(dirty = False,
                           dbupdate = None,
-                          dbstatus = True)
-            return
+                          dbstatus = True,
+                          dbversion = version,
+                          )
+        elif row and store.version is not None and store.version == version:
+            # Store has been rebuilt from the table by another request
+            # since the hierarchy was marked dirty => just save it
+            self.__status(dirty = False,
+                          dbupdate = True,
+                          dbstatus = False,
+                          dbversion = version,
+                          )
+            if not self.__readonly():
+                self.save()
         else:
             self.__status(dirty = True,
                           dbupdate = None,
-                          dbstatus = False if row else None)
-        return
+                          dbstatus = False if row else None,
+                          dbversion = version,
+                          )
 
     # -------------------------------------------------------------------------
     def save(self):
-        """ Save this hierarchy in s3_hierarchy """
+        """
+            Save this hierarchy in s3_hierarchy
+
+            Returns:
+                True if the hierarchy was saved, False if it had been
+                changed by another process in the meantime (or if there
+                was nothing to save)
+        """
 
         if not self.config:
-            return
+            return False
         tablename = self.tablename
 
-        theset = self.theset
+        tree = self.tree
         if not self.__status("dbupdate"):
-            return
+            return False
 
-        # Serialize the theset
+        # Serialize the tree
+        child_ids = tree.child_ids
         nodes_dict = {}
-        for node_id, node in theset.items():
-            nodes_dict[node_id] = {"p": node["p"],
-                                   "c": node["c"],
-                                   "s": list(node["s"]) \
-                                        if node["s"] else []}
+        for node_id, parent_id, category in tree.items():
+            nodes_dict[node_id] = {"p": parent_id,
+                                   "c": category,
+                                   "s": child_ids(node_id),
+                                   }
 
         # Generate record
+        intervals = self.intervals is not None
         data = {"tablename": tablename,
                 "dirty": False,
-                "hierarchy": {"nodes": nodes_dict}
+                "hierarchy": {"nodes": nodes_dict,
+                              "intervals": intervals,
+                              },
                 }
 
         # Get current entry
+        db = current.db
         htable = current.s3db.s3_hierarchy
         query = (htable.tablename == tablename)
-        row = current.db(query).select(htable.id,
-                                       limitby = (0, 1)
-                                       ).first()
+        row = db(query).select(htable.id,
+                               limitby = (0, 1)
+                               ).first()
 
+        version = self.__status("dbversion")
         if row:
-            # Update record
-            row.update_record(**data)
+            # Update the record, unless its version has changed since
+            # the hierarchy was loaded (=changed by another process)
+            if version is not None:
+                query = (htable.id == row.id) & \
+                        (htable.version.coalesce(0) == version)
+                data["version"] = version = version + 1
+                saved = db(query).update(**data) > 0
+            else:
+                # Record has been created by another process
+                saved = False
         else:
             # Create new record
+            data["version"] = version = 1
             htable.insert(**data)
+            saved = True
 
-        # Update status
-        self.__status(dirty=False, dbupdate=None, dbstatus=True)
-        return
+        if saved:
+            if intervals:
+                self.__save_intervals(tree)
+
+            # Other requests reload the hierarchy once this transaction
+            # is committed, so only this request's store is updated
+            hierarchy = self.__hierarchy
+            self.__detach(hierarchy)
+            store = hierarchy["store"]
+            store.version = version
+            store.intervals = intervals
+
+            self.__status(dirty = False,
+                          dbupdate = None,
+                          dbstatus = True,
+                          dbversion = version,
+                          dbdirty = None,
+                          )
+        else:
+            # Must re-validate in subsequent requests
+            self.__status(dbupdate = None,
+                          dbstatus = False,
+                          )
+        return saved
+
+    # -------------------------------------------------------------------------
+    def __save_intervals(self, tree):
+        """
+            Update the nested-set intervals in the hierarchical table,
+            for all records where they have changed
+
+            Args:
+                tree: the HierarchyTree
+
+            Note:
+                Updates the records in batches (UPDATE with CASE), and
+                bypasses the DAL so that fields with update-defaults
+                (e.g. modified_on) retain their values and no update
+                hooks are triggered - intervals are no content changes
+        """
+
+        db = current.db
+        table = current.s3db[self.tablename]
+
+        left, right = self.intervals
+        pkey = table[self.pkey.name]
+
+        # Includes deleted records, to remove their intervals
+        rows = db(pkey != None).select(pkey, left, right)
+
+        interval = tree.interval
+        updates = []
+        for row in rows:
+            node_id = row[pkey]
+            l, r = interval(node_id) or (None, None)
+            if row[left] != l or row[right] != r:
+                updates.append((int(node_id), l, r))
+        if not updates:
+            return
+
+        # NB ELSE-clauses are never reached, but determine the type of
+        #    the CASE expressions if all values in a batch are NULL
+        sql = "UPDATE %(table)s " \
+              "SET %(left)s=CASE %(pkey)s %(lcases)s ELSE %(left)s END," \
+              "%(right)s=CASE %(pkey)s %(rcases)s ELSE %(right)s END " \
+              "WHERE %(pkey)s IN (%(ids)s);"
+        names = {"table": table._tablename,
+                 "pkey": pkey.name,
+                 "left": left.name,
+                 "right": right.name,
+                 }
+
+        value = lambda v: "NULL" if v is None else "%d" % v
+        size = self.INTERVALS_BATCH_SIZE
+        for i in range(0, len(updates), size):
+            batch = updates[i:i+size]
+            names["lcases"] = " ".join("WHEN %d THEN %s" % (n, value(l))
+                                       for n, l, _ in batch)
+            names["rcases"] = " ".join("WHEN %d THEN %s" % (n, value(r))
+                                       for n, _, r in batch)
+            names["ids"] = ",".join("%d" % n for n, _, _ in batch)
+            db.executesql(sql % names)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def interval_fields(cls):
+        """
+            Fields to store the nested-set intervals of the nodes in
+            a hierarchical table; if the table has these fields, then
+            they are maintained by S3Hierarchy, and typeof-queries use
+            range predicates rather than lists of all descendant IDs
+
+            Returns:
+                tuple of Fields
+
+            Example:
+                define_table(tablename,
+                             ...,
+                             *S3Hierarchy.interval_fields())
+        """
+
+        left, right = cls.INTERVALS
+
+        return (Field(left, "integer",
+                      readable = False,
+                      writable = False,
+                      ),
+                Field(right, "integer",
+                      readable = False,
+                      writable = False,
+                      ),
+                )
+
+    # -------------------------------------------------------------------------
+    def range_query(self, field, node_ids):
+        """
+            Construct a query for values of a field that are within the
+            subtrees of certain nodes, using the nested-set intervals
+
+            Args:
+                field: the primary key of the hierarchical table, or a
+                       foreign key referencing it
+                node_ids: the root nodes of the subtrees (iterable)
+
+            Returns:
+                a Query, or None if the hierarchy has no intervals (or
+                they are not in sync with it), or if none of the nodes
+                is in the hierarchy
+        """
+
+        intervals = self.intervals
+        if not intervals:
+            return None
+
+        # Load the hierarchy (or rebuild it if dirty)
+        self.tree
+        if self.__status("dirty") or not self.__status("dbstatus"):
+            return None
+        store = self.__hierarchy["store"]
+        with store.lock:
+            tree = store.snapshot()
+            version = store.version
+            valid = store.intervals
+        if not valid or version is None or not self.__verify(version):
+            return None
+
+        # Intervals are either nested or disjoint, so skip those which
+        # start within the previous interval
+        merged = []
+        for l, r in sorted(i for i in map(tree.interval, node_ids) if i):
+            if merged and l < merged[-1][1]:
+                continue
+            merged.append((l, r))
+        if not merged:
+            return None
+
+        tablename = self.tablename
+        table = current.s3db[tablename]
+        pkey = table[self.pkey.name]
+        left = table[self.INTERVALS[0]]
+
+        query = None
+        for l, r in merged:
+            q = (left == l) if r - l == 1 else ((left >= l) & (left < r))
+            query = q if query is None else (query | q)
+
+        if original_tablename(field.table) != tablename or \
+           field.name != pkey.name:
+            # Foreign key => restrict to accessible records
+            if "deleted" in table.fields:
+                query &= (table.deleted == False)
+            query &= current.auth.s3_accessible_query("read", table)
+
+        # Subselect from the hierarchical table, joined with the stored
+        # hierarchy so that it only matches with the verified version
+        htable = current.s3db.s3_hierarchy
+        query &= (htable.tablename == tablename) & \
+                 (htable.version == version)
+
+        return field.belongs(current.db(query)._select(pkey))
+
+    # -------------------------------------------------------------------------
+    def __verify(self, version):
+        """
+            Verify that the stored hierarchy still has the version the
+            intervals have been computed for (checked once per request
+            and version)
+
+            Args:
+                version: the version of the intervals
+
+            Returns:
+                True if the version is current, otherwise False
+        """
+
+        verified = self.__status("dbverified")
+        if verified and verified[0] == version:
+            return verified[1]
+
+        htable = current.s3db.s3_hierarchy
+        query = (htable.tablename == self.tablename)
+        row = current.db(query).select(htable.version,
+                                       htable.dirty,
+                                       limitby = (0, 1),
+                                       ).first()
+        valid = bool(row) and not row.dirty and row.version == version
+
+        self.__status(dbverified=(version, valid))
+        return valid
 
     # -------------------------------------------------------------------------
     @classmethod
@@ -346,29 +687,35 @@ class S3Hierarchy:
         if not config:
             return
 
-        hierarchies = current.model["hierarchies"]
-        if tablename in hierarchies:
-            hierarchy = hierarchies[tablename]
-            flags = hierarchy["flags"]
-        else:
-            flags = {}
-            hierarchies[tablename] = {"nodes": dict(),
-                                      "flags": flags}
+        hierarchy = cls.__request_hierarchy(tablename)[0]
+
+        # Rebuild in this request only, as the changes of the target
+        # table are not visible to other requests before commit
+        cls.__detach(hierarchy, copy=False)
+
+        flags = hierarchy["flags"]
         flags["dirty"] = True
 
-        dbstatus = flags.get("dbstatus", True)
-        if dbstatus:
+        if not flags.get("dbdirty"):
+            # Increment the version, so that concurrent saves fail, and
+            # other processes know that their hierarchies are stale
+            db = current.db
             htable = current.s3db.s3_hierarchy
             query = (htable.tablename == tablename)
-            row = current.db(query).select(htable.id,
-                                           htable.dirty,
-                                           limitby=(0, 1)).first()
+            row = db(query).select(htable.id, limitby=(0, 1)).first()
             if not row:
-                htable.insert(tablename=tablename, dirty=True)
-            elif not row.dirty:
-                row.update_record(dirty=True)
+                htable.insert(tablename=tablename, dirty=True, version=1)
+            else:
+                query = (htable.id == row.id)
+                db(query).update(dirty = True,
+                                 version = htable.version.coalesce(0) + 1,
+                                 )
+            # The record remains locked until commit, so this is the
+            # version set by this request
+            row = db(query).select(htable.version, limitby=(0, 1)).first()
+            flags["dbversion"] = row.version if row else None
             flags["dbstatus"] = False
-        return
+            flags["dbdirty"] = True
 
     # -------------------------------------------------------------------------
     def read(self):
@@ -395,9 +742,11 @@ class S3Hierarchy:
             query = (table.id > 0)
         rows = current.db(query).select(left = self.left, *fields)
 
-        self.__theset.clear()
+        if self.__hierarchy is None:
+            self.__connect()
 
-        add = self.add
+        nodes = {}
+        add = HierarchyStore.add_node
         cfield = table[ckey]
         for row in rows:
             n = row[pkey]
@@ -406,7 +755,14 @@ class S3Hierarchy:
                 c = row[cfield]
             else:
                 c = None
-            add(n, parent_id=p, category=c)
+            add(nodes, n, parent_id=p, category=c)
+
+        # Unless this request has changed the hierarchy (=store detached),
+        # the nodes are consistent with the (committed) version that has
+        # been loaded, so other requests can re-use them
+        hierarchy = self.__hierarchy
+        hierarchy["store"].replace(nodes, version=self.__status("dbversion"))
+        hierarchy["labels"].clear()
 
         # Update status: memory is clean, db needs update
         self.__status(dirty=False, dbupdate=True)
@@ -415,7 +771,44 @@ class S3Hierarchy:
         self.__roots = None
         self.__nodes = None
 
-        return
+        # Save the hierarchy, so that subsequent requests can load it
+        # rather than having to rebuild it from the target table (but
+        # do not write to the database during GET requests)
+        if not self.__readonly():
+            self.save()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __detach(hierarchy, copy=True):
+        """
+            Detach the hierarchy of the current request from the
+            process-level store, so that changes in this request do
+            not become visible to other requests before commit
+
+            Args:
+                hierarchy: the hierarchy dict of the current request
+                copy: copy the current nodes into the request-local
+                      store (otherwise start with an empty store)
+        """
+
+        flags = hierarchy["flags"]
+        if not flags.get("local"):
+            store = hierarchy["store"]
+            hierarchy["store"] = store.copy() if copy else HierarchyStore()
+            flags["local"] = True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __readonly():
+        """
+            Check whether the current request must not write to the
+            database (i.e. is a GET request)
+
+            Returns:
+                boolean
+        """
+
+        return current.request.env.request_method in ("GET", "HEAD")
 
     # -------------------------------------------------------------------------
     def __keys(self):
@@ -626,7 +1019,7 @@ class S3Hierarchy:
                 result = self.delete(children, cascade=True)
                 if result is None:
                     if not cascade:
-                        current.db.rollback()
+                        self.__rollback()
                     return None
                 else:
                     total += result
@@ -641,18 +1034,41 @@ class S3Hierarchy:
                 total += 1
             else:
                 if not cascade:
-                    current.db.rollback()
+                    self.__rollback()
                 return None
 
         if not cascade and total:
-            self.dirty(tablename)
+            # Save the updated hierarchy rather than marking it as dirty
+            # (fall back to dirty if modified by another process)
+            if not self.save():
+                self.dirty(tablename)
 
         return total
 
+    # -------------------------------------------------------------------------
+    def __rollback(self):
+        """
+            Roll back the current transaction, and discard all changes
+            of the hierarchy in the current request
+        """
+
+        current.db.rollback()
+
+        # Start over with a request-local hierarchy, rebuilt from the
+        # target table (which may have been changed before rollback)
+        hierarchy = self.__hierarchy
+        hierarchy["flags"].clear()
+        hierarchy["labels"].clear()
+        self.dirty(self.tablename)
+
+        # Remove subset
+        self.__roots = None
+        self.__nodes = None
+
     # -------------------------------------------------------------------------
     def add(self, node_id, parent_id=None, category=None):
         """
-            Add a new node to the hierarchy
+            Add a new node to the hierarchy (or update an existing node)
 
             Args:
                 node_id: the node ID
@@ -660,27 +1076,16 @@ class S3Hierarchy:
                 category: the category
         """
 
-        theset = self.__theset
+        tree = self.tree
 
-        if node_id in theset:
-            node = theset[node_id]
-            if category is not None:
-                node["c"] = category
-        elif node_id:
-            node = {"s": set(), "c": category}
-        else:
-            raise SyntaxError
-
-        if parent_id:
-            if parent_id not in theset:
-                parent = self.add(parent_id, None, None)
-            else:
-                parent = theset[parent_id]
-            parent["s"].add(node_id)
-        node["p"] = parent_id
+        hierarchy = self.__hierarchy
+        self.__detach(hierarchy)
+        hierarchy["store"].add(node_id, parent_id=parent_id, category=category)
+        self.__status(dbupdate=True)
 
-        theset[node_id] = node
-        return node
+        # Remove subset
+        self.__roots = None
+        self.__nodes = None
 
     # -------------------------------------------------------------------------
     def remove(self, node_id):
@@ -689,27 +1094,31 @@ class S3Hierarchy:
 
             Args:
                 node_id: the node ID
-        """
 
-        theset = self.__theset
+            Returns:
+                True if the node was removed, False if it was not found
+        """
 
-        if node_id in theset:
-            node = theset[node_id]
-        else:
+        tree = self.tree
+        if node_id not in tree:
             return False
 
-        parent_id = node["p"]
-        if parent_id:
-            parent = theset[parent_id]
-            parent["s"].discard(node_id)
-        del theset[node_id]
+        hierarchy = self.__hierarchy
+        self.__detach(hierarchy)
+        hierarchy["store"].remove(node_id)
+        self.__status(dbupdate=True)
+
+        # Remove subset
+        self.__roots = None
+        self.__nodes = None
+
         return True
 
     # -------------------------------------------------------------------------
     def __subset(self):
         """ Generate the subset of accessible nodes which match the filter """
 
-        theset = self.theset
+        tree = self.tree
 
         roots = set()
         subset = {}
@@ -725,37 +1134,40 @@ class S3Hierarchy:
             if self.leafonly:
                 # Select matching leaf nodes
                 ids = set()
+                is_leaf = tree.is_leaf
                 for row in rows:
                     node_id = row[key]
-                    if node_id in theset and not theset[node_id]["s"]:
+                    if node_id in tree and is_leaf(node_id):
                         ids.add(node_id)
             else:
                 # Select all matching nodes
                 ids = set(row[key] for row in rows)
 
             # Resolve the paths
+            get_parent, get_category = tree.parent_id, tree.category
             while ids:
                 node_id = ids.pop()
-                if node_id in subset:
-                    continue
-                node = theset.get(node_id)
-                if not node:
+                if node_id in subset or node_id not in tree:
                     continue
-                parent_id = node["p"]
+                parent_id = get_parent(node_id)
                 if parent_id and parent_id not in subset:
                     ids.add(parent_id)
                 elif not parent_id:
                     roots.add(node_id)
-                subset[node_id] = dict(node)
+                subset[node_id] = {"p": parent_id,
+                                   "c": get_category(node_id),
+                                   "s": set(),
+                                   }
 
-            # Update the descendants
-            for node in subset.values():
-                node["s"] = set(node_id for node_id in node["s"]
-                                        if node_id in subset)
+            # Link the descendants
+            for node_id, node in subset.items():
+                parent_id = node["p"]
+                if parent_id and parent_id in subset:
+                    subset[parent_id]["s"].add(node_id)
 
         self.__roots = roots
         self.__nodes = subset
-        return
+
 
     # -------------------------------------------------------------------------
     def category(self, node_id):
@@ -999,36 +1411,47 @@ class S3Hierarchy:
         """
 
         result = set()
-        findall = self.findall
-        if isinstance(node_id, (set, list, tuple)):
-            for n in node_id:
-                if n is None:
-                    continue
-                result |= findall(n,
-                                  category=category,
-                                  classify=classify,
-                                  inclusive=inclusive)
-            return result
         nodes = self.nodes
-        node = nodes.get(node_id)
-        if not node:
-            return result
-        if node["s"]:
-            result |= findall(node["s"],
-                              category=category,
-                              classify=classify,
-                              inclusive=True)
-        if inclusive:
-            this = (node_id, node["c"]) if classify else node_id
+
+        if isinstance(node_id, (set, list, tuple)):
+            node_ids = node_id
+        else:
+            node_ids = [node_id]
+
+        def match(node_id, node):
             if category is DEFAULT or category == node["c"]:
-                result.add(this)
+                result.add((node_id, node["c"]) if classify else node_id)
+
+        # Traverse iteratively (rather than recursively) as subtrees
+        # can be large and deep
+        stack = []
+        for node_id in node_ids:
+            node = nodes.get(node_id) if node_id is not None else None
+            if not node:
+                continue
+            if inclusive:
+                match(node_id, node)
+            stack.extend(node["s"])
+
+        seen = set()
+        while stack:
+            node_id = stack.pop()
+            if node_id in seen:
+                continue
+            seen.add(node_id)
+            node = nodes.get(node_id)
+            if not node:
+                continue
+            match(node_id, node)
+            stack.extend(node["s"])
+
         return result
 
     # -------------------------------------------------------------------------
     def _represent(self, node_ids=None, renderer=None):
         """
             Represent nodes as labels, the labels are stored in the
-            nodes as attribute "l".
+            per-request labels dict.
 
             Args:
                 node_ids: the node IDs (None for all nodes)
@@ -1036,17 +1459,15 @@ class S3Hierarchy:
                           field in the target table if present)
         """
 
-        theset = self.theset
+        tree = self.tree
+        labels = self.labels
 
         if node_ids is None:
             node_ids = self.nodes.keys()
 
         pending = set()
         for node_id in node_ids:
-            node = theset.get(node_id)
-            if not node:
-                continue
-            if "l" not in node:
+            if node_id in tree and node_id not in labels:
                 pending.add(node_id)
 
         if renderer is None:
@@ -1060,17 +1481,17 @@ class S3Hierarchy:
             else:
                 renderer = s3_str
         if hasattr(renderer, "bulk"):
-            labels = renderer.bulk(list(pending), list_type = False)
-            for node_id, label in labels.items():
-                if node_id in theset:
-                    theset[node_id]["l"] = label
+            represented = renderer.bulk(list(pending), list_type = False)
+            for node_id, label in represented.items():
+                if node_id in tree:
+                    labels[node_id] = label
         else:
             for node_id in pending:
                 try:
                     label = renderer(node_id)
                 except:
                     label = s3_str(node_id)
-                theset[node_id]["l"] = label
+                labels[node_id] = label
         return
 
     # -------------------------------------------------------------------------
@@ -1083,15 +1504,11 @@ class S3Hierarchy:
                 represent: the node ID representation method
         """
 
-        theset = self.theset
-        node = theset.get(node_id)
-        if node:
-            if "l" in node:
-                label = node["l"]
-            else:
+        if node_id in self.tree:
+            labels = self.labels
+            if node_id not in labels:
                 self._represent(node_ids=[node_id], renderer=represent)
-            if "l" in node:
-                label = node["l"]
+            label = labels.get(node_id)
             if type(label) is str:
                 label = s3_str(label)
             return label
@@ -1122,11 +1539,11 @@ class S3Hierarchy:
 
         self._represent(all_parents, renderer=represent)
 
-        theset = self.theset
+        labels = self.labels
         result = {}
         for node_id, path in paths.items():
             p = (path + [None] * levels)[:levels]
-            l = [theset[parent]["l"] if parent else "-" for parent in p]
+            l = [labels[parent] if parent else "-" for parent in p]
             result[node_id] = l
 
         return result
@@ -1378,4 +1795,405 @@ class S3Hierarchy:
                              )
         return node_list
 
+# =============================================================================
+class HierarchyStore:
+    """
+        Process-level store of a hierarchy, shared by all requests:
+
+            - holds the nodes as dict {node_id: (parent_id, category)}
+            - compiles the nodes into an immutable HierarchyTree on
+              demand, i.e. once after every change
+            - versioned by the version number of the s3_hierarchy record
+              the nodes are consistent with (None if unknown)
+
+        Requests which change the hierarchy work on a request-local
+        copy (which can be updated incrementally with add/remove), so
+        that the changes do not become visible to other requests before
+        they have been committed.
+    """
+
+    # Process-level instances, {(db, tablename): HierarchyStore}
+    instances = {}
+    instances_lock = threading.Lock()
+
+    def __init__(self):
+
+        self.lock = threading.RLock()
+
+        self.nodes = {}
+        self.version = None
+
+        # Whether the interval fields in the hierarchical table
+        # match the current version
+        self.intervals = False
+
+        self.tree = None
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get(cls, tablename):
+        """
+            Get the process-level store for a hierarchy
+
+            Args:
+                tablename: the name of the hierarchical table
+
+            Returns:
+                the HierarchyStore
+        """
+
+        key = (current.db._uri_hash, tablename)
+
+        store = cls.instances.get(key)
+        if store is None:
+            with cls.instances_lock:
+                store = cls.instances.get(key)
+                if store is None:
+                    store = cls.instances[key] = cls()
+        return store
+
+    # -------------------------------------------------------------------------
+    def copy(self):
+        """
+            Copy this store, e.g. for request-local changes
+
+            Returns:
+                a new HierarchyStore
+        """
+
+        store = self.__class__()
+        with self.lock:
+            store.nodes = dict(self.nodes)
+            store.version = self.version
+            store.intervals = self.intervals
+            store.tree = self.tree
+        return store
+
+    # -------------------------------------------------------------------------
+    def snapshot(self):
+        """
+            Get the current state of the hierarchy
+
+            Returns:
+                a HierarchyTree
+        """
+
+        tree = self.tree
+        if tree is None:
+            with self.lock:
+                tree = self.tree
+                if tree is None:
+                    tree = self.tree = HierarchyTree(self.nodes)
+        return tree
+
+    # -------------------------------------------------------------------------
+    def replace(self, nodes, version=None, intervals=False):
+        """
+            Replace all nodes
+
+            Args:
+                nodes: the nodes, dict {node_id: (parent_id, category)}
+                version: the version of the nodes
+                intervals: whether the interval fields in the
+                           hierarchical table match this version
+        """
+
+        with self.lock:
+            self.nodes = nodes
+            self.version = version
+            self.intervals = intervals
+            self.tree = None
+
+    # -------------------------------------------------------------------------
+    def add(self, node_id, parent_id=None, category=None):
+        """
+            Add a node (or update an existing node)
+
+            Args:
+                node_id: the node ID
+                parent_id: the parent node ID
+                category: the category (None to retain the current
+                          category of an existing node)
+        """
+
+        with self.lock:
+            self.add_node(self.nodes, node_id, parent_id=parent_id, category=category)
+            self.version = None
+            self.intervals = False
+            self.tree = None
+
+    # -------------------------------------------------------------------------
+    def remove(self, node_id):
+        """
+            Remove a node; its child nodes retain the reference to it,
+            but are no longer linked to any parent node
+
+            Args:
+                node_id: the node ID
+
+            Returns:
+                True if the node was removed, False if it was not found
+        """
+
+        with self.lock:
+            if self.nodes.pop(node_id, None) is None:
+                return False
+            self.version = None
+            self.intervals = False
+            self.tree = None
+        return True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def add_node(nodes, node_id, parent_id=None, category=None):
+        """
+            Add a node to a nodes dict, adding the parent node as
+            placeholder if it does not exist yet
+
+            Args:
+                nodes: the nodes dict {node_id: (parent_id, category)}
+                node_id: the node ID
+                parent_id: the parent node ID
+                category: the category (None to retain the current
+                          category of an existing node)
+        """
+
+        if node_id in nodes:
+            if category is None:
+                category = nodes[node_id][1]
+        elif not node_id:
+            raise SyntaxError
+
+        if parent_id and parent_id not in nodes:
+            nodes[parent_id] = (None, None)
+        nodes[node_id] = (parent_id, category)
+
+# =============================================================================
+class HierarchyTree:
+    """
+        Immutable, array-backed representation of a hierarchy:
+
+            - node positions in order of node IDs
+            - parent position for each node (-1 for root nodes)
+            - child positions in compressed sparse rows (CSR), i.e. the
+              children of the node at position i are
+              children[offsets[i]:offsets[i+1]]
+            - nested-set intervals from a pre-order traversal, i.e. the
+              descendants of the node at position i are
+              order[left[i]+1:right[i]], and the node at position i
+              is an ancestor of the node at position j if
+              left[i] < left[j] < right[i]
+    """
+
+    def __init__(self, nodes):
+        """
+            Args:
+                nodes: the nodes, dict {node_id: (parent_id, category)}
+        """
+
+        self.ids = ids = sorted(nodes)
+        self.pos = pos = {node_id: i for i, node_id in enumerate(ids)}
+
+        size = len(ids)
+
+        # Parents and categories
+        self.parent_ids = parent_ids = [None] * size
+        self.categories = categories = [None] * size
+        self.parent = parent = array("l", [-1]) * size
+        counts = array("l", [0]) * (size + 1)
+        for i, node_id in enumerate(ids):
+            parent_id, category = nodes[node_id]
+            parent_ids[i] = parent_id
+            categories[i] = category
+            if parent_id:
+                p = pos.get(parent_id, -1)
+                if p >= 0:
+                    parent[i] = p
+                    counts[p + 1] += 1
+
+        # Children (CSR)
+        for i in range(size):
+            counts[i + 1] += counts[i]
+        self.offsets = offsets = counts
+        self.children = children = array("l", [0]) * offsets[size]
+        fill = offsets[:size]
+        for i in range(size):
+            p = parent[i]
+            if p >= 0:
+                children[fill[p]] = i
+                fill[p] += 1
+
+        # Nested-set intervals (pre-order)
+        self.left = left = array("l", [-1]) * size
+        self.right = right = array("l", [-1]) * size
+        self.order = order = array("l", [0]) * size
+        counter = 0
+        roots = [i for i in range(size) if parent[i] < 0]
+        # Nodes in parent cycles are unreachable from any root,
+        # so traverse from each of them if still unvisited
+        for start in roots + list(range(size)):
+            if left[start] >= 0:
+                continue
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                if i < 0:
+                    right[~i] = counter
+                    continue
+                if left[i] >= 0:
+                    continue
+                left[i] = counter
+                order[counter] = i
+                counter += 1
+                stack.append(~i)
+                stack.extend(c for c in reversed(children[offsets[i]:offsets[i+1]])
+                               if left[c] < 0)
+
+    # -------------------------------------------------------------------------
+    def __contains__(self, node_id):
+
+        return node_id in self.pos
+
+    # -------------------------------------------------------------------------
+    def __len__(self):
+
+        return len(self.ids)
+
+    # -------------------------------------------------------------------------
+    def items(self):
+        """
+            Iterate over all nodes
+
+            Returns:
+                iterator over tuples (node_id, parent_id, category)
+        """
+
+        return zip(self.ids, self.parent_ids, self.categories)
+
+    # -------------------------------------------------------------------------
+    def parent_id(self, node_id):
+        """
+            Get the parent ID of a node
+
+            Args:
+                node_id: the node ID
+
+            Returns:
+                the parent node ID, or None if the node is a root node
+                or not in the hierarchy
+        """
+
+        i = self.pos.get(node_id)
+        return self.parent_ids[i] if i is not None else None
+
+    # -------------------------------------------------------------------------
+    def category(self, node_id):
+        """
+            Get the category of a node
+
+            Args:
+                node_id: the node ID
+
+            Returns:
+                the category
+        """
+
+        i = self.pos.get(node_id)
+        return self.categories[i] if i is not None else None
+
+    # -------------------------------------------------------------------------
+    def child_ids(self, node_id):
+        """
+            Get the child node IDs of a node
+
+            Args:
+                node_id: the node ID
+
+            Returns:
+                list of node IDs
+        """
+
+        i = self.pos.get(node_id)
+        if i is None:
+            return []
+        ids = self.ids
+        offsets = self.offsets
+        return [ids[c] for c in self.children[offsets[i]:offsets[i+1]]]
+
+    # -------------------------------------------------------------------------
+    def is_leaf(self, node_id):
+        """
+            Check whether a node has no child nodes
+
+            Args:
+                node_id: the node ID
+
+            Returns:
+                True|False
+        """
+
+        i = self.pos.get(node_id)
+        if i is None:
+            return False
+        offsets = self.offsets
+        return offsets[i] == offsets[i+1]
+
+    # -------------------------------------------------------------------------
+    def is_ancestor(self, ancestor_id, node_id):
+        """
+            Check whether a node is an ancestor of another node
+
+            Args:
+                ancestor_id: the ancestor node ID
+                node_id: the node ID
+
+            Returns:
+                True|False
+        """
+
+        pos = self.pos
+        a, i = pos.get(ancestor_id), pos.get(node_id)
+        if a is None or i is None:
+            return False
+        left = self.left
+        return left[a] < left[i] < self.right[a]
+
+    # -------------------------------------------------------------------------
+    def interval(self, node_id):
+        """
+            Get the nested-set interval of a node
+
+            Args:
+                node_id: the node ID
+
+            Returns:
+                tuple (left, right), or None if the node is not in
+                the hierarchy
+        """
+
+        i = self.pos.get(node_id)
+        if i is None:
+            return None
+        return self.left[i], self.right[i]
+
+    # -------------------------------------------------------------------------
+    def descendants(self, node_id, inclusive=False):
+        """
+            Get the IDs of all descendant nodes of a node
+
+            Args:
+                node_id: the node ID
+                inclusive: include the node itself
+
+            Returns:
+                list of node IDs, in pre-order
+        """
+
+        i = self.pos.get(node_id)
+        if i is None:
+            return []
+        ids = self.ids
+        start = self.left[i] if inclusive else self.left[i] + 1
+        return [ids[d] for d in self.order[start:self.right[i]]]
+
 # END =========================================================================
@@ -26,6 +26,7 @@
 """
 
 __all__ = ("BooleanRepresent",
+           "RepresentCache",
            "S3Represent",
            "S3RepresentLazy",
            "S3PriorityRepresent",
@@ -47,16 +48,22 @@ __all__ = ("BooleanRepresent",
            "represent_option",
            )
 
+import hashlib
 import os
 import re
 import sys
+import threading
+import time
 
+from collections import OrderedDict
 from itertools import chain
 
 from gluon import current, A, DIV, I, IMG, IS_URL, SPAN, TAG, URL, XML
 from gluon.storage import Storage
 from gluon.languages import lazyT
 
+from s3dal import original_tablename
+
 from .convert import s3_str
 from .utils import MarkupStripper
 
@@ -77,11 +84,22 @@ class S3Represent:
                                           render_list
         @group Prototypes (to adapt in subclasses): lookup_rows,
                                                     represent_row,
-                                                    link
+                                                    link,
+                                                    cache_signature
         @group Internal Methods: _setup,
                                  _lookup
     """
 
+    # Instance attributes not relevant for the cache signature
+    VOLATILE = {"setup", "queries", "default", "none",
+                "custom_lookup", "custom_link", "lazy_show_link",
+                "slabels", "clabels", "htemplate", "signature",
+                }
+
+    # Other tables the representations depend on (when using the
+    # RepresentCache), i.e. changes in which invalidate the cache
+    cache_depends = ()
+
     def __init__(self,
                  lookup = None,
                  key = None,
@@ -95,7 +113,8 @@ class S3Represent:
                  hierarchy = False,
                  default = None,
                  none = None,
-                 field_sep = " "
+                 field_sep = " ",
+                 cache = False,
                  ):
         """
             Args:
@@ -118,6 +137,9 @@ class S3Represent:
                 default: default representation for unknown options
                 none: representation for empty fields (None or empty list)
                 field_sep: separator to use to join fields
+                cache: share the representations of looked-up rows across
+                       requests (requires the RepresentCache to be enabled
+                       in deployment settings)
         """
 
         self.tablename = lookup
@@ -134,6 +156,7 @@ class S3Represent:
         self.default = default
         self.none = none
         self.field_sep = field_sep
+        self.cache = cache
         self.setup = False
         self.theset = None
         self.queries = 0
@@ -146,6 +169,9 @@ class S3Represent:
         self.slabels = None
         self.htemplate = None
 
+        self.shared = None
+        self.signature = None
+
         # Attributes to simulate being a function for sqlhtml's count_expected_args()
         # Make sure we indicate only 1 position argument
         self.__code__ = Storage(co_argcount = 1)
@@ -154,6 +180,9 @@ class S3Represent:
         # Detect lookup_rows override
         self.custom_lookup = self.lookup_rows.__func__ is not S3Represent.lookup_rows
 
+        # Detect link override
+        self.custom_link = self.link.__func__ is not S3Represent.link
+
     # -------------------------------------------------------------------------
     def lookup_rows(self, key, values, fields=None):
         """
@@ -262,6 +291,39 @@ class S3Represent:
         else:
             return v
 
+    # -------------------------------------------------------------------------
+    def cache_signature(self):
+        """
+            Produces a signature of the configuration of this instance,
+            to distinguish its entries in the RepresentCache from those
+            of other represents for the same lookup table
+
+            Returns:
+                the signature (str)
+
+            Note:
+                The default signature covers all simple-typed instance
+                attributes; subclasses whose representations depend on
+                other parameters must override this method
+        """
+
+        config = [self.__class__.__module__, self.__class__.__name__]
+
+        labels = self.labels
+        if type(labels) is lazyT:
+            config.append(labels.m)
+        elif callable(labels):
+            config.append(getattr(labels, "__qualname__", repr(labels)))
+
+        volatile = self.VOLATILE
+        scalar = (str, bool, int, float, type(None))
+        for k, v in sorted(self.__dict__.items()):
+            if k not in volatile and isinstance(v, scalar):
+                config.append((k, v))
+        config.append(tuple(self.fields or ()))
+
+        return hashlib.sha1(repr(config).encode("utf-8")).hexdigest()
+
     # -------------------------------------------------------------------------
     def __call__(self, value, row=None, show_link=True):
         """
@@ -441,6 +503,17 @@ class S3Represent:
                               if v in labels else self.default
                               for v in value])
 
+    # -------------------------------------------------------------------------
+    def clear(self):
+        """
+            Discards all looked-up rows and their representations, e.g.
+            to release memory between the chunks of a large export
+        """
+
+        if self.options is None:
+            self.theset = {}
+        self.rows = {}
+
     # -------------------------------------------------------------------------
     def _setup(self):
         """ Lazy initialization of defaults """
@@ -499,6 +572,16 @@ class S3Represent:
         else:
             self.htemplate = "%s > %s"
 
+        # Shared representation cache (not for hierarchical representations,
+        # nor with custom links which need the looked-up rows)
+        if self.cache and self.table is not None and not self.hierarchy and \
+           not (self.show_link and self.custom_link):
+            shared = RepresentCache.instance()
+            if shared:
+                shared.register(self.table, depends=self.cache_depends)
+                self.shared = shared
+                self.signature = self.cache_signature()
+
         self.setup = True
 
     # -------------------------------------------------------------------------
@@ -538,6 +621,17 @@ class S3Represent:
         if table is None or not lookup:
             return items
 
+        # Check whether values are in the shared cache
+        shared = self.shared
+        if shared:
+            hits = shared.get(self.tablename, self.signature, list(lookup))
+            for k, v in hits.items():
+                del lookup[k]
+                items[keys.get(k, k)] = theset[k] = v
+            if not lookup:
+                return items
+            represented = {}
+
         if table and self.hierarchy:
             # Does the lookup table have a hierarchy?
             from ..tools import S3Hierarchy
@@ -584,6 +678,8 @@ class S3Represent:
                                                    )
                     else:
                         theset[k] = represent_row(row)
+                        if shared:
+                            represented[k] = theset[k]
                 if pop(k, None):
                     items[keys.get(k, k)] = theset[k]
 
@@ -615,6 +711,12 @@ class S3Represent:
                 for k, row in rows.items():
                     lookup.pop(k, None)
                     items[keys.get(k, k)] = theset[k] = represent_row(row)
+                if shared:
+                    represented.update((k, theset[k]) for k in rows)
+
+        # Share the new representations
+        if shared and represented:
+            shared.put(self.tablename, self.signature, represented)
 
         # Anything left gets set to default
         if lookup:
@@ -660,6 +762,443 @@ class S3Represent:
         theset[value] = result
         return result
 
+# =============================================================================
+class RepresentCache:
+    """
+        Process-wide cache for the representations of looked-up rows
+        (S3Represent with cache=True), shared across requests
+
+        - entries are keyed by lookup table, represent signature, language
+          and value, evicted least-recently-used beyond the configured size,
+          and expire after the configured time
+        - all entries for a lookup table are invalidated (generation counter)
+          when records in that table are updated or deleted, or when records
+          in tables the representations depend on are created, updated or
+          deleted (S3Represent.cache_depends)
+        - hit/miss statistics are collected per lookup table
+
+        Deployment settings:
+            base.represent_cache: True to use a process-local LRU store,
+                                  or the name of a web2py cache model
+                                  (e.g. "disk", "redis") to use as store
+            base.represent_cache_size: max number of entries (LRU store)
+            base.represent_cache_expire: time (seconds) entries remain valid
+    """
+
+    # The process-wide instance
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    # Lookup tables with represents using the cache
+    tables = set()
+
+    # Tables the representations depend on, {tablename: {lookup tablename}}
+    dependencies = {}
+
+    def __init__(self, size=5000, expire=300):
+        """
+            Args:
+                size: the maximum number of entries
+                expire: the time (seconds) entries remain valid
+        """
+
+        self.size = size
+        self.expire = expire
+
+        self.entries = OrderedDict()
+        self.generations = {}
+        self.stats = {}
+
+        self.lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def instance(cls):
+        """
+            Returns the process-wide instance, if enabled
+
+            Returns:
+                the RepresentCache instance, or None if disabled
+        """
+
+        settings = current.deployment_settings
+
+        mode = settings.get_base_represent_cache()
+        if not mode:
+            return None
+
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    size = settings.get_base_represent_cache_size()
+                    expire = settings.get_base_represent_cache_expire()
+                    if isinstance(mode, str):
+                        instance = RepresentCacheStore(mode, size=size, expire=expire)
+                    else:
+                        instance = cls(size=size, expire=expire)
+                    cls._instance = instance
+        return instance
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def register(cls, table, depends=None):
+        """
+            Registers a lookup table, attaching the invalidation hooks
+
+            Args:
+                table: the lookup Table
+                depends: names of other tables the representations depend
+                         on, changes in which also invalidate the entries
+                         for the lookup table
+        """
+
+        tablename = original_tablename(table)
+        cls.tables.add(tablename)
+        cls.attach(table)
+
+        if depends:
+            db = current.db
+            for dependency in depends:
+                lookups = cls.dependencies.get(dependency)
+                if lookups is None:
+                    lookups = cls.dependencies[dependency] = set()
+                lookups.add(tablename)
+                cls.tables.add(dependency)
+                if dependency in db:
+                    cls.attach(db[dependency])
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def attach(cls, table):
+        """
+            Attaches the invalidation hooks to a Table instance; called
+            when a registered table is (re-)defined, so that updates and
+            deletions invalidate the cache regardless which represents
+            the current request has set up
+
+            Args:
+                table: the Table
+        """
+
+        if getattr(table, "_represent_cache", False):
+            return
+
+        tablename = original_tablename(table)
+        if tablename not in cls.tables:
+            return
+
+        def invalidate(*args):
+            instance = cls._instance
+            if instance:
+                instance.invalidate(tablename)
+                for lookup in cls.dependencies.get(tablename, ()):
+                    instance.invalidate(lookup)
+            # Never prevent the DB operation
+            return False
+
+        def invalidate_dependent(*args):
+            # New records in a dependency can change existing
+            # representations too (e.g. link tables)
+            instance = cls._instance
+            if instance:
+                for lookup in cls.dependencies.get(tablename, ()):
+                    instance.invalidate(lookup)
+            return False
+
+        table._after_insert.append(invalidate_dependent)
+        table._after_update.append(invalidate)
+        table._after_delete.append(invalidate)
+        table._represent_cache = True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def language():
+        """
+            The language of the current request
+        """
+
+        return current.T.accepted_language
+
+    # -------------------------------------------------------------------------
+    def count(self, tablename, hits, misses):
+        """
+            Updates the hit/miss statistics for a lookup table
+
+            Args:
+                tablename: the lookup table name
+                hits: number of hits
+                misses: number of misses
+        """
+
+        with self.lock:
+            stats = self.stats.get(tablename)
+            if stats is None:
+                stats = self.stats[tablename] = [0, 0]
+            stats[0] += hits
+            stats[1] += misses
+
+    # -------------------------------------------------------------------------
+    def get(self, tablename, signature, values):
+        """
+            Looks up representations in the cache
+
+            Args:
+                tablename: the lookup table name
+                signature: the represent signature
+                values: the values (keys in the lookup table)
+
+            Returns:
+                a dict {value: representation} for all values found
+        """
+
+        language = self.language()
+        now = time.time()
+
+        hits = {}
+        with self.lock:
+            generation = self.generations.get(tablename, 0)
+            entries = self.entries
+            for value in values:
+                key = (tablename, generation, signature, language, value)
+                entry = entries.get(key)
+                if entry is None:
+                    continue
+                if entry[1] < now:
+                    del entries[key]
+                    continue
+                entries.move_to_end(key)
+                hits[value] = entry[0]
+
+        self.count(tablename, len(hits), len(values) - len(hits))
+        return hits
+
+    # -------------------------------------------------------------------------
+    def put(self, tablename, signature, items):
+        """
+            Adds representations to the cache
+
+            Args:
+                tablename: the lookup table name
+                signature: the represent signature
+                items: a dict {value: representation}
+        """
+
+        language = self.language()
+        expires = time.time() + self.expire
+
+        items = self.cacheable(items)
+
+        with self.lock:
+            generation = self.generations.get(tablename, 0)
+            entries = self.entries
+            for value, represent in items.items():
+                key = (tablename, generation, signature, language, value)
+                entries[key] = (represent, expires)
+                entries.move_to_end(key)
+            while len(entries) > self.size:
+                entries.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def cacheable(items):
+        """
+            Filters representations that can be shared across requests,
+            i.e. strings (translations resolved in the current language)
+
+            Args:
+                items: a dict {value: representation}
+
+            Returns:
+                a dict {value: str}
+        """
+
+        cacheable = {}
+        for value, represent in items.items():
+            if type(represent) is lazyT:
+                cacheable[value] = s3_str(represent)
+            elif isinstance(represent, str):
+                cacheable[value] = represent
+        return cacheable
+
+    # -------------------------------------------------------------------------
+    def invalidate(self, tablename):
+        """
+            Invalidates all cached representations for a lookup table
+
+            Args:
+                tablename: the lookup table name
+        """
+
+        with self.lock:
+            generations = self.generations
+            generations[tablename] = generations.get(tablename, 0) + 1
+
+            # Drop stale entries
+            stale = [key for key in self.entries if key[0] == tablename]
+            for key in stale:
+                del self.entries[key]
+
+    # -------------------------------------------------------------------------
+    def clear(self):
+        """
+            Removes all entries and resets the statistics
+        """
+
+        with self.lock:
+            self.entries.clear()
+            self.stats.clear()
+
+    # -------------------------------------------------------------------------
+    def statistics(self):
+        """
+            Hit/miss statistics for this process
+
+            Returns:
+                a dict {tablename: Storage(hits, misses, ratio)},
+                ordered by number of lookups (descending)
+        """
+
+        with self.lock:
+            stats = sorted(self.stats.items(),
+                           key = lambda item: item[1][0] + item[1][1],
+                           reverse = True,
+                           )
+
+        output = OrderedDict()
+        for tablename, (hits, misses) in stats:
+            total = hits + misses
+            output[tablename] = Storage(hits = hits,
+                                        misses = misses,
+                                        ratio = float(hits) / total if total else 0.0,
+                                        )
+        return output
+
+# =============================================================================
+class RepresentCacheStore(RepresentCache):
+    """
+        RepresentCache using a web2py cache model (e.g. cache.disk or
+        cache.redis) as store, to share entries between processes
+    """
+
+    def __init__(self, model, size=5000, expire=300):
+        """
+            Args:
+                model: the name of the web2py cache model
+                size: the maximum number of entries (unused)
+                expire: the time (seconds) entries remain valid
+        """
+
+        super().__init__(size=size, expire=expire)
+
+        self.model = model
+
+    # -------------------------------------------------------------------------
+    @property
+    def store(self):
+        """
+            The cache model (accessed per request)
+        """
+
+        return getattr(current.cache, self.model)
+
+    # -------------------------------------------------------------------------
+    def generation(self, tablename):
+        """
+            The current generation of entries for a lookup table
+
+            Args:
+                tablename: the lookup table name
+        """
+
+        return self.store("represent_gen_%s" % tablename, lambda: 0, None)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def key(tablename, generation, signature, language, value):
+        """
+            Produces a store key for an entry
+        """
+
+        return "represent_%s" % hashlib.sha1(repr((tablename,
+                                                    generation,
+                                                    signature,
+                                                    language,
+                                                    value,
+                                                    )).encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    def get(self, tablename, signature, values):
+        """
+            Looks up representations in the cache
+
+            Args:
+                tablename: the lookup table name
+                signature: the represent signature
+                values: the values (keys in the lookup table)
+
+            Returns:
+                a dict {value: representation} for all values found
+        """
+
+        store = self.store
+        language = self.language()
+        generation = self.generation(tablename)
+
+        hits = {}
+        for value in values:
+            key = self.key(tablename, generation, signature, language, value)
+            represent = store(key, lambda: None, self.expire)
+            if represent is not None:
+                hits[value] = represent
+
+        self.count(tablename, len(hits), len(values) - len(hits))
+        return hits
+
+    # -------------------------------------------------------------------------
+    def put(self, tablename, signature, items):
+        """
+            Adds representations to the cache
+
+            Args:
+                tablename: the lookup table name
+                signature: the represent signature
+                items: a dict {value: representation}
+        """
+
+        store = self.store
+        language = self.language()
+        generation = self.generation(tablename)
+
+        for value, represent in self.cacheable(items).items():
+            key = self.key(tablename, generation, signature, language, value)
+            store(key, lambda r=represent: r, 0)
+
+    # -------------------------------------------------------------------------
+    def invalidate(self, tablename):
+        """
+            Invalidates all cached representations for a lookup table
+
+            Args:
+                tablename: the lookup table name
+        """
+
+        store = self.store
+        key = "represent_gen_%s" % tablename
+        store(key, lambda: 0, None)
+        store.increment(key)
+
+    # -------------------------------------------------------------------------
+    def clear(self):
+        """
+            Removes all entries and resets the statistics
+        """
+
+        self.store.clear(regex=r"^represent_")
+        with self.lock:
+            self.stats.clear()
+
 # =============================================================================
 class S3RepresentLazy:
     """
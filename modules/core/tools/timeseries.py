@@ -37,12 +37,14 @@ import datetime
 import dateutil.tz
 import re
 
+from heapq import heappop, heappush
 from dateutil.relativedelta import relativedelta
 from dateutil.rrule import DAILY, HOURLY, MONTHLY, WEEKLY, YEARLY, rrule
 
 from gluon import current
 from gluon.storage import Storage
 
+from .aggregate import GroupedAggregate
 from .calendar import s3_decode_iso_datetime, s3_utc
 from .utils import MarkupStripper, s3_flatlist, s3_represent_value, s3_str
 
@@ -818,6 +820,17 @@ class TimeSeries:
 class TimeSeriesEvent:
     """ A single event in a time series """
 
+    # Events are created per record, so avoid a per-instance __dict__
+    __slots__ = ("event_id",
+                 "start",
+                 "end",
+                 "values",
+                 "row",
+                 "col",
+                 "_rows",
+                 "_cols",
+                 )
+
     def __init__(self,
                  event_id,
                  start = None,
@@ -1325,7 +1338,7 @@ class TimeSeriesFact:
 class TimeSeriesEventFrame:
     """ The time frame of a time series """
 
-    def __init__(self, start, end, slots=None):
+    def __init__(self, start, end, slots=None, events=None):
         """
             Args:
                 start: start of the time frame (datetime.datetime)
@@ -1333,6 +1346,7 @@ class TimeSeriesEventFrame:
                 slot: length of time slots within the event frame,
                       format: "{n }[hour|day|week|month|year]{s}",
                       examples: "1 week", "3 months", "years"
+                events: iterable of events to extend the frame with
         """
 
         # Start time is required
@@ -1353,6 +1367,9 @@ class TimeSeriesEventFrame:
 
         self.rule = self.get_rule()
 
+        if events:
+            self.extend(events)
+
     # -------------------------------------------------------------------------
     def get_rule(self):
         """
@@ -1373,82 +1390,109 @@ class TimeSeriesEventFrame:
             Args:
                 events: iterable of events
 
-            TODO integrate in constructor
+            Note:
+                Sweeps once over the periods and the events (ordered by
+                start date), keeping the current events in a heap ordered
+                by end date - so every event is handled only when it
+                starts and when it ends, rather than once per period
+
             TODO handle self.rule == None
         """
 
         if not events:
             return
-        empty = self.empty
 
-        # Order events by start datetime
-        events = sorted(events)
+        # Order events by start datetime (events without start first)
+        events = sorted(events,
+                        key = lambda e: (e.start is not None, e.start),
+                        )
 
-        rule = self.rule
         periods = self.periods
 
         # No point to loop over periods before the first event:
+        rule = self.rule
         start = events[0].start
         if start is None or start <= self.start:
-            first = rule[0]
+            first = None
         else:
             first = rule.before(start, inc=True)
 
+        num_events = len(events)
+        index = 0
+
         current_events = {}
-        previous_events = {}
-        for start in rule.between(first, self.end, inc=True):
-
-            # Compute end of this period
-            end = rule.after(start)
-            if not end:
-                if start < self.end:
-                    end = self.end
-                else:
-                    # Period start is at the end of the event frame
+        previous_events = []
+        ending = []
+
+        for start, end in self.bounds(first=first):
+
+            # Events which ended before this period, are previous events now
+            while ending and ending[0][0] <= start:
+                event = heappop(ending)[2]
+                event_id = event.event_id
+                if current_events.get(event_id) is event:
+                    del current_events[event_id]
+                    previous_events.append(event)
+
+            # Add all events which start before the end of this period
+            while index < num_events:
+                event = events[index]
+                event_start = event.start
+                if event_start is not None and event_start >= end:
+                    # Event starts only after this period
                     break
-
-            # Find all current events
-            last_index = None
-            for index, event in enumerate(events):
-                last_index = index
-                if event.end and event.end < start:
+                event_end = event.end
+                if event_end is not None and event_end < start:
                     # Event ended before this period
-                    previous_events[event.event_id] = event
-                elif event.start is None or event.start < end:
-                    # Event starts before or during this period
-                    current_events[event.event_id] = event
+                    previous_events.append(event)
                 else:
-                    # Event starts only after this period
-                    break
+                    current_events[event.event_id] = event
+                    if event_end is not None:
+                        heappush(ending, (event_end, index, event))
+                index += 1
 
-            # Add current events to current period
+            # Add current and previous events to this period
             period = periods.get(start)
             if period is None:
                 period = periods[start] = TimeSeriesPeriod(start, end=end)
-            for event in current_events.values():
-                period.add_current(event)
-            for event in previous_events.values():
-                period.add_previous(event)
+            period.cevents.update(current_events)
+            period.add_previous_events(previous_events, len(previous_events))
 
-            empty = False
+            self.empty = False
 
-            # Remaining events
-            events = events[last_index:] if last_index is not None else None
-            if not events:
-                # No more events
-                break
+    # -------------------------------------------------------------------------
+    def bounds(self, first=None):
+        """
+            Generate the start and end dates of all periods in this
+            event frame
 
-            # Remove events which end during this period
-            remaining = {}
-            for event_id, event in current_events.items():
-                if not event.end or event.end > end:
-                    remaining[event_id] = event
-                else:
-                    previous_events[event_id] = event
-            current_events = remaining
+            Args:
+                first: start with the period starting at this date
+                       (must be a recurrence of the rule), default is
+                       the first period
 
-        self.empty = empty
-        return
+            Returns:
+                generator of tuples (start, end)
+        """
+
+        rule = self.rule
+        end = self.end
+
+        if first is None:
+            dates = iter(rule)
+        else:
+            dates = rule.between(first, end, inc=True)
+
+        previous = None
+        for dt in dates:
+            if previous is not None:
+                yield previous, dt
+            if dt >= end:
+                previous = None
+                break
+            previous = dt
+        if previous is not None:
+            yield previous, end
 
     # -------------------------------------------------------------------------
     def __iter__(self):
@@ -1460,16 +1504,11 @@ class TimeSeriesEventFrame:
 
         rule = self.rule
         if rule:
-            for dt in rule:
-                if dt >= self.end:
-                    break
-                if dt in periods:
-                    yield periods[dt]
+            for start, end in self.bounds():
+                if start in periods:
+                    yield periods[start]
                 else:
-                    end = rule.after(dt)
-                    if not end:
-                        end = self.end
-                    yield TimeSeriesPeriod(dt, end=end)
+                    yield TimeSeriesPeriod(start, end=end)
         else:
             # @todo: continuous periods
             # sort actual periods and iterate over them
@@ -1492,7 +1531,8 @@ class TimeSeriesPeriod:
         self.end = tp_tzsafe(end)
 
         # Event sets
-        self.pevents = {}
+        self._pevents = {}
+        self._previous = []
         self.cevents = {}
 
         self._matrix = None
@@ -1539,6 +1579,44 @@ class TimeSeriesPeriod:
 
         self.pevents[event.event_id] = event
 
+    # -------------------------------------------------------------------------
+    def add_previous_events(self, events, count):
+        """
+            Add the first events of a list as previous events to this
+            period; the list is only read when the previous events are
+            accessed, and can be shared between periods (so must only
+            be appended to)
+
+            Args:
+                events: list of TimeSeriesEvents
+                count: the number of events in the list to add
+        """
+
+        if count:
+            self._previous.append((events, count))
+
+    # -------------------------------------------------------------------------
+    @property
+    def pevents(self):
+        """
+            The previous events in this period
+
+            Returns:
+                dict {event_id: TimeSeriesEvent}
+        """
+
+        pevents = self._pevents
+
+        previous = self._previous
+        if previous:
+            for events, count in previous:
+                for index in range(count):
+                    event = events[index]
+                    pevents[event.event_id] = event
+            self._previous = []
+
+        return pevents
+
     # -------------------------------------------------------------------------
     def as_dict(self, rows=None, cols=None, isoformat=True):
         """
@@ -1665,6 +1743,18 @@ class TimeSeriesPeriod:
                 events = self.cevents
                 cumulative = False
 
+            # Aggregate all rows, columns and cells at once, if possible
+            grouped = None if cumulative else self.aggregate_grouped(fact)
+            if grouped:
+                for results, target in zip(grouped[:3], (rows, cols, matrix)):
+                    for key, value in results.items():
+                        if key not in target:
+                            target[key] = [value]
+                        else:
+                            target[key].append(value)
+                totals.append(grouped[3])
+                continue
+
             aggregate = fact.aggregate
 
             # Aggregate rows
@@ -1706,6 +1796,62 @@ class TimeSeriesPeriod:
         self.totals = totals
         return totals
 
+    # -------------------------------------------------------------------------
+    def aggregate_grouped(self, fact):
+        """
+            Aggregate a (non-cumulative) fact for all rows, columns and
+            cells of this period with grouped reductions, equivalent to
+            calling fact.aggregate for each of them
+
+            Args:
+                fact: the TimeSeriesFact
+
+            Returns:
+                tuple (rows, cols, matrix, total), with rows, cols and
+                matrix as dicts {key: value}; or None if the fact cannot
+                be aggregated this way (e.g. NumPy not installed)
+        """
+
+        method = fact.method
+        base = fact.base_column
+        if method == "cumulate" or not base or \
+           not GroupedAggregate.supports(method):
+            return None
+
+        events = self.cevents
+        event_ids = list(events.keys())
+
+        grouped = GroupedAggregate([events[event_id][base]
+                                    for event_id in event_ids],
+                                   strict = True,
+                                   )
+        if not grouped.valid:
+            return None
+        index = {event_id: i for i, event_id in enumerate(event_ids)}
+
+        def compute(event_sets):
+            keys = list(event_sets.keys())
+            items, groups = [], []
+            for group, key in enumerate(keys):
+                ids = event_sets[key][0]
+                items.extend(index[event_id] for event_id in ids)
+                groups.extend([group] * len(ids))
+            results = grouped.compute(method, items, groups, len(keys))
+            return dict(zip(keys, results))
+
+        num_events = len(event_ids)
+        total = grouped.compute(method,
+                                list(range(num_events)),
+                                [0] * num_events,
+                                1,
+                                )[0]
+
+        return (compute(self._rows),
+                compute(self._cols),
+                compute(self._matrix),
+                total,
+                )
+
     # -------------------------------------------------------------------------
     def duration(self, event, interval):
         """
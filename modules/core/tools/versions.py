@@ -0,0 +1,151 @@
+"""
+    Table Version Counters
+
+    Copyright: 2022 (c) Sahana Software Foundation
+
+    Permission is hereby granted, free of charge, to any person
+    obtaining a copy of this software and associated documentation
+    files (the "Software"), to deal in the Software without
+    restriction, including without limitation the rights to use,
+    copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following
+    conditions:
+
+    The above copyright notice and this permission notice shall be
+    included in all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+    EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+    OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+    NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+    WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+    OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+__all__ = ("TableVersion",
+           )
+
+from gluon import current
+
+from s3dal import original_tablename
+
+# =============================================================================
+class TableVersion:
+    """
+        Version counters for the contents of database tables, to key
+        caches of data looked up from these tables; a cheap alternative
+        to querying the tables for their latest modification
+
+        - the counter of a table is incremented by DAL hooks whenever
+          records in the table are inserted, updated or deleted
+        - tables must be registered for counting, the hooks are attached
+          when a registered table is (re-)defined (DataModel.define_table)
+        - the counters are kept in a web2py cache model (setting
+          base.table_version_store), and are thus process-local unless
+          a shared model (e.g. "redis") is configured; caches keyed by
+          the counters should therefore expire after some time, so that
+          writes in other processes (or by raw SQL) are picked up as well
+    """
+
+    # Tables with version counters
+    tables = set()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def register(cls, tablenames):
+        """
+            Registers tables for counting, attaching the hooks to those
+            already defined in the current request
+
+            Args:
+                tablenames: iterable of table names
+        """
+
+        db = current.db
+        for tablename in tablenames:
+            cls.tables.add(tablename)
+            if tablename in db:
+                cls.attach(db[tablename])
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def attach(cls, table):
+        """
+            Attaches the counter hooks to a Table instance
+
+            Args:
+                table: the Table
+        """
+
+        if getattr(table, "_table_version", False):
+            return
+
+        tablename = original_tablename(table)
+        if tablename not in cls.tables:
+            return
+
+        def increment(*args):
+            cls.increment(tablename)
+            # Never prevent the DB operation
+            return False
+
+        table._after_insert.append(increment)
+        table._after_update.append(increment)
+        table._after_delete.append(increment)
+        table._table_version = True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def store():
+        """
+            The cache model holding the counters (accessed per request)
+        """
+
+        model = current.deployment_settings.get_base_table_version_store()
+        return getattr(current.cache, model)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def increment(cls, tablename):
+        """
+            Increments the version counter of a table
+
+            Args:
+                tablename: the table name
+        """
+
+        store = cls.store()
+        key = "table_version_%s" % tablename
+        store(key, lambda: 0, None)
+        store.increment(key)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def token(cls, tablenames):
+        """
+            Gets a version token for the contents of tables (registering
+            them for counting as necessary)
+
+            Args:
+                tablenames: iterable of table names
+
+            Returns:
+                the version token (string)
+        """
+
+        tablenames = sorted(set(tablenames))
+        cls.register(tablenames)
+
+        store = cls.store()
+        tokens = []
+        for tablename in tablenames:
+            version = store("table_version_%s" % tablename, lambda: 0, None)
+            tokens.append("%s:%s" % (tablename, version))
+
+        return ",".join(tokens)
+
+# END =========================================================================
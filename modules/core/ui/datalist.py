@@ -91,6 +91,10 @@ class S3DataList:
         self.limit = limit if limit else 0
         self.total = total if total else 0
 
+        # Keyset pagination cursor for the next page
+        # - set by CRUDResource.datalist
+        self.cursor = None
+
     # ---------------------------------------------------------------------
     def html(self,
              start=None,
@@ -191,6 +195,14 @@ class S3DataList:
 
                 items.append(row)
                 row_idx += 1
+
+            # Attach the keyset pagination cursor to the last row
+            cursor = self.cursor
+            if cursor and cursor.get("key") and len(items) and \
+               hasattr(items[-1], "update"):
+                items[-1].update(**{"_data-cursor": cursor["key"],
+                                    "_data-cursor-start": cursor["start"],
+                                    })
         else:
             # template
             raise NotImplementedError
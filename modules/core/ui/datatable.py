@@ -76,6 +76,10 @@ class DataTable:
         self._orderby = orderby
         self.dt_ordering = None
 
+        # Keyset pagination cursor for the next page
+        # - set by CRUDResource.datatable
+        self.cursor = None
+
     # -------------------------------------------------------------------------
     @property
     def orderby(self):
@@ -607,6 +611,10 @@ class DataTable:
                   "draw": draw,
                   }
 
+        cursor = self.cursor
+        if cursor and cursor.get("key"):
+            output["cursor"] = cursor
+
         if stringify:
             output = jsons(output)
 
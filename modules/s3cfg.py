@@ -1043,6 +1043,15 @@ class S3Config(Storage):
         """
         return self.security.get("strict_ownership", True)
 
+    def get_security_acl_cache(self):
+        """
+            Cache applicable ACLs across requests, for this number of
+            seconds (0 to disable); entries are invalidated whenever
+            ACLs or OU affiliations change (in other processes only
+            with a shared base.table_version_store)
+        """
+        return self.security.get("acl_cache", 0)
+
     def get_security_map(self):
         return self.security.get("map", False)
 
@@ -1078,6 +1087,14 @@ class S3Config(Storage):
         """
         return self.base.get("models")
 
+    def get_base_model_profile(self):
+        """
+            Record the run time of model loads, and log a report of the
+            model load cost per module after loading all models
+            - see DataModel.profile_report()
+        """
+        return self.base.get("model_profile", False)
+
     def get_base_rest_controllers(self):
         """
             Re-routed RESTful CRUD controllers
@@ -1109,6 +1126,25 @@ class S3Config(Storage):
         """
         return self.base.get("import_handlers")
 
+    def get_base_import_chunk_size(self):
+        """
+            Transform CSV/XLS/XLSX imports in chunks of this number of rows
+            (None or 0 to transform all rows at once), reduces the memory
+            required for large imports
+            - the stylesheet must transform rows independently, and must
+              only use name-based tuids to refer to other resources
+        """
+        return self.base.get("import_chunk_size")
+
+    def get_base_import_workers(self):
+        """
+            Number of worker processes to transform import chunks in
+            parallel (requires import_chunk_size)
+            - worker processes are forked, so this should only be used
+              for CLI/scheduler imports, not in the web server process
+        """
+        return self.base.get("import_workers", 1)
+
     def get_base_public_url(self):
         """
             The public URL for the site
@@ -1139,6 +1175,47 @@ class S3Config(Storage):
       """
         return self.base.get("bigtable", False)
 
+    def get_base_represent_cache(self):
+        """
+            Share representations of foreign keys across requests
+            (for S3Represent instances with cache=True)
+            - True to use a process-local store
+            - name of a web2py cache model (e.g. "disk") to use as store
+        """
+        return self.base.get("represent_cache", False)
+
+    def get_base_represent_cache_size(self):
+        """
+            Maximum number of entries in the (process-local) represent cache
+        """
+        return self.base.get("represent_cache_size", 5000)
+
+    def get_base_represent_cache_expire(self):
+        """
+            Time (seconds) entries in the represent cache remain valid
+        """
+        return self.base.get("represent_cache_expire", 300)
+
+    def get_base_table_version_store(self):
+        """
+            Name of the web2py cache model to keep table version counters
+            in (e.g. for the filter options cache), "ram" for process-local
+            counters, or a shared model (e.g. "redis") to detect writes
+            across processes
+        """
+        return self.base.get("table_version_store", "ram")
+
+    def get_base_export_chunk_size(self):
+        """
+            Extract the data for CSV, JSON and XLSX exports in chunks of
+            this size (keyset-paginated), writing the output incrementally
+            to a temporary file which is then streamed to the client
+            - keeps memory use flat for very large exports
+            - records are then exported in primary key order
+            - None to disable
+        """
+        return self.base.get("export_chunk_size")
+
     def get_base_cdn(self):
         """
             Should we use CDNs (Content Distribution Networks) to serve some common CSS/JS?
@@ -1391,6 +1468,15 @@ class S3Config(Storage):
         """
         return self.fin.get("voucher_claim_paid_label", "Paid")
 
+    def get_fin_voucher_billing_batch_size(self):
+        """
+            Generate claims in billing processes in batches of this size,
+            with claim post-processing (including invoice generation) in
+            parallel scheduler tasks per batch
+            - None or 0 to generate and post-process claims one by one
+        """
+        return self.fin.get("voucher_billing_batch_size")
+
     # -------------------------------------------------------------------------
     # GIS (Map) Settings
     #
@@ -1810,6 +1896,14 @@ class S3Config(Storage):
         else:
             return self.gis.get("spatialdb", False)
 
+    def get_gis_spatial_index(self):
+        """
+            Use an in-process spatial index (requires Shapely) to look up
+            features by location bounds, if the database has no spatial
+            extensions (see get_gis_spatialdb)
+        """
+        return self.gis.get("spatial_index", False)
+
     def get_gis_widget_catalogue_layers(self):
         """
             Should Map Widgets display Catalogue Layers?
@@ -2200,6 +2294,17 @@ class S3Config(Storage):
 
         return self.ui.get("datatables_pagelength", 25)
 
+    def get_ui_keyset_pagination(self):
+        """
+            Use keyset ("seek") pagination for Ajax-pagination of
+            datatables and datalists where the ordering allows it,
+            i.e. select the next page relative to the last record
+            delivered rather than skipping all preceding records
+            - faster for deep pages in large tables
+        """
+
+        return self.ui.get("keyset_pagination", False)
+
     def get_ui_datatables_initComplete(self):
         """
             Callback for dataTables
@@ -2553,6 +2658,16 @@ class S3Config(Storage):
         """
         return self.ui.get("report_timeout", 10000)
 
+    def get_ui_report_groupby(self):
+        """
+            Aggregate pivot table reports in the database (GROUP BY) where
+            axes and facts allow - much faster for large tables, but cell
+            drill-down (list of contributing records) is not available,
+                - can be overridden per table with the "report_groupby"
+                  table setting
+        """
+        return self.ui.get("report_groupby", False)
+
     def get_ui_use_button_icons(self):
         """
             Use icons on action buttons (requires corresponding CSS)
@@ -2816,6 +2931,15 @@ class S3Config(Storage):
         """
         return self.search.get("dates_auto_range", False)
 
+    def get_search_filter_options_cache(self):
+        """
+            Cache looked-up options of options filters across requests,
+            for this number of seconds (0 to disable); entries expire
+            when any of the tables involved in the lookup is written to
+            (see base.table_version_store)
+        """
+        return self.search.get("filter_options_cache", 0)
+
     # Filter Manager Widget
     def get_search_filter_manager(self):
         """ Enable the filter manager widget """
@@ -3643,6 +3767,14 @@ class S3Config(Storage):
         """
         return self.disease.get("testing_report_by_demographic", False)
 
+    def get_disease_testing_report_aggregates(self):
+        """
+            Maintain materialized aggregates of testing reports (per
+            L2/L3 and disease, and day) to speed up pivot table reports
+            - requires a scheduler task to build them
+        """
+        return self.disease.get("testing_report_aggregates", False)
+
     # -------------------------------------------------------------------------
     # Doc Options
     #
@@ -5311,6 +5443,16 @@ class S3Config(Storage):
         """
         return self.pr.get("multiple_case_groups", False)
 
+    def get_pr_affiliation_closure(self):
+        """
+            Whether to maintain a closure table of person entity affiliations
+            (pr_affiliation_closure), and use it to look up ancestors and
+            descendants of person entities with a single query
+            - requires a rebuild of the closure table when enabled for an
+              existing database (static/scripts/tools/pr_rebuild_closure.py)
+        """
+        return self.pr.get("affiliation_closure", False)
+
     # -------------------------------------------------------------------------
     # Proc
     #
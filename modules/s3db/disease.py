@@ -569,6 +569,23 @@ class DiseaseMonitoringModel(DataModel):
                   timeplot_options = timeplot_options,
                   )
 
+        # Materialized report aggregates
+        if settings.get_disease_testing_report_aggregates():
+            aggregate_facts = ["sum(tests_total)",
+                               "sum(tests_positive)",
+                               "count(id)",
+                               ]
+            configure(tablename,
+                      report_aggregates = [{"rows": level,
+                                            "cols": "disease_id",
+                                            "facts": aggregate_facts,
+                                            "partition": "date",
+                                            } for level in ("site_id$location_id$L2",
+                                                            "site_id$location_id$L3",
+                                                            )],
+                      )
+            PivotTableAggregates.attach(db[tablename])
+
         # CRUD Strings
         crud_strings[tablename] = Storage(
             label_create = T("Create Daily Report"),
@@ -33,13 +33,19 @@ __all__ = ("FinExpensesModel",
            "fin_voucher_permitted_programs",
            "fin_voucher_eligibility_types",
            "fin_voucher_start_billing",
+           "fin_voucher_process_claims",
            "fin_voucher_settle_invoice",
+           "fin_voucher_create_indexes",
            )
 
+import time
+
 from collections import OrderedDict
+from uuid import uuid4
 
 from gluon import *
 from ..core import *
+from s3dal import Expression
 
 # =============================================================================
 class FinExpensesModel(DataModel):
@@ -160,6 +166,8 @@ class FinVoucherModel(DataModel):
              "fin_voucher",
              "fin_voucher_debit",
              "fin_voucher_transaction",
+             "fin_voucher_checkpoint",
+             "fin_voucher_chain",
              )
 
     def model(self):
@@ -304,6 +312,7 @@ class FinVoucherModel(DataModel):
 
         # Table Configuration
         self.configure(tablename,
+                       create_onaccept = self.program_create_onaccept,
                        list_fields = list_fields,
                        )
 
@@ -397,6 +406,16 @@ class FinVoucherModel(DataModel):
                            represent = s3_text_represent,
                            writable = False,
                            ),
+                     Field("claims_total", "integer",
+                           label = T("Number of Claims"),
+                           default = 0,
+                           writable = False,
+                           ),
+                     Field("claims_processed", "integer",
+                           label = T("Claims processed"),
+                           default = 0,
+                           writable = False,
+                           ),
                      Field("task_id", "reference scheduler_task",
                            ondelete = "SET NULL",
                            readable = False,
@@ -1183,6 +1202,52 @@ class FinVoucherModel(DataModel):
             msg_list_empty = T("No Transactions currently registered"),
         )
 
+        # -------------------------------------------------------------------------
+        # Verification checkpoint
+        # - the last transaction of a voucher program up to which the
+        #   transaction chain has been verified, so that verification
+        #   need only walk through subsequent transactions
+        #
+        tablename = "fin_voucher_checkpoint"
+        define_table(tablename,
+                     Field("program_id", "reference fin_voucher_program",
+                           ondelete = "CASCADE",
+                           ),
+                     Field("transaction_id", "reference fin_voucher_transaction",
+                           ondelete = "CASCADE",
+                           ),
+                     Field("tuuid", length=128),
+                     Field("created_on", "datetime"),
+                     Field("vhash", "text"),
+                     Field("transactions", "integer",
+                           default = 0,
+                           ),
+                     Field("verified_on", "datetime"),
+                     meta = False,
+                     )
+
+        # -------------------------------------------------------------------------
+        # Transaction chain head
+        # - the last transaction of a voucher program, so that new transactions
+        #   can be appended to the chain without looking up the latest
+        #   transaction; the version is incremented with every append, and
+        #   serves to detect (and retry) concurrent appends
+        #
+        tablename = "fin_voucher_chain"
+        define_table(tablename,
+                     Field("program_id", "reference fin_voucher_program",
+                           ondelete = "CASCADE",
+                           unique = True,
+                           ),
+                     Field("tuuid", length=128),
+                     Field("vhash", "text"),
+                     Field("version", "integer",
+                           default = 0,
+                           notnull = True,
+                           ),
+                     meta = False,
+                     )
+
         # ---------------------------------------------------------------------
         # Pass names back to global scope (s3.*)
         #
@@ -1201,6 +1266,21 @@ class FinVoucherModel(DataModel):
                 "fin_voucher_billing_status_opts": {},
                 }
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def program_create_onaccept(form):
+        """
+            Onaccept of new voucher program:
+            - create the head of the transaction chain
+
+            Args:
+                form: the FORM
+        """
+
+        record_id = get_form_record_id(form)
+        if record_id:
+            fin_VoucherProgram.create_chain_head(record_id)
+
     # -------------------------------------------------------------------------
     @staticmethod
     def billing_onvalidation(form):
@@ -2122,6 +2202,10 @@ class fin_VoucherProgram:
         Helper to record transactions in voucher programs
     """
 
+    # Maximum number of attempts to append a transaction to the chain
+    # when other transactions are appended concurrently
+    APPEND_ATTEMPTS = 10
+
     def __init__(self, program_id):
         """
             Args:
@@ -2657,8 +2741,22 @@ class fin_VoucherProgram:
         else:
             ohash = None
 
-        # Verify the hash
-        data = {"ouuid": ouuid,
+        return self.check(transaction, ohash)
+
+    # -------------------------------------------------------------------------
+    def check(self, transaction, ohash):
+        """
+            Check the vhash of a transaction
+
+            Args:
+                transaction: the transaction record (Row)
+                ohash: the hash of the preceding transaction
+
+            Returns:
+                True|False whether the transaction is intact
+        """
+
+        data = {"ouuid": transaction.ouuid,
                 "date": transaction.date,
                 "type": transaction.type,
                 "credit": transaction.credit,
@@ -2672,6 +2770,187 @@ class fin_VoucherProgram:
 
         return vhash == transaction.vhash
 
+    # -------------------------------------------------------------------------
+    def checkpoint(self):
+        """
+            Get the verification checkpoint of this program
+
+            Returns:
+                the fin_voucher_checkpoint Row, or None if the transaction
+                chain has never been verified
+        """
+
+        program = self.program
+        if not program:
+            return None
+
+        table = current.s3db.fin_voucher_checkpoint
+        query = (table.program_id == program.id)
+        return current.db(query).select(table.ALL,
+                                        limitby = (0, 1),
+                                        ).first()
+
+    # -------------------------------------------------------------------------
+    def verify_chain(self, full=False, batch_size=1000):
+        """
+            Verify the transaction chain of this program, and advance the
+            verification checkpoint to the last transaction up to which the
+            chain is intact
+
+            Args:
+                full: verify the entire chain rather than just the
+                      transactions after the checkpoint
+                batch_size: number of transactions to process at a time
+
+            Returns:
+                a dict {"transactions": number of verified transactions,
+                        "invalid": list of IDs of invalid transactions,
+                        "duration": duration of the verification in seconds,
+                        }
+                or None if the program is not active
+
+            Notes:
+                - verification from a checkpoint uses the hash recorded in
+                  the checkpoint for the checkpoint transaction, but does not
+                  detect later changes of earlier transactions => run audit()
+                  for that
+                - transactions are verified in order of their IDs (=the order
+                  in which they have been appended to the chain)
+                - where several transactions link to the same preceding
+                  transaction (forked chain), only the first of them is
+                  considered valid
+        """
+
+        program = self.program
+        if not program:
+            return None
+
+        db = current.db
+        s3db = current.s3db
+
+        started = time.time()
+
+        table = s3db.fin_voucher_transaction
+        fields = [table.id,
+                  table.uuid,
+                  table.created_on,
+                  table.ouuid,
+                  table.date,
+                  table.type,
+                  table.credit,
+                  table.voucher,
+                  table.debit,
+                  table.compensation,
+                  table.voucher_id,
+                  table.debit_id,
+                  table.vhash,
+                  ]
+
+        # Start after the checkpoint
+        checkpoint = self.checkpoint()
+        hashes = {}
+        position = None
+        count = 0
+        if checkpoint and not full:
+            hashes[checkpoint.tuuid] = checkpoint.vhash
+            position = checkpoint.transaction_id
+            count = checkpoint.transactions or 0
+
+        base = (table.program_id == program.id) & \
+               (table.deleted == False)
+
+        first = table.id.min()
+
+        verified = 0
+        invalid = []
+        last = None
+        while True:
+
+            # Next batch (keyset-paginated)
+            query = base
+            if position:
+                query &= (table.id > position)
+            rows = db(query).select(*fields,
+                                    limitby = (0, batch_size),
+                                    orderby = table.id,
+                                    )
+            if not rows:
+                break
+
+            # Look up hashes of preceding transactions outside of this
+            # batch and the previous one (branched chain)
+            batch = {row.uuid for row in rows}
+            missing = {row.ouuid for row in rows
+                       if row.ouuid and row.ouuid not in hashes and \
+                          row.ouuid not in batch}
+            if missing:
+                query = base & table.uuid.belongs(missing)
+                for row in db(query).select(table.uuid, table.vhash):
+                    hashes[row.uuid] = row.vhash
+
+            # Detect forks: look up the first successor of each preceding
+            # transaction (can be before the checkpoint), so that later
+            # transactions linking to the same predecessor are invalid
+            ouuids = {row.ouuid for row in rows}
+            linked = ouuids - {None}
+            query = table.ouuid.belongs(linked) if linked else None
+            if None in ouuids:
+                q = (table.ouuid == None)
+                query = query | q if query is not None else q
+            successors = db(base & query).select(table.ouuid,
+                                                 first,
+                                                 groupby = table.ouuid,
+                                                 )
+            successor = {row[table.ouuid]: row[first] for row in successors}
+
+            recent = {}
+            for row in rows:
+                ouuid = row.ouuid
+                if successor.get(ouuid, row.id) != row.id:
+                    valid = False
+                elif ouuid:
+                    ohash = recent.get(ouuid, hashes.get(ouuid))
+                    valid = ohash is not None and self.check(row, ohash)
+                else:
+                    valid = self.check(row, None)
+                if valid:
+                    recent[row.uuid] = row.vhash
+                    verified += 1
+                    if not invalid:
+                        last = row
+                else:
+                    invalid.append(row.id)
+
+            # Retain only the hashes of the last batch
+            hashes = recent
+            position = rows.last().id
+            if len(rows) < batch_size:
+                break
+
+        # Advance the checkpoint
+        if last:
+            table = s3db.fin_voucher_checkpoint
+            data = {"transaction_id": last.id,
+                    "tuuid": last.uuid,
+                    "created_on": last.created_on,
+                    "vhash": last.vhash,
+                    "transactions": count + verified,
+                    "verified_on": current.request.utcnow,
+                    }
+            if checkpoint:
+                checkpoint.update_record(**data)
+            else:
+                data["program_id"] = program.id
+                table.insert(**data)
+        elif full and checkpoint:
+            # No intact transactions
+            checkpoint.delete_record()
+
+        return {"transactions": verified,
+                "invalid": invalid,
+                "duration": time.time() - started,
+                }
+
     # -------------------------------------------------------------------------
     def audit(self, correct=False):
         """
@@ -2680,15 +2959,101 @@ class fin_VoucherProgram:
                 - verify all balances, vouchers and debits
 
             Args:
-                correct: correct any incorrect balances
+                correct: correct any incorrect balances (only if
+                         all transactions are intact)
 
             Returns:
-                audit report
-
-            TODO implement
+                audit report, a dict like:
+                    {"transactions": number of verified transactions,
+                     "invalid": list of IDs of invalid transactions,
+                     "program": True|False whether the program balances are correct,
+                     "vouchers": list of IDs of vouchers with incorrect balance,
+                     "debits": list of IDs of debits with incorrect balance,
+                     "corrected": whether incorrect balances have been corrected,
+                     "duration": duration of the audit in seconds,
+                     "rate": number of transactions verified per second,
+                     }
+                or None if the program is not active
         """
 
-        return True
+        program = self.program
+        if not program:
+            return None
+
+        db = current.db
+        s3db = current.s3db
+
+        started = time.time()
+
+        # Verify all transactions
+        report = self.verify_chain(full=True)
+
+        ttable = s3db.fin_voucher_transaction
+        query = (ttable.program_id == program.id)
+
+        # Verify the program balances
+        credit = ttable.credit.sum()
+        compensation = ttable.compensation.sum()
+        row = db(query).select(credit, compensation).first()
+        credit = row[credit] or 0
+        compensation = row[compensation] or 0
+        program_ok = program.credit == credit and \
+                     program.compensation == compensation
+
+        # Verify the voucher and debit balances
+        incorrect = {}
+        for tablename, fieldname, fkey in (("fin_voucher", "voucher", "voucher_id"),
+                                           ("fin_voucher_debit", "debit", "debit_id"),
+                                           ):
+            table = s3db[tablename]
+            total = ttable[fieldname].sum()
+            left = ttable.on((ttable[fkey] == table.id) & query)
+            rows = db(table.program_id == program.id).select(table.id,
+                                                             table.balance,
+                                                             total,
+                                                             left = left,
+                                                             groupby = (table.id,
+                                                                        table.balance,
+                                                                        ),
+                                                             )
+            balances = incorrect[tablename] = {}
+            for row in rows:
+                record = row[tablename]
+                actual = row[total] or 0
+                if record.balance != actual:
+                    balances[record.id] = actual
+
+        # Correct incorrect balances
+        corrected = False
+        if correct and not report["invalid"]:
+            if not program_ok:
+                ptable = s3db.fin_voucher_program
+                db(ptable.id == program.id).update(credit = credit,
+                                                   compensation = compensation,
+                                                   modified_on = ptable.modified_on,
+                                                   modified_by = ptable.modified_by,
+                                                   )
+            for tablename, balances in incorrect.items():
+                table = s3db[tablename]
+                for record_id, balance in balances.items():
+                    db(table.id == record_id).update(balance = balance,
+                                                     modified_on = table.modified_on,
+                                                     modified_by = table.modified_by,
+                                                     )
+            corrected = True
+
+        duration = time.time() - started
+        transactions = report["transactions"] + len(report["invalid"])
+
+        return {"transactions": report["transactions"],
+                "invalid": report["invalid"],
+                "program": program_ok,
+                "vouchers": list(incorrect["fin_voucher"].keys()),
+                "debits": list(incorrect["fin_voucher_debit"].keys()),
+                "corrected": corrected,
+                "duration": duration,
+                "rate": transactions / duration if duration else None,
+                }
 
     # -------------------------------------------------------------------------
     def earliest_billing_date(self, billing_id=None, configure=None):
@@ -2790,23 +3155,11 @@ class fin_VoucherProgram:
             # Invalid - total change must always be 0
             return False
 
-        # Get last preceding transaction in this program
-        table = current.s3db.fin_voucher_transaction
-        query = (table.program_id == program.id)
-        row = current.db(query).select(table.uuid,
-                                       table.vhash,
-                                       limitby = (0, 1),
-                                       orderby = ~(table.created_on)
-                                       ).first()
-        if row:
-            ouuid = row.uuid
-            ohash = row.vhash
-        else:
-            # This is the first transaction
-            ouuid = ohash = None
+        db = current.db
+        s3db = current.s3db
 
         # Build the transaction record
-        transaction = {"ouuid": ouuid,
+        transaction = {"ouuid": None,
                        "date": current.request.utcnow,
                        "type": None,
                        "credit": 0,
@@ -2817,14 +3170,42 @@ class fin_VoucherProgram:
                        "debit_id": None
                        }
         transaction.update(data)
-        transaction["ouuid"] = ouuid
-        transaction["vhash"] = self._hash(transaction, ohash)
-        transaction["program_id"] = program.id
+        tuuid = uuid4().urn
 
-        s3db = current.s3db
+        htable = s3db.fin_voucher_chain
+        table = s3db.fin_voucher_transaction
+
+        for _ in range(self.APPEND_ATTEMPTS):
+
+            # Get the current chain head (locks it until commit)
+            head = self.__chain_head()
+
+            # Link the transaction to the preceding transaction
+            ouuid = transaction["ouuid"] = head.tuuid
+            transaction["vhash"] = self._hash(transaction, head.vhash)
+
+            # Advance the chain head, unless another transaction has been
+            # appended in the meantime (=compare-and-swap)
+            version = head.version
+            query = (htable.id == head.id) & (htable.version == version)
+            success = db(query).update(tuuid = tuuid,
+                                       vhash = transaction["vhash"],
+                                       version = version + 1,
+                                       )
+            if success:
+                break
+
+            # Retry with the new chain head
+            current.log.debug("Concurrent append to transaction chain "
+                              "after %s, retrying" % ouuid)
+        else:
+            current.log.error("Could not append transaction to chain of "
+                              "voucher program #%s" % program.id)
+            return False
 
         # Write the transaction
-        table = s3db.fin_voucher_transaction
+        transaction["program_id"] = program.id
+        transaction["uuid"] = tuuid
         transaction["id"] = table.insert(**transaction)
 
         # Post-process it
@@ -2833,6 +3214,94 @@ class fin_VoucherProgram:
 
         return True
 
+    # -------------------------------------------------------------------------
+    def __chain_head(self):
+        """
+            Get the head of the transaction chain of this program, create
+            it from the latest transaction if it doesn't exist yet
+
+            Returns:
+                the fin_voucher_chain Row
+
+            Note:
+                The head is selected FOR UPDATE, i.e. locked until the
+                end of the DB transaction, and read as last committed
+                (a plain SELECT would return a stale head under repeatable
+                read isolation after a concurrent append)
+        """
+
+        table = current.s3db.fin_voucher_chain
+
+        program_id = self.program.id
+
+        query = (table.program_id == program_id)
+        head = current.db(query).select(table.id,
+                                        table.tuuid,
+                                        table.vhash,
+                                        table.version,
+                                        limitby = (0, 1),
+                                        for_update = True,
+                                        ).first()
+        if not head:
+            head = self.create_chain_head(program_id)
+
+        return head
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def create_chain_head(program_id):
+        """
+            Create the head of the transaction chain of a program, from
+            its latest transaction if there is any; no-op if the head
+            exists already
+
+            Args:
+                program_id: the program record ID
+
+            Returns:
+                the fin_voucher_chain Row
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        # Lock the program record, so that concurrent requests
+        # do not attempt to create the head at the same time
+        ptable = s3db.fin_voucher_program
+        db(ptable.id == program_id).select(ptable.id,
+                                           limitby = (0, 1),
+                                           for_update = True,
+                                           )
+
+        table = s3db.fin_voucher_chain
+        query = (table.program_id == program_id)
+        fields = [table.id, table.tuuid, table.vhash, table.version]
+
+        head = db(query).select(*fields, limitby=(0, 1), for_update=True).first()
+        if not head:
+            # Look up the latest transaction in this program
+            ttable = s3db.fin_voucher_transaction
+            tquery = (ttable.program_id == program_id)
+            row = db(tquery).select(ttable.uuid,
+                                    ttable.vhash,
+                                    limitby = (0, 1),
+                                    orderby = ~ttable.created_on|~ttable.id,
+                                    ).first()
+            if row:
+                tuuid, vhash = row.uuid, row.vhash
+            else:
+                # This is the first transaction
+                tuuid = vhash = None
+
+            table.insert(program_id = program_id,
+                         tuuid = tuuid,
+                         vhash = vhash,
+                         version = 0,
+                         )
+            head = db(query).select(*fields, limitby=(0, 1), for_update=True).first()
+
+        return head
+
 # =============================================================================
 class fin_VoucherBilling:
     """
@@ -2932,30 +3401,43 @@ class fin_VoucherBilling:
 
         dtable = s3db.fin_voucher_debit
         ttable = s3db.fin_voucher_transaction
+        otable = ttable.with_alias("fin_voucher_otransaction")
+
+        log = current.log
+        invalid_debit = "Voucher program billing - invalid debit: #%s"
+        invalid_transaction = "Voucher program billing - corrupted transaction: #%s"
 
+        # Verify all transactions since the last checkpoint
+        invalid = set()
+        chain = program.verify_chain()
+        if chain:
+            invalid.update(chain["invalid"])
+
+        # Get the debits with their transactions, and the hashes
+        # of the preceding transactions
         query = (dtable.billing_id == billing.id) & \
                 (dtable.claim_id == None) & \
                 (dtable.deleted == False)
-        left = ttable.on((ttable.debit_id == dtable.id) & \
-                         (ttable.deleted == False))
+        left = [ttable.on((ttable.debit_id == dtable.id) & \
+                          (ttable.deleted == False)),
+                otable.on((otable.uuid == ttable.ouuid) & \
+                          (otable.program_id == ttable.program_id)),
+                ]
         rows = db(query).select(dtable.id,
                                 dtable.balance,
-                                ttable.id,
-                                ttable.debit,
+                                ttable.ALL,
+                                otable.id,
+                                otable.vhash,
                                 left = left,
                                 orderby = dtable.date,
                                 )
 
-        log = current.log
-        invalid_debit = "Voucher program billing - invalid debit: #%s"
-        invalid_transaction = "Voucher program billing - corrupted transaction: #%s"
-
-        invalid = 0
         totals = {}
         debits = {}
         for row in rows:
             debit = row.fin_voucher_debit
             transaction = row.fin_voucher_transaction
+            preceding = row.fin_voucher_otransaction
 
             if transaction.id is None:
                 # Invalid debit, drop it from billing
@@ -2964,7 +3446,10 @@ class fin_VoucherBilling:
                                     modified_on = dtable.modified_on,
                                     modified_by = dtable.modified_by,
                                     )
-            elif program.verify(transaction.id):
+            elif (not transaction.ouuid or preceding.id is not None) and \
+                 program.check(transaction,
+                               preceding.vhash if transaction.ouuid else None,
+                               ):
                 # Valid transaction
                 debit_id = debit.id
                 if debit_id in totals:
@@ -2974,8 +3459,10 @@ class fin_VoucherBilling:
                 debits[debit_id] = debit
             else:
                 # Invalid transaction
-                log.error(invalid_transaction % transaction.id)
-                invalid += 1
+                invalid.add(transaction.id)
+
+        for transaction_id in invalid:
+            log.error(invalid_transaction % transaction_id)
 
         if not invalid:
             # Fix any incorrect debit balances
@@ -2987,7 +3474,7 @@ class fin_VoucherBilling:
                                         modified_by = dtable.modified_by,
                                         )
 
-        return invalid
+        return len(invalid)
 
     # -------------------------------------------------------------------------
     def generate_claims(self):
@@ -3058,6 +3545,11 @@ class fin_VoucherBilling:
         billing_id = billing.id
         total_claims = 0
 
+        batch_size = current.deployment_settings.get_fin_voucher_billing_batch_size()
+        if batch_size:
+            total_claims = self.__generate_claims(rows, batch_size)
+            rows = ()
+
         s3db_onaccept = s3db.onaccept
         set_record_owner = current.auth.s3_set_record_owner
 
@@ -3110,11 +3602,16 @@ class fin_VoucherBilling:
                                ).first()
 
         btable = s3db.fin_voucher_billing
-        billing.update_record(vouchers_total = row[vouchers_total],
-                              quantity_total = row[quantity_total],
-                              modified_by = btable.modified_by,
-                              modified_on = btable.modified_on,
-                              )
+        data = {"vouchers_total": row[vouchers_total],
+                "quantity_total": row[quantity_total],
+                "claims_total": btable.claims_total.coalesce_zero() + total_claims,
+                "modified_by": btable.modified_by,
+                "modified_on": btable.modified_on,
+                }
+        if not batch_size:
+            # Claims have been post-processed already
+            data["claims_processed"] = btable.claims_processed.coalesce_zero() + total_claims
+        billing.update_record(**data)
 
         # If no claims have been generated, conclude the billing
         # right away (as there will be no later trigger)
@@ -3123,6 +3620,145 @@ class fin_VoucherBilling:
 
         return total_claims
 
+    # -------------------------------------------------------------------------
+    def __generate_claims(self, rows, batch_size):
+        """
+            Generate claims in batches, and schedule their post-processing
+            (record owner, onaccept) as parallel tasks per batch
+
+            Args:
+                rows: the totals per provider (from generate_claims)
+                batch_size: the number of claims per batch
+
+            Returns:
+                the number of claims generated
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        billing = self.billing
+        pdata = self.program.program
+        ppu = pdata.price_per_unit
+
+        dtable = s3db.fin_voucher_debit
+        ctable = s3db.fin_voucher_claim
+
+        # Unclaimed debits of this billing process
+        query = (dtable.billing_id == billing.id) & \
+                (dtable.claim_id == None) & \
+                (dtable.deleted == False)
+
+        provider_id = dtable.pe_id
+        balance_total = dtable.balance.sum()
+        num_vouchers = dtable.voucher_id.count()
+
+        now = datetime.datetime.utcnow()
+        claims = []
+        for row in rows:
+            provider = row[provider_id]
+            if not provider:
+                continue
+            quantity = row[balance_total]
+            claims.append({"program_id": pdata.id,
+                           "billing_id": billing.id,
+                           "pe_id": provider,
+                           "date": now,
+                           "status": "NEW",
+                           "vouchers_total": row[num_vouchers],
+                           "quantity_total": quantity,
+                           "price_per_unit": ppu,
+                           "amount_receivable": quantity * ppu if ppu else 0,
+                           "currency": pdata.currency,
+                           })
+
+        run_async = current.s3task.run_async
+
+        total_claims = 0
+        for index in range(0, len(claims), batch_size):
+
+            batch = claims[index:index + batch_size]
+            claim_ids = ctable.bulk_insert(batch)
+            if not claim_ids:
+                continue
+
+            # Assign the debits to the claims (=claim for the same provider),
+            # with a single update for the whole batch
+            cases = " ".join("WHEN %d THEN %d" % (int(claim["pe_id"]), int(claim_id))
+                             for claim_id, claim in zip(claim_ids, batch))
+            claim_id = Expression(db,
+                                  "CASE %s %s END" % (provider_id.sqlsafe, cases),
+                                  type = "integer",
+                                  )
+            q = query & provider_id.belongs([claim["pe_id"] for claim in batch])
+            db(q).update(claim_id = claim_id,
+                         modified_by = dtable.modified_by,
+                         modified_on = dtable.modified_on,
+                         )
+            total_claims += len(claim_ids)
+
+            # Post-process the claims asynchronously
+            run_async("s3db_task",
+                      args = ["fin_voucher_process_claims"],
+                      vars = {"billing_id": billing.id,
+                              "claim_ids": [int(i) for i in claim_ids],
+                              },
+                      timeout = 1800,
+                      )
+
+        return total_claims
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def process_claims(cls, billing_id, claim_ids):
+        """
+            Post-process claims generated in batches (record owner,
+            onaccept, which can generate invoices), and update the
+            progress of the billing process
+
+            Args:
+                billing_id: the billing ID
+                claim_ids: the claim IDs
+
+            Returns:
+                the number of processed claims
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        ctable = s3db.fin_voucher_claim
+
+        # Customise claim resource
+        from core import CRUDRequest
+        r = CRUDRequest("fin", "voucher_claim", args=[], get_vars={})
+        r.customise_resource("fin_voucher_claim")
+
+        s3db_onaccept = s3db.onaccept
+        set_record_owner = current.auth.s3_set_record_owner
+
+        query = (ctable.id.belongs(claim_ids)) & \
+                (ctable.billing_id == billing_id) & \
+                (ctable.deleted == False)
+        rows = db(query).select(ctable.ALL)
+
+        processed = 0
+        for row in rows:
+            data = row.as_dict()
+            set_record_owner(ctable, data)
+            s3db_onaccept(ctable, data, method="create")
+            processed += 1
+
+        # Update progress
+        btable = s3db.fin_voucher_billing
+        db(btable.id == billing_id).update(
+                claims_processed = btable.claims_processed.coalesce_zero() + processed,
+                modified_by = btable.modified_by,
+                modified_on = btable.modified_on,
+                )
+
+        return processed
+
     # -------------------------------------------------------------------------
     @classmethod
     def generate_invoice(cls, claim_id):
@@ -3878,6 +4514,28 @@ def fin_voucher_start_billing(billing_id=None):
     claims = billing.generate_claims()
     return "Billing process started (%s claims generated)" % claims
 
+# =============================================================================
+def fin_voucher_process_claims(billing_id=None, claim_ids=None):
+    """
+        Scheduler task to post-process claims generated in batches,
+        scheduled by fin_VoucherBilling.generate_claims via s3db_task
+
+        Args:
+            billing_id: the billing ID
+            claim_ids: the claim IDs
+
+        Returns:
+            success message
+    """
+
+    if not billing_id:
+        raise TypeError("Argument missing: billing ID")
+    if not claim_ids:
+        raise TypeError("Argument missing: claim IDs")
+
+    processed = fin_VoucherBilling.process_claims(billing_id, claim_ids)
+    return "%s claims processed" % processed
+
 # =============================================================================
 def fin_voucher_settle_invoice(invoice_id=None, ptoken=None, user_id=None):
     """
@@ -3910,4 +4568,28 @@ def fin_voucher_settle_invoice(invoice_id=None, ptoken=None, user_id=None):
     quantity = fin_VoucherBilling.settle_invoice(invoice_id, ptoken)
     return "Invoice settled (%s units compensated)" % quantity
 
+# =============================================================================
+def fin_voucher_create_indexes():
+    """
+        Create indexes for fin_voucher_transaction, for faster lookup
+        of transactions in chain order, and of successors of a transaction
+    """
+
+    dbtype = current.deployment_settings.get_database_type()
+
+    if dbtype in ("postgres", "sqlite"):
+        sql = "CREATE INDEX IF NOT EXISTS %(index)s ON %(table)s (%(fields)s);"
+    else:
+        return
+
+    db = current.db
+    for index, fields in (("fin_voucher_transaction_program_id_id_idx", "program_id, id"),
+                          ("fin_voucher_transaction_ouuid_idx", "ouuid"),
+                          ):
+        names = {"table": "fin_voucher_transaction",
+                 "index": index,
+                 "fields": fields,
+                 }
+        db.executesql(sql % names)
+
 # END =========================================================================
@@ -461,6 +461,10 @@ class GISLocationModel(DataModel):
             db = current.db
             db(db.gis_location.id == location_id).update(path = None)
 
+        if not auth.rollback:
+            # Update the spatial index (if used)
+            current.gis.update_spatial_index(location_id)
+
         if not auth.override and \
            not auth.rollback:
             # Update the Path (async if-possible)
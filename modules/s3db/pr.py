@@ -96,6 +96,9 @@ __all__ = (# PR Base Entities
            "pr_descendants",
            "pr_rebuild_path",
            "pr_role_rebuild_path",
+           "pr_update_closure",
+           "pr_rebuild_closure",
+           "pr_check_closure",
 
            # Helper for ImageLibrary
            "pr_image_modify",
@@ -137,6 +140,7 @@ class PRPersonEntityModel(DataModel):
 
     names = ("pr_pentity",
              "pr_affiliation",
+             "pr_affiliation_closure",
              "pr_person_user",
              "pr_role",
              "pr_role_types",
@@ -440,6 +444,21 @@ class PRPersonEntityModel(DataModel):
                   ondelete = self.pr_affiliation_ondelete,
                   )
 
+        # ---------------------------------------------------------------------
+        # Affiliation closure
+        # - all (transitive) ancestor/descendant relationships between person
+        #   entities per role type, maintained from affiliations if
+        #   pr.affiliation_closure is enabled (see pr_update_closure)
+        #
+        tablename = "pr_affiliation_closure"
+        define_table(tablename,
+                     Field("ancestor", "integer"),
+                     Field("descendant", "integer"),
+                     Field("depth", "integer"),
+                     Field("role_type", "integer"),
+                     meta = False,
+                     )
+
         # ---------------------------------------------------------------------
         # Pass names back to global scope (s3.*)
         #
@@ -735,6 +754,9 @@ class PRPersonEntityModel(DataModel):
             # Clear descendant paths
             current.s3db.pr_rebuild_path(pe_id, clear=True)
 
+            # Invalidate cached ACLs
+            current.auth.permission.expire_acl_cache()
+
     # -------------------------------------------------------------------------
     @staticmethod
     def pr_affiliation_ondelete(row):
@@ -750,6 +772,9 @@ class PRPersonEntityModel(DataModel):
         if pe_id:
             current.s3db.pr_rebuild_path(pe_id, clear=True)
 
+            # Invalidate cached ACLs
+            current.auth.permission.expire_acl_cache()
+
 # =============================================================================
 class PRPersonModel(DataModel):
     """ Persons and Groups """
@@ -8379,13 +8404,23 @@ def pr_define_role(pe_id,
     else:
         duplicate = None
     if duplicate:
-        if duplicate.role_type != role_type:
+        type_changed = duplicate.role_type != role_type
+        if type_changed:
             # Clear paths if this changes the role type
             if str(role_type) != str(OU):
                 data["path"] = None
             s3db.pr_role_rebuild_path(duplicate.id, clear=True)
         duplicate.update_record(**data)
         record_id = duplicate.id
+
+        if type_changed and \
+           current.deployment_settings.get_pr_affiliation_closure():
+            # Update the closure for all affiliates of this role
+            atable = s3db.pr_affiliation
+            query = (atable.role_id == record_id) & \
+                    (atable.deleted != True)
+            rows = current.db(query).select(atable.pe_id)
+            pr_update_closure([row.pe_id for row in rows])
     else:
         record_id = rtable.insert(**data)
     return record_id
@@ -8634,6 +8669,18 @@ def pr_get_ancestors(pe_id):
     """
 
     s3db = current.s3db
+
+    if current.deployment_settings.get_pr_affiliation_closure():
+        # Look up from closure
+        ctable = s3db.pr_affiliation_closure
+        query = (ctable.descendant == pe_id) & \
+                (ctable.role_type == OU)
+        # Nearest ancestors first
+        rows = current.db(query).select(ctable.ancestor,
+                                        orderby = ctable.depth|ctable.ancestor,
+                                        )
+        return [row.ancestor for row in rows]
+
     atable = s3db.pr_affiliation
     rtable = s3db.pr_role
     query = (atable.deleted != True) & \
@@ -8769,6 +8816,22 @@ def pr_ancestors(entities):
         return Storage()
 
     s3db = current.s3db
+
+    if current.deployment_settings.get_pr_affiliation_closure():
+        # Look up from closure
+        ctable = s3db.pr_affiliation_closure
+        query = (ctable.descendant.belongs(entities)) & \
+                (ctable.role_type == OU)
+        # Nearest ancestors first
+        rows = current.db(query).select(ctable.ancestor,
+                                        ctable.descendant,
+                                        orderby = ctable.depth|ctable.ancestor,
+                                        )
+        ancestors = Storage([(pe_id, []) for pe_id in entities])
+        for row in rows:
+            ancestors[row.descendant].append(row.ancestor)
+        return ancestors
+
     atable = s3db.pr_affiliation
     rtable = s3db.pr_role
     query = (atable.deleted != True) & \
@@ -8825,6 +8888,27 @@ def pr_descendants(pe_ids, skip=None, root=True):
         return {}
 
     s3db = current.s3db
+
+    if root and current.deployment_settings.get_pr_affiliation_closure():
+        # Look up from closure
+        ctable = s3db.pr_affiliation_closure
+        etable = s3db.pr_pentity
+        query = (ctable.ancestor.belongs(pe_ids)) & \
+                (ctable.role_type == OU) & \
+                (etable.pe_id == ctable.descendant) & \
+                (etable.instance_type != "pr_person")
+        rows = current.db(query).select(ctable.ancestor,
+                                        ctable.descendant,
+                                        )
+        result = {}
+        for row in rows:
+            ancestor = row.ancestor
+            if ancestor in result:
+                result[ancestor].append(row.descendant)
+            else:
+                result[ancestor] = [row.descendant]
+        return result
+
     etable = s3db.pr_pentity
     rtable = s3db.pr_role
     atable = s3db.pr_affiliation
@@ -8904,6 +8988,22 @@ def pr_get_descendants(pe_ids, entity_types=None, skip=None, ids=True):
 
     db = current.db
     s3db = current.s3db
+
+    if ids and skip is None and \
+       current.deployment_settings.get_pr_affiliation_closure():
+        # Look up from closure
+        ctable = s3db.pr_affiliation_closure
+        query = (ctable.ancestor.belongs(pe_ids)) & \
+                (ctable.role_type == OU)
+        if entity_types is not None:
+            if not isinstance(entity_types, (tuple, list, set)):
+                entity_types = [entity_types]
+            etable = s3db.pr_pentity
+            query &= (etable.pe_id == ctable.descendant) & \
+                     (etable.instance_type.belongs(set(entity_types)))
+        rows = db(query).select(ctable.descendant, distinct=True)
+        return [row.descendant for row in rows]
+
     etable = s3db.pr_pentity
     rtable = db.pr_role
     atable = db.pr_affiliation
@@ -8988,6 +9088,10 @@ def pr_rebuild_path(pe_id, clear=False):
         if role.path is None:
             pr_role_rebuild_path(role, clear=clear)
 
+    # Update the affiliation closure (only necessary for writes)
+    if clear and current.deployment_settings.get_pr_affiliation_closure():
+        pr_update_closure(pe_id)
+
 # =============================================================================
 def pr_role_rebuild_path(role_id, skip=None, clear=False):
     """
@@ -9057,6 +9161,235 @@ def pr_role_rebuild_path(role_id, skip=None, clear=False):
 
     return path
 
+# =============================================================================
+# Affiliation Closure
+# =============================================================================
+def pr_update_closure(pe_ids):
+    """
+        Update the affiliation closure for person entities after their
+        affiliations have changed (incl. all their descendants)
+
+        Args:
+            pe_ids: the person entity ID, or a list of PE IDs
+
+        Returns:
+            the number of closure entries written
+    """
+
+    if not pe_ids:
+        return 0
+    if not isinstance(pe_ids, (list, tuple, set)):
+        pe_ids = [pe_ids]
+
+    # Include all descendants (of any role type)
+    ctable = current.s3db.pr_affiliation_closure
+    query = ctable.ancestor.belongs(set(pe_ids))
+    rows = current.db(query).select(ctable.descendant, distinct=True)
+
+    nodes = set(pe_ids)
+    nodes.update(row.descendant for row in rows)
+
+    closure = pr_closure(nodes)
+
+    return pr_write_closure(closure, nodes)
+
+# -----------------------------------------------------------------------------
+def pr_rebuild_closure():
+    """
+        Rebuild the entire affiliation closure, e.g. after enabling
+        pr.affiliation_closure (static/scripts/tools/pr_rebuild_closure.py)
+
+        Returns:
+            the number of closure entries written
+    """
+
+    db = current.db
+    ctable = current.s3db.pr_affiliation_closure
+
+    # Indexes for ancestor/descendant lookups
+    dbtype = current.deployment_settings.get_database_type()
+    if dbtype in ("postgres", "sqlite"):
+        sql = "CREATE INDEX IF NOT EXISTS %(index)s ON %(table)s (%(fields)s);"
+        names = {"table": ctable._tablename}
+        for fn in ("ancestor", "descendant"):
+            names["index"] = "%s_%s_idx" % (ctable._tablename, fn)
+            names["fields"] = "%s, role_type" % fn
+            db.executesql(sql % names)
+
+    closure = pr_closure()
+
+    db(ctable.id > 0).delete()
+    return pr_write_closure(closure)
+
+# -----------------------------------------------------------------------------
+def pr_check_closure():
+    """
+        Check the affiliation closure for consistency with the actual
+        affiliations
+
+        Returns:
+            a dict {"missing": number of missing entries,
+                    "obsolete": number of obsolete entries,
+                    "depth": number of entries with incorrect depth,
+                    }
+    """
+
+    expected = pr_closure()
+
+    ctable = current.s3db.pr_affiliation_closure
+    rows = current.db(ctable.id > 0).select(ctable.ancestor,
+                                            ctable.descendant,
+                                            ctable.role_type,
+                                            ctable.depth,
+                                            )
+    actual = {(row.ancestor, row.descendant, row.role_type): row.depth
+              for row in rows}
+
+    missing = obsolete = depth = 0
+    for key, d in expected.items():
+        if key not in actual:
+            missing += 1
+        elif actual[key] != d:
+            depth += 1
+    for key in actual:
+        if key not in expected:
+            obsolete += 1
+
+    return {"missing": missing,
+            "obsolete": obsolete,
+            "depth": depth,
+            }
+
+# -----------------------------------------------------------------------------
+def pr_closure(nodes=None):
+    """
+        Compute the affiliation closure (=all ancestors with their
+        minimum distance) for person entities from their affiliations
+
+        Args:
+            nodes: the person entity IDs to compute the closure for,
+                   must include all their descendants; None for all
+
+        Returns:
+            dict {(ancestor, descendant, role_type): depth}
+    """
+
+    db = current.db
+    s3db = current.s3db
+
+    atable = s3db.pr_affiliation
+    rtable = s3db.pr_role
+
+    # Look up the immediate parents of all nodes
+    query = (atable.role_id == rtable.id) & \
+            (atable.deleted != True) & \
+            (rtable.deleted != True)
+    if nodes is not None:
+        nodes = set(nodes)
+        query &= atable.pe_id.belongs(nodes)
+    rows = db(query).select(atable.pe_id,
+                            rtable.pe_id,
+                            rtable.role_type,
+                            )
+    parents = {}
+    for row in rows:
+        child = row.pr_affiliation.pe_id
+        role = row.pr_role
+        key = (child, role.role_type)
+        if key in parents:
+            parents[key].add(role.pe_id)
+        else:
+            parents[key] = {role.pe_id}
+    if nodes is None:
+        nodes = set(child for child, _ in parents)
+
+    # Look up the ancestors of all parents outside of the nodes
+    # (=their closure is not affected)
+    outside = set()
+    for ps in parents.values():
+        outside |= ps - nodes
+    known = {}
+    if outside:
+        ctable = s3db.pr_affiliation_closure
+        query = ctable.descendant.belongs(outside)
+        rows = db(query).select(ctable.ancestor,
+                                ctable.descendant,
+                                ctable.role_type,
+                                ctable.depth,
+                                )
+        for row in rows:
+            key = (row.descendant, row.role_type)
+            if key in known:
+                known[key][row.ancestor] = row.depth
+            else:
+                known[key] = {row.ancestor: row.depth}
+
+    # Propagate ancestors along the affiliations until stable
+    # - number of iterations is bounded by the depth of the hierarchy
+    ancestors = {}
+    for _ in range(len(nodes) + 1):
+        changed = False
+        for key, ps in parents.items():
+            child, role_type = key
+            current_ancestors = {}
+            for parent in ps:
+                if parent != child:
+                    current_ancestors[parent] = 1
+                if parent in nodes:
+                    inherited = ancestors.get((parent, role_type))
+                else:
+                    inherited = known.get((parent, role_type))
+                if not inherited:
+                    continue
+                for ancestor, depth in inherited.items():
+                    if ancestor == child:
+                        continue
+                    depth += 1
+                    if current_ancestors.get(ancestor, depth) >= depth:
+                        current_ancestors[ancestor] = depth
+            if ancestors.get(key) != current_ancestors:
+                ancestors[key] = current_ancestors
+                changed = True
+        if not changed:
+            break
+
+    closure = {}
+    for (child, role_type), items in ancestors.items():
+        for ancestor, depth in items.items():
+            closure[(ancestor, child, role_type)] = depth
+
+    return closure
+
+# -----------------------------------------------------------------------------
+def pr_write_closure(closure, nodes=None):
+    """
+        Write the affiliation closure to the database
+
+        Args:
+            closure: the closure as returned from pr_closure
+            nodes: the person entity IDs the closure has been computed for,
+                   to replace their previous closure entries (None if the
+                   table has been emptied before)
+
+        Returns:
+            the number of closure entries written
+    """
+
+    ctable = current.s3db.pr_affiliation_closure
+
+    if nodes:
+        current.db(ctable.descendant.belongs(set(nodes))).delete()
+
+    items = [{"ancestor": ancestor,
+              "descendant": descendant,
+              "role_type": role_type,
+              "depth": depth,
+              } for (ancestor, descendant, role_type), depth in closure.items()]
+    if items:
+        ctable.bulk_insert(items)
+
+    return len(items)
+
 # -----------------------------------------------------------------------------
 def pr_image_modify(image_file,
                     image_name,
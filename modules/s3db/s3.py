@@ -28,6 +28,7 @@
 __all__ = ("S3HierarchyModel",
            "S3DashboardModel",
            "S3ImportJobModel",
+           "S3ReportAggregateModel",
            "S3DynamicTablesModel",
            "s3_table_rheader",
            "s3_scheduler_rheader",
@@ -57,6 +58,11 @@ class S3HierarchyModel(DataModel):
                                 default = False,
                                 ),
                           Field("hierarchy", "json"),
+                          # Incremented with every change, to detect
+                          # concurrent changes and stale hierarchies
+                          Field("version", "integer",
+                                default = 0,
+                                ),
                           *MetaFields.timestamps(),
                           meta = False,
                           )
@@ -210,6 +216,79 @@ class S3ImportJobModel(DataModel):
         # ---------------------------------------------------------------------
         return None
 
+# =============================================================================
+class S3ReportAggregateModel(DataModel):
+    """ Model for materialized pivot table aggregates """
+
+    names = ("s3_report_cube",
+             "s3_report_cube_cell",
+             "s3_report_cube_dirty",
+             )
+
+    def model(self):
+
+        define_table = self.define_table
+
+        # ---------------------------------------------------------------------
+        # Aggregate Cube
+        # - one per configured (rows, cols, facts) aggregation of a table
+        #
+        tablename = "s3_report_cube"
+        define_table(tablename,
+                     Field("tablename", length=64),
+                     Field("signature", length=40),
+                     Field("cube_rows"),
+                     Field("cube_cols"),
+                     Field("cube_partition", length=64),
+                     Field("facts", "json"),
+                     Field("rebuild", "boolean",
+                           default = True,
+                           ),
+                     Field("refreshed_on", "datetime"),
+                     meta = False,
+                     )
+
+        # ---------------------------------------------------------------------
+        # Aggregate Cell
+        # - partial aggregates per partition and axis values
+        #
+        tablename = "s3_report_cube_cell"
+        define_table(tablename,
+                     Field("cube_id", "reference s3_report_cube",
+                           ondelete = "CASCADE",
+                           ),
+                     Field("part", "date"),
+                     Field("row_value", "text"),
+                     Field("col_value", "text"),
+                     Field("records", "integer"),
+                     Field("data", "json"),
+                     meta = False,
+                     )
+
+        # ---------------------------------------------------------------------
+        # Dirty Partitions
+        # - partitions to refresh after source records have been changed
+        #
+        tablename = "s3_report_cube_dirty"
+        define_table(tablename,
+                     Field("cube_id", "reference s3_report_cube",
+                           ondelete = "CASCADE",
+                           ),
+                     Field("part", "date"),
+                     meta = False,
+                     )
+
+        # ---------------------------------------------------------------------
+        # Return global names to s3.*
+        #
+        return None
+
+    # -------------------------------------------------------------------------
+    def defaults(self):
+        """ Safe defaults if module is disabled """
+
+        return None
+
 # =============================================================================
 class S3DynamicTablesModel(DataModel):
     """ Model for dynamic tables """
@@ -43,6 +43,9 @@ def config(settings):
                                       ("org", "provider"): ("org", "organisation"),
                                       }
 
+    # Share organisation representations across requests
+    settings.base.represent_cache = True
+
     # Custom Logo
     #settings.ui.menu_logo = "/%s/static/themes/<templatename>/img/logo.png" % current.request.application
 
@@ -147,6 +150,12 @@ def config(settings):
     # 7: Apply Controller, Function, Table ACLs and Entity Realm + Hierarchy
     settings.security.policy = 7
 
+    # Cache applicable ACLs across requests (seconds)
+    settings.security.acl_cache = 300
+
+    # Cache options of filter widgets across requests (seconds)
+    settings.search.filter_options_cache = 300
+
     # -------------------------------------------------------------------------
     settings.cms.newsletter_recipient_types = ("org_organisation", "org_facility")
 
@@ -159,6 +168,7 @@ def config(settings):
 
     # -------------------------------------------------------------------------
     settings.disease.testing_report_by_demographic = True
+    settings.disease.testing_report_aggregates = True
 
     # -------------------------------------------------------------------------
     settings.hrm.record_tab = True
@@ -219,6 +229,7 @@ def config(settings):
     # -------------------------------------------------------------------------
     # UI Settings
     settings.ui.calendar_clear_icon = True
+    settings.ui.report_groupby = True
 
     # -------------------------------------------------------------------------
     # Custom settings
@@ -239,6 +250,41 @@ def config(settings):
 
     settings.tasks.poll_dcc = poll_dcc
 
+    # Maximum number of concurrent requests to the DCC server, and
+    # maximum run time of a poll cycle (seconds)
+    #settings.custom.dcc_poll_workers = 8
+    #settings.custom.dcc_poll_budget = 240
+
+    # -------------------------------------------------------------------------
+    # Batched updates of daily testing reports from individual test results,
+    # requires a scheduled settings_task "update_daily_reports"
+    settings.custom.testing_report_batch = False
+
+    def update_daily_reports():
+        """
+            Scheduler task to process queued updates of daily testing reports
+        """
+
+        from .helpers import DailyReportQueue
+        return DailyReportQueue.process()
+
+    settings.tasks.update_daily_reports = update_daily_reports
+
+    # -------------------------------------------------------------------------
+    # Queue test results for reporting to CWA rather than sending them
+    # during registration, requires a scheduled settings_task "send_cwa_results"
+    settings.custom.cwa_queue = False
+
+    def send_cwa_results():
+        """
+            Scheduler task to send queued test results to CWA
+        """
+
+        from .cwa import CWAResultQueue
+        return CWAResultQueue.process()
+
+    settings.tasks.send_cwa_results = send_cwa_results
+
     # -------------------------------------------------------------------------
     from .customise.auth import rlpptm_realm_entity, \
                                 consent_check, \
@@ -18,10 +18,14 @@ from core import CustomController, IS_ONE_OF, IS_UTC_DATE, S3CRUD, S3Represent,
                  get_form_record_id
 
 # -------------------------------------------------------------------------
-def case_diagnostics_onaccept(form):
+def case_diagnostics_onaccept(form, create=False):
     """
         Custom onaccept routine for disease_case_diagnostics
         - auto-generate/update corresponding daily testing report
+
+        Args:
+            form: the FORM
+            create: whether this is a new test result
     """
 
     record_id = get_form_record_id(form)
@@ -39,6 +43,8 @@ def case_diagnostics_onaccept(form):
     record = db(query).select(table.site_id,
                               table.result_date,
                               table.disease_id,
+                              table.demographic_id,
+                              table.result,
                               limitby = (0, 1),
                               ).first()
     if not record:
@@ -50,12 +56,30 @@ def case_diagnostics_onaccept(form):
 
     if site_id and disease_id and result_date:
         # Update daily testing report
+        if settings.get_custom("testing_report_batch"):
+            # Queue the update
+            from ..helpers import DailyReportQueue
+            DailyReportQueue.enqueue(site_id, result_date, disease_id,
+                                     demographic_id = record.demographic_id,
+                                     result = record.result,
+                                     recount = not create,
+                                     )
+            return
         if settings.get_disease_testing_report_by_demographic():
             from ..helpers import update_daily_report_by_demographic as update_daily_report
         else:
             from ..helpers import update_daily_report
         update_daily_report(site_id, result_date, disease_id)
 
+# -------------------------------------------------------------------------
+def case_diagnostics_create_onaccept(form):
+    """
+        Custom create-onaccept routine for disease_case_diagnostics
+        - auto-generate/update corresponding daily testing report
+    """
+
+    case_diagnostics_onaccept(form, create=True)
+
 # -------------------------------------------------------------------------
 def disease_case_diagnostics_resource(r, tablename):
 
@@ -266,10 +290,16 @@ def disease_case_diagnostics_resource(r, tablename):
                    orderby = "disease_case_diagnostics.probe_date desc",
                    )
 
-    # Custom callback to auto-update test station daily reports
+    # Custom callbacks to auto-update test station daily reports
+    s3db.add_custom_callback("disease_case_diagnostics",
+                             "onaccept",
+                             case_diagnostics_create_onaccept,
+                             method = "create",
+                             )
     s3db.add_custom_callback("disease_case_diagnostics",
                              "onaccept",
                              case_diagnostics_onaccept,
+                             method = "update",
                              )
 
     # Custom REST methods
@@ -11,8 +11,12 @@ import json
 import requests
 import secrets
 import sys
+import threading
+import time
 import uuid
 
+from requests.adapters import HTTPAdapter
+
 from gluon import current, Field, IS_EMPTY_OR, IS_IN_SET, SQLFORM, URL, \
                   BUTTON, DIV, FORM, H5, INPUT, TABLE, TD, TR
 
@@ -362,8 +366,15 @@ class TestResultRegistration(CRUDMethod):
                                         formvars.get("consent"),
                                         )
             # Send to CWA
-            if cwa_report.send():
-                response.information = T("Result reported to %(system)s") % CWA
+            if current.deployment_settings.get_custom("cwa_queue"):
+                # Queue for transmission by scheduler task
+                success = cwa_report.enqueue()
+                message = T("Result queued for reporting to %(system)s")
+            else:
+                success = cwa_report.send()
+                message = T("Result reported to %(system)s")
+            if success:
+                response.information = message % CWA
                 retry = False
             else:
                 response.error = T("Report to %(system)s failed") % CWA
@@ -577,9 +588,14 @@ class TestResultRegistration(CRUDMethod):
         except ValueError:
             r.error(400, current.ERROR.BAD_RECORD)
 
-        success = cwareport.send()
-        if success:
+        if current.deployment_settings.get_custom("cwa_queue"):
+            # Re-queue for immediate transmission
+            success = cwareport.enqueue()
+            message = T("Result queued for reporting to %(system)s") % CWA
+        else:
+            success = cwareport.send()
             message = T("Result reported to %(system)s") % CWA
+        if success:
             output = current.xml.json_message(message=message)
         else:
             r.error(503, T("Report to %(system)s failed") % CWA)
@@ -960,13 +976,14 @@ class CWAReport:
         ConsentTracking.assert_consent(dhash, processing_type, response)
 
     # -------------------------------------------------------------------------
-    def send(self):
+    def testresult(self):
         """
-            Send the CWA Report to the server;
+            Build the QuickTestResult JSON structure for this report;
             see also: https://github.com/corona-warn-app/cwa-quicktest-onboarding/blob/master/api/quicktest-openapi.json
 
             Returns:
-                True|False whether successful
+                the QuickTestResult as dict, or None if the test result
+                cannot be reported
         """
 
         # Encode the result
@@ -974,23 +991,131 @@ class CWAReport:
         result = results.get(self.result)
         if not result:
             current.log.error("CWAReport: invalid test result %s" % self.result)
-            return False
+            return None
 
-        # Build the QuickTestResult JSON structure
         data = self.data
-        testresult = {"id": data.get("hash"),
-                      "sc": data.get("timestamp"),
-                      "result": result,
-                      }
+        return {"id": data.get("hash"),
+                "sc": data.get("timestamp"),
+                "result": result,
+                }
+
+    # -------------------------------------------------------------------------
+    def lab_id(self):
+        """
+            Look up the Point-of-Care ID of the test station, which is
+            required for DCC requests
+
+            Returns:
+                the LabID, or None if no DCC is requested
+        """
+
+        if not self.dcc:
+            return None
+
+        lab_id = DCC.get_issuer_id(self.site_id)
+        if not lab_id:
+            raise RuntimeError("Point-of-Care ID for test station not found")
+
+        return lab_id
+
+    # -------------------------------------------------------------------------
+    def send(self):
+        """
+            Send the CWA Report to the server
+
+            Returns:
+                True|False whether successful
+        """
+
+        testresult = self.testresult()
+        if not testresult:
+            return False
+
+        status, error = CWATransmitter.get().transmit([testresult],
+                                                      lab_id = self.lab_id(),
+                                                      )
+        if error:
+            current.log.error("CWAReport: transmission to CWA server failed (%s)" % error)
+            return False
+
+        # Success
+        return True
+
+    # -------------------------------------------------------------------------
+    def enqueue(self):
+        """
+            Queue the CWA Report for transmission to the server, see
+            CWAResultQueue
+
+            Returns:
+                True|False whether successful
+        """
+
+        testresult = self.testresult()
+        if not testresult:
+            return False
+
+        CWAResultQueue.enqueue(self.result_id, testresult,
+                               lab_id = self.lab_id(),
+                               )
+        return True
+
+# =============================================================================
+class CWATransmitter:
+    """
+        Client for the CWA result server, using a pooled session, so
+        that connections (including the TLS handshake with the client
+        certificate) are reused for subsequent transmissions
+    """
+
+    # Process-level instances, by configuration
+    instances = {}
+    lock = threading.Lock()
+
+    def __init__(self, server_url, cert=None, verify=True, timeout=30, pool_size=4):
+        """
+            Args:
+                server_url: the URL of the result server endpoint
+                cert: the client certificate, tuple (cert, key)
+                verify: the CA certificate(s) to verify the server
+                        identity, or True to use python-certifi
+                timeout: the timeout for server responses (seconds)
+                pool_size: the maximum number of connections to keep
+        """
+
+        self.server_url = server_url
+        self.timeout = timeout
+
+        adapter = HTTPAdapter(pool_connections = 1,
+                              pool_maxsize = pool_size,
+                              )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.cert = cert
+        session.verify = verify
+
+        self.session = session
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get(cls):
+        """
+            Get the transmitter for the configured CWA server
+
+            Returns:
+                the CWATransmitter instance
+        """
 
-        # The CWA server URL
         settings = current.deployment_settings
+        folder = current.request.folder
+
+        # The CWA server URL
         server_url = settings.get_custom("cwa_server_url")
         if not server_url:
             raise RuntimeError("No CWA server URL configured")
 
         # The client credentials to access the server
-        folder = current.request.folder
         cert = settings.get_custom("cwa_client_certificate")
         key = settings.get_custom("cwa_certificate_key")
         if not cert or not key:
@@ -1002,43 +1127,251 @@ class CWAReport:
         verify = settings.get_custom("cwa_server_ca")
         if verify:
             # Use the specified CA Certificate to verify server identity
-            verify = "%s/%s" % (current.request.folder, verify)
+            verify = "%s/%s" % (folder, verify)
         else:
             # Use python-certifi (=> make sure the latest version is installed)
             verify = True
 
-        # Build the result_list
-        result_list = {"testResults": [testresult]}
-        if self.dcc:
-            # Look up the LabID
-            lab_id = DCC.get_issuer_id(self.site_id)
-            if not lab_id:
-                raise RuntimeError("Point-of-Care ID for test station not found")
-            else:
-                result_list["labId"] = lab_id
+        config = (server_url, cert, key, verify)
+        with cls.lock:
+            instance = cls.instances.get(config)
+            if instance is None:
+                instance = cls.instances[config] = cls(server_url,
+                                                       cert = (cert, key),
+                                                       verify = verify,
+                                                       )
+        return instance
+
+    # -------------------------------------------------------------------------
+    def transmit(self, testresults, lab_id=None):
+        """
+            Send a QuickTestResultList to the server
+
+            Args:
+                testresults: list of QuickTestResult dicts
+                lab_id: the LabID (Point-of-Care ID) for DCC requests
+
+            Returns:
+                tuple (status_code, error), status_code being None for
+                local errors, and error None if successful
+        """
+
+        result_list = {"testResults": testresults}
+        if lab_id:
+            result_list["labId"] = lab_id
 
-        # POST to server
         try:
-            sr = requests.post(server_url,
-                               # Send the QuickTestResultList
-                               json = result_list,
-                               cert = (cert, key),
-                               verify = verify,
-                               )
+            sr = self.session.post(self.server_url,
+                                   json = result_list,
+                                   timeout = self.timeout,
+                                   )
         except Exception:
             # Local error
-            error = sys.exc_info()[1]
-            current.log.error("CWAReport: transmission to CWA server failed (local error: %s)" % error)
-            return False
+            return None, "local error: %s" % sys.exc_info()[1]
 
         # Check return code (should be 204, but 202/200 would also be good news)
-        if sr.status_code not in (204, 202, 200):
+        status = sr.status_code
+        if status not in (204, 202, 200):
             # Remote error
-            current.log.error("CWAReport: transmission to CWA server failed, status code %s" % sr.status_code)
-            return False
+            return status, "status code %s" % status
 
-        # Success
-        return True
+        return status, None
+
+# =============================================================================
+class CWAResultQueue:
+    """
+        Outbound queue for test results to report to CWA (alternative to
+        sending every result synchronously during registration,
+        settings.custom.cwa_queue)
+
+        - registered test results are queued (disease_cwa_queue)
+        - a scheduler task (settings_task "send_cwa_results") sends the
+          pending results in batches (QuickTestResultList) per lab ID,
+          using a pooled session, and retries failed transmissions with
+          exponential backoff
+        - batches rejected by the server (4xx) are split up, so that only
+          the rejected test results are retried (and eventually failed)
+        - the task returns (and logs) latency and throughput metrics
+    """
+
+    # Maximum number of test results per transmission
+    BATCH_SIZE = 100
+
+    # Maximum number of test results per task run
+    LIMIT = 10000
+
+    # Backoff after the first failed attempt (seconds), doubled with
+    # every further attempt up to MAX_BACKOFF
+    BACKOFF = 60
+    MAX_BACKOFF = 3600
+
+    # Number of attempts after which a test result is marked as FAILED
+    MAX_ATTEMPTS = 24
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def enqueue(result_id, testresult, lab_id=None):
+        """
+            Queue a test result for transmission; if the test result is
+            already queued, it will be retried immediately
+
+            Args:
+                result_id: the disease_case_diagnostics record ID
+                testresult: the QuickTestResult (dict)
+                lab_id: the LabID (Point-of-Care ID) for DCC requests
+        """
+
+        db = current.db
+        table = current.s3db.disease_cwa_queue
+
+        query = (table.result_id == result_id)
+        entry = db(query).select(table.id,
+                                 limitby = (0, 1),
+                                 ).first()
+        if entry:
+            entry.update_record(lab_id = lab_id,
+                                testresult = testresult,
+                                status = "PENDING",
+                                attempts = 0,
+                                next_attempt = None,
+                                )
+        else:
+            table.insert(result_id = result_id,
+                         lab_id = lab_id,
+                         testresult = testresult,
+                         )
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def process(cls, transmitter=None):
+        """
+            Send all pending test results, scheduler task
+
+            Args:
+                transmitter: the CWATransmitter to use (default: the
+                             transmitter for the configured server)
+
+            Returns:
+                dict with metrics of this run
+        """
+
+        db = current.db
+        table = current.s3db.disease_cwa_queue
+
+        start = time.time()
+        now = datetime.datetime.utcnow()
+
+        query = (table.status == "PENDING") & \
+                ((table.next_attempt == None) | (table.next_attempt <= now))
+        rows = db(query).select(table.id,
+                                table.lab_id,
+                                table.testresult,
+                                table.queued_on,
+                                orderby = table.id,
+                                limitby = (0, cls.LIMIT),
+                                )
+
+        metrics = {"pending": len(rows),
+                   "sent": 0,
+                   "failed": 0,
+                   "batches": 0,
+                   "latency": None,
+                   "max_latency": None,
+                   "request_time": 0.0,
+                   "throughput": None,
+                   }
+        if not rows:
+            return metrics
+
+        if transmitter is None:
+            transmitter = CWATransmitter.get()
+
+        # Group the test results by lab ID, and split into batches
+        groups = {}
+        for row in rows:
+            groups.setdefault(row.lab_id, []).append(row)
+        BATCH_SIZE = cls.BATCH_SIZE
+        batches = [(lab_id, entries[i:i+BATCH_SIZE])
+                   for lab_id, entries in groups.items()
+                   for i in range(0, len(entries), BATCH_SIZE)
+                   ]
+
+        latencies = []
+        while batches:
+
+            lab_id, batch = batches.pop(0)
+            ids = [row.id for row in batch]
+
+            t = time.time()
+            status, error = transmitter.transmit([row.testresult for row in batch],
+                                                 lab_id = lab_id,
+                                                 )
+            metrics["request_time"] += time.time() - t
+            metrics["batches"] += 1
+
+            if error and status and 400 <= status < 500 and len(batch) > 1:
+                # Rejected by the server => split the batch to isolate the
+                # rejected test result(s), and send the halves separately
+                half = len(batch) // 2
+                batches[0:0] = [(lab_id, batch[:half]), (lab_id, batch[half:])]
+                continue
+
+            if error:
+                current.log.error("CWAResultQueue: transmission of %s results failed (%s)" % (len(batch), error))
+                cls.retry(ids, error)
+                metrics["failed"] += len(batch)
+            else:
+                db(table.id.belongs(ids)).delete()
+                metrics["sent"] += len(batch)
+                sent = datetime.datetime.utcnow()
+                latencies.extend((sent - row.queued_on).total_seconds()
+                                 for row in batch if row.queued_on)
+            db.commit()
+
+            if status is None:
+                # Local error (e.g. server not reachable) => try again
+                # later rather than failing all remaining batches
+                break
+
+        duration = time.time() - start
+        if latencies:
+            metrics["latency"] = sum(latencies) / len(latencies)
+            metrics["max_latency"] = max(latencies)
+        if duration:
+            metrics["throughput"] = metrics["sent"] / duration
+
+        current.log.info("CWAResultQueue: %(sent)s sent, %(failed)s failed in %(batches)s batches" % metrics)
+
+        return metrics
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def retry(cls, ids, error):
+        """
+            Schedule the next attempt for queue entries after a failed
+            transmission, or mark them as FAILED after MAX_ATTEMPTS
+
+            Args:
+                ids: the queue entry IDs
+                error: the error message
+        """
+
+        db = current.db
+        table = current.s3db.disease_cwa_queue
+
+        query = table.id.belongs(ids)
+        attempts = table.attempts.max()
+        row = db(query).select(attempts).first()
+        attempts = (row[attempts] or 0) + 1
+
+        backoff = min(cls.BACKOFF * 2 ** (attempts - 1), cls.MAX_BACKOFF)
+        next_attempt = datetime.datetime.utcnow() + datetime.timedelta(seconds=backoff)
+
+        db(query).update(attempts = table.attempts + 1,
+                         next_attempt = next_attempt,
+                         last_error = error,
+                         )
+        db(query & (table.attempts >= cls.MAX_ATTEMPTS)).update(status = "FAILED")
 
 # =============================================================================
 class CWACardLayout(RLPCardLayout):
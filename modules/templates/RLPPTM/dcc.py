@@ -8,13 +8,17 @@ import base64
 import cbor2
 import datetime
 import hashlib
-import json
 import re
 import requests
 import secrets
 import sys
+import threading
+import time
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from requests.adapters import HTTPAdapter
+
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
@@ -27,6 +31,11 @@ from gluon import current
 ISSUER_PREFIX = "lsjvrlp"
 EXPIRY_PERIOD = 48 # DCC expires 48h after probe
 
+POLL_WORKERS = 8 # Maximum number of concurrent requests to the DCC server
+POLL_BUDGET = 240 # Maximum run time of a poll cycle (seconds)
+REQUEST_TIMEOUT = 30 # Timeout for DCC server responses (seconds)
+SAVE_BATCH = 50 # Number of status updates to commit at once
+
 NONLATIN = re.compile(r"[^\u0020-\u0233\u1E02-\u1EF9]")
 SEPARATORS = re.compile(r"[\u002C\u0020\u002D]")
 DIACRITICS = {"A" : r"[\u00C0-\u00C3\u0100-\u0104\u01CD\u01DE\u01FA\u1EA0-\u1EB6]",
@@ -81,6 +90,10 @@ PEM_TEMPLATE = "-----BEGIN PUBLIC KEY-----\n%s\n-----END PUBLIC KEY-----"
 class DCC:
     """ Helper class to handle Digital Covid Certificates (DCCs) """
 
+    # Process-level pooled sessions, by configuration
+    sessions = {}
+    sessions_lock = threading.Lock()
+
     def __init__(self, instance_id):
         """
             Args:
@@ -229,17 +242,86 @@ class DCC:
         query = (table.instance_id == instance_id) & \
                 (table.type == "TEST") & \
                 (table.deleted == False)
-        row = db(query).select(table.disease_id,
-                               table.issuer_id,
-                               table.payload,
-                               table.vhash,
-                               table.status,
-                               table.valid_until,
-                               table.certified_on,
+        row = db(query).select(*cls.hcert_fields(table),
                                limitby = (0, 1),
                                ).first()
         if not row:
             raise ValueError("Certificate data not found")
+
+        return cls.from_row(row)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_all(cls, instance_ids):
+        """
+            Instantiate DCCs from stored HCERT data records, with a
+            single query
+
+            Args:
+                instance_ids: the instance IDs
+
+            Returns:
+                dict {instance_id: DCC instance}, omitting instances
+                that are not found or have invalid data
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        table = s3db.disease_hcert_data
+        query = (table.instance_id.belongs(set(instance_ids))) & \
+                (table.type == "TEST") & \
+                (table.deleted == False)
+        rows = db(query).select(*cls.hcert_fields(table))
+
+        instances = {}
+        for row in rows:
+            try:
+                instances[row.instance_id] = cls.from_row(row)
+            except ValueError:
+                continue
+
+        return instances
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def hcert_fields(table):
+        """
+            The fields to load from HCERT data records
+
+            Args:
+                table: the disease_hcert_data table
+
+            Returns:
+                list of Fields
+        """
+
+        return [table.instance_id,
+                table.disease_id,
+                table.issuer_id,
+                table.payload,
+                table.vhash,
+                table.status,
+                table.valid_until,
+                table.certified_on,
+                ]
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def from_row(cls, row):
+        """
+            Instantiate a DCC from a HCERT data row
+
+            Args:
+                row: the disease_hcert_data Row (with hcert_fields)
+
+            Returns:
+                DCC instance
+
+            Raises:
+                ValueError for invalid data
+        """
+
         issuer_id = row.issuer_id
         if not issuer_id:
             raise ValueError("Certificate data lacking issuer ID")
@@ -253,7 +335,7 @@ class DCC:
             raise ValueError(msg)
 
         # Create the instance and fill it with data
-        instance = cls(instance_id)
+        instance = cls(row.instance_id)
         instance.issuer_id = issuer_id
         instance.status = row.status
         instance.data = {"fn": data.get("fn"),
@@ -275,12 +357,14 @@ class DCC:
         return instance
 
     # -------------------------------------------------------------------------
-    def save(self, errors=None):
+    def save(self, errors=None, commit=True):
         """
             Store/update this instance as HCERT data record
 
             Args:
                 errors: error messages to store in the record
+                commit: commit status updates immediately (otherwise
+                        the caller must commit)
         """
 
         db = current.db
@@ -311,9 +395,10 @@ class DCC:
                 data["payload"] = None
             record.update_record(**data)
             s3db.onaccept(table, record, method="update")
-            # Prevent subsequent failures/timeouts from rolling back
-            # this status update
-            db.commit()
+            if commit:
+                # Prevent subsequent failures/timeouts from rolling back
+                # this status update
+                db.commit()
         else:
             # New record
             data = {"disease_id": self.data.get("disease"),
@@ -350,8 +435,6 @@ class DCC:
         if self.status != "PENDING":
             return "DCC upload failed, invalid status"
 
-        settings = current.deployment_settings
-
         # Encode + encrypt the DCC components
         try:
             dcc_json = self.encode(dcci, public_key)
@@ -365,39 +448,108 @@ class DCC:
         if not dcc_json:
             return "DCC upload failed, no data"
 
-        cert, key, verify = self.get_dcc_credentials()
+        status_code, errors = self.send(self.get_session(),
+                                        self.upload_url(self.instance_id),
+                                        dcc_json,
+                                        )
+        if not errors:
+            errors = self.upload_status(status_code)
 
-        # The server endpoint to send to
-        dcc_base_url = settings.get_custom("dcc_base_url")
-        endpoint = "%s/version/v1/test/%s/dcc" % (dcc_base_url.rstrip("/"), self.instance_id)
+        # Update record status
+        self.save(errors=errors)
+
+        return errors
+
+    # -------------------------------------------------------------------------
+    def upload_status(self, status_code):
+        """
+            Update the instance status from the server response to
+            an upload
+
+            Args:
+                status_code: the HTTP status code of the response
+
+            Returns:
+                error message on error, else None
+        """
+
+        # Check return code (should be 204, but 202/200 would also be good news)
+        if status_code not in (204, 202, 200, 409):
+            if status_code in (403, 404):
+                # Either test result was not found, or we're not
+                # authorized to certify it - this is a permanent
+                # error, so set status to invalid
+                self.status = "INVALID"
+            return "DCC upload failed, status code %s" % status_code
+
+        self.status = "ISSUED"
+        return None
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def upload_url(instance_id):
+        """
+            The server endpoint to upload a DCC to
+
+            Args:
+                instance_id: the DCC instance ID
+
+            Returns:
+                the URL as str
+        """
+
+        dcc_base_url = current.deployment_settings.get_custom("dcc_base_url")
+        return "%s/version/v1/test/%s/dcc" % (dcc_base_url.rstrip("/"), instance_id)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def send(session, endpoint, dcc_json):
+        """
+            Send an encrypted DCC to the server
+                - can run in worker threads (no database access)
+
+            Args:
+                session: the requests.Session to use
+                endpoint: the server endpoint
+                dcc_json: the encrypted DCC
+
+            Returns:
+                tuple (status_code, error), status_code being None for
+                local errors
+        """
 
-        errors = None
         try:
-            sr = requests.post(endpoint,
-                               json = dcc_json,
-                               cert = (cert, key),
-                               verify = verify,
-                               )
+            sr = session.post(endpoint,
+                              json = dcc_json,
+                              timeout = REQUEST_TIMEOUT,
+                              )
         except Exception:
             # Local errors
-            errors = "DCC upload failed (local error: %s)" % sys.exc_info()[1]
-        else:
-            # Check return code (should be 204, but 202/200 would also be good news)
-            status_code = sr.status_code
-            if status_code not in (204, 202, 200, 409):
-                errors = "DCC upload failed, status code %s" % status_code
-                if status_code in (403, 404):
-                    # Either test result was not found, or we're not
-                    # authorized to certify it - this is a permanent
-                    # error, so set status to invalid
-                    self.status = "INVALID"
-            else:
-                self.status = "ISSUED"
+            return None, "DCC upload failed (local error: %s)" % sys.exc_info()[1]
 
-        # Update record status
-        self.save(errors=errors)
+        return sr.status_code, None
 
-        return errors
+    # -------------------------------------------------------------------------
+    @classmethod
+    def transmit(cls, session, endpoint, hcert, public_key):
+        """
+            Encrypt and send a DCC to the server
+                - can run in worker threads (no database access)
+
+            Args:
+                session: the requests.Session to use
+                endpoint: the server endpoint
+                hcert: the HCERT as CBOR-bytestring
+                public_key: public key to encrypt the AES key
+
+            Returns:
+                tuple (status_code, error), see send()
+
+            Raises:
+                ValueError if the DCC cannot be encrypted
+        """
+
+        return cls.send(session, endpoint, cls.encrypt(hcert, public_key))
 
     # -------------------------------------------------------------------------
     # Instance helpers
@@ -441,6 +593,25 @@ class DCC:
                       }
         """
 
+        hcert = self.hcert(dcci)
+
+        return self.encrypt(hcert, public_key) if hcert else None
+
+    # -------------------------------------------------------------------------
+    def hcert(self, dcci, facility_names=None):
+        """
+            Encode this instance as HCERT
+
+            Args:
+                dcci: the certificate ID from the DCC request,
+                      e.g. "URN:UVCI:V1:DE:DMN3L94E7PBDYYLAPNNSS5T218"
+                facility_names: dict {site_id: name} of previously
+                                looked-up test station names
+
+            Returns:
+                the HCERT as CBOR-bytestring
+        """
+
         data = self.data
         if not data:
             return None
@@ -459,10 +630,10 @@ class DCC:
         tr = result_codes.get(result)
 
         # Look up site name from site
-        ftable = current.s3db.org_facility
-        query = (ftable.site_id == data.get("site"))
-        facility = current.db(query).select(ftable.name, limitby=(0, 1)).first()
-        tc = facility.name if facility else None
+        site_id = data.get("site")
+        if facility_names is None:
+            facility_names = self.facility_names([site_id])
+        tc = facility_names.get(site_id)
 
         # Device code
         ma = data.get("device")
@@ -504,7 +675,7 @@ class DCC:
                  -260: { 1: data },
                  }
 
-        return self.encrypt(cbor2.dumps(hcert), public_key)
+        return cbor2.dumps(hcert)
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -564,6 +735,14 @@ class DCC:
     def poll(cls):
         """
             Poll the server for DCC requests, and issue any requested DCCs
+                - polls all issuers concurrently, and encrypts/uploads
+                  the DCCs in the same worker pool
+                - stops after the run time budget (settings.custom.
+                  dcc_poll_budget); deferred requests will be picked up
+                  by the next poll cycle
+
+            Returns:
+                error messages (str), or None if there were no errors
         """
 
         db = current.db
@@ -571,6 +750,8 @@ class DCC:
 
         settings = current.deployment_settings
 
+        deadline = time.time() + settings.get_custom("dcc_poll_budget", POLL_BUDGET)
+
         # Get the issuer IDs for all pending DCCs
         now = datetime.datetime.utcnow()
         table = s3db.disease_hcert_data
@@ -581,58 +762,91 @@ class DCC:
         rows = db(query).select(table.issuer_id,
                                 groupby = table.issuer_id,
                                 )
-
-        # The client credentials to access the server
-        cert, key, verify = cls.get_dcc_credentials()
+        if not rows:
+            return None
 
         # The server endpoint to poll
         dcc_base_url = settings.get_custom("dcc_base_url")
         endpoint = "%s/version/v1/publicKey/search" % (dcc_base_url.rstrip("/"))
 
-        errors = []
-        for row in rows:
-            # Search URL is per-issuer
-            search_url = "%s/%s" % (endpoint, row.issuer_id)
-            try:
-                sr = requests.get(search_url,
-                                  cert = (cert, key),
-                                  verify = verify,
-                                  )
-            except Exception:
-                # Local error
-                msg = "DCC requests: polling %s failed (local error: %s)" % \
-                      (search_url, sys.exc_info()[1])
-                errors.append(msg)
-                current.log.error(msg)
-                continue
-
-            # Check return code
-            if sr.status_code != 200:
-                # Remote error
-                msg = "DCC requests: polling %s failed, status code %s" % \
-                      (search_url, sr.status_code)
-                errors.append(msg)
-                current.log.error(msg)
-                continue
+        session = cls.get_session()
 
-            # Decode the results
+        errors = []
+        futures = []
+        executor = ThreadPoolExecutor(max_workers=cls.workers())
+        try:
+            # Poll all issuers concurrently (search URL is per-issuer)
+            futures = [executor.submit(cls.search, session, "%s/%s" % (endpoint, row.issuer_id))
+                       for row in rows
+                       ]
+            requested_dccs = []
             try:
-                requested_dccs = sr.json()
-            except json.JSONDecodeError:
-                msg = "DCC results: %s server response parse error: %s" % \
-                      (search_url, sys.exc_info()[1])
+                for future in as_completed(futures, timeout=max(deadline - time.time(), 0)):
+                    dccs, error = future.result()
+                    if error:
+                        errors.append(error)
+                        current.log.error(error)
+                    elif isinstance(dccs, list):
+                        requested_dccs.extend(dccs)
+            except TimeoutError:
+                msg = "DCC requests: poll cycle budget exceeded, polling deferred"
                 errors.append(msg)
                 current.log.error(msg)
-                continue
 
             # If there are any requests, issue the DCCs
-            cls.issue(requested_dccs)
+            if requested_dccs:
+                errors.extend(cls.issue(requested_dccs,
+                                        executor = executor,
+                                        deadline = deadline,
+                                        ))
+        finally:
+            # Drop any polls that have not started yet
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
         return "\n".join(errors) if errors else None
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def search(session, url):
+        """
+            Search for DCC requests of an issuer
+                - can run in worker threads (no database access)
+
+            Args:
+                session: the requests.Session to use
+                url: the search URL
+
+            Returns:
+                tuple (requested_dccs, error)
+        """
+
+        try:
+            sr = session.get(url, timeout=REQUEST_TIMEOUT)
+        except Exception:
+            # Local error
+            return None, "DCC requests: polling %s failed (local error: %s)" % \
+                         (url, sys.exc_info()[1])
+
+        # Check return code
+        if sr.status_code != 200:
+            # Remote error
+            return None, "DCC requests: polling %s failed, status code %s" % \
+                         (url, sr.status_code)
+
+        # Decode the results
+        try:
+            requested_dccs = sr.json()
+        except ValueError:
+            return None, "DCC results: %s server response parse error: %s" % \
+                         (url, sys.exc_info()[1])
+
+        return requested_dccs, None
+
     # -------------------------------------------------------------------------
     @classmethod
-    def issue(cls, dcc_request_list):
+    def issue(cls, dcc_request_list, executor=None, deadline=None):
         """
             Upload the requested DCCs
 
@@ -642,32 +856,209 @@ class DCC:
                          "dcci":      certificate ID,
                          "publicKey": public RSA key to encrypt the AES key
                          }
+                executor: the ThreadPoolExecutor to encrypt and upload
+                          the DCCs with (default: a new executor)
+                deadline: the time (timestamp) after which no further
+                          uploads shall be started, nor their results
+                          be waited for
+
+            Returns:
+                list of error messages
         """
 
         if not isinstance(dcc_request_list, list):
-            return
+            return []
 
+        # Collect the valid requests
+        requested = {}
         for item in dcc_request_list:
             if not isinstance(item, dict):
                 continue
-
             instance_id = item.get("testId")
-            if not instance_id:
-                continue
-            try:
-                inst = cls.load(instance_id)
-            except ValueError:
-                continue
-
             dcci = item.get("dcci")
             public_key = item.get("publicKey")
-            if not dcci or not public_key:
+            if not instance_id or not dcci or not public_key:
                 continue
+            requested[instance_id] = (dcci, public_key)
+        if not requested:
+            return []
+
+        # Load all requested DCCs, and the names of their test stations
+        instances = cls.load_all(list(requested))
+        facility_names = cls.facility_names({inst.data.get("site")
+                                             for inst in instances.values()
+                                             })
+
+        errors = []
 
-            inst.upload(dcci, public_key)
+        shutdown = executor is None
+        if shutdown:
+            executor = ThreadPoolExecutor(max_workers=cls.workers())
+        try:
+            session = cls.get_session()
+
+            # Encode the DCCs, and hand them over to the workers for
+            # encryption and upload
+            jobs = []
+            for instance_id, inst in instances.items():
+                if deadline and time.time() > deadline:
+                    msg = "DCC upload: poll cycle budget exceeded, %s uploads deferred" % \
+                          (len(instances) - len(jobs))
+                    errors.append(msg)
+                    current.log.error(msg)
+                    break
+                if inst.status != "PENDING":
+                    continue
+                dcci, public_key = requested[instance_id]
+                try:
+                    hcert = inst.hcert(dcci, facility_names=facility_names)
+                except ValueError:
+                    jobs.append((inst, None, sys.exc_info()[1]))
+                    continue
+                if not hcert:
+                    continue
+                future = executor.submit(cls.transmit,
+                                         session,
+                                         cls.upload_url(instance_id),
+                                         hcert,
+                                         public_key,
+                                         )
+                jobs.append((inst, future, None))
+
+            # Collect the results as they complete (until the deadline),
+            # commit status updates in batches
+            db = current.db
+            saved = [0]
+            def save(inst, future, exception):
+                error = None
+                if future:
+                    try:
+                        status_code, error = future.result()
+                    except ValueError:
+                        exception = sys.exc_info()[1]
+                    else:
+                        if not error:
+                            error = inst.upload_status(status_code)
+                if exception:
+                    # This is a permanent error, so set status to invalid
+                    error = "DCC encoding failed, %s" % exception
+                    inst.status = "INVALID"
+                if error:
+                    errors.append(error)
+                inst.save(errors=error, commit=False)
+                saved[0] += 1
+                if saved[0] % SAVE_BATCH == 0:
+                    db.commit()
+
+            pending = {}
+            for inst, future, exception in jobs:
+                if future:
+                    pending[future] = inst
+                else:
+                    save(inst, None, exception)
+
+            timeout = max(deadline - time.time(), 0) if deadline else None
+            try:
+                for future in as_completed(pending, timeout=timeout):
+                    save(pending.pop(future), future, None)
+            except TimeoutError:
+                # Save uploads completed meanwhile, drop uploads that have
+                # not started yet; instances of any unfinished uploads stay
+                # PENDING and will be re-uploaded in the next poll cycle
+                unfinished = 0
+                for future, inst in pending.items():
+                    if future.done() and not future.cancelled():
+                        save(inst, future, None)
+                    else:
+                        future.cancel()
+                        unfinished += 1
+                if unfinished:
+                    msg = "DCC upload: poll cycle budget exceeded, %s uploads deferred" % \
+                          unfinished
+                    errors.append(msg)
+                    current.log.error(msg)
+            db.commit()
+        finally:
+            if shutdown:
+                # Do not wait for unfinished uploads beyond the deadline
+                executor.shutdown(wait=not deadline)
+
+        return errors
 
     # -------------------------------------------------------------------------
     # Tools
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get_session(cls):
+        """
+            Get a pooled session for access to the DCC server, so that
+            connections (including the TLS handshake with the client
+            certificate) are reused; the pool size limits the number of
+            concurrent connections to the server
+
+            Returns:
+                a requests.Session
+        """
+
+        cert, key, verify = cls.get_dcc_credentials()
+        workers = cls.workers()
+
+        config = (cert, key, verify, workers)
+        with cls.sessions_lock:
+            session = cls.sessions.get(config)
+            if session is None:
+                adapter = HTTPAdapter(pool_connections = 1,
+                                      pool_maxsize = workers,
+                                      pool_block = True,
+                                      )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.cert = (cert, key)
+                session.verify = verify
+                cls.sessions[config] = session
+
+        return session
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def workers():
+        """
+            The maximum number of concurrent requests to the DCC server
+            (settings.custom.dcc_poll_workers)
+
+            Returns:
+                the number of workers (int)
+        """
+
+        workers = current.deployment_settings.get_custom("dcc_poll_workers", POLL_WORKERS)
+        return max(int(workers), 1)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def facility_names(site_ids):
+        """
+            Look up the names of test stations
+
+            Args:
+                site_ids: the site IDs
+
+            Returns:
+                dict {site_id: name}
+        """
+
+        site_ids = [site_id for site_id in site_ids if site_id]
+        if not site_ids:
+            return {}
+
+        ftable = current.s3db.org_facility
+        query = (ftable.site_id.belongs(site_ids))
+        rows = current.db(query).select(ftable.site_id,
+                                        ftable.name,
+                                        )
+
+        return {row.site_id: row.name for row in rows}
+
     # -------------------------------------------------------------------------
     @staticmethod
     def get_issuer_id(site_id):
@@ -731,20 +1122,16 @@ class DCC:
 
         settings = current.deployment_settings
 
-        # The client credentials to access the server
-        cert, key, verify = cls.get_dcc_credentials()
-
         # The server endpoint to register
         dcc_base_url = settings.get_custom("dcc_base_url")
         endpoint = "%s/version/v1/labId" % dcc_base_url
 
         # POST to server
         try:
-            sr = requests.post(endpoint,
-                               json = {"labId": issuer_id},
-                               cert = (cert, key),
-                               verify = verify,
-                               )
+            sr = cls.get_session().post(endpoint,
+                                        json = {"labId": issuer_id},
+                                        timeout = REQUEST_TIMEOUT,
+                                        )
         except Exception:
             # Local error
             error = sys.exc_info()[1]
@@ -4,6 +4,7 @@
     License: MIT
 """
 
+import datetime
 import json
 
 from dateutil import rrule
@@ -1127,6 +1128,294 @@ def update_daily_report_by_demographic(site_id, result_date, disease_id):
                          tests_positive = row[positive],
                          )
 
+# =============================================================================
+class DailyReportQueue:
+    """
+        Batched updates of daily testing reports from individual test
+        results (alternative to updating the reports for every single
+        test result, settings.custom.testing_report_batch)
+
+        - new test results are queued as deltas, changed test results
+          are queued for a full recount of the respective report
+        - a scheduler task (settings_task "update_daily_reports")
+          coalesces the queue per report and applies the deltas
+        - reconcile() verifies the report totals against the recorded
+          test results, run by the daily maintenance
+    """
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def enqueue(site_id, result_date, disease_id,
+                demographic_id = None,
+                result = None,
+                recount = False,
+                ):
+        """
+            Queue an update of the daily testing report
+
+            Args:
+                site_id: the test station site ID
+                result_date: the result date of the test
+                disease_id: the disease ID
+                demographic_id: the demographic ID of the test
+                result: the test result (for new test results)
+                recount: recount all test results for the report
+                         (for changed test results)
+        """
+
+        table = current.s3db.disease_testing_report_queue
+
+        entry = {"site_id": site_id,
+                 "disease_id": disease_id,
+                 "date": result_date,
+                 "demographic_id": demographic_id,
+                 }
+        if recount:
+            entry["recount"] = True
+        else:
+            entry["tests_total"] = 1
+            entry["tests_positive"] = 1 if result == "POS" else 0
+
+        table.insert(**entry)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def process(cls):
+        """
+            Process all queued updates, scheduler task
+
+            Returns:
+                the number of processed queue entries
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        table = s3db.disease_testing_report_queue
+
+        # Only process entries which are in the queue now
+        maxid = table.id.max()
+        row = db(table.id > 0).select(maxid).first()
+        last_id = row[maxid] if row else None
+        if not last_id:
+            return 0
+
+        query = (table.id <= last_id)
+        rows = db(query).select(table.site_id,
+                                table.disease_id,
+                                table.date,
+                                table.demographic_id,
+                                table.tests_total,
+                                table.tests_positive,
+                                table.recount,
+                                )
+
+        # Coalesce the entries per report
+        updates = {}
+        for row in rows:
+            key = (row.site_id, row.date, row.disease_id)
+            update = updates.get(key)
+            if not update:
+                update = updates[key] = {"recount": False, "deltas": {}}
+            if row.recount:
+                update["recount"] = True
+                continue
+            deltas = update["deltas"]
+            delta = deltas.get(row.demographic_id)
+            if not delta:
+                delta = deltas[row.demographic_id] = [0, 0]
+            delta[0] += row.tests_total
+            delta[1] += row.tests_positive
+
+        for key, update in updates.items():
+            if update["recount"] or not cls.apply(key, update["deltas"]):
+                cls.recount(*key)
+
+        db(query).delete()
+
+        return len(rows)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def apply(key, deltas):
+        """
+            Apply deltas to an existing daily report
+
+            Args:
+                key: tuple (site_id, date, disease_id) of the report
+                deltas: dict {demographic_id: [tests_total, tests_positive]}
+
+            Returns:
+                True if successful, False if there is no report yet
+                (requires a full recount)
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        rtable = s3db.disease_testing_report
+
+        site_id, date, disease_id = key
+
+        # Look up the daily report
+        query = (rtable.site_id == site_id) & \
+                (rtable.disease_id == disease_id) & \
+                (rtable.date == date) & \
+                (rtable.deleted == False)
+        report = db(query).select(rtable.id,
+                                  limitby = (0, 1),
+                                  ).first()
+        if not report:
+            return False
+        report_id = report.id
+
+        if not current.deployment_settings.get_disease_testing_report_by_demographic():
+            # Update the report totals
+            total = sum(delta[0] for delta in deltas.values())
+            positive = sum(delta[1] for delta in deltas.values())
+            if total or positive:
+                db(rtable.id == report_id).update(
+                    tests_total = rtable.tests_total + total,
+                    tests_positive = rtable.tests_positive + positive,
+                    )
+            return True
+
+        dtable = s3db.disease_testing_demographic
+
+        # Get the last subtotal per demographic
+        query = (dtable.report_id == report_id) & \
+                (dtable.deleted == False)
+        rows = db(query).select(dtable.id,
+                                dtable.demographic_id,
+                                orderby = ~dtable.modified_on,
+                                )
+        subtotals = {}
+        for row in rows:
+            if row.demographic_id not in subtotals:
+                subtotals[row.demographic_id] = row.id
+
+        # Update the subtotals
+        set_record_owner = current.auth.s3_set_record_owner
+        for demographic_id, (total, positive) in deltas.items():
+            subtotal_id = subtotals.get(demographic_id)
+            if subtotal_id:
+                db(dtable.id == subtotal_id).update(
+                    tests_total = dtable.tests_total + total,
+                    tests_positive = dtable.tests_positive + positive,
+                    )
+            else:
+                subtotal = {"report_id": report_id,
+                            "demographic_id": demographic_id,
+                            "tests_total": total,
+                            "tests_positive": positive,
+                            }
+                subtotal_id = subtotal["id"] = dtable.insert(**subtotal)
+                set_record_owner(dtable, subtotal_id)
+
+        # Update the report totals from the subtotals
+        total = dtable.tests_total.sum()
+        positive = dtable.tests_positive.sum()
+        row = db(query).select(total, positive).first()
+        db(rtable.id == report_id).update(tests_total = row[total],
+                                          tests_positive = row[positive],
+                                          )
+        return True
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def recount(site_id, date, disease_id):
+        """
+            Update a daily report from all recorded test results
+
+            Args:
+                site_id: the test station site ID
+                date: the date of the report
+                disease_id: the disease ID
+        """
+
+        if current.deployment_settings.get_disease_testing_report_by_demographic():
+            update_daily_report_by_demographic(site_id, date, disease_id)
+        else:
+            update_daily_report(site_id, date, disease_id)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def reconcile(cls, days=7):
+        """
+            Verify the totals of recent daily reports against the recorded
+            test results, and update reports with too low totals
+
+            Args:
+                days: number of days to look back
+
+            Returns:
+                the number of updated reports
+        """
+
+        db = current.db
+        s3db = current.s3db
+
+        # Apply all pending updates first
+        cls.process()
+
+        start = current.request.utcnow.date() - datetime.timedelta(days=days)
+
+        # Recorded totals
+        table = s3db.disease_case_diagnostics
+        query = (table.result_date >= start) & \
+                (table.site_id != None) & \
+                (table.disease_id != None) & \
+                (table.deleted == False)
+        cnt = table.id.count()
+        rows = db(query).select(table.site_id,
+                                table.result_date,
+                                table.disease_id,
+                                table.result,
+                                cnt,
+                                groupby = (table.site_id,
+                                           table.result_date,
+                                           table.disease_id,
+                                           table.result,
+                                           ),
+                                )
+        recorded = {}
+        for row in rows:
+            record = row.disease_case_diagnostics
+            key = (record.site_id, record.result_date, record.disease_id)
+            item = recorded.get(key)
+            if not item:
+                item = recorded[key] = [0, 0]
+            num = row[cnt]
+            item[0] += num
+            if record.result == "POS":
+                item[1] += num
+
+        # Reported totals
+        rtable = s3db.disease_testing_report
+        query = (rtable.date >= start) & \
+                (rtable.deleted == False)
+        rows = db(query).select(rtable.site_id,
+                                rtable.date,
+                                rtable.disease_id,
+                                rtable.tests_total,
+                                rtable.tests_positive,
+                                )
+        reported = {}
+        for row in rows:
+            key = (row.site_id, row.date, row.disease_id)
+            if key not in reported:
+                reported[key] = (row.tests_total or 0, row.tests_positive or 0)
+
+        # Update reports with totals lower than the recorded totals
+        updated = 0
+        for key, (total, positive) in recorded.items():
+            report = reported.get(key)
+            if not report or report[0] < total or report[1] < positive:
+                cls.recount(*key)
+                updated += 1
+
+        return updated
+
 # =============================================================================
 def rlp_holidays(start, end):
     """
@@ -1383,11 +1672,17 @@ class OrganisationRepresent(S3Represent):
         - relevant for facility approval
     """
 
+    # Organisation types are part of the representation
+    cache_depends = ("org_organisation_organisation_type",
+                     "org_organisation_type",
+                     )
+
     def __init__(self, show_type=True, show_link=True):
 
         super().__init__(lookup = "org_organisation",
                          fields = ["name",],
                          show_link = show_link,
+                         cache = True,
                          )
         self.show_type = show_type
         self.org_types = {}
@@ -54,6 +54,20 @@ class Daily():
         # Check/update verification status for changed org type requirements
         self.check_verification_status()
 
+        # Verify daily testing reports updated in batches
+        if current.deployment_settings.get_custom("testing_report_batch"):
+            from .helpers import DailyReportQueue
+            DailyReportQueue.reconcile()
+
+        # Rebuild testing report aggregates (to catch changes of test
+        # station locations, which do not mark the aggregates dirty)
+        if current.deployment_settings.get_disease_testing_report_aggregates():
+            from core import PivotTableAggregates
+            s3db.table("disease_testing_report")
+            PivotTableAggregates.refresh_all("disease_testing_report",
+                                             rebuild = True,
+                                             )
+
         # On Sundays, cleanup public test station registry
         settings = current.deployment_settings
         if settings.get_custom(key="test_station_cleanup") and \
@@ -26,6 +26,8 @@
 """
 
 __all__ = ("DiseaseDaycareTestingInquiryModel",
+           "DiseaseTestingReportQueueModel",
+           "DiseaseCWAQueueModel",
            "disease_daycare_testing_get_pending_responders",
            )
 
@@ -36,7 +38,7 @@ from gluon import current, Field, \
 from gluon.sqlhtml import OptionsWidget
 from gluon.storage import Storage
 
-from core import DataModel, OptionsFilter, TextFilter, \
+from core import DataModel, DateTimeField, OptionsFilter, TextFilter, \
                  get_form_record_id, represent_option, \
                  CommentsField, s3_yes_no_represent
 
@@ -232,6 +234,91 @@ class DiseaseDaycareTestingInquiryModel(DataModel):
             form_vars.frequency = None
             form_vars.number_of_dc = None
 
+# =============================================================================
+class DiseaseTestingReportQueueModel(DataModel):
+    """
+        Queue for batched updates of daily testing reports from
+        individual test results, see helpers.DailyReportQueue
+    """
+
+    names = ("disease_testing_report_queue",
+             )
+
+    def model(self):
+
+        # ---------------------------------------------------------------------
+        # Testing Report Update Queue
+        # - an entry per registered test result (delta), or per changed
+        #   test result (recount)
+        #
+        tablename = "disease_testing_report_queue"
+        self.define_table(tablename,
+                          self.super_link("site_id", "org_site"),
+                          self.disease_disease_id(),
+                          Field("date", "date"),
+                          self.disease_demographic_id(),
+                          Field("tests_total", "integer",
+                                default = 0,
+                                ),
+                          Field("tests_positive", "integer",
+                                default = 0,
+                                ),
+                          Field("recount", "boolean",
+                                default = False,
+                                ),
+                          meta = False,
+                          )
+
+        # ---------------------------------------------------------------------
+        # Pass names back to global scope (s3.*)
+        #
+        return None
+
+# =============================================================================
+class DiseaseCWAQueueModel(DataModel):
+    """
+        Outbound queue for test results to report to the CWA result
+        server, see cwa.CWAResultQueue
+    """
+
+    names = ("disease_cwa_queue",
+             )
+
+    def model(self):
+
+        # ---------------------------------------------------------------------
+        # CWA Transmission Queue
+        # - an entry per test result to report
+        #
+        tablename = "disease_cwa_queue"
+        self.define_table(tablename,
+                          Field("result_id", "reference disease_case_diagnostics",
+                                ondelete = "CASCADE",
+                                ),
+                          # The Point-of-Care ID (for DCC requests)
+                          Field("lab_id"),
+                          # The QuickTestResult to send
+                          Field("testresult", "json"),
+                          # PENDING|FAILED
+                          Field("status",
+                                default = "PENDING",
+                                ),
+                          Field("attempts", "integer",
+                                default = 0,
+                                ),
+                          DateTimeField("queued_on",
+                                        default = "now",
+                                        ),
+                          DateTimeField("next_attempt"),
+                          Field("last_error", "text"),
+                          meta = False,
+                          )
+
+        # ---------------------------------------------------------------------
+        # Pass names back to global scope (s3.*)
+        #
+        return None
+
 # =============================================================================
 def disease_daycare_testing_get_pending_responders(managed_orgs):
     """
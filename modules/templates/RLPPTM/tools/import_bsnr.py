@@ -67,6 +67,14 @@ def import_prep(tree):
         if uid:
             element.set("uuid", uid)
 
+# -----------------------------------------------------------------------------
+def import_progress(tablename, done, total):
+    """
+        Report import progress (bulk mode)
+    """
+
+    info("%s/%s..." % (done, total))
+
 # -----------------------------------------------------------------------------
 # Import BSNR
 #
@@ -76,7 +84,8 @@ if not failed:
     folder = current.request.folder
     template = os.path.join(folder, "modules", "templates", "RLPPTM")
 
-    current.response.s3.import_prep=import_prep
+    current.response.s3.import_prep = import_prep
+    current.response.s3.import_progress = import_progress
     stylesheet = os.path.join(template, "formats", "import", "org_bsnr.xsl")
 
     try:
@@ -87,6 +96,7 @@ if not failed:
                                          stylesheet = stylesheet,
                                          commit = True,
                                          ignore_errors = True,
+                                         bulk = True,
                                          )
     except IOError:
         failed = True
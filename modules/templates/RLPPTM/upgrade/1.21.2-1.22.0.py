@@ -0,0 +1,77 @@
+# Database upgrade script
+#
+# RLPPTM Template Version 1.21.2 => 1.22.0
+#
+# Execute in web2py folder after code upgrade like:
+# python web2py.py -S eden -M -R applications/eden/modules/templates/RLPPTM/upgrade/1.21.2-1.22.0.py
+#
+import sys
+
+#from core import S3Duplicate
+
+# Override auth (disables all permission checks)
+auth.override = True
+
+# Initialize failed-flag
+failed = False
+
+# Info
+def info(msg):
+    sys.stderr.write("%s" % msg)
+    sys.stderr.flush()
+def infoln(msg):
+    sys.stderr.write("%s\n" % msg)
+    sys.stderr.flush()
+
+# Load models for tables
+ptable = s3db.fin_voucher_program
+htable = s3db.fin_voucher_chain
+
+# Paths
+IMPORT_XSLT_FOLDER = os.path.join(request.folder, "static", "formats", "s3csv")
+TEMPLATE_FOLDER = os.path.join(request.folder, "modules", "templates", "RLPPTM")
+
+# -----------------------------------------------------------------------------
+# Create indexes for voucher transactions
+#
+if not failed:
+    info("Create indexes for voucher transactions")
+
+    try:
+        s3db.fin_voucher_create_indexes()
+    except Exception as e:
+        infoln("...failed")
+        infoln(sys.exc_info()[1])
+        failed = True
+    else:
+        infoln("...done")
+
+# -----------------------------------------------------------------------------
+# Create transaction chain heads for existing voucher programs
+#
+if not failed:
+    info("Create transaction chain heads")
+
+    left = htable.on(htable.program_id == ptable.id)
+    query = (ptable.deleted == False) & (htable.id == None)
+    rows = db(query).select(ptable.id, left=left)
+
+    created = 0
+    for row in rows:
+        s3db.fin_VoucherProgram.create_chain_head(row.id)
+        created += 1
+        info(".")
+
+    infoln("...done (%s chain heads created)" % created)
+
+# -----------------------------------------------------------------------------
+# Finishing up
+#
+if failed:
+    db.rollback()
+    infoln("UPGRADE FAILED - Action rolled back.")
+else:
+    db.commit()
+    infoln("UPGRADE SUCCESSFUL.")
+
+# END =========================================================================
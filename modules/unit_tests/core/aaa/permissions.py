@@ -507,6 +507,106 @@ class HasPermissionTests(unittest.TestCase):
         assertFalse(permitted)
         auth.s3_remove_role(auth.user.id, self.editor)
 
+    # -------------------------------------------------------------------------
+    def testACLCache(self):
+        """ Test permission check with cross-request ACL cache """
+
+        auth = current.auth
+        settings = current.deployment_settings
+
+        acl_cache = settings.get_security_acl_cache()
+        settings.security.policy = 5
+        settings.security.acl_cache = 60
+
+        assertTrue = self.assertTrue
+        assertFalse = self.assertFalse
+        assertEqual = self.assertEqual
+
+        c = "org"
+        f = "permission_test"
+        tablename = "org_permission_test"
+
+        try:
+            auth.permission = S3Permission(auth)
+            auth.s3_impersonate("normaluser@example.com")
+            auth.s3_assign_role(auth.user.id, self.reader)
+
+            permitted = auth.s3_has_permission("read", c=c, f=f, table=tablename)
+            assertTrue(permitted)
+
+            # Simulate a subsequent request
+            auth.permission = S3Permission(auth)
+            permitted = auth.s3_has_permission("read", c=c, f=f, table=tablename)
+            assertTrue(permitted)
+
+            stats = auth.permission.stats
+            assertEqual(stats["checks"], 1)
+            assertEqual(stats["lookups"], 1)
+            assertEqual(stats["hits"], 1)
+
+            # Changing the ACL expires the cache
+            auth.permission.update_acl(self.reader, t=tablename,
+                                       uacl=auth.permission.NONE,
+                                       oacl=auth.permission.NONE,
+                                       )
+            auth.permission = S3Permission(auth)
+            permitted = auth.s3_has_permission("read", c=c, f=f, table=tablename)
+            assertFalse(permitted)
+            assertEqual(auth.permission.stats["hits"], 0)
+
+            auth.s3_remove_role(auth.user.id, self.reader)
+        finally:
+            settings.security.acl_cache = acl_cache
+
+    # -------------------------------------------------------------------------
+    def testACLVersion(self):
+        """ Test detection of realm changes by the ACL version """
+
+        auth = current.auth
+        db = current.db
+        s3db = current.s3db
+
+        assertNotEqual = self.assertNotEqual
+
+        def version():
+            # Simulate a subsequent request
+            auth.permission = S3Permission(auth)
+            return auth.permission.acl_version()
+
+        # Write directly to the tables, i.e. bypassing any
+        # onaccept/ondelete callbacks that would expire the
+        # cache (=detected by table version counters only)
+        version_0 = version()
+
+        rtable = s3db.pr_role
+        role_id = rtable.insert(pe_id = self.org[0],
+                                role = "TestOrgUnits",
+                                role_type = 1,
+                                )
+        version_1 = version()
+        assertNotEqual(version_1, version_0)
+
+        atable = s3db.pr_affiliation
+        affiliation_id = atable.insert(role_id = role_id,
+                                       pe_id = self.org[1],
+                                       )
+        version_2 = version()
+        assertNotEqual(version_2, version_1)
+
+        # Removing an affiliation altogether changes the version too
+        db(atable.id == affiliation_id).delete()
+        version_3 = version()
+        assertNotEqual(version_3, version_2)
+
+        # Same for person-user links
+        ltable = s3db.pr_person_user
+        link_id = ltable.insert(pe_id = self.org[2])
+        version_4 = version()
+        assertNotEqual(version_4, version_3)
+
+        db(ltable.id == link_id).delete()
+        assertNotEqual(version(), version_4)
+
     # -------------------------------------------------------------------------
     def testPolicy4(self):
         """ Test permission check with policy 4 """
@@ -0,0 +1,143 @@
+# Eden Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/core/filters/options.py
+
+import unittest
+
+from gluon import *
+from core import *
+
+from unit_tests import run_suite
+
+# =============================================================================
+class OptionsFilterTests(unittest.TestCase):
+    """ Tests for OptionsFilter option lookups """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        self.organisation_id = self.add_office("OptionsFilterTestOrg")
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def add_office(name):
+        """
+            Create an organisation with an office
+
+            Args:
+                name: the organisation name
+
+            Returns:
+                the organisation ID
+        """
+
+        s3db = current.s3db
+
+        organisation_id = s3db.org_organisation.insert(name=name)
+        s3db.org_office.insert(name = "%s Office" % name,
+                               organisation_id = organisation_id,
+                               )
+        return organisation_id
+
+    # -------------------------------------------------------------------------
+    def testPrefetch(self):
+        """ Test batch lookup of options for multiple widgets """
+
+        assertEqual = self.assertEqual
+
+        resource = current.s3db.resource("org_office")
+        rfield = S3ResourceField(resource, "organisation_id")
+
+        widgets = [OptionsFilter("organisation_id"),
+                   OptionsFilter("name"),
+                   DateFilter("created_on"),
+                   ]
+        widget = widgets[0]
+        expected = set(widget._lookup_options(resource, rfield))
+        self.assertIn(self.organisation_id, expected)
+
+        OptionsFilter.prefetch(widgets, resource)
+
+        # Prefetched options are used once, for the same resource
+        prefetched = widget._prefetched
+        self.assertIs(prefetched[0], resource)
+        assertEqual(set(prefetched[2]), expected)
+        assertEqual(set(widget._lookup_options(resource, rfield)), expected)
+        assertEqual(widget._prefetched, None)
+
+        self.assertIn("OptionsFilterTestOrg Office", widgets[1]._prefetched[2])
+
+    # -------------------------------------------------------------------------
+    def testCache(self):
+        """ Test cross-request caching of options """
+
+        settings = current.deployment_settings
+
+        ttl = settings.search.get("filter_options_cache")
+        settings.search.filter_options_cache = 60
+        try:
+            widget = OptionsFilter("organisation_id")
+
+            resource = current.s3db.resource("org_office")
+            rfield = S3ResourceField(resource, "organisation_id")
+            options = widget._lookup_options(resource, rfield)
+            self.assertIn(self.organisation_id, options)
+
+            # Adding a record invalidates the cached options
+            organisation_id = self.add_office("OptionsFilterTestOrg2")
+
+            resource = current.s3db.resource("org_office")
+            options = widget._lookup_options(resource, rfield)
+            self.assertIn(organisation_id, options)
+        finally:
+            settings.search.filter_options_cache = ttl
+
+    # -------------------------------------------------------------------------
+    def testTableVersion(self):
+        """ Test version counters of the tables involved in lookups """
+
+        assertNotEqual = self.assertNotEqual
+
+        db = current.db
+        s3db = current.s3db
+
+        table = s3db.org_office
+        tablenames = ["org_office", "org_organisation"]
+
+        version = TableVersion.token(tablenames)
+        self.assertIn("org_office", TableVersion.tables)
+
+        # Insert
+        organisation_id = self.add_office("OptionsFilterTestOrg3")
+        updated = TableVersion.token(tablenames)
+        assertNotEqual(updated, version)
+        version = updated
+
+        # Update
+        query = (table.organisation_id == organisation_id)
+        db(query).update(name="OptionsFilterTestOrg3 Main Office")
+        updated = TableVersion.token(tablenames)
+        assertNotEqual(updated, version)
+        version = updated
+
+        # Delete
+        db(query).delete()
+        assertNotEqual(TableVersion.token(tablenames), version)
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        OptionsFilterTests,
+    )
+
+# END ========================================================================
@@ -12,7 +12,7 @@ from lxml import etree
 
 from gluon import *
 
-from core import S3Hierarchy, s3_meta_fields, S3Represent, S3RepresentLazy, S3XMLFormat, IS_ONE_OF
+from core import S3Hierarchy, s3_meta_fields, S3Represent, S3RepresentLazy, S3XMLFormat, XSLTCache, IS_ONE_OF
 
 from unit_tests import run_suite
 
@@ -260,6 +260,202 @@ class XMLFormatTests(unittest.TestCase):
         self.assertEqual(len(root), 0)
         self.assertEqual(root.text, "Test")
 
+# =============================================================================
+class XSLTCacheTests(unittest.TestCase):
+    """ Test process-level cache of compiled stylesheets """
+
+    stylesheet = """<?xml version="1.0"?>
+<xsl:stylesheet
+    xmlns:xsl="http://www.w3.org/1999/XSL/Transform" version="1.0"
+    xmlns:s3="http://eden.sahanafoundation.org/wiki/S3">
+
+    <xsl:output method="xml"/>
+
+    <s3:fields tables="pr_person" select="ALL" exclude="last_name"/>
+
+    <xsl:template match="/">
+        <test>Test</test>
+    </xsl:template>
+</xsl:stylesheet>"""
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        import tempfile
+        handle, self.path = tempfile.mkstemp(suffix=".xsl")
+        with os.fdopen(handle, "w") as stylesheet:
+            stylesheet.write(self.stylesheet)
+
+        self.tree = etree.ElementTree(etree.fromstring("<s3xml/>"))
+
+    def tearDown(self):
+
+        os.remove(self.path)
+
+    # -------------------------------------------------------------------------
+    def testCache(self):
+        """ Test that stylesheets are compiled only once, unless modified """
+
+        assertEqual = self.assertEqual
+
+        xml = current.xml
+        path = self.path
+
+        stats = XSLTCache.stats()
+
+        # First transformation compiles the stylesheet
+        result = xml.transform(self.tree, path)
+        assertEqual(result.getroot().text, "Test")
+        assertEqual(XSLTCache.stats().compiled, stats.compiled + 1)
+
+        # Subsequent transformations use the cached stylesheet
+        for _ in range(3):
+            result = xml.transform(self.tree, path)
+            assertEqual(result.getroot().text, "Test")
+        after = XSLTCache.stats()
+        assertEqual(after.compiled, stats.compiled + 1)
+        assertEqual(after.hits, stats.hits + 3)
+        self.assertTrue(after.saved_time >= stats.saved_time)
+
+        # Modified stylesheet gets re-compiled
+        mtime = os.stat(path).st_mtime
+        os.utime(path, (mtime + 10, mtime + 10))
+        xml.transform(self.tree, path)
+        assertEqual(XSLTCache.stats().compiled, stats.compiled + 2)
+
+    # -------------------------------------------------------------------------
+    def testXMLFormat(self):
+        """ Test that S3XMLFormat uses the cached stylesheet and fields """
+
+        assertEqual = self.assertEqual
+
+        first = S3XMLFormat(self.path)
+        include, exclude = first.get_fields("pr_person")
+        assertEqual(include, None)
+        assertEqual(exclude, ["last_name"])
+
+        second = S3XMLFormat(self.path)
+        self.assertIs(second.entry, first.entry)
+        self.assertEqual(second.entry.fields, (first.select, first.skip))
+        assertEqual(second.get_fields("pr_person"), (include, exclude))
+
+        result = second.transform(self.tree)
+        assertEqual(result.getroot().text, "Test")
+
+# =============================================================================
+class ChunkedTransformationTests(unittest.TestCase):
+    """ Test transformation of table-form sources in chunks """
+
+    stylesheet = """<?xml version="1.0"?>
+<xsl:stylesheet xmlns:xsl="http://www.w3.org/1999/XSL/Transform" version="1.0">
+
+    <xsl:output method="xml"/>
+
+    <xsl:key name="organisations" match="row" use="col[@field='Organisation']"/>
+
+    <xsl:template match="/">
+        <s3xml>
+            <xsl:for-each select="//row[generate-id(.)=generate-id(key('organisations', col[@field='Organisation'])[1])]">
+                <resource name="org_organisation">
+                    <xsl:attribute name="tuid">
+                        <xsl:value-of select="col[@field='Organisation']"/>
+                    </xsl:attribute>
+                    <data field="name"><xsl:value-of select="col[@field='Organisation']"/></data>
+                </resource>
+            </xsl:for-each>
+            <xsl:apply-templates select="./table/row"/>
+        </s3xml>
+    </xsl:template>
+
+    <xsl:template match="row">
+        <resource name="org_office">
+            <reference field="organisation_id" resource="org_organisation">
+                <xsl:attribute name="tuid">
+                    <xsl:value-of select="col[@field='Organisation']"/>
+                </xsl:attribute>
+            </reference>
+            <data field="name"><xsl:value-of select="col[@field='Name']"/></data>
+        </resource>
+    </xsl:template>
+
+</xsl:stylesheet>"""
+
+    source = """Name,Organisation
+Office1,Org1
+Office2,Org2
+Office3,Org1
+Office4,Org3
+Office5,Org2
+Office6,Org1
+Office7,Org3"""
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        import tempfile
+        handle, self.path = tempfile.mkstemp(suffix=".xsl")
+        with os.fdopen(handle, "w") as stylesheet:
+            stylesheet.write(self.stylesheet)
+
+    def tearDown(self):
+
+        os.remove(self.path)
+
+    # -------------------------------------------------------------------------
+    def transform(self, chunk_size=None, workers=1):
+        """
+            Transform the test source
+
+            Args:
+                chunk_size: the chunk size (None to transform at once)
+                workers: the number of worker processes
+
+            Returns:
+                tuple (organisation tuids, office names, office references)
+        """
+
+        from core.resource.importer import XMLImporter
+
+        xml = current.xml
+
+        tree = xml.csv2tree(StringIO(self.source))
+        if chunk_size:
+            result = XMLImporter.transform_chunks(tree, self.path, chunk_size,
+                                                  workers = workers,
+                                                  )
+        else:
+            result = xml.transform(tree, self.path)
+        self.assertNotEqual(result, None)
+
+        root = result.getroot()
+        organisations = [e.get("tuid") for e in
+                         root.xpath("resource[@name='org_organisation']")]
+        offices = root.xpath("resource[@name='org_office']")
+        names = [e.findtext("data") for e in offices]
+        references = [e.find("reference").get("tuid") for e in offices]
+
+        return sorted(organisations), names, references
+
+    # -------------------------------------------------------------------------
+    def testChunkedTransformation(self):
+        """ Test that chunked transformation gives the same result """
+
+        assertEqual = self.assertEqual
+
+        expected = self.transform()
+        assertEqual(expected[0], ["Org1", "Org2", "Org3"])
+        assertEqual(len(expected[1]), 7)
+
+        for chunk_size in (1, 3, 7, 10):
+            assertEqual(self.transform(chunk_size=chunk_size), expected)
+
+    # -------------------------------------------------------------------------
+    def testParallelTransformation(self):
+        """ Test chunked transformation in worker processes """
+
+        expected = self.transform()
+        self.assertEqual(self.transform(chunk_size=2, workers=2), expected)
+
 # =============================================================================
 class GetFieldOptionsTests(unittest.TestCase):
     """ Test field options introspection method """
@@ -1096,6 +1292,8 @@ if __name__ == "__main__":
         TreeBuilderTests,
         JSONMessageTests,
         XMLFormatTests,
+        XSLTCacheTests,
+        ChunkedTransformationTests,
         GetFieldOptionsTests,
         S3JSONParsingTests,
         LookupListRepresentTests,
@@ -1 +1,2 @@
 from .base import *
+from .index import *
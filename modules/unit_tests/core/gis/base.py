@@ -317,6 +317,124 @@ class LocationTreeTests(unittest.TestCase):
         # Did we get the recursion error?
         self.assertNotIn("too much recursion", log_messages)
 
+    # -------------------------------------------------------------------------
+    def testULT5_update_location_subtree(self):
+        """ Test that changes are propagated down to the affected subtree only """
+
+        from core import GIS
+
+        table = self.table
+        db = current.db
+        gis = current.gis
+
+        # Build a tree with two L1s
+        L0_id = table.insert(level = "L0",
+                             name = "s3gis.testULT5.L0",
+                             lat = 10.0,
+                             lon = -10.0,
+                             )
+        L1_ids, L2_ids, specific_ids = [], [], []
+        for i in range(2):
+            L1_id = table.insert(level = "L1",
+                                 name = "s3gis.testULT5.L1.%s" % i,
+                                 parent = L0_id,
+                                 )
+            L2_id = table.insert(level = "L2",
+                                 name = "s3gis.testULT5.L2.%s" % i,
+                                 parent = L1_id,
+                                 )
+            specific_id = table.insert(name = "s3gis.testULT5.specific.%s" % i,
+                                       parent = L2_id,
+                                       )
+            L1_ids.append(L1_id)
+            L2_ids.append(L2_id)
+            specific_ids.append(specific_id)
+
+        gis.update_location_tree()
+
+        assertEqual = self.assertEqual
+
+        # A second run finds nothing to update below the L0
+        assertEqual(GIS.update_location_subtree(L0_id), 0)
+
+        # Rename the first L1 and give it its own Lat/Lon
+        db(table.id == L1_ids[0]).update(name = "s3gis.testULT5.L1.renamed",
+                                         inherited = False,
+                                         lat = 20.0,
+                                         lon = -20.0,
+                                         )
+        gis.update_location_tree({"id": L1_ids[0], "level": "L1"})
+
+        # Both descendants of the first L1 have been updated
+        for location_id in (L2_ids[0], specific_ids[0]):
+            record = db(table.id == location_id).select(*self.fields,
+                                                        limitby = (0, 1),
+                                                        ).first()
+            assertEqual(record.L1, "s3gis.testULT5.L1.renamed")
+            assertEqual(record.inherited, True)
+            assertEqual(record.lat, 20.0)
+            assertEqual(record.lon, -20.0)
+            assertEqual(record.lat_min, 20.0)
+            assertEqual(record.lon_max, -20.0)
+            assertEqual(record.wkt, "POINT (-20.0 20.0)")
+
+        # The other subtree is unchanged
+        record = db(table.id == specific_ids[1]).select(*self.fields,
+                                                        limitby = (0, 1),
+                                                        ).first()
+        assertEqual(record.path, "%s/%s/%s/%s" % (L0_id, L1_ids[1], L2_ids[1], specific_ids[1]))
+        assertEqual(record.L1, "s3gis.testULT5.L1.1")
+        assertEqual(record.lat, 10.0)
+        assertEqual(record.lon, -10.0)
+
+    # -------------------------------------------------------------------------
+    def testULT6_update_location_subtree_polygon(self):
+        """ Test that polygons without Lat/Lon keep their WKT and get a centroid """
+
+        table = self.table
+        db = current.db
+        gis = current.gis
+
+        polygon = "POLYGON ((10 10, 20 10, 20 20, 10 20, 10 10))"
+
+        L0_id = table.insert(level = "L0",
+                             name = "s3gis.testULT6.L0",
+                             lat = 50.0,
+                             lon = 50.0,
+                             )
+        L1_id = table.insert(level = "L1",
+                             name = "s3gis.testULT6.L1",
+                             parent = L0_id,
+                             wkt = polygon,
+                             )
+        specific_id = table.insert(name = "s3gis.testULT6.specific",
+                                   parent = L1_id,
+                                   )
+
+        gis.update_location_tree()
+
+        assertEqual = self.assertEqual
+
+        # Polygon retained, centroid and bounds computed from it
+        record = db(table.id == L1_id).select(*self.fields,
+                                              limitby = (0, 1),
+                                              ).first()
+        assertEqual(record.wkt, polygon)
+        assertEqual(record.inherited, False)
+        assertEqual(record.lat, 15.0)
+        assertEqual(record.lon, 15.0)
+        assertEqual(record.lat_min, 10.0)
+        assertEqual(record.lon_max, 20.0)
+
+        # Descendant inherits the centroid
+        record = db(table.id == specific_id).select(*self.fields,
+                                                    limitby = (0, 1),
+                                                    ).first()
+        assertEqual(record.inherited, True)
+        assertEqual(record.lat, 15.0)
+        assertEqual(record.lon, 15.0)
+        assertEqual(record.wkt, "POINT (15.0 15.0)")
+
     # -------------------------------------------------------------------------
     def testULT4_get_parents(self):
         """ Test get_parents in a case that causes it to call update_location_tree. """
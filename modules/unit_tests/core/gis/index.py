@@ -0,0 +1,233 @@
+# Eden Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/core/gis/index.py
+
+import unittest
+
+from gluon import *
+
+from core import LocationIndex
+
+from unit_tests import run_suite
+
+# =============================================================================
+class LocationIndexTests(unittest.TestCase):
+    """ Tests for the in-process spatial index of locations """
+
+    @classmethod
+    def setUpClass(cls):
+
+        table = current.s3db.gis_location
+
+        # Test locations (name, lat, lon, bounds)
+        locations = (("LocationIndexTest1", 10.5, 20.5, None),
+                     ("LocationIndexTest2", 11.5, 21.5, None),
+                     ("LocationIndexTest3", 30.5, 40.5, None),
+                     ("LocationIndexTest4", 15.0, 25.0, (10.0, 20.0, 20.0, 30.0)),
+                     )
+        ids = {}
+        for name, lat, lon, bounds in locations:
+            data = {"name": name, "lat": lat, "lon": lon}
+            if bounds:
+                data.update(lat_min = bounds[0],
+                            lon_min = bounds[1],
+                            lat_max = bounds[2],
+                            lon_max = bounds[3],
+                            )
+            ids[name] = table.insert(**data)
+        cls.ids = ids
+
+    @classmethod
+    def tearDownClass(cls):
+
+        current.db.rollback()
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        # Index without persistence
+        index = LocationIndex()
+        index.sync(force=True)
+        self.index = index
+
+    def tearDown(self):
+
+        self.index = None
+
+    # -------------------------------------------------------------------------
+    def lookup(self, lon_min, lat_min, lon_max, lat_max):
+        """
+            Look up the test locations in a bounding box
+
+            Returns:
+                set of test location names
+        """
+
+        found = self.index.query(lon_min, lat_min, lon_max, lat_max)
+        return {name for name, record_id in self.ids.items() if record_id in found}
+
+    # -------------------------------------------------------------------------
+    def testQuery(self):
+        """ Test lookup of locations by bounding box """
+
+        assertEqual = self.assertEqual
+        lookup = self.lookup
+
+        assertEqual(lookup(20.0, 10.0, 21.0, 11.0),
+                    {"LocationIndexTest1", "LocationIndexTest4"})
+        assertEqual(lookup(21.0, 11.0, 22.0, 12.0),
+                    {"LocationIndexTest2", "LocationIndexTest4"})
+        assertEqual(lookup(40.0, 30.0, 41.0, 31.0),
+                    {"LocationIndexTest3"})
+        assertEqual(lookup(50.0, 50.0, 51.0, 51.0), set())
+
+    # -------------------------------------------------------------------------
+    def testUpdate(self):
+        """ Test incremental update of the index """
+
+        assertEqual = self.assertEqual
+        lookup = self.lookup
+
+        db = current.db
+        table = current.s3db.gis_location
+        index = self.index
+
+        # Move a location
+        record_id = self.ids["LocationIndexTest3"]
+        db(table.id == record_id).update(lat=50.5, lon=50.5)
+        index.update_record(record_id)
+
+        assertEqual(lookup(40.0, 30.0, 41.0, 31.0), set())
+        assertEqual(lookup(50.0, 50.0, 51.0, 51.0), {"LocationIndexTest3"})
+
+        # Delete a location
+        record_id = self.ids["LocationIndexTest1"]
+        db(table.id == record_id).update(deleted=True)
+        index.update_record(record_id)
+
+        assertEqual(lookup(20.0, 10.0, 21.0, 11.0), {"LocationIndexTest4"})
+
+        # Rebuild the tree with the changes merged in
+        index.merge()
+        assertEqual(index.changed, {})
+        assertEqual(lookup(50.0, 50.0, 51.0, 51.0), {"LocationIndexTest3"})
+        assertEqual(lookup(20.0, 10.0, 21.0, 11.0), {"LocationIndexTest4"})
+
+    # -------------------------------------------------------------------------
+    def testSyncLateCommits(self):
+        """ Test synchronization with changes committed late """
+
+        import datetime
+
+        assertEqual = self.assertEqual
+        lookup = self.lookup
+
+        db = current.db
+        table = current.s3db.gis_location
+        index = self.index
+
+        # Update committed after others with later modified_on
+        # => picked up by the overlap of the time window
+        record_id = self.ids["LocationIndexTest2"]
+        modified_on = index.mtime - datetime.timedelta(seconds=60)
+        db(table.id == record_id).update(lat = 60.5,
+                                         lon = 60.5,
+                                         modified_on = modified_on,
+                                         )
+        index.sync(force=True)
+        assertEqual(lookup(60.0, 60.0, 61.0, 61.0), {"LocationIndexTest2"})
+
+        # Insert committed after one with a higher ID, and with a
+        # modified_on outside of the time window => detected by count
+        modified_on = index.mtime - datetime.timedelta(days=1)
+        record_id = table.insert(name = "LocationIndexTest5",
+                                 lat = 70.5,
+                                 lon = 70.5,
+                                 modified_on = modified_on,
+                                 )
+        self.ids["LocationIndexTest5"] = record_id
+        index.max_id = record_id
+        try:
+            index.sync(force=True)
+            assertEqual(lookup(70.0, 70.0, 71.0, 71.0), {"LocationIndexTest5"})
+            assertEqual(index.max_id, record_id)
+        finally:
+            del self.ids["LocationIndexTest5"]
+
+    # -------------------------------------------------------------------------
+    def testSyncUnconfirmed(self):
+        """ Test correction of uncommitted updates by synchronization """
+
+        import datetime
+
+        assertEqual = self.assertEqual
+        lookup = self.lookup
+
+        db = current.db
+        table = current.s3db.gis_location
+        index = self.index
+
+        record_id = self.ids["LocationIndexTest3"]
+        original = db(table.id == record_id).select(table.lat,
+                                                    table.lon,
+                                                    table.modified_on,
+                                                    limitby = (0, 1),
+                                                    ).first()
+
+        # Update from onaccept => applied, but does not advance mtime
+        mtime = index.mtime
+        db(table.id == record_id).update(lat=80.5, lon=80.5)
+        index.update_record(record_id)
+        assertEqual(index.mtime, mtime)
+        assertEqual(index.unconfirmed, {record_id})
+        assertEqual(lookup(80.0, 80.0, 81.0, 81.0), {"LocationIndexTest3"})
+
+        # Simulate a rollback of the update, with a modified_on
+        # outside of the time window
+        modified_on = index.mtime - datetime.timedelta(days=1)
+        db(table.id == record_id).update(lat = original.lat,
+                                         lon = original.lon,
+                                         modified_on = modified_on,
+                                         )
+        try:
+            # Unconfirmed record is re-read with the next sync
+            index.sync(force=True)
+            assertEqual(index.unconfirmed, set())
+            assertEqual(lookup(80.0, 80.0, 81.0, 81.0), set())
+            assertEqual(lookup(40.0, 30.0, 41.0, 31.0), {"LocationIndexTest3"})
+        finally:
+            db(table.id == record_id).update(modified_on=original.modified_on)
+
+    # -------------------------------------------------------------------------
+    def testPersistence(self):
+        """ Test saving and loading of the index """
+
+        import os
+        import tempfile
+
+        handle, path = tempfile.mkstemp(suffix=".pickle")
+        os.close(handle)
+        try:
+            index = self.index
+            index.path = path
+            index.save()
+
+            loaded = LocationIndex(path=path)
+            self.assertTrue(loaded.load())
+            self.assertEqual(loaded.ids, index.ids)
+            self.assertEqual(loaded.mtime, index.mtime)
+
+            found = loaded.query(20.0, 10.0, 21.0, 11.0)
+            self.assertTrue(self.ids["LocationIndexTest1"] in found)
+        finally:
+            os.remove(path)
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        LocationIndexTests,
+        )
+
+# END ========================================================================
@@ -0,0 +1,382 @@
+# Eden Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/core/methods/report.py
+#
+import datetime
+import unittest
+
+from gluon import current
+
+from core import FS, GroupedAggregate, PivotTableAggregates, S3PivotTable
+from core.methods.report import S3PivotTableFact
+
+from unit_tests import run_suite
+
+# =============================================================================
+@unittest.skipIf(not current.deployment_settings.has_module("disease"), "disease module disabled")
+class PivotTableAggregatesTests(unittest.TestCase):
+    """ Tests for materialized pivot table aggregates """
+
+    tablename = "disease_testing_report"
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        s3db = current.s3db
+
+        tablename = cls.tablename
+        table = s3db.table(tablename)
+
+        cls.report_aggregates = s3db.get_config(tablename, "report_aggregates")
+        s3db.configure(tablename,
+                       report_aggregates = {"rows": "disease_id",
+                                            "facts": ["sum(tests_total)",
+                                                      "count(id)",
+                                                      ],
+                                            "partition": "date",
+                                            },
+                       )
+        PivotTableAggregates.attach(table)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        current.s3db.configure(cls.tablename,
+                               report_aggregates = cls.report_aggregates,
+                               )
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        self.disease_id = s3db.disease_disease.insert(name="Aggregates Test Disease")
+
+        self.today = today = datetime.date.today()
+        self.yesterday = yesterday = today - datetime.timedelta(days=1)
+
+        table = s3db.table(self.tablename)
+        for date, tests in ((yesterday, 10), (yesterday, 5), (today, 7)):
+            table.insert(disease_id = self.disease_id,
+                         date = date,
+                         tests_total = tests,
+                         )
+
+        self.aggregates = PivotTableAggregates.configured(self.tablename)[0]
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def extract(self, conditions=None):
+        """
+            Helper to extract the partial aggregate for the test disease
+
+            Args:
+                conditions: the partition conditions
+
+            Returns:
+                the partial aggregate, or None if no aggregates available
+        """
+
+        result = self.aggregates.extract(conditions or [], "disease_id", None)
+        if result is None:
+            return None
+
+        partials = result[0]
+        return partials.get((self.disease_id, None))
+
+    # -------------------------------------------------------------------------
+    def testBuild(self):
+        """ Test building of aggregates """
+
+        assertEqual = self.assertEqual
+
+        aggregates = self.aggregates
+
+        # Aggregates not built yet => no results, and nothing written
+        self.assertIsNone(self.extract())
+        self.assertIsNone(aggregates.cube())
+
+        # Build the aggregates
+        PivotTableAggregates.refresh_all(self.tablename)
+
+        cube = aggregates.cube()
+        self.assertIsNotNone(cube)
+        self.assertFalse(cube.rebuild)
+
+        partial = self.extract()
+        assertEqual(partial["records"], 3)
+        assertEqual(partial["data"]["~.tests_total"][:2], [3, 22])
+
+        # Filtered by partition
+        partial = self.extract([("EQ", self.today)])
+        assertEqual(partial["records"], 1)
+        assertEqual(partial["data"]["~.tests_total"][:2], [1, 7])
+
+    # -------------------------------------------------------------------------
+    def testInvalidation(self):
+        """ Test invalidation of aggregates upon changes of the records """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        s3db = current.s3db
+
+        aggregates = self.aggregates
+
+        PivotTableAggregates.refresh_all(self.tablename)
+        cube = aggregates.cube()
+
+        # Add another report
+        table = s3db.table(self.tablename)
+        record_id = table.insert(disease_id = self.disease_id,
+                                 date = self.today,
+                                 tests_total = 3,
+                                 )
+
+        # Partition is marked dirty
+        parts = aggregates.dirty(cube.id)[0]
+        assertEqual(parts, {self.today})
+
+        # Dirty partition is computed from the records...
+        partial = self.extract()
+        assertEqual(partial["records"], 4)
+        assertEqual(partial["data"]["~.tests_total"][:2], [4, 25])
+
+        # ...but not stored
+        assertEqual(aggregates.dirty(cube.id)[0], {self.today})
+
+        # Move the report to another partition
+        db(table.id == record_id).update(date=self.yesterday)
+        parts = aggregates.dirty(cube.id)[0]
+        assertEqual(parts, {self.today, self.yesterday})
+
+        partial = self.extract([("EQ", self.yesterday)])
+        assertEqual(partial["records"], 3)
+        assertEqual(partial["data"]["~.tests_total"][:2], [3, 18])
+
+        # Refresh stores the dirty partitions
+        PivotTableAggregates.refresh_all(self.tablename)
+        assertEqual(aggregates.dirty(cube.id)[0], set())
+
+        partial = self.extract()
+        assertEqual(partial["records"], 4)
+        assertEqual(partial["data"]["~.tests_total"][:2], [4, 25])
+
+        # Delete a report
+        db(table.id == record_id).delete()
+        assertEqual(aggregates.dirty(cube.id)[0], {self.yesterday})
+
+        partial = self.extract()
+        assertEqual(partial["records"], 3)
+        assertEqual(partial["data"]["~.tests_total"][:2], [3, 22])
+
+    # -------------------------------------------------------------------------
+    def testPivotTable(self):
+        """ Test pivot table generation from the aggregates """
+
+        assertEqual = self.assertEqual
+
+        PivotTableAggregates.refresh_all(self.tablename)
+
+        # Unfiltered, as filters for the axes cannot be applied to the aggregates
+        resource = current.s3db.resource(self.tablename)
+        facts = S3PivotTableFact.parse(["sum(tests_total)", "count(id)"])
+        pt = S3PivotTable(resource, "disease_id", None, facts, aggregates=True)
+
+        # Generated from the aggregates
+        self.assertIsNotNone(pt.freshness)
+
+        rows = [row for row in pt.row if row.value == self.disease_id]
+        assertEqual(len(rows), 1)
+
+        layers = {fact.method: fact.layer for fact in facts}
+        assertEqual(rows[0][layers["sum"]], 22)
+        assertEqual(rows[0][layers["count"]], 3)
+
+# =============================================================================
+@unittest.skipIf(not current.deployment_settings.has_module("disease"), "disease module disabled")
+class GroupByPivotTableTests(unittest.TestCase):
+    """ Tests for pivot table aggregation in the database (GROUP BY) """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        dtable = s3db.disease_disease
+        self.disease_ids = disease_ids = [dtable.insert(name="GroupBy Test Disease %s" % i)
+                                          for i in range(2)]
+
+        today = datetime.date.today()
+        yesterday = today - datetime.timedelta(days=1)
+
+        table = s3db.disease_testing_report
+        for disease_id, date, tests in ((disease_ids[0], yesterday, 10),
+                                        (disease_ids[0], yesterday, 5),
+                                        (disease_ids[0], today, 7),
+                                        (disease_ids[1], today, 3),
+                                        (disease_ids[1], today, None),
+                                        ):
+            table.insert(disease_id = disease_id,
+                         date = date,
+                         tests_total = tests,
+                         )
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def pivottable(self, rows, cols, facts, groupby=False):
+        """
+            Helper to generate a pivot table for the test records
+
+            Args:
+                rows: the rows selector
+                cols: the cols selector
+                facts: the fact expressions
+                groupby: aggregate in the database
+
+            Returns:
+                tuple (pivottable, results), results being a dict
+                {(row value, col value): {layer: value}} including totals
+                (with None as value of the total axis)
+        """
+
+        resource = current.s3db.resource("disease_testing_report",
+                                         filter = FS("disease_id").belongs(self.disease_ids),
+                                         )
+        facts = S3PivotTableFact.parse(facts)
+        pt = S3PivotTable(resource, rows, cols, facts, groupby=groupby)
+
+        results = {}
+        layers = [fact.layer for fact in facts]
+        for r, row in enumerate(pt.row):
+            results[(row.value, None)] = {layer: row[layer] for layer in layers}
+            for c, col in enumerate(pt.col):
+                cell = pt.cell[r][c]
+                results[(row.value, col.value)] = {layer: cell[layer] for layer in layers}
+        for col in pt.col:
+            results[(None, col.value)] = {layer: col[layer] for layer in layers}
+        results[(None, None)] = {layer: pt.totals[layer] for layer in layers}
+
+        return pt, results
+
+    # -------------------------------------------------------------------------
+    def testGroupBy(self):
+        """ Test pivot table aggregation with GROUP BY """
+
+        assertEqual = self.assertEqual
+
+        facts = ["count(id)",
+                 "sum(tests_total)",
+                 "min(tests_total)",
+                 "max(tests_total)",
+                 "avg(tests_total)",
+                 ]
+
+        for rows, cols in (("disease_id", "date"),
+                           ("date", None),
+                           ):
+            pt, expected = self.pivottable(rows, cols, facts)
+            assertEqual(pt.numrecords, 5)
+
+            pt, results = self.pivottable(rows, cols, facts, groupby=True)
+            assertEqual(pt.numrecords, 5)
+            assertEqual(results, expected)
+
+            # Generated in the database => no contributing records
+            for row in pt.cell:
+                for cell in row:
+                    assertEqual(cell["records"], [])
+
+    # -------------------------------------------------------------------------
+    @unittest.skipIf(not GroupedAggregate.supports("sum"), "NumPy not installed")
+    def testGroupedLayers(self):
+        """ Test vectorised (grouped) layer aggregation against per-cell aggregation """
+
+        assertEqual = self.assertEqual
+
+        facts = ["sum(tests_total)",
+                 "min(tests_total)",
+                 "max(tests_total)",
+                 "avg(tests_total)",
+                 ]
+
+        # Record calls of the grouped aggregation
+        add_layer_grouped = S3PivotTable._add_layer_grouped
+        calls = []
+        def _add_layer_grouped(pt, grouped, fact, *args, **kwargs):
+            calls.append(fact.method)
+            return add_layer_grouped(pt, grouped, fact, *args, **kwargs)
+
+        supports = GroupedAggregate.__dict__["supports"]
+
+        for rows, cols in (("disease_id", "date"),
+                           ("date", None),
+                           ):
+            # Grouped
+            S3PivotTable._add_layer_grouped = _add_layer_grouped
+            try:
+                del calls[:]
+                grouped, results = self.pivottable(rows, cols, facts)
+            finally:
+                S3PivotTable._add_layer_grouped = add_layer_grouped
+            assertEqual(calls, ["sum", "min", "max", "avg"])
+
+            # Ungrouped (per cell)
+            GroupedAggregate.supports = classmethod(lambda cls, method: False)
+            try:
+                ungrouped, expected = self.pivottable(rows, cols, facts)
+            finally:
+                GroupedAggregate.supports = supports
+
+            assertEqual(results, expected)
+            for fact in S3PivotTableFact.parse(facts):
+                layer = fact.layer
+                assertEqual(grouped.values[layer], ungrouped.values[layer])
+
+        # Check the actual totals
+        disease_ids = self.disease_ids
+        pt, results = self.pivottable("disease_id", None, facts)
+        layers = {layer[1]: layer for layer in results[(None, None)]}
+        layer = layers["sum"]
+        assertEqual(results[(disease_ids[0], None)][layer], 22)
+        assertEqual(results[(disease_ids[1], None)][layer], 3)
+        assertEqual(results[(None, None)][layer], 25)
+        layer = layers["max"]
+        assertEqual(results[(None, None)][layer], 10)
+
+    # -------------------------------------------------------------------------
+    def testFallback(self):
+        """ Test fallback to aggregation in Python """
+
+        # List-facts cannot be aggregated in the database
+        pt, results = self.pivottable("disease_id", None, ["list(tests_total)"], groupby=True)
+        self.assertEqual(pt.numrecords, 5)
+        records = [cell["records"] for row in pt.cell for cell in row]
+        self.assertEqual(sum(len(items) for items in records), 5)
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        PivotTableAggregatesTests,
+        GroupByPivotTableTests,
+    )
+
+# END ========================================================================
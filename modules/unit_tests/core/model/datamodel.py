@@ -223,11 +223,61 @@ class SuperEntityTests(unittest.TestCase):
         super_record = super_table[se_id]
         self.assertFalse(super_record.deleted)
 
+# =============================================================================
+class ModelIndexTests(unittest.TestCase):
+    """ Tests for the process-wide table name index """
+
+    # -------------------------------------------------------------------------
+    def testIndexCached(self):
+        """ Test that the index is built once per process """
+
+        s3db = current.s3db
+
+        index = s3db.model_index
+        self.assertTrue(len(index.names) > 0)
+        self.assertIs(s3db.model_index, index)
+        self.assertIs(s3db.module_map, index.modules)
+
+    # -------------------------------------------------------------------------
+    def testIndexLookup(self):
+        """ Test that names are found via the index """
+
+        s3db = current.s3db
+        names = s3db.model_index.names
+
+        # Table defined by a model
+        self.assertIn("org_organisation", names)
+        self.assertTrue(s3db.has("org_organisation"))
+        self.assertIsNotNone(s3db.table("org_organisation"))
+
+        # Module-level names (classes, functions)
+        self.assertIn("org_SiteRepresent", names)
+        self.assertTrue(s3db.has("org_SiteRepresent"))
+
+        # Names which are not defined anywhere
+        self.assertNotIn("org_nonexistent", names)
+        self.assertFalse(s3db.has("org_nonexistent"))
+        self.assertIsNone(s3db.table("org_nonexistent"))
+
+    # -------------------------------------------------------------------------
+    def testIndexComplete(self):
+        """ Test that all names of all models are indexed """
+
+        names = current.s3db.model_index.names
+        for prefix, module in current.s3db.module_map.items():
+            for name in module.__dict__.get("__all__", ()):
+                model = module.__dict__.get(name)
+                if hasattr(model, "_edenmodel"):
+                    for tablename in getattr(model, "names", ()):
+                        if tablename.split("_", 1)[0] == prefix:
+                            self.assertIn(tablename, names)
+
 # =============================================================================
 if __name__ == "__main__":
 
     run_suite(
         SuperEntityTests,
+        ModelIndexTests,
     )
 
 # END ========================================================================
@@ -480,6 +480,109 @@ class DuplicateDetectionTests(unittest.TestCase):
         assertEqual(item.id, None)
         assertEqual(item.method, item.METHOD.CREATE)
 
+    # -------------------------------------------------------------------------
+    def testBulkMatch(self):
+        """ Test bulk lookup of duplicates for multiple items """
+
+        assertEqual = self.assertEqual
+
+        deduplicate = S3Duplicate(primary=("name",),
+                                  secondary=("secondary",),
+                                  )
+
+        ids = self.ids
+        samples = ((Storage(name="Test0"), ids["TEST0"]),
+                   (Storage(name="Test2", secondary="secondaryX"), ids["TEST2"]),
+                   (Storage(name="test4", secondary="secondaryX"), None),
+                   (Storage(name="Test"), None),
+                   )
+
+        # Dummy items for testing
+        items = []
+        for data, _ in samples:
+            item = ImportItem(self.job)
+            item.table = current.db.dedup_test
+            item.id = None
+            item.method = item.METHOD.CREATE
+            item.data = data
+            items.append(item)
+
+        # Look up all duplicates at once
+        deduplicate.bulk(items)
+        for item, (_, record_id) in zip(items, samples):
+            if record_id:
+                assertEqual(item.duplicate.id, record_id)
+            else:
+                assertEqual(item.duplicate, False)
+
+        # Deduplicate uses the pre-fetched duplicates
+        for item, (_, record_id) in zip(items, samples):
+            deduplicate(item)
+            assertEqual(item.id, record_id)
+            if record_id:
+                assertEqual(item.method, item.METHOD.UPDATE)
+            else:
+                assertEqual(item.method, item.METHOD.CREATE)
+
+    # -------------------------------------------------------------------------
+    def testBulkMatchChunk(self):
+        """ Test bulk lookup of duplicates within the same chunk """
+
+        assertEqual = self.assertEqual
+        assertTrue = self.assertTrue
+        assertFalse = self.assertFalse
+
+        deduplicate = S3Duplicate(primary=("name",),
+                                  secondary=("secondary",),
+                                  )
+
+        samples = (Storage(name="BulkTest", secondary="SecondaryX"),
+                   # Same as first item
+                   Storage(name="bulktest", secondary="secondaryx"),
+                   # Different secondary
+                   Storage(name="BulkTest", secondary="SecondaryY"),
+                   # Matches first item
+                   Storage(name="BulkTest"),
+                   # Existing record
+                   Storage(name="Test0"),
+                   # No primary value
+                   Storage(secondary="SecondaryX"),
+                   )
+
+        items = []
+        for data in samples:
+            item = ImportItem(self.job)
+            item.table = current.db.dedup_test
+            item.id = None
+            item.method = item.METHOD.CREATE
+            item.data = data
+            items.append(item)
+
+        deduplicate.bulk(items)
+
+        # New items
+        for index in (0, 2):
+            item = items[index]
+            assertEqual(item.duplicate, False)
+            assertFalse(item.deferred)
+
+        # Items matching an earlier new item are to be looked up
+        # individually after the bulk insert
+        for index in (1, 3):
+            item = items[index]
+            assertEqual(item.duplicate, None)
+            assertTrue(item.deferred)
+
+        item = items[4]
+        assertEqual(item.duplicate.id, self.ids["TEST0"])
+        assertFalse(item.deferred)
+
+        # Item without primary value is committed individually
+        assertTrue(items[5].deferred)
+
+        # Deferred items are not bulk-inserted
+        self.assertIsNone(items[1].bulk_data())
+
     # -------------------------------------------------------------------------
     def testDefaults(self):
         """ Test default behavior """
@@ -556,6 +659,140 @@ class DuplicateDetectionTests(unittest.TestCase):
         with assertRaises(TypeError):
             deduplicate = S3Duplicate(secondary=17)
 
+# =============================================================================
+class BulkImportTests(unittest.TestCase):
+    """ Test cases for bulk imports """
+
+    def setUp(self):
+
+        s3db = current.s3db
+
+        current.auth.override = True
+
+        # Use standard deduplication (with bulk lookup)
+        self.deduplicate = s3db.get_config("org_organisation", "deduplicate")
+        s3db.configure("org_organisation",
+                       deduplicate = S3Duplicate(primary=("name",)),
+                       )
+
+    def tearDown(self):
+
+        db = current.db
+        s3db = current.s3db
+
+        db.rollback()
+
+        # Bulk import commits => remove the test records
+        table = s3db.org_organisation
+        query = table.name.lower().like("bulkimporttestorg%")
+        pe_ids = [row.pe_id for row in db(query).select(table.pe_id)]
+        db(query).delete()
+        if pe_ids:
+            etable = s3db.pr_pentity
+            db(etable.pe_id.belongs(pe_ids)).delete()
+        db.commit()
+
+        current.auth.override = False
+
+        s3db.configure("org_organisation",
+                       deduplicate = self.deduplicate,
+                       )
+
+    # -------------------------------------------------------------------------
+    def testBulkImport(self):
+        """ Test bulk import with duplicates in the same chunk """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        s3db = current.s3db
+        auth = current.auth
+
+        xmlstr = """
+<s3xml>
+    <resource name="org_organisation">
+        <data field="name">BulkImportTestOrg1</data>
+        <data field="acronym">BITO1</data>
+    </resource>
+    <resource name="org_organisation">
+        <data field="name">BulkImportTestOrg2</data>
+    </resource>
+    <resource name="org_organisation">
+        <data field="name">bulkimporttestorg1</data>
+        <data field="comments">Updated</data>
+    </resource>
+</s3xml>"""
+
+        tree = etree.ElementTree(etree.fromstring(xmlstr))
+
+        resource = s3db.resource("org_organisation")
+        result = resource.import_xml(tree, bulk=True)
+        self.assertTrue(result.success)
+
+        table = resource.table
+        query = (table.name.lower().like("bulkimporttestorg%")) & \
+                (table.deleted == False)
+        rows = db(query).select(table.ALL, orderby=table.id)
+
+        # Duplicate within the chunk updated the first record
+        assertEqual(len(rows), 2)
+        row = rows.first()
+        assertEqual(row.acronym, "BITO1")
+        assertEqual(row.comments, "Updated")
+
+        for row in rows:
+            # Super-entity link and realm set for all new records
+            self.assertIsNotNone(row.pe_id)
+            assertEqual(row.realm_entity, auth.get_realm_entity(table, row))
+
+    # -------------------------------------------------------------------------
+    def testBulkInsertVetoed(self):
+        """ Test fallback to individual commits if bulk insert is vetoed """
+
+        db = current.db
+        s3db = current.s3db
+
+        xmlstr = """
+<s3xml>
+    <resource name="org_organisation">
+        <data field="name">BulkImportTestOrg1</data>
+    </resource>
+    <resource name="org_organisation">
+        <data field="name">BulkImportTestOrg2</data>
+    </resource>
+</s3xml>"""
+
+        tree = etree.ElementTree(etree.fromstring(xmlstr))
+
+        resource = s3db.resource("org_organisation")
+        table = resource.table
+
+        # Veto the first insert (i.e. the bulk insert) only
+        vetoed = []
+        def veto(fields):
+            if vetoed:
+                return False
+            vetoed.append(True)
+            return True
+
+        table._before_insert.append(veto)
+        try:
+            result = resource.import_xml(tree, bulk=True)
+        finally:
+            table._before_insert.remove(veto)
+
+        self.assertTrue(vetoed)
+        self.assertTrue(result.success)
+
+        # All records committed individually
+        query = (table.name.lower().like("bulkimporttestorg%")) & \
+                (table.deleted == False)
+        rows = db(query).select(table.name, table.pe_id, orderby=table.id)
+        self.assertEqual([row.name for row in rows],
+                         ["BulkImportTestOrg1", "BulkImportTestOrg2"])
+        for row in rows:
+            self.assertIsNotNone(row.pe_id)
+
 # =============================================================================
 class MtimeImportTests(unittest.TestCase):
 
@@ -1179,6 +1416,7 @@ if __name__ == "__main__":
         PostParseTests,
         FailedReferenceTests,
         DuplicateDetectionTests,
+        BulkImportTests,
         MtimeImportTests,
         ObjectReferencesTests,
         ObjectReferencesImportTests,
@@ -1606,6 +1606,72 @@ class ResourceFieldTests(unittest.TestCase):
         selector = "organisation_id.test"
         self.assertRaises(AttributeError, S3ResourceField, resource, selector)
 
+    # -------------------------------------------------------------------------
+    def testResolveSelectorCached(self):
+        """ Resolution of cached field paths """
+
+        assertEqual = self.assertEqual
+        assertNotEqual = self.assertNotEqual
+        assertTrue = self.assertTrue
+
+        s3db = current.s3db
+        cache = current.model["fieldpaths"]
+
+        resource = s3db.resource("org_office")
+        selector = "organisation_id$name"
+
+        # Resolving a selector adds the field path to the cache
+        f1 = S3ResourceField(resource, selector)
+        keys = [k for k in cache if k[0] == "org_office" and k[-1] == selector]
+        assertEqual(len(keys), 1)
+        key = keys[0]
+
+        # Resolving it again gives the same result, but with a separate
+        # joins dict
+        f2 = S3ResourceField(s3db.resource("org_office"), selector)
+        assertEqual(f2.colname, f1.colname)
+        assertEqual(str(f2.left["org_organisation"][0]),
+                    str(f1.left["org_organisation"][0]),
+                    )
+        f2.left.clear()
+        assertNotEqual(f1.left, {})
+        assertNotEqual(cache[key].joins, {})
+
+        # Configuring the table clears the cache
+        resource.configure(context = {"organisation": "organisation_id"})
+        assertTrue(key not in cache)
+
+    # -------------------------------------------------------------------------
+    def testResolveSelectorCachedComponents(self):
+        """ Field paths are cached separately per exposed components """
+
+        assertEqual = self.assertEqual
+
+        s3db = current.s3db
+        cache = current.model["fieldpaths"]
+
+        cache.clear()
+
+        selector = "name"
+        def cached():
+            return [k for k in cache if k[0] == "org_organisation" and k[-1] == selector]
+
+        # Resolve for a resource with all components
+        S3ResourceField(s3db.resource("org_organisation"), selector)
+        assertEqual(len(cached()), 1)
+
+        # Resolve for a resource with restricted components
+        resource = s3db.resource("org_organisation", components=["office"])
+        S3ResourceField(resource, selector)
+        keys = cached()
+        assertEqual(len(keys), 2)
+        self.assertIn(frozenset(["office"]), [k[-2] for k in keys])
+
+        # Resolve for a resource without components
+        resource = s3db.resource("org_organisation", components=[])
+        S3ResourceField(resource, selector)
+        assertEqual(len(cached()), 3)
+
 # =============================================================================
 class ResourceDataAccessTests(unittest.TestCase):
     """ Test data access via resources """
@@ -2702,6 +2768,29 @@ class URLQueryParserTests(unittest.TestCase):
                                   (i, v, k, actual),
                             )
 
+    # -------------------------------------------------------------------------
+    def testParseCached(self):
+        """ Test that repeated parsing returns separate query instances """
+
+        if not PYPARSING:
+            return
+
+        assertEqual = self.assertEqual
+        assertNotEqual = self.assertNotEqual
+
+        expr = "(~.name like 'T*') and (~.id gt 2)"
+        q1 = S3URLQueryParser().parse(expr)
+        q2 = S3URLQueryParser().parse(expr)
+
+        assertEqual(list(q1.keys()), list(q2.keys()))
+        assertNotEqual(id(q1[None]), id(q2[None]))
+        assertEqual(str(q1[None]), str(q2[None]))
+
+        # Modifying a result does not affect later results
+        q1[None] = ~q1[None]
+        q3 = S3URLQueryParser().parse(expr)
+        assertEqual(str(q3[None]), str(q2[None]))
+
 # =============================================================================
 class AIRegexTests(unittest.TestCase):
     """ Tests for accent-insensitive LIKE """
@@ -2499,6 +2499,104 @@ class ResourceSelectTests(unittest.TestCase):
         # - returns all matching record ids, however
         assertEqual(len(data.ids), numitems)
 
+    # -------------------------------------------------------------------------
+    def testChunkedExtraction(self):
+        """ Test chunked extraction with keyset pagination """
+
+        assertEqual = self.assertEqual
+
+        resource = current.s3db.resource("select_master")
+        table = resource.table
+
+        # Select with seek
+        rows = resource.select(["id", "name"], as_rows=True)
+        ids = sorted(row.id for row in rows)
+        data = resource.select(["id", "name"],
+                               limit = 3,
+                               orderby = table.id,
+                               seek = table.id > ids[4],
+                               )
+        assertEqual(data.page, ids[5:8])
+
+        # Extract in chunks
+        names = []
+        chunks = 0
+        for data in DataExporter.chunks(resource, ["id", "name"], 4):
+            assertEqual(len(data.rows), len(data.page))
+            names.extend(row["select_master.name"] for row in data.rows)
+            chunks += 1
+        assertEqual(chunks, 3)
+        assertEqual(names, [item[0] for item in self.test_data])
+
+        # Chunked extraction observes the resource filter
+        resource = current.s3db.resource("select_master",
+                                         filter = FS("status") == "A",
+                                         )
+        names = []
+        for data in DataExporter.chunks(resource, ["name"], 2):
+            names.extend(row["select_master.name"] for row in data.rows)
+        assertEqual(names, [item[0] for item in self.test_data if item[1] == "A"])
+
+    # -------------------------------------------------------------------------
+    def testKeysetPagination(self):
+        """ Test keyset pagination vs. offset pagination """
+
+        from core.resource.data import KeysetCursor
+
+        assertEqual = self.assertEqual
+
+        resource = current.s3db.resource("select_master")
+        orderby = "select_master.status desc"
+
+        keyset = KeysetCursor(resource, orderby)
+        self.assertTrue(keyset.seekable)
+
+        # Expected order (status has duplicates => id is tie-breaker)
+        rows = resource.select(["id"], orderby=keyset.orderby, as_rows=True)
+        expected = [row.id for row in rows]
+
+        # Paginate with cursor
+        ids = []
+        start, token = 0, None
+        while True:
+            seek = keyset.seek(token, start) if start else None
+            if start:
+                self.assertNotEqual(seek, None)
+                # Token is only valid for its start index
+                assertEqual(keyset.seek(token, start + 1), None)
+            data = resource.select(["id"],
+                                   limit = 3,
+                                   orderby = keyset.orderby,
+                                   seek = seek,
+                                   )
+            page = data.page
+            if not page:
+                break
+            ids.extend(page)
+            start += len(page)
+            token = keyset.encode(page[-1], start)
+        assertEqual(ids, expected)
+
+        # Datatable with cursor
+        dt, numrows = resource.datatable(fields = ["id", "name"],
+                                         limit = 4,
+                                         orderby = orderby,
+                                         cursor = "",
+                                         )
+        assertEqual(numrows, len(self.test_data))
+        cursor = dt.cursor
+        assertEqual(cursor["start"], 4)
+
+        dt, numrows = resource.datatable(fields = ["id", "name"],
+                                         start = 4,
+                                         limit = 4,
+                                         orderby = orderby,
+                                         cursor = cursor["key"],
+                                         )
+        assertEqual(numrows, len(self.test_data))
+        assertEqual(len(dt.data), 4)
+        assertEqual(dt.cursor["start"], 8)
+
 # =============================================================================
 class ResourceLazyVirtualFieldsSupportTests(unittest.TestCase):
     """ Test support for lazy virtual fields """
@@ -3,6 +3,8 @@
 # To run this script use:
 # python web2py.py -S eden -M -R applications/eden/modules/unit_tests/core/tools/hierarchy.py
 #
+import sys
+import timeit
 import unittest
 
 from lxml import etree
@@ -12,6 +14,9 @@ from core import *
 
 from unit_tests import run_suite
 
+def info(msg):
+    sys.stdout.write("%s\n" % msg)
+
 # =============================================================================
 class SimpleHierarchyTests(unittest.TestCase):
     """ Tests for standard hierarchies """
@@ -372,6 +377,159 @@ class SimpleHierarchyTests(unittest.TestCase):
             # Cleanup
             db(table.uuid.like("HIERARCHY1-4%")).delete()
 
+    # -------------------------------------------------------------------------
+    def stored(self, tablename):
+        """
+            Helper to look up the stored hierarchy status
+
+            Args:
+                tablename: the name of the hierarchical table
+
+            Returns:
+                the s3_hierarchy Row (version and dirty-flag)
+        """
+
+        htable = current.s3db.s3_hierarchy
+        query = (htable.tablename == tablename)
+        return current.db(query).select(htable.version,
+                                        htable.dirty,
+                                        limitby = (0, 1),
+                                        ).first()
+
+    # -------------------------------------------------------------------------
+    def testSaveVersion(self):
+        """ Test versioning of the stored hierarchy """
+
+        from core.tools.hierarchy import HierarchyStore
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        tablename = "test_hierarchy"
+        hierarchies = current.model["hierarchies"]
+
+        HierarchyStore.get(tablename).replace({})
+        try:
+            # Marking dirty increments the version
+            hierarchies.pop(tablename, None)
+            S3Hierarchy.dirty(tablename)
+            row = self.stored(tablename)
+            self.assertTrue(row.dirty)
+            version = row.version
+
+            # Rebuilding saves the hierarchy
+            h = S3Hierarchy(tablename)
+            self.assertIn(self.uids["HIERARCHY1"], h.tree)
+            row = self.stored(tablename)
+            self.assertFalse(row.dirty)
+            assertEqual(row.version, version + 1)
+
+            # Changed by another process after loading => not saved
+            hierarchies.pop(tablename, None)
+            h = S3Hierarchy(tablename)
+            h.tree
+            htable = current.s3db.s3_hierarchy
+            db(htable.tablename == tablename).update(version=htable.version + 1)
+            h.add(self.uids["HIERARCHY2-1-2"], parent_id=self.uids["HIERARCHY2"])
+            self.assertFalse(h.save())
+            assertEqual(self.stored(tablename).version, version + 2)
+        finally:
+            db.rollback()
+            hierarchies.pop(tablename, None)
+            HierarchyStore.get(tablename).replace({})
+
+    # -------------------------------------------------------------------------
+    def testRequestLocalChanges(self):
+        """ Test that changes do not affect the process-level store """
+
+        from core.tools.hierarchy import HierarchyStore
+
+        db = current.db
+        tablename = "test_hierarchy"
+        hierarchies = current.model["hierarchies"]
+
+        node_id = self.uids["HIERARCHY2-1-2"]
+        parent_id = self.uids["HIERARCHY2-1"]
+
+        HierarchyStore.get(tablename).replace({})
+        try:
+            hierarchies.pop(tablename, None)
+            h = S3Hierarchy(tablename)
+            tree = h.tree
+
+            store = HierarchyStore.get(tablename)
+            self.assertIs(store.snapshot(), tree)
+
+            # Change is visible in the request...
+            h.remove(node_id)
+            self.assertNotIn(node_id, h.tree)
+            self.assertNotIn(node_id, h.children(parent_id))
+            self.assertTrue(h.save())
+
+            # ...but not in the process-level store
+            self.assertIs(store.snapshot(), tree)
+            self.assertIn(node_id, tree)
+
+            # Other requests reload the hierarchy (once committed)
+            hierarchies.pop(tablename, None)
+            h = S3Hierarchy(tablename)
+            self.assertNotIn(node_id, h.tree)
+        finally:
+            db.rollback()
+            hierarchies.pop(tablename, None)
+            HierarchyStore.get(tablename).replace({})
+
+    # -------------------------------------------------------------------------
+    def testReadOnlyRequest(self):
+        """ Test that GET requests rebuild the hierarchy without saving it """
+
+        from core.tools.hierarchy import HierarchyStore
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        tablename = "test_hierarchy"
+        hierarchies = current.model["hierarchies"]
+
+        env = current.request.env
+        method = env.request_method
+
+        HierarchyStore.get(tablename).replace({})
+        try:
+            hierarchies.pop(tablename, None)
+            S3Hierarchy.dirty(tablename)
+            version = self.stored(tablename).version
+
+            # GET request rebuilds the hierarchy, but does not save it
+            hierarchies.pop(tablename, None)
+            env.request_method = "GET"
+            h = S3Hierarchy(tablename)
+            tree = h.tree
+            self.assertIn(self.uids["HIERARCHY1"], tree)
+            row = self.stored(tablename)
+            self.assertTrue(row.dirty)
+            assertEqual(row.version, version)
+
+            # Rebuilt hierarchy is re-used by subsequent requests...
+            hierarchies.pop(tablename, None)
+            h = S3Hierarchy(tablename)
+            self.assertIs(h.tree, tree)
+            self.assertTrue(self.stored(tablename).dirty)
+
+            # ...and saved by the next write request
+            hierarchies.pop(tablename, None)
+            env.request_method = "POST"
+            h = S3Hierarchy(tablename)
+            self.assertIs(h.tree, tree)
+            row = self.stored(tablename)
+            self.assertFalse(row.dirty)
+            assertEqual(row.version, version + 1)
+        finally:
+            env.request_method = method
+            db.rollback()
+            hierarchies.pop(tablename, None)
+            HierarchyStore.get(tablename).replace({})
+
     # -------------------------------------------------------------------------
     def testCategory(self):
         """ Test node category lookup """
@@ -2083,6 +2241,324 @@ class TypeOfTests(unittest.TestCase):
         self.assertTrue(self.equivalent(query, expected_query),
                         msg = "%s != %s" % (query, expected_query))
 
+# =============================================================================
+class HierarchyTreeTests(unittest.TestCase):
+    """ Tests for the array-backed hierarchy representation """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        from core.tools.hierarchy import HierarchyStore
+
+        nodes = {}
+        add = HierarchyStore.add_node
+        for node_id, parent_id, category in ((1, None, "A"),
+                                             (2, 1, "B"),
+                                             (3, 1, "B"),
+                                             (4, 2, "C"),
+                                             (5, None, "A"),
+                                             (6, 5, "B"),
+                                             ):
+            add(nodes, node_id, parent_id=parent_id, category=category)
+        self.nodes = nodes
+
+    # -------------------------------------------------------------------------
+    def testTreeStructure(self):
+        """ Test parent, children and category lookups """
+
+        from core.tools.hierarchy import HierarchyTree
+
+        assertEqual = self.assertEqual
+
+        tree = HierarchyTree(self.nodes)
+
+        assertEqual(len(tree), 6)
+        assertEqual(tree.parent_id(4), 2)
+        assertEqual(tree.parent_id(1), None)
+        assertEqual(tree.category(6), "B")
+        assertEqual(set(tree.child_ids(1)), {2, 3})
+        assertEqual(tree.child_ids(4), [])
+        self.assertTrue(tree.is_leaf(3))
+        self.assertFalse(tree.is_leaf(2))
+        self.assertNotIn(7, tree)
+
+    # -------------------------------------------------------------------------
+    def testTreeIntervals(self):
+        """ Test descendant lookups and ancestor tests via nested sets """
+
+        from core.tools.hierarchy import HierarchyTree
+
+        assertEqual = self.assertEqual
+        assertTrue = self.assertTrue
+        assertFalse = self.assertFalse
+
+        tree = HierarchyTree(self.nodes)
+
+        assertEqual(set(tree.descendants(1)), {2, 3, 4})
+        assertEqual(set(tree.descendants(1, inclusive=True)), {1, 2, 3, 4})
+        assertEqual(tree.descendants(4), [])
+        assertEqual(tree.descendants(7), [])
+
+        assertTrue(tree.is_ancestor(1, 4))
+        assertFalse(tree.is_ancestor(4, 1))
+        assertFalse(tree.is_ancestor(2, 3))
+        assertFalse(tree.is_ancestor(5, 4))
+
+        left, right = tree.interval(5)
+        assertEqual(right - left, 2)
+
+    # -------------------------------------------------------------------------
+    def testTreeCycle(self):
+        """ Test that parent cycles do not break the traversal """
+
+        from core.tools.hierarchy import HierarchyTree
+
+        nodes = dict(self.nodes)
+        nodes[7] = (8, None)
+        nodes[8] = (7, None)
+
+        tree = HierarchyTree(nodes)
+        self.assertEqual(len(tree.descendants(7)) + len(tree.descendants(8)), 1)
+
+    # -------------------------------------------------------------------------
+    def testStoreIncremental(self):
+        """ Test incremental updates of the hierarchy store """
+
+        from core.tools.hierarchy import HierarchyStore
+
+        assertEqual = self.assertEqual
+
+        store = HierarchyStore()
+        store.replace(dict(self.nodes), version="v1")
+
+        tree = store.snapshot()
+        self.assertIs(store.snapshot(), tree)
+
+        # Add a node under an existing node
+        store.add(7, parent_id=4, category="D")
+        assertEqual(store.version, None)
+        updated = store.snapshot()
+        self.assertIsNot(updated, tree)
+        assertEqual(set(updated.descendants(2)), {4, 7})
+
+        # Previous snapshot remains unchanged
+        assertEqual(set(tree.descendants(2)), {4})
+
+        # Remove a node
+        self.assertTrue(store.remove(4))
+        self.assertFalse(store.remove(4))
+        updated = store.snapshot()
+        assertEqual(updated.descendants(2), [])
+        assertEqual(updated.parent_id(7), 4)
+
+# =============================================================================
+class TypeOfIntervalTests(unittest.TestCase):
+    """
+        Tests for __typeof queries with nested-set intervals, with a
+        hierarchy of the size of the German administrative areas
+        (16 states, 401 districts, 10787 municipalities)
+    """
+
+    STATES = 16
+    DISTRICTS = 401
+    MUNICIPALITIES = 10787
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        s3db = current.s3db
+
+        s3db.define_table("typeof_interval",
+                          Field("name"),
+                          Field("parent", "reference typeof_interval"),
+                          *S3Hierarchy.interval_fields())
+
+        s3db.define_table("typeof_interval_reference",
+                          Field("typeof_interval_id", "reference typeof_interval"),
+                          )
+
+        current.auth.override = True
+
+        table = current.db.typeof_interval
+        rtable = current.db.typeof_interval_reference
+
+        # States, with districts and municipalities round-robin
+        states = [table.insert(name="State %s" % i)
+                  for i in range(cls.STATES)]
+        districts = [table.insert(name = "District %s" % i,
+                                  parent = states[i % cls.STATES],
+                                  )
+                     for i in range(cls.DISTRICTS)]
+        for i in range(cls.MUNICIPALITIES):
+            municipality = table.insert(name = "Municipality %s" % i,
+                                        parent = districts[i % cls.DISTRICTS],
+                                        )
+            rtable.insert(typeof_interval_id=municipality)
+        for district in districts:
+            rtable.insert(typeof_interval_id=district)
+
+        cls.states = states
+        cls.districts = districts
+
+        s3db.configure("typeof_interval", hierarchy="parent")
+        S3Hierarchy.dirty("typeof_interval")
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        db = current.db
+        db.typeof_interval_reference.drop()
+        db.typeof_interval.drop(mode="cascade")
+
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+        current.s3db.configure("typeof_interval", hierarchy="parent")
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def testIntervals(self):
+        """ Test that the intervals are saved in the hierarchical table """
+
+        h = S3Hierarchy("typeof_interval")
+        tree = h.tree
+
+        table = current.db.typeof_interval
+        rows = current.db(table.id > 0).select(table.id,
+                                               table.hierarchy_left,
+                                               table.hierarchy_right,
+                                               )
+        intervals = {row.id: (row.hierarchy_left, row.hierarchy_right)
+                     for row in rows}
+
+        for node_id, interval in intervals.items():
+            self.assertEqual(interval, tree.interval(node_id))
+
+        state = self.states[0]
+        left, right = intervals[state]
+        for node_id in tree.descendants(state):
+            self.assertTrue(left < intervals[node_id][0] < right)
+
+    # -------------------------------------------------------------------------
+    def testTypeOfRange(self):
+        """ Test that typeof resolves into range queries """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        resource = current.s3db.resource("typeof_interval_reference")
+        rtable = resource.table
+
+        h = S3Hierarchy("typeof_interval")
+
+        for node_ids in ([self.states[0]],
+                         self.states[:4],
+                         [self.districts[0], self.states[1]],
+                         ):
+            expr = FS("typeof_interval_id").typeof(node_ids)
+            query = expr.query(resource)
+            sql = str(query)
+            self.assertIn("hierarchy_left", sql)
+            # No list of node IDs in the query
+            self.assertNotRegex(sql, r"IN \(\d")
+
+            expected = h.findall(node_ids, inclusive=True)
+            q = rtable.typeof_interval_id.belongs(expected)
+            assertEqual(db(query).count(), db(q).count())
+
+        # Query in the hierarchical table itself
+        resource = current.s3db.resource("typeof_interval")
+        table = resource.table
+
+        state = self.states[2]
+        query = FS("id").typeof(state).query(resource)
+        sql = str(query)
+        self.assertIn("hierarchy_left", sql)
+        self.assertNotRegex(sql, r"IN \(\d")
+        rows = db(query).select(table.id)
+        assertEqual({row.id for row in rows},
+                    set(h.tree.descendants(state, inclusive=True)))
+
+    # -------------------------------------------------------------------------
+    def testTypeOfOutdatedIntervals(self):
+        """ Test that typeof queries verify the version of the intervals """
+
+        from core.tools.hierarchy import HierarchyStore
+
+        db = current.db
+        s3db = current.s3db
+
+        tablename = "typeof_interval"
+        resource = s3db.resource("typeof_interval_reference")
+        rtable = resource.table
+
+        hierarchies = current.model["hierarchies"]
+        hierarchies.pop(tablename, None)
+
+        h = S3Hierarchy(tablename)
+        node_ids = self.states[:2]
+        expected = h.findall(node_ids, inclusive=True)
+        count = db(rtable.typeof_interval_id.belongs(expected)).count()
+
+        htable = s3db.s3_hierarchy
+        table = db[tablename]
+        try:
+            # Another process changes the intervals and saves a new
+            # version after this request has loaded the hierarchy
+            db(htable.tablename == tablename).update(version=htable.version + 1)
+            db(table.id > 0).update(hierarchy_left=None, hierarchy_right=None)
+
+            # Query falls back to the node set
+            query = FS("typeof_interval_id").typeof(node_ids).query(resource)
+            self.assertNotIn("hierarchy_left", str(query))
+            self.assertEqual(db(query).count(), count)
+        finally:
+            # Restore the intervals
+            hierarchies.pop(tablename, None)
+            HierarchyStore.get(tablename).replace({})
+            S3Hierarchy.dirty(tablename)
+            S3Hierarchy(tablename).tree
+
+    # -------------------------------------------------------------------------
+    def testTypeOfPerformance(self):
+        """ Benchmark for typeof queries, node lists vs intervals """
+
+        db = current.db
+        resource = current.s3db.resource("typeof_interval_reference")
+        field = resource.table.typeof_interval_id
+
+        h = S3Hierarchy("typeof_interval")
+        h.tree
+
+        info("")
+        for label, node_ids in (("1 state", self.states[:1]),
+                                ("all states", self.states),
+                                ):
+            # Using a list of all descendant IDs
+            def belongs():
+                nodeset = h.findall(node_ids, inclusive=True)
+                return db(field.belongs(nodeset)).count()
+            mlt_belongs = timeit.Timer(belongs).timeit(number=10) / 10
+
+            # Using the interval fields
+            def intervals():
+                query = FS("typeof_interval_id").typeof(node_ids).query(resource)
+                return db(query).count()
+            mlt_intervals = timeit.Timer(intervals).timeit(number=10) / 10
+
+            self.assertEqual(belongs(), intervals())
+            info("typeof (%s): belongs = %.1f ms, intervals = %.1f ms" % \
+                 (label, mlt_belongs * 1000, mlt_intervals * 1000))
+
 # =============================================================================
 if __name__ == "__main__":
 
@@ -2090,6 +2566,8 @@ if __name__ == "__main__":
         SimpleHierarchyTests,
         LinkedHierarchyTests,
         TypeOfTests,
+        HierarchyTreeTests,
+        TypeOfIntervalTests,
     )
 
 # END ========================================================================
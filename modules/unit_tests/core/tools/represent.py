@@ -301,6 +301,147 @@ class BulkRepresentTests(unittest.TestCase):
         current.db.rollback()
         current.auth.override = False
 
+# =============================================================================
+class SharedRepresentCacheTests(unittest.TestCase):
+    """ Tests for the cross-request RepresentCache """
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        settings = current.deployment_settings
+        cls.represent_cache = settings.get_base_represent_cache()
+        settings.base.represent_cache = True
+
+        RepresentCache._instance = None
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        current.deployment_settings.base.represent_cache = cls.represent_cache
+
+        RepresentCache._instance = None
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        otable = s3db.org_organisation
+        org = Storage(name="Shared Represent Test Organisation")
+        org_id = otable.insert(**org)
+        org.update(id=org_id)
+        s3db.update_super(otable, org)
+
+        self.org_id = org_id
+        self.name = org.name
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        RepresentCache.instance().clear()
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def testSharedLookup(self):
+        """ Test sharing of representations between instances """
+
+        org_id = self.org_id
+
+        # Not shared by default
+        r = S3Represent(lookup="org_organisation")
+        self.assertEqual(r(org_id), self.name)
+        self.assertEqual(r.queries, 1)
+        r = S3Represent(lookup="org_organisation")
+        self.assertEqual(r(org_id), self.name)
+        self.assertEqual(r.queries, 1)
+
+        # First instance with cache looks up the row
+        r = S3Represent(lookup="org_organisation", cache=True)
+        self.assertEqual(r(org_id), self.name)
+        self.assertEqual(r.queries, 1)
+
+        # Second instance gets the representation from the cache
+        r = S3Represent(lookup="org_organisation", cache=True)
+        self.assertEqual(r(org_id), self.name)
+        self.assertEqual(r.bulk([org_id])[org_id], self.name)
+        self.assertEqual(r.queries, 0)
+
+        # Different configuration does not share entries
+        r = S3Represent(lookup="org_organisation", fields=["name", "acronym"], cache=True)
+        r(org_id)
+        self.assertEqual(r.queries, 1)
+
+        stats = RepresentCache.instance().statistics()
+        self.assertIn("org_organisation", stats)
+        self.assertEqual(stats["org_organisation"].hits, 1)
+        self.assertEqual(stats["org_organisation"].misses, 2)
+
+    # -------------------------------------------------------------------------
+    def testInvalidation(self):
+        """ Test invalidation of shared representations upon update """
+
+        org_id = self.org_id
+
+        r = S3Represent(lookup="org_organisation", cache=True)
+        self.assertEqual(r(org_id), self.name)
+
+        table = current.s3db.org_organisation
+        current.db(table.id == org_id).update(name="Renamed Test Organisation")
+
+        r = S3Represent(lookup="org_organisation", cache=True)
+        self.assertEqual(r(org_id), "Renamed Test Organisation")
+        self.assertEqual(r.queries, 1)
+
+    # -------------------------------------------------------------------------
+    def testDependencyInvalidation(self):
+        """ Test invalidation of shared representations upon changes in dependencies """
+
+        org_id = self.org_id
+
+        class TypeRepresent(S3Represent):
+            cache_depends = ("org_organisation_organisation_type",)
+
+        r = TypeRepresent(lookup="org_organisation", cache=True)
+        self.assertEqual(r(org_id), self.name)
+
+        r = TypeRepresent(lookup="org_organisation", cache=True)
+        r(org_id)
+        self.assertEqual(r.queries, 0)
+
+        # Creating a link in the dependency invalidates the entries
+        s3db = current.s3db
+        ttable = s3db.org_organisation_type
+        type_id = ttable.insert(name="Shared Represent Test Type")
+        ltable = s3db.org_organisation_organisation_type
+        link_id = ltable.insert(organisation_id = org_id,
+                                organisation_type_id = type_id,
+                                )
+
+        r = TypeRepresent(lookup="org_organisation", cache=True)
+        r(org_id)
+        self.assertEqual(r.queries, 1)
+
+        # ...and so does updating it
+        current.db(ltable.id == link_id).update(deleted=True)
+
+        r = TypeRepresent(lookup="org_organisation", cache=True)
+        r(org_id)
+        self.assertEqual(r.queries, 1)
+
+        # Lookups without dependencies are unaffected
+        r = S3Represent(lookup="org_organisation", cache=True)
+        r(org_id)
+        current.db(ttable.id == type_id).update(name="Renamed Test Type")
+        r = S3Represent(lookup="org_organisation", cache=True)
+        r(org_id)
+        self.assertEqual(r.queries, 0)
+
 # =============================================================================
 class ExtractLazyFKRepresentationTests(unittest.TestCase):
     """ Test lazy representation of foreign keys in datatables """
@@ -1046,6 +1187,7 @@ if __name__ == "__main__":
 
     run_suite(
         BulkRepresentTests,
+        SharedRepresentCacheTests,
         ExtractLazyFKRepresentationTests,
         ExportLazyFKRepresentationTests,
     )
@@ -5,6 +5,8 @@
 #
 import datetime
 import random
+import sys
+import timeit
 import unittest
 import dateutil.tz
 
@@ -13,6 +15,9 @@ from core import *
 
 from unit_tests import run_suite
 
+def info(msg):
+    sys.stdout.write("%s\n" % msg)
+
 # =============================================================================
 class EventTests(unittest.TestCase):
     """ Tests for TimeSeriesEvent class """
@@ -667,6 +672,37 @@ class PeriodTests(unittest.TestCase):
         assertEqual(period.totals, expected_totals)
         assertEqual(totals, expected_totals)
 
+    # -------------------------------------------------------------------------
+    def testAggregateGrouped(self):
+        """ Test grouped aggregation gives the same results as per group """
+
+        period = self.period
+        assertEqual = self.assertEqual
+
+        for method in ("count", "sum", "min", "max", "avg"):
+
+            fact = TimeSeriesFact(method, "base")
+
+            period.group()
+            result = period.aggregate_grouped(fact)
+            if result is None:
+                # NumPy not installed
+                continue
+            rows, cols, matrix, total = result
+
+            aggregate = fact.aggregate
+            cevents = period.cevents
+            def expected(event_sets):
+                return {key: aggregate(period,
+                                       [cevents[i] for i in event_ids[0]])
+                        for key, event_ids in event_sets.items()
+                        }
+
+            assertEqual(rows, expected(period._rows))
+            assertEqual(cols, expected(period._cols))
+            assertEqual(matrix, expected(period._matrix))
+            assertEqual(total, aggregate(period, list(cevents.values())))
+
 # =============================================================================
 class PeriodTestsSingleAxis(unittest.TestCase):
     """ Tests for TimeSeriesPeriod with single pivot axis """
@@ -1205,6 +1241,153 @@ class EventFrameTests(unittest.TestCase):
             assertEqual(period.start, expected[i][0])
             assertEqual(period.end, expected[i][1])
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def random_events(num, start, days):
+        """
+            Generate random events within a time frame
+
+            Args:
+                num: the number of events
+                start: the start of the time frame (datetime)
+                days: the length of the time frame in days
+
+            Returns:
+                list of TimeSeriesEvents
+        """
+
+        events = []
+        randint = random.randint
+        delta = datetime.timedelta
+        for event_id in range(num):
+            event_start = event_end = None
+            if randint(0, 9):
+                event_start = start + delta(days=randint(-30, days + 30))
+                if randint(0, 4):
+                    event_end = event_start + delta(days=randint(0, 60))
+            events.append(TimeSeriesEvent(event_id,
+                                          start = event_start,
+                                          end = event_end,
+                                          values = {"test": 1},
+                                          ))
+        return events
+
+    # -------------------------------------------------------------------------
+    def testExtendLegacy(self):
+        """ Test that extend gives the same results as the legacy algorithm """
+
+        assertEqual = self.assertEqual
+
+        start = tp_datetime(2012, 1, 1)
+        end = tp_datetime(2012, 12, 15)
+
+        events = self.random_events(500, start, 350)
+        for slots in ("days", "2 weeks", "3 months"):
+
+            ef = TimeSeriesEventFrame(start, end, slots=slots, events=events)
+
+            legacy = TimeSeriesEventFrame(start, end, slots=slots)
+            legacy_extend(legacy, events)
+
+            assertEqual(set(ef.periods), set(legacy.periods))
+            for dt, period in legacy.periods.items():
+                other = ef.periods[dt]
+                assertEqual(other.end, period.end)
+                assertEqual(set(other.cevents), set(period.cevents))
+                assertEqual(set(other.pevents), set(period.pevents))
+
+    # -------------------------------------------------------------------------
+    def testExtendPerformance(self):
+        """ Benchmark for extend, compared to the legacy algorithm """
+
+        info("")
+
+        start = tp_datetime(2012, 1, 1)
+        end = tp_datetime(2012, 12, 31)
+
+        for num in (1000, 10000):
+            events = self.random_events(num, start, 365)
+
+            x = lambda: TimeSeriesEventFrame(start, end,
+                                             slots = "days",
+                                             events = events,
+                                             )
+            mlt = timeit.Timer(x).timeit(number=1)
+            info("TimeSeriesEventFrame.extend (N=%s, daily) = %s ms" % \
+                 (num, mlt * 1000.0))
+
+            def y():
+                legacy = TimeSeriesEventFrame(start, end, slots="days")
+                legacy_extend(legacy, events)
+            legacy_mlt = timeit.Timer(y).timeit(number=1)
+            info("Legacy extend (N=%s, daily) = %s ms" % \
+                 (num, legacy_mlt * 1000.0))
+
+# =============================================================================
+def legacy_extend(frame, events):
+    """
+        The previous algorithm of TimeSeriesEventFrame.extend (re-scanning
+        the events for every period), for comparison
+
+        Args:
+            frame: the TimeSeriesEventFrame
+            events: list of TimeSeriesEvents
+    """
+
+    events = sorted(events)
+
+    rule = frame.rule
+    periods = frame.periods
+
+    start = events[0].start
+    if start is None or start <= frame.start:
+        first = rule[0]
+    else:
+        first = rule.before(start, inc=True)
+
+    current_events = {}
+    previous_events = {}
+    for start in rule.between(first, frame.end, inc=True):
+
+        end = rule.after(start)
+        if not end:
+            if start < frame.end:
+                end = frame.end
+            else:
+                break
+
+        last_index = None
+        for index, event in enumerate(events):
+            last_index = index
+            if event.end and event.end < start:
+                previous_events[event.event_id] = event
+            elif event.start is None or event.start < end:
+                current_events[event.event_id] = event
+            else:
+                break
+
+        period = periods.get(start)
+        if period is None:
+            period = periods[start] = TimeSeriesPeriod(start, end=end)
+        for event in current_events.values():
+            period.add_current(event)
+        for event in previous_events.values():
+            period.add_previous(event)
+
+        events = events[last_index:] if last_index is not None else None
+        if not events:
+            break
+
+        remaining = {}
+        for event_id, event in current_events.items():
+            if not event.end or event.end > end:
+                remaining[event_id] = event
+            else:
+                previous_events[event_id] = event
+        current_events = remaining
+
+    frame.empty = False
+
 # =============================================================================
 class DtParseTests(unittest.TestCase):
     """ Test Parsing of Datetime Options """
@@ -1 +1,4 @@
 from .s3layouts import *
+from .cwa import *
+from .dailyreports import *
+from .dcc import *
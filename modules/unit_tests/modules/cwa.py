@@ -0,0 +1,267 @@
+# RLPPTM CWA Reporting Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/modules/cwa.py
+#
+import json
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gluon import current
+
+from unit_tests import run_suite
+
+try:
+    from templates.RLPPTM.cwa import CWATransmitter, CWAResultQueue
+except ImportError:
+    CWATransmitter = CWAResultQueue = None
+
+# =============================================================================
+class CWAStubHandler(BaseHTTPRequestHandler):
+    """ Request handler for a stub CWA result server """
+
+    def do_POST(self):
+
+        server = self.server
+
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        server.received.append(data)
+
+        # Reject the whole list if it contains a rejected test result
+        ids = {testresult["id"] for testresult in data["testResults"]}
+        if ids & server.rejected:
+            self.send_response(400)
+        else:
+            self.send_response(server.status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+# =============================================================================
+class CWATransmissionTests(unittest.TestCase):
+    """ Tests for batched transmission of test results to CWA """
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        if CWATransmitter is None:
+            raise unittest.SkipTest("RLPPTM template not available")
+
+        # Start a stub server on a free local port
+        server = ThreadingHTTPServer(("127.0.0.1", 0), CWAStubHandler)
+        server.received = []
+        server.rejected = set()
+        server.status = 204
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        cls.server = server
+        cls.url = "http://127.0.0.1:%s/api/v1/quicktest/results" % server.server_port
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        self.server.received = []
+        self.server.rejected = set()
+        self.server.status = 204
+
+        self.entries = []
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        if self.entries:
+            # The queue commits, so must clean up explicitly
+            db = current.db
+            table = current.s3db.disease_cwa_queue
+            db(table.id.belongs(self.entries)).delete()
+            db.commit()
+
+    # -------------------------------------------------------------------------
+    def queue(self, lab_ids):
+        """
+            Add entries to the CWA queue
+
+            Args:
+                lab_ids: list of lab IDs, one entry per item
+        """
+
+        table = current.s3db.table("disease_cwa_queue")
+        if not table:
+            self.skipTest("CWA queue not available")
+
+        for index, lab_id in enumerate(lab_ids):
+            self.entries.append(table.insert(lab_id = lab_id,
+                                             testresult = {"id": "hash%s" % index,
+                                                           "sc": 1640995200,
+                                                           "result": 6,
+                                                           },
+                                             ))
+
+    # -------------------------------------------------------------------------
+    def testTransmit(self):
+        """ Test transmission of a QuickTestResultList """
+
+        assertEqual = self.assertEqual
+
+        transmitter = CWATransmitter(self.url)
+        testresults = [{"id": "hash%s" % i, "sc": 1640995200, "result": 6}
+                       for i in range(3)
+                       ]
+
+        # Successful transmission
+        status, error = transmitter.transmit(testresults, lab_id="LAB1")
+        assertEqual(status, 204)
+        assertEqual(error, None)
+
+        received = self.server.received
+        assertEqual(len(received), 1)
+        assertEqual(received[0]["labId"], "LAB1")
+        assertEqual(received[0]["testResults"], testresults)
+
+        # Connection is reused for subsequent transmissions
+        status, error = transmitter.transmit(testresults)
+        assertEqual(status, 204)
+        assertEqual(len(received), 2)
+        self.assertNotIn("labId", received[1])
+
+        # Remote error
+        self.server.status = 500
+        status, error = transmitter.transmit(testresults)
+        assertEqual(status, 500)
+        self.assertTrue(error)
+
+    # -------------------------------------------------------------------------
+    def testTransmitLocalError(self):
+        """ Test transmission to an unreachable server """
+
+        # Find a port nobody listens on
+        server = ThreadingHTTPServer(("127.0.0.1", 0), CWAStubHandler)
+        port = server.server_port
+        server.server_close()
+
+        transmitter = CWATransmitter("http://127.0.0.1:%s/" % port, timeout=5)
+        status, error = transmitter.transmit([{"id": "hash", "sc": 1640995200, "result": 6}])
+        self.assertEqual(status, None)
+        self.assertTrue(error)
+
+    # -------------------------------------------------------------------------
+    def testProcessBatches(self):
+        """ Test that queued results are sent in batches per lab ID """
+
+        assertEqual = self.assertEqual
+
+        self.queue(["LAB1", "LAB2", "LAB1", None, "LAB1"])
+
+        batch_size = CWAResultQueue.BATCH_SIZE
+        CWAResultQueue.BATCH_SIZE = 2
+        try:
+            metrics = CWAResultQueue.process(transmitter=CWATransmitter(self.url))
+        finally:
+            CWAResultQueue.BATCH_SIZE = batch_size
+
+        assertEqual(metrics["sent"], 5)
+        assertEqual(metrics["failed"], 0)
+        assertEqual(metrics["batches"], 4)
+        self.assertTrue(metrics["throughput"] > 0)
+
+        # One request per batch, lab IDs as queued
+        received = self.server.received
+        assertEqual(sorted(len(r["testResults"]) for r in received), [1, 1, 1, 2])
+        assertEqual(sorted(r.get("labId") or "" for r in received), ["", "LAB1", "LAB1", "LAB2"])
+
+        # Sent entries are removed from the queue
+        table = current.s3db.disease_cwa_queue
+        query = table.id.belongs(self.entries)
+        assertEqual(current.db(query).count(), 0)
+
+    # -------------------------------------------------------------------------
+    def testProcessRetry(self):
+        """ Test that failed transmissions are retried with backoff """
+
+        assertEqual = self.assertEqual
+
+        self.queue(["LAB1", "LAB1"])
+
+        self.server.status = 503
+        metrics = CWAResultQueue.process(transmitter=CWATransmitter(self.url))
+        assertEqual(metrics["sent"], 0)
+        assertEqual(metrics["failed"], 2)
+
+        db = current.db
+        table = current.s3db.disease_cwa_queue
+        query = table.id.belongs(self.entries)
+        rows = db(query).select(table.status,
+                                table.attempts,
+                                table.next_attempt,
+                                )
+        for row in rows:
+            assertEqual(row.status, "PENDING")
+            assertEqual(row.attempts, 1)
+            self.assertTrue(row.next_attempt is not None)
+
+        # Not retried before the next attempt is due
+        self.server.status = 204
+        metrics = CWAResultQueue.process(transmitter=CWATransmitter(self.url))
+        assertEqual(metrics["sent"], 0)
+
+        # ...but then sent
+        db(query).update(next_attempt=None)
+        metrics = CWAResultQueue.process(transmitter=CWATransmitter(self.url))
+        assertEqual(metrics["sent"], 2)
+
+    # -------------------------------------------------------------------------
+    def testProcessRejected(self):
+        """ Test that only rejected results of a batch are retried """
+
+        assertEqual = self.assertEqual
+
+        self.queue(["LAB1"] * 5)
+
+        # Server rejects the third test result
+        self.server.rejected = {"hash2"}
+        metrics = CWAResultQueue.process(transmitter=CWATransmitter(self.url))
+        assertEqual(metrics["sent"], 4)
+        assertEqual(metrics["failed"], 1)
+
+        # Only the rejected entry remains in the queue, to be retried
+        db = current.db
+        table = current.s3db.disease_cwa_queue
+        query = table.id.belongs(self.entries)
+        rows = db(query).select(table.id,
+                                table.status,
+                                table.attempts,
+                                )
+        assertEqual(len(rows), 1)
+        row = rows.first()
+        assertEqual(row.id, self.entries[2])
+        assertEqual(row.status, "PENDING")
+        assertEqual(row.attempts, 1)
+
+        # Every accepted test result was sent exactly once
+        accepted = []
+        for r in self.server.received:
+            ids = [testresult["id"] for testresult in r["testResults"]]
+            if "hash2" not in ids:
+                accepted.extend(ids)
+        assertEqual(sorted(accepted), ["hash0", "hash1", "hash3", "hash4"])
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        CWATransmissionTests,
+    )
+
+# END ========================================================================
@@ -0,0 +1,210 @@
+# RLPPTM Daily Testing Reports Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/modules/dailyreports.py
+#
+import datetime
+import unittest
+
+from gluon import current
+
+from unit_tests import run_suite
+
+try:
+    from templates.RLPPTM.helpers import DailyReportQueue
+except ImportError:
+    DailyReportQueue = None
+
+# =============================================================================
+class DailyReportQueueTests(unittest.TestCase):
+    """ Tests for batched updates of daily testing reports """
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        if DailyReportQueue is None:
+            raise unittest.SkipTest("RLPPTM template not available")
+        if not current.s3db.table("disease_testing_report_queue"):
+            raise unittest.SkipTest("Testing report queue not available")
+
+        # Test without subtotals per demographic
+        settings = current.deployment_settings
+        cls.by_demographic = settings.disease.get("testing_report_by_demographic")
+        settings.disease.testing_report_by_demographic = False
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        current.deployment_settings.disease.testing_report_by_demographic = cls.by_demographic
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        self.disease_id = s3db.disease_disease.insert(name="Report Queue Test Disease")
+
+        org_id = s3db.org_organisation.insert(name="Report Queue Test Organisation")
+
+        ftable = s3db.org_facility
+        facility = {"name": "Report Queue Test Station",
+                    "organisation_id": org_id,
+                    }
+        facility["id"] = ftable.insert(**facility)
+        s3db.update_super(ftable, facility)
+        self.site_id = facility["site_id"]
+
+        self.today = current.request.utcnow.date()
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def report(self, date=None):
+        """
+            Look up the daily report for the test station
+
+            Args:
+                date: the report date (default: today)
+
+            Returns:
+                the disease_testing_report Row
+        """
+
+        table = current.s3db.disease_testing_report
+        query = (table.site_id == self.site_id) & \
+                (table.disease_id == self.disease_id) & \
+                (table.date == (date or self.today)) & \
+                (table.deleted == False)
+        return current.db(query).select(table.id,
+                                        table.tests_total,
+                                        table.tests_positive,
+                                        limitby = (0, 1),
+                                        ).first()
+
+    # -------------------------------------------------------------------------
+    def record_results(self, results, date=None):
+        """
+            Record individual test results for the test station
+
+            Args:
+                results: list of test results ("POS"|"NEG")
+                date: the result date (default: today)
+        """
+
+        table = current.s3db.disease_case_diagnostics
+        for result in results:
+            table.insert(site_id = self.site_id,
+                         disease_id = self.disease_id,
+                         result_date = date or self.today,
+                         result = result,
+                         )
+
+    # -------------------------------------------------------------------------
+    def testProcessDeltas(self):
+        """ Test application of queued deltas to an existing report """
+
+        assertEqual = self.assertEqual
+
+        site_id, disease_id, today = self.site_id, self.disease_id, self.today
+
+        table = current.s3db.disease_testing_report
+        table.insert(site_id = site_id,
+                     disease_id = disease_id,
+                     date = today,
+                     tests_total = 5,
+                     tests_positive = 1,
+                     )
+
+        for result in ("POS", "NEG", "NEG"):
+            DailyReportQueue.enqueue(site_id, today, disease_id, result=result)
+
+        # Nothing changed before processing the queue
+        report = self.report()
+        assertEqual(report.tests_total, 5)
+        assertEqual(report.tests_positive, 1)
+
+        self.assertGreaterEqual(DailyReportQueue.process(), 3)
+
+        report = self.report()
+        assertEqual(report.tests_total, 8)
+        assertEqual(report.tests_positive, 2)
+
+        # Queue is empty
+        qtable = current.s3db.disease_testing_report_queue
+        query = (qtable.site_id == site_id)
+        assertEqual(current.db(query).count(), 0)
+
+    # -------------------------------------------------------------------------
+    def testProcessRecount(self):
+        """ Test recount for changed results and for missing reports """
+
+        assertEqual = self.assertEqual
+
+        site_id, disease_id, today = self.site_id, self.disease_id, self.today
+
+        self.record_results(["POS", "NEG"])
+
+        # Deltas without report => full recount
+        DailyReportQueue.enqueue(site_id, today, disease_id, result="POS")
+        DailyReportQueue.process()
+
+        report = self.report()
+        assertEqual(report.tests_total, 2)
+        assertEqual(report.tests_positive, 1)
+
+        # Changed result => full recount
+        self.record_results(["POS"])
+        DailyReportQueue.enqueue(site_id, today, disease_id, recount=True)
+        DailyReportQueue.process()
+
+        report = self.report()
+        assertEqual(report.tests_total, 3)
+        assertEqual(report.tests_positive, 2)
+
+    # -------------------------------------------------------------------------
+    def testReconcile(self):
+        """ Test reconciliation of reports with recorded test results """
+
+        assertEqual = self.assertEqual
+
+        yesterday = self.today - datetime.timedelta(days=1)
+
+        # Report with too low totals
+        table = current.s3db.disease_testing_report
+        table.insert(site_id = self.site_id,
+                     disease_id = self.disease_id,
+                     date = self.today,
+                     tests_total = 1,
+                     tests_positive = 0,
+                     )
+        self.record_results(["POS", "NEG"])
+
+        # Recorded results without report
+        self.record_results(["NEG"], date=yesterday)
+
+        self.assertGreaterEqual(DailyReportQueue.reconcile(), 2)
+
+        report = self.report()
+        assertEqual(report.tests_total, 2)
+        assertEqual(report.tests_positive, 1)
+
+        report = self.report(yesterday)
+        assertEqual(report.tests_total, 1)
+        assertEqual(report.tests_positive, 0)
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        DailyReportQueueTests,
+    )
+
+# END ========================================================================
@@ -0,0 +1,273 @@
+# RLPPTM DCC Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/modules/dcc.py
+#
+import threading
+import time
+import unittest
+
+from gluon import current
+
+from unit_tests import run_suite
+
+try:
+    from templates.RLPPTM.dcc import DCC
+except ImportError:
+    DCC = None
+
+# =============================================================================
+if DCC is not None:
+
+    class StubDCC(DCC):
+        """
+            DCC with stub server access and storage, to test the
+            concurrent poll/issue paths without DCC server
+        """
+
+        # Requests per issuer, {issuer_id: [request]}
+        requests = {}
+
+        # Issuers whose search does not respond until released
+        slow_issuers = set()
+
+        # Instances whose upload does not respond until released
+        slow_uploads = set()
+
+        # Event to release slow requests
+        release = threading.Event()
+
+        # Uploaded instance IDs, and saved instances {instance_id: status}
+        uploaded = []
+        saved = {}
+
+        @classmethod
+        def reset(cls):
+            cls.requests = {}
+            cls.slow_issuers = set()
+            cls.slow_uploads = set()
+            cls.release = threading.Event()
+            cls.uploaded = []
+            cls.saved = {}
+
+        @classmethod
+        def get_session(cls):
+            return None
+
+        @staticmethod
+        def workers():
+            return 4
+
+        @staticmethod
+        def search(session, url):
+            issuer_id = url.rsplit("/", 1)[-1]
+            if issuer_id in StubDCC.slow_issuers:
+                StubDCC.release.wait(10)
+            return StubDCC.requests.get(issuer_id, []), None
+
+        @classmethod
+        def load_all(cls, instance_ids):
+            instances = {}
+            for instance_id in instance_ids:
+                inst = cls(instance_id)
+                inst.status = "PENDING"
+                inst.data = {}
+                instances[instance_id] = inst
+            return instances
+
+        @staticmethod
+        def facility_names(site_ids):
+            return {}
+
+        def hcert(self, dcci, facility_names=None):
+            return dcci.encode("utf-8")
+
+        @staticmethod
+        def upload_url(instance_id):
+            return instance_id
+
+        @classmethod
+        def transmit(cls, session, endpoint, hcert, public_key):
+            if endpoint in cls.slow_uploads:
+                cls.release.wait(10)
+            cls.uploaded.append(endpoint)
+            return 204, None
+
+        def save(self, errors=None, commit=True):
+            StubDCC.saved[self.instance_id] = self.status
+
+else:
+    StubDCC = None
+
+# =============================================================================
+class DCCIssueTests(unittest.TestCase):
+    """ Tests for concurrent polling and issuing of DCCs """
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        if StubDCC is None:
+            raise unittest.SkipTest("RLPPTM template not available")
+        if not current.s3db.table("disease_hcert_data"):
+            raise unittest.SkipTest("HCERT data table not available")
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        StubDCC.reset()
+
+        settings = current.deployment_settings
+        self.custom = dict(settings.custom)
+        settings.custom.dcc_base_url = "http://dcc.example.com"
+
+        self.records = []
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        # Release any pending requests
+        StubDCC.release.set()
+
+        settings = current.deployment_settings
+        settings.custom.clear()
+        settings.custom.update(self.custom)
+
+        db = current.db
+        db.rollback()
+        if self.records:
+            # Issuing commits, so must clean up explicitly
+            table = current.s3db.disease_hcert_data
+            db(table.id.belongs(self.records)).delete()
+            db.commit()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def request(instance_id):
+        """
+            Generate a DCC request
+
+            Args:
+                instance_id: the DCC instance ID
+
+            Returns:
+                the request (dict)
+        """
+
+        return {"testId": instance_id,
+                "dcci": "DCCI-%s" % instance_id,
+                "publicKey": "KEY-%s" % instance_id,
+                }
+
+    # -------------------------------------------------------------------------
+    def add_pending(self, issuer_id, instance_id):
+        """
+            Add a pending HCERT data record
+
+            Args:
+                issuer_id: the issuer ID
+                instance_id: the instance ID
+        """
+
+        table = current.s3db.disease_hcert_data
+        record_id = table.insert(instance_id = instance_id,
+                                 issuer_id = issuer_id,
+                                 status = "PENDING",
+                                 )
+        self.records.append(record_id)
+
+    # -------------------------------------------------------------------------
+    def testIssue(self):
+        """ Test concurrent upload of requested DCCs """
+
+        assertEqual = self.assertEqual
+
+        instance_ids = ["DCCTEST%s" % i for i in range(10)]
+        requests = [self.request(instance_id) for instance_id in instance_ids]
+
+        # Invalid requests are ignored
+        requests.append({"testId": "DCCTESTX"})
+
+        errors = StubDCC.issue(requests)
+        assertEqual(errors, [])
+
+        assertEqual(set(StubDCC.uploaded), set(instance_ids))
+        assertEqual(StubDCC.saved, {instance_id: "ISSUED" for instance_id in instance_ids})
+
+    # -------------------------------------------------------------------------
+    def testIssueDeadline(self):
+        """ Test that uploads are not waited for beyond the deadline """
+
+        assertEqual = self.assertEqual
+
+        instance_ids = ["DCCTEST%s" % i for i in range(4)]
+        requests = [self.request(instance_id) for instance_id in instance_ids]
+
+        slow = instance_ids[0]
+        StubDCC.slow_uploads.add(slow)
+
+        start = time.time()
+        errors = StubDCC.issue(requests, deadline=start + 1)
+        self.assertLess(time.time() - start, 5)
+
+        # Unfinished upload is deferred, and its instance not saved
+        assertEqual(len(errors), 1)
+        self.assertIn("deferred", errors[0])
+        self.assertNotIn(slow, StubDCC.saved)
+
+        # All other uploads completed
+        assertEqual(StubDCC.saved, {instance_id: "ISSUED"
+                                    for instance_id in instance_ids[1:]})
+
+    # -------------------------------------------------------------------------
+    def testPoll(self):
+        """ Test concurrent polling of all issuers """
+
+        assertEqual = self.assertEqual
+
+        issuers = {"DCCTESTISSUER%s" % i: ["DCCTEST%s%s" % (i, j) for j in range(3)]
+                   for i in range(3)}
+        for issuer_id, instance_ids in issuers.items():
+            for instance_id in instance_ids:
+                self.add_pending(issuer_id, instance_id)
+            StubDCC.requests[issuer_id] = [self.request(instance_id)
+                                           for instance_id in instance_ids]
+
+        errors = StubDCC.poll()
+        self.assertIsNone(errors)
+
+        expected = {instance_id for instance_ids in issuers.values()
+                                for instance_id in instance_ids}
+        assertEqual(set(StubDCC.uploaded), expected)
+        assertEqual(set(StubDCC.saved), expected)
+
+    # -------------------------------------------------------------------------
+    def testPollDeadline(self):
+        """ Test that polling stops after the poll cycle budget """
+
+        settings = current.deployment_settings
+        settings.custom.dcc_poll_budget = 1
+
+        issuers = {"DCCTESTISSUER%s" % i: "DCCTEST%s" % i for i in range(2)}
+        for issuer_id, instance_id in issuers.items():
+            self.add_pending(issuer_id, instance_id)
+            StubDCC.requests[issuer_id] = [self.request(instance_id)]
+
+        StubDCC.slow_issuers.add("DCCTESTISSUER0")
+
+        start = time.time()
+        errors = StubDCC.poll()
+        self.assertLess(time.time() - start, 5)
+
+        # Polling of the slow issuer deferred
+        self.assertIn("polling deferred", errors)
+        self.assertNotIn("DCCTEST0", StubDCC.uploaded)
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        DCCIssueTests,
+    )
+
+# END ========================================================================
@@ -1,3 +1,4 @@
 from .pr import *
 from .org import *
 from .cms import *
+from .fin import *
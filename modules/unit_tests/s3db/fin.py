@@ -0,0 +1,727 @@
+# Fin Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/s3db/fin.py
+#
+import sys
+import threading
+import timeit
+import unittest
+
+from gluon import *
+from gluon.globals import Response
+
+from core import DataModel
+
+from unit_tests import run_suite
+
+def info(msg):
+    sys.stdout.write("%s\n" % msg)
+
+# =============================================================================
+class VoucherTransactionChainTests(unittest.TestCase):
+    """ Tests for appending transactions to the voucher transaction chain """
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        otable = s3db.org_organisation
+        organisation_id = otable.insert(name = "VoucherChainTestOrg")
+
+        ptable = s3db.fin_voucher_program
+        cls.program_id = ptable.insert(organisation_id = organisation_id,
+                                       name = "VoucherChainTestProgram",
+                                       status = "ACTIVE",
+                                       credit = 0,
+                                       compensation = 0,
+                                       )
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def append(self, program=None):
+        """
+            Append a balanced transaction to the chain of the test program
+
+            Args:
+                program: the fin_VoucherProgram instance to use
+
+            Returns:
+                True|False for success or failure
+        """
+
+        if program is None:
+            program = self.program()
+
+        transaction = {"type": "CMP",
+                       "debit": -1,
+                       "compensation": 1,
+                       }
+        return program._fin_VoucherProgram__transaction(transaction)
+
+    # -------------------------------------------------------------------------
+    def program(self):
+        """
+            Get a new fin_VoucherProgram instance for the test program
+        """
+
+        return current.s3db.fin_VoucherProgram(self.program_id)
+
+    # -------------------------------------------------------------------------
+    def chain(self):
+        """
+            Get the transactions of the test program, in order of their IDs
+
+            Returns:
+                Rows
+        """
+
+        table = current.s3db.fin_voucher_transaction
+        query = (table.program_id == self.program_id)
+        return current.db(query).select(table.id,
+                                        table.uuid,
+                                        table.ouuid,
+                                        orderby = table.id,
+                                        )
+
+    # -------------------------------------------------------------------------
+    def testAppend(self):
+        """ Test that appended transactions form an intact chain """
+
+        assertEqual = self.assertEqual
+        assertTrue = self.assertTrue
+
+        for _ in range(3):
+            assertTrue(self.append())
+
+        rows = self.chain()
+        program = self.program()
+
+        # Every transaction links to its predecessor, and is intact
+        ouuid = None
+        for row in rows:
+            assertEqual(row.ouuid, ouuid)
+            assertTrue(program.verify(row.id))
+            ouuid = row.uuid
+
+        # Chain head points to the last transaction
+        table = current.s3db.fin_voucher_chain
+        query = (table.program_id == self.program_id)
+        head = current.db(query).select(table.tuuid,
+                                        table.version,
+                                        limitby = (0, 1),
+                                        ).first()
+        assertEqual(head.tuuid, ouuid)
+
+    # -------------------------------------------------------------------------
+    def testConcurrentAppend(self):
+        """ Test that an append after a concurrent append is retried """
+
+        assertEqual = self.assertEqual
+        assertTrue = self.assertTrue
+
+        # Two requests read the same chain head...
+        first, second = self.program(), self.program()
+        stale = second._fin_VoucherProgram__chain_head()
+
+        # ...but the first appends its transaction first
+        assertTrue(self.append(first))
+
+        # Make the second request use the stale chain head at first
+        heads = [stale]
+        get_head = second._fin_VoucherProgram__chain_head
+        second._fin_VoucherProgram__chain_head = \
+            lambda: heads.pop() if heads else get_head()
+
+        assertTrue(self.append(second))
+        assertEqual(len(heads), 0)
+
+        # Both transactions are in the chain, without forking it
+        rows = self.chain()
+        ouuids = [row.ouuid for row in rows]
+        assertEqual(len(set(ouuids)), len(ouuids))
+        assertEqual(rows.last().ouuid, rows[-2].uuid)
+
+    # -------------------------------------------------------------------------
+    def testCreateChainHead(self):
+        """ Test creation of the chain head from the latest transaction """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        s3db = current.s3db
+
+        self.assertTrue(self.append())
+        last = self.chain().last()
+
+        # Remove the chain head
+        table = s3db.fin_voucher_chain
+        query = (table.program_id == self.program_id)
+        db(query).delete()
+
+        # Re-created from the latest transaction
+        fin_VoucherProgram = s3db.fin_VoucherProgram
+        head = fin_VoucherProgram.create_chain_head(self.program_id)
+        assertEqual(head.tuuid, last.uuid)
+        assertEqual(head.version, 0)
+
+        # Not duplicated when it exists already
+        head = fin_VoucherProgram.create_chain_head(self.program_id)
+        assertEqual(head.tuuid, last.uuid)
+        assertEqual(db(query).count(), 1)
+
+# =============================================================================
+class VoucherConcurrentAppendTests(unittest.TestCase):
+    """
+        Tests for appending transactions to the voucher transaction chain
+        from concurrent requests (=threads with separate DB connections)
+    """
+
+    # Transactions per request
+    TRANSACTIONS = 5
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+
+        db = current.db
+        if db._dbname == "sqlite":
+            raise unittest.SkipTest("Concurrent transactions not supported by SQLite")
+
+        s3db = current.s3db
+
+        otable = s3db.org_organisation
+        cls.organisation_id = otable.insert(name = "VoucherConcurrencyTestOrg")
+
+        ptable = s3db.fin_voucher_program
+        cls.program_id = ptable.insert(organisation_id = cls.organisation_id,
+                                       name = "VoucherConcurrencyTestProgram",
+                                       status = "ACTIVE",
+                                       credit = 0,
+                                       compensation = 0,
+                                       )
+
+        # Must be committed to be visible to the other connections
+        db.commit()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+
+        db = current.db
+        s3db = current.s3db
+
+        db.rollback()
+
+        program_id = cls.program_id
+        for tablename in ("fin_voucher_transaction", "fin_voucher_chain"):
+            table = s3db[tablename]
+            db(table.program_id == program_id).delete()
+
+        ptable = s3db.fin_voucher_program
+        db(ptable.id == program_id).delete()
+
+        otable = s3db.org_organisation
+        db(otable.id == cls.organisation_id).delete()
+
+        db.commit()
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.auth.override = False
+        current.db.rollback()
+
+    # -------------------------------------------------------------------------
+    def append(self, requests):
+        """
+            Append transactions to the chain of the test program from
+            concurrent requests, each running in a separate thread with
+            its own DB connection, committing after every transaction
+
+            Args:
+                requests: the number of concurrent requests
+
+            Returns:
+                tuple (results, errors), results being a list of
+                True|False for success or failure of each transaction
+        """
+
+        program_id = self.program_id
+        transactions = self.TRANSACTIONS
+
+        # Request environment of this thread (current is thread-local)
+        env = {k: v for k, v in current.__dict__.items()
+                    if k not in ("db", "s3db", "response", "model")}
+
+        db_type, db_string, pool_size = current.deployment_settings.get_database_string()
+        folder = current.db._folder
+
+        barrier = threading.Barrier(requests)
+        results, errors = [], []
+
+        def request():
+
+            current.__dict__.update(env)
+            current.response = Response()
+
+            db = current.db = DAL(db_string,
+                                  folder = folder,
+                                  pool_size = pool_size,
+                                  migrate_enabled = False,
+                                  lazy_tables = True,
+                                  ignore_field_case = db_type != "postgres",
+                                  )
+            s3db = current.s3db = DataModel()
+            try:
+                fin_VoucherProgram = s3db.fin_VoucherProgram
+
+                # Start all requests at the same time
+                barrier.wait(30)
+
+                for _ in range(transactions):
+                    transaction = {"type": "CMP",
+                                   "debit": -1,
+                                   "compensation": 1,
+                                   }
+                    program = fin_VoucherProgram(program_id)
+                    success = program._fin_VoucherProgram__transaction(transaction)
+                    if success:
+                        db.commit()
+                    else:
+                        db.rollback()
+                    results.append(success)
+            except Exception as e:
+                db.rollback()
+                errors.append(e)
+            finally:
+                db.close()
+
+        threads = [threading.Thread(target=request) for _ in range(requests)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results, errors
+
+    # -------------------------------------------------------------------------
+    def assertLinearChain(self, expected):
+        """
+            Assert that the chain of the test program is linear, and
+            contains the expected number of transactions
+
+            Args:
+                expected: the expected number of transactions
+        """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        s3db = current.s3db
+
+        # New DB transaction, to see the concurrent commits
+        db.rollback()
+
+        table = s3db.fin_voucher_transaction
+        query = (table.program_id == self.program_id)
+        rows = db(query).select(table.uuid, table.ouuid)
+
+        # No lost transactions
+        assertEqual(len(rows), expected)
+
+        # No forks, i.e. every transaction has exactly one successor...
+        successors = {row.ouuid: row.uuid for row in rows}
+        assertEqual(len(successors), expected)
+
+        # ...and all transactions form one sequence from the first
+        # transaction to the chain head
+        tuuid, length = None, 0
+        while tuuid in successors:
+            tuuid = successors[tuuid]
+            length += 1
+        assertEqual(length, expected)
+
+        htable = s3db.fin_voucher_chain
+        query = (htable.program_id == self.program_id)
+        head = db(query).select(htable.tuuid, limitby=(0, 1)).first()
+        assertEqual(head.tuuid, tuuid)
+
+        # All transactions intact
+        program = s3db.fin_VoucherProgram(self.program_id)
+        report = program.verify_chain(full=True)
+        assertEqual(report["invalid"], [])
+
+    # -------------------------------------------------------------------------
+    def testAppendPerformance(self):
+        """ Benchmark for appending transactions from N concurrent requests """
+
+        info("")
+
+        total = 0
+        for n in (10, 25):
+            start = timeit.default_timer()
+            results, errors = self.append(n)
+            duration = timeit.default_timer() - start
+
+            self.assertEqual(errors, [])
+            self.assertTrue(all(results))
+
+            total += n * self.TRANSACTIONS
+            self.assertLinearChain(total)
+
+            info("fin_VoucherProgram append (N=%s) = %s ms/transaction" % \
+                 (n, duration * 1000.0 / (n * self.TRANSACTIONS)))
+
+# =============================================================================
+class VoucherChainVerificationTests(unittest.TestCase):
+    """ Tests for the verification of the voucher transaction chain """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        otable = s3db.org_organisation
+        organisation_id = otable.insert(name = "VoucherVerificationTestOrg")
+
+        ptable = s3db.fin_voucher_program
+        self.program_id = ptable.insert(organisation_id = organisation_id,
+                                        name = "VoucherVerificationTestProgram",
+                                        status = "ACTIVE",
+                                        credit = 0,
+                                        compensation = 0,
+                                        )
+
+        # Build a chain of 5 transactions
+        program = self.program()
+        for _ in range(5):
+            transaction = {"type": "CMP",
+                           "debit": -1,
+                           "compensation": 1,
+                           }
+            self.assertTrue(program._fin_VoucherProgram__transaction(transaction))
+
+        table = s3db.fin_voucher_transaction
+        query = (table.program_id == self.program_id)
+        self.transactions = current.db(query).select(table.ALL, orderby=table.id)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def program(self):
+        """
+            Get a new fin_VoucherProgram instance for the test program
+        """
+
+        return current.s3db.fin_VoucherProgram(self.program_id)
+
+    # -------------------------------------------------------------------------
+    def testIntactChain(self):
+        """ Test verification of an intact chain """
+
+        assertEqual = self.assertEqual
+
+        transactions = self.transactions
+
+        program = self.program()
+        report = program.verify_chain(full=True, batch_size=2)
+        assertEqual(report["transactions"], 5)
+        assertEqual(report["invalid"], [])
+
+        # Checkpoint advanced to the last transaction
+        checkpoint = program.checkpoint()
+        assertEqual(checkpoint.transaction_id, transactions.last().id)
+        assertEqual(checkpoint.transactions, 5)
+
+        # Incremental verification only verifies new transactions
+        transaction = {"type": "CMP", "debit": -1, "compensation": 1}
+        self.assertTrue(program._fin_VoucherProgram__transaction(transaction))
+        report = program.verify_chain(batch_size=2)
+        assertEqual(report["transactions"], 1)
+        assertEqual(report["invalid"], [])
+        assertEqual(program.checkpoint().transactions, 6)
+
+    # -------------------------------------------------------------------------
+    def testTamperedTransaction(self):
+        """ Test detection of a tampered transaction """
+
+        assertEqual = self.assertEqual
+
+        transactions = self.transactions
+        tampered = transactions[2]
+
+        table = current.s3db.fin_voucher_transaction
+        current.db(table.id == tampered.id).update(debit = -2,
+                                                   compensation = 2,
+                                                   )
+
+        program = self.program()
+        report = program.verify_chain(full=True, batch_size=2)
+        assertEqual(report["invalid"], [tampered.id])
+
+        # Checkpoint advanced only up to the last intact transaction
+        checkpoint = program.checkpoint()
+        assertEqual(checkpoint.transaction_id, transactions[1].id)
+
+    # -------------------------------------------------------------------------
+    def testForkedChain(self):
+        """ Test detection of a forked chain """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        s3db = current.s3db
+
+        transactions = self.transactions
+        parent = transactions[1]
+
+        # Append a correctly hashed transaction to an earlier transaction
+        program = self.program()
+        program.program # load the program record
+        transaction = {"ouuid": parent.uuid,
+                       "date": current.request.utcnow,
+                       "type": "CMP",
+                       "credit": 0,
+                       "voucher": 0,
+                       "debit": -1,
+                       "compensation": 1,
+                       "voucher_id": None,
+                       "debit_id": None,
+                       }
+        vhash = program._hash(transaction, parent.vhash)
+
+        table = s3db.fin_voucher_transaction
+        fork_id = table.insert(program_id = self.program_id,
+                               vhash = vhash,
+                               **transaction)
+
+        report = program.verify_chain(full=True, batch_size=2)
+        assertEqual(report["transactions"], 5)
+        assertEqual(report["invalid"], [fork_id])
+
+        # Deleted transactions are not verified
+        db(table.id == fork_id).update(deleted=True)
+        report = program.verify_chain(full=True, batch_size=2)
+        assertEqual(report["transactions"], 5)
+        assertEqual(report["invalid"], [])
+
+    # -------------------------------------------------------------------------
+    def testForkedChainIncremental(self):
+        """ Test detection of forks from before the checkpoint """
+
+        assertEqual = self.assertEqual
+
+        s3db = current.s3db
+
+        transactions = self.transactions
+        parent = transactions[1]
+
+        program = self.program()
+        report = program.verify_chain(full=True, batch_size=2)
+        assertEqual(report["transactions"], 5)
+
+        # Fork the chain at a transaction before the checkpoint
+        transaction = {"ouuid": parent.uuid,
+                       "date": current.request.utcnow,
+                       "type": "CMP",
+                       "credit": 0,
+                       "voucher": 0,
+                       "debit": -1,
+                       "compensation": 1,
+                       "voucher_id": None,
+                       "debit_id": None,
+                       }
+        vhash = program._hash(transaction, parent.vhash)
+
+        table = s3db.fin_voucher_transaction
+        fork_id = table.insert(program_id = self.program_id,
+                               vhash = vhash,
+                               **transaction)
+
+        # Incremental verification detects the fork
+        report = program.verify_chain(batch_size=2)
+        assertEqual(report["transactions"], 0)
+        assertEqual(report["invalid"], [fork_id])
+        assertEqual(program.checkpoint().transaction_id, transactions.last().id)
+
+# =============================================================================
+class VoucherBillingBatchTests(unittest.TestCase):
+    """ Tests for the generation of voucher claims in batches """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+
+        otable = s3db.org_organisation
+        organisation_id = otable.insert(name = "VoucherBillingTestOrg")
+
+        ptable = s3db.fin_voucher_program
+        program_id = ptable.insert(organisation_id = organisation_id,
+                                   name = "VoucherBillingTestProgram",
+                                   status = "ACTIVE",
+                                   price_per_unit = 2.0,
+                                   currency = "EUR",
+                                   )
+
+        btable = s3db.fin_voucher_billing
+        self.billing_id = billing_id = btable.insert(program_id = program_id,
+                                                     date = current.request.utcnow.date(),
+                                                     status = "IN PROGRESS",
+                                                     )
+
+        # Providers
+        providers = []
+        for index in range(3):
+            provider = {"name": "VoucherBillingTestProvider%s" % index}
+            provider["id"] = otable.insert(**provider)
+            s3db.update_super(otable, provider)
+            providers.append(provider["pe_id"])
+        self.providers = providers
+
+        # Debits: 2 per provider, plus a deleted one
+        dtable = s3db.fin_voucher_debit
+        for index, pe_id in enumerate(providers):
+            for _ in range(2):
+                dtable.insert(program_id = program_id,
+                              billing_id = billing_id,
+                              pe_id = pe_id,
+                              balance = index + 1,
+                              )
+        self.deleted_id = dtable.insert(program_id = program_id,
+                                        billing_id = billing_id,
+                                        pe_id = providers[0],
+                                        balance = 1,
+                                        deleted = True,
+                                        )
+
+        # Record scheduled tasks rather than running them
+        s3task = current.s3task
+        self.run_async = s3task.run_async
+        self.tasks = tasks = []
+        def run_async(task, args=None, vars=None, timeout=300):
+            tasks.append((args, vars))
+        s3task.run_async = run_async
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.s3task.run_async = self.run_async
+
+        current.db.rollback()
+        current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def testGenerateClaims(self):
+        """ Test generation of claims in batches """
+
+        assertEqual = self.assertEqual
+
+        db = current.db
+        s3db = current.s3db
+
+        billing_id = self.billing_id
+
+        # Totals per provider, as in generate_claims
+        dtable = s3db.fin_voucher_debit
+        query = (dtable.billing_id == billing_id) & \
+                (dtable.claim_id == None) & \
+                (dtable.deleted == False)
+        balance_total = dtable.balance.sum()
+        num_vouchers = dtable.voucher_id.count()
+        rows = db(query).select(dtable.pe_id,
+                                balance_total,
+                                num_vouchers,
+                                groupby = dtable.pe_id,
+                                having = balance_total > 0,
+                                )
+        modified_on = {row.id: row.modified_on
+                       for row in db(dtable.billing_id == billing_id).select(dtable.id,
+                                                                             dtable.modified_on,
+                                                                             )}
+
+        # Count the updates of debits
+        updates = []
+        def after_update(dbset, data):
+            updates.append(data)
+        dtable._after_update.append(after_update)
+
+        billing = s3db.fin_VoucherBilling(billing_id)
+        generate = billing._fin_VoucherBilling__generate_claims
+        try:
+            assertEqual(generate(rows, 2), 3)
+        finally:
+            dtable._after_update.remove(after_update)
+
+        # A single update of debits per batch
+        assertEqual(len(updates), 2)
+
+        # Post-processing scheduled per batch
+        tasks = self.tasks
+        assertEqual(len(tasks), 2)
+        assertEqual([len(v["claim_ids"]) for a, v in tasks], [2, 1])
+
+        # One claim per provider, with correct totals
+        ctable = s3db.fin_voucher_claim
+        claims = db(ctable.billing_id == billing_id).select(ctable.id,
+                                                             ctable.pe_id,
+                                                             ctable.quantity_total,
+                                                             ctable.amount_receivable,
+                                                             )
+        assertEqual(len(claims), 3)
+        claim_ids = {}
+        for claim in claims:
+            index = self.providers.index(claim.pe_id)
+            assertEqual(claim.quantity_total, 2 * (index + 1))
+            assertEqual(claim.amount_receivable, 4.0 * (index + 1))
+            claim_ids[claim.pe_id] = claim.id
+
+        # Debits assigned to the claim of their provider
+        debits = db(dtable.billing_id == billing_id).select(dtable.id,
+                                                            dtable.pe_id,
+                                                            dtable.claim_id,
+                                                            dtable.modified_on,
+                                                            )
+        for debit in debits:
+            if debit.id == self.deleted_id:
+                self.assertIsNone(debit.claim_id)
+            else:
+                assertEqual(debit.claim_id, claim_ids[debit.pe_id])
+            # Modification date retained
+            assertEqual(debit.modified_on, modified_on[debit.id])
+
+# =============================================================================
+if __name__ == "__main__":
+
+    run_suite(
+        VoucherTransactionChainTests,
+        VoucherConcurrentAppendTests,
+        VoucherChainVerificationTests,
+        VoucherBillingBatchTests,
+    )
+
+# END ========================================================================
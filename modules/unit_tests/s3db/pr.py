@@ -140,6 +140,61 @@ class PRTests(unittest.TestCase):
         users = s3db.pr_realm_users(None)
         self.assertTrue(all([u in users for u in all_users]))
 
+    # -------------------------------------------------------------------------
+    def testAffiliationClosure(self):
+        """ Test maintenance and lookups of the affiliation closure """
+
+        assertEqual = self.assertEqual
+
+        s3db = current.s3db
+        settings = current.deployment_settings
+
+        org1 = self.org1
+        org2 = self.org2
+
+        otable = s3db.org_organisation
+        org3 = Storage(name="Test PR Organisation 3")
+        org3_id = otable.insert(**org3)
+        org3.update(id=org3_id)
+        s3db.update_super(otable, org3)
+        org3 = s3db.pr_get_pe_id("org_organisation", org3_id)
+
+        closure = settings.pr.get("affiliation_closure")
+        settings.pr.affiliation_closure = True
+        try:
+            # org1 => org2 => org3
+            s3db.pr_add_affiliation(org1, org2, role="TestOrgUnit")
+            s3db.pr_add_affiliation(org2, org3, role="TestOrgUnit")
+
+            ctable = s3db.pr_affiliation_closure
+            query = (ctable.descendant == org3)
+            rows = current.db(query).select(ctable.ancestor, ctable.depth)
+            depths = {row.ancestor: row.depth for row in rows}
+            assertEqual(depths, {org1: 2, org2: 1})
+
+            # Ancestors ordered nearest-first
+            assertEqual(s3db.pr_get_ancestors(org3), [org2, org1])
+            ancestors = s3db.pr_ancestors([org3, org2])
+            assertEqual(ancestors[org3], [org2, org1])
+            assertEqual(ancestors[org2], [org1])
+            assertEqual(set(s3db.pr_get_descendants(org1)), {org2, org3})
+
+            descendants = s3db.pr_descendants([org1])
+            assertEqual(set(descendants[org1]), {org2, org3})
+
+            # Removing the middle link updates all descendants
+            s3db.pr_remove_affiliation(org1, org2, role="TestOrgUnit")
+            assertEqual(s3db.pr_get_ancestors(org3), [org2])
+            assertEqual(s3db.pr_get_descendants(org1), [])
+
+            # Rebuild gives a consistent closure
+            s3db.pr_rebuild_closure()
+            assertEqual(s3db.pr_get_ancestors(org3), [org2])
+            check = s3db.pr_check_closure()
+            assertEqual(check, {"missing": 0, "obsolete": 0, "depth": 0})
+        finally:
+            settings.pr.affiliation_closure = closure
+
     # -------------------------------------------------------------------------
     def tearDown(self):
 
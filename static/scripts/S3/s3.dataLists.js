@@ -238,6 +238,12 @@
                         var limit = Math.min(pageSize, maxIndex - start);
                         // Construct Ajax URL
                         var url = dl._urlAppend(ajaxURL, 'start=' + start + '&limit=' + limit);
+                        // Keyset pagination: send the cursor if it
+                        // refers to the requested start position
+                        var cursor = $datalist.find('.dl-row[data-cursor]').last();
+                        if (cursor.length && cursor.attr('data-cursor-start') == start) {
+                            url = dl._urlAppend(url, 'cursor=' + encodeURIComponent(cursor.attr('data-cursor')));
+                        }
                         return url;
                     },
                     dataType: 'html',
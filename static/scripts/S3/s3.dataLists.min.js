@@ -6,41 +6,91 @@
  requires jQuery UI 1.10 widget factory
 
 */
-(function(d,e,g){e.infinitescroll=function(a,b,c){this.element=e(c);this._create(a,b)||(this.failed=!0)};e.infinitescroll.defaults={loading:{finished:g,finishedMsg:"<em>Congratulations, you've reached the end of the internet.</em>",img:"data:image/gif;base64,R0lGODlh3AATAPQeAPDy+MnQ6LW/4N3h8MzT6rjC4sTM5r/I5NHX7N7j8c7U6tvg8OLl8uXo9Ojr9b3G5MfP6Ovu9tPZ7PT1+vX2+tbb7vf4+8/W69jd7rC73vn5/O/x+K243ai02////wAAACH/C05FVFNDQVBFMi4wAwEAAAAh+QQECgD/ACwAAAAA3AATAAAF/6AnjmRpnmiqrmzrvnAsz3Rt33iu73zv/8CgcEj0BAScpHLJbDqf0Kh0Sq1ar9isdioItAKGw+MAKYMFhbF63CW438f0mg1R2O8EuXj/aOPtaHx7fn96goR4hmuId4qDdX95c4+RBIGCB4yAjpmQhZN0YGYGXitdZBIVGAsLoq4BBKQDswm1CQRkcG6ytrYKubq8vbfAcMK9v7q7EMO1ycrHvsW6zcTKsczNz8HZw9vG3cjTsMIYqQkCLBwHCgsMDQ4RDAYIqfYSFxDxEfz88/X38Onr16+Bp4ADCco7eC8hQYMAEe57yNCew4IVBU7EGNDiRn8Z831cGLHhSIgdFf9chIeBg7oA7gjaWUWTVQAGE3LqBDCTlc9WOHfm7PkTqNCh54rePDqB6M+lR536hCpUqs2gVZM+xbrTqtGoWqdy1emValeXKzggYBBB5y1acFNZmEvXAoN2cGfJrTv3bl69Ffj2xZt3L1+/fw3XRVw4sGDGcR0fJhxZsF3KtBTThZxZ8mLMgC3fRatCbYMNFCzwLEqLgE4NsDWs/tvqdezZf13Hvk2A9Szdu2X3pg18N+68xXn7rh1c+PLksI/Dhe6cuO3ow3NfV92bdArTqC2Ebd3A8vjf5QWfH6Bg7Nz17c2fj69+fnq+8N2Lty+fuP78/eV2X13neIcCeBRwxorbZrA1ANoCDGrgoG8RTshahQ9iSKEEzUmYIYfNWViUhheCGJyIP5E4oom7WWjgCeBFAJNv1DVV01MAdJhhjdkplWNzO/5oXI846njjVEIqR2OS2B1pE5PVscajkxhMycqLJghQSwT40PgfAl4GqNSXYdZXJn5gSkmmmmJu1aZYb14V51do+pTOCmA40AqVCIhG5IJ9PvYnhIFOxmdqhpaI6GeHCtpooisuutmg+Eg62KOMKuqoTaXgicQWoIYq6qiklmoqFV0UoeqqrLbq6quwxirrrLTWauutJ4QAACH5BAUKABwALAcABADOAAsAAAX/IPd0D2dyRCoUp/k8gpHOKtseR9yiSmGbuBykler9XLAhkbDavXTL5k2oqFqNOxzUZPU5YYZd1XsD72rZpBjbeh52mSNnMSC8lwblKZGwi+0QfIJ8CncnCoCDgoVnBHmKfByGJimPkIwtiAeBkH6ZHJaKmCeVnKKTHIihg5KNq4uoqmEtcRUtEREMBggtEr4QDrjCuRC8h7/BwxENeicSF8DKy82pyNLMOxzWygzFmdvD2L3P0dze4+Xh1Arkyepi7dfFvvTtLQkZBC0T/FX3CRgCMOBHsJ+EHYQY7OinAGECgQsB+Lu3AOK+CewcWjwxQeJBihtNGHSoQOE+iQ3//4XkwBBhRZMcUS6YSXOAwIL8PGqEaSJCiYt9SNoCmnJPAgUVLChdaoFBURN8MAzl2PQphwQLfDFd6lTowglHve6rKpbjhK7/pG5VinZP1qkiz1rl4+tr2LRwWU64cFEihwEtZgbgR1UiHaMVvxpOSwBA37kzGz9e8G+B5MIEKLutOGEsAH2ATQwYfTmuX8aETWdGPZmiZcccNSzeTCA1Sw0bdiitC7LBWgu8jQr8HRzqgpK6gX88QbrB14z/kF+ELpwB8eVQj/JkqdylAudji/+ts3039vEEfK8Vz2dlvxZKG0CmbkKDBvllRd6fCzDvBLKBDSCeffhRJEFebFk1k/Mv9jVIoIJZSeBggwUaNeB+Qk34IE0cXlihcfRxkOAJFFhwGmKlmWDiakZhUJtnLBpnWWcnKaAZcxI0piFGGLBm1mc90kajSCveeBVWKeYEoU2wqeaQi0PetoE+rr14EpVC7oAbAUHqhYExbn2XHHsVqbcVew9tx8+XJKk5AZsqqdlddGpqAKdbAYBn1pcczmSTdWvdmZ17c1b3FZ99vnTdCRFM8OEcAhLwm1NdXnWcBBSMRWmfkWZqVlsmLIiAp/o1gGV2vpS4lalGYsUOqXrddcKCmK61aZ8SjEpUpVFVoCpTj4r661Km7kBHjrDyc1RAIQAAIfkEBQoAGwAsBwAEAM4ACwAABf/gtmUCd4goQQgFKj6PYKi0yrrbc8i4ohQt12EHcal+MNSQiCP8gigdz7iCioaCIvUmZLp8QBzW0EN2vSlCuDtFKaq4RyHzQLEKZNdiQDhRDVooCwkbfm59EAmKi4SGIm+AjIsKjhsqB4mSjT2IOIOUnICeCaB/mZKFNTSRmqVpmJqklSqskq6PfYYCDwYHDC4REQwGCBLGxxIQDsHMwhAIX8bKzcENgSLGF9PU1j3Sy9zX2NrgzQziChLk1BHWxcjf7N046tvN82715czn9Pryz6Ilc4ACj4EBOCZM8KEnAYYADBRKnACAYUMFv1wotIhCEcaJCisqwJFgAUSQGyX/kCSVUUTIdKMwJlyo0oXHlhskwrTJciZHEXsgaqS4s6PJiCAr1uzYU8kBBSgnWFqpoMJMUjGtDmUwkmfVmVypakWhEKvXsS4nhLW5wNjVroJIoc05wSzTr0PtiigpYe4EC2vj4iWrFu5euWIMRBhacaVJhYQBEFjA9jHjyQ0xEABwGceGAZYjY0YBOrRLCxUp29QM+bRkx5s7ZyYgVbTqwwti2ybJ+vLtDYpycyZbYOlptxdx0kV+V7lC5iJAyyRrwYKxAdiz82ng0/jnAdMJFz0cPi104Ec1Vj9/M6F173vKL/feXv156dw11tlqeMMnv4V5Ap53GmjQQH97nFfg+IFiucfgRX5Z8KAgbUlQ4IULIlghhhdOSB6AgX0IVn8eReghen3NRIBsRgnH4l4LuEidZBjwRpt6NM5WGwoW0KSjCwX6yJSMab2GwwAPDXfaBCtWpluRTQqC5JM5oUZAjUNS+VeOLWpJEQ7VYQANW0INJSZVDFSnZphjSikfmzE5N4EEbQI1QJmnWXCmHulRp2edwDXF43txukenJwvI9xyg9Q26Z3MzGUcBYFEChZh6DVTq34AU8Iflh51Sd+CnKFYQ6mmZkhqfBKfSxZWqA9DZanWjxmhrWwi0qtCrt/43K6WqVjjpmhIqgEGvculaGKklKstAACEAACH5BAUKABwALAcABADOAAsAAAX/ICdyQmaMYyAUqPgIBiHPxNpy79kqRXH8wAPsRmDdXpAWgWdEIYm2llCHqjVHU+jjJkwqBTecwItShMXkEfNWSh8e1NGAcLgpDGlRgk7EJ/6Ae3VKfoF/fDuFhohVeDeCfXkcCQqDVQcQhn+VNDOYmpSWaoqBlUSfmowjEA+iEAEGDRGztAwGCDcXEA60tXEiCrq8vREMEBLIyRLCxMWSHMzExnbRvQ2Sy7vN0zvVtNfU2tLY3rPgLdnDvca4VQS/Cpk3ABwSLQkYAQwT/P309vcI7OvXr94jBQMJ/nskkGA/BQBRLNDncAIAiDcG6LsxAWOLiQzmeURBKWSLCQbv/1F0eDGinJUKR47YY1IEgQASKk7Yc7ACRwZm7mHweRJoz59BJUogisKCUaFMR0x4SlJBVBFTk8pZivTR0K73rN5wqlXEAq5Fy3IYgHbEzQ0nLy4QSoCjXLoom96VOJEeCosK5n4kkFfqXjl94wa+l1gvAcGICbewAOAxY8l/Ky/QhAGz4cUkGxu2HNozhwMGBnCUqUdBg9UuW9eUynqSwLHIBujePef1ZGQZXcM+OFuEBeBhi3OYgLyqcuaxbT9vLkf4SeqyWxSQpKGB2gQpm1KdWbu72rPRzR9Ne2Nu9Kzr/1Jqj0yD/fvqP4aXOt5sW/5qsXXVcv1Nsp8IBUAmgswGF3llGgeU1YVXXKTN1FlhWFXW3gIE+DVChApysACHHo7Q4A35lLichh+ROBmLKAzgYmYEYDAhCgxKGOOMn4WR4kkDaoBBOxJtdNKQxFmg5JIWIBnQc07GaORfUY4AEkdV6jHlCEISSZ5yTXpp1pbGZbkWmcuZmQCaE6iJ0FhjMaDjTMsgZaNEHFRAQVp3bqXnZED1qYcECOz5V6BhSWCoVJQIKuKQi2KFKEkEFAqoAo7uYSmO3jk61wUUMKmknJ4SGimBmAa0qVQBhAAAIfkEBQoAGwAsBwAEAM4ACwAABf/gJm5FmRlEqhJC+bywgK5pO4rHI0D3pii22+Mg6/0Ej96weCMAk7cDkXf7lZTTnrMl7eaYoy10JN0ZFdco0XAuvKI6qkgVFJXYNwjkIBcNBgR8TQoGfRsJCRuCYYQQiI+ICosiCoGOkIiKfSl8mJkHZ4U9kZMbKaI3pKGXmJKrngmug4WwkhA0lrCBWgYFCCMQFwoQDRHGxwwGCBLMzRLEx8iGzMMO0cYNeCMKzBDW19lnF9DXDIY/48Xg093f0Q3s1dcR8OLe8+Y91OTv5wrj7o7B+7VNQqABIoRVCMBggsOHE36kSoCBIcSH3EbFangxogJYFi8CkJhqQciLJEf/LDDJEeJIBT0GsOwYUYJGBS0fjpQAMidGmyVP6sx4Y6VQhzs9VUwkwqaCCh0tmKoFtSMDmBOf9phg4SrVrROuasRQAaxXpVUhdsU6IsECZlvX3kwLUWzRt0BHOLTbNlbZG3vZinArge5Dvn7wbqtQkSYAAgtKmnSsYKVKo2AfW048uaPmG386i4Q8EQMBAIAnfB7xBxBqvapJ9zX9WgRS2YMpnvYMGdPK3aMjt/3dUcNI4blpj7iwkMFWDXDvSmgAlijrt9RTR78+PS6z1uAJZIe93Q8g5zcsWCi/4Y+C8bah5zUv3vv89uft30QP23punGCx5954oBBwnwYaNCDY/wYrsYeggnM9B2Fpf8GG2CEUVWhbWAtGouEGDy7Y4IEJVrbSiXghqGKIo7z1IVcXIkKWWR361QOLWWnIhwERpLaaCCee5iMBGJQmJGyPFTnbkfHVZGRtIGrg5HALEJAZbu39BuUEUmq1JJQIPtZilY5hGeSWsSk52G9XqsmgljdIcABytq13HyIM6RcUA+r1qZ4EBF3WHWB29tBgAzRhEGhig8KmqKFv8SeCeo+mgsF7YFXa1qWSbkDpom/mqR1PmHCqJ3fwNRVXjC7S6CZhFVCQ2lWvZiirhQq42SACt25IK2hv8TprriUV1usGgeka7LFcNmCldMLi6qZMgFLgpw16Cipb7bC1knXsBiEAACH5BAUKABsALAcABADOAAsAAAX/4FZsJPkUmUGsLCEUTywXglFuSg7fW1xAvNWLF6sFFcPb42C8EZCj24EJdCp2yoegWsolS0Uu6fmamg8n8YYcLU2bXSiRaXMGvqV6/KAeJAh8VgZqCX+BexCFioWAYgqNi4qAR4ORhRuHY408jAeUhAmYYiuVlpiflqGZa5CWkzc5fKmbbhIpsAoQDRG8vQwQCBLCwxK6vb5qwhfGxxENahvCEA7NzskSy7vNzzzK09W/PNHF1NvX2dXcN8K55cfh69Luveol3vO8zwi4Yhj+AQwmCBw4IYclDAAJDlQggVOChAoLKkgFkSCAHDwWLKhIEOONARsDKryogFPIiAUb/95gJNIiw4wnI778GFPhzBKFOAq8qLJEhQpiNArjMcHCmlTCUDIouTKBhApELSxFWiGiVKY4E2CAekPgUphDu0742nRrVLJZnyrFSqKQ2ohoSYAMW6IoDpNJ4bLdILTnAj8KUF7UeENjAKuDyxIgOuGiOI0EBBMgLNew5AUrDTMGsFixwBIaNCQuAXJB57qNJ2OWm2Aj4skwCQCIyNkhhtMkdsIuodE0AN4LJDRgfLPtn5YDLdBlraAByuUbBgxQwICxMOnYpVOPej074OFdlfc0TqC62OIbcppHjV4o+LrieWhfT8JC/I/T6W8oCl29vQ0XjLdBaA3s1RcPBO7lFvpX8BVoG4O5jTXRQRDuJ6FDTzEWF1/BCZhgbyAKE9qICYLloQYOFtahVRsWYlZ4KQJHlwHS/IYaZ6sZd9tmu5HQm2xi1UaTbzxYwJk/wBF5g5EEYOBZeEfGZmNdFyFZmZIR4jikbLThlh5kUUVJGmRT7sekkziRWUIACABk3T4qCsedgO4xhgGcY7q5pHJ4klBBTQRJ0CeHcoYHHUh6wgfdn9uJdSdMiebGJ0zUPTcoS286FCkrZxnYoYYKWLkBowhQoBeaOlZAgVhLidrXqg2GiqpQpZ4apwSwRtjqrB3muoF9BboaXKmshlqWqsWiGt2wphJkQbAU5hoCACH5BAUKABsALAcABADOAAsAAAX/oGFw2WZuT5oZROsSQnGaKjRvilI893MItlNOJ5v5gDcFrHhKIWcEYu/xFEqNv6B1N62aclysF7fsZYe5aOx2yL5aAUGSaT1oTYMBwQ5VGCAJgYIJCnx1gIOBhXdwiIl7d0p2iYGQUAQBjoOFSQR/lIQHnZ+Ue6OagqYzSqSJi5eTpTxGcjcSChANEbu8DBAIEsHBChe5vL13G7fFuscRDcnKuM3H0La3EA7Oz8kKEsXazr7Cw9/Gztar5uHHvte47MjktznZ2w0G1+D3BgirAqJmJMAQgMGEgwgn5Ei0gKDBhBMALGRYEOJBb5QcWlQo4cbAihZz3GgIMqFEBSM1/4ZEOWPAgpIIJXYU+PIhRG8ja1qU6VHlzZknJNQ6UanCjQkWCIGSUGEjAwVLjc44+DTqUQtPPS5gejUrTa5TJ3g9sWCr1BNUWZI161StiQUDmLYdGfesibQ3XMq1OPYthrwuA2yU2LBs2cBHIypYQPPlYAKFD5cVvNPtW8eVGbdcQADATsiNO4cFAPkvHpedPzc8kUcPgNGgZ5RNDZG05reoE9s2vSEP79MEGiQGy1qP8LA4ZcdtsJE48ONoLTBtTV0B9LsTnPceoIDBDQvS7W7vfjVY3q3eZ4A339J4eaAmKqU/sV58HvJh2RcnIBsDUw0ABqhBA5aV5V9XUFGiHfVeAiWwoFgJJrIXRH1tEMiDFV4oHoAEGlaWhgIGSGBO2nFomYY3mKjVglidaNYJGJDkWW2xxTfbjCbVaOGNqoX2GloR8ZeTaECS9pthRGJH2g0b3Agbk6hNANtteHD2GJUucfajCQBy5OOTQ25ZgUPvaVVQmbKh9510/qQpwXx3SQdfk8tZJOd5b6JJFplT3ZnmmX3qd5l1eg5q00HrtUkUn0AKaiGjClSAgKLYZcgWXwocGRcCFGCKwSB6ceqphwmYRUFYT/1WKlOdUpipmxW0mlCqHjYkAaeoZlqrqZ4qd+upQKaapn/AmgAegZ8KUtYtFAQQAgAh+QQFCgAbACwHAAQAzgALAAAF/+C2PUcmiCiZGUTrEkKBis8jQEquKwU5HyXIbEPgyX7BYa5wTNmEMwWsSXsqFbEh8DYs9mrgGjdK6GkPY5GOeU6ryz7UFopSQEzygOGhJBjoIgMDBAcBM0V/CYqLCQqFOwobiYyKjn2TlI6GKC2YjJZknouaZAcQlJUHl6eooJwKooobqoewrJSEmyKdt59NhRKFMxLEEA4RyMkMEAjDEhfGycqAG8TQx9IRDRDE3d3R2ctD1RLg0ttKEnbY5wZD3+zJ6M7X2RHi9Oby7u/r9g38UFjTh2xZJBEBMDAboogAgwkQI07IMUORwocSJwCgWDFBAIwZOaJIsOBjRogKJP8wTODw5ESVHVtm3AhzpEeQElOuNDlTZ0ycEUWKWFASqEahGwYUPbnxoAgEdlYSqDBkgoUNClAlIHbSAoOsqCRQnQHxq1axVb06FWFxLIqyaze0Tft1JVqyE+pWXMD1pF6bYl3+HTqAWNW8cRUFzmih0ZAAB2oGKukSAAGGRHWJgLiR6AylBLpuHKKUMlMCngMpDSAa9QIUggZVVvDaJobLeC3XZpvgNgCmtPcuwP3WgmXSq4do0DC6o2/guzcseECtUoO0hmcsGKDgOt7ssBd07wqesAIGZC1YIBa7PQHvb1+SFo+++HrJSQfB33xfav3i5eX3Hnb4CTJgegEq8tH/YQEOcIJzbm2G2EoYRLgBXFpVmFYDcREV4HIcnmUhiGBRouEMJGJGzHIspqgdXxK0yCKHRNXoIX4uorCdTyjkyNtdPWrA4Up82EbAbzMRxxZRR54WXVLDIRmRcag5d2R6ugl3ZXzNhTecchpMhIGVAKAYpgJjjsSklBEd99maZoo535ZvdamjBEpusJyctg3h4X8XqodBMx0tiNeg/oGJaKGABpogS40KSqiaEgBqlQWLUtqoVQnytekEjzo0hHqhRorppOZt2p923M2AAV+oBtpAnnPNoB6HaU6mAAIU+IXmi3j2mtFXuUoHKwXpzVrsjcgGOauKEjQrwq157hitGq2NoWmjh7z6Wmxb0m5w66+2VRAuXN/yFUAIACH5BAUKABsALAcABADOAAsAAAX/4CZuRiaM45MZqBgIRbs9AqTcuFLE7VHLOh7KB5ERdjJaEaU4ClO/lgKWjKKcMiJQ8KgumcieVdQMD8cbBeuAkkC6LYLhOxoQ2PF5Ys9PKPBMen17f0CCg4VSh32JV4t8jSNqEIOEgJKPlkYBlJWRInKdiJdkmQlvKAsLBxdABA4RsbIMBggtEhcQsLKxDBC2TAS6vLENdJLDxMZAubu8vjIbzcQRtMzJz79S08oQEt/guNiyy7fcvMbh4OezdAvGrakLAQwyABsELQkY9BP+//ckyPDD4J9BfAMh1GsBoImMeQUN+lMgUJ9CiRMa5msxoB9Gh/o8GmxYMZXIgxtR/yQ46S/gQAURR0pDwYDfywoyLPip5AdnCwsMFPBU4BPFhKBDi444quCmDKZOfwZ9KEGpCKgcN1jdALSpPqIYsabS+nSqvqplvYqQYAeDPgwKwjaMtiDl0oaqUAyo+3TuWwUAMPpVCfee0cEjVBGQq2ABx7oTWmQk4FglZMGN9fGVDMCuiH2AOVOu/PmyxM630gwM0CCn6q8LjVJ8GXvpa5Uwn95OTC/nNxkda1/dLSK475IjCD6dHbK1ZOa4hXP9DXs5chJ00UpVm5xo2qRpoxptwF2E4/IbJpB/SDz9+q9b1aNfQH08+p4a8uvX8B53fLP+ycAfemjsRUBgp1H20K+BghHgVgt1GXZXZpZ5lt4ECjxYR4ScUWiShEtZqBiIInRGWnERNnjiBglw+JyGnxUmGowsyiiZg189lNtPGACjV2+S9UjbU0JWF6SPvEk3QZEqsZYTk3UAaRSUnznJI5LmESCdBVSyaOWUWLK4I5gDUYVeV1T9l+FZClCAUVA09uSmRHBCKAECFEhW51ht6rnmWBXkaR+NjuHpJ40D3DmnQXt2F+ihZxlqVKOfQRACACH5BAUKABwALAcABADOAAsAAAX/ICdyUCkUo/g8mUG8MCGkKgspeC6j6XEIEBpBUeCNfECaglBcOVfJFK7YQwZHQ6JRZBUqTrSuVEuD3nI45pYjFuWKvjjSkCoRaBUMWxkwBGgJCXspQ36Bh4EEB0oKhoiBgyNLjo8Ki4QElIiWfJqHnISNEI+Ql5J9o6SgkqKkgqYihamPkW6oNBgSfiMMDQkGCBLCwxIQDhHIyQwQCGMKxsnKVyPCF9DREQ3MxMPX0cu4wt7J2uHWx9jlKd3o39MiuefYEcvNkuLt5O8c1ePI2tyELXGQwoGDAQf+iEC2xByDCRAjTlAgIUWCBRgCPJQ4AQBFXAs0coT40WLIjRxL/47AcHLkxIomRXL0CHPERZkpa4q4iVKiyp0tR/7kwHMkTUBBJR5dOCEBAVcKKtCAyOHpowXCpk7goABqBZdcvWploACpBKkpIJI1q5OD2rIWE0R1uTZu1LFwbWL9OlKuWb4c6+o9i3dEgw0RCGDUG9KlRw56gDY2qmCByZBaASi+TACA0TucAaTteCcy0ZuOK3N2vJlx58+LRQyY3Xm0ZsgjZg+oPQLi7dUcNXi0LOJw1pgNtB7XG6CBy+U75SYfPTSQAgZTNUDnQHt67wnbZyvwLgKiMN3oCZB3C76tdewpLFgIP2C88rbi4Y+QT3+8S5USMICZXWj1pkEDeUU3lOYGB3alSoEiMIjgX4WlgNF2EibIwQIXauWXSRg2SAOHIU5IIIMoZkhhWiJaiFVbKo6AQEgQXrTAazO1JhkBrBG3Y2Y6EsUhaGn95hprSN0oWpFE7rhkeaQBchGOEWnwEmc0uKWZj0LeuNV3W4Y2lZHFlQCSRjTIl8uZ+kG5HU/3sRlnTG2ytyadytnD3HrmuRcSn+0h1dycexIK1KCjYaCnjCCVqOFFJTZ5GkUUjESWaUIKU2lgCmAKKQIUjHapXRKE+t2og1VgankNYnohqKJ2CmKplso6GKz7WYCgqxeuyoF8u9IQAgA7",
-msg:null,msgText:"<em>Loading the next set of posts...</em>",selector:null,speed:"fast",start:g},state:{isDuringAjax:!1,isInvalidPage:!1,isDestroyed:!1,isDone:!1,isPaused:!1,currPage:1},debug:!1,behavior:g,binder:e(d),nextSelector:"div.navigation a:first",navSelector:"div.navigation",contentSelector:null,extraScrollPx:150,itemSelector:"div.post",animate:!1,pathParse:g,dataType:"html",appendCallback:!0,bufferPx:40,errorCallback:function(){},infid:0,pixelsFromNavToBottom:g,path:g,prefill:!1,maxPage:g};
-e.infinitescroll.prototype={_binding:function(a){var b=this,c=b.options;c.v="2.0b2.120520";if(c.behavior&&this["_binding_"+c.behavior]!==g)this["_binding_"+c.behavior].call(this);else{if("bind"!==a&&"unbind"!==a)return this._debug("Binding value  "+a+" not valid"),!1;if("unbind"===a)this.options.binder.unbind("smartscroll.infscr."+b.options.infid);else this.options.binder[a]("smartscroll.infscr."+b.options.infid,function(){b.scroll()});this._debug("Binding",a)}},_create:function(a,b){var c=e.extend(!0,
-{},e.infinitescroll.defaults,a);this.options=c;var f=e(d);if(!this._validate(a))return!1;var h=e(c.nextSelector).attr("href");if(!h)return this._debug("Navigation selector not found"),!1;c.path=c.path||this._determinepath(h);c.contentSelector=c.contentSelector||this.element;c.loading.selector=c.loading.selector||c.contentSelector;c.loading.msg=c.loading.msg||e('<div id="infscr-loading"><img alt="Loading..." src="'+c.loading.img+'" /><div>'+c.loading.msgText+"</div></div>");(new Image).src=c.loading.img;
-c.pixelsFromNavToBottom===g&&(c.pixelsFromNavToBottom=e(document).height()-e(c.navSelector).offset().top);var l=this;c.loading.start=c.loading.start||function(){e(c.navSelector).hide();c.loading.msg.appendTo(c.loading.selector).show(c.loading.speed,e.proxy(function(){this.beginAjax(c)},l))};c.loading.finished=c.loading.finished||function(){c.loading.msg.fadeOut(c.loading.speed)};c.callback=function(k,m,n){c.behavior&&k["_callback_"+c.behavior]!==g&&k["_callback_"+c.behavior].call(e(c.contentSelector)[0],
-m,n);b&&b.call(e(c.contentSelector)[0],m,c,n);c.prefill&&f.bind("resize.infinite-scroll",k._prefill)};a.debug&&(!Function.prototype.bind||"object"!==typeof console&&"function"!==typeof console||"object"!==typeof console.log||"log info warn error assert dir clear profile profileEnd".split(" ").forEach(function(k){console[k]=this.call(console[k],console)},Function.prototype.bind));this._setup();c.prefill&&this._prefill();return!0},_prefill:function(){var a=this,b=e(document),c=e(d);this._prefill=function(){b.height()<=
-c.height()&&a.scroll();c.bind("resize.infinite-scroll",function(){b.height()<=c.height()&&(c.unbind("resize.infinite-scroll"),a.scroll())})};this._prefill()},_debug:function(){!0===this.options.debug&&("undefined"!==typeof console&&"function"===typeof console.log?1===Array.prototype.slice.call(arguments).length&&"string"===typeof Array.prototype.slice.call(arguments)[0]?console.log(Array.prototype.slice.call(arguments).toString()):console.log(Array.prototype.slice.call(arguments)):Function.prototype.bind||
-"undefined"===typeof console||"object"!==typeof console.log||Function.prototype.call.call(console.log,console,Array.prototype.slice.call(arguments)))},_determinepath:function(a){var b=this.options;if(b.behavior&&this["_determinepath_"+b.behavior]!==g)return this["_determinepath_"+b.behavior].call(this,a);if(b.pathParse)return this._debug("pathParse manual"),b.pathParse(a,this.options.state.currPage+1);if(a.match(/^(.*?)\b2\b(.*?$)/))a=a.match(/^(.*?)\b2\b(.*?$)/).slice(1);else if(a.match(/^(.*?)2(.*?$)/)){if(a.match(/^(.*?page=)2(\/.*|$)/))return a=
-a.match(/^(.*?page=)2(\/.*|$)/).slice(1);a=a.match(/^(.*?)2(.*?$)/).slice(1)}else{if(a.match(/^(.*?page=)1(\/.*|$)/))return a=a.match(/^(.*?page=)1(\/.*|$)/).slice(1);this._debug("Sorry, we couldn't parse your Next (Previous Posts) URL. Verify your the css selector points to the correct A tag. If you still get this error: yell, scream, and kindly ask for help at infinite-scroll.com.");b.state.isInvalidPage=!0}this._debug("determinePath",a);return a},_error:function(a){var b=this.options;b.behavior&&
-this["_error_"+b.behavior]!==g?this["_error_"+b.behavior].call(this,a):("destroy"!==a&&"end"!==a&&(a="unknown"),this._debug("Error",a),"end"===a&&this._showdonemsg(),b.state.isDone=!0,b.state.currPage=1,b.state.isPaused=!1,this._binding("unbind"))},_loadcallback:function(a,b,c){var f=this.options,h=this.options.callback,l=f.state.isDone?"done":f.appendCallback?"append":"no-append";if(f.behavior&&this["_loadcallback_"+f.behavior]!==g)this["_loadcallback_"+f.behavior].call(this,a,b);else{switch(l){case "done":return this._showdonemsg(),
-!1;case "no-append":"html"===f.dataType&&(b=e("<div>"+b+"</div>").find(f.itemSelector));break;case "append":l=a.children();if(0===l.length)return this._error("end");for(b=document.createDocumentFragment();a[0].firstChild;)b.appendChild(a[0].firstChild);this._debug("contentSelector",e(f.contentSelector)[0]);e(f.contentSelector)[0].appendChild(b);b=l.get()}f.loading.finished.call(e(f.contentSelector)[0],f);f.animate&&(a=e(d).scrollTop()+e("#infscr-loading").height()+f.extraScrollPx+"px",e("html,body").animate({scrollTop:a},
-800,function(){f.state.isDuringAjax=!1}));f.animate||(f.state.isDuringAjax=!1);h(this,b,c);f.prefill&&this._prefill()}},_nearbottom:function(){var a=this.options,b=0+e(document).height()-a.binder.scrollTop()-e(d).height();if(a.behavior&&this["_nearbottom_"+a.behavior]!==g)return this["_nearbottom_"+a.behavior].call(this);this._debug("math:",b,a.pixelsFromNavToBottom);return b-a.bufferPx<a.pixelsFromNavToBottom},_pausing:function(a){var b=this.options;if(b.behavior&&this["_pausing_"+b.behavior]!==
-g)this["_pausing_"+b.behavior].call(this,a);else{"pause"!==a&&"resume"!==a&&null!==a&&this._debug("Invalid argument. Toggling pause value instead");switch(!a||"pause"!==a&&"resume"!==a?"toggle":a){case "pause":b.state.isPaused=!0;break;case "resume":b.state.isPaused=!1;break;case "toggle":b.state.isPaused=!b.state.isPaused}this._debug("Paused",b.state.isPaused);return!1}},_setup:function(){var a=this.options;if(a.behavior&&this["_setup_"+a.behavior]!==g)this["_setup_"+a.behavior].call(this);else return this._binding("bind"),
-!1},_showdonemsg:function(){var a=this.options;a.behavior&&this["_showdonemsg_"+a.behavior]!==g?this["_showdonemsg_"+a.behavior].call(this):(a.loading.msg.find("img").hide().parent().find("div").html(a.loading.finishedMsg).animate({opacity:1},2E3,function(){e(this).parent().fadeOut(a.loading.speed)}),a.errorCallback.call(e(a.contentSelector)[0],"done"))},_validate:function(a){for(var b in a)if(b.indexOf&&-1<b.indexOf("Selector")&&0===e(a[b]).length)return this._debug("Your "+b+" found no elements."),
-!1;return!0},bind:function(){this._binding("bind")},destroy:function(){this.options.state.isDestroyed=!0;this.options.loading.finished();return this._error("destroy")},pause:function(){this._pausing("pause")},resume:function(){this._pausing("resume")},beginAjax:function(a){var b=this,c=a.path,f;a.state.currPage++;if(a.maxPage!=g&&a.state.currPage>a.maxPage)this.destroy();else{var h=e(a.contentSelector).is("table")?e("<tbody/>"):e("<div/>");var l="function"===typeof c?c(a.state.currPage):c.join(a.state.currPage);
-b._debug("heading into ajax",l);c="html"===a.dataType||"json"===a.dataType?a.dataType:"html+callback";a.appendCallback&&"html"===a.dataType&&(c+="+callback");switch(c){case "html+callback":b._debug("Using HTML via .load() method");h.load(l+" "+a.itemSelector,g,function(k){b._loadcallback(h,k,l)});break;case "html":b._debug("Using "+c.toUpperCase()+" via $.ajax() method");e.ajax({url:l,dataType:a.dataType,complete:function(k,m){(f="undefined"!==typeof k.isResolved?k.isResolved():"success"===m||"notmodified"===
-m)?b._loadcallback(h,k.responseText,l):b._error("end")}});break;case "json":b._debug("Using "+c.toUpperCase()+" via $.ajax() method"),e.ajax({dataType:"json",type:"GET",url:l,success:function(k,m,n){f="undefined"!==typeof n.isResolved?n.isResolved():"success"===m||"notmodified"===m;a.appendCallback?a.template!==g?(k=a.template(k),h.append(k),f?b._loadcallback(h,k):b._error("end")):(b._debug("template must be defined."),b._error("end")):f?b._loadcallback(h,k,l):b._error("end")},error:function(){b._debug("JSON ajax request failed.");
-b._error("end")}})}}},retrieve:function(a){a=a||null;var b=this.options;if(b.behavior&&this["retrieve_"+b.behavior]!==g)this["retrieve_"+b.behavior].call(this,a);else{if(b.state.isDestroyed)return this._debug("Instance is destroyed"),!1;b.state.isDuringAjax=!0;b.loading.start.call(e(b.contentSelector)[0],b)}},scroll:function(){var a=this.options,b=a.state;a.behavior&&this["scroll_"+a.behavior]!==g?this["scroll_"+a.behavior].call(this):b.isDuringAjax||b.isInvalidPage||b.isDone||b.isDestroyed||b.isPaused||
-this._nearbottom()&&this.retrieve()},toggle:function(){this._pausing()},unbind:function(){this._binding("unbind")},update:function(a){e.isPlainObject(a)&&(this.options=e.extend(!0,this.options,a))}};e.fn.infinitescroll=function(a,b){switch(typeof a){case "string":var c=Array.prototype.slice.call(arguments,1);this.each(function(){var f=e.data(this,"infinitescroll");if(!f||!e.isFunction(f[a])||"_"===a.charAt(0))return!1;f[a].apply(f,c)});break;case "object":this.each(function(){var f=e.data(this,"infinitescroll");
-f?f.update(a):(f=new e.infinitescroll(a,b,this),f.failed||e.data(this,"infinitescroll",f))})}return this};var v=e.event,z;v.special.smartscroll={setup:function(){e(this).bind("scroll",v.special.smartscroll.handler)},teardown:function(){e(this).unbind("scroll",v.special.smartscroll.handler)},handler:function(a,b){var c=this,f=arguments;a.type="smartscroll";z&&clearTimeout(z);z=setTimeout(function(){e(c).trigger("smartscroll",f)},"execAsap"===b?0:100)}};e.fn.smartscroll=function(a){return a?this.bind("smartscroll",
-a):this.trigger("smartscroll",["execAsap"])}})(window,jQuery);
-(function(d){d.belowthefold=function(e,g){return d(window).height()+d(window).scrollTop()<=d(e).offset().top-g.threshold};d.abovethetop=function(e,g){return d(window).scrollTop()>=d(e).offset().top+d(e).height()-g.threshold};d.rightofscreen=function(e,g){return d(window).width()+d(window).scrollLeft()<=d(e).offset().left-g.threshold};d.leftofscreen=function(e,g){return d(window).scrollLeft()>=d(e).offset().left+d(e).width()-g.threshold};d.inviewport=function(e,g){return!d.rightofscreen(e,g)&&!d.leftofscreen(e,
-g)&&!d.belowthefold(e,g)&&!d.abovethetop(e,g)};d.extend(d.expr[":"],{"below-the-fold":function(e,g,v){return d.belowthefold(e,{threshold:0})},"above-the-top":function(e,g,v){return d.abovethetop(e,{threshold:0})},"left-of-screen":function(e,g,v){return d.leftofscreen(e,{threshold:0})},"right-of-screen":function(e,g,v){return d.rightofscreen(e,{threshold:0})},"in-viewport":function(e,g,v){return d.inviewport(e,{threshold:0})}})})(jQuery);
-(function(d,e){var g=d.ajaxS3;d.searchS3!==e&&(g=d.searchS3);var v=function(a){var b="html+callback";if("html"===a.dataType||"json"===a.dataType)b=a.dataType,a.appendCallback&&"html"===a.dataType&&(b+="+callback");if("html"==b)if(a.state.currPage++,a.maxPage!=e&&a.state.currPage>a.maxPage)this.destroy();else{b=a.path;var c="function"===typeof b?b(a.state.currPage):b.join(a.state.currPage);var f=this;g({url:c,type:"GET",dataType:a.dataType,complete:function(h,l){var k=d(a.contentSelector).is("table")?
-d("<tbody>"):d("<div>");("undefined"!==typeof h.isResolved?h.isResolved():"success"===l||"notmodified"===l)?f._loadcallback(k,h.responseText,c):f._error("end")}})}else this.prototype.beginAjax.call(this,a)};d.infinitescroll.prototype._callback_append=function(a){var b=document.createDocumentFragment();a.each(function(){b.appendChild(this)});d(this).get()[0].appendChild(b)};var z=0;d.widget("s3.datalist",{options:{},_create:function(){this.id=z;z+=1},_init:function(){this.hasInfiniteScroll=!1;this.refresh()},
-_destroy:function(){d.Widget.prototype.destroy.call(this)},refresh:function(){this._infiniteScroll();this._bindItemEvents();d(this.element).trigger("listUpdate")},_infiniteScroll:function(){var a=d(this.element),b=a.find("input.dl-pagination");if(b.length){var c=JSON.parse(d(b[0]).val()),f=c.startindex,h=c.maxitems,l=c.totalitems,k=c.pagesize,m=c.ajaxurl;if(b.hasClass("dl-scroll"))if(null===k)b.closest(".dl-navigation").css({display:"none"});else{h=Math.min(h,l-f);var n=f+h,q=a.find(".dl-item").length;
-c=1;h-=q;if(0<h){if(c+=Math.ceil(h/k),b.length){var t=this;a.infinitescroll({debug:!1,appendCallback:!1,behavior:"append",loading:{finishedMsg:"no more items to load",msgText:"loading...",img:S3.Ap.concat("/static/img/indicator.gif")},navSelector:"div.dl-navigation",nextSelector:"div.dl-navigation a:first",itemSelector:"div.dl-row",path:function(r){r=q+(r-2)*k;return t._urlAppend(m,"start="+r+"&limit="+Math.min(k,n-r))},dataType:"html",maxPage:c},function(){a.find(".dl-row:last:in-viewport").each(function(){var r=
-d(this);r.hasClass("autoretrieve")||(r.addClass("autoretrieve"),t._autoRetrieve())});t._bindItemEvents()});a.data("infinitescroll").beginAjax=v;this.hasInfiniteScroll=!0;a.find(".dl-row:last:in-viewport").each(function(){d(this).addClass("autoretrieve");t._autoRetrieve()})}}else b.length&&b.closest(".dl-navigation").css({display:"none"})}else k>l&&b.closest(".dl-navigation").css({display:"none"})}},ajaxReloadItem:function(a){var b=d(this.element),c=b.attr("id"),f=b.find("input.dl-pagination");if(f.length){var h=
-JSON.parse(d(f[0]).val());f=h.ajaxurl;if(null!==f){var l="#"+c+"-"+a,k=d(l);if(k.length){var m=this;g({url:m._urlAppend(f,"record="+a),type:"GET",dataType:"html",success:function(n){n=d(n.slice(n.indexOf("<"))).find(l);n.length?k.replaceWith(n):m._removeItem(k,h);m._bindItemEvents();b.trigger("listUpdate")},error:function(n,q,t){console.log("UNAUTHORIZED"==t?i18n.gis_requires_login:n.responseText)}})}}}},ajaxReload:function(a){var b=d(this.element),c=b.find("input.dl-pagination");if(c.length){var f=
-d(c[0]),h=JSON.parse(f.val()),l=h.startindex,k=h.pagesize,m=h.ajaxurl;if(null!==k){if("undefined"==typeof a){var n=b.attr("id"),q=d("form.filter-form input.filter-submit-target"),t=q.length;if(n&&t)for(var r=0;r<t;r++){var A=d(q[r]);var E=A.val().split(" ");if(-1!=d.inArray(n,E)){a=S3.search.getCurrentFilters(A.closest("form.filter-form"));break}}}if(a)try{m=S3.search.filterURL(m,a),h.ajaxurl=m,f.val(JSON.stringify(h))}catch(p){}var y=this;g({url:y._urlAppend(m,"start="+l+"&limit="+k),type:"GET",
-dataType:"html",success:function(p){b.infinitescroll("destroy");b.data("infinitescroll",null);var w=d(p.slice(p.indexOf("<"))).find(".dl");if(w.length){p=d(w).find("input.dl-pagination");p.length&&(p=JSON.parse(d(p[0]).val()),h.totalitems=p.totalitems,h.maxitems=p.maxitems,f.val(JSON.stringify(h)));p=b.find("div.dl-navigation a.dl-more");var u=p.length;if(u){var x=d(p[0]).attr("href");var B=d(p[0]).attr("title")}b.empty().html(w.html());b.find("input.dl-pagination").replaceWith(c);u&&(a&&(x=S3.search.filterURL(x,
-a)),d(b.find(".dl-navigation a")[0]).addClass("s3_modal").attr("href",x).attr("title",B))}else x=b.find(".dl-navigation").css({display:"none"}),w=d(p.slice(p.indexOf("<"))).find(".empty"),b.empty().append(w),b.append(x);y._infiniteScroll();b.find(".dl-item:last:in-viewport").each(function(){d(this).addClass("autoretrieve");y._autoRetrieve()});y._bindItemEvents();b.trigger("listUpdate")},error:function(p,w,u){console.log("UNAUTHORIZED"==u?i18n.gis_requires_login:p.responseText)}})}}},_ajaxDeleteItem:function(a){var b=
-d(this.element),c=d(a).closest(".dl-item");if(c.length&&(a=b.find("input.dl-pagination").first(),a.length)){var f=JSON.parse(d(a).val());a=this._stripFilters(f.ajaxurl);if(null!==a){var h=c.attr("id").split("-").pop(),l=this;g({url:this._urlAppend(a,"delete="+h),type:"POST",dataType:"json",success:function(){l._removeItem(c,f)},error:function(k,m,n){console.log("UNAUTHORIZED"==n?i18n.gis_requires_login:k.responseText)}});b.find(".dl-item:last:in-viewport").each(function(){d(this).addClass("autoretrieve");
-l._autoRetrieve(this)})}}},_removeItem:function(a,b){var c=d(this.element),f=c.find("input.dl-pagination").first(),h=b.rowsize,l=b.ajaxurl,k=a.index(),m=a.closest(".dl-row"),n=a.attr("id").split("-"),q;a.remove();a=d(m);if(k<h-1)for(q=k+1;q<h;q++){var t="dl-col-"+(q-1);var r="dl-col-"+q;a.find("."+r).removeClass(r).addClass(t)}var A=m;a.nextAll(".dl-row").each(function(){d(this).find(".dl-col-0").first().appendTo(A).removeClass("dl-col-0").addClass("dl-col-"+(h-1));if(1<h)for(q=1;q<h;q++)t="dl-col-"+
-(q-1),r="dl-col-"+q,d(this).find("."+r).removeClass(r).addClass(t);A=this});var E=a.closest(".dl").find(".dl-row").last();k=a.closest(".dl").find(".dl-item").length;var y=this;g({url:y._urlAppend(l,"start="+k+"&limit=1"),type:"GET",dataType:"html",success:function(u){d(u.slice(u.indexOf("<"))).find(".dl-item").first().removeClass("dl-col-0").addClass("dl-col-"+(h-1)).appendTo(E);y._bindItemEvents()},error:function(u,x,B){console.log("UNAUTHORIZED"==B?i18n.gis_requires_login:u.responseText)}});b.totalitems--;
-b.maxitems>b.totalitems&&(b.maxitems=b.totalitems);d(f).val(JSON.stringify(b));0===b.totalitems&&c.find(".dl-empty").css({display:"block"});if("undefined"!=typeof map){var p=map.layers,w=n.join("_");Ext.iterate(p,function(u,x,B){if(u.s3_layer_id==w){var C=p[x],F=!1,H=data.uuid;Ext.iterate(C.feaures,function(D,G,I){D.properties.id==H&&(C.removeFeatures([D]),F=!0)});F||Ext.iterate(C.strategies,function(D,G,I){"OpenLayers.Strategy.Refresh"==D.CLASS_NAME&&C.strategies[G].refresh()})}})}c.trigger("listUpdate")},
-_autoRetrieve:function(){this.hasInfiniteScroll&&d(this.element).infinitescroll("retrieve")},_urlAppend:function(a,b){a=a.split("?");var c="",f=a[0];if(1<a.length)return b&&(c="&"+b),f+"?"+a[1]+c;b&&(c="?"+b);return f+c},_stripFilters:function(a){if(!a)return null;var b=a.split("?");if(2<=b.length){a=b[1].split(/[&;]/g);for(var c=a.length;0<c--;)-1!=a[c].split("=")[0].lastIndexOf(".",1)&&a.splice(c,1);a=b[0]+(0<a.length?"?"+a.join("&"):"")}return a},getTotalItems:function(){var a=d(this.element),
-b=a.find("input.dl-pagination");return b.length?JSON.parse(d(b[0]).val()).totalitems:a.find(".dl-item").length},_bindItemEvents:function(){var a=this;d(this.element).find(".dl-item-delete").css({cursor:"pointer"}).off("click.dl").on("click.dl",function(b){if(confirm(i18n.delete_confirmation))return a._ajaxDeleteItem(this),!0;b.preventDefault();return!1});S3.redraw()},_bindEvents:function(){return!0},_unbindEvents:function(){return!0}});d(function(){d(".dl").each(function(){d(this).datalist()})})})(jQuery);
+(function(window,$,undefined){"use strict";$.infinitescroll=function infscr(options,callback,element){this.element=$(element);if(!this._create(options,callback)){this.failed=true;}};$.infinitescroll.defaults={loading:{finished:undefined,finishedMsg:"<em>Congratulations, you've reached the end of the internet.</em>",img:"data:image/gif;base64,R0lGODlh3AATAPQeAPDy+MnQ6LW/4N3h8MzT6rjC4sTM5r/I5NHX7N7j8c7U6tvg8OLl8uXo9Ojr9b3G5MfP6Ovu9tPZ7PT1+vX2+tbb7vf4+8/W69jd7rC73vn5/O/x+K243ai02////wAAACH/C05FVFNDQVBFMi4wAwEAAAAh+QQECgD/ACwAAAAA3AATAAAF/6AnjmRpnmiqrmzrvnAsz3Rt33iu73zv/8CgcEj0BAScpHLJbDqf0Kh0Sq1ar9isdioItAKGw+MAKYMFhbF63CW438f0mg1R2O8EuXj/aOPtaHx7fn96goR4hmuId4qDdX95c4+RBIGCB4yAjpmQhZN0YGYGXitdZBIVGAsLoq4BBKQDswm1CQRkcG6ytrYKubq8vbfAcMK9v7q7EMO1ycrHvsW6zcTKsczNz8HZw9vG3cjTsMIYqQkCLBwHCgsMDQ4RDAYIqfYSFxDxEfz88/X38Onr16+Bp4ADCco7eC8hQYMAEe57yNCew4IVBU7EGNDiRn8Z831cGLHhSIgdFf9chIeBg7oA7gjaWUWTVQAGE3LqBDCTlc9WOHfm7PkTqNCh54rePDqB6M+lR536hCpUqs2gVZM+xbrTqtGoWqdy1emValeXKzggYBBB5y1acFNZmEvXAoN2cGfJrTv3bl69Ffj2xZt3L1+/fw3XRVw4sGDGcR0fJhxZsF3KtBTThZxZ8mLMgC3fRatCbYMNFCzwLEqLgE4NsDWs/tvqdezZf13Hvk2A9Szdu2X3pg18N+68xXn7rh1c+PLksI/Dhe6cuO3ow3NfV92bdArTqC2Ebd3A8vjf5QWfH6Bg7Nz17c2fj69+fnq+8N2Lty+fuP78/eV2X13neIcCeBRwxorbZrA1ANoCDGrgoG8RTshahQ9iSKEEzUmYIYfNWViUhheCGJyIP5E4oom7WWjgCeBFAJNv1DVV01MAdJhhjdkplWNzO/5oXI846njjVEIqR2OS2B1pE5PVscajkxhMycqLJghQSwT40PgfAl4GqNSXYdZXJn5gSkmmmmJu1aZYb14V51do+pTOCmA40AqVCIhG5IJ9PvYnhIFOxmdqhpaI6GeHCtpooisuutmg+Eg62KOMKuqoTaXgicQWoIYq6qiklmoqFV0UoeqqrLbq6quwxirrrLTWauutJ4QAACH5BAUKABwALAcABADOAAsAAAX/IPd0D2dyRCoUp/k8gpHOKtseR9yiSmGbuBykler9XLAhkbDavXTL5k2oqFqNOxzUZPU5YYZd1XsD72rZpBjbeh52mSNnMSC8lwblKZGwi+0QfIJ8CncnCoCDgoVnBHmKfByGJimPkIwtiAeBkH6ZHJaKmCeVnKKTHIihg5KNq4uoqmEtcRUtEREMBggtEr4QDrjCuRC8h7/BwxENeicSF8DKy82pyNLMOxzWygzFmdvD2L3P0dze4+Xh1Arkyepi7dfFvvTtLQkZBC0T/FX3CRgCMOBHsJ+EHYQY7OinAGECgQsB+Lu3AOK+CewcWjwxQeJBihtNGHSoQOE+iQ3//4XkwBBhRZMcUS6YSXOAwIL8PGqEaSJCiYt9SNoCmnJPAgUVLChdaoFBURN8MAzl2PQphwQLfDFd6lTowglHve6rKpbjhK7/pG5VinZP1qkiz1rl4+tr2LRwWU64cFEihwEtZgbgR1UiHaMVvxpOSwBA37kzGz9e8G+B5MIEKLutOGEsAH2ATQwYfTmuX8aETWdGPZmiZcccNSzeTCA1Sw0bdiitC7LBWgu8jQr8HRzqgpK6gX88QbrB14z/kF+ELpwB8eVQj/JkqdylAudji/+ts3039vEEfK8Vz2dlvxZKG0CmbkKDBvllRd6fCzDvBLKBDSCeffhRJEFebFk1k/Mv9jVIoIJZSeBggwUaNeB+Qk34IE0cXlihcfRxkOAJFFhwGmKlmWDiakZhUJtnLBpnWWcnKaAZcxI0piFGGLBm1mc90kajSCveeBVWKeYEoU2wqeaQi0PetoE+rr14EpVC7oAbAUHqhYExbn2XHHsVqbcVew9tx8+XJKk5AZsqqdlddGpqAKdbAYBn1pcczmSTdWvdmZ17c1b3FZ99vnTdCRFM8OEcAhLwm1NdXnWcBBSMRWmfkWZqVlsmLIiAp/o1gGV2vpS4lalGYsUOqXrddcKCmK61aZ8SjEpUpVFVoCpTj4r661Km7kBHjrDyc1RAIQAAIfkEBQoAGwAsBwAEAM4ACwAABf/gtmUCd4goQQgFKj6PYKi0yrrbc8i4ohQt12EHcal+MNSQiCP8gigdz7iCioaCIvUmZLp8QBzW0EN2vSlCuDtFKaq4RyHzQLEKZNdiQDhRDVooCwkbfm59EAmKi4SGIm+AjIsKjhsqB4mSjT2IOIOUnICeCaB/mZKFNTSRmqVpmJqklSqskq6PfYYCDwYHDC4REQwGCBLGxxIQDsHMwhAIX8bKzcENgSLGF9PU1j3Sy9zX2NrgzQziChLk1BHWxcjf7N046tvN82715czn9Pryz6Ilc4ACj4EBOCZM8KEnAYYADBRKnACAYUMFv1wotIhCEcaJCisqwJFgAUSQGyX/kCSVUUTIdKMwJlyo0oXHlhskwrTJciZHEXsgaqS4s6PJiCAr1uzYU8kBBSgnWFqpoMJMUjGtDmUwkmfVmVypakWhEKvXsS4nhLW5wNjVroJIoc05wSzTr0PtiigpYe4EC2vj4iWrFu5euWIMRBhacaVJhYQBEFjA9jHjyQ0xEABwGceGAZYjY0YBOrRLCxUp29QM+bRkx5s7ZyYgVbTqwwti2ybJ+vLtDYpycyZbYOlptxdx0kV+V7lC5iJAyyRrwYKxAdiz82ng0/jnAdMJFz0cPi104Ec1Vj9/M6F173vKL/feXv156dw11tlqeMMnv4V5Ap53GmjQQH97nFfg+IFiucfgRX5Z8KAgbUlQ4IULIlghhhdOSB6AgX0IVn8eReghen3NRIBsRgnH4l4LuEidZBjwRpt6NM5WGwoW0KSjCwX6yJSMab2GwwAPDXfaBCtWpluRTQqC5JM5oUZAjUNS+VeOLWpJEQ7VYQANW0INJSZVDFSnZphjSikfmzE5N4EEbQI1QJmnWXCmHulRp2edwDXF43txukenJwvI9xyg9Q26Z3MzGUcBYFEChZh6DVTq34AU8Iflh51Sd+CnKFYQ6mmZkhqfBKfSxZWqA9DZanWjxmhrWwi0qtCrt/43K6WqVjjpmhIqgEGvculaGKklKstAACEAACH5BAUKABwALAcABADOAAsAAAX/ICdyQmaMYyAUqPgIBiHPxNpy79kqRXH8wAPsRmDdXpAWgWdEIYm2llCHqjVHU+jjJkwqBTecwItShMXkEfNWSh8e1NGAcLgpDGlRgk7EJ/6Ae3VKfoF/fDuFhohVeDeCfXkcCQqDVQcQhn+VNDOYmpSWaoqBlUSfmowjEA+iEAEGDRGztAwGCDcXEA60tXEiCrq8vREMEBLIyRLCxMWSHMzExnbRvQ2Sy7vN0zvVtNfU2tLY3rPgLdnDvca4VQS/Cpk3ABwSLQkYAQwT/P309vcI7OvXr94jBQMJ/nskkGA/BQBRLNDncAIAiDcG6LsxAWOLiQzmeURBKWSLCQbv/1F0eDGinJUKR47YY1IEgQASKk7Yc7ACRwZm7mHweRJoz59BJUogisKCUaFMR0x4SlJBVBFTk8pZivTR0K73rN5wqlXEAq5Fy3IYgHbEzQ0nLy4QSoCjXLoom96VOJEeCosK5n4kkFfqXjl94wa+l1gvAcGICbewAOAxY8l/Ky/QhAGz4cUkGxu2HNozhwMGBnCUqUdBg9UuW9eUynqSwLHIBujePef1ZGQZXcM+OFuEBeBhi3OYgLyqcuaxbT9vLkf4SeqyWxSQpKGB2gQpm1KdWbu72rPRzR9Ne2Nu9Kzr/1Jqj0yD/fvqP4aXOt5sW/5qsXXVcv1Nsp8IBUAmgswGF3llGgeU1YVXXKTN1FlhWFXW3gIE+DVChApysACHHo7Q4A35lLichh+ROBmLKAzgYmYEYDAhCgxKGOOMn4WR4kkDaoBBOxJtdNKQxFmg5JIWIBnQc07GaORfUY4AEkdV6jHlCEISSZ5yTXpp1pbGZbkWmcuZmQCaE6iJ0FhjMaDjTMsgZaNEHFRAQVp3bqXnZED1qYcECOz5V6BhSWCoVJQIKuKQi2KFKEkEFAqoAo7uYSmO3jk61wUUMKmknJ4SGimBmAa0qVQBhAAAIfkEBQoAGwAsBwAEAM4ACwAABf/gJm5FmRlEqhJC+bywgK5pO4rHI0D3pii22+Mg6/0Ej96weCMAk7cDkXf7lZTTnrMl7eaYoy10JN0ZFdco0XAuvKI6qkgVFJXYNwjkIBcNBgR8TQoGfRsJCRuCYYQQiI+ICosiCoGOkIiKfSl8mJkHZ4U9kZMbKaI3pKGXmJKrngmug4WwkhA0lrCBWgYFCCMQFwoQDRHGxwwGCBLMzRLEx8iGzMMO0cYNeCMKzBDW19lnF9DXDIY/48Xg093f0Q3s1dcR8OLe8+Y91OTv5wrj7o7B+7VNQqABIoRVCMBggsOHE36kSoCBIcSH3EbFangxogJYFi8CkJhqQciLJEf/LDDJEeJIBT0GsOwYUYJGBS0fjpQAMidGmyVP6sx4Y6VQhzs9VUwkwqaCCh0tmKoFtSMDmBOf9phg4SrVrROuasRQAaxXpVUhdsU6IsECZlvX3kwLUWzRt0BHOLTbNlbZG3vZinArge5Dvn7wbqtQkSYAAgtKmnSsYKVKo2AfW048uaPmG386i4Q8EQMBAIAnfB7xBxBqvapJ9zX9WgRS2YMpnvYMGdPK3aMjt/3dUcNI4blpj7iwkMFWDXDvSmgAlijrt9RTR78+PS6z1uAJZIe93Q8g5zcsWCi/4Y+C8bah5zUv3vv89uft30QP23punGCx5954oBBwnwYaNCDY/wYrsYeggnM9B2Fpf8GG2CEUVWhbWAtGouEGDy7Y4IEJVrbSiXghqGKIo7z1IVcXIkKWWR361QOLWWnIhwERpLaaCCee5iMBGJQmJGyPFTnbkfHVZGRtIGrg5HALEJAZbu39BuUEUmq1JJQIPtZilY5hGeSWsSk52G9XqsmgljdIcABytq13HyIM6RcUA+r1qZ4EBF3WHWB29tBgAzRhEGhig8KmqKFv8SeCeo+mgsF7YFXa1qWSbkDpom/mqR1PmHCqJ3fwNRVXjC7S6CZhFVCQ2lWvZiirhQq42SACt25IK2hv8TprriUV1usGgeka7LFcNmCldMLi6qZMgFLgpw16Cipb7bC1knXsBiEAACH5BAUKABsALAcABADOAAsAAAX/4FZsJPkUmUGsLCEUTywXglFuSg7fW1xAvNWLF6sFFcPb42C8EZCj24EJdCp2yoegWsolS0Uu6fmamg8n8YYcLU2bXSiRaXMGvqV6/KAeJAh8VgZqCX+BexCFioWAYgqNi4qAR4ORhRuHY408jAeUhAmYYiuVlpiflqGZa5CWkzc5fKmbbhIpsAoQDRG8vQwQCBLCwxK6vb5qwhfGxxENahvCEA7NzskSy7vNzzzK09W/PNHF1NvX2dXcN8K55cfh69Luveol3vO8zwi4Yhj+AQwmCBw4IYclDAAJDlQggVOChAoLKkgFkSCAHDwWLKhIEOONARsDKryogFPIiAUb/95gJNIiw4wnI778GFPhzBKFOAq8qLJEhQpiNArjMcHCmlTCUDIouTKBhApELSxFWiGiVKY4E2CAekPgUphDu0742nRrVLJZnyrFSqKQ2ohoSYAMW6IoDpNJ4bLdILTnAj8KUF7UeENjAKuDyxIgOuGiOI0EBBMgLNew5AUrDTMGsFixwBIaNCQuAXJB57qNJ2OWm2Aj4skwCQCIyNkhhtMkdsIuodE0AN4LJDRgfLPtn5YDLdBlraAByuUbBgxQwICxMOnYpVOPej074OFdlfc0TqC62OIbcppHjV4o+LrieWhfT8JC/I/T6W8oCl29vQ0XjLdBaA3s1RcPBO7lFvpX8BVoG4O5jTXRQRDuJ6FDTzEWF1/BCZhgbyAKE9qICYLloQYOFtahVRsWYlZ4KQJHlwHS/IYaZ6sZd9tmu5HQm2xi1UaTbzxYwJk/wBF5g5EEYOBZeEfGZmNdFyFZmZIR4jikbLThlh5kUUVJGmRT7sekkziRWUIACABk3T4qCsedgO4xhgGcY7q5pHJ4klBBTQRJ0CeHcoYHHUh6wgfdn9uJdSdMiebGJ0zUPTcoS286FCkrZxnYoYYKWLkBowhQoBeaOlZAgVhLidrXqg2GiqpQpZ4apwSwRtjqrB3muoF9BboaXKmshlqWqsWiGt2wphJkQbAU5hoCACH5BAUKABsALAcABADOAAsAAAX/oGFw2WZuT5oZROsSQnGaKjRvilI893MItlNOJ5v5gDcFrHhKIWcEYu/xFEqNv6B1N62aclysF7fsZYe5aOx2yL5aAUGSaT1oTYMBwQ5VGCAJgYIJCnx1gIOBhXdwiIl7d0p2iYGQUAQBjoOFSQR/lIQHnZ+Ue6OagqYzSqSJi5eTpTxGcjcSChANEbu8DBAIEsHBChe5vL13G7fFuscRDcnKuM3H0La3EA7Oz8kKEsXazr7Cw9/Gztar5uHHvte47MjktznZ2w0G1+D3BgirAqJmJMAQgMGEgwgn5Ei0gKDBhBMALGRYEOJBb5QcWlQo4cbAihZz3GgIMqFEBSM1/4ZEOWPAgpIIJXYU+PIhRG8ja1qU6VHlzZknJNQ6UanCjQkWCIGSUGEjAwVLjc44+DTqUQtPPS5gejUrTa5TJ3g9sWCr1BNUWZI161StiQUDmLYdGfesibQ3XMq1OPYthrwuA2yU2LBs2cBHIypYQPPlYAKFD5cVvNPtW8eVGbdcQADATsiNO4cFAPkvHpedPzc8kUcPgNGgZ5RNDZG05reoE9s2vSEP79MEGiQGy1qP8LA4ZcdtsJE48ONoLTBtTV0B9LsTnPceoIDBDQvS7W7vfjVY3q3eZ4A339J4eaAmKqU/sV58HvJh2RcnIBsDUw0ABqhBA5aV5V9XUFGiHfVeAiWwoFgJJrIXRH1tEMiDFV4oHoAEGlaWhgIGSGBO2nFomYY3mKjVglidaNYJGJDkWW2xxTfbjCbVaOGNqoX2GloR8ZeTaECS9pthRGJH2g0b3Agbk6hNANtteHD2GJUucfajCQBy5OOTQ25ZgUPvaVVQmbKh9510/qQpwXx3SQdfk8tZJOd5b6JJFplT3ZnmmX3qd5l1eg5q00HrtUkUn0AKaiGjClSAgKLYZcgWXwocGRcCFGCKwSB6ceqphwmYRUFYT/1WKlOdUpipmxW0mlCqHjYkAaeoZlqrqZ4qd+upQKaapn/AmgAegZ8KUtYtFAQQAgAh+QQFCgAbACwHAAQAzgALAAAF/+C2PUcmiCiZGUTrEkKBis8jQEquKwU5HyXIbEPgyX7BYa5wTNmEMwWsSXsqFbEh8DYs9mrgGjdK6GkPY5GOeU6ryz7UFopSQEzygOGhJBjoIgMDBAcBM0V/CYqLCQqFOwobiYyKjn2TlI6GKC2YjJZknouaZAcQlJUHl6eooJwKooobqoewrJSEmyKdt59NhRKFMxLEEA4RyMkMEAjDEhfGycqAG8TQx9IRDRDE3d3R2ctD1RLg0ttKEnbY5wZD3+zJ6M7X2RHi9Oby7u/r9g38UFjTh2xZJBEBMDAboogAgwkQI07IMUORwocSJwCgWDFBAIwZOaJIsOBjRogKJP8wTODw5ESVHVtm3AhzpEeQElOuNDlTZ0ycEUWKWFASqEahGwYUPbnxoAgEdlYSqDBkgoUNClAlIHbSAoOsqCRQnQHxq1axVb06FWFxLIqyaze0Tft1JVqyE+pWXMD1pF6bYl3+HTqAWNW8cRUFzmih0ZAAB2oGKukSAAGGRHWJgLiR6AylBLpuHKKUMlMCngMpDSAa9QIUggZVVvDaJobLeC3XZpvgNgCmtPcuwP3WgmXSq4do0DC6o2/guzcseECtUoO0hmcsGKDgOt7ssBd07wqesAIGZC1YIBa7PQHvb1+SFo+++HrJSQfB33xfav3i5eX3Hnb4CTJgegEq8tH/YQEOcIJzbm2G2EoYRLgBXFpVmFYDcREV4HIcnmUhiGBRouEMJGJGzHIspqgdXxK0yCKHRNXoIX4uorCdTyjkyNtdPWrA4Up82EbAbzMRxxZRR54WXVLDIRmRcag5d2R6ugl3ZXzNhTecchpMhIGVAKAYpgJjjsSklBEd99maZoo535ZvdamjBEpusJyctg3h4X8XqodBMx0tiNeg/oGJaKGABpogS40KSqiaEgBqlQWLUtqoVQnytekEjzo0hHqhRorppOZt2p923M2AAV+oBtpAnnPNoB6HaU6mAAIU+IXmi3j2mtFXuUoHKwXpzVrsjcgGOauKEjQrwq157hitGq2NoWmjh7z6Wmxb0m5w66+2VRAuXN/yFUAIACH5BAUKABsALAcABADOAAsAAAX/4CZuRiaM45MZqBgIRbs9AqTcuFLE7VHLOh7KB5ERdjJaEaU4ClO/lgKWjKKcMiJQ8KgumcieVdQMD8cbBeuAkkC6LYLhOxoQ2PF5Ys9PKPBMen17f0CCg4VSh32JV4t8jSNqEIOEgJKPlkYBlJWRInKdiJdkmQlvKAsLBxdABA4RsbIMBggtEhcQsLKxDBC2TAS6vLENdJLDxMZAubu8vjIbzcQRtMzJz79S08oQEt/guNiyy7fcvMbh4OezdAvGrakLAQwyABsELQkY9BP+//ckyPDD4J9BfAMh1GsBoImMeQUN+lMgUJ9CiRMa5msxoB9Gh/o8GmxYMZXIgxtR/yQ46S/gQAURR0pDwYDfywoyLPip5AdnCwsMFPBU4BPFhKBDi444quCmDKZOfwZ9KEGpCKgcN1jdALSpPqIYsabS+nSqvqplvYqQYAeDPgwKwjaMtiDl0oaqUAyo+3TuWwUAMPpVCfee0cEjVBGQq2ABx7oTWmQk4FglZMGN9fGVDMCuiH2AOVOu/PmyxM630gwM0CCn6q8LjVJ8GXvpa5Uwn95OTC/nNxkda1/dLSK475IjCD6dHbK1ZOa4hXP9DXs5chJ00UpVm5xo2qRpoxptwF2E4/IbJpB/SDz9+q9b1aNfQH08+p4a8uvX8B53fLP+ycAfemjsRUBgp1H20K+BghHgVgt1GXZXZpZ5lt4ECjxYR4ScUWiShEtZqBiIInRGWnERNnjiBglw+JyGnxUmGowsyiiZg189lNtPGACjV2+S9UjbU0JWF6SPvEk3QZEqsZYTk3UAaRSUnznJI5LmESCdBVSyaOWUWLK4I5gDUYVeV1T9l+FZClCAUVA09uSmRHBCKAECFEhW51ht6rnmWBXkaR+NjuHpJ40D3DmnQXt2F+ihZxlqVKOfQRACACH5BAUKABwALAcABADOAAsAAAX/ICdyUCkUo/g8mUG8MCGkKgspeC6j6XEIEBpBUeCNfECaglBcOVfJFK7YQwZHQ6JRZBUqTrSuVEuD3nI45pYjFuWKvjjSkCoRaBUMWxkwBGgJCXspQ36Bh4EEB0oKhoiBgyNLjo8Ki4QElIiWfJqHnISNEI+Ql5J9o6SgkqKkgqYihamPkW6oNBgSfiMMDQkGCBLCwxIQDhHIyQwQCGMKxsnKVyPCF9DREQ3MxMPX0cu4wt7J2uHWx9jlKd3o39MiuefYEcvNkuLt5O8c1ePI2tyELXGQwoGDAQf+iEC2xByDCRAjTlAgIUWCBRgCPJQ4AQBFXAs0coT40WLIjRxL/47AcHLkxIomRXL0CHPERZkpa4q4iVKiyp0tR/7kwHMkTUBBJR5dOCEBAVcKKtCAyOHpowXCpk7goABqBZdcvWploACpBKkpIJI1q5OD2rIWE0R1uTZu1LFwbWL9OlKuWb4c6+o9i3dEgw0RCGDUG9KlRw56gDY2qmCByZBaASi+TACA0TucAaTteCcy0ZuOK3N2vJlx58+LRQyY3Xm0ZsgjZg+oPQLi7dUcNXi0LOJw1pgNtB7XG6CBy+U75SYfPTSQAgZTNUDnQHt67wnbZyvwLgKiMN3oCZB3C76tdewpLFgIP2C88rbi4Y+QT3+8S5USMICZXWj1pkEDeUU3lOYGB3alSoEiMIjgX4WlgNF2EibIwQIXauWXSRg2SAOHIU5IIIMoZkhhWiJaiFVbKo6AQEgQXrTAazO1JhkBrBG3Y2Y6EsUhaGn95hprSN0oWpFE7rhkeaQBchGOEWnwEmc0uKWZj0LeuNV3W4Y2lZHFlQCSRjTIl8uZ+kG5HU/3sRlnTG2ytyadytnD3HrmuRcSn+0h1dycexIK1KCjYaCnjCCVqOFFJTZ5GkUUjESWaUIKU2lgCmAKKQIUjHapXRKE+t2og1VgankNYnohqKJ2CmKplso6GKz7WYCgqxeuyoF8u9IQAgA7",msg:null,msgText:"<em>Loading the next set of posts...</em>",selector:null,speed:'fast',start:undefined},state:{isDuringAjax:false,isInvalidPage:false,isDestroyed:false,isDone:false,isPaused:false,currPage:1},debug:false,behavior:undefined,binder:$(window),nextSelector:"div.navigation a:first",navSelector:"div.navigation",contentSelector:null,extraScrollPx:150,itemSelector:"div.post",animate:false,pathParse:undefined,dataType:'html',appendCallback:true,bufferPx:40,errorCallback:function(){},infid:0,pixelsFromNavToBottom:undefined,path:undefined,prefill:false,maxPage:undefined};$.infinitescroll.prototype={_binding:function infscr_binding(binding){var instance=this,opts=instance.options;opts.v='2.0b2.120520';if(!!opts.behavior&&this['_binding_'+opts.behavior]!==undefined){this['_binding_'+opts.behavior].call(this);return;}
+if(binding!=='bind'&&binding!=='unbind'){this._debug('Binding value  '+binding+' not valid');return false;}
+if(binding==='unbind'){(this.options.binder).unbind('smartscroll.infscr.'+instance.options.infid);}else{(this.options.binder)[binding]('smartscroll.infscr.'+instance.options.infid,function(){instance.scroll();});}
+this._debug('Binding',binding);},_create:function infscr_create(options,callback){var opts=$.extend(true,{},$.infinitescroll.defaults,options);this.options=opts;var $window=$(window);var instance=this;if(!instance._validate(options)){return false;}
+var path=$(opts.nextSelector).attr('href');if(!path){this._debug('Navigation selector not found');return false;}
+opts.path=opts.path||this._determinepath(path);opts.contentSelector=opts.contentSelector||this.element;opts.loading.selector=opts.loading.selector||opts.contentSelector;opts.loading.msg=opts.loading.msg||$('<div id="infscr-loading"><img alt="Loading..." src="'+opts.loading.img+'" /><div>'+opts.loading.msgText+'</div></div>');(new Image()).src=opts.loading.img;if(opts.pixelsFromNavToBottom===undefined){opts.pixelsFromNavToBottom=$(document).height()-$(opts.navSelector).offset().top;}
+var self=this;opts.loading.start=opts.loading.start||function(){$(opts.navSelector).hide();opts.loading.msg.appendTo(opts.loading.selector).show(opts.loading.speed,$.proxy(function(){this.beginAjax(opts);},self));};opts.loading.finished=opts.loading.finished||function(){opts.loading.msg.fadeOut(opts.loading.speed);};opts.callback=function(instance,data,url){if(!!opts.behavior&&instance['_callback_'+opts.behavior]!==undefined){instance['_callback_'+opts.behavior].call($(opts.contentSelector)[0],data,url);}
+if(callback){callback.call($(opts.contentSelector)[0],data,opts,url);}
+if(opts.prefill){$window.bind("resize.infinite-scroll",instance._prefill);}};if(options.debug){if(Function.prototype.bind&&(typeof console==='object'||typeof console==='function')&&typeof console.log==="object"){["log","info","warn","error","assert","dir","clear","profile","profileEnd"].forEach(function(method){console[method]=this.call(console[method],console);},Function.prototype.bind);}}
+this._setup();if(opts.prefill){this._prefill();}
+return true;},_prefill:function infscr_prefill(){var instance=this;var $document=$(document);var $window=$(window);function needsPrefill(){return($document.height()<=$window.height());}
+this._prefill=function(){if(needsPrefill()){instance.scroll();}
+$window.bind("resize.infinite-scroll",function(){if(needsPrefill()){$window.unbind("resize.infinite-scroll");instance.scroll();}});};this._prefill();},_debug:function infscr_debug(){if(true!==this.options.debug){return;}
+if(typeof console!=='undefined'&&typeof console.log==='function'){if((Array.prototype.slice.call(arguments)).length===1&&typeof Array.prototype.slice.call(arguments)[0]==='string'){console.log((Array.prototype.slice.call(arguments)).toString());}else{console.log(Array.prototype.slice.call(arguments));}}else if(!Function.prototype.bind&&typeof console!=='undefined'&&typeof console.log==='object'){Function.prototype.call.call(console.log,console,Array.prototype.slice.call(arguments));}},_determinepath:function infscr_determinepath(path){var opts=this.options;if(!!opts.behavior&&this['_determinepath_'+opts.behavior]!==undefined){return this['_determinepath_'+opts.behavior].call(this,path);}
+if(!!opts.pathParse){this._debug('pathParse manual');return opts.pathParse(path,this.options.state.currPage+1);}else if(path.match(/^(.*?)\b2\b(.*?$)/)){path=path.match(/^(.*?)\b2\b(.*?$)/).slice(1);}else if(path.match(/^(.*?)2(.*?$)/)){if(path.match(/^(.*?page=)2(\/.*|$)/)){path=path.match(/^(.*?page=)2(\/.*|$)/).slice(1);return path;}
+path=path.match(/^(.*?)2(.*?$)/).slice(1);}else{if(path.match(/^(.*?page=)1(\/.*|$)/)){path=path.match(/^(.*?page=)1(\/.*|$)/).slice(1);return path;}else{this._debug('Sorry, we couldn\'t parse your Next (Previous Posts) URL. Verify your the css selector points to the correct A tag. If you still get this error: yell, scream, and kindly ask for help at infinite-scroll.com.');opts.state.isInvalidPage=true;}}
+this._debug('determinePath',path);return path;},_error:function infscr_error(xhr){var opts=this.options;if(!!opts.behavior&&this['_error_'+opts.behavior]!==undefined){this['_error_'+opts.behavior].call(this,xhr);return;}
+if(xhr!=='destroy'&&xhr!=='end'){xhr='unknown';}
+this._debug('Error',xhr);if(xhr==='end'){this._showdonemsg();}
+opts.state.isDone=true;opts.state.currPage=1;opts.state.isPaused=false;this._binding('unbind');},_loadcallback:function infscr_loadcallback(box,data,url){var opts=this.options,callback=this.options.callback,result=(opts.state.isDone)?'done':(!opts.appendCallback)?'no-append':'append',frag;if(!!opts.behavior&&this['_loadcallback_'+opts.behavior]!==undefined){this['_loadcallback_'+opts.behavior].call(this,box,data);return;}
+switch(result){case'done':this._showdonemsg();return false;case'no-append':if(opts.dataType==='html'){data='<div>'+data+'</div>';data=$(data).find(opts.itemSelector);}
+break;case'append':var children=box.children();if(children.length===0){return this._error('end');}
+frag=document.createDocumentFragment();while(box[0].firstChild){frag.appendChild(box[0].firstChild);}
+this._debug('contentSelector',$(opts.contentSelector)[0]);$(opts.contentSelector)[0].appendChild(frag);data=children.get();break;}
+opts.loading.finished.call($(opts.contentSelector)[0],opts);if(opts.animate){var scrollTo=$(window).scrollTop()+$('#infscr-loading').height()+opts.extraScrollPx+'px';$('html,body').animate({scrollTop:scrollTo},800,function(){opts.state.isDuringAjax=false;});}
+if(!opts.animate){opts.state.isDuringAjax=false;}
+callback(this,data,url);if(opts.prefill){this._prefill();}},_nearbottom:function infscr_nearbottom(){var opts=this.options,pixelsFromWindowBottomToBottom=0+$(document).height()-(opts.binder.scrollTop())-$(window).height();if(!!opts.behavior&&this['_nearbottom_'+opts.behavior]!==undefined){return this['_nearbottom_'+opts.behavior].call(this);}
+this._debug('math:',pixelsFromWindowBottomToBottom,opts.pixelsFromNavToBottom);return(pixelsFromWindowBottomToBottom-opts.bufferPx<opts.pixelsFromNavToBottom);},_pausing:function infscr_pausing(pause){var opts=this.options;if(!!opts.behavior&&this['_pausing_'+opts.behavior]!==undefined){this['_pausing_'+opts.behavior].call(this,pause);return;}
+if(pause!=='pause'&&pause!=='resume'&&pause!==null){this._debug('Invalid argument. Toggling pause value instead');}
+pause=(pause&&(pause==='pause'||pause==='resume'))?pause:'toggle';switch(pause){case'pause':opts.state.isPaused=true;break;case'resume':opts.state.isPaused=false;break;case'toggle':opts.state.isPaused=!opts.state.isPaused;break;}
+this._debug('Paused',opts.state.isPaused);return false;},_setup:function infscr_setup(){var opts=this.options;if(!!opts.behavior&&this['_setup_'+opts.behavior]!==undefined){this['_setup_'+opts.behavior].call(this);return;}
+this._binding('bind');return false;},_showdonemsg:function infscr_showdonemsg(){var opts=this.options;if(!!opts.behavior&&this['_showdonemsg_'+opts.behavior]!==undefined){this['_showdonemsg_'+opts.behavior].call(this);return;}
+opts.loading.msg.find('img').hide().parent().find('div').html(opts.loading.finishedMsg).animate({opacity:1},2000,function(){$(this).parent().fadeOut(opts.loading.speed);});opts.errorCallback.call($(opts.contentSelector)[0],'done');},_validate:function infscr_validate(opts){for(var key in opts){if(key.indexOf&&key.indexOf('Selector')>-1&&$(opts[key]).length===0){this._debug('Your '+key+' found no elements.');return false;}}
+return true;},bind:function infscr_bind(){this._binding('bind');},destroy:function infscr_destroy(){this.options.state.isDestroyed=true;this.options.loading.finished();return this._error('destroy');},pause:function infscr_pause(){this._pausing('pause');},resume:function infscr_resume(){this._pausing('resume');},beginAjax:function infscr_ajax(opts){var instance=this,path=opts.path,box,desturl,method,condition;opts.state.currPage++;if(opts.maxPage!=undefined&&opts.state.currPage>opts.maxPage){this.destroy();return;}
+box=$(opts.contentSelector).is('table')?$('<tbody/>'):$('<div/>');desturl=(typeof path==='function')?path(opts.state.currPage):path.join(opts.state.currPage);instance._debug('heading into ajax',desturl);method=(opts.dataType==='html'||opts.dataType==='json')?opts.dataType:'html+callback';if(opts.appendCallback&&opts.dataType==='html'){method+='+callback';}
+switch(method){case'html+callback':instance._debug('Using HTML via .load() method');box.load(desturl+' '+opts.itemSelector,undefined,function infscr_ajax_callback(responseText){instance._loadcallback(box,responseText,desturl);});break;case'html':instance._debug('Using '+(method.toUpperCase())+' via $.ajax() method');$.ajax({url:desturl,dataType:opts.dataType,complete:function infscr_ajax_callback(jqXHR,textStatus){condition=(typeof(jqXHR.isResolved)!=='undefined')?(jqXHR.isResolved()):(textStatus==="success"||textStatus==="notmodified");if(condition){instance._loadcallback(box,jqXHR.responseText,desturl);}else{instance._error('end');}}});break;case'json':instance._debug('Using '+(method.toUpperCase())+' via $.ajax() method');$.ajax({dataType:'json',type:'GET',url:desturl,success:function(data,textStatus,jqXHR){condition=(typeof(jqXHR.isResolved)!=='undefined')?(jqXHR.isResolved()):(textStatus==="success"||textStatus==="notmodified");if(opts.appendCallback){if(opts.template!==undefined){var theData=opts.template(data);box.append(theData);if(condition){instance._loadcallback(box,theData);}else{instance._error('end');}}else{instance._debug("template must be defined.");instance._error('end');}}else{if(condition){instance._loadcallback(box,data,desturl);}else{instance._error('end');}}},error:function(){instance._debug("JSON ajax request failed.");instance._error('end');}});break;}},retrieve:function infscr_retrieve(pageNum){pageNum=pageNum||null;var instance=this,opts=instance.options;if(!!opts.behavior&&this['retrieve_'+opts.behavior]!==undefined){this['retrieve_'+opts.behavior].call(this,pageNum);return;}
+if(opts.state.isDestroyed){this._debug('Instance is destroyed');return false;}
+opts.state.isDuringAjax=true;opts.loading.start.call($(opts.contentSelector)[0],opts);},scroll:function infscr_scroll(){var opts=this.options,state=opts.state;if(!!opts.behavior&&this['scroll_'+opts.behavior]!==undefined){this['scroll_'+opts.behavior].call(this);return;}
+if(state.isDuringAjax||state.isInvalidPage||state.isDone||state.isDestroyed||state.isPaused){return;}
+if(!this._nearbottom()){return;}
+this.retrieve();},toggle:function infscr_toggle(){this._pausing();},unbind:function infscr_unbind(){this._binding('unbind');},update:function infscr_options(key){if($.isPlainObject(key)){this.options=$.extend(true,this.options,key);}}};$.fn.infinitescroll=function infscr_init(options,callback){var thisCall=typeof options;switch(thisCall){case'string':var args=Array.prototype.slice.call(arguments,1);this.each(function(){var instance=$.data(this,'infinitescroll');if(!instance){return false;}
+if(!$.isFunction(instance[options])||options.charAt(0)==="_"){return false;}
+instance[options].apply(instance,args);});break;case'object':this.each(function(){var instance=$.data(this,'infinitescroll');if(instance){instance.update(options);}else{instance=new $.infinitescroll(options,callback,this);if(!instance.failed){$.data(this,'infinitescroll',instance);}}});break;}
+return this;};var event=$.event,scrollTimeout;event.special.smartscroll={setup:function(){$(this).bind("scroll",event.special.smartscroll.handler);},teardown:function(){$(this).unbind("scroll",event.special.smartscroll.handler);},handler:function(event,execAsap){var context=this,args=arguments;event.type="smartscroll";if(scrollTimeout){clearTimeout(scrollTimeout);}
+scrollTimeout=setTimeout(function(){$(context).trigger('smartscroll',args);},execAsap==="execAsap"?0:100);}};$.fn.smartscroll=function(fn){return fn?this.bind("smartscroll",fn):this.trigger("smartscroll",["execAsap"]);};})(window,jQuery);(function($){$.belowthefold=function(element,settings){var fold=$(window).height()+$(window).scrollTop();return fold<=$(element).offset().top-settings.threshold;};$.abovethetop=function(element,settings){var top=$(window).scrollTop();return top>=$(element).offset().top+$(element).height()-settings.threshold;};$.rightofscreen=function(element,settings){var fold=$(window).width()+$(window).scrollLeft();return fold<=$(element).offset().left-settings.threshold;};$.leftofscreen=function(element,settings){var left=$(window).scrollLeft();return left>=$(element).offset().left+$(element).width()-settings.threshold;};$.inviewport=function(element,settings){return!$.rightofscreen(element,settings)&&!$.leftofscreen(element,settings)&&!$.belowthefold(element,settings)&&!$.abovethetop(element,settings);};$.extend($.expr[':'],{"below-the-fold":function(a,i,m){return $.belowthefold(a,{threshold:0});},"above-the-top":function(a,i,m){return $.abovethetop(a,{threshold:0});},"left-of-screen":function(a,i,m){return $.leftofscreen(a,{threshold:0});},"right-of-screen":function(a,i,m){return $.rightofscreen(a,{threshold:0});},"in-viewport":function(a,i,m){return $.inviewport(a,{threshold:0});}});})(jQuery);(function($,undefined){"use strict";var ajaxMethod=$.ajaxS3;if($.searchS3!==undefined){ajaxMethod=$.searchS3;}
+var beginAjaxS3=function(opts){var method='html+callback';if(opts.dataType==='html'||opts.dataType==='json'){method=opts.dataType;if(opts.appendCallback&&opts.dataType==='html'){method+='+callback';}}
+if(method=='html'){opts.state.currPage++;if(opts.maxPage!=undefined&&opts.state.currPage>opts.maxPage){this.destroy();return;}
+var path=opts.path,desturl;if(typeof path==='function'){desturl=path(opts.state.currPage);}else{desturl=path.join(opts.state.currPage);}
+var instance=this;ajaxMethod({url:desturl,type:'GET',dataType:opts.dataType,complete:function infscr_ajax_callback(jqXHR,textStatus){var box;if($(opts.contentSelector).is('table')){box=$('<tbody>');}else{box=$('<div>');}
+var condition=(typeof(jqXHR.isResolved)!=='undefined')?(jqXHR.isResolved()):(textStatus==="success"||textStatus==="notmodified");if(condition){instance._loadcallback(box,jqXHR.responseText,desturl);}else{instance._error('end');}}});}else{this.prototype.beginAjax.call(this,opts);}};$.infinitescroll.prototype._callback_append=function(data){var frag=document.createDocumentFragment();data.each(function(){frag.appendChild(this);});$(this).get()[0].appendChild(frag);};var datalistID=0;$.widget('s3.datalist',{options:{},_create:function(){this.id=datalistID;datalistID+=1;},_init:function(){this.hasInfiniteScroll=false;this.refresh();},_destroy:function(){$.Widget.prototype.destroy.call(this);},refresh:function(){this._infiniteScroll();this._bindItemEvents();$(this.element).trigger('listUpdate');},_infiniteScroll:function(){var $datalist=$(this.element);var pagination=$datalist.find('input.dl-pagination');if(!pagination.length){return;}
+var dlData=JSON.parse($(pagination[0]).val());var startIndex=dlData.startindex,maxItems=dlData.maxitems,totalItems=dlData.totalitems,pageSize=dlData.pagesize,ajaxURL=dlData.ajaxurl;if(!pagination.hasClass('dl-scroll')){if(pageSize>totalItems){pagination.closest('.dl-navigation').css({display:'none'});}
+return;}
+if(pageSize===null){pagination.closest('.dl-navigation').css({display:'none'});return;}
+maxItems=Math.min(maxItems,totalItems-startIndex);var maxIndex=startIndex+maxItems,initialItems=$datalist.find('.dl-item').length;var maxPage=1,ajaxItems=(maxItems-initialItems);if(ajaxItems>0){maxPage+=Math.ceil(ajaxItems/pageSize);}else{if(pagination.length){pagination.closest('.dl-navigation').css({display:'none'});}
+return;}
+if(pagination.length){var dl=this;$datalist.infinitescroll({debug:false,appendCallback:false,behavior:'append',loading:{finishedMsg:'no more items to load',msgText:'loading...',img:S3.Ap.concat('/static/img/indicator.gif')},navSelector:'div.dl-navigation',nextSelector:'div.dl-navigation a:first',itemSelector:'div.dl-row',path:function(page){var start=initialItems+(page-2)*pageSize;var limit=Math.min(pageSize,maxIndex-start);var url=dl._urlAppend(ajaxURL,'start='+start+'&limit='+limit);var cursor=$datalist.find('.dl-row[data-cursor]').last();if(cursor.length&&cursor.attr('data-cursor-start')==start){url=dl._urlAppend(url,'cursor='+encodeURIComponent(cursor.attr('data-cursor')));}
+return url;},dataType:'html',maxPage:maxPage},function(){$datalist.find('.dl-row:last:in-viewport').each(function(){var $this=$(this);if(!$this.hasClass('autoretrieve')){$this.addClass('autoretrieve');dl._autoRetrieve();}});dl._bindItemEvents();});var inst=$datalist.data("infinitescroll");inst.beginAjax=beginAjaxS3;this.hasInfiniteScroll=true;$datalist.find('.dl-row:last:in-viewport').each(function(){$(this).addClass('autoretrieve');dl._autoRetrieve();});}
+return;},ajaxReloadItem:function(recordID){var $datalist=$(this.element);var listID=$datalist.attr('id'),pagination=$datalist.find('input.dl-pagination');if(!pagination.length){return;}
+var dlData=JSON.parse($(pagination[0]).val()),ajaxURL=dlData.ajaxurl;if(ajaxURL===null){return;}
+var itemID='#'+listID+'-'+recordID,item=$(itemID);if(!item.length){return;}
+var dl=this;ajaxMethod({'url':dl._urlAppend(ajaxURL,'record='+recordID),'type':'GET','dataType':'html','success':function(data){var itemData=$(data.slice(data.indexOf('<'))).find(itemID);if(itemData.length){item.replaceWith(itemData);}else{dl._removeItem(item,dlData);}
+dl._bindItemEvents();$datalist.trigger('listUpdate');},'error':function(request,status,error){var msg;if(error=='UNAUTHORIZED'){msg=i18n.gis_requires_login;}else{msg=request.responseText;}
+console.log(msg);}});},ajaxReload:function(filters){var $datalist=$(this.element);var pagination=$datalist.find('input.dl-pagination');if(!pagination.length){return;}
+var $pagination0=$(pagination[0]);var dlData=JSON.parse($pagination0.val());var startIndex=dlData.startindex,pageSize=dlData.pagesize,ajaxURL=dlData.ajaxurl;if(pageSize===null){return;}
+if(typeof filters=='undefined'){var listID=$datalist.attr('id'),filterTargets=$('form.filter-form input.filter-submit-target'),len=filterTargets.length,targets,targetList;if(listID&&len){for(var i=0;i<len;i++){targets=$(filterTargets[i]);targetList=targets.val().split(' ');if($.inArray(listID,targetList)!=-1){filters=S3.search.getCurrentFilters(targets.closest('form.filter-form'));break;}}}}
+if(filters){try{ajaxURL=S3.search.filterURL(ajaxURL,filters);dlData.ajaxurl=ajaxURL;$pagination0.val(JSON.stringify(dlData));}catch(e){}}
+var dl=this;ajaxMethod({'url':dl._urlAppend(ajaxURL,'start='+startIndex+'&limit='+pageSize),'type':'GET','dataType':'html','success':function(data){$datalist.infinitescroll('destroy');$datalist.data('infinitescroll',null);var newlist=$(data.slice(data.indexOf('<'))).find('.dl');if(newlist.length){var paginationNew=$(newlist).find('input.dl-pagination');if(paginationNew.length){var dlDataNew=JSON.parse($(paginationNew[0]).val());dlData.totalitems=dlDataNew.totalitems;dlData.maxitems=dlDataNew.maxitems;$pagination0.val(JSON.stringify(dlData));}
+var modalMore=$datalist.find('div.dl-navigation a.dl-more'),modalMoreLength=modalMore.length,popup_url,popup_title;if(modalMoreLength){popup_url=$(modalMore[0]).attr('href');popup_title=$(modalMore[0]).attr('title');}
+$datalist.empty().html(newlist.html());$datalist.find('input.dl-pagination').replaceWith(pagination);if(modalMoreLength){if(filters){popup_url=S3.search.filterURL(popup_url,filters);}
+$($datalist.find('.dl-navigation a')[0]).addClass('s3_modal').attr('href',popup_url).attr('title',popup_title);}}else{var nav=$datalist.find('.dl-navigation').css({display:'none'});newlist=$(data.slice(data.indexOf('<'))).find('.empty');$datalist.empty().append(newlist);$datalist.append(nav);}
+dl._infiniteScroll();$datalist.find('.dl-item:last:in-viewport').each(function(){$(this).addClass('autoretrieve');dl._autoRetrieve();});dl._bindItemEvents();$datalist.trigger('listUpdate');},'error':function(request,status,error){var msg;if(error=='UNAUTHORIZED'){msg=i18n.gis_requires_login;}else{msg=request.responseText;}
+console.log(msg);}});return;},_ajaxDeleteItem:function(anchor){var $datalist=$(this.element);var item=$(anchor).closest('.dl-item');if(!item.length){return;}
+var pagination=$datalist.find('input.dl-pagination').first();if(!pagination.length){return;}
+var dlData=JSON.parse($(pagination).val());var ajaxURL=this._stripFilters(dlData.ajaxurl);if(ajaxURL===null){return;}
+var recordID=item.attr('id').split('-').pop();var dl=this;ajaxMethod({'url':this._urlAppend(ajaxURL,'delete='+recordID),'type':'POST','dataType':'json','success':function(){dl._removeItem(item,dlData);},'error':function(request,status,error){var msg;if(error=='UNAUTHORIZED'){msg=i18n.gis_requires_login;}else{msg=request.responseText;}
+console.log(msg);}});$datalist.find('.dl-item:last:in-viewport').each(function(){$(this).addClass('autoretrieve');dl._autoRetrieve(this);});},_removeItem:function(item,dlData){var $datalist=$(this.element),pagination=$datalist.find('input.dl-pagination').first(),rowSize=dlData.rowsize,ajaxURL=dlData.ajaxurl;var rowIndex=item.index(),row=item.closest('.dl-row'),idTokens=item.attr('id').split('-'),i,prev,next;item.remove();var $row=$(row);if(rowIndex<rowSize-1){for(i=rowIndex+1;i<rowSize;i++){prev='dl-col-'+(i-1);next='dl-col-'+i;$row.find('.'+next).removeClass(next).addClass(prev);}}
+var prevRow=row;$row.nextAll('.dl-row').each(function(){$(this).find('.dl-col-0').first().appendTo(prevRow).removeClass('dl-col-0').addClass('dl-col-'+(rowSize-1));if(rowSize>1){for(i=1;i<rowSize;i++){prev='dl-col-'+(i-1);next='dl-col-'+i;$(this).find('.'+next).removeClass(next).addClass(prev);}}
+prevRow=this;});var lastRow=$row.closest('.dl').find('.dl-row').last(),numItems=$row.closest('.dl').find('.dl-item').length;var dl=this;ajaxMethod({'url':dl._urlAppend(ajaxURL,'start='+numItems+'&limit=1'),'type':'GET','dataType':'html','success':function(data){$(data.slice(data.indexOf('<'))).find('.dl-item').first().removeClass('dl-col-0').addClass('dl-col-'+(rowSize-1)).appendTo(lastRow);dl._bindItemEvents();},'error':function(request,status,error){var msg;if(error=='UNAUTHORIZED'){msg=i18n.gis_requires_login;}else{msg=request.responseText;}
+console.log(msg);}});dlData.totalitems--;if(dlData.maxitems>dlData.totalitems){dlData.maxitems=dlData.totalitems;}
+$(pagination).val(JSON.stringify(dlData));if(dlData.totalitems===0){$datalist.find('.dl-empty').css({display:'block'});}
+if(typeof map!='undefined'){var layers=map.layers,needle=idTokens.join('_');Ext.iterate(layers,function(key,val,obj){if(key.s3_layer_id==needle){var layer=layers[val],found=false,uuid=data.uuid;Ext.iterate(layer.feaures,function(key,val,obj){if(key.properties.id==uuid){layer.removeFeatures([key]);found=true;}});if(!found){Ext.iterate(layer.strategies,function(key,val,obj){if(key.CLASS_NAME=='OpenLayers.Strategy.Refresh'){layer.strategies[val].refresh();}});}}});}
+$datalist.trigger('listUpdate');},_autoRetrieve:function(){if(this.hasInfiniteScroll){$(this.element).infinitescroll('retrieve');}},_urlAppend:function(url,query){var parts=url.split('?'),q='';var newurl=parts[0];if(parts.length>1){if(query){q='&'+query;}
+return(newurl+'?'+parts[1]+q);}else{if(query){q='?'+query;}
+return(newurl+q);}},_stripFilters:function(url){if(!url){return null;}
+var urlparts=url.split('?');if(urlparts.length>=2){var queries=urlparts[1].split(/[&;]/g);for(var i=queries.length;i-->0;){if(queries[i].split('=')[0].lastIndexOf('.',1)!=-1){queries.splice(i,1);}}
+url=urlparts[0]+(queries.length>0?'?'+queries.join('&'):"");}
+return url;},getTotalItems:function(){var $datalist=$(this.element),pagination=$datalist.find('input.dl-pagination');if(!pagination.length){return $datalist.find('.dl-item').length;}
+return JSON.parse($(pagination[0]).val()).totalitems;},_bindItemEvents:function(){var $datalist=$(this.element);var dl=this;$datalist.find('.dl-item-delete').css({cursor:'pointer'}).off('click.dl').on('click.dl',function(event){if(confirm(i18n.delete_confirmation)){dl._ajaxDeleteItem(this);return true;}else{event.preventDefault();return false;}});S3.redraw();return;},_bindEvents:function(){return true;},_unbindEvents:function(){return true;}});$(function(){$('.dl').each(function(){$(this).datalist();});});})(jQuery);
\ No newline at end of file
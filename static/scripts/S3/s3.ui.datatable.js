@@ -494,7 +494,8 @@
                 cacheLastRequest = cache.cacheLastRequest || null,
                 cacheLastJson = cache.cacheLastJson || null,
                 cacheUpper = cache.cacheUpper || null,
-                cacheLower = cache.cacheLower;
+                cacheLower = cache.cacheLower,
+                cursor = cacheLastJson && cacheLastJson.cursor || null;
 
             if (cacheLower === undefined) {
                 cacheLower = -1;
@@ -533,6 +534,7 @@
                     cacheLower = -1;
                     cacheUpper = null;
                     cacheCombined.clear();
+                    cursor = null;
 
                     drawCallback({}); // calls the inner function of reloadAjax
 
@@ -583,6 +585,7 @@
                         // API requested that the cache be cleared
                         cacheCombined.clear();
                         settings.clearCache = false;
+                        cursor = null;
                         ajax = true;
 
                     } else if (cacheLastRequest &&
@@ -591,6 +594,7 @@
                                 JSON.stringify(request.search)  !== JSON.stringify(cacheLastRequest.search))) {
                         // Properties changed (ordering, columns, searching)
                         cacheCombined.clear();
+                        cursor = null;
                         ajax = true;
 
                     } else {
@@ -657,6 +661,13 @@
                         sendData.push({'name': 'start',
                                        'value': requestStart
                                        });
+                        // Keyset pagination: send the cursor if it
+                        // refers to the requested start position
+                        if (cursor && cursor.start == requestStart) {
+                            sendData.push({'name': 'cursor',
+                                           'value': cursor.key
+                                           });
+                        }
                     }
                     if (request.search && request.search.value) {
                         sendData.push({'name': 'sSearch',
@@ -725,6 +736,9 @@
                             // Keep the server response as basis for subsequent cache responses
                             cacheLastJson = $.extend(true, {}, json);
 
+                            // Keyset pagination cursor for the next page
+                            cursor = json.cursor || null;
+
                             // Update cacheUpper with the actual number of records returned
                             cacheUpper = requestStart + json.data.length;
 
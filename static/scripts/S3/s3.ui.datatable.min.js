@@ -42,236 +42,1249 @@
  Responsive 2.3.0
  2014-2022 SpryMedia Ltd - datatables.net/license
 */
-(function(g){"function"===typeof define&&define.amd?define(["jquery"],function(M){return g(M,window,document)}):"object"===typeof exports?module.exports=function(M,X){M||=window;X||="undefined"!==typeof window?require("jquery"):require("jquery")(M);return g(X,M,M.document)}:window.DataTable=g(jQuery,window,document)})(function(g,M,X,z){function pa(a){var b,c,d={};g.each(a,function(e,k){(b=e.match(/^([^A-Z]+?)([A-Z])/))&&-1!=="a aa ai ao as b fn i m o s ".indexOf(b[1]+" ")&&(c=e.replace(b[0],b[2].toLowerCase()),
-d[c]=e,"o"===b[1]&&pa(a[e]))});a._hungarianMap=d}function ea(a,b,c){a._hungarianMap||pa(a);var d;g.each(b,function(e,k){d=a._hungarianMap[e];d===z||!c&&b[d]!==z||("o"===d.charAt(0)?(b[d]||(b[d]={}),g.extend(!0,b[d],b[e]),ea(a[d],b[d],c)):b[d]=b[e])})}function ba(a){var b=E.defaults.oLanguage,c=b.sDecimal;c&&lb(c);if(a){var d=a.sZeroRecords;!a.sEmptyTable&&d&&"No data available in table"===b.sEmptyTable&&sa(a,a,"sZeroRecords","sEmptyTable");!a.sLoadingRecords&&d&&"Loading..."===b.sLoadingRecords&&
-sa(a,a,"sZeroRecords","sLoadingRecords");a.sInfoThousands&&(a.sThousands=a.sInfoThousands);(a=a.sDecimal)&&c!==a&&lb(a)}}function r(a){la(a,"ordering","bSort");la(a,"orderMulti","bSortMulti");la(a,"orderClasses","bSortClasses");la(a,"orderCellsTop","bSortCellsTop");la(a,"order","aaSorting");la(a,"orderFixed","aaSortingFixed");la(a,"paging","bPaginate");la(a,"pagingType","sPaginationType");la(a,"pageLength","iDisplayLength");la(a,"searching","bFilter");"boolean"===typeof a.sScrollX&&(a.sScrollX=a.sScrollX?
-"100%":"");"boolean"===typeof a.scrollX&&(a.scrollX=a.scrollX?"100%":"");if(a=a.aoSearchCols)for(var b=0,c=a.length;b<c;b++)a[b]&&ea(E.models.oSearch,a[b])}function w(a){la(a,"orderable","bSortable");la(a,"orderData","aDataSort");la(a,"orderSequence","asSorting");la(a,"orderDataType","sortDataType");var b=a.aDataSort;"number"!==typeof b||Array.isArray(b)||(a.aDataSort=[b])}function m(a){if(!E.__browser){var b={};E.__browser=b;var c=g("<div/>").css({position:"fixed",top:0,left:-1*g(M).scrollLeft(),
-height:1,width:1,overflow:"hidden"}).append(g("<div/>").css({position:"absolute",top:1,left:1,width:100,overflow:"scroll"}).append(g("<div/>").css({width:"100%",height:10}))).appendTo("body"),d=c.children(),e=d.children();b.barWidth=d[0].offsetWidth-d[0].clientWidth;b.bScrollOversize=100===e[0].offsetWidth&&100!==d[0].clientWidth;b.bScrollbarLeft=1!==Math.round(e.offset().left);b.bBounding=c[0].getBoundingClientRect().width?!0:!1;c.remove()}g.extend(a.oBrowser,E.__browser);a.oScroll.iBarWidth=E.__browser.barWidth}
-function n(a,b,c,d,e,k){var f=!1;if(c!==z){var h=c;f=!0}for(;d!==e;)a.hasOwnProperty(d)&&(h=f?b(h,a[d],d,a):a[d],f=!0,d+=k);return h}function t(a,b){var c=E.defaults.column,d=a.aoColumns.length;c=g.extend({},E.models.oColumn,c,{nTh:b?b:X.createElement("th"),sTitle:c.sTitle?c.sTitle:b?b.innerHTML:"",aDataSort:c.aDataSort?c.aDataSort:[d],mData:c.mData?c.mData:d,idx:d});a.aoColumns.push(c);c=a.aoPreSearchCols;c[d]=g.extend({},E.models.oSearch,c[d]);v(a,d,g(b).data())}function v(a,b,c){b=a.aoColumns[b];
-var d=a.oClasses,e=g(b.nTh);if(!b.sWidthOrig){b.sWidthOrig=e.attr("width")||null;var k=(e.attr("style")||"").match(/width:\s*(\d+[pxem%]+)/);k&&(b.sWidthOrig=k[1])}c!==z&&null!==c&&(w(c),ea(E.defaults.column,c,!0),c.mDataProp===z||c.mData||(c.mData=c.mDataProp),c.sType&&(b._sManualType=c.sType),c.className&&!c.sClass&&(c.sClass=c.className),c.sClass&&e.addClass(c.sClass),k=b.sClass,g.extend(b,c),sa(b,c,"sWidth","sWidthOrig"),k!==b.sClass&&(b.sClass=k+" "+b.sClass),c.iDataSort!==z&&(b.aDataSort=[c.iDataSort]),
-sa(b,c,"aDataSort"));var f=b.mData,h=Ea(f),l=b.mRender?Ea(b.mRender):null;c=function(p){return"string"===typeof p&&-1!==p.indexOf("@")};b._bAttrSrc=g.isPlainObject(f)&&(c(f.sort)||c(f.type)||c(f.filter));b._setter=null;b.fnGetData=function(p,q,u){var D=h(p,q,z,u);return l&&q?l(D,q,p,u):D};b.fnSetData=function(p,q,u){return Aa(f)(p,q,u)};"number"!==typeof f&&(a._rowReadObject=!0);a.oFeatures.bSort||(b.bSortable=!1,e.addClass(d.sSortableNone));a=-1!==g.inArray("asc",b.asSorting);c=-1!==g.inArray("desc",
-b.asSorting);b.bSortable&&(a||c)?a&&!c?(b.sSortingClass=d.sSortableAsc,b.sSortingClassJUI=d.sSortJUIAscAllowed):!a&&c?(b.sSortingClass=d.sSortableDesc,b.sSortingClassJUI=d.sSortJUIDescAllowed):(b.sSortingClass=d.sSortable,b.sSortingClassJUI=d.sSortJUI):(b.sSortingClass=d.sSortableNone,b.sSortingClassJUI="")}function x(a){if(!1!==a.oFeatures.bAutoWidth){var b=a.aoColumns;mb(a);for(var c=0,d=b.length;c<d;c++)b[c].nTh.style.width=b[c].sWidth}b=a.oScroll;""===b.sY&&""===b.sX||Wa(a);T(a,null,"column-sizing",
-[a])}function A(a,b){a=H(a,"bVisible");return"number"===typeof a[b]?a[b]:null}function B(a,b){a=H(a,"bVisible");b=g.inArray(b,a);return-1!==b?b:null}function y(a){var b=0;g.each(a.aoColumns,function(c,d){d.bVisible&&"none"!==g(d.nTh).css("display")&&b++});return b}function H(a,b){var c=[];g.map(a.aoColumns,function(d,e){d[b]&&c.push(e)});return c}function G(a){var b=a.aoColumns,c=a.aoData,d=E.ext.type.detect,e,k,f;var h=0;for(e=b.length;h<e;h++){var l=b[h];var p=[];if(!l.sType&&l._sManualType)l.sType=
-l._sManualType;else if(!l.sType){var q=0;for(k=d.length;q<k;q++){var u=0;for(f=c.length;u<f;u++){p[u]===z&&(p[u]=O(a,u,h,"type"));var D=d[q](p[u],a);if(!D&&q!==d.length-1)break;if("html"===D&&!ua(p[u]))break}if(D){l.sType=D;break}}l.sType||(l.sType="string")}}}function N(a,b,c,d){var e,k,f,h=a.aoColumns;if(b)for(e=b.length-1;0<=e;e--){var l=b[e];var p=l.target!==z?l.target:l.targets!==z?l.targets:l.aTargets;Array.isArray(p)||(p=[p]);var q=0;for(k=p.length;q<k;q++)if("number"===typeof p[q]&&0<=p[q]){for(;h.length<=
-p[q];)t(a);d(p[q],l)}else if("number"===typeof p[q]&&0>p[q])d(h.length+p[q],l);else if("string"===typeof p[q]){var u=0;for(f=h.length;u<f;u++)("_all"==p[q]||g(h[u].nTh).hasClass(p[q]))&&d(u,l)}}if(c)for(e=0,a=c.length;e<a;e++)d(e,c[e])}function L(a,b,c,d){var e=a.aoData.length,k=g.extend(!0,{},E.models.oRow,{src:c?"dom":"data",idx:e});k._aData=b;a.aoData.push(k);for(var f=a.aoColumns,h=0,l=f.length;h<l;h++)f[h].sType=null;a.aiDisplayMaster.push(e);b=a.rowIdFn(b);b!==z&&(a.aIds[b]=k);!c&&a.oFeatures.bDeferRender||
-nb(a,e,c,d);return e}function P(a,b){var c;b instanceof g||(b=g(b));return b.map(function(d,e){c=ob(a,e);return L(a,c.data,e,c.cells)})}function O(a,b,c,d){"search"===d?d="filter":"order"===d&&(d="sort");var e=a.iDraw,k=a.aoColumns[c],f=a.aoData[b]._aData,h=k.sDefaultContent,l=k.fnGetData(f,d,{settings:a,row:b,col:c});if(l===z)return a.iDrawError!=e&&null===h&&(ya(a,0,"Requested unknown parameter "+("function"==typeof k.mData?"{function}":"'"+k.mData+"'")+" for row "+b+", column "+c,4),a.iDrawError=
-e),h;if((l===f||null===l)&&null!==h&&d!==z)l=h;else if("function"===typeof l)return l.call(f);if(null===l&&"display"===d)return"";"filter"===d&&(a=E.ext.type.search,a[k.sType]&&(l=a[k.sType](l)));return l}function Z(a,b,c,d){a.aoColumns[c].fnSetData(a.aoData[b]._aData,d,{settings:a,row:b,col:c})}function fa(a){return g.map(a.match(/(\\.|[^\.])+/g)||[""],function(b){return b.replace(/\\\./g,".")})}function qa(a){return ma(a.aoData,"_aData")}function Ca(a){a.aoData.length=0;a.aiDisplayMaster.length=
-0;a.aiDisplay.length=0;a.aIds={}}function Xa(a,b,c){for(var d=-1,e=0,k=a.length;e<k;e++)a[e]==b?d=e:a[e]>b&&a[e]--;-1!=d&&c===z&&a.splice(d,1)}function Ja(a,b,c,d){var e=a.aoData[b],k,f=function(l,p){for(;l.childNodes.length;)l.removeChild(l.firstChild);l.innerHTML=O(a,b,p,"display")};if("dom"!==c&&(c&&"auto"!==c||"dom"!==e.src)){var h=e.anCells;if(h)if(d!==z)f(h[d],d);else for(c=0,k=h.length;c<k;c++)f(h[c],c)}else e._aData=ob(a,e,d,d===z?z:e._aData).data;e._aSortData=null;e._aFilterData=null;f=a.aoColumns;
-if(d!==z)f[d].sType=null;else{c=0;for(k=f.length;c<k;c++)f[c].sType=null;pb(a,e)}}function ob(a,b,c,d){var e=[],k=b.firstChild,f,h=0,l,p=a.aoColumns,q=a._rowReadObject;d=d!==z?d:q?{}:[];var u=function(J,I){if("string"===typeof J){var C=J.indexOf("@");-1!==C&&(C=J.substring(C+1),Aa(J)(d,I.getAttribute(C)))}},D=function(J){if(c===z||c===h)f=p[h],l=J.innerHTML.trim(),f&&f._bAttrSrc?(Aa(f.mData._)(d,l),u(f.mData.sort,J),u(f.mData.type,J),u(f.mData.filter,J)):q?(f._setter||(f._setter=Aa(f.mData)),f._setter(d,
-l)):d[h]=l;h++};if(k)for(;k;){var F=k.nodeName.toUpperCase();if("TD"==F||"TH"==F)D(k),e.push(k);k=k.nextSibling}else for(e=b.anCells,k=0,F=e.length;k<F;k++)D(e[k]);(b=b.firstChild?b:b.nTr)&&(b=b.getAttribute("id"))&&Aa(a.rowId)(d,b);return{data:d,cells:e}}function nb(a,b,c,d){var e=a.aoData[b],k=e._aData,f=[],h,l;if(null===e.nTr){var p=c||X.createElement("tr");e.nTr=p;e.anCells=f;p._DT_RowIndex=b;pb(a,e);var q=0;for(h=a.aoColumns.length;q<h;q++){var u=a.aoColumns[q];e=(l=c?!1:!0)?X.createElement(u.sCellType):
-d[q];e._DT_CellIndex={row:b,column:q};f.push(e);if(l||!(!u.mRender&&u.mData===q||g.isPlainObject(u.mData)&&u.mData._===q+".display"))e.innerHTML=O(a,b,q,"display");u.sClass&&(e.className+=" "+u.sClass);u.bVisible&&!c?p.appendChild(e):!u.bVisible&&c&&e.parentNode.removeChild(e);u.fnCreatedCell&&u.fnCreatedCell.call(a.oInstance,e,O(a,b,q),k,b,q)}T(a,"aoRowCreatedCallback",null,[p,k,b,f])}}function pb(a,b){var c=b.nTr,d=b._aData;if(c){if(a=a.rowIdFn(d))c.id=a;d.DT_RowClass&&(a=d.DT_RowClass.split(" "),
-b.__rowc=b.__rowc?Ya(b.__rowc.concat(a)):a,g(c).removeClass(b.__rowc.join(" ")).addClass(d.DT_RowClass));d.DT_RowAttr&&g(c).attr(d.DT_RowAttr);d.DT_RowData&&g(c).data(d.DT_RowData)}}function Jb(a){var b,c,d=a.nTHead,e=a.nTFoot,k=0===g("th, td",d).length,f=a.oClasses,h=a.aoColumns;k&&(c=g("<tr/>").appendTo(d));var l=0;for(b=h.length;l<b;l++){var p=h[l];var q=g(p.nTh).addClass(p.sClass);k&&q.appendTo(c);a.oFeatures.bSort&&(q.addClass(p.sSortingClass),!1!==p.bSortable&&(q.attr("tabindex",a.iTabIndex).attr("aria-controls",
-a.sTableId),qb(a,p.nTh,l)));p.sTitle!=q[0].innerHTML&&q.html(p.sTitle);rb(a,"header")(a,q,p,f)}k&&Ka(a.aoHeader,d);g(d).children("tr").children("th, td").addClass(f.sHeaderTH);g(e).children("tr").children("th, td").addClass(f.sFooterTH);if(null!==e)for(a=a.aoFooter[0],l=0,b=a.length;l<b;l++)p=h[l],p.nTf=a[l].cell,p.sClass&&g(p.nTf).addClass(p.sClass)}function La(a,b,c){var d,e,k=[],f=[],h=a.aoColumns.length;if(b){c===z&&(c=!1);var l=0;for(d=b.length;l<d;l++){k[l]=b[l].slice();k[l].nTr=b[l].nTr;for(e=
-h-1;0<=e;e--)a.aoColumns[e].bVisible||c||k[l].splice(e,1);f.push([])}l=0;for(d=k.length;l<d;l++){if(a=k[l].nTr)for(;e=a.firstChild;)a.removeChild(e);e=0;for(b=k[l].length;e<b;e++){var p=h=1;if(f[l][e]===z){a.appendChild(k[l][e].cell);for(f[l][e]=1;k[l+h]!==z&&k[l][e].cell==k[l+h][e].cell;)f[l+h][e]=1,h++;for(;k[l][e+p]!==z&&k[l][e].cell==k[l][e+p].cell;){for(c=0;c<h;c++)f[l+c][e+p]=1;p++}g(k[l][e].cell).attr("rowspan",h).attr("colspan",p)}}}}}function Ba(a,b){var c="ssp"==ja(a),d=a.iInitDisplayStart;
-d!==z&&-1!==d&&(a._iDisplayStart=c?d:d>=a.fnRecordsDisplay()?0:d,a.iInitDisplayStart=-1);c=T(a,"aoPreDrawCallback","preDraw",[a]);if(-1!==g.inArray(!1,c))na(a,!1);else{c=[];var e=0;d=a.asStripeClasses;var k=d.length,f=a.oLanguage,h="ssp"==ja(a),l=a.aiDisplay,p=a._iDisplayStart,q=a.fnDisplayEnd();a.bDrawing=!0;if(a.bDeferLoading)a.bDeferLoading=!1,a.iDraw++,na(a,!1);else if(!h)a.iDraw++;else if(!a.bDestroying&&!b){Kb(a);return}if(0!==l.length)for(b=h?a.aoData.length:q,f=h?0:p;f<b;f++){h=l[f];var u=
-a.aoData[h];null===u.nTr&&nb(a,h);var D=u.nTr;if(0!==k){var F=d[e%k];u._sRowStripe!=F&&(g(D).removeClass(u._sRowStripe).addClass(F),u._sRowStripe=F)}T(a,"aoRowCallback",null,[D,u._aData,e,f,h]);c.push(D);e++}else e=f.sZeroRecords,1==a.iDraw&&"ajax"==ja(a)?e=f.sLoadingRecords:f.sEmptyTable&&0===a.fnRecordsTotal()&&(e=f.sEmptyTable),c[0]=g("<tr/>",{"class":k?d[0]:""}).append(g("<td />",{valign:"top",colSpan:y(a),"class":a.oClasses.sRowEmpty}).html(e))[0];T(a,"aoHeaderCallback","header",[g(a.nTHead).children("tr")[0],
-qa(a),p,q,l]);T(a,"aoFooterCallback","footer",[g(a.nTFoot).children("tr")[0],qa(a),p,q,l]);d=g(a.nTBody);d.children().detach();d.append(g(c));T(a,"aoDrawCallback","draw",[a]);a.bSorted=!1;a.bFiltered=!1;a.bDrawing=!1}}function Da(a,b){var c=a.oFeatures,d=c.bFilter;c.bSort&&Lb(a);d?Ma(a,a.oPreviousSearch):a.aiDisplay=a.aiDisplayMaster.slice();!0!==b&&(a._iDisplayStart=0);a._drawHold=b;Ba(a);a._drawHold=!1}function Mb(a){var b=a.oClasses,c=g(a.nTable);c=g("<div/>").insertBefore(c);var d=a.oFeatures,
-e=g("<div/>",{id:a.sTableId+"_wrapper","class":b.sWrapper+(a.nTFoot?"":" "+b.sNoFooter)});a.nHolding=c[0];a.nTableWrapper=e[0];a.nTableReinsertBefore=a.nTable.nextSibling;for(var k=a.sDom.split(""),f,h,l,p,q,u,D=0;D<k.length;D++){f=null;h=k[D];if("<"==h){l=g("<div/>")[0];p=k[D+1];if("'"==p||'"'==p){q="";for(u=2;k[D+u]!=p;)q+=k[D+u],u++;"H"==q?q=b.sJUIHeader:"F"==q&&(q=b.sJUIFooter);-1!=q.indexOf(".")?(p=q.split("."),l.id=p[0].substr(1,p[0].length-1),l.className=p[1]):"#"==q.charAt(0)?l.id=q.substr(1,
-q.length-1):l.className=q;D+=u}e.append(l);e=g(l)}else if(">"==h)e=e.parent();else if("l"==h&&d.bPaginate&&d.bLengthChange)f=Nb(a);else if("f"==h&&d.bFilter)f=Ob(a);else if("r"==h&&d.bProcessing)f=Pb(a);else if("t"==h)f=Qb(a);else if("i"==h&&d.bInfo)f=Rb(a);else if("p"==h&&d.bPaginate)f=Sb(a);else if(0!==E.ext.feature.length)for(l=E.ext.feature,u=0,p=l.length;u<p;u++)if(h==l[u].cFeature){f=l[u].fnInit(a);break}f&&(l=a.aanFeatures,l[h]||(l[h]=[]),l[h].push(f),e.append(f))}c.replaceWith(e);a.nHolding=
-null}function Ka(a,b){b=g(b).children("tr");var c,d,e;a.splice(0,a.length);var k=0;for(e=b.length;k<e;k++)a.push([]);k=0;for(e=b.length;k<e;k++){var f=b[k];for(c=f.firstChild;c;){if("TD"==c.nodeName.toUpperCase()||"TH"==c.nodeName.toUpperCase()){var h=1*c.getAttribute("colspan");var l=1*c.getAttribute("rowspan");h=h&&0!==h&&1!==h?h:1;l=l&&0!==l&&1!==l?l:1;var p=0;for(d=a[k];d[p];)p++;var q=p;var u=1===h?!0:!1;for(d=0;d<h;d++)for(p=0;p<l;p++)a[k+p][q+d]={cell:c,unique:u},a[k+p].nTr=f}c=c.nextSibling}}}
-function Za(a,b,c){var d=[];c||(c=a.aoHeader,b&&(c=[],Ka(c,b)));b=0;for(var e=c.length;b<e;b++)for(var k=0,f=c[b].length;k<f;k++)!c[b][k].unique||d[k]&&a.bSortCellsTop||(d[k]=c[b][k].cell);return d}function $a(a,b,c){T(a,"aoServerParams","serverParams",[b]);if(b&&Array.isArray(b)){var d={},e=/(.*?)\[\]$/;g.each(b,function(q,u){(q=u.name.match(e))?(q=q[0],d[q]||(d[q]=[]),d[q].push(u.value)):d[u.name]=u.value});b=d}var k=a.ajax,f=a.oInstance,h=function(q){var u=a.jqXHR?a.jqXHR.status:null;if(null===
-q||"number"===typeof u&&204==u)q={},Na(a,q,[]);(u=q.error||q.sError)&&ya(a,0,u);a.json=q;T(a,null,"xhr",[a,q,a.jqXHR]);c(q)};if(g.isPlainObject(k)&&k.data){var l=k.data;var p="function"===typeof l?l(b,a):l;b="function"===typeof l&&p?p:g.extend(!0,b,p);delete k.data}p={data:b,success:h,dataType:"json",cache:!1,type:a.sServerMethod,error:function(q,u,D){D=T(a,null,"xhr",[a,null,a.jqXHR]);-1===g.inArray(!0,D)&&("parsererror"==u?ya(a,0,"Invalid JSON response",1):4===q.readyState&&ya(a,0,"Ajax error",
-7));na(a,!1)}};a.oAjaxData=b;T(a,null,"preXhr",[a,b]);a.fnServerData?a.fnServerData.call(f,a.sAjaxSource,g.map(b,function(q,u){return{name:u,value:q}}),h,a):a.sAjaxSource||"string"===typeof k?a.jqXHR=g.ajax(g.extend(p,{url:k||a.sAjaxSource})):"function"===typeof k?a.jqXHR=k.call(f,b,h,a):(a.jqXHR=g.ajax(g.extend(p,k)),k.data=l)}function Kb(a){a.iDraw++;na(a,!0);$a(a,Tb(a),function(b){Ub(a,b)})}function Tb(a){var b=a.aoColumns,c=b.length,d=a.oFeatures,e=a.oPreviousSearch,k=a.aoPreSearchCols,f=[],h=
-Fa(a);var l=a._iDisplayStart;var p=!1!==d.bPaginate?a._iDisplayLength:-1;var q=function(J,I){f.push({name:J,value:I})};q("sEcho",a.iDraw);q("iColumns",c);q("sColumns",ma(b,"sName").join(","));q("iDisplayStart",l);q("iDisplayLength",p);var u={draw:a.iDraw,columns:[],order:[],start:l,length:p,search:{value:e.sSearch,regex:e.bRegex}};for(l=0;l<c;l++){var D=b[l];var F=k[l];p="function"==typeof D.mData?"function":D.mData;u.columns.push({data:p,name:D.sName,searchable:D.bSearchable,orderable:D.bSortable,
-search:{value:F.sSearch,regex:F.bRegex}});q("mDataProp_"+l,p);d.bFilter&&(q("sSearch_"+l,F.sSearch),q("bRegex_"+l,F.bRegex),q("bSearchable_"+l,D.bSearchable));d.bSort&&q("bSortable_"+l,D.bSortable)}d.bFilter&&(q("sSearch",e.sSearch),q("bRegex",e.bRegex));d.bSort&&(g.each(h,function(J,I){u.order.push({column:I.col,dir:I.dir});q("iSortCol_"+J,I.col);q("sSortDir_"+J,I.dir)}),q("iSortingCols",h.length));b=E.ext.legacy.ajax;return null===b?a.sAjaxSource?f:u:b?f:u}function Ub(a,b){var c=function(f,h){return b[f]!==
-z?b[f]:b[h]},d=Na(a,b),e=c("sEcho","draw"),k=c("iTotalRecords","recordsTotal");c=c("iTotalDisplayRecords","recordsFiltered");if(e!==z){if(1*e<a.iDraw)return;a.iDraw=1*e}d||=[];Ca(a);a._iRecordsTotal=parseInt(k,10);a._iRecordsDisplay=parseInt(c,10);e=0;for(k=d.length;e<k;e++)L(a,d[e]);a.aiDisplay=a.aiDisplayMaster.slice();Ba(a,!0);a._bInitComplete||ab(a,b);na(a,!1)}function Na(a,b,c){a=g.isPlainObject(a.ajax)&&a.ajax.dataSrc!==z?a.ajax.dataSrc:a.sAjaxDataProp;if(!c)return"data"===a?b.aaData||b[a]:
-""!==a?Ea(a)(b):b;Aa(a)(b,c)}function Ob(a){var b=a.oClasses,c=a.sTableId,d=a.oLanguage,e=a.oPreviousSearch,k=a.aanFeatures,f='<input type="search" class="'+b.sFilterInput+'"/>',h=d.sSearch;h=h.match(/_INPUT_/)?h.replace("_INPUT_",f):h+f;b=g("<div/>",{id:k.f?null:c+"_filter","class":b.sFilter}).append(g("<label/>").append(h));var l=function(q){var u=this.value?this.value:"";e.return&&"Enter"!==q.key||u==e.sSearch||(Ma(a,{sSearch:u,bRegex:e.bRegex,bSmart:e.bSmart,bCaseInsensitive:e.bCaseInsensitive,
-"return":e.return}),a._iDisplayStart=0,Ba(a))};k=null!==a.searchDelay?a.searchDelay:"ssp"===ja(a)?400:0;var p=g("input",b).val(e.sSearch).attr("placeholder",d.sSearchPlaceholder).on("keyup.DT search.DT input.DT paste.DT cut.DT",k?sb(l,k):l).on("mouseup",function(q){setTimeout(function(){l.call(p[0],q)},10)}).on("keypress.DT",function(q){if(13==q.keyCode)return!1}).attr("aria-controls",c);g(a.nTable).on("search.dt.DT",function(q,u){if(a===u)try{p[0]!==X.activeElement&&p.val(e.sSearch)}catch(D){}});
-return b[0]}function Ma(a,b,c){var d=a.oPreviousSearch,e=a.aoPreSearchCols,k=function(h){d.sSearch=h.sSearch;d.bRegex=h.bRegex;d.bSmart=h.bSmart;d.bCaseInsensitive=h.bCaseInsensitive;d.return=h.return},f=function(h){return h.bEscapeRegex!==z?!h.bEscapeRegex:h.bRegex};G(a);if("ssp"!=ja(a)){Vb(a,b.sSearch,c,f(b),b.bSmart,b.bCaseInsensitive,b.return);k(b);for(b=0;b<e.length;b++)Wb(a,e[b].sSearch,b,f(e[b]),e[b].bSmart,e[b].bCaseInsensitive);Xb(a)}else k(b);a.bFiltered=!0;T(a,null,"search",[a])}function Xb(a){for(var b=
-E.ext.search,c=a.aiDisplay,d,e,k=0,f=b.length;k<f;k++){for(var h=[],l=0,p=c.length;l<p;l++)e=c[l],d=a.aoData[e],b[k](a,d._aFilterData,e,d._aData,l)&&h.push(e);c.length=0;g.merge(c,h)}}function Wb(a,b,c,d,e,k){if(""!==b){var f=[],h=a.aiDisplay;d=tb(b,d,e,k);for(e=0;e<h.length;e++)b=a.aoData[h[e]]._aFilterData[c],d.test(b)&&f.push(h[e]);a.aiDisplay=f}}function Vb(a,b,c,d,e,k){e=tb(b,d,e,k);var f=a.oPreviousSearch.sSearch,h=a.aiDisplayMaster;k=[];0!==E.ext.search.length&&(c=!0);var l=Yb(a);if(0>=b.length)a.aiDisplay=
-h.slice();else{if(l||c||d||f.length>b.length||0!==b.indexOf(f)||a.bSorted)a.aiDisplay=h.slice();b=a.aiDisplay;for(c=0;c<b.length;c++)e.test(a.aoData[b[c]]._sFilterRow)&&k.push(b[c]);a.aiDisplay=k}}function tb(a,b,c,d){a=b?a:ub(a);c&&(a="^(?=.*?"+g.map(a.match(/"[^"]+"|[^ ]+/g)||[""],function(e){if('"'===e.charAt(0)){var k=e.match(/^"(.*)"$/);e=k?k[1]:e}return e.replace('"',"")}).join(")(?=.*?")+").*$");return new RegExp(a,d?"i":"")}function Yb(a){var b=a.aoColumns,c,d;var e=!1;var k=0;for(c=a.aoData.length;k<
-c;k++){var f=a.aoData[k];if(!f._aFilterData){var h=[];e=0;for(d=b.length;e<d;e++){var l=b[e];l.bSearchable?(l=O(a,k,e,"filter"),null===l&&(l=""),"string"!==typeof l&&l.toString&&(l=l.toString())):l="";l.indexOf&&-1!==l.indexOf("&")&&(bb.innerHTML=l,l=Bc?bb.textContent:bb.innerText);l.replace&&(l=l.replace(/[\r\n\u2028]/g,""));h.push(l)}f._aFilterData=h;f._sFilterRow=h.join("  ");e=!0}}return e}function Zb(a){return{search:a.sSearch,smart:a.bSmart,regex:a.bRegex,caseInsensitive:a.bCaseInsensitive}}
-function $b(a){return{sSearch:a.search,bSmart:a.smart,bRegex:a.regex,bCaseInsensitive:a.caseInsensitive}}function Rb(a){var b=a.sTableId,c=a.aanFeatures.i,d=g("<div/>",{"class":a.oClasses.sInfo,id:c?null:b+"_info"});c||(a.aoDrawCallback.push({fn:ac,sName:"information"}),d.attr("role","status").attr("aria-live","polite"),g(a.nTable).attr("aria-describedby",b+"_info"));return d[0]}function ac(a){var b=a.aanFeatures.i;if(0!==b.length){var c=a.oLanguage,d=a._iDisplayStart+1,e=a.fnDisplayEnd(),k=a.fnRecordsTotal(),
-f=a.fnRecordsDisplay(),h=f?c.sInfo:c.sInfoEmpty;f!==k&&(h+=" "+c.sInfoFiltered);h+=c.sInfoPostFix;h=bc(a,h);c=c.fnInfoCallback;null!==c&&(h=c.call(a.oInstance,a,d,e,k,f,h));g(b).html(h)}}function bc(a,b){var c=a.fnFormatNumber,d=a._iDisplayStart+1,e=a._iDisplayLength,k=a.fnRecordsDisplay(),f=-1===e;return b.replace(/_START_/g,c.call(a,d)).replace(/_END_/g,c.call(a,a.fnDisplayEnd())).replace(/_MAX_/g,c.call(a,a.fnRecordsTotal())).replace(/_TOTAL_/g,c.call(a,k)).replace(/_PAGE_/g,c.call(a,f?1:Math.ceil(d/
-e))).replace(/_PAGES_/g,c.call(a,f?1:Math.ceil(k/e)))}function Oa(a){var b=a.iInitDisplayStart,c=a.aoColumns;var d=a.oFeatures;var e=a.bDeferLoading;if(a.bInitialised){Mb(a);Jb(a);La(a,a.aoHeader);La(a,a.aoFooter);na(a,!0);d.bAutoWidth&&mb(a);var k=0;for(d=c.length;k<d;k++){var f=c[k];f.sWidth&&(f.nTh.style.width=aa(f.sWidth))}T(a,null,"preInit",[a]);Da(a);c=ja(a);if("ssp"!=c||e)"ajax"==c?$a(a,[],function(h){var l=Na(a,h);for(k=0;k<l.length;k++)L(a,l[k]);a.iInitDisplayStart=b;Da(a);na(a,!1);ab(a,
-h)},a):(na(a,!1),ab(a))}else setTimeout(function(){Oa(a)},200)}function ab(a,b){a._bInitComplete=!0;(b||a.oInit.aaData)&&x(a);T(a,null,"plugin-init",[a,b]);T(a,"aoInitComplete","init",[a,b])}function vb(a,b){b=parseInt(b,10);a._iDisplayLength=b;wb(a);T(a,null,"length",[a,b])}function Nb(a){var b=a.oClasses,c=a.sTableId,d=a.aLengthMenu,e=Array.isArray(d[0]),k=e?d[0]:d;d=e?d[1]:d;e=g("<select/>",{name:c+"_length","aria-controls":c,"class":b.sLengthSelect});for(var f=0,h=k.length;f<h;f++)e[0][f]=new Option("number"===
-typeof d[f]?a.fnFormatNumber(d[f]):d[f],k[f]);var l=g("<div><label/></div>").addClass(b.sLength);a.aanFeatures.l||(l[0].id=c+"_length");l.children().append(a.oLanguage.sLengthMenu.replace("_MENU_",e[0].outerHTML));g("select",l).val(a._iDisplayLength).on("change.DT",function(p){vb(a,g(this).val());Ba(a)});g(a.nTable).on("length.dt.DT",function(p,q,u){a===q&&g("select",l).val(u)});return l[0]}function Sb(a){var b=a.sPaginationType,c=E.ext.pager[b],d="function"===typeof c,e=function(f){Ba(f)};b=g("<div/>").addClass(a.oClasses.sPaging+
-b)[0];var k=a.aanFeatures;d||c.fnInit(a,b,e);k.p||(b.id=a.sTableId+"_paginate",a.aoDrawCallback.push({fn:function(f){if(d){var h=f._iDisplayStart,l=f._iDisplayLength,p=f.fnRecordsDisplay(),q=-1===l;h=q?0:Math.ceil(h/l);l=q?1:Math.ceil(p/l);p=c(h,l);var u;q=0;for(u=k.p.length;q<u;q++)rb(f,"pageButton")(f,k.p[q],q,p,h,l)}else c.fnUpdate(f,e)},sName:"pagination"}));return b}function cb(a,b,c){var d=a._iDisplayStart,e=a._iDisplayLength,k=a.fnRecordsDisplay();0===k||-1===e?d=0:"number"===typeof b?(d=b*
-e,d>k&&(d=0)):"first"==b?d=0:"previous"==b?(d=0<=e?d-e:0,0>d&&(d=0)):"next"==b?d+e<k&&(d+=e):"last"==b?d=Math.floor((k-1)/e)*e:ya(a,0,"Unknown paging action: "+b,5);b=a._iDisplayStart!==d;a._iDisplayStart=d;b&&(T(a,null,"page",[a]),c&&Ba(a));return b}function Pb(a){return g("<div/>",{id:a.aanFeatures.r?null:a.sTableId+"_processing","class":a.oClasses.sProcessing}).html(a.oLanguage.sProcessing).append("<div><div></div><div></div><div></div><div></div></div>").insertBefore(a.nTable)[0]}function na(a,
-b){a.oFeatures.bProcessing&&g(a.aanFeatures.r).css("display",b?"block":"none");T(a,null,"processing",[a,b])}function Qb(a){var b=g(a.nTable),c=a.oScroll;if(""===c.sX&&""===c.sY)return a.nTable;var d=c.sX,e=c.sY,k=a.oClasses,f=b.children("caption"),h=f.length?f[0]._captionSide:null,l=g(b[0].cloneNode(!1)),p=g(b[0].cloneNode(!1)),q=b.children("tfoot");q.length||(q=null);l=g("<div/>",{"class":k.sScrollWrapper}).append(g("<div/>",{"class":k.sScrollHead}).css({overflow:"hidden",position:"relative",border:0,
-width:d?d?aa(d):null:"100%"}).append(g("<div/>",{"class":k.sScrollHeadInner}).css({"box-sizing":"content-box",width:c.sXInner||"100%"}).append(l.removeAttr("id").css("margin-left",0).append("top"===h?f:null).append(b.children("thead"))))).append(g("<div/>",{"class":k.sScrollBody}).css({position:"relative",overflow:"auto",width:d?aa(d):null}).append(b));q&&l.append(g("<div/>",{"class":k.sScrollFoot}).css({overflow:"hidden",border:0,width:d?d?aa(d):null:"100%"}).append(g("<div/>",{"class":k.sScrollFootInner}).append(p.removeAttr("id").css("margin-left",
-0).append("bottom"===h?f:null).append(b.children("tfoot")))));b=l.children();var u=b[0];k=b[1];var D=q?b[2]:null;if(d)g(k).on("scroll.DT",function(F){F=this.scrollLeft;u.scrollLeft=F;q&&(D.scrollLeft=F)});g(k).css("max-height",e);c.bCollapse||g(k).css("height",e);a.nScrollHead=u;a.nScrollBody=k;a.nScrollFoot=D;a.aoDrawCallback.push({fn:Wa,sName:"scrolling"});return l[0]}function Wa(a){var b=a.oScroll,c=b.sX,d=b.sXInner,e=b.sY;b=b.iBarWidth;var k=g(a.nScrollHead),f=k[0].style,h=k.children("div"),l=
-h[0].style,p=h.children("table");h=a.nScrollBody;var q=g(h),u=h.style,D=g(a.nScrollFoot).children("div"),F=D.children("table"),J=g(a.nTHead),I=g(a.nTable),C=I[0],R=C.style,U=a.nTFoot?g(a.nTFoot):null,va=a.oBrowser,ca=va.bScrollOversize;ma(a.aoColumns,"nTh");var ia=[],W=[],V=[],za=[],ta,Pa=function(S){S=S.style;S.paddingTop="0";S.paddingBottom="0";S.borderTopWidth="0";S.borderBottomWidth="0";S.height=0};var ra=h.scrollHeight>h.clientHeight;if(a.scrollBarVis!==ra&&a.scrollBarVis!==z)a.scrollBarVis=
-ra,x(a);else{a.scrollBarVis=ra;I.children("thead, tfoot").remove();if(U){ra=U.clone().prependTo(I);var wa=U.find("tr");var Qa=ra.find("tr");ra.find("[id]").removeAttr("id")}var db=J.clone().prependTo(I);J=J.find("tr");ra=db.find("tr");db.find("th, td").removeAttr("tabindex");db.find("[id]").removeAttr("id");c||(u.width="100%",k[0].style.width="100%");g.each(Za(a,db),function(S,oa){ta=A(a,S);oa.style.width=a.aoColumns[ta].sWidth});U&&xa(function(S){S.style.width=""},Qa);k=I.outerWidth();""===c?(R.width=
-"100%",ca&&(I.find("tbody").height()>h.offsetHeight||"scroll"==q.css("overflow-y"))&&(R.width=aa(I.outerWidth()-b)),k=I.outerWidth()):""!==d&&(R.width=aa(d),k=I.outerWidth());xa(Pa,ra);xa(function(S){var oa=M.getComputedStyle?M.getComputedStyle(S).width:aa(g(S).width());V.push(S.innerHTML);ia.push(oa)},ra);xa(function(S,oa){S.style.width=ia[oa]},J);g(ra).css("height",0);U&&(xa(Pa,Qa),xa(function(S){za.push(S.innerHTML);W.push(aa(g(S).css("width")))},Qa),xa(function(S,oa){S.style.width=W[oa]},wa),
-g(Qa).height(0));xa(function(S,oa){S.innerHTML='<div class="dataTables_sizing">'+V[oa]+"</div>";S.childNodes[0].style.height="0";S.childNodes[0].style.overflow="hidden";S.style.width=ia[oa]},ra);U&&xa(function(S,oa){S.innerHTML='<div class="dataTables_sizing">'+za[oa]+"</div>";S.childNodes[0].style.height="0";S.childNodes[0].style.overflow="hidden";S.style.width=W[oa]},Qa);Math.round(I.outerWidth())<Math.round(k)?(wa=h.scrollHeight>h.offsetHeight||"scroll"==q.css("overflow-y")?k+b:k,ca&&(h.scrollHeight>
-h.offsetHeight||"scroll"==q.css("overflow-y"))&&(R.width=aa(wa-b)),""!==c&&""===d||ya(a,1,"Possible column misalignment",6)):wa="100%";u.width=aa(wa);f.width=aa(wa);U&&(a.nScrollFoot.style.width=aa(wa));!e&&ca&&(u.height=aa(C.offsetHeight+b));c=I.outerWidth();p[0].style.width=aa(c);l.width=aa(c);d=I.height()>h.clientHeight||"scroll"==q.css("overflow-y");e="padding"+(va.bScrollbarLeft?"Left":"Right");l[e]=d?b+"px":"0px";U&&(F[0].style.width=aa(c),D[0].style.width=aa(c),D[0].style[e]=d?b+"px":"0px");
-I.children("colgroup").insertBefore(I.children("thead"));q.trigger("scroll");!a.bSorted&&!a.bFiltered||a._drawHold||(h.scrollTop=0)}}function xa(a,b,c){for(var d=0,e=0,k=b.length,f,h;e<k;){f=b[e].firstChild;for(h=c?c[e].firstChild:null;f;)1===f.nodeType&&(c?a(f,h,d):a(f,d),d++),f=f.nextSibling,h=c?h.nextSibling:null;e++}}function mb(a){var b=a.nTable,c=a.aoColumns,d=a.oScroll,e=d.sY,k=d.sX,f=d.sXInner,h=c.length,l=H(a,"bVisible"),p=g("th",a.nTHead),q=b.getAttribute("width"),u=b.parentNode,D=!1,F,
-J=a.oBrowser;d=J.bScrollOversize;(F=b.style.width)&&-1!==F.indexOf("%")&&(q=F);for(F=0;F<l.length;F++){var I=c[l[F]];null!==I.sWidth&&(I.sWidth=cc(I.sWidthOrig,u),D=!0)}if(d||!D&&!k&&!e&&h==y(a)&&h==p.length)for(F=0;F<h;F++)l=A(a,F),null!==l&&(c[l].sWidth=aa(p.eq(F).width()));else{h=g(b).clone().css("visibility","hidden").removeAttr("id");h.find("tbody tr").remove();var C=g("<tr/>").appendTo(h.find("tbody"));h.find("thead, tfoot").remove();h.append(g(a.nTHead).clone()).append(g(a.nTFoot).clone());
-h.find("tfoot th, tfoot td").css("width","");p=Za(a,h.find("thead")[0]);for(F=0;F<l.length;F++)I=c[l[F]],p[F].style.width=null!==I.sWidthOrig&&""!==I.sWidthOrig?aa(I.sWidthOrig):"",I.sWidthOrig&&k&&g(p[F]).append(g("<div/>").css({width:I.sWidthOrig,margin:0,padding:0,border:0,height:1}));if(a.aoData.length)for(F=0;F<l.length;F++)D=l[F],I=c[D],g(dc(a,D)).clone(!1).append(I.sContentPadding).appendTo(C);g("[name]",h).removeAttr("name");I=g("<div/>").css(k||e?{position:"absolute",top:0,left:0,height:1,
-right:0,overflow:"hidden"}:{}).append(h).appendTo(u);k&&f?h.width(f):k?(h.css("width","auto"),h.removeAttr("width"),h.width()<u.clientWidth&&q&&h.width(u.clientWidth)):e?h.width(u.clientWidth):q&&h.width(q);for(F=e=0;F<l.length;F++)u=g(p[F]),f=u.outerWidth()-u.width(),u=J.bBounding?Math.ceil(p[F].getBoundingClientRect().width):u.outerWidth(),e+=u,c[l[F]].sWidth=aa(u-f);b.style.width=aa(e);I.remove()}q&&(b.style.width=aa(q));!q&&!k||a._reszEvt||(b=function(){g(M).on("resize.DT-"+a.sInstance,sb(function(){x(a)}))},
-d?setTimeout(b,1E3):b(),a._reszEvt=!0)}function cc(a,b){if(!a)return 0;a=g("<div/>").css("width",aa(a)).appendTo(b||X.body);b=a[0].offsetWidth;a.remove();return b}function dc(a,b){var c=ec(a,b);if(0>c)return null;var d=a.aoData[c];return d.nTr?d.anCells[b]:g("<td/>").html(O(a,c,b,"display"))[0]}function ec(a,b){for(var c,d=-1,e=-1,k=0,f=a.aoData.length;k<f;k++)c=O(a,k,b,"display")+"",c=c.replace(Cc,""),c=c.replace(/&nbsp;/g," "),c.length>d&&(d=c.length,e=k);return e}function aa(a){return null===a?
-"0px":"number"==typeof a?0>a?"0px":a+"px":a.match(/\d$/)?a+"px":a}function Fa(a){var b=[],c=a.aoColumns;var d=a.aaSortingFixed;var e=g.isPlainObject(d);var k=[];var f=function(q){q.length&&!Array.isArray(q[0])?k.push(q):g.merge(k,q)};Array.isArray(d)&&f(d);e&&d.pre&&f(d.pre);f(a.aaSorting);e&&d.post&&f(d.post);for(a=0;a<k.length;a++){var h=k[a][0];f=c[h].aDataSort;d=0;for(e=f.length;d<e;d++){var l=f[d];var p=c[l].sType||"string";k[a]._idx===z&&(k[a]._idx=g.inArray(k[a][1],c[l].asSorting));b.push({src:h,
-col:l,dir:k[a][1],index:k[a]._idx,type:p,formatter:E.ext.type.order[p+"-pre"]})}}return b}function Lb(a){var b,c=[],d=E.ext.type.order,e=a.aoData,k=0,f=a.aiDisplayMaster;G(a);var h=Fa(a);var l=0;for(b=h.length;l<b;l++){var p=h[l];p.formatter&&k++;fc(a,p.col)}if("ssp"!=ja(a)&&0!==h.length){l=0;for(b=f.length;l<b;l++)c[f[l]]=l;k===h.length?f.sort(function(q,u){var D,F=h.length,J=e[q]._aSortData,I=e[u]._aSortData;for(D=0;D<F;D++){var C=h[D];var R=J[C.col];var U=I[C.col];R=R<U?-1:R>U?1:0;if(0!==R)return"asc"===
-C.dir?R:-R}R=c[q];U=c[u];return R<U?-1:R>U?1:0}):f.sort(function(q,u){var D,F=h.length,J=e[q]._aSortData,I=e[u]._aSortData;for(D=0;D<F;D++){var C=h[D];var R=J[C.col];var U=I[C.col];C=d[C.type+"-"+C.dir]||d["string-"+C.dir];R=C(R,U);if(0!==R)return R}R=c[q];U=c[u];return R<U?-1:R>U?1:0})}a.bSorted=!0}function gc(a){var b=a.aoColumns,c=Fa(a);a=a.oLanguage.oAria;for(var d=0,e=b.length;d<e;d++){var k=b[d];var f=k.asSorting;var h=k.ariaTitle||k.sTitle.replace(/<.*?>/g,"");var l=k.nTh;l.removeAttribute("aria-sort");
-k.bSortable&&(0<c.length&&c[0].col==d?(l.setAttribute("aria-sort","asc"==c[0].dir?"ascending":"descending"),k=f[c[0].index+1]||f[0]):k=f[0],h+="asc"===k?a.sSortAscending:a.sSortDescending);l.setAttribute("aria-label",h)}}function xb(a,b,c,d){var e=a.aaSorting,k=a.aoColumns[b].asSorting,f=function(h,l){var p=h._idx;p===z&&(p=g.inArray(h[1],k));return p+1<k.length?p+1:l?null:0};"number"===typeof e[0]&&(e=a.aaSorting=[e]);c&&a.oFeatures.bSortMulti?(c=g.inArray(b,ma(e,"0")),-1!==c?(b=f(e[c],!0),null===
-b&&1===e.length&&(b=0),null===b?e.splice(c,1):(e[c][1]=k[b],e[c]._idx=b)):(e.push([b,k[0],0]),e[e.length-1]._idx=0)):e.length&&e[0][0]==b?(b=f(e[0]),e.length=1,e[0][1]=k[b],e[0]._idx=b):(e.length=0,e.push([b,k[0]]),e[0]._idx=0);Da(a);"function"==typeof d&&d(a)}function qb(a,b,c,d){var e=a.aoColumns[c];yb(b,{},function(k){!1!==e.bSortable&&(a.oFeatures.bProcessing?(na(a,!0),setTimeout(function(){xb(a,c,k.shiftKey,d);"ssp"!==ja(a)&&na(a,!1)},0)):xb(a,c,k.shiftKey,d))})}function eb(a){var b=a.aLastSort,
-c=a.oClasses.sSortColumn,d=Fa(a),e=a.oFeatures,k;if(e.bSort&&e.bSortClasses){e=0;for(k=b.length;e<k;e++){var f=b[e].src;g(ma(a.aoData,"anCells",f)).removeClass(c+(2>e?e+1:3))}e=0;for(k=d.length;e<k;e++)f=d[e].src,g(ma(a.aoData,"anCells",f)).addClass(c+(2>e?e+1:3))}a.aLastSort=d}function fc(a,b){var c=a.aoColumns[b],d=E.ext.order[c.sSortDataType],e;d&&(e=d.call(a.oInstance,a,b,B(a,b)));for(var k,f=E.ext.type.order[c.sType+"-pre"],h=0,l=a.aoData.length;h<l;h++)if(c=a.aoData[h],c._aSortData||(c._aSortData=
-[]),!c._aSortData[b]||d)k=d?e[h]:O(a,h,b,"sort"),c._aSortData[b]=f?f(k):k}function Ra(a){if(!a._bLoadingState){var b={time:+new Date,start:a._iDisplayStart,length:a._iDisplayLength,order:g.extend(!0,[],a.aaSorting),search:Zb(a.oPreviousSearch),columns:g.map(a.aoColumns,function(c,d){return{visible:c.bVisible,search:Zb(a.aoPreSearchCols[d])}})};a.oSavedState=b;T(a,"aoStateSaveParams","stateSaveParams",[a,b]);a.oFeatures.bStateSave&&!a.bDestroying&&a.fnStateSaveCallback.call(a.oInstance,a,b)}}function hc(a,
-b,c){if(a.oFeatures.bStateSave)return b=a.fnStateLoadCallback.call(a.oInstance,a,function(d){zb(a,d,c)}),b!==z&&zb(a,b,c),!0;c()}function zb(a,b,c){var d,e=a.aoColumns;a._bLoadingState=!0;var k=a._bInitComplete?new E.Api(a):null;if(b&&b.time){var f=T(a,"aoStateLoadParams","stateLoadParams",[a,b]);if(-1!==g.inArray(!1,f))a._bLoadingState=!1;else if(f=a.iStateDuration,0<f&&b.time<+new Date-1E3*f)a._bLoadingState=!1;else if(b.columns&&e.length!==b.columns.length)a._bLoadingState=!1;else{a.oLoadedState=
-g.extend(!0,{},b);b.length!==z&&(k?k.page.len(b.length):a._iDisplayLength=b.length);b.start!==z&&(null===k?(a._iDisplayStart=b.start,a.iInitDisplayStart=b.start):cb(a,b.start/a._iDisplayLength));b.order!==z&&(a.aaSorting=[],g.each(b.order,function(l,p){a.aaSorting.push(p[0]>=e.length?[0,p[1]]:p)}));b.search!==z&&g.extend(a.oPreviousSearch,$b(b.search));if(b.columns){f=0;for(d=b.columns.length;f<d;f++){var h=b.columns[f];h.visible!==z&&(k?k.column(f).visible(h.visible,!1):e[f].bVisible=h.visible);
-h.search!==z&&g.extend(a.aoPreSearchCols[f],$b(h.search))}k&&k.columns.adjust()}a._bLoadingState=!1;T(a,"aoStateLoaded","stateLoaded",[a,b])}}else a._bLoadingState=!1;c()}function fb(a){var b=E.settings;a=g.inArray(a,ma(b,"nTable"));return-1!==a?b[a]:null}function ya(a,b,c,d){c="DataTables warning: "+(a?"table id="+a.sTableId+" - ":"")+c;d&&(c+=". For more information about this error, please see http://datatables.net/tn/"+d);if(b)M.console&&console.log&&console.log(c);else if(b=E.ext,b=b.sErrMode||
-b.errMode,a&&T(a,null,"error",[a,d,c]),"alert"==b)alert(c);else{if("throw"==b)throw Error(c);"function"==typeof b&&b(a,d,c)}}function sa(a,b,c,d){Array.isArray(c)?g.each(c,function(e,k){Array.isArray(k)?sa(a,b,k[0],k[1]):sa(a,b,k)}):(d===z&&(d=c),b[c]!==z&&(a[d]=b[c]))}function Ab(a,b,c){var d;for(d in b)if(b.hasOwnProperty(d)){var e=b[d];g.isPlainObject(e)?(g.isPlainObject(a[d])||(a[d]={}),g.extend(!0,a[d],e)):c&&"data"!==d&&"aaData"!==d&&Array.isArray(e)?a[d]=e.slice():a[d]=e}return a}function yb(a,
-b,c){g(a).on("click.DT",b,function(d){g(a).trigger("blur");c(d)}).on("keypress.DT",b,function(d){13===d.which&&(d.preventDefault(),c(d))}).on("selectstart.DT",function(){return!1})}function ka(a,b,c,d){c&&a[b].push({fn:c,sName:d})}function T(a,b,c,d){var e=[];b&&(e=g.map(a[b].slice().reverse(),function(k,f){return k.fn.apply(a.oInstance,d)}));null!==c&&(b=g.Event(c+".dt"),g(a.nTable).trigger(b,d),e.push(b.result));return e}function wb(a){var b=a._iDisplayStart,c=a.fnDisplayEnd(),d=a._iDisplayLength;
-b>=c&&(b=c-d);b-=b%d;if(-1===d||0>b)b=0;a._iDisplayStart=b}function rb(a,b){a=a.renderer;var c=E.ext.renderer[b];return g.isPlainObject(a)&&a[b]?c[a[b]]||c._:"string"===typeof a?c[a]||c._:c._}function ja(a){return a.oFeatures.bServerSide?"ssp":a.ajax||a.sAjaxSource?"ajax":"dom"}function Sa(a,b){var c=ic.numbers_length,d=Math.floor(c/2);b<=c?a=Ga(0,b):a<=d?(a=Ga(0,c-2),a.push("ellipsis"),a.push(b-1)):(a>=b-1-d?a=Ga(b-(c-2),b):(a=Ga(a-d+2,a+d-1),a.push("ellipsis"),a.push(b-1)),a.splice(0,0,"ellipsis"),
-a.splice(0,0,0));a.DT_el="span";return a}function lb(a){g.each({num:function(b){return gb(b,a)},"num-fmt":function(b){return gb(b,a,Bb)},"html-num":function(b){return gb(b,a,hb)},"html-num-fmt":function(b){return gb(b,a,hb,Bb)}},function(b,c){da.type.order[b+a+"-pre"]=c;b.match(/^html\-/)&&(da.type.search[b+a]=da.type.search.html)})}function jc(a,b,c,d,e){return M.moment?a[b](e):M.luxon?a[c](e):d?a[d](e):a}function ib(a,b,c){if(M.moment){var d=M.moment.utc(a,b,c,!0);if(!d.isValid())return null}else if(M.luxon){d=
-b?M.luxon.DateTime.fromFormat(a,b):M.luxon.DateTime.fromISO(a);if(!d.isValid)return null;d.setLocale(c)}else b?(kc||alert("DataTables warning: Formatted date without Moment.js or Luxon - https://datatables.net/tn/17"),kc=!0):d=new Date(a);return d}function Cb(a){return function(b,c,d,e){0===arguments.length?(d="en",b=c=null):1===arguments.length?(d="en",c=b,b=null):2===arguments.length&&(d=c,c=b,b=null);var k="datetime-"+c;E.ext.type.order[k]||(E.ext.type.detect.unshift(function(f){return f===k?k:
-!1}),E.ext.type.order[k+"-asc"]=function(f,h){f=f.valueOf();h=h.valueOf();return f===h?0:f<h?-1:1},E.ext.type.order[k+"-desc"]=function(f,h){f=f.valueOf();h=h.valueOf();return f===h?0:f>h?-1:1});return function(f,h){if(null===f||f===z)"--now"===e?(f=new Date,f=new Date(Date.UTC(f.getFullYear(),f.getMonth(),f.getDate(),f.getHours(),f.getMinutes(),f.getSeconds()))):f="";if("type"===h)return k;if(""===f)return"sort"!==h?"":ib("0000-01-01 00:00:00",null,d);if(null!==c&&b===c&&"sort"!==h&&"type"!==h&&
-!(f instanceof Date))return f;var l=ib(f,b,d);if(null===l)return f;if("sort"===h)return l;f=null===c?jc(l,"toDate","toJSDate","")[a]():jc(l,"format","toFormat","toISOString",c);return"display"===h?jb(f):f}}}function lc(a){return function(){var b=[fb(this[E.ext.iApiIndex])].concat(Array.prototype.slice.call(arguments));return E.ext.internal[a].apply(this,b)}}var E=function(a,b){if(this instanceof E)return g(a).DataTable(b);b=a;this.$=function(f,h){return this.api(!0).$(f,h)};this._=function(f,h){return this.api(!0).rows(f,
-h).data()};this.api=function(f){return f?new Q(fb(this[da.iApiIndex])):new Q(this)};this.fnAddData=function(f,h){var l=this.api(!0);f=Array.isArray(f)&&(Array.isArray(f[0])||g.isPlainObject(f[0]))?l.rows.add(f):l.row.add(f);(h===z||h)&&l.draw();return f.flatten().toArray()};this.fnAdjustColumnSizing=function(f){var h=this.api(!0).columns.adjust(),l=h.settings()[0],p=l.oScroll;f===z||f?h.draw(!1):(""!==p.sX||""!==p.sY)&&Wa(l)};this.fnClearTable=function(f){var h=this.api(!0).clear();(f===z||f)&&h.draw()};
-this.fnClose=function(f){this.api(!0).row(f).child.hide()};this.fnDeleteRow=function(f,h,l){var p=this.api(!0);f=p.rows(f);var q=f.settings()[0],u=q.aoData[f[0][0]];f.remove();h&&h.call(this,q,u);(l===z||l)&&p.draw();return u};this.fnDestroy=function(f){this.api(!0).destroy(f)};this.fnDraw=function(f){this.api(!0).draw(f)};this.fnFilter=function(f,h,l,p,q,u){q=this.api(!0);null===h||h===z?q.search(f,l,p,u):q.column(h).search(f,l,p,u);q.draw()};this.fnGetData=function(f,h){var l=this.api(!0);if(f!==
-z){var p=f.nodeName?f.nodeName.toLowerCase():"";return h!==z||"td"==p||"th"==p?l.cell(f,h).data():l.row(f).data()||null}return l.data().toArray()};this.fnGetNodes=function(f){var h=this.api(!0);return f!==z?h.row(f).node():h.rows().nodes().flatten().toArray()};this.fnGetPosition=function(f){var h=this.api(!0),l=f.nodeName.toUpperCase();return"TR"==l?h.row(f).index():"TD"==l||"TH"==l?(f=h.cell(f).index(),[f.row,f.columnVisible,f.column]):null};this.fnIsOpen=function(f){return this.api(!0).row(f).child.isShown()};
-this.fnOpen=function(f,h,l){return this.api(!0).row(f).child(h,l).show().child()[0]};this.fnPageChange=function(f,h){f=this.api(!0).page(f);(h===z||h)&&f.draw(!1)};this.fnSetColumnVis=function(f,h,l){f=this.api(!0).column(f).visible(h);(l===z||l)&&f.columns.adjust().draw()};this.fnSettings=function(){return fb(this[da.iApiIndex])};this.fnSort=function(f){this.api(!0).order(f).draw()};this.fnSortListener=function(f,h,l){this.api(!0).order.listener(f,h,l)};this.fnUpdate=function(f,h,l,p,q){var u=this.api(!0);
-l===z||null===l?u.row(h).data(f):u.cell(h,l).data(f);(q===z||q)&&u.columns.adjust();(p===z||p)&&u.draw();return 0};this.fnVersionCheck=da.fnVersionCheck;var c=this,d=b===z,e=this.length;d&&(b={});this.oApi=this.internal=da.internal;for(var k in E.ext.internal)k&&(this[k]=lc(k));this.each(function(){var f={},h=1<e?Ab(f,b,!0):b,l=0,p;f=this.getAttribute("id");var q=!1,u=E.defaults,D=g(this);if("table"!=this.nodeName.toLowerCase())ya(null,0,"Non-table node initialisation ("+this.nodeName+")",2);else{r(u);
-w(u.column);ea(u,u,!0);ea(u.column,u.column,!0);ea(u,g.extend(h,D.data()),!0);var F=E.settings;l=0;for(p=F.length;l<p;l++){var J=F[l];if(J.nTable==this||J.nTHead&&J.nTHead.parentNode==this||J.nTFoot&&J.nTFoot.parentNode==this){var I=h.bRetrieve!==z?h.bRetrieve:u.bRetrieve;if(d||I)return J.oInstance;if(h.bDestroy!==z?h.bDestroy:u.bDestroy){J.oInstance.fnDestroy();break}else{ya(J,0,"Cannot reinitialise DataTable",3);return}}if(J.sTableId==this.id){F.splice(l,1);break}}if(null===f||""===f)this.id=f=
-"DataTables_Table_"+E.ext._unique++;var C=g.extend(!0,{},E.models.oSettings,{sDestroyWidth:D[0].style.width,sInstance:f,sTableId:f});C.nTable=this;C.oApi=c.internal;C.oInit=h;F.push(C);C.oInstance=1===c.length?c:D.dataTable();r(h);ba(h.oLanguage);h.aLengthMenu&&!h.iDisplayLength&&(h.iDisplayLength=Array.isArray(h.aLengthMenu[0])?h.aLengthMenu[0][0]:h.aLengthMenu[0]);h=Ab(g.extend(!0,{},u),h);sa(C.oFeatures,h,"bPaginate bLengthChange bFilter bSort bSortMulti bInfo bProcessing bAutoWidth bSortClasses bServerSide bDeferRender".split(" "));
-sa(C,h,["asStripeClasses","ajax","fnServerData","fnFormatNumber","sServerMethod","aaSorting","aaSortingFixed","aLengthMenu","sPaginationType","sAjaxSource","sAjaxDataProp","iStateDuration","sDom","bSortCellsTop","iTabIndex","fnStateLoadCallback","fnStateSaveCallback","renderer","searchDelay","rowId",["iCookieDuration","iStateDuration"],["oSearch","oPreviousSearch"],["aoSearchCols","aoPreSearchCols"],["iDisplayLength","_iDisplayLength"]]);sa(C.oScroll,h,[["sScrollX","sX"],["sScrollXInner","sXInner"],
-["sScrollY","sY"],["bScrollCollapse","bCollapse"]]);sa(C.oLanguage,h,"fnInfoCallback");ka(C,"aoDrawCallback",h.fnDrawCallback,"user");ka(C,"aoServerParams",h.fnServerParams,"user");ka(C,"aoStateSaveParams",h.fnStateSaveParams,"user");ka(C,"aoStateLoadParams",h.fnStateLoadParams,"user");ka(C,"aoStateLoaded",h.fnStateLoaded,"user");ka(C,"aoRowCallback",h.fnRowCallback,"user");ka(C,"aoRowCreatedCallback",h.fnCreatedRow,"user");ka(C,"aoHeaderCallback",h.fnHeaderCallback,"user");ka(C,"aoFooterCallback",
-h.fnFooterCallback,"user");ka(C,"aoInitComplete",h.fnInitComplete,"user");ka(C,"aoPreDrawCallback",h.fnPreDrawCallback,"user");C.rowIdFn=Ea(h.rowId);m(C);var R=C.oClasses;g.extend(R,E.ext.classes,h.oClasses);D.addClass(R.sTable);C.iInitDisplayStart===z&&(C.iInitDisplayStart=h.iDisplayStart,C._iDisplayStart=h.iDisplayStart);null!==h.iDeferLoading&&(C.bDeferLoading=!0,f=Array.isArray(h.iDeferLoading),C._iRecordsDisplay=f?h.iDeferLoading[0]:h.iDeferLoading,C._iRecordsTotal=f?h.iDeferLoading[1]:h.iDeferLoading);
-var U=C.oLanguage;g.extend(!0,U,h.oLanguage);U.sUrl?(g.ajax({dataType:"json",url:U.sUrl,success:function(W){ea(u.oLanguage,W);ba(W);g.extend(!0,U,W,C.oInit.oLanguage);T(C,null,"i18n",[C]);Oa(C)},error:function(){Oa(C)}}),q=!0):T(C,null,"i18n",[C]);null===h.asStripeClasses&&(C.asStripeClasses=[R.sStripeOdd,R.sStripeEven]);f=C.asStripeClasses;var va=D.children("tbody").find("tr").eq(0);-1!==g.inArray(!0,g.map(f,function(W,V){return va.hasClass(W)}))&&(g("tbody tr",this).removeClass(f.join(" ")),C.asDestroyStripes=
-f.slice());f=[];F=this.getElementsByTagName("thead");0!==F.length&&(Ka(C.aoHeader,F[0]),f=Za(C));if(null===h.aoColumns)for(F=[],l=0,p=f.length;l<p;l++)F.push(null);else F=h.aoColumns;l=0;for(p=F.length;l<p;l++)t(C,f?f[l]:null);N(C,h.aoColumnDefs,F,function(W,V){v(C,W,V)});if(va.length){var ca=function(W,V){return null!==W.getAttribute("data-"+V)?V:null};g(va[0]).children("th, td").each(function(W,V){var za=C.aoColumns[W];if(za.mData===W){var ta=ca(V,"sort")||ca(V,"order");V=ca(V,"filter")||ca(V,"search");
-if(null!==ta||null!==V)za.mData={_:W+".display",sort:null!==ta?W+".@data-"+ta:z,type:null!==ta?W+".@data-"+ta:z,filter:null!==V?W+".@data-"+V:z},v(C,W)}})}var ia=C.oFeatures;f=function(){if(h.aaSorting===z){var W=C.aaSorting;l=0;for(p=W.length;l<p;l++)W[l][1]=C.aoColumns[l].asSorting[0]}eb(C);ia.bSort&&ka(C,"aoDrawCallback",function(){if(C.bSorted){var ta=Fa(C),Pa={};g.each(ta,function(ra,wa){Pa[wa.src]=wa.dir});T(C,null,"order",[C,ta,Pa]);gc(C)}});ka(C,"aoDrawCallback",function(){(C.bSorted||"ssp"===
-ja(C)||ia.bDeferRender)&&eb(C)},"sc");W=D.children("caption").each(function(){this._captionSide=g(this).css("caption-side")});var V=D.children("thead");0===V.length&&(V=g("<thead/>").appendTo(D));C.nTHead=V[0];var za=D.children("tbody");0===za.length&&(za=g("<tbody/>").insertAfter(V));C.nTBody=za[0];V=D.children("tfoot");0===V.length&&0<W.length&&(""!==C.oScroll.sX||""!==C.oScroll.sY)&&(V=g("<tfoot/>").appendTo(D));0===V.length||0===V.children().length?D.addClass(R.sNoFooter):0<V.length&&(C.nTFoot=
-V[0],Ka(C.aoFooter,C.nTFoot));if(h.aaData)for(l=0;l<h.aaData.length;l++)L(C,h.aaData[l]);else(C.bDeferLoading||"dom"==ja(C))&&P(C,g(C.nTBody).children("tr"));C.aiDisplay=C.aiDisplayMaster.slice();C.bInitialised=!0;!1===q&&Oa(C)};ka(C,"aoDrawCallback",Ra,"state_save");h.bStateSave?(ia.bStateSave=!0,hc(C,h,f)):f()}});c=null;return this},da,K,Y,Db={},mc=/[\r\n\u2028]/g,hb=/<.*?>/g,Dc=/^\d{2,4}[\.\/\-]\d{1,2}[\.\/\-]\d{1,2}([T ]{1}\d{1,2}[:\.]\d{2}([\.:]\d{2})?)?$/,Ec=RegExp("(\\/|\\.|\\*|\\+|\\?|\\||\\(|\\)|\\[|\\]|\\{|\\}|\\\\|\\$|\\^|\\-)",
-"g"),Bb=/['\u00A0,$\u00a3\u20ac\u00a5%\u2009\u202F\u20BD\u20a9\u20BArfk\u0243\u039e]/gi,ua=function(a){return a&&!0!==a&&"-"!==a?!1:!0},nc=function(a){var b=parseInt(a,10);return!isNaN(b)&&isFinite(a)?b:null},oc=function(a,b){Db[b]||(Db[b]=new RegExp(ub(b),"g"));return"string"===typeof a&&"."!==b?a.replace(/\./g,"").replace(Db[b],"."):a},Eb=function(a,b,c){var d="string"===typeof a;if(ua(a))return!0;b&&d&&(a=oc(a,b));c&&d&&(a=a.replace(Bb,""));return!isNaN(parseFloat(a))&&isFinite(a)},pc=function(a,
-b,c){return ua(a)?!0:ua(a)||"string"===typeof a?Eb(a.replace(hb,""),b,c)?!0:null:null},ma=function(a,b,c){var d=[],e=0,k=a.length;if(c!==z)for(;e<k;e++)a[e]&&a[e][b]&&d.push(a[e][b][c]);else for(;e<k;e++)a[e]&&d.push(a[e][b]);return d},Ta=function(a,b,c,d){var e=[],k=0,f=b.length;if(d!==z)for(;k<f;k++)a[b[k]][c]&&e.push(a[b[k]][c][d]);else for(;k<f;k++)e.push(a[b[k]][c]);return e},Ga=function(a,b){var c=[];if(b===z){b=0;var d=a}else d=b,b=a;for(a=b;a<d;a++)c.push(a);return c},qc=function(a){for(var b=
-[],c=0,d=a.length;c<d;c++)a[c]&&b.push(a[c]);return b},Ya=function(a){a:{if(!(2>a.length)){var b=a.slice().sort();for(var c=b[0],d=1,e=b.length;d<e;d++){if(b[d]===c){b=!1;break a}c=b[d]}}b=!0}if(b)return a.slice();b=[];e=a.length;var k,f=0;d=0;a:for(;d<e;d++){c=a[d];for(k=0;k<f;k++)if(b[k]===c)continue a;b.push(c);f++}return b},rc=function(a,b){if(Array.isArray(b))for(var c=0;c<b.length;c++)rc(a,b[c]);else a.push(b);return a},sc=function(a,b){b===z&&(b=0);return-1!==this.indexOf(a,b)};Array.isArray||
-(Array.isArray=function(a){return"[object Array]"===Object.prototype.toString.call(a)});Array.prototype.includes||(Array.prototype.includes=sc);String.prototype.trim||(String.prototype.trim=function(){return this.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"")});String.prototype.includes||(String.prototype.includes=sc);E.util={throttle:function(a,b){var c=b!==z?b:200,d,e;return function(){var k=this,f=+new Date,h=arguments;d&&f<d+c?(clearTimeout(e),e=setTimeout(function(){d=z;a.apply(k,h)},c)):(d=
-f,a.apply(k,h))}},escapeRegex:function(a){return a.replace(Ec,"\\$1")},set:function(a){if(g.isPlainObject(a))return E.util.set(a._);if(null===a)return function(){};if("function"===typeof a)return function(c,d,e){a(c,"set",d,e)};if("string"!==typeof a||-1===a.indexOf(".")&&-1===a.indexOf("[")&&-1===a.indexOf("("))return function(c,d){c[a]=d};var b=function(c,d,e){e=fa(e);var k=e[e.length-1];for(var f,h,l=0,p=e.length-1;l<p;l++){if("__proto__"===e[l]||"constructor"===e[l])throw Error("Cannot set prototype values");
-f=e[l].match(Ua);h=e[l].match(Ha);if(f){e[l]=e[l].replace(Ua,"");c[e[l]]=[];k=e.slice();k.splice(0,l+1);f=k.join(".");if(Array.isArray(d))for(h=0,p=d.length;h<p;h++)k={},b(k,d[h],f),c[e[l]].push(k);else c[e[l]]=d;return}h&&(e[l]=e[l].replace(Ha,""),c=c[e[l]](d));if(null===c[e[l]]||c[e[l]]===z)c[e[l]]={};c=c[e[l]]}if(k.match(Ha))c[k.replace(Ha,"")](d);else c[k.replace(Ua,"")]=d};return function(c,d){return b(c,d,a)}},get:function(a){if(g.isPlainObject(a)){var b={};g.each(a,function(d,e){e&&(b[d]=E.util.get(e))});
-return function(d,e,k,f){var h=b[e]||b._;return h!==z?h(d,e,k,f):d}}if(null===a)return function(d){return d};if("function"===typeof a)return function(d,e,k,f){return a(d,e,k,f)};if("string"!==typeof a||-1===a.indexOf(".")&&-1===a.indexOf("[")&&-1===a.indexOf("("))return function(d,e){return d[a]};var c=function(d,e,k){if(""!==k){var f=fa(k);for(var h=0,l=f.length;h<l;h++){k=f[h].match(Ua);var p=f[h].match(Ha);if(k){f[h]=f[h].replace(Ua,"");""!==f[h]&&(d=d[f[h]]);p=[];f.splice(0,h+1);f=f.join(".");
-if(Array.isArray(d))for(h=0,l=d.length;h<l;h++)p.push(c(d[h],e,f));d=k[0].substring(1,k[0].length-1);d=""===d?p:p.join(d);break}else if(p){f[h]=f[h].replace(Ha,"");d=d[f[h]]();continue}if(null===d||d[f[h]]===z)return z;d=d[f[h]]}}return d};return function(d,e){return c(d,e,a)}}};var la=function(a,b,c){a[b]!==z&&(a[c]=a[b])},Ua=/\[.*?\]$/,Ha=/\(\)$/,Ea=E.util.get,Aa=E.util.set,ub=E.util.escapeRegex,bb=g("<div>")[0],Bc=bb.textContent!==z,Cc=/<.*?>/g,sb=E.util.throttle,tc=[],ha=Array.prototype,Fc=function(a){var b,
-c=E.settings,d=g.map(c,function(k,f){return k.nTable});if(a){if(a.nTable&&a.oApi)return[a];if(a.nodeName&&"table"===a.nodeName.toLowerCase()){var e=g.inArray(a,d);return-1!==e?[c[e]]:null}if(a&&"function"===typeof a.settings)return a.settings().toArray();"string"===typeof a?b=g(a):a instanceof g&&(b=a)}else return[];if(b)return b.map(function(k){e=g.inArray(this,d);return-1!==e?c[e]:null}).toArray()};var Q=function(a,b){if(!(this instanceof Q))return new Q(a,b);var c=[],d=function(f){(f=Fc(f))&&c.push.apply(c,
-f)};if(Array.isArray(a))for(var e=0,k=a.length;e<k;e++)d(a[e]);else d(a);this.context=Ya(c);b&&g.merge(this,b);this.selector={rows:null,cols:null,opts:null};Q.extend(this,this,tc)};E.Api=Q;g.extend(Q.prototype,{any:function(){return 0!==this.count()},concat:ha.concat,context:[],count:function(){return this.flatten().length},each:function(a){for(var b=0,c=this.length;b<c;b++)a.call(this,this[b],b,this);return this},eq:function(a){var b=this.context;return b.length>a?new Q(b[a],this[a]):null},filter:function(a){var b=
-[];if(ha.filter)b=ha.filter.call(this,a,this);else for(var c=0,d=this.length;c<d;c++)a.call(this,this[c],c,this)&&b.push(this[c]);return new Q(this.context,b)},flatten:function(){var a=[];return new Q(this.context,a.concat.apply(a,this.toArray()))},join:ha.join,indexOf:ha.indexOf||function(a,b){b=b||0;for(var c=this.length;b<c;b++)if(this[b]===a)return b;return-1},iterator:function(a,b,c,d){var e=[],k,f,h=this.context,l,p=this.selector;"string"===typeof a&&(d=c,c=b,b=a,a=!1);var q=0;for(k=h.length;q<
-k;q++){var u=new Q(h[q]);if("table"===b){var D=c.call(u,h[q],q);D!==z&&e.push(D)}else if("columns"===b||"rows"===b)D=c.call(u,h[q],this[q],q),D!==z&&e.push(D);else if("column"===b||"column-rows"===b||"row"===b||"cell"===b){var F=this[q];"column-rows"===b&&(l=kb(h[q],p.opts));var J=0;for(f=F.length;J<f;J++)D=F[J],D="cell"===b?c.call(u,h[q],D.row,D.column,q,J):c.call(u,h[q],D,q,J,l),D!==z&&e.push(D)}}return e.length||d?(a=new Q(h,a?e.concat.apply([],e):e),b=a.selector,b.rows=p.rows,b.cols=p.cols,b.opts=
-p.opts,a):this},lastIndexOf:ha.lastIndexOf||function(a,b){return this.indexOf.apply(this.toArray.reverse(),arguments)},length:0,map:function(a){var b=[];if(ha.map)b=ha.map.call(this,a,this);else for(var c=0,d=this.length;c<d;c++)b.push(a.call(this,this[c],c));return new Q(this.context,b)},pluck:function(a){let b=E.util.get(a);return this.map(function(c){return b(c)})},pop:ha.pop,push:ha.push,reduce:ha.reduce||function(a,b){return n(this,a,b,0,this.length,1)},reduceRight:ha.reduceRight||function(a,
-b){return n(this,a,b,this.length-1,-1,-1)},reverse:ha.reverse,selector:null,shift:ha.shift,slice:function(){return new Q(this.context,this)},sort:ha.sort,splice:ha.splice,toArray:function(){return ha.slice.call(this)},to$:function(){return g(this)},toJQuery:function(){return g(this)},unique:function(){return new Q(this.context,Ya(this))},unshift:ha.unshift});Q.extend=function(a,b,c){if(c.length&&b&&(b instanceof Q||b.__dt_wrapper)){var d,e=function(h,l,p){return function(){var q=l.apply(h,arguments);
-Q.extend(q,q,p.methodExt);return q}};var k=0;for(d=c.length;k<d;k++){var f=c[k];b[f.name]="function"===f.type?e(a,f.val,f):"object"===f.type?{}:f.val;b[f.name].__dt_wrapper=!0;Q.extend(a,b[f.name],f.propExt)}}};Q.register=K=function(a,b){if(Array.isArray(a))for(var c=0,d=a.length;c<d;c++)Q.register(a[c],b);else{d=a.split(".");var e=tc,k;a=0;for(c=d.length;a<c;a++){var f=(k=-1!==d[a].indexOf("()"))?d[a].replace("()",""):d[a];a:{var h=0;for(var l=e.length;h<l;h++)if(e[h].name===f){h=e[h];break a}h=
-null}h||(h={name:f,val:{},methodExt:[],propExt:[],type:"object"},e.push(h));a===c-1?(h.val=b,h.type="function"===typeof b?"function":g.isPlainObject(b)?"object":"other"):e=k?h.methodExt:h.propExt}}};Q.registerPlural=Y=function(a,b,c){Q.register(a,c);Q.register(b,function(){var d=c.apply(this,arguments);return d===this?this:d instanceof Q?d.length?Array.isArray(d[0])?new Q(d.context,d[0]):d[0]:z:d})};var uc=function(a,b){if(Array.isArray(a))return g.map(a,function(d){return uc(d,b)});if("number"===
-typeof a)return[b[a]];var c=g.map(b,function(d,e){return d.nTable});return g(c).filter(a).map(function(d){d=g.inArray(this,c);return b[d]}).toArray()};K("tables()",function(a){return a!==z&&null!==a?new Q(uc(a,this.context)):this});K("table()",function(a){a=this.tables(a);var b=a.context;return b.length?new Q(b[0]):a});Y("tables().nodes()","table().node()",function(){return this.iterator("table",function(a){return a.nTable},1)});Y("tables().body()","table().body()",function(){return this.iterator("table",
-function(a){return a.nTBody},1)});Y("tables().header()","table().header()",function(){return this.iterator("table",function(a){return a.nTHead},1)});Y("tables().footer()","table().footer()",function(){return this.iterator("table",function(a){return a.nTFoot},1)});Y("tables().containers()","table().container()",function(){return this.iterator("table",function(a){return a.nTableWrapper},1)});K("draw()",function(a){return this.iterator("table",function(b){"page"===a?Ba(b):("string"===typeof a&&(a="full-hold"===
-a?!1:!0),Da(b,!1===a))})});K("page()",function(a){return a===z?this.page.info().page:this.iterator("table",function(b){cb(b,a)})});K("page.info()",function(a){if(0===this.context.length)return z;a=this.context[0];var b=a._iDisplayStart,c=a.oFeatures.bPaginate?a._iDisplayLength:-1,d=a.fnRecordsDisplay(),e=-1===c;return{page:e?0:Math.floor(b/c),pages:e?1:Math.ceil(d/c),start:b,end:a.fnDisplayEnd(),length:c,recordsTotal:a.fnRecordsTotal(),recordsDisplay:d,serverSide:"ssp"===ja(a)}});K("page.len()",function(a){return a===
-z?0!==this.context.length?this.context[0]._iDisplayLength:z:this.iterator("table",function(b){vb(b,a)})});var vc=function(a,b,c){if(c){var d=new Q(a);d.one("draw",function(){c(d.ajax.json())})}if("ssp"==ja(a))Da(a,b);else{na(a,!0);var e=a.jqXHR;e&&4!==e.readyState&&e.abort();$a(a,[],function(k){Ca(a);k=Na(a,k);for(var f=0,h=k.length;f<h;f++)L(a,k[f]);Da(a,b);na(a,!1)})}};K("ajax.json()",function(){var a=this.context;if(0<a.length)return a[0].json});K("ajax.params()",function(){var a=this.context;
-if(0<a.length)return a[0].oAjaxData});K("ajax.reload()",function(a,b){return this.iterator("table",function(c){vc(c,!1===b,a)})});K("ajax.url()",function(a){var b=this.context;if(a===z){if(0===b.length)return z;b=b[0];return b.ajax?g.isPlainObject(b.ajax)?b.ajax.url:b.ajax:b.sAjaxSource}return this.iterator("table",function(c){g.isPlainObject(c.ajax)?c.ajax.url=a:c.ajax=a})});K("ajax.url().load()",function(a,b){return this.iterator("table",function(c){vc(c,!1===b,a)})});var Fb=function(a,b,c,d,e){var k=
-[],f,h,l;var p=typeof b;b&&"string"!==p&&"function"!==p&&b.length!==z||(b=[b]);p=0;for(h=b.length;p<h;p++){var q=b[p]&&b[p].split&&!b[p].match(/[\[\(:]/)?b[p].split(","):[b[p]];var u=0;for(l=q.length;u<l;u++)(f=c("string"===typeof q[u]?q[u].trim():q[u]))&&f.length&&(k=k.concat(f))}a=da.selector[a];if(a.length)for(p=0,h=a.length;p<h;p++)k=a[p](d,e,k);return Ya(k)},Gb=function(a){a||={};a.filter&&a.search===z&&(a.search=a.filter);return g.extend({search:"none",order:"current",page:"all"},a)},Hb=function(a){for(var b=
-0,c=a.length;b<c;b++)if(0<a[b].length)return a[0]=a[b],a[0].length=1,a.length=1,a.context=[a.context[b]],a;a.length=0;return a},kb=function(a,b){var c=[],d=a.aiDisplay;var e=a.aiDisplayMaster;var k=b.search;var f=b.order;b=b.page;if("ssp"==ja(a))return"removed"===k?[]:Ga(0,e.length);if("current"==b)for(f=a._iDisplayStart,a=a.fnDisplayEnd();f<a;f++)c.push(d[f]);else if("current"==f||"applied"==f)if("none"==k)c=e.slice();else if("applied"==k)c=d.slice();else{if("removed"==k){var h={};f=0;for(a=d.length;f<
-a;f++)h[d[f]]=null;c=g.map(e,function(l){return h.hasOwnProperty(l)?null:l})}}else if("index"==f||"original"==f)for(f=0,a=a.aoData.length;f<a;f++)"none"==k?c.push(f):(e=g.inArray(f,d),(-1===e&&"removed"==k||0<=e&&"applied"==k)&&c.push(f));return c},Gc=function(a,b,c){var d;return Fb("row",b,function(e){var k=nc(e),f=a.aoData;if(null!==k&&!c)return[k];d||=kb(a,c);if(null!==k&&-1!==g.inArray(k,d))return[k];if(null===e||e===z||""===e)return d;if("function"===typeof e)return g.map(d,function(l){var p=
-f[l];return e(l,p._aData,p.nTr)?l:null});if(e.nodeName){k=e._DT_RowIndex;var h=e._DT_CellIndex;if(k!==z)return f[k]&&f[k].nTr===e?[k]:[];if(h)return f[h.row]&&f[h.row].nTr===e.parentNode?[h.row]:[];k=g(e).closest("*[data-dt-row]");return k.length?[k.data("dt-row")]:[]}if("string"===typeof e&&"#"===e.charAt(0)&&(k=a.aIds[e.replace(/^#/,"")],k!==z))return[k.idx];k=qc(Ta(a.aoData,d,"nTr"));return g(k).filter(e).map(function(){return this._DT_RowIndex}).toArray()},a,c)};K("rows()",function(a,b){a===z?
-a="":g.isPlainObject(a)&&(b=a,a="");b=Gb(b);var c=this.iterator("table",function(d){return Gc(d,a,b)},1);c.selector.rows=a;c.selector.opts=b;return c});K("rows().nodes()",function(){return this.iterator("row",function(a,b){return a.aoData[b].nTr||z},1)});K("rows().data()",function(){return this.iterator(!0,"rows",function(a,b){return Ta(a.aoData,b,"_aData")},1)});Y("rows().cache()","row().cache()",function(a){return this.iterator("row",function(b,c){b=b.aoData[c];return"search"===a?b._aFilterData:
-b._aSortData},1)});Y("rows().invalidate()","row().invalidate()",function(a){return this.iterator("row",function(b,c){Ja(b,c,a)})});Y("rows().indexes()","row().index()",function(){return this.iterator("row",function(a,b){return b},1)});Y("rows().ids()","row().id()",function(a){for(var b=[],c=this.context,d=0,e=c.length;d<e;d++)for(var k=0,f=this[d].length;k<f;k++){var h=c[d].rowIdFn(c[d].aoData[this[d][k]]._aData);b.push((!0===a?"#":"")+h)}return new Q(c,b)});Y("rows().remove()","row().remove()",function(){var a=
-this;this.iterator("row",function(b,c,d){var e=b.aoData,k=e[c],f,h;e.splice(c,1);var l=0;for(f=e.length;l<f;l++){var p=e[l];var q=p.anCells;null!==p.nTr&&(p.nTr._DT_RowIndex=l);if(null!==q)for(p=0,h=q.length;p<h;p++)q[p]._DT_CellIndex.row=l}Xa(b.aiDisplayMaster,c);Xa(b.aiDisplay,c);Xa(a[d],c,!1);0<b._iRecordsDisplay&&b._iRecordsDisplay--;wb(b);c=b.rowIdFn(k._aData);c!==z&&delete b.aIds[c]});this.iterator("table",function(b){for(var c=0,d=b.aoData.length;c<d;c++)b.aoData[c].idx=c});return this});K("rows.add()",
-function(a){var b=this.iterator("table",function(d){var e,k=[];var f=0;for(e=a.length;f<e;f++){var h=a[f];h.nodeName&&"TR"===h.nodeName.toUpperCase()?k.push(P(d,h)[0]):k.push(L(d,h))}return k},1),c=this.rows(-1);c.pop();g.merge(c,b);return c});K("row()",function(a,b){return Hb(this.rows(a,b))});K("row().data()",function(a){var b=this.context;if(a===z)return b.length&&this.length?b[0].aoData[this[0]]._aData:z;var c=b[0].aoData[this[0]];c._aData=a;Array.isArray(a)&&c.nTr&&c.nTr.id&&Aa(b[0].rowId)(a,
-c.nTr.id);Ja(b[0],this[0],"data");return this});K("row().node()",function(){var a=this.context;return a.length&&this.length?a[0].aoData[this[0]].nTr||null:null});K("row.add()",function(a){a instanceof g&&a.length&&(a=a[0]);var b=this.iterator("table",function(c){return a.nodeName&&"TR"===a.nodeName.toUpperCase()?P(c,a)[0]:L(c,a)});return this.row(b[0])});g(X).on("plugin-init.dt",function(a,b){a=new Q(b);a.on("stateSaveParams",function(d,e,k){d=e.rowIdFn;e=e.aoData;for(var f=[],h=0;h<e.length;h++)e[h]._detailsShow&&
-f.push("#"+d(e[h]._aData));k.childRows=f});var c=a.state.loaded();c&&c.childRows&&a.rows(g.map(c.childRows,function(d){return d.replace(/:/g,"\\:")})).every(function(){T(b,null,"requestChild",[this])})});var Hc=function(a,b,c,d){var e=[],k=function(f,h){if(Array.isArray(f)||f instanceof g)for(var l=0,p=f.length;l<p;l++)k(f[l],h);else f.nodeName&&"tr"===f.nodeName.toLowerCase()?e.push(f):(l=g("<tr><td></td></tr>").addClass(h),g("td",l).addClass(h).html(f)[0].colSpan=y(a),e.push(l[0]))};k(c,d);b._details&&
-b._details.detach();b._details=g(e);b._detailsShow&&b._details.insertAfter(b.nTr)},wc=E.util.throttle(function(a){Ra(a[0])},500),Ib=function(a,b){var c=a.context;c.length&&(a=c[0].aoData[b!==z?b:a[0]])&&a._details&&(a._details.remove(),a._detailsShow=z,a._details=z,g(a.nTr).removeClass("dt-hasChild"),wc(c))},xc=function(a,b){var c=a.context;if(c.length&&a.length){var d=c[0].aoData[a[0]];d._details&&((d._detailsShow=b)?(d._details.insertAfter(d.nTr),g(d.nTr).addClass("dt-hasChild")):(d._details.detach(),
-g(d.nTr).removeClass("dt-hasChild")),T(c[0],null,"childRow",[b,a.row(a[0])]),Ic(c[0]),wc(c))}},Ic=function(a){var b=new Q(a),c=a.aoData;b.off("draw.dt.DT_details column-sizing.dt.DT_details destroy.dt.DT_details");0<ma(c,"_details").length&&(b.on("draw.dt.DT_details",function(d,e){a===e&&b.rows({page:"current"}).eq(0).each(function(k){k=c[k];k._detailsShow&&k._details.insertAfter(k.nTr)})}),b.on("column-sizing.dt.DT_details",function(d,e,k,f){if(a===e)for(e=y(e),k=0,f=c.length;k<f;k++)d=c[k],d._details&&
-d._details.children("td[colspan]").attr("colspan",e)}),b.on("destroy.dt.DT_details",function(d,e){if(a===e)for(d=0,e=c.length;d<e;d++)c[d]._details&&Ib(b,d)}))};K("row().child()",function(a,b){var c=this.context;if(a===z)return c.length&&this.length?c[0].aoData[this[0]]._details:z;!0===a?this.child.show():!1===a?Ib(this):c.length&&this.length&&Hc(c[0],c[0].aoData[this[0]],a,b);return this});K(["row().child.show()","row().child().show()"],function(a){xc(this,!0);return this});K(["row().child.hide()",
-"row().child().hide()"],function(){xc(this,!1);return this});K(["row().child.remove()","row().child().remove()"],function(){Ib(this);return this});K("row().child.isShown()",function(){var a=this.context;return a.length&&this.length?a[0].aoData[this[0]]._detailsShow||!1:!1});var Jc=/^([^:]+):(name|visIdx|visible)$/,yc=function(a,b,c,d,e){c=[];d=0;for(var k=e.length;d<k;d++)c.push(O(a,e[d],b));return c},Kc=function(a,b,c){var d=a.aoColumns,e=ma(d,"sName"),k=ma(d,"nTh");return Fb("column",b,function(f){var h=
-nc(f);if(""===f)return Ga(d.length);if(null!==h)return[0<=h?h:d.length+h];if("function"===typeof f){var l=kb(a,c);return g.map(d,function(u,D){return f(D,yc(a,D,0,0,l),k[D])?D:null})}var p="string"===typeof f?f.match(Jc):"";if(p)switch(p[2]){case "visIdx":case "visible":h=parseInt(p[1],10);if(0>h){var q=g.map(d,function(u,D){return u.bVisible?D:null});return[q[q.length+h]]}return[A(a,h)];case "name":return g.map(e,function(u,D){return u===p[1]?D:null});default:return[]}if(f.nodeName&&f._DT_CellIndex)return[f._DT_CellIndex.column];
-h=g(k).filter(f).map(function(){return g.inArray(this,k)}).toArray();if(h.length||!f.nodeName)return h;h=g(f).closest("*[data-dt-column]");return h.length?[h.data("dt-column")]:[]},a,c)};K("columns()",function(a,b){a===z?a="":g.isPlainObject(a)&&(b=a,a="");b=Gb(b);var c=this.iterator("table",function(d){return Kc(d,a,b)},1);c.selector.cols=a;c.selector.opts=b;return c});Y("columns().header()","column().header()",function(a,b){return this.iterator("column",function(c,d){return c.aoColumns[d].nTh},
-1)});Y("columns().footer()","column().footer()",function(a,b){return this.iterator("column",function(c,d){return c.aoColumns[d].nTf},1)});Y("columns().data()","column().data()",function(){return this.iterator("column-rows",yc,1)});Y("columns().dataSrc()","column().dataSrc()",function(){return this.iterator("column",function(a,b){return a.aoColumns[b].mData},1)});Y("columns().cache()","column().cache()",function(a){return this.iterator("column-rows",function(b,c,d,e,k){return Ta(b.aoData,k,"search"===
-a?"_aFilterData":"_aSortData",c)},1)});Y("columns().nodes()","column().nodes()",function(){return this.iterator("column-rows",function(a,b,c,d,e){return Ta(a.aoData,e,"anCells",b)},1)});Y("columns().visible()","column().visible()",function(a,b){var c=this,d=this.iterator("column",function(e,k){if(a===z)return e.aoColumns[k].bVisible;var f=e.aoColumns,h=f[k],l=e.aoData,p;if(a!==z&&h.bVisible!==a){if(a){var q=g.inArray(!0,ma(f,"bVisible"),k+1);f=0;for(p=l.length;f<p;f++){var u=l[f].nTr;e=l[f].anCells;
-u&&u.insertBefore(e[k],e[q]||null)}}else g(ma(e.aoData,"anCells",k)).detach();h.bVisible=a}});a!==z&&this.iterator("table",function(e){La(e,e.aoHeader);La(e,e.aoFooter);e.aiDisplay.length||g(e.nTBody).find("td[colspan]").attr("colspan",y(e));Ra(e);c.iterator("column",function(k,f){T(k,null,"column-visibility",[k,f,a,b])});(b===z||b)&&c.columns.adjust()});return d});Y("columns().indexes()","column().index()",function(a){return this.iterator("column",function(b,c){return"visible"===a?B(b,c):c},1)});
-K("columns.adjust()",function(){return this.iterator("table",function(a){x(a)},1)});K("column.index()",function(a,b){if(0!==this.context.length){var c=this.context[0];if("fromVisible"===a||"toData"===a)return A(c,b);if("fromData"===a||"toVisible"===a)return B(c,b)}});K("column()",function(a,b){return Hb(this.columns(a,b))});var Lc=function(a,b,c){var d=a.aoData,e=kb(a,c),k=qc(Ta(d,e,"anCells")),f=g(rc([],k)),h,l=a.aoColumns.length,p,q,u,D,F,J;return Fb("cell",b,function(I){var C="function"===typeof I;
-if(null===I||I===z||C){p=[];q=0;for(u=e.length;q<u;q++)for(h=e[q],D=0;D<l;D++)F={row:h,column:D},C?(J=d[h],I(F,O(a,h,D),J.anCells?J.anCells[D]:null)&&p.push(F)):p.push(F);return p}if(g.isPlainObject(I))return I.column!==z&&I.row!==z&&-1!==g.inArray(I.row,e)?[I]:[];C=f.filter(I).map(function(R,U){return{row:U._DT_CellIndex.row,column:U._DT_CellIndex.column}}).toArray();if(C.length||!I.nodeName)return C;J=g(I).closest("*[data-dt-row]");return J.length?[{row:J.data("dt-row"),column:J.data("dt-column")}]:
-[]},a,c)};K("cells()",function(a,b,c){g.isPlainObject(a)&&(a.row===z?(c=a,a=null):(c=b,b=null));g.isPlainObject(b)&&(c=b,b=null);if(null===b||b===z)return this.iterator("table",function(q){return Lc(q,a,Gb(c))});var d=c?{page:c.page,order:c.order,search:c.search}:{},e=this.columns(b,d),k=this.rows(a,d),f,h,l,p;d=this.iterator("table",function(q,u){q=[];f=0;for(h=k[u].length;f<h;f++)for(l=0,p=e[u].length;l<p;l++)q.push({row:k[u][f],column:e[u][l]});return q},1);d=c&&c.selected?this.cells(d,c):d;g.extend(d.selector,
-{cols:b,rows:a,opts:c});return d});Y("cells().nodes()","cell().node()",function(){return this.iterator("cell",function(a,b,c){return(a=a.aoData[b])&&a.anCells?a.anCells[c]:z},1)});K("cells().data()",function(){return this.iterator("cell",function(a,b,c){return O(a,b,c)},1)});Y("cells().cache()","cell().cache()",function(a){a="search"===a?"_aFilterData":"_aSortData";return this.iterator("cell",function(b,c,d){return b.aoData[c][a][d]},1)});Y("cells().render()","cell().render()",function(a){return this.iterator("cell",
-function(b,c,d){return O(b,c,d,a)},1)});Y("cells().indexes()","cell().index()",function(){return this.iterator("cell",function(a,b,c){return{row:b,column:c,columnVisible:B(a,c)}},1)});Y("cells().invalidate()","cell().invalidate()",function(a){return this.iterator("cell",function(b,c,d){Ja(b,c,a,d)})});K("cell()",function(a,b,c){return Hb(this.cells(a,b,c))});K("cell().data()",function(a){var b=this.context,c=this[0];if(a===z)return b.length&&c.length?O(b[0],c[0].row,c[0].column):z;Z(b[0],c[0].row,
-c[0].column,a);Ja(b[0],c[0].row,"data",c[0].column);return this});K("order()",function(a,b){var c=this.context;if(a===z)return 0!==c.length?c[0].aaSorting:z;"number"===typeof a?a=[[a,b]]:a.length&&!Array.isArray(a[0])&&(a=Array.prototype.slice.call(arguments));return this.iterator("table",function(d){d.aaSorting=a.slice()})});K("order.listener()",function(a,b,c){return this.iterator("table",function(d){qb(d,a,b,c)})});K("order.fixed()",function(a){if(!a){var b=this.context;b=b.length?b[0].aaSortingFixed:
-z;return Array.isArray(b)?{pre:b}:b}return this.iterator("table",function(c){c.aaSortingFixed=g.extend(!0,{},a)})});K(["columns().order()","column().order()"],function(a){var b=this;return this.iterator("table",function(c,d){var e=[];g.each(b[d],function(k,f){e.push([f,a])});c.aaSorting=e})});K("search()",function(a,b,c,d){var e=this.context;return a===z?0!==e.length?e[0].oPreviousSearch.sSearch:z:this.iterator("table",function(k){k.oFeatures.bFilter&&Ma(k,g.extend({},k.oPreviousSearch,{sSearch:a+
-"",bRegex:null===b?!1:b,bSmart:null===c?!0:c,bCaseInsensitive:null===d?!0:d}),1)})});Y("columns().search()","column().search()",function(a,b,c,d){return this.iterator("column",function(e,k){var f=e.aoPreSearchCols;if(a===z)return f[k].sSearch;e.oFeatures.bFilter&&(g.extend(f[k],{sSearch:a+"",bRegex:null===b?!1:b,bSmart:null===c?!0:c,bCaseInsensitive:null===d?!0:d}),Ma(e,e.oPreviousSearch,1))})});K("state()",function(){return this.context.length?this.context[0].oSavedState:null});K("state.clear()",
-function(){return this.iterator("table",function(a){a.fnStateSaveCallback.call(a.oInstance,a,{})})});K("state.loaded()",function(){return this.context.length?this.context[0].oLoadedState:null});K("state.save()",function(){return this.iterator("table",function(a){Ra(a)})});E.versionCheck=E.fnVersionCheck=function(a){var b=E.version.split(".");a=a.split(".");for(var c,d,e=0,k=a.length;e<k;e++)if(c=parseInt(b[e],10)||0,d=parseInt(a[e],10)||0,c!==d)return c>d;return!0};E.isDataTable=E.fnIsDataTable=function(a){var b=
-g(a).get(0),c=!1;if(a instanceof E.Api)return!0;g.each(E.settings,function(d,e){d=e.nScrollHead?g("table",e.nScrollHead)[0]:null;var k=e.nScrollFoot?g("table",e.nScrollFoot)[0]:null;if(e.nTable===b||d===b||k===b)c=!0});return c};E.tables=E.fnTables=function(a){var b=!1;g.isPlainObject(a)&&(b=a.api,a=a.visible);var c=g.map(E.settings,function(d){if(!a||a&&g(d.nTable).is(":visible"))return d.nTable});return b?new Q(c):c};E.camelToHungarian=ea;K("$()",function(a,b){b=this.rows(b).nodes();b=g(b);return g([].concat(b.filter(a).toArray(),
-b.find(a).toArray()))});g.each(["on","one","off"],function(a,b){K(b+"()",function(){var c=Array.prototype.slice.call(arguments);c[0]=g.map(c[0].split(/\s/),function(e){return e.match(/\.dt\b/)?e:e+".dt"}).join(" ");var d=g(this.tables().nodes());d[b].apply(d,c);return this})});K("clear()",function(){return this.iterator("table",function(a){Ca(a)})});K("settings()",function(){return new Q(this.context,this.context)});K("init()",function(){var a=this.context;return a.length?a[0].oInit:null});K("data()",
-function(){return this.iterator("table",function(a){return ma(a.aoData,"_aData")}).flatten()});K("destroy()",function(a){a=a||!1;return this.iterator("table",function(b){var c=b.oClasses,d=b.nTable,e=b.nTBody,k=b.nTHead,f=b.nTFoot,h=g(d);e=g(e);var l=g(b.nTableWrapper),p=g.map(b.aoData,function(u){return u.nTr}),q;b.bDestroying=!0;T(b,"aoDestroyCallback","destroy",[b]);a||(new Q(b)).columns().visible(!0);l.off(".DT").find(":not(tbody *)").off(".DT");g(M).off(".DT-"+b.sInstance);d!=k.parentNode&&(h.children("thead").detach(),
-h.append(k));f&&d!=f.parentNode&&(h.children("tfoot").detach(),h.append(f));b.aaSorting=[];b.aaSortingFixed=[];eb(b);g(p).removeClass(b.asStripeClasses.join(" "));g("th, td",k).removeClass(c.sSortable+" "+c.sSortableAsc+" "+c.sSortableDesc+" "+c.sSortableNone);e.children().detach();e.append(p);k=b.nTableWrapper.parentNode;f=a?"remove":"detach";h[f]();l[f]();!a&&k&&(k.insertBefore(d,b.nTableReinsertBefore),h.css("width",b.sDestroyWidth).removeClass(c.sTable),(q=b.asDestroyStripes.length)&&e.children().each(function(u){g(this).addClass(b.asDestroyStripes[u%
-q])}));c=g.inArray(b,E.settings);-1!==c&&E.settings.splice(c,1)})});g.each(["column","row","cell"],function(a,b){K(b+"s().every()",function(c){var d=this.selector.opts,e=this;return this.iterator(b,function(k,f,h,l,p){c.call(e[b](f,"cell"===b?h:d,"cell"===b?d:z),f,h,l,p)})})});K("i18n()",function(a,b,c){var d=this.context[0];a=Ea(a)(d.oLanguage);a===z&&(a=b);c!==z&&g.isPlainObject(a)&&(a=a[c]!==z?a[c]:a._);return a.replace("%d",c)});E.version="1.12.1";E.settings=[];E.models={};E.models.oSearch={bCaseInsensitive:!0,
-sSearch:"",bRegex:!1,bSmart:!0,"return":!1};E.models.oRow={nTr:null,anCells:null,_aData:[],_aSortData:null,_aFilterData:null,_sFilterRow:null,_sRowStripe:"",src:null,idx:-1};E.models.oColumn={idx:null,aDataSort:null,asSorting:null,bSearchable:null,bSortable:null,bVisible:null,_sManualType:null,_bAttrSrc:!1,fnCreatedCell:null,fnGetData:null,fnSetData:null,mData:null,mRender:null,nTh:null,nTf:null,sClass:null,sContentPadding:null,sDefaultContent:null,sName:null,sSortDataType:"std",sSortingClass:null,
-sSortingClassJUI:null,sTitle:null,sType:null,sWidth:null,sWidthOrig:null};E.defaults={aaData:null,aaSorting:[[0,"asc"]],aaSortingFixed:[],ajax:null,aLengthMenu:[10,25,50,100],aoColumns:null,aoColumnDefs:null,aoSearchCols:[],asStripeClasses:null,bAutoWidth:!0,bDeferRender:!1,bDestroy:!1,bFilter:!0,bInfo:!0,bLengthChange:!0,bPaginate:!0,bProcessing:!1,bRetrieve:!1,bScrollCollapse:!1,bServerSide:!1,bSort:!0,bSortMulti:!0,bSortCellsTop:!1,bSortClasses:!0,bStateSave:!1,fnCreatedRow:null,fnDrawCallback:null,
-fnFooterCallback:null,fnFormatNumber:function(a){return a.toString().replace(/\B(?=(\d{3})+(?!\d))/g,this.oLanguage.sThousands)},fnHeaderCallback:null,fnInfoCallback:null,fnInitComplete:null,fnPreDrawCallback:null,fnRowCallback:null,fnServerData:null,fnServerParams:null,fnStateLoadCallback:function(a){try{return JSON.parse((-1===a.iStateDuration?sessionStorage:localStorage).getItem("DataTables_"+a.sInstance+"_"+location.pathname))}catch(b){return{}}},fnStateLoadParams:null,fnStateLoaded:null,fnStateSaveCallback:function(a,
-b){try{(-1===a.iStateDuration?sessionStorage:localStorage).setItem("DataTables_"+a.sInstance+"_"+location.pathname,JSON.stringify(b))}catch(c){}},fnStateSaveParams:null,iStateDuration:7200,iDeferLoading:null,iDisplayLength:10,iDisplayStart:0,iTabIndex:0,oClasses:{},oLanguage:{oAria:{sSortAscending:": activate to sort column ascending",sSortDescending:": activate to sort column descending"},oPaginate:{sFirst:"First",sLast:"Last",sNext:"Next",sPrevious:"Previous"},sEmptyTable:"No data available in table",
-sInfo:"Showing _START_ to _END_ of _TOTAL_ entries",sInfoEmpty:"Showing 0 to 0 of 0 entries",sInfoFiltered:"(filtered from _MAX_ total entries)",sInfoPostFix:"",sDecimal:"",sThousands:",",sLengthMenu:"Show _MENU_ entries",sLoadingRecords:"Loading...",sProcessing:"",sSearch:"Search:",sSearchPlaceholder:"",sUrl:"",sZeroRecords:"No matching records found"},oSearch:g.extend({},E.models.oSearch),sAjaxDataProp:"data",sAjaxSource:null,sDom:"lfrtip",searchDelay:null,sPaginationType:"simple_numbers",sScrollX:"",
-sScrollXInner:"",sScrollY:"",sServerMethod:"GET",renderer:null,rowId:"DT_RowId"};pa(E.defaults);E.defaults.column={aDataSort:null,iDataSort:-1,asSorting:["asc","desc"],bSearchable:!0,bSortable:!0,bVisible:!0,fnCreatedCell:null,mData:null,mRender:null,sCellType:"td",sClass:"",sContentPadding:"",sDefaultContent:null,sName:"",sSortDataType:"std",sTitle:null,sType:null,sWidth:null};pa(E.defaults.column);E.models.oSettings={oFeatures:{bAutoWidth:null,bDeferRender:null,bFilter:null,bInfo:null,bLengthChange:null,
-bPaginate:null,bProcessing:null,bServerSide:null,bSort:null,bSortMulti:null,bSortClasses:null,bStateSave:null},oScroll:{bCollapse:null,iBarWidth:0,sX:null,sXInner:null,sY:null},oLanguage:{fnInfoCallback:null},oBrowser:{bScrollOversize:!1,bScrollbarLeft:!1,bBounding:!1,barWidth:0},ajax:null,aanFeatures:[],aoData:[],aiDisplay:[],aiDisplayMaster:[],aIds:{},aoColumns:[],aoHeader:[],aoFooter:[],oPreviousSearch:{},aoPreSearchCols:[],aaSorting:null,aaSortingFixed:[],asStripeClasses:null,asDestroyStripes:[],
-sDestroyWidth:0,aoRowCallback:[],aoHeaderCallback:[],aoFooterCallback:[],aoDrawCallback:[],aoRowCreatedCallback:[],aoPreDrawCallback:[],aoInitComplete:[],aoStateSaveParams:[],aoStateLoadParams:[],aoStateLoaded:[],sTableId:"",nTable:null,nTHead:null,nTFoot:null,nTBody:null,nTableWrapper:null,bDeferLoading:!1,bInitialised:!1,aoOpenRows:[],sDom:null,searchDelay:null,sPaginationType:"two_button",iStateDuration:0,aoStateSave:[],aoStateLoad:[],oSavedState:null,oLoadedState:null,sAjaxSource:null,sAjaxDataProp:null,
-jqXHR:null,json:z,oAjaxData:z,fnServerData:null,aoServerParams:[],sServerMethod:null,fnFormatNumber:null,aLengthMenu:null,iDraw:0,bDrawing:!1,iDrawError:-1,_iDisplayLength:10,_iDisplayStart:0,_iRecordsTotal:0,_iRecordsDisplay:0,oClasses:{},bFiltered:!1,bSorted:!1,bSortCellsTop:null,oInit:null,aoDestroyCallback:[],fnRecordsTotal:function(){return"ssp"==ja(this)?1*this._iRecordsTotal:this.aiDisplayMaster.length},fnRecordsDisplay:function(){return"ssp"==ja(this)?1*this._iRecordsDisplay:this.aiDisplay.length},
-fnDisplayEnd:function(){var a=this._iDisplayLength,b=this._iDisplayStart,c=b+a,d=this.aiDisplay.length,e=this.oFeatures,k=e.bPaginate;return e.bServerSide?!1===k||-1===a?b+d:Math.min(b+a,this._iRecordsDisplay):!k||c>d||-1===a?d:c},oInstance:null,sInstance:null,iTabIndex:0,nScrollHead:null,nScrollFoot:null,aLastSort:[],oPlugins:{},rowIdFn:null,rowId:null};E.ext=da={buttons:{},classes:{},builder:"-source-",errMode:"alert",feature:[],search:[],selector:{cell:[],column:[],row:[]},internal:{},legacy:{ajax:null},
-pager:{},renderer:{pageButton:{},header:{}},order:{},type:{detect:[],search:{},order:{}},_unique:0,fnVersionCheck:E.fnVersionCheck,iApiIndex:0,oJUIClasses:{},sVersion:E.version};g.extend(da,{afnFiltering:da.search,aTypes:da.type.detect,ofnSearch:da.type.search,oSort:da.type.order,afnSortData:da.order,aoFeatures:da.feature,oApi:da.internal,oStdClasses:da.classes,oPagination:da.pager});g.extend(E.ext.classes,{sTable:"dataTable",sNoFooter:"no-footer",sPageButton:"paginate_button",sPageButtonActive:"current",
-sPageButtonDisabled:"disabled",sStripeOdd:"odd",sStripeEven:"even",sRowEmpty:"dataTables_empty",sWrapper:"dataTables_wrapper",sFilter:"dataTables_filter",sInfo:"dataTables_info",sPaging:"dataTables_paginate paging_",sLength:"dataTables_length",sProcessing:"dataTables_processing",sSortAsc:"sorting_asc",sSortDesc:"sorting_desc",sSortable:"sorting",sSortableAsc:"sorting_desc_disabled",sSortableDesc:"sorting_asc_disabled",sSortableNone:"sorting_disabled",sSortColumn:"sorting_",sFilterInput:"",sLengthSelect:"",
-sScrollWrapper:"dataTables_scroll",sScrollHead:"dataTables_scrollHead",sScrollHeadInner:"dataTables_scrollHeadInner",sScrollBody:"dataTables_scrollBody",sScrollFoot:"dataTables_scrollFoot",sScrollFootInner:"dataTables_scrollFootInner",sHeaderTH:"",sFooterTH:"",sSortJUIAsc:"",sSortJUIDesc:"",sSortJUI:"",sSortJUIAscAllowed:"",sSortJUIDescAllowed:"",sSortJUIWrapper:"",sSortIcon:"",sJUIHeader:"",sJUIFooter:""});var ic=E.ext.pager;g.extend(ic,{simple:function(a,b){return["previous","next"]},full:function(a,
-b){return["first","previous","next","last"]},numbers:function(a,b){return[Sa(a,b)]},simple_numbers:function(a,b){return["previous",Sa(a,b),"next"]},full_numbers:function(a,b){return["first","previous",Sa(a,b),"next","last"]},first_last_numbers:function(a,b){return["first",Sa(a,b),"last"]},_numbers:Sa,numbers_length:7});g.extend(!0,E.ext.renderer,{pageButton:{_:function(a,b,c,d,e,k){var f=a.oClasses,h=a.oLanguage.oPaginate,l=a.oLanguage.oAria.paginate||{},p,q,u=0,D=function(J,I){var C,R=f.sPageButtonDisabled,
-U=function(W){cb(a,W.data.action,!0)};var va=0;for(C=I.length;va<C;va++){var ca=I[va];if(Array.isArray(ca)){var ia=g("<"+(ca.DT_el||"div")+"/>").appendTo(J);D(ia,ca)}else{p=null;q=ca;ia=a.iTabIndex;switch(ca){case "ellipsis":J.append('<span class="ellipsis">&#x2026;</span>');break;case "first":p=h.sFirst;0===e&&(ia=-1,q+=" "+R);break;case "previous":p=h.sPrevious;0===e&&(ia=-1,q+=" "+R);break;case "next":p=h.sNext;if(0===k||e===k-1)ia=-1,q+=" "+R;break;case "last":p=h.sLast;if(0===k||e===k-1)ia=-1,
-q+=" "+R;break;default:p=a.fnFormatNumber(ca+1),q=e===ca?f.sPageButtonActive:""}null!==p&&(ia=g("<a>",{"class":f.sPageButton+" "+q,"aria-controls":a.sTableId,"aria-label":l[ca],"data-dt-idx":u,tabindex:ia,id:0===c&&"string"===typeof ca?a.sTableId+"_"+ca:null}).html(p).appendTo(J),yb(ia,{action:ca},U),u++)}}};try{var F=g(b).find(X.activeElement).data("dt-idx")}catch(J){}D(g(b).empty(),d);F!==z&&g(b).find("[data-dt-idx="+F+"]").trigger("focus")}}});g.extend(E.ext.type.detect,[function(a,b){b=b.oLanguage.sDecimal;
-return Eb(a,b)?"num"+b:null},function(a,b){if(a&&!(a instanceof Date)&&!Dc.test(a))return null;b=Date.parse(a);return null!==b&&!isNaN(b)||ua(a)?"date":null},function(a,b){b=b.oLanguage.sDecimal;return Eb(a,b,!0)?"num-fmt"+b:null},function(a,b){b=b.oLanguage.sDecimal;return pc(a,b)?"html-num"+b:null},function(a,b){b=b.oLanguage.sDecimal;return pc(a,b,!0)?"html-num-fmt"+b:null},function(a,b){return ua(a)||"string"===typeof a&&-1!==a.indexOf("<")?"html":null}]);g.extend(E.ext.type.search,{html:function(a){return ua(a)?
-a:"string"===typeof a?a.replace(mc," ").replace(hb,""):""},string:function(a){return ua(a)?a:"string"===typeof a?a.replace(mc," "):a}});var gb=function(a,b,c,d){if(0!==a&&(!a||"-"===a))return-Infinity;b&&(a=oc(a,b));a.replace&&(c&&(a=a.replace(c,"")),d&&(a=a.replace(d,"")));return 1*a};g.extend(da.type.order,{"date-pre":function(a){a=Date.parse(a);return isNaN(a)?-Infinity:a},"html-pre":function(a){return ua(a)?"":a.replace?a.replace(/<.*?>/g,"").toLowerCase():a+""},"string-pre":function(a){return ua(a)?
-"":"string"===typeof a?a.toLowerCase():a.toString?a.toString():""},"string-asc":function(a,b){return a<b?-1:a>b?1:0},"string-desc":function(a,b){return a<b?1:a>b?-1:0}});lb("");g.extend(!0,E.ext.renderer,{header:{_:function(a,b,c,d){g(a.nTable).on("order.dt.DT",function(e,k,f,h){a===k&&(e=c.idx,b.removeClass(d.sSortAsc+" "+d.sSortDesc).addClass("asc"==h[e]?d.sSortAsc:"desc"==h[e]?d.sSortDesc:c.sSortingClass))})},jqueryui:function(a,b,c,d){g("<div/>").addClass(d.sSortJUIWrapper).append(b.contents()).append(g("<span/>").addClass(d.sSortIcon+
-" "+c.sSortingClassJUI)).appendTo(b);g(a.nTable).on("order.dt.DT",function(e,k,f,h){a===k&&(e=c.idx,b.removeClass(d.sSortAsc+" "+d.sSortDesc).addClass("asc"==h[e]?d.sSortAsc:"desc"==h[e]?d.sSortDesc:c.sSortingClass),b.find("span."+d.sSortIcon).removeClass(d.sSortJUIAsc+" "+d.sSortJUIDesc+" "+d.sSortJUI+" "+d.sSortJUIAscAllowed+" "+d.sSortJUIDescAllowed).addClass("asc"==h[e]?d.sSortJUIAsc:"desc"==h[e]?d.sSortJUIDesc:c.sSortingClassJUI))})}}});var jb=function(a){Array.isArray(a)&&(a=a.join(","));return"string"===
-typeof a?a.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;"):a},kc=!1,zc=",",Ac=".";if(Intl)try{for(var Va=(new Intl.NumberFormat).formatToParts(100000.1),Ia=0;Ia<Va.length;Ia++)"group"===Va[Ia].type?zc=Va[Ia].value:"decimal"===Va[Ia].type&&(Ac=Va[Ia].value)}catch(a){}E.datetime=function(a,b){var c="datetime-detect-"+a;b||="en";E.ext.type.order[c]||(E.ext.type.detect.unshift(function(d){var e=ib(d,a,b);return""===d||e?c:!1}),E.ext.type.order[c+"-pre"]=function(d){return ib(d,
-a,b)||0})};E.render={date:Cb("toLocaleDateString"),datetime:Cb("toLocaleString"),time:Cb("toLocaleTimeString"),number:function(a,b,c,d,e){if(null===a||a===z)a=zc;if(null===b||b===z)b=Ac;return{display:function(k){if("number"!==typeof k&&"string"!==typeof k||""===k||null===k)return k;var f=0>k?"-":"",h=parseFloat(k);if(isNaN(h))return jb(k);h=h.toFixed(c);k=Math.abs(h);h=parseInt(k,10);k=c?b+(k-h).toFixed(c).substring(2):"";0===h&&0===parseFloat(k)&&(f="");return f+(d||"")+h.toString().replace(/\B(?=(\d{3})+(?!\d))/g,
-a)+k+(e||"")}}},text:function(){return{display:jb,filter:jb}}};g.extend(E.ext.internal,{_fnExternApiFunc:lc,_fnBuildAjax:$a,_fnAjaxUpdate:Kb,_fnAjaxParameters:Tb,_fnAjaxUpdateDraw:Ub,_fnAjaxDataSrc:Na,_fnAddColumn:t,_fnColumnOptions:v,_fnAdjustColumnSizing:x,_fnVisibleToColumnIndex:A,_fnColumnIndexToVisible:B,_fnVisbleColumns:y,_fnGetColumns:H,_fnColumnTypes:G,_fnApplyColumnDefs:N,_fnHungarianMap:pa,_fnCamelToHungarian:ea,_fnLanguageCompat:ba,_fnBrowserDetect:m,_fnAddData:L,_fnAddTr:P,_fnNodeToDataIndex:function(a,
-b){return b._DT_RowIndex!==z?b._DT_RowIndex:null},_fnNodeToColumnIndex:function(a,b,c){return g.inArray(c,a.aoData[b].anCells)},_fnGetCellData:O,_fnSetCellData:Z,_fnSplitObjNotation:fa,_fnGetObjectDataFn:Ea,_fnSetObjectDataFn:Aa,_fnGetDataMaster:qa,_fnClearTable:Ca,_fnDeleteIndex:Xa,_fnInvalidate:Ja,_fnGetRowElements:ob,_fnCreateTr:nb,_fnBuildHead:Jb,_fnDrawHead:La,_fnDraw:Ba,_fnReDraw:Da,_fnAddOptionsHtml:Mb,_fnDetectHeader:Ka,_fnGetUniqueThs:Za,_fnFeatureHtmlFilter:Ob,_fnFilterComplete:Ma,_fnFilterCustom:Xb,
-_fnFilterColumn:Wb,_fnFilter:Vb,_fnFilterCreateSearch:tb,_fnEscapeRegex:ub,_fnFilterData:Yb,_fnFeatureHtmlInfo:Rb,_fnUpdateInfo:ac,_fnInfoMacros:bc,_fnInitialise:Oa,_fnInitComplete:ab,_fnLengthChange:vb,_fnFeatureHtmlLength:Nb,_fnFeatureHtmlPaginate:Sb,_fnPageChange:cb,_fnFeatureHtmlProcessing:Pb,_fnProcessingDisplay:na,_fnFeatureHtmlTable:Qb,_fnScrollDraw:Wa,_fnApplyToChildren:xa,_fnCalculateColumnWidths:mb,_fnThrottle:sb,_fnConvertToWidth:cc,_fnGetWidestNode:dc,_fnGetMaxLenString:ec,_fnStringToCss:aa,
-_fnSortFlatten:Fa,_fnSort:Lb,_fnSortAria:gc,_fnSortListener:xb,_fnSortAttachListener:qb,_fnSortingClasses:eb,_fnSortData:fc,_fnSaveState:Ra,_fnLoadState:hc,_fnImplementState:zb,_fnSettingsFromNode:fb,_fnLog:ya,_fnMap:sa,_fnBindAction:yb,_fnCallbackReg:ka,_fnCallbackFire:T,_fnLengthOverflow:wb,_fnRenderer:rb,_fnDataSource:ja,_fnRowAttributes:pb,_fnExtend:Ab,_fnCalculateEnd:function(){}});g.fn.dataTable=E;E.$=g;g.fn.dataTableSettings=E.settings;g.fn.dataTableExt=E.ext;g.fn.DataTable=function(a){return g(this).dataTable(a).api()};
-g.each(E,function(a,b){g.fn.DataTable[a]=b});return E});
-(function(g){"function"===typeof define&&define.amd?define(["jquery","datatables.net"],function(M){return g(M,window,document)}):"object"===typeof exports?module.exports=function(M,X){M||=window;X&&X.fn.dataTable||(X=require("datatables.net")(M,X).$);return g(X,M,M.document)}:g(jQuery,window,document)})(function(g,M,X,z){function pa(m,n,t){var v=n+"-"+t;if(r[v]){m=m.cell(n,t).node();t=r[v][0].parentNode.childNodes;n=[];for(var x=0,A=t.length;x<A;x++)n.push(t[x]);t=0;for(x=n.length;t<x;t++)m.appendChild(n[t]);
-r[v]=z}}var ea=g.fn.dataTable,ba=function(m,n){if(!ea.versionCheck||!ea.versionCheck("1.10.10"))throw"DataTables Responsive requires DataTables 1.10.10 or newer";this.s={dt:new ea.Api(m),columns:[],current:[]};this.s.dt.settings()[0].responsive||(n&&"string"===typeof n.details?n.details={type:n.details}:n&&!1===n.details?n.details={type:!1}:n&&!0===n.details&&(n.details={type:"inline"}),this.c=g.extend(!0,{},ba.defaults,ea.defaults.responsive,n),m.responsive=this,this._constructor())};g.extend(ba.prototype,
-{_constructor:function(){var m=this,n=this.s.dt,t=n.settings()[0],v=g(M).innerWidth();n.settings()[0]._responsive=this;g(M).on("resize.dtr orientationchange.dtr",ea.util.throttle(function(){var x=g(M).innerWidth();x!==v&&(m._resize(),v=x)}));t.oApi._fnCallbackReg(t,"aoRowCreatedCallback",function(x,A,B){-1!==g.inArray(!1,m.s.current)&&g(">td, >th",x).each(function(y){y=n.column.index("toData",y);!1===m.s.current[y]&&g(this).css("display","none")})});n.on("destroy.dtr",function(){n.off(".dtr");g(n.table().body()).off(".dtr");
-g(M).off("resize.dtr orientationchange.dtr");n.cells(".dtr-control").nodes().to$().removeClass("dtr-control");g.each(m.s.current,function(x,A){!1===A&&m._setColumnVis(x,!0)})});this.c.breakpoints.sort(function(x,A){return x.width<A.width?1:x.width>A.width?-1:0});this._classLogic();this._resizeAuto();t=this.c.details;!1!==t.type&&(m._detailsInit(),n.on("column-visibility.dtr",function(){m._timer&&clearTimeout(m._timer);m._timer=setTimeout(function(){m._timer=null;m._classLogic();m._resizeAuto();m._resize(!0);
-m._redrawChildren()},100)}),n.on("draw.dtr",function(){m._redrawChildren()}),g(n.table().node()).addClass("dtr-"+t.type));n.on("column-reorder.dtr",function(x,A,B){m._classLogic();m._resizeAuto();m._resize(!0)});n.on("column-sizing.dtr",function(){m._resizeAuto();m._resize()});n.on("column-calc.dt",function(x,A){x=m.s.current;for(var B=0;B<x.length;B++){var y=A.visible.indexOf(B);!1===x[B]&&0<=y&&A.visible.splice(y,1)}});n.on("preXhr.dtr",function(){var x=[];n.rows().every(function(){this.child.isShown()&&
-x.push(this.id(!0))});n.one("draw.dtr",function(){m._resizeAuto();m._resize();n.rows(x).every(function(){m._detailsDisplay(this,!1)})})});n.on("draw.dtr",function(){m._controlClass()}).on("init.dtr",function(x,A,B){"dt"===x.namespace&&(m._resizeAuto(),m._resize(),g.inArray(!1,m.s.current)&&n.columns.adjust())});this._resize()},_columnsVisiblity:function(m){var n=this.s.dt,t=this.s.columns,v,x=t.map(function(N,L){return{columnIdx:L,priority:N.priority}}).sort(function(N,L){return N.priority!==L.priority?
-N.priority-L.priority:N.columnIdx-L.columnIdx}),A=g.map(t,function(N,L){return!1===n.column(L).visible()?"not-visible":N.auto&&null===N.minWidth?!1:!0===N.auto?"-":-1!==g.inArray(m,N.includeIn)}),B=0;var y=0;for(v=A.length;y<v;y++)!0===A[y]&&(B+=t[y].minWidth);y=n.settings()[0].oScroll;y=y.sY||y.sX?y.iBarWidth:0;B=n.table().container().offsetWidth-y-B;y=0;for(v=A.length;y<v;y++)t[y].control&&(B-=t[y].minWidth);var H=!1;y=0;for(v=x.length;y<v;y++){var G=x[y].columnIdx;"-"===A[G]&&!t[G].control&&t[G].minWidth&&
-(H||0>B-t[G].minWidth?(H=!0,A[G]=!1):A[G]=!0,B-=t[G].minWidth)}x=!1;y=0;for(v=t.length;y<v;y++)if(!t[y].control&&!t[y].never&&!1===A[y]){x=!0;break}y=0;for(v=t.length;y<v;y++)t[y].control&&(A[y]=x),"not-visible"===A[y]&&(A[y]=!1);-1===g.inArray(!0,A)&&(A[0]=!0);return A},_classLogic:function(){var m=this,n=this.c.breakpoints,t=this.s.dt,v=t.columns().eq(0).map(function(B){var y=this.column(B),H=y.header().className;B=t.settings()[0].aoColumns[B].responsivePriority;y=y.header().getAttribute("data-priority");
-B===z&&(B=y===z||null===y?1E4:1*y);return{className:H,includeIn:[],auto:!1,control:!1,never:H.match(/\b(dtr\-)?never\b/)?!0:!1,priority:B}}),x=function(B,y){B=v[B].includeIn;-1===g.inArray(y,B)&&B.push(y)},A=function(B,y,H,G){if(!H)v[B].includeIn.push(y);else if("max-"===H)for(G=m._find(y).width,y=0,H=n.length;y<H;y++)n[y].width<=G&&x(B,n[y].name);else if("min-"===H)for(G=m._find(y).width,y=0,H=n.length;y<H;y++)n[y].width>=G&&x(B,n[y].name);else if("not-"===H)for(y=0,H=n.length;y<H;y++)-1===n[y].name.indexOf(G)&&
-x(B,n[y].name)};v.each(function(B,y){for(var H=B.className.split(" "),G=!1,N=0,L=H.length;N<L;N++){var P=H[N].trim();if("all"===P||"dtr-all"===P){G=!0;B.includeIn=g.map(n,function(O){return O.name});return}if("none"===P||"dtr-none"===P||B.never){G=!0;return}if("control"===P||"dtr-control"===P){G=!0;B.control=!0;return}g.each(n,function(O,Z){O=Z.name.split("-");var fa=P.match(new RegExp("(min\\-|max\\-|not\\-)?("+O[0]+")(\\-[_a-zA-Z0-9])?"));fa&&(G=!0,fa[2]===O[0]&&fa[3]==="-"+O[1]?A(y,Z.name,fa[1],
-fa[2]+fa[3]):fa[2]!==O[0]||fa[3]||A(y,Z.name,fa[1],fa[2]))})}G||(B.auto=!0)});this.s.columns=v},_controlClass:function(){if("inline"===this.c.details.type){var m=this.s.dt,n=g.inArray(!0,this.s.current);m.cells(null,function(t){return t!==n},{page:"current"}).nodes().to$().filter(".dtr-control").removeClass("dtr-control");m.cells(null,n,{page:"current"}).nodes().to$().addClass("dtr-control")}},_detailsDisplay:function(m,n){var t=this,v=this.s.dt,x=this.c.details;if(x&&!1!==x.type){var A="string"===
-typeof x.renderer?ba.renderer[x.renderer]():x.renderer;x=x.display(m,n,function(){return A(v,m[0],t._detailsObj(m[0]))});!0!==x&&!1!==x||g(v.table().node()).triggerHandler("responsive-display.dt",[v,m,x,n])}},_detailsInit:function(){var m=this,n=this.s.dt,t=this.c.details;"inline"===t.type&&(t.target="td.dtr-control, th.dtr-control");n.on("draw.dtr",function(){m._tabIndexes()});m._tabIndexes();g(n.table().body()).on("keyup.dtr","td, th",function(x){13===x.keyCode&&g(this).data("dtr-keyboard")&&g(this).click()});
-var v=t.target;t="string"===typeof v?v:"td, th";if(v!==z||null!==v)g(n.table().body()).on("click.dtr mousedown.dtr mouseup.dtr",t,function(x){if(g(n.table().node()).hasClass("collapsed")&&-1!==g.inArray(g(this).closest("tr").get(0),n.rows().nodes().toArray())){if("number"===typeof v){var A=0>v?n.columns().eq(0).length+v:v;if(n.cell(this).index().column!==A)return}A=n.row(g(this).closest("tr"));"click"===x.type?m._detailsDisplay(A,!1):"mousedown"===x.type?g(this).css("outline","none"):"mouseup"===
-x.type&&g(this).trigger("blur").css("outline","")}})},_detailsObj:function(m){var n=this,t=this.s.dt;return g.map(this.s.columns,function(v,x){if(!v.never&&!v.control)return v=t.settings()[0].aoColumns[x],{className:v.sClass,columnIndex:x,data:t.cell(m,x).render(n.c.orthogonal),hidden:t.column(x).visible()&&!n.s.current[x],rowIndex:m,title:null!==v.sTitle?v.sTitle:g(t.column(x).header()).text()}})},_find:function(m){for(var n=this.c.breakpoints,t=0,v=n.length;t<v;t++)if(n[t].name===m)return n[t]},
-_redrawChildren:function(){var m=this,n=this.s.dt;n.rows({page:"current"}).iterator("row",function(t,v){n.row(v);m._detailsDisplay(n.row(v),!0)})},_resize:function(m){var n=this,t=this.s.dt,v=g(M).innerWidth(),x=this.c.breakpoints,A=x[0].name,B=this.s.columns,y,H=this.s.current.slice();for(y=x.length-1;0<=y;y--)if(v<=x[y].width){A=x[y].name;break}var G=this._columnsVisiblity(A);this.s.current=G;x=!1;y=0;for(v=B.length;y<v;y++)if(!1===G[y]&&!B[y].never&&!B[y].control&&!1===!t.column(y).visible()){x=
-!0;break}g(t.table().node()).toggleClass("collapsed",x);var N=!1,L=0;t.columns().eq(0).each(function(P,O){!0===G[O]&&L++;if(m||G[O]!==H[O])N=!0,n._setColumnVis(P,G[O])});N&&(this._redrawChildren(),g(t.table().node()).trigger("responsive-resize.dt",[t,this.s.current]),0===t.page.info().recordsDisplay&&g("td",t.table().body()).eq(0).attr("colspan",L));n._controlClass()},_resizeAuto:function(){var m=this.s.dt,n=this.s.columns;if(this.c.auto&&-1!==g.inArray(!0,g.map(n,function(y){return y.auto}))){g.isEmptyObject(r)||
-g.each(r,function(y){y=y.split("-");pa(m,1*y[0],1*y[1])});m.table().node();var t=m.table().node().cloneNode(!1),v=g(m.table().header().cloneNode(!1)).appendTo(t),x=g(m.table().body()).clone(!1,!1).empty().appendTo(t);t.style.width="auto";var A=m.columns().header().filter(function(y){return m.column(y).visible()}).to$().clone(!1).css("display","table-cell").css("width","auto").css("min-width",0);g(x).append(g(m.rows({page:"current"}).nodes()).clone(!1)).find("th, td").css("display","");if(x=m.table().footer()){x=
-g(x.cloneNode(!1)).appendTo(t);var B=m.columns().footer().filter(function(y){return m.column(y).visible()}).to$().clone(!1).css("display","table-cell");g("<tr/>").append(B).appendTo(x)}g("<tr/>").append(A).appendTo(v);"inline"===this.c.details.type&&g(t).addClass("dtr-inline collapsed");g(t).find("[name]").removeAttr("name");g(t).css("position","relative");t=g("<div/>").css({width:1,height:1,overflow:"hidden",clear:"both"}).append(t);t.insertBefore(m.table().node());A.each(function(y){y=m.column.index("fromVisible",
-y);n[y].minWidth=this.offsetWidth||0});t.remove()}},_responsiveOnlyHidden:function(){var m=this.s.dt;return g.map(this.s.current,function(n,t){return!1===m.column(t).visible()?!0:n})},_setColumnVis:function(m,n){var t=this.s.dt,v=n?"":"none";g(t.column(m).header()).css("display",v).toggleClass("dtr-hidden",!n);g(t.column(m).footer()).css("display",v).toggleClass("dtr-hidden",!n);t.column(m).nodes().to$().css("display",v).toggleClass("dtr-hidden",!n);g.isEmptyObject(r)||t.cells(null,m).indexes().each(function(x){pa(t,
-x.row,x.column)})},_tabIndexes:function(){var m=this.s.dt,n=m.cells({page:"current"}).nodes().to$(),t=m.settings()[0],v=this.c.details.target;n.filter("[data-dtr-keyboard]").removeData("[data-dtr-keyboard]");"number"===typeof v?m.cells(null,v,{page:"current"}).nodes().to$().attr("tabIndex",t.iTabIndex).data("dtr-keyboard",1):("td:first-child, th:first-child"===v&&(v=">td:first-child, >th:first-child"),g(v,m.rows({page:"current"}).nodes()).attr("tabIndex",t.iTabIndex).data("dtr-keyboard",1))}});ba.breakpoints=
-[{name:"desktop",width:Infinity},{name:"tablet-l",width:1024},{name:"tablet-p",width:768},{name:"mobile-l",width:480},{name:"mobile-p",width:320}];ba.display={childRow:function(m,n,t){if(n){if(g(m.node()).hasClass("parent"))return m.child(t(),"child").show(),!0}else{if(m.child.isShown())return m.child(!1),g(m.node()).removeClass("parent"),!1;m.child(t(),"child").show();g(m.node()).addClass("parent");return!0}},childRowImmediate:function(m,n,t){if(!n&&m.child.isShown()||!m.responsive.hasHidden())return m.child(!1),
-g(m.node()).removeClass("parent"),!1;m.child(t(),"child").show();g(m.node()).addClass("parent");return!0},modal:function(m){return function(n,t,v){if(t)g("div.dtr-modal-content").empty().append(v());else{var x=function(){A.remove();g(X).off("keypress.dtr")},A=g('<div class="dtr-modal"/>').append(g('<div class="dtr-modal-display"/>').append(g('<div class="dtr-modal-content"/>').append(v())).append(g('<div class="dtr-modal-close">&times;</div>').click(function(){x()}))).append(g('<div class="dtr-modal-background"/>').click(function(){x()})).appendTo("body");
-g(X).on("keyup.dtr",function(B){27===B.keyCode&&(B.stopPropagation(),x())})}m&&m.header&&g("div.dtr-modal-content").prepend("<h2>"+m.header(n)+"</h2>")}}};var r={};ba.renderer={listHiddenNodes:function(){return function(m,n,t){var v=g('<ul data-dtr-index="'+n+'" class="dtr-details"/>'),x=!1;g.each(t,function(A,B){if(B.hidden){A=g("<li "+(B.className?'class="'+B.className+'"':"")+' data-dtr-index="'+B.columnIndex+'" data-dt-row="'+B.rowIndex+'" data-dt-column="'+B.columnIndex+'"><span class="dtr-title">'+
-B.title+"</span> </li>");var y=A.append,H=g('<span class="dtr-data"/>'),G=H.append;var N=B.rowIndex,L=B.columnIndex;B=N+"-"+L;if(r[B])B=r[B];else{var P=[];N=m.cell(N,L).node().childNodes;L=0;for(var O=N.length;L<O;L++)P.push(N[L]);B=r[B]=P}y.call(A,G.call(H,B)).appendTo(v);x=!0}});return x?v:!1}},listHidden:function(){return function(m,n,t){return(m=g.map(t,function(v){var x=v.className?'class="'+v.className+'"':"";return v.hidden?"<li "+x+' data-dtr-index="'+v.columnIndex+'" data-dt-row="'+v.rowIndex+
-'" data-dt-column="'+v.columnIndex+'"><span class="dtr-title">'+v.title+'</span> <span class="dtr-data">'+v.data+"</span></li>":""}).join(""))?g('<ul data-dtr-index="'+n+'" class="dtr-details"/>').append(m):!1}},tableAll:function(m){m=g.extend({tableClass:""},m);return function(n,t,v){n=g.map(v,function(x){return"<tr "+(x.className?'class="'+x.className+'"':"")+' data-dt-row="'+x.rowIndex+'" data-dt-column="'+x.columnIndex+'"><td>'+x.title+":</td> <td>"+x.data+"</td></tr>"}).join("");return g('<table class="'+
-m.tableClass+' dtr-details" width="100%"/>').append(n)}}};ba.defaults={breakpoints:ba.breakpoints,auto:!0,details:{display:ba.display.childRow,renderer:ba.renderer.listHidden(),target:0,type:"inline"},orthogonal:"display"};var w=g.fn.dataTable.Api;w.register("responsive()",function(){return this});w.register("responsive.index()",function(m){m=g(m);return{column:m.data("dtr-index"),row:m.parent().data("dtr-index")}});w.register("responsive.rebuild()",function(){return this.iterator("table",function(m){m._responsive&&
-m._responsive._classLogic()})});w.register("responsive.recalc()",function(){return this.iterator("table",function(m){m._responsive&&(m._responsive._resizeAuto(),m._responsive._resize())})});w.register("responsive.hasHidden()",function(){var m=this.context[0];return m._responsive?-1!==g.inArray(!1,m._responsive._responsiveOnlyHidden()):!1});w.registerPlural("columns().responsiveHidden()","column().responsiveHidden()",function(){return this.iterator("column",function(m,n){return m._responsive?m._responsive._responsiveOnlyHidden()[n]:
-!1},1)});ba.version="2.3.0";g.fn.dataTable.Responsive=ba;g.fn.DataTable.Responsive=ba;g(X).on("preInit.dt.dtr",function(m,n,t){"dt"===m.namespace&&(g(n.nTable).hasClass("responsive")||g(n.nTable).hasClass("dt-responsive")||n.oInit.responsive||ea.defaults.responsive)&&(m=n.oInit.responsive,!1!==m&&new ba(n,g.isPlainObject(m)?m:{}))});return ba});
-(function(g,M){function X(){this.data=[];this.slices=[];this.availableRecords=-1}var z=0,pa=function(r,w){for(var m=0,n=w.length;m<n;m++)if(r==w[m])return m;return-1},ea=function(r,w,m){r=r.split("?");w&&(r[0]+="."+w);m&&(1<r.length?r[1]+="&"+m:r.push(m));return r.join("?")},ba=function(r,w){var m=function(v){return-1!=v.indexOf(".")||"("==v[0]},n=function(v,x){return v&&v.split("&").filter(function(A){A=A.split("=");return 1<A.length&&x(S3.urlDecode(A[0]))})||[]};r=r.split("?");w=w.split("?");var t=
-n(r[1],function(v){return!m(v)&&"w"!=v[0]});r[1]=t.concat(n(w[1],m)).join("&");return r.join("?")};X.prototype.store=function(r,w,m){m!==M&&(this.availableRecords=m);if(m=w.length){var n=this.data,t=this.slices;w.forEach(function(x,A){n[r+A]=x});t.push([r,r+m]);t.sort(function(x,A){var B=x[0]-A[0];return 0!==B?B:x[1]-A[1]});if(1<t.length){var v=[];w=t.reduce(function(x,A){return x[1]<A[0]||x[0]>A[1]?(v.push(x),A):[Math.min(x[0],A[0]),Math.max(x[1],A[1])]});v.push(w);this.slices=v}}};X.prototype.retrieve=
-function(r,w){var m=this.availableRecords;if(0>m)return null;0>r&&(r=0);if(r>=m)return[];w=r+w;w>m&&(w=m);m=this.slices;for(var n,t=m.length,v=0;v<t;v++)if(n=m[v],r>=n[0]&&w<=n[1])return this.data.slice(r,w);return null};X.prototype.clear=function(){this.cache=[];this.slices=[];this.availableRecords=-1};g.widget("s3.dataTableS3",{options:{destroy:!1,deselectedIndicator:!1},_create:function(){this.id=z;z+=1;this.eventNamespace=".dataTableS3"},_init:function(){var r=g(this.element).attr("id");this.tableID=
-r;this.selector="#"+r;this.refresh()},_destroy:function(){g.Widget.prototype.destroy.call(this)},refresh:function(){var r=g(this.element),w=this.options;this._unbindEvents();var m=this._parseConfig();if(m!==M){var n=!0,t=!0,v=null;m.pagination?(this.ajaxUrl=m.ajaxUrl,v=this._pipeline({cache:this._initCache()})):t=n=!1;this._renderBulkActions();r.dataTable({ajax:v,autoWidth:!1,columns:this.columnConfigs,deferRender:!0,destroy:w.destroy,dom:m.dom,lengthMenu:m.lengthMenu,order:m.order,orderFixed:m.group,
-ordering:!0,pageLength:m.pageLength,pagingType:m.pagingType,processing:t,searchDelay:450,searching:m.searching,serverSide:n,search:{smart:n},language:{aria:{sortAscending:": "+i18n.sortAscending,sortDescending:": "+i18n.sortDescending},paginate:{first:i18n.first,last:i18n.last,next:i18n.next,previous:i18n.previous},emptyTable:i18n.emptyTable,info:i18n.info,infoEmpty:i18n.infoEmpty,infoFiltered:i18n.infoFiltered,infoThousands:i18n.infoThousands,lengthMenu:i18n.lengthMenu,loadingRecords:i18n.loadingRecords+
-"...",processing:i18n.processing+"...",search:i18n.search+":",zeroRecords:i18n.zeroRecords},rowCallback:this._rowCallback(),drawCallback:this._drawCallback(),initComplete:S3.dataTables.initComplete});this._bindEvents()}},_parseConfig:function(){var r=g(this.element),w=g(this.selector+"_configurations");if(w.length){this.tableConfig=w=JSON.parse(w.val());w.rowActions.length?w.rowActionsJSON=!0:(w.rowActionsJSON=!1,w.rowActions=S3.dataTables.Actions?S3.dataTables.Actions:[]);var m=[];r=g("thead tr",
-r).children().length;for(var n=0;n<r;n++)m[n]=null;0<w.rowActions.length&&(m[w.actionCol]={sTitle:" ",bSortable:!1});w.bulkActions&&(m[w.bulkCol]={sTitle:'<div class="bulk-select-options"><input class="bulk-select-all" type="checkbox">'+i18n.selectAll+"</input></div>",bSortable:!1});if(w.colWidths){var t;r=w.colWidths;for(t in r)null!=m[t]?m[t].sWidth=r[t]:m[t]={sWidth:r[t]}}this.columnConfigs=m;return w}},_pipeline:function(r){var w=g.extend({cache:{},pages:2,data:null,method:"GET"},r);r=w.cache;
-var m=r.cacheLastRequest||null,n=r.cacheLastJson||null,t=r.cacheLower;t===M&&(t=-1);var v=new X;n&&-1!=t&&v.store(t,n.data,n.recordsFiltered||n.recordsTotal);var x=this;return function(A,B,y){if(this.hasOwnProperty("nTable")){if(A=y.sAjaxSource)x.ajaxUrl=A,y.sAjaxSource=null;m=n=null;t=-1;v.clear();B({})}else{var H=!1,G=A.start,N=A.start,L=A.length,P=A.recordsTotal,O=P;n&&(n.recordsTotal!==M&&(P=n.recordsTotal),O=n.recordsFiltered!==M?n.recordsFiltered:P);x.totalRecords=P;-1==L&&(G=0,O!==M?L=O:H=
-!0);if(!H)if(P=G+L,y.clearCache)v.clear(),y.clearCache=!1,H=!0;else if(!m||JSON.stringify(A.order)===JSON.stringify(m.order)&&JSON.stringify(A.columns)===JSON.stringify(m.columns)&&JSON.stringify(A.search)===JSON.stringify(m.search)){var Z=v.retrieve(G,P-G);null===Z&&(H=!0)}else v.clear(),H=!0;m=g.extend(!0,{},A);if(H){G<t&&(G-=L*(w.pages-1),0>G&&(G=0));t=G;A.start=G;A.length=L*w.pages;g.isFunction(w.data)?(Z=w.data(A))&&g.extend(A,Z):g.isPlainObject(w.data)&&g.extend(A,w.data);Z=[{name:"draw",value:A.draw},
-{name:"limit",value:-1==L?"none":A.length}];0!=G&&Z.push({name:"start",value:G});A.search&&A.search.value&&(Z.push({name:"sSearch",value:A.search.value}),Z.push({name:"iColumns",value:A.columns.length}));if(H=A.order.length){Z.push({name:"iSortingCols",value:H});O=x.columnConfigs;var fa;for(P=0;P<O.length;P++)(fa=O[P])&&!fa.bSortable&&Z.push({name:"bSortable_"+P,value:"false"});for(P=0;P<H;P++)O=A.order[P],Z.push({name:"iSortCol_"+P,value:O.column}),Z.push({name:"sSortDir_"+P,value:O.dir})}A=g.ajaxS3;
-g.searchS3!==M&&(A=g.searchS3);y.jqXHR=A({type:w.method,url:x.ajaxUrl,data:Z,dataType:"json",cache:!1,success:function(qa){var Ca=x.totalRecords;qa.recordsFiltered!==M&&(Ca=qa.recordsFiltered);v.store(G,qa.data,Ca);n=g.extend(!0,{},qa);G!=N&&qa.data.splice(0,N-G);-1!=L&&qa.data.splice(L,qa.data.length);B(qa)}})}else y=g.extend(!0,{},n,{draw:A.draw}),y.data=Z,B(y)}}},_initCache:function(){var r=g(this.selector+"_dataTable_cache");return this.pipelineCache=r=0<r.length?JSON.parse(r.val()):{}},_headerCallback:function(){},
-_rowCallback:function(){var r=this;return function(w,m){var n=r.tableConfig,t=n.actionCol,v=/>(.*)</i.exec(m[t]);v=null===v?m[t]:v[1];var x=n.rowActions;if(x.length||n.bulkActions){for(var A=[],B=0;B<x.length;B++)A.push(r._renderActionButton(v,x[B]));g("td:eq("+t+")",w).addClass("actions").html(A.join(""))}n.bulkActions&&r._bulkSelect(w,pa(v,r.selectedRows));if(n=n.rowStyles){t=g(w);for(var y in n)-1!=pa(v,n[y])&&t.addClass(y)}r._truncateCellContents(w,m);return w}},_drawCallback:function(){var r=
-this;return function(w){var m=g(r.element),n=r.selector,t=m.closest(".dt-wrapper"),v=r.ajaxUrl;v&&t.find("a.permalink").each(function(){var G=g(this);G.attr("href",ba(G.attr("href"),v))});var x=w.fnRecordsDisplay();1<Math.ceil(x/w._iDisplayLength)?g(n+"_paginate").show():g(n+"_paginate").hide();0===x?t.find(".dt-export-options").hide():t.find(".dt-export-options").show();g(n+" .s3_modal").length&&S3.addModals();n=m.closest(".dt-contents");n.length&&(0<x?n.find(".empty").hide().siblings(".dt-wrapper").show():
-n.find(".empty").show().siblings(".dt-wrapper").hide());var A=r.tableConfig;if((x=A.group)&&x.length){var B=[];x.forEach(function(G,N){r._renderGroups(w,G[0],A.groupTitles[N]||[],A.groupTotals[N]||{},B,N+1);B.push(G[0])});if(A.shrinkGroupedRows){var y,H;g("tbody tr",m).each(function(){var G=g(this);G.hasClass("group")?(y=G.data("level"),H=G.data("group")):y&&H&&!G.hasClass("spacer")&&G.addClass("xgroup_"+y+"_"+H).addClass("collapsable")});g(".collapsable").hide()}}r.doubleScroll()}},_renderActionButton:function(r,
-w){var m="",n=w.restrict;if(n&&n.constructor===Array&&-1==n.indexOf(r)||(n=w.exclude)&&n.constructor===Array&&-1!=n.indexOf(r))return m;m=w._class;n=w.label;var t=w._title||n;w.icon?n='<i class="'+w.icon+'" alt="'+n+'"> </i>':w.img&&(n='<img src="'+w.icon+'" alt="'+n+'"></img>');var v=w._disabled?' disabled="disabled"':"";var x=/%5Bid%5D/g;w._onclick?(r=w._onclick.replace(x,r),m='<a class="'+m+'" onclick="'+r+v+'">'+n+"</a>"):w.url?(x=w.url.replace(x,r),(w=w._target||"")&&(w=' target="'+w+'"'),m=
-'<a db_id="'+r+'" class="'+m+'" href="'+x+'" title="'+t+'"'+w+v+">"+n+"</a>"):((w=w._ajaxurl||"")&&(w=' data-url="'+w+'"'),m='<a db_id="'+r+'" class="'+m+'" title="'+t+'"'+w+v+">"+n+"</a>");return m},ajaxAction:function(r){var w=g(this.element);return function(m){m.stopPropagation();m.preventDefault();if(!r||confirm(r)){var n=g(this);m=n.attr("db_id");n=n.data("url");var t={},v=w.closest(".dt-wrapper").find('input[name="_formkey"]').first().val();v!==M&&(t._formkey=v);n&&m&&g.ajaxS3({url:n.replace(/%5Bid%5D/g,
-m),type:"POST",dataType:"json",data:t,success:function(){w.dataTable().fnReloadAjax()}})}}},_truncateCellContents:function(r,w){var m=this.tableConfig,n=m.textMaxLength,t=m.textShrinkLength,v=null,x=0;m.group&&(v=m.group.map(function(y){return y[0]}));for(m=0;m<w.length;m++)if(-1==g.inArray(m,v)){var A=w[m];if(A.length>n&&!A.match(/<.*>/)){var B='<div class="dt-truncate"><span class="ui-icon ui-icon-zoomin" style="float:right"></span>'+A.substr(0,t)+"&hellip;</div>";A='<div  style="display:none" class="dt-truncate"><span class="ui-icon ui-icon-zoomout" style="float:right"></span>'+
-A+"</div>";g("td:eq("+x+")",r).html(B+A)}x++}},doubleScroll:function(){var r=g(this.element);if(r.hasClass("doublescroll")&&!r.hasClass("responsive"))try{r.closest(".dataTable_table").doubleScroll({contentElement:r,resetOnWindowResize:!0})}catch(w){console.log("dataTableS3: doubleScroll not available")}},_renderBulkActions:function(){var r=this.tableConfig.bulkActions;if(r){var w=g('<div class="dataTable-action">');r.forEach(function(m){var n;if(m.constructor===Array){var t=m[0];var v=m[1];2<m.length&&
-(n=m[2])}else t=v=m;m=g('<input type="submit" class="selected-action">').attr({id:v+"-selected-action",name:v,value:t}).appendTo(w);n&&m.addClass(n)});this.bulkActionControls=w;r=JSON.parse(g(this.selector+"_dataTable_bulkSelection").val());null===r&&(r=[]);this.selectedRows=r;g(this.selector+"_dataTable_bulkSelectAll").val()?this.selectionMode="Exclusive":this.selectionMode="Inclusive"}},_bulkSelect:function(r,w){var m=g(this.element),n=this.tableConfig,t=this.selectedRows.length,v=this.totalRecords,
-x=g(".bulk-select-options",m),A=g(".bulk-select-all",m),B=g(".bulk-deselected",m),y=g(".bulk-total-available",m),H=g(".bulk-total-selected",m),G=y.length&&y.length;"Inclusive"==this.selectionMode?(G?(H.text(t),y.text(v)):B.remove(),B=n.bulkSingle,-1==w?(g(r).removeClass("row_selected"),g(".bulkcheckbox",r).prop("checked",!1)):(B&&g(r).closest("table").find("tr").removeClass("row_selected").find(".bulkcheckbox").prop("checked",!1),g(r).addClass("row_selected"),g(".bulkcheckbox",r).prop("checked",!0)),
-B||t!=v||(A.prop("checked",!0),this.selectionMode="Exclusive",this.selectedRows=[])):(G?(H.text(parseInt(y.text(),10)-t),y.text(v)):t&&t!=v?(!B.length&&this.options.deselectedIndicator&&(B=g('<span class="bulk-deselected">').appendTo(x)),B.html("[-"+t+"]")):B.remove(),-1==w?(g(r).addClass("row_selected"),g(".bulkcheckbox",r).prop("checked",!0)):(g(r).removeClass("row_selected"),g(".bulkcheckbox",r).prop("checked",!1)),t==v&&(A.prop("checked",!1),this.selectionMode="Inclusive",this.selectedRows=[]));
-n.bulkActions&&(g(this.selector+"_dataTable_bulkMode").val(this.selectionMode),g(this.selector+"_dataTable_bulkSelection").val(this.selectedRows.join(",")),this.bulkActionControls.insertBefore(x),r=this.selectedRows.length,"Exclusive"==this.selectionMode&&(r=v-r),g(".selected-action",m).prop("disabled",0==r),g(".pair-action",m).prop("disabled",2!=r))},_bulkSelectRow:function(){var r=this;return function(){var w=g(this),m=w.data("dbid"),n=r.selectedRows,t=pa(m,n);-1==t?(r.tableConfig.bulkSingle?r.selectedRows=
-[m]:n.push(m),t=0):(n.splice(t,1),t=-1);r._bulkSelect(w.closest("tr"),t)}},_bulkSelectAll:function(){var r=g(this.element),w=this;return function(){w.selectedRows=[];g(this).prop("checked")?w.selectionMode="Exclusive":w.selectionMode="Inclusive";r.dataTable().api().draw(!1)}},_renderGroups:function(r,w,m,n,t,v){var x=r.aoColumns.length,A=g(this.element);A=g("tbody tr",A);for(var B,y,H,G=1,N=0,L=0,P="",O=0;O<A.length;O++)if(B=g(A[O]),!B.hasClass("spacer")&&r.aoData.length)if(y=r.aoData[r.aiDisplay[N]]._aData,
-B.hasClass("group")){H=M;var Z=B.data("group");P=t.map(function(fa){return this[fa]},y).join("_")}else{y=y[w];if(y!==H){for(;m.length>L&&y!=m[L][0];)H=m[L][1],this._insertGroupHeader(B,H,v,G,Z,x,n,P),L++,G++;m.length>L?(H=m[L][1],L++):H=y;this._insertGroupHeader(B,H,v,G,Z,x,n,P,!0);G++;H=y}N+=1;this.tableConfig.shrinkGroupedRows&&B.hide()}for(B=A[A.length-1];m.length>L;)H=m[L][1],this._insertGroupHeader(B,H,v,G,Z,x,n,P,!1,!0),L++,G++},_insertGroupHeader:function(r,w,m,n,t,v,x,A,B,y){var H=this.tableConfig;
-n=g('<tr class="group">').data({level:""+m,group:""+n}).addClass("level_"+m);var G=H.shrinkGroupedRows;if(t){var N=""+(m-1);n.addClass("xgroup_"+N+"_"+t).data({parentLevel:N,parentGroup:t});G&&n.addClass("collapsable")}t=g("<td>").attr("colspan",v).appendTo(n);for(N=1;N<m;N++)g('<span class="group-indent">').appendTo(t);1<m&&(g('<span class="ui-icon ui-icon-triangle-1-e group-closed">').appendTo(t),g('<span class="ui-icon ui-icon-triangle-1-s group-opened">').hide().appendTo(t));N="";null!=x[w]?N=
-" ("+x[w]+")":(A+=w,null!=x[A]&&(N=" ("+x[A]+")"));t.append(w+N);G&&B&&(w=H.groupIcon|0,w=w.length>=m?w[m-1]:"icon",x=g('<span class="group-expand">').appendTo(t),B=g('<span class="group-collapse">').hide().appendTo(t),"text"==w?(x.text("\u2192"),B.text("\u2193")):"icon"==w&&(x.addClass("ui-icon ui-icon-arrowthick-1-e"),B.addClass("ui-icon ui-icon-arrowthick-1-s")));y?n.insertAfter(r):n.insertBefore(r);H.groupSpacing&&(r=n.prevAll("tr.group").first(),r.length&&r.data("level")==m&&(r=r.data("group"),
-v=g("<td>").attr("colspan",v),v=g('<tr class="spacer">').append(v),G&&v.addClass("collapsable"),v.addClass("xgroup_"+m+"_"+r).insertBefore(n)))},_toggleGroup:function(r,w){switch(this.tableConfig.shrinkGroupedRows){case "individual":w?this._expandGroup(r):this._collapseGroup(r);break;case "accordion":if(w){this._expandGroup(r);w=".level_"+r.data("level");var m=r.data("parentGroup");m&&(w+=".xgroup_"+r.data("parentLevel")+"_"+m);var n=this;r.siblings("tr.group"+w).each(function(){n._collapseGroup(g(this))})}else this._collapseGroup(r)}},
-_expandGroup:function(r){var w=r.data("level"),m=r.data("group");r.siblings("tr.xgroup_"+w+"_"+m).show();g(".group-expand, .group-closed",r).hide();g(".group-collapse, .group-opened",r).show()},_collapseGroup:function(r){var w=r.data("level"),m=r.data("group"),n=this;r.siblings("tr.xgroup_"+w+"_"+m).each(function(){var t=g(this);t.hasClass("group")&&n._collapseGroup(t);t.hide()});g(".group-expand, .group-closed",r).show();g(".group-collapse, .group-opened",r).hide()},_exportFormat:function(){var r=
-g(this.element),w=this;return function(){var m=r.dataTable().fnSettings(),n=g(this).data("url"),t=g(this).data("extension");if(m){var v="id="+w.tableID,x=m.oPreviousSearch.sSearch,A=m.aaSorting,B=m.aaSortingFixed;m=m.aoColumns;x&&(v+="&sSearch="+x+"&iColumns="+m.length);null!==B&&(A=B.concat(A));m.forEach(function(y,H){y.bSortable||(v+="&bSortable_"+H+"=false")});v+="&iSortingCols="+A.length;A.forEach(function(y,H){v+="&iSortCol_"+H+"="+A[H][0]+"&sSortDir_"+H+"="+A[H][1]});n=ea(n,t,v)}else n=ea(n,
-t);g.searchDownloadS3!==M?g.searchDownloadS3(n,"_blank"):window.open(n)}},_initExportFormats:function(){var r=this._parseConfig();if(r!==M&&(r=r.ajaxUrl)&&S3.search!==M){var w=document.createElement("a");w.href=r;if(w.search){var m=w.search.slice(1).split("&").map(function(n){n=n.split("=");return[S3.urlDecode(n[0]),S3.urlDecode(n[1])]}).filter(function(n){return-1!=n[0].indexOf(".")});g(this.element).closest(".dt-wrapper").find(".dt-export").each(function(){var n=g(this),t=n.data("url");t&&n.data("url",
-S3.search.filterURL(t,m))})}}},_bindEvents:function(){var r=g(this.element),w=this.eventNamespace,m=this;r.on("click"+w,".dt-truncate .ui-icon-zoomin, .dt-truncate .ui-icon-zoomout",function(){g(this).parent().toggle().siblings(".dt-truncate").toggle();return!1});this._initExportFormats();r.closest(".dt-wrapper").find(".dt-export").on("click"+w,this._exportFormat());r.on("click"+w,".dt-ajax-delete",this.ajaxAction(i18n.delete_confirmation));r.on("click"+w,".group-collapse, .group-expand",function(){var n=
-g(this),t=n.closest("tr.group"),v=!0;n.hasClass("group-collapse")&&(v=!1);m._toggleGroup(t,v)});if(this.tableConfig.bulkActions){if(this.tableConfig.bulkSingle)g(".bulk-select-options",r).hide();else r.on("click"+w,".bulk-select-all",this._bulkSelectAll());r.on("click"+w,".bulkcheckbox",this._bulkSelectRow())}return!0},_unbindEvents:function(){var r=g(this.element),w=this.eventNamespace;r.off(w);r.closest(".dt-wrapper").find(".dt-export").off(w);return!0}});g.fn.dataTable.Api.register("clearPipeline()",
-function(){return this.iterator("table",function(r){r.clearCache=!0})});g.fn.dataTableExt.oApi.fnReloadAjax=function(r,w){"undefined"!=w&&null!=w&&(r.sAjaxSource=w);this.oApi._fnProcessingDisplay(r,!0);var m=this;r.ajax({},function(){m.oApi._fnClearTable(r);m.fnDraw()},r)};g(function(){if(S3.dataTables){var r=S3.dataTables.id;r&&r.forEach(function(w){g("#"+w).dataTableS3({destroy:!1})})}})})(jQuery);
+(function(factory){"use strict";if(typeof define==='function'&&define.amd){define(['jquery'],function($){return factory($,window,document);});}
+else if(typeof exports==='object'){module.exports=function(root,$){if(!root){root=window;}
+if(!$){$=typeof window!=='undefined'?require('jquery'):require('jquery')(root);}
+return factory($,root,root.document);};}
+else{window.DataTable=factory(jQuery,window,document);}}
+(function($,window,document,undefined){"use strict";var DataTable=function(selector,options)
+{if(this instanceof DataTable){return $(selector).DataTable(options);}
+else{options=selector;}
+this.$=function(sSelector,oOpts)
+{return this.api(true).$(sSelector,oOpts);};this._=function(sSelector,oOpts)
+{return this.api(true).rows(sSelector,oOpts).data();};this.api=function(traditional)
+{return traditional?new _Api(_fnSettingsFromNode(this[_ext.iApiIndex])):new _Api(this);};this.fnAddData=function(data,redraw)
+{var api=this.api(true);var rows=Array.isArray(data)&&(Array.isArray(data[0])||$.isPlainObject(data[0]))?api.rows.add(data):api.row.add(data);if(redraw===undefined||redraw){api.draw();}
+return rows.flatten().toArray();};this.fnAdjustColumnSizing=function(bRedraw)
+{var api=this.api(true).columns.adjust();var settings=api.settings()[0];var scroll=settings.oScroll;if(bRedraw===undefined||bRedraw){api.draw(false);}
+else if(scroll.sX!==""||scroll.sY!==""){_fnScrollDraw(settings);}};this.fnClearTable=function(bRedraw)
+{var api=this.api(true).clear();if(bRedraw===undefined||bRedraw){api.draw();}};this.fnClose=function(nTr)
+{this.api(true).row(nTr).child.hide();};this.fnDeleteRow=function(target,callback,redraw)
+{var api=this.api(true);var rows=api.rows(target);var settings=rows.settings()[0];var data=settings.aoData[rows[0][0]];rows.remove();if(callback){callback.call(this,settings,data);}
+if(redraw===undefined||redraw){api.draw();}
+return data;};this.fnDestroy=function(remove)
+{this.api(true).destroy(remove);};this.fnDraw=function(complete)
+{this.api(true).draw(complete);};this.fnFilter=function(sInput,iColumn,bRegex,bSmart,bShowGlobal,bCaseInsensitive)
+{var api=this.api(true);if(iColumn===null||iColumn===undefined){api.search(sInput,bRegex,bSmart,bCaseInsensitive);}
+else{api.column(iColumn).search(sInput,bRegex,bSmart,bCaseInsensitive);}
+api.draw();};this.fnGetData=function(src,col)
+{var api=this.api(true);if(src!==undefined){var type=src.nodeName?src.nodeName.toLowerCase():'';return col!==undefined||type=='td'||type=='th'?api.cell(src,col).data():api.row(src).data()||null;}
+return api.data().toArray();};this.fnGetNodes=function(iRow)
+{var api=this.api(true);return iRow!==undefined?api.row(iRow).node():api.rows().nodes().flatten().toArray();};this.fnGetPosition=function(node)
+{var api=this.api(true);var nodeName=node.nodeName.toUpperCase();if(nodeName=='TR'){return api.row(node).index();}
+else if(nodeName=='TD'||nodeName=='TH'){var cell=api.cell(node).index();return[cell.row,cell.columnVisible,cell.column];}
+return null;};this.fnIsOpen=function(nTr)
+{return this.api(true).row(nTr).child.isShown();};this.fnOpen=function(nTr,mHtml,sClass)
+{return this.api(true).row(nTr).child(mHtml,sClass).show().child()[0];};this.fnPageChange=function(mAction,bRedraw)
+{var api=this.api(true).page(mAction);if(bRedraw===undefined||bRedraw){api.draw(false);}};this.fnSetColumnVis=function(iCol,bShow,bRedraw)
+{var api=this.api(true).column(iCol).visible(bShow);if(bRedraw===undefined||bRedraw){api.columns.adjust().draw();}};this.fnSettings=function()
+{return _fnSettingsFromNode(this[_ext.iApiIndex]);};this.fnSort=function(aaSort)
+{this.api(true).order(aaSort).draw();};this.fnSortListener=function(nNode,iColumn,fnCallback)
+{this.api(true).order.listener(nNode,iColumn,fnCallback);};this.fnUpdate=function(mData,mRow,iColumn,bRedraw,bAction)
+{var api=this.api(true);if(iColumn===undefined||iColumn===null){api.row(mRow).data(mData);}
+else{api.cell(mRow,iColumn).data(mData);}
+if(bAction===undefined||bAction){api.columns.adjust();}
+if(bRedraw===undefined||bRedraw){api.draw();}
+return 0;};this.fnVersionCheck=_ext.fnVersionCheck;var _that=this;var emptyInit=options===undefined;var len=this.length;if(emptyInit){options={};}
+this.oApi=this.internal=_ext.internal;for(var fn in DataTable.ext.internal){if(fn){this[fn]=_fnExternApiFunc(fn);}}
+this.each(function(){var o={};var oInit=len>1?_fnExtend(o,options,true):options;var i=0,iLen,j,jLen,k,kLen;var sId=this.getAttribute('id');var bInitHandedOff=false;var defaults=DataTable.defaults;var $this=$(this);if(this.nodeName.toLowerCase()!='table')
+{_fnLog(null,0,'Non-table node initialisation ('+this.nodeName+')',2);return;}
+_fnCompatOpts(defaults);_fnCompatCols(defaults.column);_fnCamelToHungarian(defaults,defaults,true);_fnCamelToHungarian(defaults.column,defaults.column,true);_fnCamelToHungarian(defaults,$.extend(oInit,$this.data()),true);var allSettings=DataTable.settings;for(i=0,iLen=allSettings.length;i<iLen;i++)
+{var s=allSettings[i];if(s.nTable==this||(s.nTHead&&s.nTHead.parentNode==this)||(s.nTFoot&&s.nTFoot.parentNode==this)){var bRetrieve=oInit.bRetrieve!==undefined?oInit.bRetrieve:defaults.bRetrieve;var bDestroy=oInit.bDestroy!==undefined?oInit.bDestroy:defaults.bDestroy;if(emptyInit||bRetrieve)
+{return s.oInstance;}
+else if(bDestroy)
+{s.oInstance.fnDestroy();break;}
+else
+{_fnLog(s,0,'Cannot reinitialise DataTable',3);return;}}
+if(s.sTableId==this.id)
+{allSettings.splice(i,1);break;}}
+if(sId===null||sId==="")
+{sId="DataTables_Table_"+(DataTable.ext._unique++);this.id=sId;}
+var oSettings=$.extend(true,{},DataTable.models.oSettings,{"sDestroyWidth":$this[0].style.width,"sInstance":sId,"sTableId":sId});oSettings.nTable=this;oSettings.oApi=_that.internal;oSettings.oInit=oInit;allSettings.push(oSettings);oSettings.oInstance=(_that.length===1)?_that:$this.dataTable();_fnCompatOpts(oInit);_fnLanguageCompat(oInit.oLanguage);if(oInit.aLengthMenu&&!oInit.iDisplayLength)
+{oInit.iDisplayLength=Array.isArray(oInit.aLengthMenu[0])?oInit.aLengthMenu[0][0]:oInit.aLengthMenu[0];}
+oInit=_fnExtend($.extend(true,{},defaults),oInit);_fnMap(oSettings.oFeatures,oInit,["bPaginate","bLengthChange","bFilter","bSort","bSortMulti","bInfo","bProcessing","bAutoWidth","bSortClasses","bServerSide","bDeferRender"]);_fnMap(oSettings,oInit,["asStripeClasses","ajax","fnServerData","fnFormatNumber","sServerMethod","aaSorting","aaSortingFixed","aLengthMenu","sPaginationType","sAjaxSource","sAjaxDataProp","iStateDuration","sDom","bSortCellsTop","iTabIndex","fnStateLoadCallback","fnStateSaveCallback","renderer","searchDelay","rowId",["iCookieDuration","iStateDuration"],["oSearch","oPreviousSearch"],["aoSearchCols","aoPreSearchCols"],["iDisplayLength","_iDisplayLength"]]);_fnMap(oSettings.oScroll,oInit,[["sScrollX","sX"],["sScrollXInner","sXInner"],["sScrollY","sY"],["bScrollCollapse","bCollapse"]]);_fnMap(oSettings.oLanguage,oInit,"fnInfoCallback");_fnCallbackReg(oSettings,'aoDrawCallback',oInit.fnDrawCallback,'user');_fnCallbackReg(oSettings,'aoServerParams',oInit.fnServerParams,'user');_fnCallbackReg(oSettings,'aoStateSaveParams',oInit.fnStateSaveParams,'user');_fnCallbackReg(oSettings,'aoStateLoadParams',oInit.fnStateLoadParams,'user');_fnCallbackReg(oSettings,'aoStateLoaded',oInit.fnStateLoaded,'user');_fnCallbackReg(oSettings,'aoRowCallback',oInit.fnRowCallback,'user');_fnCallbackReg(oSettings,'aoRowCreatedCallback',oInit.fnCreatedRow,'user');_fnCallbackReg(oSettings,'aoHeaderCallback',oInit.fnHeaderCallback,'user');_fnCallbackReg(oSettings,'aoFooterCallback',oInit.fnFooterCallback,'user');_fnCallbackReg(oSettings,'aoInitComplete',oInit.fnInitComplete,'user');_fnCallbackReg(oSettings,'aoPreDrawCallback',oInit.fnPreDrawCallback,'user');oSettings.rowIdFn=_fnGetObjectDataFn(oInit.rowId);_fnBrowserDetect(oSettings);var oClasses=oSettings.oClasses;$.extend(oClasses,DataTable.ext.classes,oInit.oClasses);$this.addClass(oClasses.sTable);if(oSettings.iInitDisplayStart===undefined)
+{oSettings.iInitDisplayStart=oInit.iDisplayStart;oSettings._iDisplayStart=oInit.iDisplayStart;}
+if(oInit.iDeferLoading!==null)
+{oSettings.bDeferLoading=true;var tmp=Array.isArray(oInit.iDeferLoading);oSettings._iRecordsDisplay=tmp?oInit.iDeferLoading[0]:oInit.iDeferLoading;oSettings._iRecordsTotal=tmp?oInit.iDeferLoading[1]:oInit.iDeferLoading;}
+var oLanguage=oSettings.oLanguage;$.extend(true,oLanguage,oInit.oLanguage);if(oLanguage.sUrl)
+{$.ajax({dataType:'json',url:oLanguage.sUrl,success:function(json){_fnCamelToHungarian(defaults.oLanguage,json);_fnLanguageCompat(json);$.extend(true,oLanguage,json,oSettings.oInit.oLanguage);_fnCallbackFire(oSettings,null,'i18n',[oSettings]);_fnInitialise(oSettings);},error:function(){_fnInitialise(oSettings);}});bInitHandedOff=true;}
+else{_fnCallbackFire(oSettings,null,'i18n',[oSettings]);}
+if(oInit.asStripeClasses===null)
+{oSettings.asStripeClasses=[oClasses.sStripeOdd,oClasses.sStripeEven];}
+var stripeClasses=oSettings.asStripeClasses;var rowOne=$this.children('tbody').find('tr').eq(0);if($.inArray(true,$.map(stripeClasses,function(el,i){return rowOne.hasClass(el);}))!==-1){$('tbody tr',this).removeClass(stripeClasses.join(' '));oSettings.asDestroyStripes=stripeClasses.slice();}
+var anThs=[];var aoColumnsInit;var nThead=this.getElementsByTagName('thead');if(nThead.length!==0)
+{_fnDetectHeader(oSettings.aoHeader,nThead[0]);anThs=_fnGetUniqueThs(oSettings);}
+if(oInit.aoColumns===null)
+{aoColumnsInit=[];for(i=0,iLen=anThs.length;i<iLen;i++)
+{aoColumnsInit.push(null);}}
+else
+{aoColumnsInit=oInit.aoColumns;}
+for(i=0,iLen=aoColumnsInit.length;i<iLen;i++)
+{_fnAddColumn(oSettings,anThs?anThs[i]:null);}
+_fnApplyColumnDefs(oSettings,oInit.aoColumnDefs,aoColumnsInit,function(iCol,oDef){_fnColumnOptions(oSettings,iCol,oDef);});if(rowOne.length){var a=function(cell,name){return cell.getAttribute('data-'+name)!==null?name:null;};$(rowOne[0]).children('th, td').each(function(i,cell){var col=oSettings.aoColumns[i];if(col.mData===i){var sort=a(cell,'sort')||a(cell,'order');var filter=a(cell,'filter')||a(cell,'search');if(sort!==null||filter!==null){col.mData={_:i+'.display',sort:sort!==null?i+'.@data-'+sort:undefined,type:sort!==null?i+'.@data-'+sort:undefined,filter:filter!==null?i+'.@data-'+filter:undefined};_fnColumnOptions(oSettings,i);}}});}
+var features=oSettings.oFeatures;var loadedInit=function(){if(oInit.aaSorting===undefined){var sorting=oSettings.aaSorting;for(i=0,iLen=sorting.length;i<iLen;i++){sorting[i][1]=oSettings.aoColumns[i].asSorting[0];}}
+_fnSortingClasses(oSettings);if(features.bSort){_fnCallbackReg(oSettings,'aoDrawCallback',function(){if(oSettings.bSorted){var aSort=_fnSortFlatten(oSettings);var sortedColumns={};$.each(aSort,function(i,val){sortedColumns[val.src]=val.dir;});_fnCallbackFire(oSettings,null,'order',[oSettings,aSort,sortedColumns]);_fnSortAria(oSettings);}});}
+_fnCallbackReg(oSettings,'aoDrawCallback',function(){if(oSettings.bSorted||_fnDataSource(oSettings)==='ssp'||features.bDeferRender){_fnSortingClasses(oSettings);}},'sc');var captions=$this.children('caption').each(function(){this._captionSide=$(this).css('caption-side');});var thead=$this.children('thead');if(thead.length===0){thead=$('<thead/>').appendTo($this);}
+oSettings.nTHead=thead[0];var tbody=$this.children('tbody');if(tbody.length===0){tbody=$('<tbody/>').insertAfter(thead);}
+oSettings.nTBody=tbody[0];var tfoot=$this.children('tfoot');if(tfoot.length===0&&captions.length>0&&(oSettings.oScroll.sX!==""||oSettings.oScroll.sY!=="")){tfoot=$('<tfoot/>').appendTo($this);}
+if(tfoot.length===0||tfoot.children().length===0){$this.addClass(oClasses.sNoFooter);}
+else if(tfoot.length>0){oSettings.nTFoot=tfoot[0];_fnDetectHeader(oSettings.aoFooter,oSettings.nTFoot);}
+if(oInit.aaData){for(i=0;i<oInit.aaData.length;i++){_fnAddData(oSettings,oInit.aaData[i]);}}
+else if(oSettings.bDeferLoading||_fnDataSource(oSettings)=='dom'){_fnAddTr(oSettings,$(oSettings.nTBody).children('tr'));}
+oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();oSettings.bInitialised=true;if(bInitHandedOff===false){_fnInitialise(oSettings);}};_fnCallbackReg(oSettings,'aoDrawCallback',_fnSaveState,'state_save');if(oInit.bStateSave)
+{features.bStateSave=true;_fnLoadState(oSettings,oInit,loadedInit);}
+else{loadedInit();}});_that=null;return this;};var _ext;var _Api;var _api_register;var _api_registerPlural;var _re_dic={};var _re_new_lines=/[\r\n\u2028]/g;var _re_html=/<.*?>/g;var _re_date=/^\d{2,4}[\.\/\-]\d{1,2}[\.\/\-]\d{1,2}([T ]{1}\d{1,2}[:\.]\d{2}([\.:]\d{2})?)?$/;var _re_escape_regex=new RegExp('(\\'+['/','.','*','+','?','|','(',')','[',']','{','}','\\','$','^','-'].join('|\\')+')','g');var _re_formatted_numeric=/['\u00A0,$£€¥%\u2009\u202F\u20BD\u20a9\u20BArfkɃΞ]/gi;var _empty=function(d){return!d||d===true||d==='-'?true:false;};var _intVal=function(s){var integer=parseInt(s,10);return!isNaN(integer)&&isFinite(s)?integer:null;};var _numToDecimal=function(num,decimalPoint){if(!_re_dic[decimalPoint]){_re_dic[decimalPoint]=new RegExp(_fnEscapeRegex(decimalPoint),'g');}
+return typeof num==='string'&&decimalPoint!=='.'?num.replace(/\./g,'').replace(_re_dic[decimalPoint],'.'):num;};var _isNumber=function(d,decimalPoint,formatted){var strType=typeof d==='string';if(_empty(d)){return true;}
+if(decimalPoint&&strType){d=_numToDecimal(d,decimalPoint);}
+if(formatted&&strType){d=d.replace(_re_formatted_numeric,'');}
+return!isNaN(parseFloat(d))&&isFinite(d);};var _isHtml=function(d){return _empty(d)||typeof d==='string';};var _htmlNumeric=function(d,decimalPoint,formatted){if(_empty(d)){return true;}
+var html=_isHtml(d);return!html?null:_isNumber(_stripHtml(d),decimalPoint,formatted)?true:null;};var _pluck=function(a,prop,prop2){var out=[];var i=0,ien=a.length;if(prop2!==undefined){for(;i<ien;i++){if(a[i]&&a[i][prop]){out.push(a[i][prop][prop2]);}}}
+else{for(;i<ien;i++){if(a[i]){out.push(a[i][prop]);}}}
+return out;};var _pluck_order=function(a,order,prop,prop2)
+{var out=[];var i=0,ien=order.length;if(prop2!==undefined){for(;i<ien;i++){if(a[order[i]][prop]){out.push(a[order[i]][prop][prop2]);}}}
+else{for(;i<ien;i++){out.push(a[order[i]][prop]);}}
+return out;};var _range=function(len,start)
+{var out=[];var end;if(start===undefined){start=0;end=len;}
+else{end=start;start=len;}
+for(var i=start;i<end;i++){out.push(i);}
+return out;};var _removeEmpty=function(a)
+{var out=[];for(var i=0,ien=a.length;i<ien;i++){if(a[i]){out.push(a[i]);}}
+return out;};var _stripHtml=function(d){return d.replace(_re_html,'');};var _areAllUnique=function(src){if(src.length<2){return true;}
+var sorted=src.slice().sort();var last=sorted[0];for(var i=1,ien=sorted.length;i<ien;i++){if(sorted[i]===last){return false;}
+last=sorted[i];}
+return true;};var _unique=function(src)
+{if(_areAllUnique(src)){return src.slice();}
+var
+out=[],val,i,ien=src.length,j,k=0;again:for(i=0;i<ien;i++){val=src[i];for(j=0;j<k;j++){if(out[j]===val){continue again;}}
+out.push(val);k++;}
+return out;};var _flatten=function(out,val){if(Array.isArray(val)){for(var i=0;i<val.length;i++){_flatten(out,val[i]);}}
+else{out.push(val);}
+return out;}
+var _includes=function(search,start){if(start===undefined){start=0;}
+return this.indexOf(search,start)!==-1;};if(!Array.isArray){Array.isArray=function(arg){return Object.prototype.toString.call(arg)==='[object Array]';};}
+if(!Array.prototype.includes){Array.prototype.includes=_includes;}
+if(!String.prototype.trim){String.prototype.trim=function(){return this.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,'');};}
+if(!String.prototype.includes){String.prototype.includes=_includes;}
+DataTable.util={throttle:function(fn,freq){var
+frequency=freq!==undefined?freq:200,last,timer;return function(){var
+that=this,now=+new Date(),args=arguments;if(last&&now<last+frequency){clearTimeout(timer);timer=setTimeout(function(){last=undefined;fn.apply(that,args);},frequency);}
+else{last=now;fn.apply(that,args);}};},escapeRegex:function(val){return val.replace(_re_escape_regex,'\\$1');},set:function(source){if($.isPlainObject(source)){return DataTable.util.set(source._);}
+else if(source===null){return function(){};}
+else if(typeof source==='function'){return function(data,val,meta){source(data,'set',val,meta);};}
+else if(typeof source==='string'&&(source.indexOf('.')!==-1||source.indexOf('[')!==-1||source.indexOf('(')!==-1))
+{var setData=function(data,val,src){var a=_fnSplitObjNotation(src),b;var aLast=a[a.length-1];var arrayNotation,funcNotation,o,innerSrc;for(var i=0,iLen=a.length-1;i<iLen;i++){if(a[i]==='__proto__'||a[i]==='constructor'){throw new Error('Cannot set prototype values');}
+arrayNotation=a[i].match(__reArray);funcNotation=a[i].match(__reFn);if(arrayNotation){a[i]=a[i].replace(__reArray,'');data[a[i]]=[];b=a.slice();b.splice(0,i+1);innerSrc=b.join('.');if(Array.isArray(val)){for(var j=0,jLen=val.length;j<jLen;j++){o={};setData(o,val[j],innerSrc);data[a[i]].push(o);}}
+else{data[a[i]]=val;}
+return;}
+else if(funcNotation){a[i]=a[i].replace(__reFn,'');data=data[a[i]](val);}
+if(data[a[i]]===null||data[a[i]]===undefined){data[a[i]]={};}
+data=data[a[i]];}
+if(aLast.match(__reFn)){data=data[aLast.replace(__reFn,'')](val);}
+else{data[aLast.replace(__reArray,'')]=val;}};return function(data,val){return setData(data,val,source);};}
+else{return function(data,val){data[source]=val;};}},get:function(source){if($.isPlainObject(source)){var o={};$.each(source,function(key,val){if(val){o[key]=DataTable.util.get(val);}});return function(data,type,row,meta){var t=o[type]||o._;return t!==undefined?t(data,type,row,meta):data;};}
+else if(source===null){return function(data){return data;};}
+else if(typeof source==='function'){return function(data,type,row,meta){return source(data,type,row,meta);};}
+else if(typeof source==='string'&&(source.indexOf('.')!==-1||source.indexOf('[')!==-1||source.indexOf('(')!==-1))
+{var fetchData=function(data,type,src){var arrayNotation,funcNotation,out,innerSrc;if(src!==""){var a=_fnSplitObjNotation(src);for(var i=0,iLen=a.length;i<iLen;i++){arrayNotation=a[i].match(__reArray);funcNotation=a[i].match(__reFn);if(arrayNotation){a[i]=a[i].replace(__reArray,'');if(a[i]!==""){data=data[a[i]];}
+out=[];a.splice(0,i+1);innerSrc=a.join('.');if(Array.isArray(data)){for(var j=0,jLen=data.length;j<jLen;j++){out.push(fetchData(data[j],type,innerSrc));}}
+var join=arrayNotation[0].substring(1,arrayNotation[0].length-1);data=(join==="")?out:out.join(join);break;}
+else if(funcNotation){a[i]=a[i].replace(__reFn,'');data=data[a[i]]();continue;}
+if(data===null||data[a[i]]===undefined){return undefined;}
+data=data[a[i]];}}
+return data;};return function(data,type){return fetchData(data,type,source);};}
+else{return function(data,type){return data[source];};}}};function _fnHungarianMap(o)
+{var
+hungarian='a aa ai ao as b fn i m o s ',match,newKey,map={};$.each(o,function(key,val){match=key.match(/^([^A-Z]+?)([A-Z])/);if(match&&hungarian.indexOf(match[1]+' ')!==-1)
+{newKey=key.replace(match[0],match[2].toLowerCase());map[newKey]=key;if(match[1]==='o')
+{_fnHungarianMap(o[key]);}}});o._hungarianMap=map;}
+function _fnCamelToHungarian(src,user,force)
+{if(!src._hungarianMap){_fnHungarianMap(src);}
+var hungarianKey;$.each(user,function(key,val){hungarianKey=src._hungarianMap[key];if(hungarianKey!==undefined&&(force||user[hungarianKey]===undefined))
+{if(hungarianKey.charAt(0)==='o')
+{if(!user[hungarianKey]){user[hungarianKey]={};}
+$.extend(true,user[hungarianKey],user[key]);_fnCamelToHungarian(src[hungarianKey],user[hungarianKey],force);}
+else{user[hungarianKey]=user[key];}}});}
+function _fnLanguageCompat(lang)
+{var defaults=DataTable.defaults.oLanguage;var defaultDecimal=defaults.sDecimal;if(defaultDecimal){_addNumericSort(defaultDecimal);}
+if(lang){var zeroRecords=lang.sZeroRecords;if(!lang.sEmptyTable&&zeroRecords&&defaults.sEmptyTable==="No data available in table")
+{_fnMap(lang,lang,'sZeroRecords','sEmptyTable');}
+if(!lang.sLoadingRecords&&zeroRecords&&defaults.sLoadingRecords==="Loading...")
+{_fnMap(lang,lang,'sZeroRecords','sLoadingRecords');}
+if(lang.sInfoThousands){lang.sThousands=lang.sInfoThousands;}
+var decimal=lang.sDecimal;if(decimal&&defaultDecimal!==decimal){_addNumericSort(decimal);}}}
+var _fnCompatMap=function(o,knew,old){if(o[knew]!==undefined){o[old]=o[knew];}};function _fnCompatOpts(init)
+{_fnCompatMap(init,'ordering','bSort');_fnCompatMap(init,'orderMulti','bSortMulti');_fnCompatMap(init,'orderClasses','bSortClasses');_fnCompatMap(init,'orderCellsTop','bSortCellsTop');_fnCompatMap(init,'order','aaSorting');_fnCompatMap(init,'orderFixed','aaSortingFixed');_fnCompatMap(init,'paging','bPaginate');_fnCompatMap(init,'pagingType','sPaginationType');_fnCompatMap(init,'pageLength','iDisplayLength');_fnCompatMap(init,'searching','bFilter');if(typeof init.sScrollX==='boolean'){init.sScrollX=init.sScrollX?'100%':'';}
+if(typeof init.scrollX==='boolean'){init.scrollX=init.scrollX?'100%':'';}
+var searchCols=init.aoSearchCols;if(searchCols){for(var i=0,ien=searchCols.length;i<ien;i++){if(searchCols[i]){_fnCamelToHungarian(DataTable.models.oSearch,searchCols[i]);}}}}
+function _fnCompatCols(init)
+{_fnCompatMap(init,'orderable','bSortable');_fnCompatMap(init,'orderData','aDataSort');_fnCompatMap(init,'orderSequence','asSorting');_fnCompatMap(init,'orderDataType','sortDataType');var dataSort=init.aDataSort;if(typeof dataSort==='number'&&!Array.isArray(dataSort)){init.aDataSort=[dataSort];}}
+function _fnBrowserDetect(settings)
+{if(!DataTable.__browser){var browser={};DataTable.__browser=browser;var n=$('<div/>').css({position:'fixed',top:0,left:$(window).scrollLeft()*-1,height:1,width:1,overflow:'hidden'}).append($('<div/>').css({position:'absolute',top:1,left:1,width:100,overflow:'scroll'}).append($('<div/>').css({width:'100%',height:10}))).appendTo('body');var outer=n.children();var inner=outer.children();browser.barWidth=outer[0].offsetWidth-outer[0].clientWidth;browser.bScrollOversize=inner[0].offsetWidth===100&&outer[0].clientWidth!==100;browser.bScrollbarLeft=Math.round(inner.offset().left)!==1;browser.bBounding=n[0].getBoundingClientRect().width?true:false;n.remove();}
+$.extend(settings.oBrowser,DataTable.__browser);settings.oScroll.iBarWidth=DataTable.__browser.barWidth;}
+function _fnReduce(that,fn,init,start,end,inc)
+{var
+i=start,value,isSet=false;if(init!==undefined){value=init;isSet=true;}
+while(i!==end){if(!that.hasOwnProperty(i)){continue;}
+value=isSet?fn(value,that[i],i,that):that[i];isSet=true;i+=inc;}
+return value;}
+function _fnAddColumn(oSettings,nTh)
+{var oDefaults=DataTable.defaults.column;var iCol=oSettings.aoColumns.length;var oCol=$.extend({},DataTable.models.oColumn,oDefaults,{"nTh":nTh?nTh:document.createElement('th'),"sTitle":oDefaults.sTitle?oDefaults.sTitle:nTh?nTh.innerHTML:'',"aDataSort":oDefaults.aDataSort?oDefaults.aDataSort:[iCol],"mData":oDefaults.mData?oDefaults.mData:iCol,idx:iCol});oSettings.aoColumns.push(oCol);var searchCols=oSettings.aoPreSearchCols;searchCols[iCol]=$.extend({},DataTable.models.oSearch,searchCols[iCol]);_fnColumnOptions(oSettings,iCol,$(nTh).data());}
+function _fnColumnOptions(oSettings,iCol,oOptions)
+{var oCol=oSettings.aoColumns[iCol];var oClasses=oSettings.oClasses;var th=$(oCol.nTh);if(!oCol.sWidthOrig){oCol.sWidthOrig=th.attr('width')||null;var t=(th.attr('style')||'').match(/width:\s*(\d+[pxem%]+)/);if(t){oCol.sWidthOrig=t[1];}}
+if(oOptions!==undefined&&oOptions!==null)
+{_fnCompatCols(oOptions);_fnCamelToHungarian(DataTable.defaults.column,oOptions,true);if(oOptions.mDataProp!==undefined&&!oOptions.mData)
+{oOptions.mData=oOptions.mDataProp;}
+if(oOptions.sType)
+{oCol._sManualType=oOptions.sType;}
+if(oOptions.className&&!oOptions.sClass)
+{oOptions.sClass=oOptions.className;}
+if(oOptions.sClass){th.addClass(oOptions.sClass);}
+var origClass=oCol.sClass;$.extend(oCol,oOptions);_fnMap(oCol,oOptions,"sWidth","sWidthOrig");if(origClass!==oCol.sClass){oCol.sClass=origClass+' '+oCol.sClass;}
+if(oOptions.iDataSort!==undefined)
+{oCol.aDataSort=[oOptions.iDataSort];}
+_fnMap(oCol,oOptions,"aDataSort");}
+var mDataSrc=oCol.mData;var mData=_fnGetObjectDataFn(mDataSrc);var mRender=oCol.mRender?_fnGetObjectDataFn(oCol.mRender):null;var attrTest=function(src){return typeof src==='string'&&src.indexOf('@')!==-1;};oCol._bAttrSrc=$.isPlainObject(mDataSrc)&&(attrTest(mDataSrc.sort)||attrTest(mDataSrc.type)||attrTest(mDataSrc.filter));oCol._setter=null;oCol.fnGetData=function(rowData,type,meta){var innerData=mData(rowData,type,undefined,meta);return mRender&&type?mRender(innerData,type,rowData,meta):innerData;};oCol.fnSetData=function(rowData,val,meta){return _fnSetObjectDataFn(mDataSrc)(rowData,val,meta);};if(typeof mDataSrc!=='number'){oSettings._rowReadObject=true;}
+if(!oSettings.oFeatures.bSort)
+{oCol.bSortable=false;th.addClass(oClasses.sSortableNone);}
+var bAsc=$.inArray('asc',oCol.asSorting)!==-1;var bDesc=$.inArray('desc',oCol.asSorting)!==-1;if(!oCol.bSortable||(!bAsc&&!bDesc))
+{oCol.sSortingClass=oClasses.sSortableNone;oCol.sSortingClassJUI="";}
+else if(bAsc&&!bDesc)
+{oCol.sSortingClass=oClasses.sSortableAsc;oCol.sSortingClassJUI=oClasses.sSortJUIAscAllowed;}
+else if(!bAsc&&bDesc)
+{oCol.sSortingClass=oClasses.sSortableDesc;oCol.sSortingClassJUI=oClasses.sSortJUIDescAllowed;}
+else
+{oCol.sSortingClass=oClasses.sSortable;oCol.sSortingClassJUI=oClasses.sSortJUI;}}
+function _fnAdjustColumnSizing(settings)
+{if(settings.oFeatures.bAutoWidth!==false)
+{var columns=settings.aoColumns;_fnCalculateColumnWidths(settings);for(var i=0,iLen=columns.length;i<iLen;i++)
+{columns[i].nTh.style.width=columns[i].sWidth;}}
+var scroll=settings.oScroll;if(scroll.sY!==''||scroll.sX!=='')
+{_fnScrollDraw(settings);}
+_fnCallbackFire(settings,null,'column-sizing',[settings]);}
+function _fnVisibleToColumnIndex(oSettings,iMatch)
+{var aiVis=_fnGetColumns(oSettings,'bVisible');return typeof aiVis[iMatch]==='number'?aiVis[iMatch]:null;}
+function _fnColumnIndexToVisible(oSettings,iMatch)
+{var aiVis=_fnGetColumns(oSettings,'bVisible');var iPos=$.inArray(iMatch,aiVis);return iPos!==-1?iPos:null;}
+function _fnVisbleColumns(oSettings)
+{var vis=0;$.each(oSettings.aoColumns,function(i,col){if(col.bVisible&&$(col.nTh).css('display')!=='none'){vis++;}});return vis;}
+function _fnGetColumns(oSettings,sParam)
+{var a=[];$.map(oSettings.aoColumns,function(val,i){if(val[sParam]){a.push(i);}});return a;}
+function _fnColumnTypes(settings)
+{var columns=settings.aoColumns;var data=settings.aoData;var types=DataTable.ext.type.detect;var i,ien,j,jen,k,ken;var col,cell,detectedType,cache;for(i=0,ien=columns.length;i<ien;i++){col=columns[i];cache=[];if(!col.sType&&col._sManualType){col.sType=col._sManualType;}
+else if(!col.sType){for(j=0,jen=types.length;j<jen;j++){for(k=0,ken=data.length;k<ken;k++){if(cache[k]===undefined){cache[k]=_fnGetCellData(settings,k,i,'type');}
+detectedType=types[j](cache[k],settings);if(!detectedType&&j!==types.length-1){break;}
+if(detectedType==='html'&&!_empty(cache[k])){break;}}
+if(detectedType){col.sType=detectedType;break;}}
+if(!col.sType){col.sType='string';}}}}
+function _fnApplyColumnDefs(oSettings,aoColDefs,aoCols,fn)
+{var i,iLen,j,jLen,k,kLen,def;var columns=oSettings.aoColumns;if(aoColDefs)
+{for(i=aoColDefs.length-1;i>=0;i--)
+{def=aoColDefs[i];var aTargets=def.target!==undefined?def.target:def.targets!==undefined?def.targets:def.aTargets;if(!Array.isArray(aTargets))
+{aTargets=[aTargets];}
+for(j=0,jLen=aTargets.length;j<jLen;j++)
+{if(typeof aTargets[j]==='number'&&aTargets[j]>=0)
+{while(columns.length<=aTargets[j])
+{_fnAddColumn(oSettings);}
+fn(aTargets[j],def);}
+else if(typeof aTargets[j]==='number'&&aTargets[j]<0)
+{fn(columns.length+aTargets[j],def);}
+else if(typeof aTargets[j]==='string')
+{for(k=0,kLen=columns.length;k<kLen;k++)
+{if(aTargets[j]=="_all"||$(columns[k].nTh).hasClass(aTargets[j]))
+{fn(k,def);}}}}}}
+if(aoCols)
+{for(i=0,iLen=aoCols.length;i<iLen;i++)
+{fn(i,aoCols[i]);}}}
+function _fnAddData(oSettings,aDataIn,nTr,anTds)
+{var iRow=oSettings.aoData.length;var oData=$.extend(true,{},DataTable.models.oRow,{src:nTr?'dom':'data',idx:iRow});oData._aData=aDataIn;oSettings.aoData.push(oData);var nTd,sThisType;var columns=oSettings.aoColumns;for(var i=0,iLen=columns.length;i<iLen;i++)
+{columns[i].sType=null;}
+oSettings.aiDisplayMaster.push(iRow);var id=oSettings.rowIdFn(aDataIn);if(id!==undefined){oSettings.aIds[id]=oData;}
+if(nTr||!oSettings.oFeatures.bDeferRender)
+{_fnCreateTr(oSettings,iRow,nTr,anTds);}
+return iRow;}
+function _fnAddTr(settings,trs)
+{var row;if(!(trs instanceof $)){trs=$(trs);}
+return trs.map(function(i,el){row=_fnGetRowElements(settings,el);return _fnAddData(settings,row.data,el,row.cells);});}
+function _fnNodeToDataIndex(oSettings,n)
+{return(n._DT_RowIndex!==undefined)?n._DT_RowIndex:null;}
+function _fnNodeToColumnIndex(oSettings,iRow,n)
+{return $.inArray(n,oSettings.aoData[iRow].anCells);}
+function _fnGetCellData(settings,rowIdx,colIdx,type)
+{if(type==='search'){type='filter';}
+else if(type==='order'){type='sort';}
+var draw=settings.iDraw;var col=settings.aoColumns[colIdx];var rowData=settings.aoData[rowIdx]._aData;var defaultContent=col.sDefaultContent;var cellData=col.fnGetData(rowData,type,{settings:settings,row:rowIdx,col:colIdx});if(cellData===undefined){if(settings.iDrawError!=draw&&defaultContent===null){_fnLog(settings,0,"Requested unknown parameter "+
+(typeof col.mData=='function'?'{function}':"'"+col.mData+"'")+" for row "+rowIdx+", column "+colIdx,4);settings.iDrawError=draw;}
+return defaultContent;}
+if((cellData===rowData||cellData===null)&&defaultContent!==null&&type!==undefined){cellData=defaultContent;}
+else if(typeof cellData==='function'){return cellData.call(rowData);}
+if(cellData===null&&type==='display'){return'';}
+if(type==='filter'){var fomatters=DataTable.ext.type.search;if(fomatters[col.sType]){cellData=fomatters[col.sType](cellData);}}
+return cellData;}
+function _fnSetCellData(settings,rowIdx,colIdx,val)
+{var col=settings.aoColumns[colIdx];var rowData=settings.aoData[rowIdx]._aData;col.fnSetData(rowData,val,{settings:settings,row:rowIdx,col:colIdx});}
+var __reArray=/\[.*?\]$/;var __reFn=/\(\)$/;function _fnSplitObjNotation(str)
+{return $.map(str.match(/(\\.|[^\.])+/g)||[''],function(s){return s.replace(/\\\./g,'.');});}
+var _fnGetObjectDataFn=DataTable.util.get;var _fnSetObjectDataFn=DataTable.util.set;function _fnGetDataMaster(settings)
+{return _pluck(settings.aoData,'_aData');}
+function _fnClearTable(settings)
+{settings.aoData.length=0;settings.aiDisplayMaster.length=0;settings.aiDisplay.length=0;settings.aIds={};}
+function _fnDeleteIndex(a,iTarget,splice)
+{var iTargetIndex=-1;for(var i=0,iLen=a.length;i<iLen;i++)
+{if(a[i]==iTarget)
+{iTargetIndex=i;}
+else if(a[i]>iTarget)
+{a[i]--;}}
+if(iTargetIndex!=-1&&splice===undefined)
+{a.splice(iTargetIndex,1);}}
+function _fnInvalidate(settings,rowIdx,src,colIdx)
+{var row=settings.aoData[rowIdx];var i,ien;var cellWrite=function(cell,col){while(cell.childNodes.length){cell.removeChild(cell.firstChild);}
+cell.innerHTML=_fnGetCellData(settings,rowIdx,col,'display');};if(src==='dom'||((!src||src==='auto')&&row.src==='dom')){row._aData=_fnGetRowElements(settings,row,colIdx,colIdx===undefined?undefined:row._aData).data;}
+else{var cells=row.anCells;if(cells){if(colIdx!==undefined){cellWrite(cells[colIdx],colIdx);}
+else{for(i=0,ien=cells.length;i<ien;i++){cellWrite(cells[i],i);}}}}
+row._aSortData=null;row._aFilterData=null;var cols=settings.aoColumns;if(colIdx!==undefined){cols[colIdx].sType=null;}
+else{for(i=0,ien=cols.length;i<ien;i++){cols[i].sType=null;}
+_fnRowAttributes(settings,row);}}
+function _fnGetRowElements(settings,row,colIdx,d)
+{var
+tds=[],td=row.firstChild,name,col,o,i=0,contents,columns=settings.aoColumns,objectRead=settings._rowReadObject;d=d!==undefined?d:objectRead?{}:[];var attr=function(str,td){if(typeof str==='string'){var idx=str.indexOf('@');if(idx!==-1){var attr=str.substring(idx+1);var setter=_fnSetObjectDataFn(str);setter(d,td.getAttribute(attr));}}};var cellProcess=function(cell){if(colIdx===undefined||colIdx===i){col=columns[i];contents=(cell.innerHTML).trim();if(col&&col._bAttrSrc){var setter=_fnSetObjectDataFn(col.mData._);setter(d,contents);attr(col.mData.sort,cell);attr(col.mData.type,cell);attr(col.mData.filter,cell);}
+else{if(objectRead){if(!col._setter){col._setter=_fnSetObjectDataFn(col.mData);}
+col._setter(d,contents);}
+else{d[i]=contents;}}}
+i++;};if(td){while(td){name=td.nodeName.toUpperCase();if(name=="TD"||name=="TH"){cellProcess(td);tds.push(td);}
+td=td.nextSibling;}}
+else{tds=row.anCells;for(var j=0,jen=tds.length;j<jen;j++){cellProcess(tds[j]);}}
+var rowNode=row.firstChild?row:row.nTr;if(rowNode){var id=rowNode.getAttribute('id');if(id){_fnSetObjectDataFn(settings.rowId)(d,id);}}
+return{data:d,cells:tds};}
+function _fnCreateTr(oSettings,iRow,nTrIn,anTds)
+{var
+row=oSettings.aoData[iRow],rowData=row._aData,cells=[],nTr,nTd,oCol,i,iLen,create;if(row.nTr===null)
+{nTr=nTrIn||document.createElement('tr');row.nTr=nTr;row.anCells=cells;nTr._DT_RowIndex=iRow;_fnRowAttributes(oSettings,row);for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{oCol=oSettings.aoColumns[i];create=nTrIn?false:true;nTd=create?document.createElement(oCol.sCellType):anTds[i];nTd._DT_CellIndex={row:iRow,column:i};cells.push(nTd);if(create||((oCol.mRender||oCol.mData!==i)&&(!$.isPlainObject(oCol.mData)||oCol.mData._!==i+'.display'))){nTd.innerHTML=_fnGetCellData(oSettings,iRow,i,'display');}
+if(oCol.sClass)
+{nTd.className+=' '+oCol.sClass;}
+if(oCol.bVisible&&!nTrIn)
+{nTr.appendChild(nTd);}
+else if(!oCol.bVisible&&nTrIn)
+{nTd.parentNode.removeChild(nTd);}
+if(oCol.fnCreatedCell)
+{oCol.fnCreatedCell.call(oSettings.oInstance,nTd,_fnGetCellData(oSettings,iRow,i),rowData,iRow,i);}}
+_fnCallbackFire(oSettings,'aoRowCreatedCallback',null,[nTr,rowData,iRow,cells]);}}
+function _fnRowAttributes(settings,row)
+{var tr=row.nTr;var data=row._aData;if(tr){var id=settings.rowIdFn(data);if(id){tr.id=id;}
+if(data.DT_RowClass){var a=data.DT_RowClass.split(' ');row.__rowc=row.__rowc?_unique(row.__rowc.concat(a)):a;$(tr).removeClass(row.__rowc.join(' ')).addClass(data.DT_RowClass);}
+if(data.DT_RowAttr){$(tr).attr(data.DT_RowAttr);}
+if(data.DT_RowData){$(tr).data(data.DT_RowData);}}}
+function _fnBuildHead(oSettings)
+{var i,ien,cell,row,column;var thead=oSettings.nTHead;var tfoot=oSettings.nTFoot;var createHeader=$('th, td',thead).length===0;var classes=oSettings.oClasses;var columns=oSettings.aoColumns;if(createHeader){row=$('<tr/>').appendTo(thead);}
+for(i=0,ien=columns.length;i<ien;i++){column=columns[i];cell=$(column.nTh).addClass(column.sClass);if(createHeader){cell.appendTo(row);}
+if(oSettings.oFeatures.bSort){cell.addClass(column.sSortingClass);if(column.bSortable!==false){cell.attr('tabindex',oSettings.iTabIndex).attr('aria-controls',oSettings.sTableId);_fnSortAttachListener(oSettings,column.nTh,i);}}
+if(column.sTitle!=cell[0].innerHTML){cell.html(column.sTitle);}
+_fnRenderer(oSettings,'header')(oSettings,cell,column,classes);}
+if(createHeader){_fnDetectHeader(oSettings.aoHeader,thead);}
+$(thead).children('tr').children('th, td').addClass(classes.sHeaderTH);$(tfoot).children('tr').children('th, td').addClass(classes.sFooterTH);if(tfoot!==null){var cells=oSettings.aoFooter[0];for(i=0,ien=cells.length;i<ien;i++){column=columns[i];column.nTf=cells[i].cell;if(column.sClass){$(column.nTf).addClass(column.sClass);}}}}
+function _fnDrawHead(oSettings,aoSource,bIncludeHidden)
+{var i,iLen,j,jLen,k,kLen,n,nLocalTr;var aoLocal=[];var aApplied=[];var iColumns=oSettings.aoColumns.length;var iRowspan,iColspan;if(!aoSource)
+{return;}
+if(bIncludeHidden===undefined)
+{bIncludeHidden=false;}
+for(i=0,iLen=aoSource.length;i<iLen;i++)
+{aoLocal[i]=aoSource[i].slice();aoLocal[i].nTr=aoSource[i].nTr;for(j=iColumns-1;j>=0;j--)
+{if(!oSettings.aoColumns[j].bVisible&&!bIncludeHidden)
+{aoLocal[i].splice(j,1);}}
+aApplied.push([]);}
+for(i=0,iLen=aoLocal.length;i<iLen;i++)
+{nLocalTr=aoLocal[i].nTr;if(nLocalTr)
+{while((n=nLocalTr.firstChild))
+{nLocalTr.removeChild(n);}}
+for(j=0,jLen=aoLocal[i].length;j<jLen;j++)
+{iRowspan=1;iColspan=1;if(aApplied[i][j]===undefined)
+{nLocalTr.appendChild(aoLocal[i][j].cell);aApplied[i][j]=1;while(aoLocal[i+iRowspan]!==undefined&&aoLocal[i][j].cell==aoLocal[i+iRowspan][j].cell)
+{aApplied[i+iRowspan][j]=1;iRowspan++;}
+while(aoLocal[i][j+iColspan]!==undefined&&aoLocal[i][j].cell==aoLocal[i][j+iColspan].cell)
+{for(k=0;k<iRowspan;k++)
+{aApplied[i+k][j+iColspan]=1;}
+iColspan++;}
+$(aoLocal[i][j].cell).attr('rowspan',iRowspan).attr('colspan',iColspan);}}}}
+function _fnDraw(oSettings,ajaxComplete)
+{_fnStart(oSettings);var aPreDraw=_fnCallbackFire(oSettings,'aoPreDrawCallback','preDraw',[oSettings]);if($.inArray(false,aPreDraw)!==-1)
+{_fnProcessingDisplay(oSettings,false);return;}
+var anRows=[];var iRowCount=0;var asStripeClasses=oSettings.asStripeClasses;var iStripes=asStripeClasses.length;var oLang=oSettings.oLanguage;var bServerSide=_fnDataSource(oSettings)=='ssp';var aiDisplay=oSettings.aiDisplay;var iDisplayStart=oSettings._iDisplayStart;var iDisplayEnd=oSettings.fnDisplayEnd();oSettings.bDrawing=true;if(oSettings.bDeferLoading)
+{oSettings.bDeferLoading=false;oSettings.iDraw++;_fnProcessingDisplay(oSettings,false);}
+else if(!bServerSide)
+{oSettings.iDraw++;}
+else if(!oSettings.bDestroying&&!ajaxComplete)
+{_fnAjaxUpdate(oSettings);return;}
+if(aiDisplay.length!==0)
+{var iStart=bServerSide?0:iDisplayStart;var iEnd=bServerSide?oSettings.aoData.length:iDisplayEnd;for(var j=iStart;j<iEnd;j++)
+{var iDataIndex=aiDisplay[j];var aoData=oSettings.aoData[iDataIndex];if(aoData.nTr===null)
+{_fnCreateTr(oSettings,iDataIndex);}
+var nRow=aoData.nTr;if(iStripes!==0)
+{var sStripe=asStripeClasses[iRowCount%iStripes];if(aoData._sRowStripe!=sStripe)
+{$(nRow).removeClass(aoData._sRowStripe).addClass(sStripe);aoData._sRowStripe=sStripe;}}
+_fnCallbackFire(oSettings,'aoRowCallback',null,[nRow,aoData._aData,iRowCount,j,iDataIndex]);anRows.push(nRow);iRowCount++;}}
+else
+{var sZero=oLang.sZeroRecords;if(oSettings.iDraw==1&&_fnDataSource(oSettings)=='ajax')
+{sZero=oLang.sLoadingRecords;}
+else if(oLang.sEmptyTable&&oSettings.fnRecordsTotal()===0)
+{sZero=oLang.sEmptyTable;}
+anRows[0]=$('<tr/>',{'class':iStripes?asStripeClasses[0]:''}).append($('<td />',{'valign':'top','colSpan':_fnVisbleColumns(oSettings),'class':oSettings.oClasses.sRowEmpty}).html(sZero))[0];}
+_fnCallbackFire(oSettings,'aoHeaderCallback','header',[$(oSettings.nTHead).children('tr')[0],_fnGetDataMaster(oSettings),iDisplayStart,iDisplayEnd,aiDisplay]);_fnCallbackFire(oSettings,'aoFooterCallback','footer',[$(oSettings.nTFoot).children('tr')[0],_fnGetDataMaster(oSettings),iDisplayStart,iDisplayEnd,aiDisplay]);var body=$(oSettings.nTBody);body.children().detach();body.append($(anRows));_fnCallbackFire(oSettings,'aoDrawCallback','draw',[oSettings]);oSettings.bSorted=false;oSettings.bFiltered=false;oSettings.bDrawing=false;}
+function _fnReDraw(settings,holdPosition)
+{var
+features=settings.oFeatures,sort=features.bSort,filter=features.bFilter;if(sort){_fnSort(settings);}
+if(filter){_fnFilterComplete(settings,settings.oPreviousSearch);}
+else{settings.aiDisplay=settings.aiDisplayMaster.slice();}
+if(holdPosition!==true){settings._iDisplayStart=0;}
+settings._drawHold=holdPosition;_fnDraw(settings);settings._drawHold=false;}
+function _fnAddOptionsHtml(oSettings)
+{var classes=oSettings.oClasses;var table=$(oSettings.nTable);var holding=$('<div/>').insertBefore(table);var features=oSettings.oFeatures;var insert=$('<div/>',{id:oSettings.sTableId+'_wrapper','class':classes.sWrapper+(oSettings.nTFoot?'':' '+classes.sNoFooter)});oSettings.nHolding=holding[0];oSettings.nTableWrapper=insert[0];oSettings.nTableReinsertBefore=oSettings.nTable.nextSibling;var aDom=oSettings.sDom.split('');var featureNode,cOption,nNewNode,cNext,sAttr,j;for(var i=0;i<aDom.length;i++)
+{featureNode=null;cOption=aDom[i];if(cOption=='<')
+{nNewNode=$('<div/>')[0];cNext=aDom[i+1];if(cNext=="'"||cNext=='"')
+{sAttr="";j=2;while(aDom[i+j]!=cNext)
+{sAttr+=aDom[i+j];j++;}
+if(sAttr=="H")
+{sAttr=classes.sJUIHeader;}
+else if(sAttr=="F")
+{sAttr=classes.sJUIFooter;}
+if(sAttr.indexOf('.')!=-1)
+{var aSplit=sAttr.split('.');nNewNode.id=aSplit[0].substr(1,aSplit[0].length-1);nNewNode.className=aSplit[1];}
+else if(sAttr.charAt(0)=="#")
+{nNewNode.id=sAttr.substr(1,sAttr.length-1);}
+else
+{nNewNode.className=sAttr;}
+i+=j;}
+insert.append(nNewNode);insert=$(nNewNode);}
+else if(cOption=='>')
+{insert=insert.parent();}
+else if(cOption=='l'&&features.bPaginate&&features.bLengthChange)
+{featureNode=_fnFeatureHtmlLength(oSettings);}
+else if(cOption=='f'&&features.bFilter)
+{featureNode=_fnFeatureHtmlFilter(oSettings);}
+else if(cOption=='r'&&features.bProcessing)
+{featureNode=_fnFeatureHtmlProcessing(oSettings);}
+else if(cOption=='t')
+{featureNode=_fnFeatureHtmlTable(oSettings);}
+else if(cOption=='i'&&features.bInfo)
+{featureNode=_fnFeatureHtmlInfo(oSettings);}
+else if(cOption=='p'&&features.bPaginate)
+{featureNode=_fnFeatureHtmlPaginate(oSettings);}
+else if(DataTable.ext.feature.length!==0)
+{var aoFeatures=DataTable.ext.feature;for(var k=0,kLen=aoFeatures.length;k<kLen;k++)
+{if(cOption==aoFeatures[k].cFeature)
+{featureNode=aoFeatures[k].fnInit(oSettings);break;}}}
+if(featureNode)
+{var aanFeatures=oSettings.aanFeatures;if(!aanFeatures[cOption])
+{aanFeatures[cOption]=[];}
+aanFeatures[cOption].push(featureNode);insert.append(featureNode);}}
+holding.replaceWith(insert);oSettings.nHolding=null;}
+function _fnDetectHeader(aLayout,nThead)
+{var nTrs=$(nThead).children('tr');var nTr,nCell;var i,k,l,iLen,jLen,iColShifted,iColumn,iColspan,iRowspan;var bUnique;var fnShiftCol=function(a,i,j){var k=a[i];while(k[j]){j++;}
+return j;};aLayout.splice(0,aLayout.length);for(i=0,iLen=nTrs.length;i<iLen;i++)
+{aLayout.push([]);}
+for(i=0,iLen=nTrs.length;i<iLen;i++)
+{nTr=nTrs[i];iColumn=0;nCell=nTr.firstChild;while(nCell){if(nCell.nodeName.toUpperCase()=="TD"||nCell.nodeName.toUpperCase()=="TH")
+{iColspan=nCell.getAttribute('colspan')*1;iRowspan=nCell.getAttribute('rowspan')*1;iColspan=(!iColspan||iColspan===0||iColspan===1)?1:iColspan;iRowspan=(!iRowspan||iRowspan===0||iRowspan===1)?1:iRowspan;iColShifted=fnShiftCol(aLayout,i,iColumn);bUnique=iColspan===1?true:false;for(l=0;l<iColspan;l++)
+{for(k=0;k<iRowspan;k++)
+{aLayout[i+k][iColShifted+l]={"cell":nCell,"unique":bUnique};aLayout[i+k].nTr=nTr;}}}
+nCell=nCell.nextSibling;}}}
+function _fnGetUniqueThs(oSettings,nHeader,aLayout)
+{var aReturn=[];if(!aLayout)
+{aLayout=oSettings.aoHeader;if(nHeader)
+{aLayout=[];_fnDetectHeader(aLayout,nHeader);}}
+for(var i=0,iLen=aLayout.length;i<iLen;i++)
+{for(var j=0,jLen=aLayout[i].length;j<jLen;j++)
+{if(aLayout[i][j].unique&&(!aReturn[j]||!oSettings.bSortCellsTop))
+{aReturn[j]=aLayout[i][j].cell;}}}
+return aReturn;}
+function _fnStart(oSettings)
+{var bServerSide=_fnDataSource(oSettings)=='ssp';var iInitDisplayStart=oSettings.iInitDisplayStart;if(iInitDisplayStart!==undefined&&iInitDisplayStart!==-1)
+{oSettings._iDisplayStart=bServerSide?iInitDisplayStart:iInitDisplayStart>=oSettings.fnRecordsDisplay()?0:iInitDisplayStart;oSettings.iInitDisplayStart=-1;}}
+function _fnBuildAjax(oSettings,data,fn)
+{_fnCallbackFire(oSettings,'aoServerParams','serverParams',[data]);if(data&&Array.isArray(data)){var tmp={};var rbracket=/(.*?)\[\]$/;$.each(data,function(key,val){var match=val.name.match(rbracket);if(match){var name=match[0];if(!tmp[name]){tmp[name]=[];}
+tmp[name].push(val.value);}
+else{tmp[val.name]=val.value;}});data=tmp;}
+var ajaxData;var ajax=oSettings.ajax;var instance=oSettings.oInstance;var callback=function(json){var status=oSettings.jqXHR?oSettings.jqXHR.status:null;if(json===null||(typeof status==='number'&&status==204)){json={};_fnAjaxDataSrc(oSettings,json,[]);}
+var error=json.error||json.sError;if(error){_fnLog(oSettings,0,error);}
+oSettings.json=json;_fnCallbackFire(oSettings,null,'xhr',[oSettings,json,oSettings.jqXHR]);fn(json);};if($.isPlainObject(ajax)&&ajax.data)
+{ajaxData=ajax.data;var newData=typeof ajaxData==='function'?ajaxData(data,oSettings):ajaxData;data=typeof ajaxData==='function'&&newData?newData:$.extend(true,data,newData);delete ajax.data;}
+var baseAjax={"data":data,"success":callback,"dataType":"json","cache":false,"type":oSettings.sServerMethod,"error":function(xhr,error,thrown){var ret=_fnCallbackFire(oSettings,null,'xhr',[oSettings,null,oSettings.jqXHR]);if($.inArray(true,ret)===-1){if(error=="parsererror"){_fnLog(oSettings,0,'Invalid JSON response',1);}
+else if(xhr.readyState===4){_fnLog(oSettings,0,'Ajax error',7);}}
+_fnProcessingDisplay(oSettings,false);}};oSettings.oAjaxData=data;_fnCallbackFire(oSettings,null,'preXhr',[oSettings,data]);if(oSettings.fnServerData)
+{oSettings.fnServerData.call(instance,oSettings.sAjaxSource,$.map(data,function(val,key){return{name:key,value:val};}),callback,oSettings);}
+else if(oSettings.sAjaxSource||typeof ajax==='string')
+{oSettings.jqXHR=$.ajax($.extend(baseAjax,{url:ajax||oSettings.sAjaxSource}));}
+else if(typeof ajax==='function')
+{oSettings.jqXHR=ajax.call(instance,data,callback,oSettings);}
+else
+{oSettings.jqXHR=$.ajax($.extend(baseAjax,ajax));ajax.data=ajaxData;}}
+function _fnAjaxUpdate(settings)
+{settings.iDraw++;_fnProcessingDisplay(settings,true);_fnBuildAjax(settings,_fnAjaxParameters(settings),function(json){_fnAjaxUpdateDraw(settings,json);});}
+function _fnAjaxParameters(settings)
+{var
+columns=settings.aoColumns,columnCount=columns.length,features=settings.oFeatures,preSearch=settings.oPreviousSearch,preColSearch=settings.aoPreSearchCols,i,data=[],dataProp,column,columnSearch,sort=_fnSortFlatten(settings),displayStart=settings._iDisplayStart,displayLength=features.bPaginate!==false?settings._iDisplayLength:-1;var param=function(name,value){data.push({'name':name,'value':value});};param('sEcho',settings.iDraw);param('iColumns',columnCount);param('sColumns',_pluck(columns,'sName').join(','));param('iDisplayStart',displayStart);param('iDisplayLength',displayLength);var d={draw:settings.iDraw,columns:[],order:[],start:displayStart,length:displayLength,search:{value:preSearch.sSearch,regex:preSearch.bRegex}};for(i=0;i<columnCount;i++){column=columns[i];columnSearch=preColSearch[i];dataProp=typeof column.mData=="function"?'function':column.mData;d.columns.push({data:dataProp,name:column.sName,searchable:column.bSearchable,orderable:column.bSortable,search:{value:columnSearch.sSearch,regex:columnSearch.bRegex}});param("mDataProp_"+i,dataProp);if(features.bFilter){param('sSearch_'+i,columnSearch.sSearch);param('bRegex_'+i,columnSearch.bRegex);param('bSearchable_'+i,column.bSearchable);}
+if(features.bSort){param('bSortable_'+i,column.bSortable);}}
+if(features.bFilter){param('sSearch',preSearch.sSearch);param('bRegex',preSearch.bRegex);}
+if(features.bSort){$.each(sort,function(i,val){d.order.push({column:val.col,dir:val.dir});param('iSortCol_'+i,val.col);param('sSortDir_'+i,val.dir);});param('iSortingCols',sort.length);}
+var legacy=DataTable.ext.legacy.ajax;if(legacy===null){return settings.sAjaxSource?data:d;}
+return legacy?data:d;}
+function _fnAjaxUpdateDraw(settings,json)
+{var compat=function(old,modern){return json[old]!==undefined?json[old]:json[modern];};var data=_fnAjaxDataSrc(settings,json);var draw=compat('sEcho','draw');var recordsTotal=compat('iTotalRecords','recordsTotal');var recordsFiltered=compat('iTotalDisplayRecords','recordsFiltered');if(draw!==undefined){if(draw*1<settings.iDraw){return;}
+settings.iDraw=draw*1;}
+if(!data){data=[];}
+_fnClearTable(settings);settings._iRecordsTotal=parseInt(recordsTotal,10);settings._iRecordsDisplay=parseInt(recordsFiltered,10);for(var i=0,ien=data.length;i<ien;i++){_fnAddData(settings,data[i]);}
+settings.aiDisplay=settings.aiDisplayMaster.slice();_fnDraw(settings,true);if(!settings._bInitComplete){_fnInitComplete(settings,json);}
+_fnProcessingDisplay(settings,false);}
+function _fnAjaxDataSrc(oSettings,json,write)
+{var dataSrc=$.isPlainObject(oSettings.ajax)&&oSettings.ajax.dataSrc!==undefined?oSettings.ajax.dataSrc:oSettings.sAjaxDataProp;if(!write){if(dataSrc==='data'){return json.aaData||json[dataSrc];}
+return dataSrc!==""?_fnGetObjectDataFn(dataSrc)(json):json;}
+_fnSetObjectDataFn(dataSrc)(json,write);}
+function _fnFeatureHtmlFilter(settings)
+{var classes=settings.oClasses;var tableId=settings.sTableId;var language=settings.oLanguage;var previousSearch=settings.oPreviousSearch;var features=settings.aanFeatures;var input='<input type="search" class="'+classes.sFilterInput+'"/>';var str=language.sSearch;str=str.match(/_INPUT_/)?str.replace('_INPUT_',input):str+input;var filter=$('<div/>',{'id':!features.f?tableId+'_filter':null,'class':classes.sFilter}).append($('<label/>').append(str));var searchFn=function(event){var n=features.f;var val=!this.value?"":this.value;if(previousSearch.return&&event.key!=="Enter"){return;}
+if(val!=previousSearch.sSearch){_fnFilterComplete(settings,{"sSearch":val,"bRegex":previousSearch.bRegex,"bSmart":previousSearch.bSmart,"bCaseInsensitive":previousSearch.bCaseInsensitive,"return":previousSearch.return});settings._iDisplayStart=0;_fnDraw(settings);}};var searchDelay=settings.searchDelay!==null?settings.searchDelay:_fnDataSource(settings)==='ssp'?400:0;var jqFilter=$('input',filter).val(previousSearch.sSearch).attr('placeholder',language.sSearchPlaceholder).on('keyup.DT search.DT input.DT paste.DT cut.DT',searchDelay?_fnThrottle(searchFn,searchDelay):searchFn).on('mouseup',function(e){setTimeout(function(){searchFn.call(jqFilter[0],e);},10);}).on('keypress.DT',function(e){if(e.keyCode==13){return false;}}).attr('aria-controls',tableId);$(settings.nTable).on('search.dt.DT',function(ev,s){if(settings===s){try{if(jqFilter[0]!==document.activeElement){jqFilter.val(previousSearch.sSearch);}}
+catch(e){}}});return filter[0];}
+function _fnFilterComplete(oSettings,oInput,iForce)
+{var oPrevSearch=oSettings.oPreviousSearch;var aoPrevSearch=oSettings.aoPreSearchCols;var fnSaveFilter=function(oFilter){oPrevSearch.sSearch=oFilter.sSearch;oPrevSearch.bRegex=oFilter.bRegex;oPrevSearch.bSmart=oFilter.bSmart;oPrevSearch.bCaseInsensitive=oFilter.bCaseInsensitive;oPrevSearch.return=oFilter.return;};var fnRegex=function(o){return o.bEscapeRegex!==undefined?!o.bEscapeRegex:o.bRegex;};_fnColumnTypes(oSettings);if(_fnDataSource(oSettings)!='ssp')
+{_fnFilter(oSettings,oInput.sSearch,iForce,fnRegex(oInput),oInput.bSmart,oInput.bCaseInsensitive,oInput.return);fnSaveFilter(oInput);for(var i=0;i<aoPrevSearch.length;i++)
+{_fnFilterColumn(oSettings,aoPrevSearch[i].sSearch,i,fnRegex(aoPrevSearch[i]),aoPrevSearch[i].bSmart,aoPrevSearch[i].bCaseInsensitive);}
+_fnFilterCustom(oSettings);}
+else
+{fnSaveFilter(oInput);}
+oSettings.bFiltered=true;_fnCallbackFire(oSettings,null,'search',[oSettings]);}
+function _fnFilterCustom(settings)
+{var filters=DataTable.ext.search;var displayRows=settings.aiDisplay;var row,rowIdx;for(var i=0,ien=filters.length;i<ien;i++){var rows=[];for(var j=0,jen=displayRows.length;j<jen;j++){rowIdx=displayRows[j];row=settings.aoData[rowIdx];if(filters[i](settings,row._aFilterData,rowIdx,row._aData,j)){rows.push(rowIdx);}}
+displayRows.length=0;$.merge(displayRows,rows);}}
+function _fnFilterColumn(settings,searchStr,colIdx,regex,smart,caseInsensitive)
+{if(searchStr===''){return;}
+var data;var out=[];var display=settings.aiDisplay;var rpSearch=_fnFilterCreateSearch(searchStr,regex,smart,caseInsensitive);for(var i=0;i<display.length;i++){data=settings.aoData[display[i]]._aFilterData[colIdx];if(rpSearch.test(data)){out.push(display[i]);}}
+settings.aiDisplay=out;}
+function _fnFilter(settings,input,force,regex,smart,caseInsensitive)
+{var rpSearch=_fnFilterCreateSearch(input,regex,smart,caseInsensitive);var prevSearch=settings.oPreviousSearch.sSearch;var displayMaster=settings.aiDisplayMaster;var display,invalidated,i;var filtered=[];if(DataTable.ext.search.length!==0){force=true;}
+invalidated=_fnFilterData(settings);if(input.length<=0){settings.aiDisplay=displayMaster.slice();}
+else{if(invalidated||force||regex||prevSearch.length>input.length||input.indexOf(prevSearch)!==0||settings.bSorted){settings.aiDisplay=displayMaster.slice();}
+display=settings.aiDisplay;for(i=0;i<display.length;i++){if(rpSearch.test(settings.aoData[display[i]]._sFilterRow)){filtered.push(display[i]);}}
+settings.aiDisplay=filtered;}}
+function _fnFilterCreateSearch(search,regex,smart,caseInsensitive)
+{search=regex?search:_fnEscapeRegex(search);if(smart){var a=$.map(search.match(/"[^"]+"|[^ ]+/g)||[''],function(word){if(word.charAt(0)==='"'){var m=word.match(/^"(.*)"$/);word=m?m[1]:word;}
+return word.replace('"','');});search='^(?=.*?'+a.join(')(?=.*?')+').*$';}
+return new RegExp(search,caseInsensitive?'i':'');}
+var _fnEscapeRegex=DataTable.util.escapeRegex;var __filter_div=$('<div>')[0];var __filter_div_textContent=__filter_div.textContent!==undefined;function _fnFilterData(settings)
+{var columns=settings.aoColumns;var column;var i,j,ien,jen,filterData,cellData,row;var wasInvalidated=false;for(i=0,ien=settings.aoData.length;i<ien;i++){row=settings.aoData[i];if(!row._aFilterData){filterData=[];for(j=0,jen=columns.length;j<jen;j++){column=columns[j];if(column.bSearchable){cellData=_fnGetCellData(settings,i,j,'filter');if(cellData===null){cellData='';}
+if(typeof cellData!=='string'&&cellData.toString){cellData=cellData.toString();}}
+else{cellData='';}
+if(cellData.indexOf&&cellData.indexOf('&')!==-1){__filter_div.innerHTML=cellData;cellData=__filter_div_textContent?__filter_div.textContent:__filter_div.innerText;}
+if(cellData.replace){cellData=cellData.replace(/[\r\n\u2028]/g,'');}
+filterData.push(cellData);}
+row._aFilterData=filterData;row._sFilterRow=filterData.join('  ');wasInvalidated=true;}}
+return wasInvalidated;}
+function _fnSearchToCamel(obj)
+{return{search:obj.sSearch,smart:obj.bSmart,regex:obj.bRegex,caseInsensitive:obj.bCaseInsensitive};}
+function _fnSearchToHung(obj)
+{return{sSearch:obj.search,bSmart:obj.smart,bRegex:obj.regex,bCaseInsensitive:obj.caseInsensitive};}
+function _fnFeatureHtmlInfo(settings)
+{var
+tid=settings.sTableId,nodes=settings.aanFeatures.i,n=$('<div/>',{'class':settings.oClasses.sInfo,'id':!nodes?tid+'_info':null});if(!nodes){settings.aoDrawCallback.push({"fn":_fnUpdateInfo,"sName":"information"});n.attr('role','status').attr('aria-live','polite');$(settings.nTable).attr('aria-describedby',tid+'_info');}
+return n[0];}
+function _fnUpdateInfo(settings)
+{var nodes=settings.aanFeatures.i;if(nodes.length===0){return;}
+var
+lang=settings.oLanguage,start=settings._iDisplayStart+1,end=settings.fnDisplayEnd(),max=settings.fnRecordsTotal(),total=settings.fnRecordsDisplay(),out=total?lang.sInfo:lang.sInfoEmpty;if(total!==max){out+=' '+lang.sInfoFiltered;}
+out+=lang.sInfoPostFix;out=_fnInfoMacros(settings,out);var callback=lang.fnInfoCallback;if(callback!==null){out=callback.call(settings.oInstance,settings,start,end,max,total,out);}
+$(nodes).html(out);}
+function _fnInfoMacros(settings,str)
+{var
+formatter=settings.fnFormatNumber,start=settings._iDisplayStart+1,len=settings._iDisplayLength,vis=settings.fnRecordsDisplay(),all=len===-1;return str.replace(/_START_/g,formatter.call(settings,start)).replace(/_END_/g,formatter.call(settings,settings.fnDisplayEnd())).replace(/_MAX_/g,formatter.call(settings,settings.fnRecordsTotal())).replace(/_TOTAL_/g,formatter.call(settings,vis)).replace(/_PAGE_/g,formatter.call(settings,all?1:Math.ceil(start/len))).replace(/_PAGES_/g,formatter.call(settings,all?1:Math.ceil(vis/len)));}
+function _fnInitialise(settings)
+{var i,iLen,iAjaxStart=settings.iInitDisplayStart;var columns=settings.aoColumns,column;var features=settings.oFeatures;var deferLoading=settings.bDeferLoading;if(!settings.bInitialised){setTimeout(function(){_fnInitialise(settings);},200);return;}
+_fnAddOptionsHtml(settings);_fnBuildHead(settings);_fnDrawHead(settings,settings.aoHeader);_fnDrawHead(settings,settings.aoFooter);_fnProcessingDisplay(settings,true);if(features.bAutoWidth){_fnCalculateColumnWidths(settings);}
+for(i=0,iLen=columns.length;i<iLen;i++){column=columns[i];if(column.sWidth){column.nTh.style.width=_fnStringToCss(column.sWidth);}}
+_fnCallbackFire(settings,null,'preInit',[settings]);_fnReDraw(settings);var dataSrc=_fnDataSource(settings);if(dataSrc!='ssp'||deferLoading){if(dataSrc=='ajax'){_fnBuildAjax(settings,[],function(json){var aData=_fnAjaxDataSrc(settings,json);for(i=0;i<aData.length;i++){_fnAddData(settings,aData[i]);}
+settings.iInitDisplayStart=iAjaxStart;_fnReDraw(settings);_fnProcessingDisplay(settings,false);_fnInitComplete(settings,json);},settings);}
+else{_fnProcessingDisplay(settings,false);_fnInitComplete(settings);}}}
+function _fnInitComplete(settings,json)
+{settings._bInitComplete=true;if(json||settings.oInit.aaData){_fnAdjustColumnSizing(settings);}
+_fnCallbackFire(settings,null,'plugin-init',[settings,json]);_fnCallbackFire(settings,'aoInitComplete','init',[settings,json]);}
+function _fnLengthChange(settings,val)
+{var len=parseInt(val,10);settings._iDisplayLength=len;_fnLengthOverflow(settings);_fnCallbackFire(settings,null,'length',[settings,len]);}
+function _fnFeatureHtmlLength(settings)
+{var
+classes=settings.oClasses,tableId=settings.sTableId,menu=settings.aLengthMenu,d2=Array.isArray(menu[0]),lengths=d2?menu[0]:menu,language=d2?menu[1]:menu;var select=$('<select/>',{'name':tableId+'_length','aria-controls':tableId,'class':classes.sLengthSelect});for(var i=0,ien=lengths.length;i<ien;i++){select[0][i]=new Option(typeof language[i]==='number'?settings.fnFormatNumber(language[i]):language[i],lengths[i]);}
+var div=$('<div><label/></div>').addClass(classes.sLength);if(!settings.aanFeatures.l){div[0].id=tableId+'_length';}
+div.children().append(settings.oLanguage.sLengthMenu.replace('_MENU_',select[0].outerHTML));$('select',div).val(settings._iDisplayLength).on('change.DT',function(e){_fnLengthChange(settings,$(this).val());_fnDraw(settings);});$(settings.nTable).on('length.dt.DT',function(e,s,len){if(settings===s){$('select',div).val(len);}});return div[0];}
+function _fnFeatureHtmlPaginate(settings)
+{var
+type=settings.sPaginationType,plugin=DataTable.ext.pager[type],modern=typeof plugin==='function',redraw=function(settings){_fnDraw(settings);},node=$('<div/>').addClass(settings.oClasses.sPaging+type)[0],features=settings.aanFeatures;if(!modern){plugin.fnInit(settings,node,redraw);}
+if(!features.p)
+{node.id=settings.sTableId+'_paginate';settings.aoDrawCallback.push({"fn":function(settings){if(modern){var
+start=settings._iDisplayStart,len=settings._iDisplayLength,visRecords=settings.fnRecordsDisplay(),all=len===-1,page=all?0:Math.ceil(start/len),pages=all?1:Math.ceil(visRecords/len),buttons=plugin(page,pages),i,ien;for(i=0,ien=features.p.length;i<ien;i++){_fnRenderer(settings,'pageButton')(settings,features.p[i],i,buttons,page,pages);}}
+else{plugin.fnUpdate(settings,redraw);}},"sName":"pagination"});}
+return node;}
+function _fnPageChange(settings,action,redraw)
+{var
+start=settings._iDisplayStart,len=settings._iDisplayLength,records=settings.fnRecordsDisplay();if(records===0||len===-1)
+{start=0;}
+else if(typeof action==="number")
+{start=action*len;if(start>records)
+{start=0;}}
+else if(action=="first")
+{start=0;}
+else if(action=="previous")
+{start=len>=0?start-len:0;if(start<0)
+{start=0;}}
+else if(action=="next")
+{if(start+len<records)
+{start+=len;}}
+else if(action=="last")
+{start=Math.floor((records-1)/len)*len;}
+else
+{_fnLog(settings,0,"Unknown paging action: "+action,5);}
+var changed=settings._iDisplayStart!==start;settings._iDisplayStart=start;if(changed){_fnCallbackFire(settings,null,'page',[settings]);if(redraw){_fnDraw(settings);}}
+return changed;}
+function _fnFeatureHtmlProcessing(settings)
+{return $('<div/>',{'id':!settings.aanFeatures.r?settings.sTableId+'_processing':null,'class':settings.oClasses.sProcessing}).html(settings.oLanguage.sProcessing).append('<div><div></div><div></div><div></div><div></div></div>').insertBefore(settings.nTable)[0];}
+function _fnProcessingDisplay(settings,show)
+{if(settings.oFeatures.bProcessing){$(settings.aanFeatures.r).css('display',show?'block':'none');}
+_fnCallbackFire(settings,null,'processing',[settings,show]);}
+function _fnFeatureHtmlTable(settings)
+{var table=$(settings.nTable);var scroll=settings.oScroll;if(scroll.sX===''&&scroll.sY===''){return settings.nTable;}
+var scrollX=scroll.sX;var scrollY=scroll.sY;var classes=settings.oClasses;var caption=table.children('caption');var captionSide=caption.length?caption[0]._captionSide:null;var headerClone=$(table[0].cloneNode(false));var footerClone=$(table[0].cloneNode(false));var footer=table.children('tfoot');var _div='<div/>';var size=function(s){return!s?null:_fnStringToCss(s);};if(!footer.length){footer=null;}
+var scroller=$(_div,{'class':classes.sScrollWrapper}).append($(_div,{'class':classes.sScrollHead}).css({overflow:'hidden',position:'relative',border:0,width:scrollX?size(scrollX):'100%'}).append($(_div,{'class':classes.sScrollHeadInner}).css({'box-sizing':'content-box',width:scroll.sXInner||'100%'}).append(headerClone.removeAttr('id').css('margin-left',0).append(captionSide==='top'?caption:null).append(table.children('thead'))))).append($(_div,{'class':classes.sScrollBody}).css({position:'relative',overflow:'auto',width:size(scrollX)}).append(table));if(footer){scroller.append($(_div,{'class':classes.sScrollFoot}).css({overflow:'hidden',border:0,width:scrollX?size(scrollX):'100%'}).append($(_div,{'class':classes.sScrollFootInner}).append(footerClone.removeAttr('id').css('margin-left',0).append(captionSide==='bottom'?caption:null).append(table.children('tfoot')))));}
+var children=scroller.children();var scrollHead=children[0];var scrollBody=children[1];var scrollFoot=footer?children[2]:null;if(scrollX){$(scrollBody).on('scroll.DT',function(e){var scrollLeft=this.scrollLeft;scrollHead.scrollLeft=scrollLeft;if(footer){scrollFoot.scrollLeft=scrollLeft;}});}
+$(scrollBody).css('max-height',scrollY);if(!scroll.bCollapse){$(scrollBody).css('height',scrollY);}
+settings.nScrollHead=scrollHead;settings.nScrollBody=scrollBody;settings.nScrollFoot=scrollFoot;settings.aoDrawCallback.push({"fn":_fnScrollDraw,"sName":"scrolling"});return scroller[0];}
+function _fnScrollDraw(settings)
+{var
+scroll=settings.oScroll,scrollX=scroll.sX,scrollXInner=scroll.sXInner,scrollY=scroll.sY,barWidth=scroll.iBarWidth,divHeader=$(settings.nScrollHead),divHeaderStyle=divHeader[0].style,divHeaderInner=divHeader.children('div'),divHeaderInnerStyle=divHeaderInner[0].style,divHeaderTable=divHeaderInner.children('table'),divBodyEl=settings.nScrollBody,divBody=$(divBodyEl),divBodyStyle=divBodyEl.style,divFooter=$(settings.nScrollFoot),divFooterInner=divFooter.children('div'),divFooterTable=divFooterInner.children('table'),header=$(settings.nTHead),table=$(settings.nTable),tableEl=table[0],tableStyle=tableEl.style,footer=settings.nTFoot?$(settings.nTFoot):null,browser=settings.oBrowser,ie67=browser.bScrollOversize,dtHeaderCells=_pluck(settings.aoColumns,'nTh'),headerTrgEls,footerTrgEls,headerSrcEls,footerSrcEls,headerCopy,footerCopy,headerWidths=[],footerWidths=[],headerContent=[],footerContent=[],idx,correction,sanityWidth,zeroOut=function(nSizer){var style=nSizer.style;style.paddingTop="0";style.paddingBottom="0";style.borderTopWidth="0";style.borderBottomWidth="0";style.height=0;};var scrollBarVis=divBodyEl.scrollHeight>divBodyEl.clientHeight;if(settings.scrollBarVis!==scrollBarVis&&settings.scrollBarVis!==undefined){settings.scrollBarVis=scrollBarVis;_fnAdjustColumnSizing(settings);return;}
+else{settings.scrollBarVis=scrollBarVis;}
+table.children('thead, tfoot').remove();if(footer){footerCopy=footer.clone().prependTo(table);footerTrgEls=footer.find('tr');footerSrcEls=footerCopy.find('tr');footerCopy.find('[id]').removeAttr('id');}
+headerCopy=header.clone().prependTo(table);headerTrgEls=header.find('tr');headerSrcEls=headerCopy.find('tr');headerCopy.find('th, td').removeAttr('tabindex');headerCopy.find('[id]').removeAttr('id');if(!scrollX)
+{divBodyStyle.width='100%';divHeader[0].style.width='100%';}
+$.each(_fnGetUniqueThs(settings,headerCopy),function(i,el){idx=_fnVisibleToColumnIndex(settings,i);el.style.width=settings.aoColumns[idx].sWidth;});if(footer){_fnApplyToChildren(function(n){n.style.width="";},footerSrcEls);}
+sanityWidth=table.outerWidth();if(scrollX===""){tableStyle.width="100%";if(ie67&&(table.find('tbody').height()>divBodyEl.offsetHeight||divBody.css('overflow-y')=="scroll")){tableStyle.width=_fnStringToCss(table.outerWidth()-barWidth);}
+sanityWidth=table.outerWidth();}
+else if(scrollXInner!==""){tableStyle.width=_fnStringToCss(scrollXInner);sanityWidth=table.outerWidth();}
+_fnApplyToChildren(zeroOut,headerSrcEls);_fnApplyToChildren(function(nSizer){var style=window.getComputedStyle?window.getComputedStyle(nSizer).width:_fnStringToCss($(nSizer).width());headerContent.push(nSizer.innerHTML);headerWidths.push(style);},headerSrcEls);_fnApplyToChildren(function(nToSize,i){nToSize.style.width=headerWidths[i];},headerTrgEls);$(headerSrcEls).css('height',0);if(footer)
+{_fnApplyToChildren(zeroOut,footerSrcEls);_fnApplyToChildren(function(nSizer){footerContent.push(nSizer.innerHTML);footerWidths.push(_fnStringToCss($(nSizer).css('width')));},footerSrcEls);_fnApplyToChildren(function(nToSize,i){nToSize.style.width=footerWidths[i];},footerTrgEls);$(footerSrcEls).height(0);}
+_fnApplyToChildren(function(nSizer,i){nSizer.innerHTML='<div class="dataTables_sizing">'+headerContent[i]+'</div>';nSizer.childNodes[0].style.height="0";nSizer.childNodes[0].style.overflow="hidden";nSizer.style.width=headerWidths[i];},headerSrcEls);if(footer)
+{_fnApplyToChildren(function(nSizer,i){nSizer.innerHTML='<div class="dataTables_sizing">'+footerContent[i]+'</div>';nSizer.childNodes[0].style.height="0";nSizer.childNodes[0].style.overflow="hidden";nSizer.style.width=footerWidths[i];},footerSrcEls);}
+if(Math.round(table.outerWidth())<Math.round(sanityWidth))
+{correction=((divBodyEl.scrollHeight>divBodyEl.offsetHeight||divBody.css('overflow-y')=="scroll"))?sanityWidth+barWidth:sanityWidth;if(ie67&&(divBodyEl.scrollHeight>divBodyEl.offsetHeight||divBody.css('overflow-y')=="scroll")){tableStyle.width=_fnStringToCss(correction-barWidth);}
+if(scrollX===""||scrollXInner!==""){_fnLog(settings,1,'Possible column misalignment',6);}}
+else
+{correction='100%';}
+divBodyStyle.width=_fnStringToCss(correction);divHeaderStyle.width=_fnStringToCss(correction);if(footer){settings.nScrollFoot.style.width=_fnStringToCss(correction);}
+if(!scrollY){if(ie67){divBodyStyle.height=_fnStringToCss(tableEl.offsetHeight+barWidth);}}
+var iOuterWidth=table.outerWidth();divHeaderTable[0].style.width=_fnStringToCss(iOuterWidth);divHeaderInnerStyle.width=_fnStringToCss(iOuterWidth);var bScrolling=table.height()>divBodyEl.clientHeight||divBody.css('overflow-y')=="scroll";var padding='padding'+(browser.bScrollbarLeft?'Left':'Right');divHeaderInnerStyle[padding]=bScrolling?barWidth+"px":"0px";if(footer){divFooterTable[0].style.width=_fnStringToCss(iOuterWidth);divFooterInner[0].style.width=_fnStringToCss(iOuterWidth);divFooterInner[0].style[padding]=bScrolling?barWidth+"px":"0px";}
+table.children('colgroup').insertBefore(table.children('thead'));divBody.trigger('scroll');if((settings.bSorted||settings.bFiltered)&&!settings._drawHold){divBodyEl.scrollTop=0;}}
+function _fnApplyToChildren(fn,an1,an2)
+{var index=0,i=0,iLen=an1.length;var nNode1,nNode2;while(i<iLen){nNode1=an1[i].firstChild;nNode2=an2?an2[i].firstChild:null;while(nNode1){if(nNode1.nodeType===1){if(an2){fn(nNode1,nNode2,index);}
+else{fn(nNode1,index);}
+index++;}
+nNode1=nNode1.nextSibling;nNode2=an2?nNode2.nextSibling:null;}
+i++;}}
+var __re_html_remove=/<.*?>/g;function _fnCalculateColumnWidths(oSettings)
+{var
+table=oSettings.nTable,columns=oSettings.aoColumns,scroll=oSettings.oScroll,scrollY=scroll.sY,scrollX=scroll.sX,scrollXInner=scroll.sXInner,columnCount=columns.length,visibleColumns=_fnGetColumns(oSettings,'bVisible'),headerCells=$('th',oSettings.nTHead),tableWidthAttr=table.getAttribute('width'),tableContainer=table.parentNode,userInputs=false,i,column,columnIdx,width,outerWidth,browser=oSettings.oBrowser,ie67=browser.bScrollOversize;var styleWidth=table.style.width;if(styleWidth&&styleWidth.indexOf('%')!==-1){tableWidthAttr=styleWidth;}
+for(i=0;i<visibleColumns.length;i++){column=columns[visibleColumns[i]];if(column.sWidth!==null){column.sWidth=_fnConvertToWidth(column.sWidthOrig,tableContainer);userInputs=true;}}
+if(ie67||!userInputs&&!scrollX&&!scrollY&&columnCount==_fnVisbleColumns(oSettings)&&columnCount==headerCells.length){for(i=0;i<columnCount;i++){var colIdx=_fnVisibleToColumnIndex(oSettings,i);if(colIdx!==null){columns[colIdx].sWidth=_fnStringToCss(headerCells.eq(i).width());}}}
+else
+{var tmpTable=$(table).clone().css('visibility','hidden').removeAttr('id');tmpTable.find('tbody tr').remove();var tr=$('<tr/>').appendTo(tmpTable.find('tbody'));tmpTable.find('thead, tfoot').remove();tmpTable.append($(oSettings.nTHead).clone()).append($(oSettings.nTFoot).clone());tmpTable.find('tfoot th, tfoot td').css('width','');headerCells=_fnGetUniqueThs(oSettings,tmpTable.find('thead')[0]);for(i=0;i<visibleColumns.length;i++){column=columns[visibleColumns[i]];headerCells[i].style.width=column.sWidthOrig!==null&&column.sWidthOrig!==''?_fnStringToCss(column.sWidthOrig):'';if(column.sWidthOrig&&scrollX){$(headerCells[i]).append($('<div/>').css({width:column.sWidthOrig,margin:0,padding:0,border:0,height:1}));}}
+if(oSettings.aoData.length){for(i=0;i<visibleColumns.length;i++){columnIdx=visibleColumns[i];column=columns[columnIdx];$(_fnGetWidestNode(oSettings,columnIdx)).clone(false).append(column.sContentPadding).appendTo(tr);}}
+$('[name]',tmpTable).removeAttr('name');var holder=$('<div/>').css(scrollX||scrollY?{position:'absolute',top:0,left:0,height:1,right:0,overflow:'hidden'}:{}).append(tmpTable).appendTo(tableContainer);if(scrollX&&scrollXInner){tmpTable.width(scrollXInner);}
+else if(scrollX){tmpTable.css('width','auto');tmpTable.removeAttr('width');if(tmpTable.width()<tableContainer.clientWidth&&tableWidthAttr){tmpTable.width(tableContainer.clientWidth);}}
+else if(scrollY){tmpTable.width(tableContainer.clientWidth);}
+else if(tableWidthAttr){tmpTable.width(tableWidthAttr);}
+var total=0;for(i=0;i<visibleColumns.length;i++){var cell=$(headerCells[i]);var border=cell.outerWidth()-cell.width();var bounding=browser.bBounding?Math.ceil(headerCells[i].getBoundingClientRect().width):cell.outerWidth();total+=bounding;columns[visibleColumns[i]].sWidth=_fnStringToCss(bounding-border);}
+table.style.width=_fnStringToCss(total);holder.remove();}
+if(tableWidthAttr){table.style.width=_fnStringToCss(tableWidthAttr);}
+if((tableWidthAttr||scrollX)&&!oSettings._reszEvt){var bindResize=function(){$(window).on('resize.DT-'+oSettings.sInstance,_fnThrottle(function(){_fnAdjustColumnSizing(oSettings);}));};if(ie67){setTimeout(bindResize,1000);}
+else{bindResize();}
+oSettings._reszEvt=true;}}
+var _fnThrottle=DataTable.util.throttle;function _fnConvertToWidth(width,parent)
+{if(!width){return 0;}
+var n=$('<div/>').css('width',_fnStringToCss(width)).appendTo(parent||document.body);var val=n[0].offsetWidth;n.remove();return val;}
+function _fnGetWidestNode(settings,colIdx)
+{var idx=_fnGetMaxLenString(settings,colIdx);if(idx<0){return null;}
+var data=settings.aoData[idx];return!data.nTr?$('<td/>').html(_fnGetCellData(settings,idx,colIdx,'display'))[0]:data.anCells[colIdx];}
+function _fnGetMaxLenString(settings,colIdx)
+{var s,max=-1,maxIdx=-1;for(var i=0,ien=settings.aoData.length;i<ien;i++){s=_fnGetCellData(settings,i,colIdx,'display')+'';s=s.replace(__re_html_remove,'');s=s.replace(/&nbsp;/g,' ');if(s.length>max){max=s.length;maxIdx=i;}}
+return maxIdx;}
+function _fnStringToCss(s)
+{if(s===null){return'0px';}
+if(typeof s=='number'){return s<0?'0px':s+'px';}
+return s.match(/\d$/)?s+'px':s;}
+function _fnSortFlatten(settings)
+{var
+i,iLen,k,kLen,aSort=[],aiOrig=[],aoColumns=settings.aoColumns,aDataSort,iCol,sType,srcCol,fixed=settings.aaSortingFixed,fixedObj=$.isPlainObject(fixed),nestedSort=[],add=function(a){if(a.length&&!Array.isArray(a[0])){nestedSort.push(a);}
+else{$.merge(nestedSort,a);}};if(Array.isArray(fixed)){add(fixed);}
+if(fixedObj&&fixed.pre){add(fixed.pre);}
+add(settings.aaSorting);if(fixedObj&&fixed.post){add(fixed.post);}
+for(i=0;i<nestedSort.length;i++)
+{srcCol=nestedSort[i][0];aDataSort=aoColumns[srcCol].aDataSort;for(k=0,kLen=aDataSort.length;k<kLen;k++)
+{iCol=aDataSort[k];sType=aoColumns[iCol].sType||'string';if(nestedSort[i]._idx===undefined){nestedSort[i]._idx=$.inArray(nestedSort[i][1],aoColumns[iCol].asSorting);}
+aSort.push({src:srcCol,col:iCol,dir:nestedSort[i][1],index:nestedSort[i]._idx,type:sType,formatter:DataTable.ext.type.order[sType+"-pre"]});}}
+return aSort;}
+function _fnSort(oSettings)
+{var
+i,ien,iLen,j,jLen,k,kLen,sDataType,nTh,aiOrig=[],oExtSort=DataTable.ext.type.order,aoData=oSettings.aoData,aoColumns=oSettings.aoColumns,aDataSort,data,iCol,sType,oSort,formatters=0,sortCol,displayMaster=oSettings.aiDisplayMaster,aSort;_fnColumnTypes(oSettings);aSort=_fnSortFlatten(oSettings);for(i=0,ien=aSort.length;i<ien;i++){sortCol=aSort[i];if(sortCol.formatter){formatters++;}
+_fnSortData(oSettings,sortCol.col);}
+if(_fnDataSource(oSettings)!='ssp'&&aSort.length!==0)
+{for(i=0,iLen=displayMaster.length;i<iLen;i++){aiOrig[displayMaster[i]]=i;}
+if(formatters===aSort.length){displayMaster.sort(function(a,b){var
+x,y,k,test,sort,len=aSort.length,dataA=aoData[a]._aSortData,dataB=aoData[b]._aSortData;for(k=0;k<len;k++){sort=aSort[k];x=dataA[sort.col];y=dataB[sort.col];test=x<y?-1:x>y?1:0;if(test!==0){return sort.dir==='asc'?test:-test;}}
+x=aiOrig[a];y=aiOrig[b];return x<y?-1:x>y?1:0;});}
+else{displayMaster.sort(function(a,b){var
+x,y,k,l,test,sort,fn,len=aSort.length,dataA=aoData[a]._aSortData,dataB=aoData[b]._aSortData;for(k=0;k<len;k++){sort=aSort[k];x=dataA[sort.col];y=dataB[sort.col];fn=oExtSort[sort.type+"-"+sort.dir]||oExtSort["string-"+sort.dir];test=fn(x,y);if(test!==0){return test;}}
+x=aiOrig[a];y=aiOrig[b];return x<y?-1:x>y?1:0;});}}
+oSettings.bSorted=true;}
+function _fnSortAria(settings)
+{var label;var nextSort;var columns=settings.aoColumns;var aSort=_fnSortFlatten(settings);var oAria=settings.oLanguage.oAria;for(var i=0,iLen=columns.length;i<iLen;i++)
+{var col=columns[i];var asSorting=col.asSorting;var sTitle=col.ariaTitle||col.sTitle.replace(/<.*?>/g,"");var th=col.nTh;th.removeAttribute('aria-sort');if(col.bSortable){if(aSort.length>0&&aSort[0].col==i){th.setAttribute('aria-sort',aSort[0].dir=="asc"?"ascending":"descending");nextSort=asSorting[aSort[0].index+1]||asSorting[0];}
+else{nextSort=asSorting[0];}
+label=sTitle+(nextSort==="asc"?oAria.sSortAscending:oAria.sSortDescending);}
+else{label=sTitle;}
+th.setAttribute('aria-label',label);}}
+function _fnSortListener(settings,colIdx,append,callback)
+{var col=settings.aoColumns[colIdx];var sorting=settings.aaSorting;var asSorting=col.asSorting;var nextSortIdx;var next=function(a,overflow){var idx=a._idx;if(idx===undefined){idx=$.inArray(a[1],asSorting);}
+return idx+1<asSorting.length?idx+1:overflow?null:0;};if(typeof sorting[0]==='number'){sorting=settings.aaSorting=[sorting];}
+if(append&&settings.oFeatures.bSortMulti){var sortIdx=$.inArray(colIdx,_pluck(sorting,'0'));if(sortIdx!==-1){nextSortIdx=next(sorting[sortIdx],true);if(nextSortIdx===null&&sorting.length===1){nextSortIdx=0;}
+if(nextSortIdx===null){sorting.splice(sortIdx,1);}
+else{sorting[sortIdx][1]=asSorting[nextSortIdx];sorting[sortIdx]._idx=nextSortIdx;}}
+else{sorting.push([colIdx,asSorting[0],0]);sorting[sorting.length-1]._idx=0;}}
+else if(sorting.length&&sorting[0][0]==colIdx){nextSortIdx=next(sorting[0]);sorting.length=1;sorting[0][1]=asSorting[nextSortIdx];sorting[0]._idx=nextSortIdx;}
+else{sorting.length=0;sorting.push([colIdx,asSorting[0]]);sorting[0]._idx=0;}
+_fnReDraw(settings);if(typeof callback=='function'){callback(settings);}}
+function _fnSortAttachListener(settings,attachTo,colIdx,callback)
+{var col=settings.aoColumns[colIdx];_fnBindAction(attachTo,{},function(e){if(col.bSortable===false){return;}
+if(settings.oFeatures.bProcessing){_fnProcessingDisplay(settings,true);setTimeout(function(){_fnSortListener(settings,colIdx,e.shiftKey,callback);if(_fnDataSource(settings)!=='ssp'){_fnProcessingDisplay(settings,false);}},0);}
+else{_fnSortListener(settings,colIdx,e.shiftKey,callback);}});}
+function _fnSortingClasses(settings)
+{var oldSort=settings.aLastSort;var sortClass=settings.oClasses.sSortColumn;var sort=_fnSortFlatten(settings);var features=settings.oFeatures;var i,ien,colIdx;if(features.bSort&&features.bSortClasses){for(i=0,ien=oldSort.length;i<ien;i++){colIdx=oldSort[i].src;$(_pluck(settings.aoData,'anCells',colIdx)).removeClass(sortClass+(i<2?i+1:3));}
+for(i=0,ien=sort.length;i<ien;i++){colIdx=sort[i].src;$(_pluck(settings.aoData,'anCells',colIdx)).addClass(sortClass+(i<2?i+1:3));}}
+settings.aLastSort=sort;}
+function _fnSortData(settings,idx)
+{var column=settings.aoColumns[idx];var customSort=DataTable.ext.order[column.sSortDataType];var customData;if(customSort){customData=customSort.call(settings.oInstance,settings,idx,_fnColumnIndexToVisible(settings,idx));}
+var row,cellData;var formatter=DataTable.ext.type.order[column.sType+"-pre"];for(var i=0,ien=settings.aoData.length;i<ien;i++){row=settings.aoData[i];if(!row._aSortData){row._aSortData=[];}
+if(!row._aSortData[idx]||customSort){cellData=customSort?customData[i]:_fnGetCellData(settings,i,idx,'sort');row._aSortData[idx]=formatter?formatter(cellData):cellData;}}}
+function _fnSaveState(settings)
+{if(settings._bLoadingState){return;}
+var state={time:+new Date(),start:settings._iDisplayStart,length:settings._iDisplayLength,order:$.extend(true,[],settings.aaSorting),search:_fnSearchToCamel(settings.oPreviousSearch),columns:$.map(settings.aoColumns,function(col,i){return{visible:col.bVisible,search:_fnSearchToCamel(settings.aoPreSearchCols[i])};})};settings.oSavedState=state;_fnCallbackFire(settings,"aoStateSaveParams",'stateSaveParams',[settings,state]);if(settings.oFeatures.bStateSave&&!settings.bDestroying)
+{settings.fnStateSaveCallback.call(settings.oInstance,settings,state);}}
+function _fnLoadState(settings,oInit,callback)
+{if(!settings.oFeatures.bStateSave){callback();return;}
+var loaded=function(state){_fnImplementState(settings,state,callback);}
+var state=settings.fnStateLoadCallback.call(settings.oInstance,settings,loaded);if(state!==undefined){_fnImplementState(settings,state,callback);}
+return true;}
+function _fnImplementState(settings,s,callback){var i,ien;var columns=settings.aoColumns;settings._bLoadingState=true;var api=settings._bInitComplete?new DataTable.Api(settings):null;if(!s||!s.time){settings._bLoadingState=false;callback();return;}
+var abStateLoad=_fnCallbackFire(settings,'aoStateLoadParams','stateLoadParams',[settings,s]);if($.inArray(false,abStateLoad)!==-1){settings._bLoadingState=false;callback();return;}
+var duration=settings.iStateDuration;if(duration>0&&s.time<+new Date()-(duration*1000)){settings._bLoadingState=false;callback();return;}
+if(s.columns&&columns.length!==s.columns.length){settings._bLoadingState=false;callback();return;}
+settings.oLoadedState=$.extend(true,{},s);if(s.length!==undefined){if(api){api.page.len(s.length)}
+else{settings._iDisplayLength=s.length;}}
+if(s.start!==undefined){if(api===null){settings._iDisplayStart=s.start;settings.iInitDisplayStart=s.start;}
+else{_fnPageChange(settings,s.start/settings._iDisplayLength);}}
+if(s.order!==undefined){settings.aaSorting=[];$.each(s.order,function(i,col){settings.aaSorting.push(col[0]>=columns.length?[0,col[1]]:col);});}
+if(s.search!==undefined){$.extend(settings.oPreviousSearch,_fnSearchToHung(s.search));}
+if(s.columns){for(i=0,ien=s.columns.length;i<ien;i++){var col=s.columns[i];if(col.visible!==undefined){if(api){api.column(i).visible(col.visible,false);}
+else{columns[i].bVisible=col.visible;}}
+if(col.search!==undefined){$.extend(settings.aoPreSearchCols[i],_fnSearchToHung(col.search));}}
+if(api){api.columns.adjust();}}
+settings._bLoadingState=false;_fnCallbackFire(settings,'aoStateLoaded','stateLoaded',[settings,s]);callback();};function _fnSettingsFromNode(table)
+{var settings=DataTable.settings;var idx=$.inArray(table,_pluck(settings,'nTable'));return idx!==-1?settings[idx]:null;}
+function _fnLog(settings,level,msg,tn)
+{msg='DataTables warning: '+
+(settings?'table id='+settings.sTableId+' - ':'')+msg;if(tn){msg+='. For more information about this error, please see '+'http://datatables.net/tn/'+tn;}
+if(!level){var ext=DataTable.ext;var type=ext.sErrMode||ext.errMode;if(settings){_fnCallbackFire(settings,null,'error',[settings,tn,msg]);}
+if(type=='alert'){alert(msg);}
+else if(type=='throw'){throw new Error(msg);}
+else if(typeof type=='function'){type(settings,tn,msg);}}
+else if(window.console&&console.log){console.log(msg);}}
+function _fnMap(ret,src,name,mappedName)
+{if(Array.isArray(name)){$.each(name,function(i,val){if(Array.isArray(val)){_fnMap(ret,src,val[0],val[1]);}
+else{_fnMap(ret,src,val);}});return;}
+if(mappedName===undefined){mappedName=name;}
+if(src[name]!==undefined){ret[mappedName]=src[name];}}
+function _fnExtend(out,extender,breakRefs)
+{var val;for(var prop in extender){if(extender.hasOwnProperty(prop)){val=extender[prop];if($.isPlainObject(val)){if(!$.isPlainObject(out[prop])){out[prop]={};}
+$.extend(true,out[prop],val);}
+else if(breakRefs&&prop!=='data'&&prop!=='aaData'&&Array.isArray(val)){out[prop]=val.slice();}
+else{out[prop]=val;}}}
+return out;}
+function _fnBindAction(n,oData,fn)
+{$(n).on('click.DT',oData,function(e){$(n).trigger('blur');fn(e);}).on('keypress.DT',oData,function(e){if(e.which===13){e.preventDefault();fn(e);}}).on('selectstart.DT',function(){return false;});}
+function _fnCallbackReg(oSettings,sStore,fn,sName)
+{if(fn)
+{oSettings[sStore].push({"fn":fn,"sName":sName});}}
+function _fnCallbackFire(settings,callbackArr,eventName,args)
+{var ret=[];if(callbackArr){ret=$.map(settings[callbackArr].slice().reverse(),function(val,i){return val.fn.apply(settings.oInstance,args);});}
+if(eventName!==null){var e=$.Event(eventName+'.dt');$(settings.nTable).trigger(e,args);ret.push(e.result);}
+return ret;}
+function _fnLengthOverflow(settings)
+{var
+start=settings._iDisplayStart,end=settings.fnDisplayEnd(),len=settings._iDisplayLength;if(start>=end)
+{start=end-len;}
+start-=(start%len);if(len===-1||start<0)
+{start=0;}
+settings._iDisplayStart=start;}
+function _fnRenderer(settings,type)
+{var renderer=settings.renderer;var host=DataTable.ext.renderer[type];if($.isPlainObject(renderer)&&renderer[type]){return host[renderer[type]]||host._;}
+else if(typeof renderer==='string'){return host[renderer]||host._;}
+return host._;}
+function _fnDataSource(settings)
+{if(settings.oFeatures.bServerSide){return'ssp';}
+else if(settings.ajax||settings.sAjaxSource){return'ajax';}
+return'dom';}
+var __apiStruct=[];var __arrayProto=Array.prototype;var _toSettings=function(mixed)
+{var idx,jq;var settings=DataTable.settings;var tables=$.map(settings,function(el,i){return el.nTable;});if(!mixed){return[];}
+else if(mixed.nTable&&mixed.oApi){return[mixed];}
+else if(mixed.nodeName&&mixed.nodeName.toLowerCase()==='table'){idx=$.inArray(mixed,tables);return idx!==-1?[settings[idx]]:null;}
+else if(mixed&&typeof mixed.settings==='function'){return mixed.settings().toArray();}
+else if(typeof mixed==='string'){jq=$(mixed);}
+else if(mixed instanceof $){jq=mixed;}
+if(jq){return jq.map(function(i){idx=$.inArray(this,tables);return idx!==-1?settings[idx]:null;}).toArray();}};_Api=function(context,data)
+{if(!(this instanceof _Api)){return new _Api(context,data);}
+var settings=[];var ctxSettings=function(o){var a=_toSettings(o);if(a){settings.push.apply(settings,a);}};if(Array.isArray(context)){for(var i=0,ien=context.length;i<ien;i++){ctxSettings(context[i]);}}
+else{ctxSettings(context);}
+this.context=_unique(settings);if(data){$.merge(this,data);}
+this.selector={rows:null,cols:null,opts:null};_Api.extend(this,this,__apiStruct);};DataTable.Api=_Api;$.extend(_Api.prototype,{any:function()
+{return this.count()!==0;},concat:__arrayProto.concat,context:[],count:function()
+{return this.flatten().length;},each:function(fn)
+{for(var i=0,ien=this.length;i<ien;i++){fn.call(this,this[i],i,this);}
+return this;},eq:function(idx)
+{var ctx=this.context;return ctx.length>idx?new _Api(ctx[idx],this[idx]):null;},filter:function(fn)
+{var a=[];if(__arrayProto.filter){a=__arrayProto.filter.call(this,fn,this);}
+else{for(var i=0,ien=this.length;i<ien;i++){if(fn.call(this,this[i],i,this)){a.push(this[i]);}}}
+return new _Api(this.context,a);},flatten:function()
+{var a=[];return new _Api(this.context,a.concat.apply(a,this.toArray()));},join:__arrayProto.join,indexOf:__arrayProto.indexOf||function(obj,start)
+{for(var i=(start||0),ien=this.length;i<ien;i++){if(this[i]===obj){return i;}}
+return-1;},iterator:function(flatten,type,fn,alwaysNew){var
+a=[],ret,i,ien,j,jen,context=this.context,rows,items,item,selector=this.selector;if(typeof flatten==='string'){alwaysNew=fn;fn=type;type=flatten;flatten=false;}
+for(i=0,ien=context.length;i<ien;i++){var apiInst=new _Api(context[i]);if(type==='table'){ret=fn.call(apiInst,context[i],i);if(ret!==undefined){a.push(ret);}}
+else if(type==='columns'||type==='rows'){ret=fn.call(apiInst,context[i],this[i],i);if(ret!==undefined){a.push(ret);}}
+else if(type==='column'||type==='column-rows'||type==='row'||type==='cell'){items=this[i];if(type==='column-rows'){rows=_selector_row_indexes(context[i],selector.opts);}
+for(j=0,jen=items.length;j<jen;j++){item=items[j];if(type==='cell'){ret=fn.call(apiInst,context[i],item.row,item.column,i,j);}
+else{ret=fn.call(apiInst,context[i],item,i,j,rows);}
+if(ret!==undefined){a.push(ret);}}}}
+if(a.length||alwaysNew){var api=new _Api(context,flatten?a.concat.apply([],a):a);var apiSelector=api.selector;apiSelector.rows=selector.rows;apiSelector.cols=selector.cols;apiSelector.opts=selector.opts;return api;}
+return this;},lastIndexOf:__arrayProto.lastIndexOf||function(obj,start)
+{return this.indexOf.apply(this.toArray.reverse(),arguments);},length:0,map:function(fn)
+{var a=[];if(__arrayProto.map){a=__arrayProto.map.call(this,fn,this);}
+else{for(var i=0,ien=this.length;i<ien;i++){a.push(fn.call(this,this[i],i));}}
+return new _Api(this.context,a);},pluck:function(prop)
+{let fn=DataTable.util.get(prop);return this.map(function(el){return fn(el);});},pop:__arrayProto.pop,push:__arrayProto.push,reduce:__arrayProto.reduce||function(fn,init)
+{return _fnReduce(this,fn,init,0,this.length,1);},reduceRight:__arrayProto.reduceRight||function(fn,init)
+{return _fnReduce(this,fn,init,this.length-1,-1,-1);},reverse:__arrayProto.reverse,selector:null,shift:__arrayProto.shift,slice:function(){return new _Api(this.context,this);},sort:__arrayProto.sort,splice:__arrayProto.splice,toArray:function()
+{return __arrayProto.slice.call(this);},to$:function()
+{return $(this);},toJQuery:function()
+{return $(this);},unique:function()
+{return new _Api(this.context,_unique(this));},unshift:__arrayProto.unshift});_Api.extend=function(scope,obj,ext)
+{if(!ext.length||!obj||(!(obj instanceof _Api)&&!obj.__dt_wrapper)){return;}
+var
+i,ien,struct,methodScoping=function(scope,fn,struc){return function(){var ret=fn.apply(scope,arguments);_Api.extend(ret,ret,struc.methodExt);return ret;};};for(i=0,ien=ext.length;i<ien;i++){struct=ext[i];obj[struct.name]=struct.type==='function'?methodScoping(scope,struct.val,struct):struct.type==='object'?{}:struct.val;obj[struct.name].__dt_wrapper=true;_Api.extend(scope,obj[struct.name],struct.propExt);}};_Api.register=_api_register=function(name,val)
+{if(Array.isArray(name)){for(var j=0,jen=name.length;j<jen;j++){_Api.register(name[j],val);}
+return;}
+var
+i,ien,heir=name.split('.'),struct=__apiStruct,key,method;var find=function(src,name){for(var i=0,ien=src.length;i<ien;i++){if(src[i].name===name){return src[i];}}
+return null;};for(i=0,ien=heir.length;i<ien;i++){method=heir[i].indexOf('()')!==-1;key=method?heir[i].replace('()',''):heir[i];var src=find(struct,key);if(!src){src={name:key,val:{},methodExt:[],propExt:[],type:'object'};struct.push(src);}
+if(i===ien-1){src.val=val;src.type=typeof val==='function'?'function':$.isPlainObject(val)?'object':'other';}
+else{struct=method?src.methodExt:src.propExt;}}};_Api.registerPlural=_api_registerPlural=function(pluralName,singularName,val){_Api.register(pluralName,val);_Api.register(singularName,function(){var ret=val.apply(this,arguments);if(ret===this){return this;}
+else if(ret instanceof _Api){return ret.length?Array.isArray(ret[0])?new _Api(ret.context,ret[0]):ret[0]:undefined;}
+return ret;});};var __table_selector=function(selector,a)
+{if(Array.isArray(selector)){return $.map(selector,function(item){return __table_selector(item,a);});}
+if(typeof selector==='number'){return[a[selector]];}
+var nodes=$.map(a,function(el,i){return el.nTable;});return $(nodes).filter(selector).map(function(i){var idx=$.inArray(this,nodes);return a[idx];}).toArray();};_api_register('tables()',function(selector){return selector!==undefined&&selector!==null?new _Api(__table_selector(selector,this.context)):this;});_api_register('table()',function(selector){var tables=this.tables(selector);var ctx=tables.context;return ctx.length?new _Api(ctx[0]):tables;});_api_registerPlural('tables().nodes()','table().node()',function(){return this.iterator('table',function(ctx){return ctx.nTable;},1);});_api_registerPlural('tables().body()','table().body()',function(){return this.iterator('table',function(ctx){return ctx.nTBody;},1);});_api_registerPlural('tables().header()','table().header()',function(){return this.iterator('table',function(ctx){return ctx.nTHead;},1);});_api_registerPlural('tables().footer()','table().footer()',function(){return this.iterator('table',function(ctx){return ctx.nTFoot;},1);});_api_registerPlural('tables().containers()','table().container()',function(){return this.iterator('table',function(ctx){return ctx.nTableWrapper;},1);});_api_register('draw()',function(paging){return this.iterator('table',function(settings){if(paging==='page'){_fnDraw(settings);}
+else{if(typeof paging==='string'){paging=paging==='full-hold'?false:true;}
+_fnReDraw(settings,paging===false);}});});_api_register('page()',function(action){if(action===undefined){return this.page.info().page;}
+return this.iterator('table',function(settings){_fnPageChange(settings,action);});});_api_register('page.info()',function(action){if(this.context.length===0){return undefined;}
+var
+settings=this.context[0],start=settings._iDisplayStart,len=settings.oFeatures.bPaginate?settings._iDisplayLength:-1,visRecords=settings.fnRecordsDisplay(),all=len===-1;return{"page":all?0:Math.floor(start/len),"pages":all?1:Math.ceil(visRecords/len),"start":start,"end":settings.fnDisplayEnd(),"length":len,"recordsTotal":settings.fnRecordsTotal(),"recordsDisplay":visRecords,"serverSide":_fnDataSource(settings)==='ssp'};});_api_register('page.len()',function(len){if(len===undefined){return this.context.length!==0?this.context[0]._iDisplayLength:undefined;}
+return this.iterator('table',function(settings){_fnLengthChange(settings,len);});});var __reload=function(settings,holdPosition,callback){if(callback){var api=new _Api(settings);api.one('draw',function(){callback(api.ajax.json());});}
+if(_fnDataSource(settings)=='ssp'){_fnReDraw(settings,holdPosition);}
+else{_fnProcessingDisplay(settings,true);var xhr=settings.jqXHR;if(xhr&&xhr.readyState!==4){xhr.abort();}
+_fnBuildAjax(settings,[],function(json){_fnClearTable(settings);var data=_fnAjaxDataSrc(settings,json);for(var i=0,ien=data.length;i<ien;i++){_fnAddData(settings,data[i]);}
+_fnReDraw(settings,holdPosition);_fnProcessingDisplay(settings,false);});}};_api_register('ajax.json()',function(){var ctx=this.context;if(ctx.length>0){return ctx[0].json;}});_api_register('ajax.params()',function(){var ctx=this.context;if(ctx.length>0){return ctx[0].oAjaxData;}});_api_register('ajax.reload()',function(callback,resetPaging){return this.iterator('table',function(settings){__reload(settings,resetPaging===false,callback);});});_api_register('ajax.url()',function(url){var ctx=this.context;if(url===undefined){if(ctx.length===0){return undefined;}
+ctx=ctx[0];return ctx.ajax?$.isPlainObject(ctx.ajax)?ctx.ajax.url:ctx.ajax:ctx.sAjaxSource;}
+return this.iterator('table',function(settings){if($.isPlainObject(settings.ajax)){settings.ajax.url=url;}
+else{settings.ajax=url;}});});_api_register('ajax.url().load()',function(callback,resetPaging){return this.iterator('table',function(ctx){__reload(ctx,resetPaging===false,callback);});});var _selector_run=function(type,selector,selectFn,settings,opts)
+{var
+out=[],res,a,i,ien,j,jen,selectorType=typeof selector;if(!selector||selectorType==='string'||selectorType==='function'||selector.length===undefined){selector=[selector];}
+for(i=0,ien=selector.length;i<ien;i++){a=selector[i]&&selector[i].split&&!selector[i].match(/[\[\(:]/)?selector[i].split(','):[selector[i]];for(j=0,jen=a.length;j<jen;j++){res=selectFn(typeof a[j]==='string'?(a[j]).trim():a[j]);if(res&&res.length){out=out.concat(res);}}}
+var ext=_ext.selector[type];if(ext.length){for(i=0,ien=ext.length;i<ien;i++){out=ext[i](settings,opts,out);}}
+return _unique(out);};var _selector_opts=function(opts)
+{if(!opts){opts={};}
+if(opts.filter&&opts.search===undefined){opts.search=opts.filter;}
+return $.extend({search:'none',order:'current',page:'all'},opts);};var _selector_first=function(inst)
+{for(var i=0,ien=inst.length;i<ien;i++){if(inst[i].length>0){inst[0]=inst[i];inst[0].length=1;inst.length=1;inst.context=[inst.context[i]];return inst;}}
+inst.length=0;return inst;};var _selector_row_indexes=function(settings,opts)
+{var
+i,ien,tmp,a=[],displayFiltered=settings.aiDisplay,displayMaster=settings.aiDisplayMaster;var
+search=opts.search,order=opts.order,page=opts.page;if(_fnDataSource(settings)=='ssp'){return search==='removed'?[]:_range(0,displayMaster.length);}
+else if(page=='current'){for(i=settings._iDisplayStart,ien=settings.fnDisplayEnd();i<ien;i++){a.push(displayFiltered[i]);}}
+else if(order=='current'||order=='applied'){if(search=='none'){a=displayMaster.slice();}
+else if(search=='applied'){a=displayFiltered.slice();}
+else if(search=='removed'){var displayFilteredMap={};for(var i=0,ien=displayFiltered.length;i<ien;i++){displayFilteredMap[displayFiltered[i]]=null;}
+a=$.map(displayMaster,function(el){return!displayFilteredMap.hasOwnProperty(el)?el:null;});}}
+else if(order=='index'||order=='original'){for(i=0,ien=settings.aoData.length;i<ien;i++){if(search=='none'){a.push(i);}
+else{tmp=$.inArray(i,displayFiltered);if((tmp===-1&&search=='removed')||(tmp>=0&&search=='applied'))
+{a.push(i);}}}}
+return a;};var __row_selector=function(settings,selector,opts)
+{var rows;var run=function(sel){var selInt=_intVal(sel);var i,ien;var aoData=settings.aoData;if(selInt!==null&&!opts){return[selInt];}
+if(!rows){rows=_selector_row_indexes(settings,opts);}
+if(selInt!==null&&$.inArray(selInt,rows)!==-1){return[selInt];}
+else if(sel===null||sel===undefined||sel===''){return rows;}
+if(typeof sel==='function'){return $.map(rows,function(idx){var row=aoData[idx];return sel(idx,row._aData,row.nTr)?idx:null;});}
+if(sel.nodeName){var rowIdx=sel._DT_RowIndex;var cellIdx=sel._DT_CellIndex;if(rowIdx!==undefined){return aoData[rowIdx]&&aoData[rowIdx].nTr===sel?[rowIdx]:[];}
+else if(cellIdx){return aoData[cellIdx.row]&&aoData[cellIdx.row].nTr===sel.parentNode?[cellIdx.row]:[];}
+else{var host=$(sel).closest('*[data-dt-row]');return host.length?[host.data('dt-row')]:[];}}
+if(typeof sel==='string'&&sel.charAt(0)==='#'){var rowObj=settings.aIds[sel.replace(/^#/,'')];if(rowObj!==undefined){return[rowObj.idx];}}
+var nodes=_removeEmpty(_pluck_order(settings.aoData,rows,'nTr'));return $(nodes).filter(sel).map(function(){return this._DT_RowIndex;}).toArray();};return _selector_run('row',selector,run,settings,opts);};_api_register('rows()',function(selector,opts){if(selector===undefined){selector='';}
+else if($.isPlainObject(selector)){opts=selector;selector='';}
+opts=_selector_opts(opts);var inst=this.iterator('table',function(settings){return __row_selector(settings,selector,opts);},1);inst.selector.rows=selector;inst.selector.opts=opts;return inst;});_api_register('rows().nodes()',function(){return this.iterator('row',function(settings,row){return settings.aoData[row].nTr||undefined;},1);});_api_register('rows().data()',function(){return this.iterator(true,'rows',function(settings,rows){return _pluck_order(settings.aoData,rows,'_aData');},1);});_api_registerPlural('rows().cache()','row().cache()',function(type){return this.iterator('row',function(settings,row){var r=settings.aoData[row];return type==='search'?r._aFilterData:r._aSortData;},1);});_api_registerPlural('rows().invalidate()','row().invalidate()',function(src){return this.iterator('row',function(settings,row){_fnInvalidate(settings,row,src);});});_api_registerPlural('rows().indexes()','row().index()',function(){return this.iterator('row',function(settings,row){return row;},1);});_api_registerPlural('rows().ids()','row().id()',function(hash){var a=[];var context=this.context;for(var i=0,ien=context.length;i<ien;i++){for(var j=0,jen=this[i].length;j<jen;j++){var id=context[i].rowIdFn(context[i].aoData[this[i][j]]._aData);a.push((hash===true?'#':'')+id);}}
+return new _Api(context,a);});_api_registerPlural('rows().remove()','row().remove()',function(){var that=this;this.iterator('row',function(settings,row,thatIdx){var data=settings.aoData;var rowData=data[row];var i,ien,j,jen;var loopRow,loopCells;data.splice(row,1);for(i=0,ien=data.length;i<ien;i++){loopRow=data[i];loopCells=loopRow.anCells;if(loopRow.nTr!==null){loopRow.nTr._DT_RowIndex=i;}
+if(loopCells!==null){for(j=0,jen=loopCells.length;j<jen;j++){loopCells[j]._DT_CellIndex.row=i;}}}
+_fnDeleteIndex(settings.aiDisplayMaster,row);_fnDeleteIndex(settings.aiDisplay,row);_fnDeleteIndex(that[thatIdx],row,false);if(settings._iRecordsDisplay>0){settings._iRecordsDisplay--;}
+_fnLengthOverflow(settings);var id=settings.rowIdFn(rowData._aData);if(id!==undefined){delete settings.aIds[id];}});this.iterator('table',function(settings){for(var i=0,ien=settings.aoData.length;i<ien;i++){settings.aoData[i].idx=i;}});return this;});_api_register('rows.add()',function(rows){var newRows=this.iterator('table',function(settings){var row,i,ien;var out=[];for(i=0,ien=rows.length;i<ien;i++){row=rows[i];if(row.nodeName&&row.nodeName.toUpperCase()==='TR'){out.push(_fnAddTr(settings,row)[0]);}
+else{out.push(_fnAddData(settings,row));}}
+return out;},1);var modRows=this.rows(-1);modRows.pop();$.merge(modRows,newRows);return modRows;});_api_register('row()',function(selector,opts){return _selector_first(this.rows(selector,opts));});_api_register('row().data()',function(data){var ctx=this.context;if(data===undefined){return ctx.length&&this.length?ctx[0].aoData[this[0]]._aData:undefined;}
+var row=ctx[0].aoData[this[0]];row._aData=data;if(Array.isArray(data)&&row.nTr&&row.nTr.id){_fnSetObjectDataFn(ctx[0].rowId)(data,row.nTr.id);}
+_fnInvalidate(ctx[0],this[0],'data');return this;});_api_register('row().node()',function(){var ctx=this.context;return ctx.length&&this.length?ctx[0].aoData[this[0]].nTr||null:null;});_api_register('row.add()',function(row){if(row instanceof $&&row.length){row=row[0];}
+var rows=this.iterator('table',function(settings){if(row.nodeName&&row.nodeName.toUpperCase()==='TR'){return _fnAddTr(settings,row)[0];}
+return _fnAddData(settings,row);});return this.row(rows[0]);});$(document).on('plugin-init.dt',function(e,context){var api=new _Api(context);api.on('stateSaveParams',function(e,settings,d){var idFn=settings.rowIdFn;var data=settings.aoData;var ids=[];for(var i=0;i<data.length;i++){if(data[i]._detailsShow){ids.push('#'+idFn(data[i]._aData));}}
+d.childRows=ids;})
+var loaded=api.state.loaded();if(loaded&&loaded.childRows){api.rows($.map(loaded.childRows,function(id){return id.replace(/:/g,'\\:')})).every(function(){_fnCallbackFire(context,null,'requestChild',[this])});}});var __details_add=function(ctx,row,data,klass)
+{var rows=[];var addRow=function(r,k){if(Array.isArray(r)||r instanceof $){for(var i=0,ien=r.length;i<ien;i++){addRow(r[i],k);}
+return;}
+if(r.nodeName&&r.nodeName.toLowerCase()==='tr'){rows.push(r);}
+else{var created=$('<tr><td></td></tr>').addClass(k);$('td',created).addClass(k).html(r)
+[0].colSpan=_fnVisbleColumns(ctx);rows.push(created[0]);}};addRow(data,klass);if(row._details){row._details.detach();}
+row._details=$(rows);if(row._detailsShow){row._details.insertAfter(row.nTr);}};var __details_state=DataTable.util.throttle(function(ctx){_fnSaveState(ctx[0])},500);var __details_remove=function(api,idx)
+{var ctx=api.context;if(ctx.length){var row=ctx[0].aoData[idx!==undefined?idx:api[0]];if(row&&row._details){row._details.remove();row._detailsShow=undefined;row._details=undefined;$(row.nTr).removeClass('dt-hasChild');__details_state(ctx);}}};var __details_display=function(api,show){var ctx=api.context;if(ctx.length&&api.length){var row=ctx[0].aoData[api[0]];if(row._details){row._detailsShow=show;if(show){row._details.insertAfter(row.nTr);$(row.nTr).addClass('dt-hasChild');}
+else{row._details.detach();$(row.nTr).removeClass('dt-hasChild');}
+_fnCallbackFire(ctx[0],null,'childRow',[show,api.row(api[0])])
+__details_events(ctx[0]);__details_state(ctx);}}};var __details_events=function(settings)
+{var api=new _Api(settings);var namespace='.dt.DT_details';var drawEvent='draw'+namespace;var colvisEvent='column-sizing'+namespace;var destroyEvent='destroy'+namespace;var data=settings.aoData;api.off(drawEvent+' '+colvisEvent+' '+destroyEvent);if(_pluck(data,'_details').length>0){api.on(drawEvent,function(e,ctx){if(settings!==ctx){return;}
+api.rows({page:'current'}).eq(0).each(function(idx){var row=data[idx];if(row._detailsShow){row._details.insertAfter(row.nTr);}});});api.on(colvisEvent,function(e,ctx,idx,vis){if(settings!==ctx){return;}
+var row,visible=_fnVisbleColumns(ctx);for(var i=0,ien=data.length;i<ien;i++){row=data[i];if(row._details){row._details.children('td[colspan]').attr('colspan',visible);}}});api.on(destroyEvent,function(e,ctx){if(settings!==ctx){return;}
+for(var i=0,ien=data.length;i<ien;i++){if(data[i]._details){__details_remove(api,i);}}});}};var _emp='';var _child_obj=_emp+'row().child';var _child_mth=_child_obj+'()';_api_register(_child_mth,function(data,klass){var ctx=this.context;if(data===undefined){return ctx.length&&this.length?ctx[0].aoData[this[0]]._details:undefined;}
+else if(data===true){this.child.show();}
+else if(data===false){__details_remove(this);}
+else if(ctx.length&&this.length){__details_add(ctx[0],ctx[0].aoData[this[0]],data,klass);}
+return this;});_api_register([_child_obj+'.show()',_child_mth+'.show()'],function(show){__details_display(this,true);return this;});_api_register([_child_obj+'.hide()',_child_mth+'.hide()'],function(){__details_display(this,false);return this;});_api_register([_child_obj+'.remove()',_child_mth+'.remove()'],function(){__details_remove(this);return this;});_api_register(_child_obj+'.isShown()',function(){var ctx=this.context;if(ctx.length&&this.length){return ctx[0].aoData[this[0]]._detailsShow||false;}
+return false;});var __re_column_selector=/^([^:]+):(name|visIdx|visible)$/;var __columnData=function(settings,column,r1,r2,rows){var a=[];for(var row=0,ien=rows.length;row<ien;row++){a.push(_fnGetCellData(settings,rows[row],column));}
+return a;};var __column_selector=function(settings,selector,opts)
+{var
+columns=settings.aoColumns,names=_pluck(columns,'sName'),nodes=_pluck(columns,'nTh');var run=function(s){var selInt=_intVal(s);if(s===''){return _range(columns.length);}
+if(selInt!==null){return[selInt>=0?selInt:columns.length+selInt];}
+if(typeof s==='function'){var rows=_selector_row_indexes(settings,opts);return $.map(columns,function(col,idx){return s(idx,__columnData(settings,idx,0,0,rows),nodes[idx])?idx:null;});}
+var match=typeof s==='string'?s.match(__re_column_selector):'';if(match){switch(match[2]){case'visIdx':case'visible':var idx=parseInt(match[1],10);if(idx<0){var visColumns=$.map(columns,function(col,i){return col.bVisible?i:null;});return[visColumns[visColumns.length+idx]];}
+return[_fnVisibleToColumnIndex(settings,idx)];case'name':return $.map(names,function(name,i){return name===match[1]?i:null;});default:return[];}}
+if(s.nodeName&&s._DT_CellIndex){return[s._DT_CellIndex.column];}
+var jqResult=$(nodes).filter(s).map(function(){return $.inArray(this,nodes);}).toArray();if(jqResult.length||!s.nodeName){return jqResult;}
+var host=$(s).closest('*[data-dt-column]');return host.length?[host.data('dt-column')]:[];};return _selector_run('column',selector,run,settings,opts);};var __setColumnVis=function(settings,column,vis){var
+cols=settings.aoColumns,col=cols[column],data=settings.aoData,row,cells,i,ien,tr;if(vis===undefined){return col.bVisible;}
+if(col.bVisible===vis){return;}
+if(vis){var insertBefore=$.inArray(true,_pluck(cols,'bVisible'),column+1);for(i=0,ien=data.length;i<ien;i++){tr=data[i].nTr;cells=data[i].anCells;if(tr){tr.insertBefore(cells[column],cells[insertBefore]||null);}}}
+else{$(_pluck(settings.aoData,'anCells',column)).detach();}
+col.bVisible=vis;};_api_register('columns()',function(selector,opts){if(selector===undefined){selector='';}
+else if($.isPlainObject(selector)){opts=selector;selector='';}
+opts=_selector_opts(opts);var inst=this.iterator('table',function(settings){return __column_selector(settings,selector,opts);},1);inst.selector.cols=selector;inst.selector.opts=opts;return inst;});_api_registerPlural('columns().header()','column().header()',function(selector,opts){return this.iterator('column',function(settings,column){return settings.aoColumns[column].nTh;},1);});_api_registerPlural('columns().footer()','column().footer()',function(selector,opts){return this.iterator('column',function(settings,column){return settings.aoColumns[column].nTf;},1);});_api_registerPlural('columns().data()','column().data()',function(){return this.iterator('column-rows',__columnData,1);});_api_registerPlural('columns().dataSrc()','column().dataSrc()',function(){return this.iterator('column',function(settings,column){return settings.aoColumns[column].mData;},1);});_api_registerPlural('columns().cache()','column().cache()',function(type){return this.iterator('column-rows',function(settings,column,i,j,rows){return _pluck_order(settings.aoData,rows,type==='search'?'_aFilterData':'_aSortData',column);},1);});_api_registerPlural('columns().nodes()','column().nodes()',function(){return this.iterator('column-rows',function(settings,column,i,j,rows){return _pluck_order(settings.aoData,rows,'anCells',column);},1);});_api_registerPlural('columns().visible()','column().visible()',function(vis,calc){var that=this;var ret=this.iterator('column',function(settings,column){if(vis===undefined){return settings.aoColumns[column].bVisible;}
+__setColumnVis(settings,column,vis);});if(vis!==undefined){this.iterator('table',function(settings){_fnDrawHead(settings,settings.aoHeader);_fnDrawHead(settings,settings.aoFooter);if(!settings.aiDisplay.length){$(settings.nTBody).find('td[colspan]').attr('colspan',_fnVisbleColumns(settings));}
+_fnSaveState(settings);that.iterator('column',function(settings,column){_fnCallbackFire(settings,null,'column-visibility',[settings,column,vis,calc]);});if(calc===undefined||calc){that.columns.adjust();}});}
+return ret;});_api_registerPlural('columns().indexes()','column().index()',function(type){return this.iterator('column',function(settings,column){return type==='visible'?_fnColumnIndexToVisible(settings,column):column;},1);});_api_register('columns.adjust()',function(){return this.iterator('table',function(settings){_fnAdjustColumnSizing(settings);},1);});_api_register('column.index()',function(type,idx){if(this.context.length!==0){var ctx=this.context[0];if(type==='fromVisible'||type==='toData'){return _fnVisibleToColumnIndex(ctx,idx);}
+else if(type==='fromData'||type==='toVisible'){return _fnColumnIndexToVisible(ctx,idx);}}});_api_register('column()',function(selector,opts){return _selector_first(this.columns(selector,opts));});var __cell_selector=function(settings,selector,opts)
+{var data=settings.aoData;var rows=_selector_row_indexes(settings,opts);var cells=_removeEmpty(_pluck_order(data,rows,'anCells'));var allCells=$(_flatten([],cells));var row;var columns=settings.aoColumns.length;var a,i,ien,j,o,host;var run=function(s){var fnSelector=typeof s==='function';if(s===null||s===undefined||fnSelector){a=[];for(i=0,ien=rows.length;i<ien;i++){row=rows[i];for(j=0;j<columns;j++){o={row:row,column:j};if(fnSelector){host=data[row];if(s(o,_fnGetCellData(settings,row,j),host.anCells?host.anCells[j]:null)){a.push(o);}}
+else{a.push(o);}}}
+return a;}
+if($.isPlainObject(s)){return s.column!==undefined&&s.row!==undefined&&$.inArray(s.row,rows)!==-1?[s]:[];}
+var jqResult=allCells.filter(s).map(function(i,el){return{row:el._DT_CellIndex.row,column:el._DT_CellIndex.column};}).toArray();if(jqResult.length||!s.nodeName){return jqResult;}
+host=$(s).closest('*[data-dt-row]');return host.length?[{row:host.data('dt-row'),column:host.data('dt-column')}]:[];};return _selector_run('cell',selector,run,settings,opts);};_api_register('cells()',function(rowSelector,columnSelector,opts){if($.isPlainObject(rowSelector)){if(rowSelector.row===undefined){opts=rowSelector;rowSelector=null;}
+else{opts=columnSelector;columnSelector=null;}}
+if($.isPlainObject(columnSelector)){opts=columnSelector;columnSelector=null;}
+if(columnSelector===null||columnSelector===undefined){return this.iterator('table',function(settings){return __cell_selector(settings,rowSelector,_selector_opts(opts));});}
+var internalOpts=opts?{page:opts.page,order:opts.order,search:opts.search}:{};var columns=this.columns(columnSelector,internalOpts);var rows=this.rows(rowSelector,internalOpts);var i,ien,j,jen;var cellsNoOpts=this.iterator('table',function(settings,idx){var a=[];for(i=0,ien=rows[idx].length;i<ien;i++){for(j=0,jen=columns[idx].length;j<jen;j++){a.push({row:rows[idx][i],column:columns[idx][j]});}}
+return a;},1);var cells=opts&&opts.selected?this.cells(cellsNoOpts,opts):cellsNoOpts;$.extend(cells.selector,{cols:columnSelector,rows:rowSelector,opts:opts});return cells;});_api_registerPlural('cells().nodes()','cell().node()',function(){return this.iterator('cell',function(settings,row,column){var data=settings.aoData[row];return data&&data.anCells?data.anCells[column]:undefined;},1);});_api_register('cells().data()',function(){return this.iterator('cell',function(settings,row,column){return _fnGetCellData(settings,row,column);},1);});_api_registerPlural('cells().cache()','cell().cache()',function(type){type=type==='search'?'_aFilterData':'_aSortData';return this.iterator('cell',function(settings,row,column){return settings.aoData[row][type][column];},1);});_api_registerPlural('cells().render()','cell().render()',function(type){return this.iterator('cell',function(settings,row,column){return _fnGetCellData(settings,row,column,type);},1);});_api_registerPlural('cells().indexes()','cell().index()',function(){return this.iterator('cell',function(settings,row,column){return{row:row,column:column,columnVisible:_fnColumnIndexToVisible(settings,column)};},1);});_api_registerPlural('cells().invalidate()','cell().invalidate()',function(src){return this.iterator('cell',function(settings,row,column){_fnInvalidate(settings,row,src,column);});});_api_register('cell()',function(rowSelector,columnSelector,opts){return _selector_first(this.cells(rowSelector,columnSelector,opts));});_api_register('cell().data()',function(data){var ctx=this.context;var cell=this[0];if(data===undefined){return ctx.length&&cell.length?_fnGetCellData(ctx[0],cell[0].row,cell[0].column):undefined;}
+_fnSetCellData(ctx[0],cell[0].row,cell[0].column,data);_fnInvalidate(ctx[0],cell[0].row,'data',cell[0].column);return this;});_api_register('order()',function(order,dir){var ctx=this.context;if(order===undefined){return ctx.length!==0?ctx[0].aaSorting:undefined;}
+if(typeof order==='number'){order=[[order,dir]];}
+else if(order.length&&!Array.isArray(order[0])){order=Array.prototype.slice.call(arguments);}
+return this.iterator('table',function(settings){settings.aaSorting=order.slice();});});_api_register('order.listener()',function(node,column,callback){return this.iterator('table',function(settings){_fnSortAttachListener(settings,node,column,callback);});});_api_register('order.fixed()',function(set){if(!set){var ctx=this.context;var fixed=ctx.length?ctx[0].aaSortingFixed:undefined;return Array.isArray(fixed)?{pre:fixed}:fixed;}
+return this.iterator('table',function(settings){settings.aaSortingFixed=$.extend(true,{},set);});});_api_register(['columns().order()','column().order()'],function(dir){var that=this;return this.iterator('table',function(settings,i){var sort=[];$.each(that[i],function(j,col){sort.push([col,dir]);});settings.aaSorting=sort;});});_api_register('search()',function(input,regex,smart,caseInsen){var ctx=this.context;if(input===undefined){return ctx.length!==0?ctx[0].oPreviousSearch.sSearch:undefined;}
+return this.iterator('table',function(settings){if(!settings.oFeatures.bFilter){return;}
+_fnFilterComplete(settings,$.extend({},settings.oPreviousSearch,{"sSearch":input+"","bRegex":regex===null?false:regex,"bSmart":smart===null?true:smart,"bCaseInsensitive":caseInsen===null?true:caseInsen}),1);});});_api_registerPlural('columns().search()','column().search()',function(input,regex,smart,caseInsen){return this.iterator('column',function(settings,column){var preSearch=settings.aoPreSearchCols;if(input===undefined){return preSearch[column].sSearch;}
+if(!settings.oFeatures.bFilter){return;}
+$.extend(preSearch[column],{"sSearch":input+"","bRegex":regex===null?false:regex,"bSmart":smart===null?true:smart,"bCaseInsensitive":caseInsen===null?true:caseInsen});_fnFilterComplete(settings,settings.oPreviousSearch,1);});});_api_register('state()',function(){return this.context.length?this.context[0].oSavedState:null;});_api_register('state.clear()',function(){return this.iterator('table',function(settings){settings.fnStateSaveCallback.call(settings.oInstance,settings,{});});});_api_register('state.loaded()',function(){return this.context.length?this.context[0].oLoadedState:null;});_api_register('state.save()',function(){return this.iterator('table',function(settings){_fnSaveState(settings);});});DataTable.versionCheck=DataTable.fnVersionCheck=function(version)
+{var aThis=DataTable.version.split('.');var aThat=version.split('.');var iThis,iThat;for(var i=0,iLen=aThat.length;i<iLen;i++){iThis=parseInt(aThis[i],10)||0;iThat=parseInt(aThat[i],10)||0;if(iThis===iThat){continue;}
+return iThis>iThat;}
+return true;};DataTable.isDataTable=DataTable.fnIsDataTable=function(table)
+{var t=$(table).get(0);var is=false;if(table instanceof DataTable.Api){return true;}
+$.each(DataTable.settings,function(i,o){var head=o.nScrollHead?$('table',o.nScrollHead)[0]:null;var foot=o.nScrollFoot?$('table',o.nScrollFoot)[0]:null;if(o.nTable===t||head===t||foot===t){is=true;}});return is;};DataTable.tables=DataTable.fnTables=function(visible)
+{var api=false;if($.isPlainObject(visible)){api=visible.api;visible=visible.visible;}
+var a=$.map(DataTable.settings,function(o){if(!visible||(visible&&$(o.nTable).is(':visible'))){return o.nTable;}});return api?new _Api(a):a;};DataTable.camelToHungarian=_fnCamelToHungarian;_api_register('$()',function(selector,opts){var
+rows=this.rows(opts).nodes(),jqRows=$(rows);return $([].concat(jqRows.filter(selector).toArray(),jqRows.find(selector).toArray()));});$.each(['on','one','off'],function(i,key){_api_register(key+'()',function(){var args=Array.prototype.slice.call(arguments);args[0]=$.map(args[0].split(/\s/),function(e){return!e.match(/\.dt\b/)?e+'.dt':e;}).join(' ');var inst=$(this.tables().nodes());inst[key].apply(inst,args);return this;});});_api_register('clear()',function(){return this.iterator('table',function(settings){_fnClearTable(settings);});});_api_register('settings()',function(){return new _Api(this.context,this.context);});_api_register('init()',function(){var ctx=this.context;return ctx.length?ctx[0].oInit:null;});_api_register('data()',function(){return this.iterator('table',function(settings){return _pluck(settings.aoData,'_aData');}).flatten();});_api_register('destroy()',function(remove){remove=remove||false;return this.iterator('table',function(settings){var classes=settings.oClasses;var table=settings.nTable;var tbody=settings.nTBody;var thead=settings.nTHead;var tfoot=settings.nTFoot;var jqTable=$(table);var jqTbody=$(tbody);var jqWrapper=$(settings.nTableWrapper);var rows=$.map(settings.aoData,function(r){return r.nTr;});var i,ien;settings.bDestroying=true;_fnCallbackFire(settings,"aoDestroyCallback","destroy",[settings]);if(!remove){new _Api(settings).columns().visible(true);}
+jqWrapper.off('.DT').find(':not(tbody *)').off('.DT');$(window).off('.DT-'+settings.sInstance);if(table!=thead.parentNode){jqTable.children('thead').detach();jqTable.append(thead);}
+if(tfoot&&table!=tfoot.parentNode){jqTable.children('tfoot').detach();jqTable.append(tfoot);}
+settings.aaSorting=[];settings.aaSortingFixed=[];_fnSortingClasses(settings);$(rows).removeClass(settings.asStripeClasses.join(' '));$('th, td',thead).removeClass(classes.sSortable+' '+
+classes.sSortableAsc+' '+classes.sSortableDesc+' '+classes.sSortableNone);jqTbody.children().detach();jqTbody.append(rows);var orig=settings.nTableWrapper.parentNode;var removedMethod=remove?'remove':'detach';jqTable[removedMethod]();jqWrapper[removedMethod]();if(!remove&&orig){orig.insertBefore(table,settings.nTableReinsertBefore);jqTable.css('width',settings.sDestroyWidth).removeClass(classes.sTable);ien=settings.asDestroyStripes.length;if(ien){jqTbody.children().each(function(i){$(this).addClass(settings.asDestroyStripes[i%ien]);});}}
+var idx=$.inArray(settings,DataTable.settings);if(idx!==-1){DataTable.settings.splice(idx,1);}});});$.each(['column','row','cell'],function(i,type){_api_register(type+'s().every()',function(fn){var opts=this.selector.opts;var api=this;return this.iterator(type,function(settings,arg1,arg2,arg3,arg4){fn.call(api[type](arg1,type==='cell'?arg2:opts,type==='cell'?opts:undefined),arg1,arg2,arg3,arg4);});});});_api_register('i18n()',function(token,def,plural){var ctx=this.context[0];var resolved=_fnGetObjectDataFn(token)(ctx.oLanguage);if(resolved===undefined){resolved=def;}
+if(plural!==undefined&&$.isPlainObject(resolved)){resolved=resolved[plural]!==undefined?resolved[plural]:resolved._;}
+return resolved.replace('%d',plural);});DataTable.version="1.12.1";DataTable.settings=[];DataTable.models={};DataTable.models.oSearch={"bCaseInsensitive":true,"sSearch":"","bRegex":false,"bSmart":true,"return":false};DataTable.models.oRow={"nTr":null,"anCells":null,"_aData":[],"_aSortData":null,"_aFilterData":null,"_sFilterRow":null,"_sRowStripe":"","src":null,"idx":-1};DataTable.models.oColumn={"idx":null,"aDataSort":null,"asSorting":null,"bSearchable":null,"bSortable":null,"bVisible":null,"_sManualType":null,"_bAttrSrc":false,"fnCreatedCell":null,"fnGetData":null,"fnSetData":null,"mData":null,"mRender":null,"nTh":null,"nTf":null,"sClass":null,"sContentPadding":null,"sDefaultContent":null,"sName":null,"sSortDataType":'std',"sSortingClass":null,"sSortingClassJUI":null,"sTitle":null,"sType":null,"sWidth":null,"sWidthOrig":null};DataTable.defaults={"aaData":null,"aaSorting":[[0,'asc']],"aaSortingFixed":[],"ajax":null,"aLengthMenu":[10,25,50,100],"aoColumns":null,"aoColumnDefs":null,"aoSearchCols":[],"asStripeClasses":null,"bAutoWidth":true,"bDeferRender":false,"bDestroy":false,"bFilter":true,"bInfo":true,"bLengthChange":true,"bPaginate":true,"bProcessing":false,"bRetrieve":false,"bScrollCollapse":false,"bServerSide":false,"bSort":true,"bSortMulti":true,"bSortCellsTop":false,"bSortClasses":true,"bStateSave":false,"fnCreatedRow":null,"fnDrawCallback":null,"fnFooterCallback":null,"fnFormatNumber":function(toFormat){return toFormat.toString().replace(/\B(?=(\d{3})+(?!\d))/g,this.oLanguage.sThousands);},"fnHeaderCallback":null,"fnInfoCallback":null,"fnInitComplete":null,"fnPreDrawCallback":null,"fnRowCallback":null,"fnServerData":null,"fnServerParams":null,"fnStateLoadCallback":function(settings){try{return JSON.parse((settings.iStateDuration===-1?sessionStorage:localStorage).getItem('DataTables_'+settings.sInstance+'_'+location.pathname));}catch(e){return{};}},"fnStateLoadParams":null,"fnStateLoaded":null,"fnStateSaveCallback":function(settings,data){try{(settings.iStateDuration===-1?sessionStorage:localStorage).setItem('DataTables_'+settings.sInstance+'_'+location.pathname,JSON.stringify(data));}catch(e){}},"fnStateSaveParams":null,"iStateDuration":7200,"iDeferLoading":null,"iDisplayLength":10,"iDisplayStart":0,"iTabIndex":0,"oClasses":{},"oLanguage":{"oAria":{"sSortAscending":": activate to sort column ascending","sSortDescending":": activate to sort column descending"},"oPaginate":{"sFirst":"First","sLast":"Last","sNext":"Next","sPrevious":"Previous"},"sEmptyTable":"No data available in table","sInfo":"Showing _START_ to _END_ of _TOTAL_ entries","sInfoEmpty":"Showing 0 to 0 of 0 entries","sInfoFiltered":"(filtered from _MAX_ total entries)","sInfoPostFix":"","sDecimal":"","sThousands":",","sLengthMenu":"Show _MENU_ entries","sLoadingRecords":"Loading...","sProcessing":"","sSearch":"Search:","sSearchPlaceholder":"","sUrl":"","sZeroRecords":"No matching records found"},"oSearch":$.extend({},DataTable.models.oSearch),"sAjaxDataProp":"data","sAjaxSource":null,"sDom":"lfrtip","searchDelay":null,"sPaginationType":"simple_numbers","sScrollX":"","sScrollXInner":"","sScrollY":"","sServerMethod":"GET","renderer":null,"rowId":"DT_RowId"};_fnHungarianMap(DataTable.defaults);DataTable.defaults.column={"aDataSort":null,"iDataSort":-1,"asSorting":['asc','desc'],"bSearchable":true,"bSortable":true,"bVisible":true,"fnCreatedCell":null,"mData":null,"mRender":null,"sCellType":"td","sClass":"","sContentPadding":"","sDefaultContent":null,"sName":"","sSortDataType":"std","sTitle":null,"sType":null,"sWidth":null};_fnHungarianMap(DataTable.defaults.column);DataTable.models.oSettings={"oFeatures":{"bAutoWidth":null,"bDeferRender":null,"bFilter":null,"bInfo":null,"bLengthChange":null,"bPaginate":null,"bProcessing":null,"bServerSide":null,"bSort":null,"bSortMulti":null,"bSortClasses":null,"bStateSave":null},"oScroll":{"bCollapse":null,"iBarWidth":0,"sX":null,"sXInner":null,"sY":null},"oLanguage":{"fnInfoCallback":null},"oBrowser":{"bScrollOversize":false,"bScrollbarLeft":false,"bBounding":false,"barWidth":0},"ajax":null,"aanFeatures":[],"aoData":[],"aiDisplay":[],"aiDisplayMaster":[],"aIds":{},"aoColumns":[],"aoHeader":[],"aoFooter":[],"oPreviousSearch":{},"aoPreSearchCols":[],"aaSorting":null,"aaSortingFixed":[],"asStripeClasses":null,"asDestroyStripes":[],"sDestroyWidth":0,"aoRowCallback":[],"aoHeaderCallback":[],"aoFooterCallback":[],"aoDrawCallback":[],"aoRowCreatedCallback":[],"aoPreDrawCallback":[],"aoInitComplete":[],"aoStateSaveParams":[],"aoStateLoadParams":[],"aoStateLoaded":[],"sTableId":"","nTable":null,"nTHead":null,"nTFoot":null,"nTBody":null,"nTableWrapper":null,"bDeferLoading":false,"bInitialised":false,"aoOpenRows":[],"sDom":null,"searchDelay":null,"sPaginationType":"two_button","iStateDuration":0,"aoStateSave":[],"aoStateLoad":[],"oSavedState":null,"oLoadedState":null,"sAjaxSource":null,"sAjaxDataProp":null,"jqXHR":null,"json":undefined,"oAjaxData":undefined,"fnServerData":null,"aoServerParams":[],"sServerMethod":null,"fnFormatNumber":null,"aLengthMenu":null,"iDraw":0,"bDrawing":false,"iDrawError":-1,"_iDisplayLength":10,"_iDisplayStart":0,"_iRecordsTotal":0,"_iRecordsDisplay":0,"oClasses":{},"bFiltered":false,"bSorted":false,"bSortCellsTop":null,"oInit":null,"aoDestroyCallback":[],"fnRecordsTotal":function()
+{return _fnDataSource(this)=='ssp'?this._iRecordsTotal*1:this.aiDisplayMaster.length;},"fnRecordsDisplay":function()
+{return _fnDataSource(this)=='ssp'?this._iRecordsDisplay*1:this.aiDisplay.length;},"fnDisplayEnd":function()
+{var
+len=this._iDisplayLength,start=this._iDisplayStart,calc=start+len,records=this.aiDisplay.length,features=this.oFeatures,paginate=features.bPaginate;if(features.bServerSide){return paginate===false||len===-1?start+records:Math.min(start+len,this._iRecordsDisplay);}
+else{return!paginate||calc>records||len===-1?records:calc;}},"oInstance":null,"sInstance":null,"iTabIndex":0,"nScrollHead":null,"nScrollFoot":null,"aLastSort":[],"oPlugins":{},"rowIdFn":null,"rowId":null};DataTable.ext=_ext={buttons:{},classes:{},builder:"-source-",errMode:"alert",feature:[],search:[],selector:{cell:[],column:[],row:[]},internal:{},legacy:{ajax:null},pager:{},renderer:{pageButton:{},header:{}},order:{},type:{detect:[],search:{},order:{}},_unique:0,fnVersionCheck:DataTable.fnVersionCheck,iApiIndex:0,oJUIClasses:{},sVersion:DataTable.version};$.extend(_ext,{afnFiltering:_ext.search,aTypes:_ext.type.detect,ofnSearch:_ext.type.search,oSort:_ext.type.order,afnSortData:_ext.order,aoFeatures:_ext.feature,oApi:_ext.internal,oStdClasses:_ext.classes,oPagination:_ext.pager});$.extend(DataTable.ext.classes,{"sTable":"dataTable","sNoFooter":"no-footer","sPageButton":"paginate_button","sPageButtonActive":"current","sPageButtonDisabled":"disabled","sStripeOdd":"odd","sStripeEven":"even","sRowEmpty":"dataTables_empty","sWrapper":"dataTables_wrapper","sFilter":"dataTables_filter","sInfo":"dataTables_info","sPaging":"dataTables_paginate paging_","sLength":"dataTables_length","sProcessing":"dataTables_processing","sSortAsc":"sorting_asc","sSortDesc":"sorting_desc","sSortable":"sorting","sSortableAsc":"sorting_desc_disabled","sSortableDesc":"sorting_asc_disabled","sSortableNone":"sorting_disabled","sSortColumn":"sorting_","sFilterInput":"","sLengthSelect":"","sScrollWrapper":"dataTables_scroll","sScrollHead":"dataTables_scrollHead","sScrollHeadInner":"dataTables_scrollHeadInner","sScrollBody":"dataTables_scrollBody","sScrollFoot":"dataTables_scrollFoot","sScrollFootInner":"dataTables_scrollFootInner","sHeaderTH":"","sFooterTH":"","sSortJUIAsc":"","sSortJUIDesc":"","sSortJUI":"","sSortJUIAscAllowed":"","sSortJUIDescAllowed":"","sSortJUIWrapper":"","sSortIcon":"","sJUIHeader":"","sJUIFooter":""});var extPagination=DataTable.ext.pager;function _numbers(page,pages){var
+numbers=[],buttons=extPagination.numbers_length,half=Math.floor(buttons/2),i=1;if(pages<=buttons){numbers=_range(0,pages);}
+else if(page<=half){numbers=_range(0,buttons-2);numbers.push('ellipsis');numbers.push(pages-1);}
+else if(page>=pages-1-half){numbers=_range(pages-(buttons-2),pages);numbers.splice(0,0,'ellipsis');numbers.splice(0,0,0);}
+else{numbers=_range(page-half+2,page+half-1);numbers.push('ellipsis');numbers.push(pages-1);numbers.splice(0,0,'ellipsis');numbers.splice(0,0,0);}
+numbers.DT_el='span';return numbers;}
+$.extend(extPagination,{simple:function(page,pages){return['previous','next'];},full:function(page,pages){return['first','previous','next','last'];},numbers:function(page,pages){return[_numbers(page,pages)];},simple_numbers:function(page,pages){return['previous',_numbers(page,pages),'next'];},full_numbers:function(page,pages){return['first','previous',_numbers(page,pages),'next','last'];},first_last_numbers:function(page,pages){return['first',_numbers(page,pages),'last'];},_numbers:_numbers,numbers_length:7});$.extend(true,DataTable.ext.renderer,{pageButton:{_:function(settings,host,idx,buttons,page,pages){var classes=settings.oClasses;var lang=settings.oLanguage.oPaginate;var aria=settings.oLanguage.oAria.paginate||{};var btnDisplay,btnClass,counter=0;var attach=function(container,buttons){var i,ien,node,button,tabIndex;var disabledClass=classes.sPageButtonDisabled;var clickHandler=function(e){_fnPageChange(settings,e.data.action,true);};for(i=0,ien=buttons.length;i<ien;i++){button=buttons[i];if(Array.isArray(button)){var inner=$('<'+(button.DT_el||'div')+'/>').appendTo(container);attach(inner,button);}
+else{btnDisplay=null;btnClass=button;tabIndex=settings.iTabIndex;switch(button){case'ellipsis':container.append('<span class="ellipsis">&#x2026;</span>');break;case'first':btnDisplay=lang.sFirst;if(page===0){tabIndex=-1;btnClass+=' '+disabledClass;}
+break;case'previous':btnDisplay=lang.sPrevious;if(page===0){tabIndex=-1;btnClass+=' '+disabledClass;}
+break;case'next':btnDisplay=lang.sNext;if(pages===0||page===pages-1){tabIndex=-1;btnClass+=' '+disabledClass;}
+break;case'last':btnDisplay=lang.sLast;if(pages===0||page===pages-1){tabIndex=-1;btnClass+=' '+disabledClass;}
+break;default:btnDisplay=settings.fnFormatNumber(button+1);btnClass=page===button?classes.sPageButtonActive:'';break;}
+if(btnDisplay!==null){node=$('<a>',{'class':classes.sPageButton+' '+btnClass,'aria-controls':settings.sTableId,'aria-label':aria[button],'data-dt-idx':counter,'tabindex':tabIndex,'id':idx===0&&typeof button==='string'?settings.sTableId+'_'+button:null}).html(btnDisplay).appendTo(container);_fnBindAction(node,{action:button},clickHandler);counter++;}}}};var activeEl;try{activeEl=$(host).find(document.activeElement).data('dt-idx');}
+catch(e){}
+attach($(host).empty(),buttons);if(activeEl!==undefined){$(host).find('[data-dt-idx='+activeEl+']').trigger('focus');}}}});$.extend(DataTable.ext.type.detect,[function(d,settings)
+{var decimal=settings.oLanguage.sDecimal;return _isNumber(d,decimal)?'num'+decimal:null;},function(d,settings)
+{if(d&&!(d instanceof Date)&&!_re_date.test(d)){return null;}
+var parsed=Date.parse(d);return(parsed!==null&&!isNaN(parsed))||_empty(d)?'date':null;},function(d,settings)
+{var decimal=settings.oLanguage.sDecimal;return _isNumber(d,decimal,true)?'num-fmt'+decimal:null;},function(d,settings)
+{var decimal=settings.oLanguage.sDecimal;return _htmlNumeric(d,decimal)?'html-num'+decimal:null;},function(d,settings)
+{var decimal=settings.oLanguage.sDecimal;return _htmlNumeric(d,decimal,true)?'html-num-fmt'+decimal:null;},function(d,settings)
+{return _empty(d)||(typeof d==='string'&&d.indexOf('<')!==-1)?'html':null;}]);$.extend(DataTable.ext.type.search,{html:function(data){return _empty(data)?data:typeof data==='string'?data.replace(_re_new_lines," ").replace(_re_html,""):'';},string:function(data){return _empty(data)?data:typeof data==='string'?data.replace(_re_new_lines," "):data;}});var __numericReplace=function(d,decimalPlace,re1,re2){if(d!==0&&(!d||d==='-')){return-Infinity;}
+if(decimalPlace){d=_numToDecimal(d,decimalPlace);}
+if(d.replace){if(re1){d=d.replace(re1,'');}
+if(re2){d=d.replace(re2,'');}}
+return d*1;};function _addNumericSort(decimalPlace){$.each({"num":function(d){return __numericReplace(d,decimalPlace);},"num-fmt":function(d){return __numericReplace(d,decimalPlace,_re_formatted_numeric);},"html-num":function(d){return __numericReplace(d,decimalPlace,_re_html);},"html-num-fmt":function(d){return __numericReplace(d,decimalPlace,_re_html,_re_formatted_numeric);}},function(key,fn){_ext.type.order[key+decimalPlace+'-pre']=fn;if(key.match(/^html\-/)){_ext.type.search[key+decimalPlace]=_ext.type.search.html;}});}
+$.extend(_ext.type.order,{"date-pre":function(d){var ts=Date.parse(d);return isNaN(ts)?-Infinity:ts;},"html-pre":function(a){return _empty(a)?'':a.replace?a.replace(/<.*?>/g,"").toLowerCase():a+'';},"string-pre":function(a){return _empty(a)?'':typeof a==='string'?a.toLowerCase():!a.toString?'':a.toString();},"string-asc":function(x,y){return((x<y)?-1:((x>y)?1:0));},"string-desc":function(x,y){return((x<y)?1:((x>y)?-1:0));}});_addNumericSort('');$.extend(true,DataTable.ext.renderer,{header:{_:function(settings,cell,column,classes){$(settings.nTable).on('order.dt.DT',function(e,ctx,sorting,columns){if(settings!==ctx){return;}
+var colIdx=column.idx;cell.removeClass(classes.sSortAsc+' '+
+classes.sSortDesc).addClass(columns[colIdx]=='asc'?classes.sSortAsc:columns[colIdx]=='desc'?classes.sSortDesc:column.sSortingClass);});},jqueryui:function(settings,cell,column,classes){$('<div/>').addClass(classes.sSortJUIWrapper).append(cell.contents()).append($('<span/>').addClass(classes.sSortIcon+' '+column.sSortingClassJUI)).appendTo(cell);$(settings.nTable).on('order.dt.DT',function(e,ctx,sorting,columns){if(settings!==ctx){return;}
+var colIdx=column.idx;cell.removeClass(classes.sSortAsc+" "+classes.sSortDesc).addClass(columns[colIdx]=='asc'?classes.sSortAsc:columns[colIdx]=='desc'?classes.sSortDesc:column.sSortingClass);cell.find('span.'+classes.sSortIcon).removeClass(classes.sSortJUIAsc+" "+
+classes.sSortJUIDesc+" "+
+classes.sSortJUI+" "+
+classes.sSortJUIAscAllowed+" "+
+classes.sSortJUIDescAllowed).addClass(columns[colIdx]=='asc'?classes.sSortJUIAsc:columns[colIdx]=='desc'?classes.sSortJUIDesc:column.sSortingClassJUI);});}}});var __htmlEscapeEntities=function(d){if(Array.isArray(d)){d=d.join(',');}
+return typeof d==='string'?d.replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;'):d;};function __mld(dt,momentFn,luxonFn,dateFn,arg1){if(window.moment){return dt[momentFn](arg1);}
+else if(window.luxon){return dt[luxonFn](arg1);}
+return dateFn?dt[dateFn](arg1):dt;}
+var __mlWarning=false;function __mldObj(d,format,locale){var dt;if(window.moment){dt=window.moment.utc(d,format,locale,true);if(!dt.isValid()){return null;}}
+else if(window.luxon){dt=format?window.luxon.DateTime.fromFormat(d,format):window.luxon.DateTime.fromISO(d);if(!dt.isValid){return null;}
+dt.setLocale(locale);}
+else if(!format){dt=new Date(d);}
+else{if(!__mlWarning){alert('DataTables warning: Formatted date without Moment.js or Luxon - https://datatables.net/tn/17');}
+__mlWarning=true;}
+return dt;}
+function __mlHelper(localeString){return function(from,to,locale,def){if(arguments.length===0){locale='en';to=null;from=null;}
+else if(arguments.length===1){locale='en';to=from;from=null;}
+else if(arguments.length===2){locale=to;to=from;from=null;}
+var typeName='datetime-'+to;if(!DataTable.ext.type.order[typeName]){DataTable.ext.type.detect.unshift(function(d){return d===typeName?typeName:false;});DataTable.ext.type.order[typeName+'-asc']=function(a,b){var x=a.valueOf();var y=b.valueOf();return x===y?0:x<y?-1:1;}
+DataTable.ext.type.order[typeName+'-desc']=function(a,b){var x=a.valueOf();var y=b.valueOf();return x===y?0:x>y?-1:1;}}
+return function(d,type){if(d===null||d===undefined){if(def==='--now'){var local=new Date();d=new Date(Date.UTC(local.getFullYear(),local.getMonth(),local.getDate(),local.getHours(),local.getMinutes(),local.getSeconds()));}
+else{d='';}}
+if(type==='type'){return typeName;}
+if(d===''){return type!=='sort'?'':__mldObj('0000-01-01 00:00:00',null,locale);}
+if(to!==null&&from===to&&type!=='sort'&&type!=='type'&&!(d instanceof Date)){return d;}
+var dt=__mldObj(d,from,locale);if(dt===null){return d;}
+if(type==='sort'){return dt;}
+var formatted=to===null?__mld(dt,'toDate','toJSDate','')[localeString]():__mld(dt,'format','toFormat','toISOString',to);return type==='display'?__htmlEscapeEntities(formatted):formatted;};}}
+var __thousands=',';var __decimal='.';if(Intl){try{var num=new Intl.NumberFormat().formatToParts(100000.1);for(var i=0;i<num.length;i++){if(num[i].type==='group'){__thousands=num[i].value;}
+else if(num[i].type==='decimal'){__decimal=num[i].value;}}}
+catch(e){}}
+DataTable.datetime=function(format,locale){var typeName='datetime-detect-'+format;if(!locale){locale='en';}
+if(!DataTable.ext.type.order[typeName]){DataTable.ext.type.detect.unshift(function(d){var dt=__mldObj(d,format,locale);return d===''||dt?typeName:false;});DataTable.ext.type.order[typeName+'-pre']=function(d){return __mldObj(d,format,locale)||0;}}}
+DataTable.render={date:__mlHelper('toLocaleDateString'),datetime:__mlHelper('toLocaleString'),time:__mlHelper('toLocaleTimeString'),number:function(thousands,decimal,precision,prefix,postfix){if(thousands===null||thousands===undefined){thousands=__thousands;}
+if(decimal===null||decimal===undefined){decimal=__decimal;}
+return{display:function(d){if(typeof d!=='number'&&typeof d!=='string'){return d;}
+if(d===''||d===null){return d;}
+var negative=d<0?'-':'';var flo=parseFloat(d);if(isNaN(flo)){return __htmlEscapeEntities(d);}
+flo=flo.toFixed(precision);d=Math.abs(flo);var intPart=parseInt(d,10);var floatPart=precision?decimal+(d-intPart).toFixed(precision).substring(2):'';if(intPart===0&&parseFloat(floatPart)===0){negative='';}
+return negative+(prefix||'')+
+intPart.toString().replace(/\B(?=(\d{3})+(?!\d))/g,thousands)+
+floatPart+
+(postfix||'');}};},text:function(){return{display:__htmlEscapeEntities,filter:__htmlEscapeEntities};}};function _fnExternApiFunc(fn)
+{return function(){var args=[_fnSettingsFromNode(this[DataTable.ext.iApiIndex])].concat(Array.prototype.slice.call(arguments));return DataTable.ext.internal[fn].apply(this,args);};}
+$.extend(DataTable.ext.internal,{_fnExternApiFunc:_fnExternApiFunc,_fnBuildAjax:_fnBuildAjax,_fnAjaxUpdate:_fnAjaxUpdate,_fnAjaxParameters:_fnAjaxParameters,_fnAjaxUpdateDraw:_fnAjaxUpdateDraw,_fnAjaxDataSrc:_fnAjaxDataSrc,_fnAddColumn:_fnAddColumn,_fnColumnOptions:_fnColumnOptions,_fnAdjustColumnSizing:_fnAdjustColumnSizing,_fnVisibleToColumnIndex:_fnVisibleToColumnIndex,_fnColumnIndexToVisible:_fnColumnIndexToVisible,_fnVisbleColumns:_fnVisbleColumns,_fnGetColumns:_fnGetColumns,_fnColumnTypes:_fnColumnTypes,_fnApplyColumnDefs:_fnApplyColumnDefs,_fnHungarianMap:_fnHungarianMap,_fnCamelToHungarian:_fnCamelToHungarian,_fnLanguageCompat:_fnLanguageCompat,_fnBrowserDetect:_fnBrowserDetect,_fnAddData:_fnAddData,_fnAddTr:_fnAddTr,_fnNodeToDataIndex:_fnNodeToDataIndex,_fnNodeToColumnIndex:_fnNodeToColumnIndex,_fnGetCellData:_fnGetCellData,_fnSetCellData:_fnSetCellData,_fnSplitObjNotation:_fnSplitObjNotation,_fnGetObjectDataFn:_fnGetObjectDataFn,_fnSetObjectDataFn:_fnSetObjectDataFn,_fnGetDataMaster:_fnGetDataMaster,_fnClearTable:_fnClearTable,_fnDeleteIndex:_fnDeleteIndex,_fnInvalidate:_fnInvalidate,_fnGetRowElements:_fnGetRowElements,_fnCreateTr:_fnCreateTr,_fnBuildHead:_fnBuildHead,_fnDrawHead:_fnDrawHead,_fnDraw:_fnDraw,_fnReDraw:_fnReDraw,_fnAddOptionsHtml:_fnAddOptionsHtml,_fnDetectHeader:_fnDetectHeader,_fnGetUniqueThs:_fnGetUniqueThs,_fnFeatureHtmlFilter:_fnFeatureHtmlFilter,_fnFilterComplete:_fnFilterComplete,_fnFilterCustom:_fnFilterCustom,_fnFilterColumn:_fnFilterColumn,_fnFilter:_fnFilter,_fnFilterCreateSearch:_fnFilterCreateSearch,_fnEscapeRegex:_fnEscapeRegex,_fnFilterData:_fnFilterData,_fnFeatureHtmlInfo:_fnFeatureHtmlInfo,_fnUpdateInfo:_fnUpdateInfo,_fnInfoMacros:_fnInfoMacros,_fnInitialise:_fnInitialise,_fnInitComplete:_fnInitComplete,_fnLengthChange:_fnLengthChange,_fnFeatureHtmlLength:_fnFeatureHtmlLength,_fnFeatureHtmlPaginate:_fnFeatureHtmlPaginate,_fnPageChange:_fnPageChange,_fnFeatureHtmlProcessing:_fnFeatureHtmlProcessing,_fnProcessingDisplay:_fnProcessingDisplay,_fnFeatureHtmlTable:_fnFeatureHtmlTable,_fnScrollDraw:_fnScrollDraw,_fnApplyToChildren:_fnApplyToChildren,_fnCalculateColumnWidths:_fnCalculateColumnWidths,_fnThrottle:_fnThrottle,_fnConvertToWidth:_fnConvertToWidth,_fnGetWidestNode:_fnGetWidestNode,_fnGetMaxLenString:_fnGetMaxLenString,_fnStringToCss:_fnStringToCss,_fnSortFlatten:_fnSortFlatten,_fnSort:_fnSort,_fnSortAria:_fnSortAria,_fnSortListener:_fnSortListener,_fnSortAttachListener:_fnSortAttachListener,_fnSortingClasses:_fnSortingClasses,_fnSortData:_fnSortData,_fnSaveState:_fnSaveState,_fnLoadState:_fnLoadState,_fnImplementState:_fnImplementState,_fnSettingsFromNode:_fnSettingsFromNode,_fnLog:_fnLog,_fnMap:_fnMap,_fnBindAction:_fnBindAction,_fnCallbackReg:_fnCallbackReg,_fnCallbackFire:_fnCallbackFire,_fnLengthOverflow:_fnLengthOverflow,_fnRenderer:_fnRenderer,_fnDataSource:_fnDataSource,_fnRowAttributes:_fnRowAttributes,_fnExtend:_fnExtend,_fnCalculateEnd:function(){}});$.fn.dataTable=DataTable;DataTable.$=$;$.fn.dataTableSettings=DataTable.settings;$.fn.dataTableExt=DataTable.ext;$.fn.DataTable=function(opts){return $(this).dataTable(opts).api();};$.each(DataTable,function(prop,val){$.fn.DataTable[prop]=val;});return DataTable;}));(function(factory){if(typeof define==='function'&&define.amd){define(['jquery','datatables.net'],function($){return factory($,window,document);});}
+else if(typeof exports==='object'){module.exports=function(root,$){if(!root){root=window;}
+if(!$||!$.fn.dataTable){$=require('datatables.net')(root,$).$;}
+return factory($,root,root.document);};}
+else{factory(jQuery,window,document);}}(function($,window,document,undefined){'use strict';var DataTable=$.fn.dataTable;var Responsive=function(settings,opts){if(!DataTable.versionCheck||!DataTable.versionCheck('1.10.10')){throw'DataTables Responsive requires DataTables 1.10.10 or newer';}
+this.s={dt:new DataTable.Api(settings),columns:[],current:[]};if(this.s.dt.settings()[0].responsive){return;}
+if(opts&&typeof opts.details==='string'){opts.details={type:opts.details};}
+else if(opts&&opts.details===false){opts.details={type:false};}
+else if(opts&&opts.details===true){opts.details={type:'inline'};}
+this.c=$.extend(true,{},Responsive.defaults,DataTable.defaults.responsive,opts);settings.responsive=this;this._constructor();};$.extend(Responsive.prototype,{_constructor:function()
+{var that=this;var dt=this.s.dt;var dtPrivateSettings=dt.settings()[0];var oldWindowWidth=$(window).innerWidth();dt.settings()[0]._responsive=this;$(window).on('resize.dtr orientationchange.dtr',DataTable.util.throttle(function(){var width=$(window).innerWidth();if(width!==oldWindowWidth){that._resize();oldWindowWidth=width;}}));dtPrivateSettings.oApi._fnCallbackReg(dtPrivateSettings,'aoRowCreatedCallback',function(tr,data,idx){if($.inArray(false,that.s.current)!==-1){$('>td, >th',tr).each(function(i){var idx=dt.column.index('toData',i);if(that.s.current[idx]===false){$(this).css('display','none');}});}});dt.on('destroy.dtr',function(){dt.off('.dtr');$(dt.table().body()).off('.dtr');$(window).off('resize.dtr orientationchange.dtr');dt.cells('.dtr-control').nodes().to$().removeClass('dtr-control');$.each(that.s.current,function(i,val){if(val===false){that._setColumnVis(i,true);}});});this.c.breakpoints.sort(function(a,b){return a.width<b.width?1:a.width>b.width?-1:0;});this._classLogic();this._resizeAuto();var details=this.c.details;if(details.type!==false){that._detailsInit();dt.on('column-visibility.dtr',function(){if(that._timer){clearTimeout(that._timer);}
+that._timer=setTimeout(function(){that._timer=null;that._classLogic();that._resizeAuto();that._resize(true);that._redrawChildren();},100);});dt.on('draw.dtr',function(){that._redrawChildren();});$(dt.table().node()).addClass('dtr-'+details.type);}
+dt.on('column-reorder.dtr',function(e,settings,details){that._classLogic();that._resizeAuto();that._resize(true);});dt.on('column-sizing.dtr',function(){that._resizeAuto();that._resize();});dt.on('column-calc.dt',function(e,d){var curr=that.s.current;for(var i=0;i<curr.length;i++){var idx=d.visible.indexOf(i);if(curr[i]===false&&idx>=0){d.visible.splice(idx,1);}}});dt.on('preXhr.dtr',function(){var rowIds=[];dt.rows().every(function(){if(this.child.isShown()){rowIds.push(this.id(true));}});dt.one('draw.dtr',function(){that._resizeAuto();that._resize();dt.rows(rowIds).every(function(){that._detailsDisplay(this,false);});});});dt.on('draw.dtr',function(){that._controlClass();}).on('init.dtr',function(e,settings,details){if(e.namespace!=='dt'){return;}
+that._resizeAuto();that._resize();if($.inArray(false,that.s.current)){dt.columns.adjust();}});this._resize();},_columnsVisiblity:function(breakpoint)
+{var dt=this.s.dt;var columns=this.s.columns;var i,ien;var order=columns.map(function(col,idx){return{columnIdx:idx,priority:col.priority};}).sort(function(a,b){if(a.priority!==b.priority){return a.priority-b.priority;}
+return a.columnIdx-b.columnIdx;});var display=$.map(columns,function(col,i){if(dt.column(i).visible()===false){return'not-visible';}
+return col.auto&&col.minWidth===null?false:col.auto===true?'-':$.inArray(breakpoint,col.includeIn)!==-1;});var requiredWidth=0;for(i=0,ien=display.length;i<ien;i++){if(display[i]===true){requiredWidth+=columns[i].minWidth;}}
+var scrolling=dt.settings()[0].oScroll;var bar=scrolling.sY||scrolling.sX?scrolling.iBarWidth:0;var widthAvailable=dt.table().container().offsetWidth-bar;var usedWidth=widthAvailable-requiredWidth;for(i=0,ien=display.length;i<ien;i++){if(columns[i].control){usedWidth-=columns[i].minWidth;}}
+var empty=false;for(i=0,ien=order.length;i<ien;i++){var colIdx=order[i].columnIdx;if(display[colIdx]==='-'&&!columns[colIdx].control&&columns[colIdx].minWidth){if(empty||usedWidth-columns[colIdx].minWidth<0){empty=true;display[colIdx]=false;}
+else{display[colIdx]=true;}
+usedWidth-=columns[colIdx].minWidth;}}
+var showControl=false;for(i=0,ien=columns.length;i<ien;i++){if(!columns[i].control&&!columns[i].never&&display[i]===false){showControl=true;break;}}
+for(i=0,ien=columns.length;i<ien;i++){if(columns[i].control){display[i]=showControl;}
+if(display[i]==='not-visible'){display[i]=false;}}
+if($.inArray(true,display)===-1){display[0]=true;}
+return display;},_classLogic:function()
+{var that=this;var calc={};var breakpoints=this.c.breakpoints;var dt=this.s.dt;var columns=dt.columns().eq(0).map(function(i){var column=this.column(i);var className=column.header().className;var priority=dt.settings()[0].aoColumns[i].responsivePriority;var dataPriority=column.header().getAttribute('data-priority');if(priority===undefined){priority=dataPriority===undefined||dataPriority===null?10000:dataPriority*1;}
+return{className:className,includeIn:[],auto:false,control:false,never:className.match(/\b(dtr\-)?never\b/)?true:false,priority:priority};});var add=function(colIdx,name){var includeIn=columns[colIdx].includeIn;if($.inArray(name,includeIn)===-1){includeIn.push(name);}};var column=function(colIdx,name,operator,matched){var size,i,ien;if(!operator){columns[colIdx].includeIn.push(name);}
+else if(operator==='max-'){size=that._find(name).width;for(i=0,ien=breakpoints.length;i<ien;i++){if(breakpoints[i].width<=size){add(colIdx,breakpoints[i].name);}}}
+else if(operator==='min-'){size=that._find(name).width;for(i=0,ien=breakpoints.length;i<ien;i++){if(breakpoints[i].width>=size){add(colIdx,breakpoints[i].name);}}}
+else if(operator==='not-'){for(i=0,ien=breakpoints.length;i<ien;i++){if(breakpoints[i].name.indexOf(matched)===-1){add(colIdx,breakpoints[i].name);}}}};columns.each(function(col,i){var classNames=col.className.split(' ');var hasClass=false;for(var k=0,ken=classNames.length;k<ken;k++){var className=classNames[k].trim();if(className==='all'||className==='dtr-all'){hasClass=true;col.includeIn=$.map(breakpoints,function(a){return a.name;});return;}
+else if(className==='none'||className==='dtr-none'||col.never){hasClass=true;return;}
+else if(className==='control'||className==='dtr-control'){hasClass=true;col.control=true;return;}
+$.each(breakpoints,function(j,breakpoint){var brokenPoint=breakpoint.name.split('-');var re=new RegExp('(min\\-|max\\-|not\\-)?('+brokenPoint[0]+')(\\-[_a-zA-Z0-9])?');var match=className.match(re);if(match){hasClass=true;if(match[2]===brokenPoint[0]&&match[3]==='-'+brokenPoint[1]){column(i,breakpoint.name,match[1],match[2]+match[3]);}
+else if(match[2]===brokenPoint[0]&&!match[3]){column(i,breakpoint.name,match[1],match[2]);}}});}
+if(!hasClass){col.auto=true;}});this.s.columns=columns;},_controlClass:function()
+{if(this.c.details.type==='inline'){var dt=this.s.dt;var columnsVis=this.s.current;var firstVisible=$.inArray(true,columnsVis);dt.cells(null,function(idx){return idx!==firstVisible;},{page:'current'}).nodes().to$().filter('.dtr-control').removeClass('dtr-control');dt.cells(null,firstVisible,{page:'current'}).nodes().to$().addClass('dtr-control');}},_detailsDisplay:function(row,update)
+{var that=this;var dt=this.s.dt;var details=this.c.details;if(details&&details.type!==false){var renderer=typeof details.renderer==='string'?Responsive.renderer[details.renderer]():details.renderer;var res=details.display(row,update,function(){return renderer(dt,row[0],that._detailsObj(row[0]));});if(res===true||res===false){$(dt.table().node()).triggerHandler('responsive-display.dt',[dt,row,res,update]);}}},_detailsInit:function()
+{var that=this;var dt=this.s.dt;var details=this.c.details;if(details.type==='inline'){details.target='td.dtr-control, th.dtr-control';}
+dt.on('draw.dtr',function(){that._tabIndexes();});that._tabIndexes();$(dt.table().body()).on('keyup.dtr','td, th',function(e){if(e.keyCode===13&&$(this).data('dtr-keyboard')){$(this).click();}});var target=details.target;var selector=typeof target==='string'?target:'td, th';if(target!==undefined||target!==null){$(dt.table().body()).on('click.dtr mousedown.dtr mouseup.dtr',selector,function(e){if(!$(dt.table().node()).hasClass('collapsed')){return;}
+if($.inArray($(this).closest('tr').get(0),dt.rows().nodes().toArray())===-1){return;}
+if(typeof target==='number'){var targetIdx=target<0?dt.columns().eq(0).length+target:target;if(dt.cell(this).index().column!==targetIdx){return;}}
+var row=dt.row($(this).closest('tr'));if(e.type==='click'){that._detailsDisplay(row,false);}
+else if(e.type==='mousedown'){$(this).css('outline','none');}
+else if(e.type==='mouseup'){$(this).trigger('blur').css('outline','');}});}},_detailsObj:function(rowIdx)
+{var that=this;var dt=this.s.dt;return $.map(this.s.columns,function(col,i){if(col.never||col.control){return;}
+var dtCol=dt.settings()[0].aoColumns[i];return{className:dtCol.sClass,columnIndex:i,data:dt.cell(rowIdx,i).render(that.c.orthogonal),hidden:dt.column(i).visible()&&!that.s.current[i],rowIndex:rowIdx,title:dtCol.sTitle!==null?dtCol.sTitle:$(dt.column(i).header()).text()};});},_find:function(name)
+{var breakpoints=this.c.breakpoints;for(var i=0,ien=breakpoints.length;i<ien;i++){if(breakpoints[i].name===name){return breakpoints[i];}}},_redrawChildren:function()
+{var that=this;var dt=this.s.dt;dt.rows({page:'current'}).iterator('row',function(settings,idx){var row=dt.row(idx);that._detailsDisplay(dt.row(idx),true);});},_resize:function(forceRedraw)
+{var that=this;var dt=this.s.dt;var width=$(window).innerWidth();var breakpoints=this.c.breakpoints;var breakpoint=breakpoints[0].name;var columns=this.s.columns;var i,ien;var oldVis=this.s.current.slice();for(i=breakpoints.length-1;i>=0;i--){if(width<=breakpoints[i].width){breakpoint=breakpoints[i].name;break;}}
+var columnsVis=this._columnsVisiblity(breakpoint);this.s.current=columnsVis;var collapsedClass=false;for(i=0,ien=columns.length;i<ien;i++){if(columnsVis[i]===false&&!columns[i].never&&!columns[i].control&&!dt.column(i).visible()===false){collapsedClass=true;break;}}
+$(dt.table().node()).toggleClass('collapsed',collapsedClass);var changed=false;var visible=0;dt.columns().eq(0).each(function(colIdx,i){if(columnsVis[i]===true){visible++;}
+if(forceRedraw||columnsVis[i]!==oldVis[i]){changed=true;that._setColumnVis(colIdx,columnsVis[i]);}});if(changed){this._redrawChildren();$(dt.table().node()).trigger('responsive-resize.dt',[dt,this.s.current]);if(dt.page.info().recordsDisplay===0){$('td',dt.table().body()).eq(0).attr('colspan',visible);}}
+that._controlClass();},_resizeAuto:function()
+{var dt=this.s.dt;var columns=this.s.columns;if(!this.c.auto){return;}
+if($.inArray(true,$.map(columns,function(c){return c.auto;}))===-1){return;}
+if(!$.isEmptyObject(_childNodeStore)){$.each(_childNodeStore,function(key){var idx=key.split('-');_childNodesRestore(dt,idx[0]*1,idx[1]*1);});}
+var tableWidth=dt.table().node().offsetWidth;var columnWidths=dt.columns;var clonedTable=dt.table().node().cloneNode(false);var clonedHeader=$(dt.table().header().cloneNode(false)).appendTo(clonedTable);var clonedBody=$(dt.table().body()).clone(false,false).empty().appendTo(clonedTable);clonedTable.style.width='auto';var headerCells=dt.columns().header().filter(function(idx){return dt.column(idx).visible();}).to$().clone(false).css('display','table-cell').css('width','auto').css('min-width',0);$(clonedBody).append($(dt.rows({page:'current'}).nodes()).clone(false)).find('th, td').css('display','');var footer=dt.table().footer();if(footer){var clonedFooter=$(footer.cloneNode(false)).appendTo(clonedTable);var footerCells=dt.columns().footer().filter(function(idx){return dt.column(idx).visible();}).to$().clone(false).css('display','table-cell');$('<tr/>').append(footerCells).appendTo(clonedFooter);}
+$('<tr/>').append(headerCells).appendTo(clonedHeader);if(this.c.details.type==='inline'){$(clonedTable).addClass('dtr-inline collapsed');}
+$(clonedTable).find('[name]').removeAttr('name');$(clonedTable).css('position','relative')
+var inserted=$('<div/>').css({width:1,height:1,overflow:'hidden',clear:'both'}).append(clonedTable);inserted.insertBefore(dt.table().node());headerCells.each(function(i){var idx=dt.column.index('fromVisible',i);columns[idx].minWidth=this.offsetWidth||0;});inserted.remove();},_responsiveOnlyHidden:function()
+{var dt=this.s.dt;return $.map(this.s.current,function(v,i){if(dt.column(i).visible()===false){return true;}
+return v;});},_setColumnVis:function(col,showHide)
+{var dt=this.s.dt;var display=showHide?'':'none';$(dt.column(col).header()).css('display',display).toggleClass('dtr-hidden',!showHide);$(dt.column(col).footer()).css('display',display).toggleClass('dtr-hidden',!showHide);dt.column(col).nodes().to$().css('display',display).toggleClass('dtr-hidden',!showHide);if(!$.isEmptyObject(_childNodeStore)){dt.cells(null,col).indexes().each(function(idx){_childNodesRestore(dt,idx.row,idx.column);});}},_tabIndexes:function()
+{var dt=this.s.dt;var cells=dt.cells({page:'current'}).nodes().to$();var ctx=dt.settings()[0];var target=this.c.details.target;cells.filter('[data-dtr-keyboard]').removeData('[data-dtr-keyboard]');if(typeof target==='number'){dt.cells(null,target,{page:'current'}).nodes().to$().attr('tabIndex',ctx.iTabIndex).data('dtr-keyboard',1);}
+else{if(target==='td:first-child, th:first-child'){target='>td:first-child, >th:first-child';}
+$(target,dt.rows({page:'current'}).nodes()).attr('tabIndex',ctx.iTabIndex).data('dtr-keyboard',1);}}});Responsive.breakpoints=[{name:'desktop',width:Infinity},{name:'tablet-l',width:1024},{name:'tablet-p',width:768},{name:'mobile-l',width:480},{name:'mobile-p',width:320}];Responsive.display={childRow:function(row,update,render){if(update){if($(row.node()).hasClass('parent')){row.child(render(),'child').show();return true;}}
+else{if(!row.child.isShown()){row.child(render(),'child').show();$(row.node()).addClass('parent');return true;}
+else{row.child(false);$(row.node()).removeClass('parent');return false;}}},childRowImmediate:function(row,update,render){if((!update&&row.child.isShown())||!row.responsive.hasHidden()){row.child(false);$(row.node()).removeClass('parent');return false;}
+else{row.child(render(),'child').show();$(row.node()).addClass('parent');return true;}},modal:function(options){return function(row,update,render){if(!update){var close=function(){modal.remove();$(document).off('keypress.dtr');};var modal=$('<div class="dtr-modal"/>').append($('<div class="dtr-modal-display"/>').append($('<div class="dtr-modal-content"/>').append(render())).append($('<div class="dtr-modal-close">&times;</div>').click(function(){close();}))).append($('<div class="dtr-modal-background"/>').click(function(){close();})).appendTo('body');$(document).on('keyup.dtr',function(e){if(e.keyCode===27){e.stopPropagation();close();}});}
+else{$('div.dtr-modal-content').empty().append(render());}
+if(options&&options.header){$('div.dtr-modal-content').prepend('<h2>'+options.header(row)+'</h2>');}};}};var _childNodeStore={};function _childNodes(dt,row,col){var name=row+'-'+col;if(_childNodeStore[name]){return _childNodeStore[name];}
+var nodes=[];var children=dt.cell(row,col).node().childNodes;for(var i=0,ien=children.length;i<ien;i++){nodes.push(children[i]);}
+_childNodeStore[name]=nodes;return nodes;}
+function _childNodesRestore(dt,row,col){var name=row+'-'+col;if(!_childNodeStore[name]){return;}
+var node=dt.cell(row,col).node();var store=_childNodeStore[name];var parent=store[0].parentNode;var parentChildren=parent.childNodes;var a=[];for(var i=0,ien=parentChildren.length;i<ien;i++){a.push(parentChildren[i]);}
+for(var j=0,jen=a.length;j<jen;j++){node.appendChild(a[j]);}
+_childNodeStore[name]=undefined;}
+Responsive.renderer={listHiddenNodes:function(){return function(api,rowIdx,columns){var ul=$('<ul data-dtr-index="'+rowIdx+'" class="dtr-details"/>');var found=false;var data=$.each(columns,function(i,col){if(col.hidden){var klass=col.className?'class="'+col.className+'"':'';$('<li '+klass+' data-dtr-index="'+col.columnIndex+'" data-dt-row="'+col.rowIndex+'" data-dt-column="'+col.columnIndex+'">'+'<span class="dtr-title">'+
+col.title+'</span> '+'</li>').append($('<span class="dtr-data"/>').append(_childNodes(api,col.rowIndex,col.columnIndex))).appendTo(ul);found=true;}});return found?ul:false;};},listHidden:function(){return function(api,rowIdx,columns){var data=$.map(columns,function(col){var klass=col.className?'class="'+col.className+'"':'';return col.hidden?'<li '+klass+' data-dtr-index="'+col.columnIndex+'" data-dt-row="'+col.rowIndex+'" data-dt-column="'+col.columnIndex+'">'+'<span class="dtr-title">'+
+col.title+'</span> '+'<span class="dtr-data">'+
+col.data+'</span>'+'</li>':'';}).join('');return data?$('<ul data-dtr-index="'+rowIdx+'" class="dtr-details"/>').append(data):false;}},tableAll:function(options){options=$.extend({tableClass:''},options);return function(api,rowIdx,columns){var data=$.map(columns,function(col){var klass=col.className?'class="'+col.className+'"':'';return'<tr '+klass+' data-dt-row="'+col.rowIndex+'" data-dt-column="'+col.columnIndex+'">'+'<td>'+col.title+':'+'</td> '+'<td>'+col.data+'</td>'+'</tr>';}).join('');return $('<table class="'+options.tableClass+' dtr-details" width="100%"/>').append(data);}}};Responsive.defaults={breakpoints:Responsive.breakpoints,auto:true,details:{display:Responsive.display.childRow,renderer:Responsive.renderer.listHidden(),target:0,type:'inline'},orthogonal:'display'};var Api=$.fn.dataTable.Api;Api.register('responsive()',function(){return this;});Api.register('responsive.index()',function(li){li=$(li);return{column:li.data('dtr-index'),row:li.parent().data('dtr-index')};});Api.register('responsive.rebuild()',function(){return this.iterator('table',function(ctx){if(ctx._responsive){ctx._responsive._classLogic();}});});Api.register('responsive.recalc()',function(){return this.iterator('table',function(ctx){if(ctx._responsive){ctx._responsive._resizeAuto();ctx._responsive._resize();}});});Api.register('responsive.hasHidden()',function(){var ctx=this.context[0];return ctx._responsive?$.inArray(false,ctx._responsive._responsiveOnlyHidden())!==-1:false;});Api.registerPlural('columns().responsiveHidden()','column().responsiveHidden()',function(){return this.iterator('column',function(settings,column){return settings._responsive?settings._responsive._responsiveOnlyHidden()[column]:false;},1);});Responsive.version='2.3.0';$.fn.dataTable.Responsive=Responsive;$.fn.DataTable.Responsive=Responsive;$(document).on('preInit.dt.dtr',function(e,settings,json){if(e.namespace!=='dt'){return;}
+if($(settings.nTable).hasClass('responsive')||$(settings.nTable).hasClass('dt-responsive')||settings.oInit.responsive||DataTable.defaults.responsive){var init=settings.oInit.responsive;if(init!==false){new Responsive(settings,$.isPlainObject(init)?init:{});}}});return Responsive;}));(function($,undefined){"use strict";var dataTableS3ID=0;var inList=function(item,arr){for(var i=0,len=arr.length;i<len;i++){if(item==arr[i]){return i;}}
+return-1;};var appendUrlQuery=function(url,extension,query){var parts=url.split('?');if(extension){parts[0]+='.'+extension;}
+if(query){if(parts.length>1){parts[1]+='&'+query;}else{parts.push(query);}}
+return parts.join('?');};var updateUrlQuery=function(target,source){var urlFilters=function(k){return k.indexOf('.')!=-1||k[0]=='(';};var otherParams=function(k){return!urlFilters(k)&&k[0]!='w';};var extractFrom=function(query,f){return query&&query.split('&').filter(function(item){var q=item.split('=');return q.length>1&&f(S3.urlDecode(q[0]));})||[];};var tparts=target.split('?'),sparts=source.split('?'),urlVars=extractFrom(tparts[1],otherParams);tparts[1]=urlVars.concat(extractFrom(sparts[1],urlFilters)).join('&');return tparts.join('?');};function DDTCache(){this.data=[];this.slices=[];this.availableRecords=-1;}
+DDTCache.prototype.store=function(startIndex,data,availableRecords){if(availableRecords!==undefined){this.availableRecords=availableRecords;}
+var dataLength=data.length;if(dataLength){var cache=this.data,slices=this.slices;data.forEach(function(record,index){cache[startIndex+index]=record;});slices.push([startIndex,startIndex+dataLength]);slices.sort(function(x,y){var diff=x[0]-y[0];if(diff!==0){return diff;}else{return x[1]-y[1];}});if(slices.length>1){var newSlices=[];var merged=slices.reduce(function(x,y){if(x[1]<y[0]||x[0]>y[1]){newSlices.push(x);return y;}else{return[Math.min(x[0],y[0]),Math.max(x[1],y[1])];}});newSlices.push(merged);this.slices=newSlices;}}};DDTCache.prototype.retrieve=function(pageStart,pageLength){var availableRecords=this.availableRecords;if(availableRecords<0){return null;}
+if(pageStart<0){pageStart=0;}
+if(pageStart>=availableRecords){return[];}
+var pageEnd=pageStart+pageLength;if(pageEnd>availableRecords){pageEnd=availableRecords;}
+var slices=this.slices,slice,numSlices=slices.length;for(var i=0;i<numSlices;i++){slice=slices[i];if(pageStart>=slice[0]&&pageEnd<=slice[1]){return this.data.slice(pageStart,pageEnd);}}
+return null;};DDTCache.prototype.clear=function(){this.cache=[];this.slices=[];this.availableRecords=-1;};$.widget('s3.dataTableS3',{options:{destroy:false,deselectedIndicator:false},_create:function(){this.id=dataTableS3ID;dataTableS3ID+=1;this.eventNamespace='.dataTableS3';},_init:function(){var el=$(this.element),tableID=el.attr('id');this.tableID=tableID;this.selector='#'+tableID;this.refresh();},_destroy:function(){$.Widget.prototype.destroy.call(this);},refresh:function(){var el=$(this.element),opts=this.options;this._unbindEvents();var tableConfig=this._parseConfig();if(tableConfig===undefined){return;}
+var serverSide=true,processing=true,fnAjax=null;if(tableConfig.pagination){this.ajaxUrl=tableConfig.ajaxUrl;fnAjax=this._pipeline({cache:this._initCache()});}else{serverSide=false;processing=false;}
+this._renderBulkActions();el.dataTable({'ajax':fnAjax,'autoWidth':false,'columns':this.columnConfigs,'deferRender':true,'destroy':opts.destroy,'dom':tableConfig.dom,'lengthMenu':tableConfig.lengthMenu,'order':tableConfig.order,'orderFixed':tableConfig.group,'ordering':true,'pageLength':tableConfig.pageLength,'pagingType':tableConfig.pagingType,'processing':processing,'searchDelay':450,'searching':tableConfig.searching,'serverSide':serverSide,'search':{'smart':serverSide},'language':{'aria':{'sortAscending':': '+i18n.sortAscending,'sortDescending':': '+i18n.sortDescending},'paginate':{'first':i18n.first,'last':i18n.last,'next':i18n.next,'previous':i18n.previous},'emptyTable':i18n.emptyTable,'info':i18n.info,'infoEmpty':i18n.infoEmpty,'infoFiltered':i18n.infoFiltered,'infoThousands':i18n.infoThousands,'lengthMenu':i18n.lengthMenu,'loadingRecords':i18n.loadingRecords+'...','processing':i18n.processing+'...','search':i18n.search+':','zeroRecords':i18n.zeroRecords},'rowCallback':this._rowCallback(),'drawCallback':this._drawCallback(),'initComplete':S3.dataTables.initComplete});this._bindEvents();},_parseConfig:function(){var el=$(this.element),config=$(this.selector+'_configurations');if(!config.length){return;}
+var tableConfig=JSON.parse(config.val());this.tableConfig=tableConfig;if(!tableConfig.rowActions.length){tableConfig.rowActionsJSON=false;if(S3.dataTables.Actions){tableConfig.rowActions=S3.dataTables.Actions;}else{tableConfig.rowActions=[];}}else{tableConfig.rowActionsJSON=true;}
+var columnConfig=[],numCols=$('thead tr',el).children().length;for(var i=0;i<numCols;i++){columnConfig[i]=null;}
+if(tableConfig.rowActions.length>0){columnConfig[tableConfig.actionCol]={'sTitle':' ','bSortable':false};}
+if(tableConfig.bulkActions){columnConfig[tableConfig.bulkCol]={'sTitle':'<div class="bulk-select-options"><input class="bulk-select-all" type="checkbox">'+i18n.selectAll+'</input></div>','bSortable':false};}
+if(tableConfig.colWidths){var col,_colWidths=tableConfig.colWidths;for(col in _colWidths){if(columnConfig[col]!=null){columnConfig[col].sWidth=_colWidths[col];}else{columnConfig[col]={'sWidth':_colWidths[col]};}}}
+this.columnConfigs=columnConfig;return tableConfig;},_pipeline:function(opts){var conf=$.extend({cache:{},pages:2,data:null,method:'GET'},opts);var cache=conf.cache,cacheLastRequest=cache.cacheLastRequest||null,cacheLastJson=cache.cacheLastJson||null,cacheUpper=cache.cacheUpper||null,cacheLower=cache.cacheLower,cursor=cacheLastJson&&cacheLastJson.cursor||null;if(cacheLower===undefined){cacheLower=-1;}
+var cacheCombined=new DDTCache();if(cacheLastJson&&cacheLower!=-1){var availableRecords=cacheLastJson.recordsFiltered||cacheLastJson.recordsTotal;cacheCombined.store(cacheLower,cacheLastJson.data,availableRecords);}
+var self=this;return function(request,drawCallback,settings){if(this.hasOwnProperty('nTable')){var sAjaxSource=settings.sAjaxSource;if(sAjaxSource){self.ajaxUrl=sAjaxSource;settings.sAjaxSource=null;}
+cacheLastJson=null;cacheLastRequest=null;cacheLower=-1;cacheUpper=null;cacheCombined.clear();cursor=null;drawCallback({});return;}
+var ajax=false,requestStart=request.start,drawStart=request.start,requestLength=request.length,cached;var totalRecords=request.recordsTotal,availableRecords=totalRecords;if(cacheLastJson){if(cacheLastJson.recordsTotal!==undefined){totalRecords=cacheLastJson.recordsTotal;}
+if(cacheLastJson.recordsFiltered!==undefined){availableRecords=cacheLastJson.recordsFiltered;}else{availableRecords=totalRecords;}}
+self.totalRecords=totalRecords;if(requestLength==-1){requestStart=0;if(availableRecords!==undefined){requestLength=availableRecords;}else{ajax=true;}}
+if(!ajax){var requestEnd=requestStart+requestLength;if(settings.clearCache){cacheCombined.clear();settings.clearCache=false;cursor=null;ajax=true;}else if(cacheLastRequest&&(JSON.stringify(request.order)!==JSON.stringify(cacheLastRequest.order)||JSON.stringify(request.columns)!==JSON.stringify(cacheLastRequest.columns)||JSON.stringify(request.search)!==JSON.stringify(cacheLastRequest.search))){cacheCombined.clear();cursor=null;ajax=true;}else{cached=cacheCombined.retrieve(requestStart,requestEnd-requestStart);if(cached===null){ajax=true;}}}
+cacheLastRequest=$.extend(true,{},request);if(ajax){if(requestStart<cacheLower){requestStart=requestStart-(requestLength*(conf.pages-1));if(requestStart<0){requestStart=0;}}
+cacheLower=requestStart;if(request.length!=-1){cacheUpper=requestStart+(requestLength*conf.pages);}else{cacheUpper=requestLength;}
+request.start=requestStart;request.length=requestLength*conf.pages;if($.isFunction(conf.data)){var d=conf.data(request);if(d){$.extend(request,d);}}
+else if($.isPlainObject(conf.data)){$.extend(request,conf.data);}
+var limit;if(requestLength==-1){limit='none';}else{limit=request.length;}
+var sendData=[{'name':'draw','value':request.draw},{'name':'limit','value':limit}];if(requestStart!=0){sendData.push({'name':'start','value':requestStart});if(cursor&&cursor.start==requestStart){sendData.push({'name':'cursor','value':cursor.key});}}
+if(request.search&&request.search.value){sendData.push({'name':'sSearch','value':request.search.value});sendData.push({'name':'iColumns','value':request.columns.length});}
+var order_len=request.order.length;if(order_len){sendData.push({'name':'iSortingCols','value':order_len});var columnConfigs=self.columnConfigs,columnConfig,ordering,i;for(i=0;i<columnConfigs.length;i++){columnConfig=columnConfigs[i];if(columnConfig&&!columnConfig.bSortable){sendData.push({'name':'bSortable_'+i,'value':'false'});}}
+for(i=0;i<order_len;i++){ordering=request.order[i];sendData.push({'name':'iSortCol_'+i,'value':ordering.column});sendData.push({'name':'sSortDir_'+i,'value':ordering.dir});}}
+var ajaxMethod=$.ajaxS3;if($.searchS3!==undefined){ajaxMethod=$.searchS3;}
+settings.jqXHR=ajaxMethod({'type':conf.method,'url':self.ajaxUrl,'data':sendData,'dataType':'json','cache':false,'success':function(json){var cacheEnd=self.totalRecords;if(json.recordsFiltered!==undefined){cacheEnd=json.recordsFiltered;}
+cacheCombined.store(requestStart,json.data,cacheEnd);cacheLastJson=$.extend(true,{},json);cursor=json.cursor||null;cacheUpper=requestStart+json.data.length;if(requestStart!=drawStart){json.data.splice(0,drawStart-requestStart);}
+if(requestLength!=-1){json.data.splice(requestLength,json.data.length);}
+drawCallback(json);}});}else{var json=$.extend(true,{},cacheLastJson,{draw:request.draw});json.data=cached;drawCallback(json);}};},_initCache:function(){var initial=$(this.selector+'_dataTable_cache'),cache;if(initial.length>0){cache=JSON.parse(initial.val());}else{cache={};}
+this.pipelineCache=cache;return cache;},_headerCallback:function(){},_rowCallback:function(){var self=this;return function(nRow,aData){var tableConfig=self.tableConfig,actionCol=tableConfig.actionCol;var result=/>(.*)</i.exec(aData[actionCol]),recordId;if(result===null){recordId=aData[actionCol];}else{recordId=result[1];}
+var rowActions=tableConfig.rowActions;if(rowActions.length||tableConfig.bulkActions){var buttons=[];for(var i=0;i<rowActions.length;i++){buttons.push(self._renderActionButton(recordId,rowActions[i]));}
+$('td:eq('+actionCol+')',nRow).addClass('actions').html(buttons.join(''));}
+if(tableConfig.bulkActions){self._bulkSelect(nRow,inList(recordId,self.selectedRows));}
+var styles=tableConfig.rowStyles;if(styles){var row=$(nRow);for(var style in styles){if(inList(recordId,styles[style])!=-1){row.addClass(style);}}}
+self._truncateCellContents(nRow,aData);return nRow;};},_drawCallback:function(){var self=this;return function(oSettings){var el=$(self.element),selector=self.selector,wrapper=el.closest('.dt-wrapper');var ajaxSource=self.ajaxUrl;if(ajaxSource){wrapper.find('a.permalink').each(function(){var $this=$(this);$this.attr('href',updateUrlQuery($this.attr('href'),ajaxSource));});}
+var numrows=oSettings.fnRecordsDisplay();if(Math.ceil(numrows/oSettings._iDisplayLength)>1){$(selector+'_paginate').show();}else{$(selector+'_paginate').hide();}
+if(numrows===0){wrapper.find('.dt-export-options').hide();}else{wrapper.find('.dt-export-options').show();}
+if($(selector+' .s3_modal').length){S3.addModals();}
+var container=el.closest('.dt-contents');if(container.length){if(numrows>0){container.find('.empty').hide().siblings('.dt-wrapper').show();}else{container.find('.empty').show().siblings('.dt-wrapper').hide();}}
+var tableConfig=self.tableConfig,groups=tableConfig.group;if(groups&&groups.length){var prefixID=[];groups.forEach(function(group,i){var groupTotals=tableConfig.groupTotals[i]||{},groupTitles=tableConfig.groupTitles[i]||[];self._renderGroups(oSettings,group[0],groupTitles,groupTotals,prefixID,i+1);prefixID.push(group[0]);});if(tableConfig.shrinkGroupedRows){var levelID,groupID;$('tbody tr',el).each(function(){var row=$(this);if(row.hasClass('group')){levelID=row.data('level');groupID=row.data('group');}else if(levelID&&groupID&&!row.hasClass('spacer')){row.addClass('xgroup_'+levelID+'_'+groupID).addClass('collapsable');}});$('.collapsable').hide();}}
+self.doubleScroll();};},_renderActionButton:function(recordId,action){var button='';var restrict=action.restrict;if(restrict&&restrict.constructor===Array&&restrict.indexOf(recordId)==-1){return button;}
+var exclude=action.exclude;if(exclude&&exclude.constructor===Array&&exclude.indexOf(recordId)!=-1){return button;}
+var c=action._class;var label=action.label,title=action._title||label;if(action.icon){label='<i class="'+action.icon+'" alt="'+label+'"> </i>';}else if(action.img){label='<img src="'+action.icon+'" alt="'+label+'"></img>';}
+var disabled;if(action._disabled){disabled=' disabled="disabled"';}else{disabled='';}
+var re=/%5Bid%5D/g;if(action._onclick){var oc=action._onclick.replace(re,recordId);button='<a class="'+c+'" onclick="'+oc+disabled+'">'+label+'</a>';}else if(action.url){var url=action.url.replace(re,recordId),target=action._target||'';if(target){target=' target="'+target+'"';}
+button='<a db_id="'+recordId+'" class="'+c+'" href="'+url+'" title="'+title+'"'+target+disabled+'>'+label+'</a>';}else{var ajaxURL=action._ajaxurl||'';if(ajaxURL){ajaxURL=' data-url="'+ajaxURL+'"';}
+button='<a db_id="'+recordId+'" class="'+c+'" title="'+title+'"'+ajaxURL+disabled+'>'+label+'</a>';}
+return button;},ajaxAction:function(confirmation){var el=$(this.element);return function(event){event.stopPropagation();event.preventDefault();if(!confirmation||confirm(confirmation)){var $this=$(this),recordID=$this.attr('db_id'),ajaxURL=$this.data('url'),data={},formKey=el.closest('.dt-wrapper').find('input[name="_formkey"]').first().val();if(formKey!==undefined){data._formkey=formKey;}
+if(ajaxURL&&recordID){$.ajaxS3({'url':ajaxURL.replace(/%5Bid%5D/g,recordID),'type':'POST','dataType':'json','data':data,'success':function(){el.dataTable().fnReloadAjax();}});}}};},_truncateCellContents:function(row,data){var tableConfig=this.tableConfig,maxLength=tableConfig.textMaxLength,shrinkLength=tableConfig.textShrinkLength,groups=null,colIdx=0;if(tableConfig.group){groups=tableConfig.group.map(function(group){return group[0];});}
+for(var i=0;i<data.length;i++){if($.inArray(i,groups)!=-1){continue;}
+var str=data[i];if(str.length>maxLength&&!str.match(/<.*>/)){var disp='<div class="dt-truncate"><span class="ui-icon ui-icon-zoomin" style="float:right"></span>'+str.substr(0,shrinkLength)+"&hellip;</div>",full='<div  style="display:none" class="dt-truncate"><span class="ui-icon ui-icon-zoomout" style="float:right"></span>'+str+"</div>";$('td:eq('+colIdx+')',row).html(disp+full);}
+colIdx++;}},doubleScroll:function(){var el=$(this.element);if(el.hasClass('doublescroll')&&!el.hasClass('responsive')){try{el.closest('.dataTable_table').doubleScroll({contentElement:el,resetOnWindowResize:true});}catch(e){console.log('dataTableS3: doubleScroll not available');}}},_renderBulkActions:function(){var tableConfig=this.tableConfig,bulkActions=tableConfig.bulkActions;if(bulkActions){var bulkActionControls=$('<div class="dataTable-action">');bulkActions.forEach(function(bulkAction){var name,value,cls;if(bulkAction.constructor===Array){value=bulkAction[0];name=bulkAction[1];if(bulkAction.length>2){cls=bulkAction[2];}}else{name=bulkAction;value=bulkAction;}
+var bulkActionSubmit=$('<input type="submit" class="selected-action">').attr({id:name+'-selected-action',name:name,value:value}).appendTo(bulkActionControls);if(cls){bulkActionSubmit.addClass(cls);}});this.bulkActionControls=bulkActionControls;var selected=JSON.parse($(this.selector+'_dataTable_bulkSelection').val());if(selected===null){selected=[];}
+this.selectedRows=selected;if($(this.selector+'_dataTable_bulkSelectAll').val()){this.selectionMode='Exclusive';}else{this.selectionMode='Inclusive';}}},_bulkSelect:function(row,index){var el=$(this.element),tableConfig=this.tableConfig,numSelected=this.selectedRows.length,totalRecords=this.totalRecords;var bulkSelectOptions=$('.bulk-select-options',el),selectAll=$('.bulk-select-all',el),deselected=$('.bulk-deselected',el),totalAvailable=$('.bulk-total-available',el),totalSelected=$('.bulk-total-selected',el),selectedIndicator=totalAvailable.length&&totalAvailable.length;if(this.selectionMode=='Inclusive'){if(selectedIndicator){totalSelected.text(numSelected);totalAvailable.text(totalRecords);}else{deselected.remove();}
+var bulkSingle=tableConfig.bulkSingle;if(index==-1){$(row).removeClass('row_selected');$('.bulkcheckbox',row).prop('checked',false);}else{if(bulkSingle){$(row).closest('table').find('tr').removeClass('row_selected').find('.bulkcheckbox').prop('checked',false);}
+$(row).addClass('row_selected');$('.bulkcheckbox',row).prop('checked',true);}
+if(!bulkSingle&&(numSelected==totalRecords)){selectAll.prop('checked',true);this.selectionMode='Exclusive';this.selectedRows=[];}}else{if(selectedIndicator){totalSelected.text(parseInt(totalAvailable.text(),10)-numSelected);totalAvailable.text(totalRecords);}else{if(!numSelected||numSelected==totalRecords){deselected.remove();}else{if(!deselected.length&&this.options.deselectedIndicator){deselected=$('<span class="bulk-deselected">').appendTo(bulkSelectOptions);}
+deselected.html('[-'+numSelected+']');}}
+if(index==-1){$(row).addClass('row_selected');$('.bulkcheckbox',row).prop('checked',true);}else{$(row).removeClass('row_selected');$('.bulkcheckbox',row).prop('checked',false);}
+if(numSelected==totalRecords){selectAll.prop('checked',false);this.selectionMode='Inclusive';this.selectedRows=[];}}
+if(tableConfig.bulkActions){$(this.selector+'_dataTable_bulkMode').val(this.selectionMode);$(this.selector+'_dataTable_bulkSelection').val(this.selectedRows.join(','));this.bulkActionControls.insertBefore(bulkSelectOptions);var numActive=this.selectedRows.length;if(this.selectionMode=='Exclusive'){numActive=totalRecords-numActive;}
+$('.selected-action',el).prop('disabled',numActive==0);$('.pair-action',el).prop('disabled',numActive!=2);}},_bulkSelectRow:function(){var self=this;return function(){var $this=$(this),id=$this.data('dbid'),rows=self.selectedRows;var posn=inList(id,rows);if(posn==-1){if(self.tableConfig.bulkSingle){self.selectedRows=[id];}else{rows.push(id);}
+posn=0;}else{rows.splice(posn,1);posn=-1;}
+self._bulkSelect($this.closest('tr'),posn);};},_bulkSelectAll:function(){var el=$(this.element),self=this;return function(){self.selectedRows=[];if($(this).prop('checked')){self.selectionMode='Exclusive';}else{self.selectionMode='Inclusive';}
+el.dataTable().api().draw(false);};},_renderGroups:function(oSettings,groupColumn,groupTitles,groupTotals,prefixID,level){var iColspan=oSettings.aoColumns.length,parentGroup,el=$(this.element),tableRows=$('tbody tr',el),row,rowData,value,prevValue,title,group=1,dataCnt=0,groupTitleCnt=0,groupPrefix='';for(var i=0;i<tableRows.length;i++){row=$(tableRows[i]);if(row.hasClass('spacer')){continue;}
+if(oSettings.aoData.length){rowData=oSettings.aoData[oSettings.aiDisplay[dataCnt]]._aData;}else{continue;}
+if(row.hasClass('group')){prevValue=undefined;parentGroup=row.data('group');groupPrefix=prefixID.map(function(idx){return this[idx];},rowData).join('_');continue;}
+value=rowData[groupColumn];if(value!==prevValue){while(groupTitles.length>groupTitleCnt&&value!=groupTitles[groupTitleCnt][0]){title=groupTitles[groupTitleCnt][1];this._insertGroupHeader(row,title,level,group,parentGroup,iColspan,groupTotals,groupPrefix);groupTitleCnt++;group++;}
+if(groupTitles.length>groupTitleCnt){title=groupTitles[groupTitleCnt][1];groupTitleCnt++;}else{title=value;}
+this._insertGroupHeader(row,title,level,group,parentGroup,iColspan,groupTotals,groupPrefix,true);group++;prevValue=value;}
+dataCnt+=1;if(this.tableConfig.shrinkGroupedRows){row.hide();}}
+row=tableRows[tableRows.length-1];while(groupTitles.length>groupTitleCnt){title=groupTitles[groupTitleCnt][1];this._insertGroupHeader(row,title,level,group,parentGroup,iColspan,groupTotals,groupPrefix,false,true);groupTitleCnt++;group++;}},_insertGroupHeader:function(row,groupTitle,level,group,parentGroup,iColspan,groupTotals,groupPrefix,addIcons,append){var tableConfig=this.tableConfig;var nGroup=$('<tr class="group">').data({level:''+level,group:''+group}).addClass('level_'+level);var collapsable=tableConfig.shrinkGroupedRows;if(parentGroup){var parentLevel=''+(level-1);nGroup.addClass('xgroup_'+parentLevel+'_'+parentGroup).data({parentLevel:parentLevel,parentGroup:parentGroup});if(collapsable){nGroup.addClass('collapsable');}}
+var nCell=$('<td>').attr('colspan',iColspan).appendTo(nGroup);for(var lvl=1;lvl<level;lvl++){$('<span class="group-indent">').appendTo(nCell);}
+if(level>1){$('<span class="ui-icon ui-icon-triangle-1-e group-closed">').appendTo(nCell);$('<span class="ui-icon ui-icon-triangle-1-s group-opened">').hide().appendTo(nCell);}
+var groupCount='';if(groupTotals[groupTitle]!=null){groupCount=' ('+groupTotals[groupTitle]+')';}else{var index=groupPrefix+groupTitle;if(groupTotals[index]!=null){groupCount=' ('+groupTotals[index]+')';}}
+nCell.append(groupTitle+groupCount);if(collapsable&&addIcons){var expandIcons=tableConfig.groupIcon|[],expandIconType;if(expandIcons.length>=level){expandIconType=expandIcons[level-1];}else{expandIconType='icon';}
+var expandIcon=$('<span class="group-expand">').appendTo(nCell),collapseIcon=$('<span class="group-collapse">').hide().appendTo(nCell);if(expandIconType=='text'){expandIcon.text('→');collapseIcon.text('↓');}else if(expandIconType=='icon'){expandIcon.addClass('ui-icon ui-icon-arrowthick-1-e');collapseIcon.addClass('ui-icon ui-icon-arrowthick-1-s');}}
+if(append){nGroup.insertAfter(row);}else{nGroup.insertBefore(row);}
+if(tableConfig.groupSpacing){var prevHeader=nGroup.prevAll('tr.group').first();if(prevHeader.length){var prevLevel=prevHeader.data('level');if(prevLevel==level){var prevGroup=prevHeader.data('group'),emptyCell=$('<td>').attr('colspan',iColspan),spacerRow=$('<tr class="spacer">').append(emptyCell);if(collapsable){spacerRow.addClass('collapsable');}
+spacerRow.addClass('xgroup_'+level+'_'+prevGroup).insertBefore(nGroup);}}}},_toggleGroup:function(row,visibility){switch(this.tableConfig.shrinkGroupedRows){case'individual':if(visibility){this._expandGroup(row);}else{this._collapseGroup(row);}
+break;case'accordion':if(visibility){this._expandGroup(row);var level=row.data('level'),siblingClass='.level_'+level,parentGroup=row.data('parentGroup');if(parentGroup){siblingClass+='.xgroup_'+row.data('parentLevel')+'_'+parentGroup;}
+var self=this;row.siblings('tr.group'+siblingClass).each(function(){self._collapseGroup($(this));});}else{this._collapseGroup(row);}
+break;default:break;}},_expandGroup:function(row){var level=row.data('level'),group=row.data('group');row.siblings('tr.xgroup_'+level+'_'+group).show();$('.group-expand, .group-closed',row).hide();$('.group-collapse, .group-opened',row).show();},_collapseGroup:function(row){var level=row.data('level'),group=row.data('group'),self=this;row.siblings('tr.xgroup_'+level+'_'+group).each(function(){var $this=$(this);if($this.hasClass('group')){self._collapseGroup($this);}
+$this.hide();});$('.group-expand, .group-closed',row).show();$('.group-collapse, .group-opened',row).hide();},_exportFormat:function(){var el=$(this.element),self=this;return function(){var oSetting=el.dataTable().fnSettings(),url=$(this).data('url'),extension=$(this).data('extension');if(oSetting){var args='id='+self.tableID,sSearch=oSetting.oPreviousSearch.sSearch,aaSort=oSetting.aaSorting,aaSortFixed=oSetting.aaSortingFixed,aoColumns=oSetting.aoColumns;if(sSearch){args+='&sSearch='+sSearch+'&iColumns='+aoColumns.length;}
+if(aaSortFixed!==null){aaSort=aaSortFixed.concat(aaSort);}
+aoColumns.forEach(function(column,i){if(!column.bSortable){args+='&bSortable_'+i+'=false';}});args+='&iSortingCols='+aaSort.length;aaSort.forEach(function(sorting,i){args+='&iSortCol_'+i+'='+aaSort[i][0]+'&sSortDir_'+i+'='+aaSort[i][1];});url=appendUrlQuery(url,extension,args);}else{url=appendUrlQuery(url,extension);}
+if($.searchDownloadS3!==undefined){$.searchDownloadS3(url,'_blank');}else{window.open(url);}};},_initExportFormats:function(){var tableConfig=this._parseConfig();if(tableConfig===undefined){return;}
+var ajaxURL=tableConfig.ajaxUrl;if(ajaxURL&&S3.search!==undefined){var link=document.createElement('a');link.href=ajaxURL;if(link.search){var items=link.search.slice(1).split('&'),queries=items.map(function(item){var q=item.split('=');return[S3.urlDecode(q[0]),S3.urlDecode(q[1])];}).filter(function(item){return item[0].indexOf('.')!=-1;});$(this.element).closest('.dt-wrapper').find('.dt-export').each(function(){var $this=$(this);var url=$this.data('url');if(url){$this.data('url',S3.search.filterURL(url,queries));}});}}},_bindEvents:function(){var el=$(this.element),ns=this.eventNamespace,self=this;el.on('click'+ns,'.dt-truncate .ui-icon-zoomin, .dt-truncate .ui-icon-zoomout',function(){$(this).parent().toggle().siblings('.dt-truncate').toggle();return false;});this._initExportFormats();el.closest('.dt-wrapper').find('.dt-export').on('click'+ns,this._exportFormat());el.on('click'+ns,'.dt-ajax-delete',this.ajaxAction(i18n.delete_confirmation));el.on('click'+ns,'.group-collapse, .group-expand',function(){var $this=$(this),trow=$this.closest('tr.group'),visibility=true;if($this.hasClass('group-collapse')){visibility=false;}
+self._toggleGroup(trow,visibility);});if(this.tableConfig.bulkActions){if(this.tableConfig.bulkSingle){$('.bulk-select-options',el).hide();}else{el.on('click'+ns,'.bulk-select-all',this._bulkSelectAll());}
+el.on('click'+ns,'.bulkcheckbox',this._bulkSelectRow());}
+return true;},_unbindEvents:function(){var el=$(this.element),ns=this.eventNamespace;el.off(ns);el.closest('.dt-wrapper').find('.dt-export').off(ns);return true;}});$.fn.dataTable.Api.register('clearPipeline()',function(){return this.iterator('table',function(settings){settings.clearCache=true;});});$.fn.dataTableExt.oApi.fnReloadAjax=function(oSettings,sNewSource){if(sNewSource!='undefined'&&sNewSource!=null){oSettings.sAjaxSource=sNewSource;}
+this.oApi._fnProcessingDisplay(oSettings,true);var self=this;oSettings.ajax({},function(){self.oApi._fnClearTable(oSettings);self.fnDraw();},oSettings);};$(function(){if(S3.dataTables){var dataTableIds=S3.dataTables.id;if(dataTableIds){dataTableIds.forEach(function(tableId){$('#'+tableId).dataTableS3({destroy:false});});}}});})(jQuery);
\ No newline at end of file
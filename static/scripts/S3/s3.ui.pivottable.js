@@ -244,6 +244,13 @@
             } else {
                 $el.find('.pt-empty').hide();
             }
+
+            // Freshness indicator (when generated from stored aggregates)
+            $el.find('.pt-freshness').remove();
+            if (data.freshness) {
+                $el.find('.pt-table').first().after(
+                    $('<div class="pt-freshness">').text(data.freshness));
+            }
             if (this.options.autoSubmit) {
                 $el.find('.pt-submit').hide();
             } else {
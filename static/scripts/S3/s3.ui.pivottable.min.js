@@ -8,54 +8,127 @@
  requires NVD3.js 1.8.5 (patched)
 
 */
-(function(e,J){var L=0;e.widget("s3.pivottable",{options:{showTotals:!0,ajaxURL:null,defaultChart:{type:"breakdown",axis:"rows"},renderFilter:!0,renderOptions:!0,renderChart:!0,renderTable:!0,collapseFilter:!1,collapseOptions:!0,collapseChart:!0,collapseTable:!1,exploreChart:!1,filterURL:null,filterForm:null,filterTab:null,autoSubmit:1E3,timeout:1E4,thousandSeparator:" ",thousandGrouping:"3",minTickSize:null,precision:null,textAll:"All",labelRecords:"Records"},_create:function(){this.id=L;L+=1;this.openRequest=
-this.chart=this.table=null;this.eventNamespace=".pt"},_init:function(){var a=e(this.element),b=this.options;this.table=this.data=null;this.chartOptions={currentChart:null,currentDataIndex:null,currentSeriesIndex:null,currentSpectrumIndex:null};this.table_options={hidden:!1};var c=a.find(".pt-chart");this.chart=c.length?c.first():null;b.renderFilter||b.renderOptions?(c="#"+a.attr("id"),b.renderOptions?(e(c+"-options").show(),b.collapseOptions&&(e(c+"-options legend").siblings().toggle(),e(c+"-options legend").children().toggle())):
-e(c+"-options").hide(),b.renderFilter?(e(c+"-filters").show(),b.collapseFilter&&(e(c+"-filters legend").siblings().toggle(),e(c+"-filters legend").children().toggle())):e(c+"-options").hide()):a.find(".pt-form-container").hide();b.collapseTable&&(this.table_options.hidden=!0,a.find(".pt-table").hide(),a.find(".pt-show-table").show(),a.find(".pt-hide-table").hide());b.numberFormatter=function(d){var f=b.precision;if(null===d||"undefined"==typeof d)return"-";f=f||0==f?d.toFixed(f):d.toString();f=f.split(".");
-d=f[0];f=1<f.length?"."+f[1]:"";d=d.replace(new RegExp("\\B(?=(\\d{"+b.thousandGrouping+"})+(?!\\d))","g"),b.thousandSeparator);return d+f};this.refresh()},_destroy:function(){this.table&&this.table.remove();this.chart&&this.chart.empty()},refresh:function(){var a=e(this.element),b=null;this._unbindEvents();var c=a.find('input[type="hidden"][name="pivotdata"]');c.length&&(b=JSON.parse(e(c).first().val()));b?"count"==b.method&&(this.options.precision=0,this.options.minTickSize=1):(b={empty:!0},a.find(".pt-hide-table").hide(),
-a.find(".pt-show-table").hide(),a.find(".pt-export-opt").hide());this.data=b;this.lookups={};b.nodata?(a.find(".pt-table").first().empty().append(e('<div class="pt-no-data">'+b.nodata+"</div>")),a.find(".pt-hide-table").hide(),a.find(".pt-show-table").hide(),a.find(".pt-export-opt").hide()):(this._renderTable(),this._renderChartOptions());this._renderChart();b.empty?a.find(".pt-empty").show():a.find(".pt-empty").hide();this.options.autoSubmit?a.find(".pt-submit").hide():a.find(".pt-submit").show();
-this._bindEvents();a.find(".pt-throbber").hide()},_renderTable:function(){var a=e(this.element),b=a.find(".pt-table").first().empty();this.table=null;var c=this.data;if(!c.empty)if(this.options.renderTable){var d=c.cells.slice(0),f=c.cols,g=c.rows,l=c.total,h=c.labels,k=!1,m=!1;c=c.facts;1==c.length&&"list"!=c[0][1]&&(1==g.length&&null===g[0][4]&&(k=!0),1==f.length&&null===f[0][4]&&(m=!0));c=this.options;var q=c.showTotals,r;if(m&&q)for(f=[],r=0;r<g.length;r++)d[r]=[];else{var w=function(p,t){return"__other__"!=
-f[t][0]};for(r=0;r<g.length;r++)d[r]=d[r].filter(w);f=f.filter(function(p){return"__other__"!=p[0]})}k&&q?(g=[],d=[]):(d=d.filter(function(p,t){return"__other__"!=g[t][0]}),g=g.filter(function(p){return"__other__"!=p[0]}));b=d3.select(b.get(0)).append("table").attr("class","dataTable display report");b.append("thead").call(this._renderHeader,f,h,c).call(this._renderColumns,f,h,m);k&&q||b.append("tbody").call(this._renderRows,this,g,f,h,d,c);q&&b.append("tfoot").call(this._renderFooter,g,f,h,l);this.table=
-e(b.node());this.table_options.hidden?(a.find(".pt-show-table").show(),a.find(".pt-hide-table").hide(),a.find(".pt-export-opt").hide()):(a.find(".pt-show-table").hide(),a.find(".pt-hide-table").show(),a.find(".pt-export-opt").show())}else a.find(".pt-show-table").hide(),a.find(".pt-hide-table").hide(),a.find(".pt-export-opt").hide()},_renderHeader:function(a,b,c,d){a=a.append("tr");a.append("th").attr("scope","col").text(c.layer);b.length&&a.append("th").attr({scope:"col",colspan:b.length}).text(c.cols);
-d.showTotals&&a.append("th").attr({scope:"col","class":"pt-totals-header pt-row-total",rowspan:2}).text(c.total);return a},_renderColumns:function(a,b,c,d){a=a.append("tr");a.append("th").attr({scope:"col","class":"pt-rows-header"}).text(c.rows);a.selectAll("th.pt-data").data(b).enter().append("th").attr({scope:"col","class":"pt-col-label"}).text(function(f){return d?"":f[4]});return a},_renderRows:function(a,b,c,d,f,g,l){c=a.selectAll("tr.pt-row").data(c).enter().append("tr").attr("class",function(h,
-k){return k%2?"odd":"even"});c.append("td").text(function(h){return h[4]});c.selectAll("td.pt-cell").data(function(h,k){return g[k]}).enter().append("td").attr("class","pt-cell").each(b._renderCell,f);l.showTotals&&c.append("td").attr("class","pt-row-total").text(function(h){return h[2][0]});return c},_renderCell:function(a,b,c){b=d3.select(this);for(var d=a.i,f,g=0,l=d.length;g<l;g++){f=d[g];var h=b.append("div").attr("class","pt-cell-value");null===f?h.text(c.none):Array.isArray(f)?h.append("ul").selectAll("li").data(f).enter().append("li").html(function(k){return k}):
-h.text(f);1<l-g&&h.append("span").text(" / ")}(a=a.k)&&a.length&&(e(b.node()).data("recordIDs",a),b.append("div").attr("class","pt-cell-zoom"))},_renderCellRecords:function(a,b){var c=e(".pt-cell-zoom",a).removeClass("opened");a=e(".pt-cell-records",a).remove();if(b){var d=this.lookups,f=[],g,l=[];b.forEach(function(k){if(g=d[k]){if(g.constructor===Array){k=g[1];if(-1!=l.indexOf(k))return;l.push(k);g=g[0]}g&&f.push(g)}});a=e('<div class="pt-cell-records">');var h=e("<ul>").appendTo(a);f.length?(f.sort(function(k,
-m){return k.localeCompare(m)}),f.forEach(function(k){e("<li>").html(k).appendTo(h)})):e("<li>").text(b.length+" "+this.options.textRecords).appendTo(h);c.addClass("opened").after(a)}},_renderFooter:function(a,b,c,d,f){b=b.length%2?"odd":"even";a=a.append("tr").attr("class",b+" pt-totals-row");a.append("th").attr({"class":"pt-totals-header",scope:"row"}).text(d.total);a.selectAll("td.pt-col-total").data(c).enter().append("td").attr("class","pt-col-total").text(function(g){return g[2][0]});a.append("td").attr("class",
-"pt-total").text(f);return a},_renderChartOptions:function(){var a=e(this.element),b=a.find(".pt-chart-controls").first().empty(),c=this.data;if(!c.empty&&this.options.renderChart){c=c.labels;var d=a.attr("id");a=c.layer;var f=c.rows,g=c.cols,l=c.per,h=e('<div class="pt-chart-opts">'),k=d+"-pchart-rows",m=d+"-vchart-rows",q=d+"-hchart-rows",r=d+"-schart-rows",w=d+"-pchart-cols",p=d+"-vchart-cols",t=d+"-hchart-cols";d+="-schart-cols";a&&e(h).append(e('<span class="pt-chart-label">'+a+": </span>"));
-f&&e(h).append(e('<div id="'+k+'" class="pt-chart-icon pt-pchart"></div><div id="'+m+'" class="pt-chart-icon pt-vchart"></div><span class="pt-chart-label">'+l+" "+f+"</span>"));g&&e(h).append(e('<div id="'+w+'" class="pt-chart-icon pt-pchart"></div><div id="'+p+'" class="pt-chart-icon pt-vchart"></div><span class="pt-chart-label">'+l+" "+g+"</span>"));f&&g&&e(h).append(e('<span class="pt-chart-label">| '+c.breakdown+': </span><div id="'+r+'" class="pt-chart-icon pt-schart"></div><div id="'+q+'" class="pt-chart-icon pt-hchart"></div><span class="pt-chart-label">'+
-l+" "+f+'</span><div id="'+d+'"  class="pt-chart-icon pt-schart"></div><div id="'+t+'"  class="pt-chart-icon pt-hchart"></div><span class="pt-chart-label">'+l+" "+g+"</span>"));e(b).append(h)}},_truncateLabel:function(a,b){return a&&a.length>b?a.substring(0,b-3).replace(/\s+$/g,"")+"...":a},_renderChart:function(a){var b=e(this.element),c=this.data;e(".pt-chart-contents",b).hide();if(b=this.chart)if(e(b).off("plothover").off("plotclick").empty(),!c.empty&&this.options.renderChart)if(!1===a)this.options.collapseChart=
-!0;else{b=this.options.collapseChart;if("undefined"==typeof a||!a){if(b)return;a=this.chartOptions.currentChart}if("undefined"==typeof a||!a){if(b)return;a=this.options.defaultChart}if("undefined"!=typeof a&&a){this.options.collapseChart=!1;this.chartOptions.currentChart=a;b=a.type;a=a.axis;var d=c.labels,f=d.per,g=d.layer+" "+f+" "+d.rows;d=d.layer+" "+f+" "+d.cols;f=c.filter;var l=f[0],h=f[1];"piechart"==b?"rows"==a?this._renderPieChart(c.rows,g,l):this._renderPieChart(c.cols,d,h):"barchart"==b?
-"rows"==a?this._renderBarChart(c.rows,c.facts,g,l):this._renderBarChart(c.cols,c.facts,d,h):"breakdown"==b?"rows"==a?this._renderBreakDown(c,0,g,f):this._renderBreakDown(c,1,d,f):"spectrum"==b&&this._renderSpectrum(c,a,f)}}},_renderPieChart:function(a,b,c){var d=this.chart;if(d){e(d).css({height:"360px"}).closest(".pt-chart-contents").show();b?e(d).siblings(".pt-chart-title").html("<h4>"+b+"</h4>"):e(d).siblings(".pt-chart-title").empty();var f=[],g=0;for(b=0;b<a.length;b++){var l=a[b];!l[1]&&0<=
-l[2][0]&&(f.push({index:l[0],label:l[4],value:l[2][0],key:l[3]}),g+=l[2][0])}var h=this;h.chartOptions.currentDataIndex=null;var k=function(m){var q=m.index;if(h.chartOptions.currentDataIndex!=q){h._removeChartTooltip();h.chartOptions.currentDataIndex=q;m=m.data;var r=m.value,w=d3.event;h._renderChartTooltip(w.pageX,w.pageY,'<div class="pt-tooltip-label">'+m.label+'</div><div class="pt-tooltip-text">'+(r+" ("+Math.round(r/g*100)+"%)</div>"));e(".pt-tooltip-label").css({color:nv.utils.defaultColor()({},
-q)})}};nv.addGraph(function(){var m=nv.models.pieChart().x(function(q){return q.label}).y(function(q){return q.value}).labelsOutside(!1).labelType("percent").labelThreshold(.03).showLegend(!0);m.tooltip.enabled(!1);m.legend.align(!0).rightAlign(!1);m.pie.dispatch.on("elementMouseover",k).on("elementMouseout",function(){e(".pt-tooltip").remove();h.chartOptions.currentDataIndex=null;h.chartOptions.currentSeriesIndex=null});if(h.options.exploreChart&&c)m.pie.dispatch.on("elementClick",function(q){q=
-q.data;h._chartExplore([["__other__"==q.index?c+"__belongs":c,q.key]])});d3.select(e(d).get(0)).append("svg").attr("class","nv").datum(f).transition().duration(1200).call(m);nv.utils.windowResize(m.update);return m})}},_renderBarChart:function(a,b,c,d){var f=this.chart;if(f){e(f).closest(".pt-chart-contents").show().css({width:"96%"});for(var g=[],l,h,k,m=0;m<b.length;m++){l={key:b[m][2]};h=[];for(var q=0;q<a.length;q++)k=a[q],h.push({label:k[4],value:k[2][m],filterIndex:k[0],filterKey:k[3]});l.values=
-h;g.push(l)}e(f).css({height:"360px"});c?e(f).siblings(".pt-chart-title").html("<h4>"+c+"</h4>"):e(f).siblings(".pt-chart-title").empty();var r=function(t){t=t.data;return'<div class="pt-tooltip"><div class="pt-tooltip-label" style="color:'+nv.utils.defaultColor()({},t.index)+'">'+t.label+'</div><div class="pt-tooltip-text">'+t.value+"</div></div>"},w=this,p=this.options.numberFormatter;nv.addGraph(function(){if(1<g.length){var t=nv.models.multiBarChart().x(function(y){return y.label}).y(function(y){return y.value}).staggerLabels(!0).showControls(!1);
-var C=t.multibar}else t=nv.models.discreteBarChart().x(function(y){return y.label}).y(function(y){return y.value}).staggerLabels(!0).showValues(!0),t.valueFormat(p),C=t.discretebar;t.tooltip.contentGenerator(r);t.yAxis.tickFormat(p);t.xAxis.tickFormat(function(y){return w._truncateLabel(y,18)});d3.select(e(f).get(0)).append("svg").attr("class","nv").datum(g).transition().duration(500).call(t);if(w.options.exploreChart&&d)C.dispatch.on("elementClick",function(y){var z=y.data.filterKey;null===z&&(z=
-"None");var v=d;"__other__"==y.data.filterIndex&&(v+="__belongs");w._chartExplore([[v,z]])});nv.utils.windowResize(t.update);return t})}},_renderBreakDown:function(a,b,c,d){var f=this.chart;if(f){e(f).closest(".pt-chart-contents").show().css({width:"96%"});var g=a.cells,l=[],h=[];if(0===b){var k=a.rows;var m=a.cols;a=function(v,x){return g[l[v]][h[x]].v[0]};var q=d[0];var r=d[1]}else k=a.cols,m=a.rows,a=function(v,x){return g[h[x]][l[v]].v[0]},q=d[1],r=d[0];var w;d=[];b=[];var p=0;for(w=k.length;p<
-w;p++)k[p][1]||(d.push(k[p]),l.push(p));p=0;for(w=m.length;p<w;p++)m[p][1]||(b.push(m[p]),h.push(p));var t=[];for(k=0;k<b.length;k++){m={key:b[k][4],filterIndex:b[k][0],filterKey:b[k][3]};p=[];for(w=0;w<d.length;w++)p.push({label:d[w][4],filterIndex:d[w][0],filterKey:d[w][3],value:a(w,k)});m.values=p;t.push(m)}a=Math.max(d.length*Math.max(16*(b.length+1),50)+70,360);e(f).css({height:a+"px"});c?e(f).siblings(".pt-chart-title").html("<h4>"+c+"</h4>"):e(f).siblings(".pt-chart-title").empty();var C=function(v){var x=
-v.series[0];v=v.data;return'<div class="pt-tooltip"><div class="pt-tooltip-label" style="color:'+nv.utils.defaultColor()({},v.index)+'">'+x.key+'</div><div class="pt-tooltip-text">'+v.label+': <span class="pt-tooltip-value">'+v.value+"</span></div></div>"},y=this,z=this.options.numberFormatter;nv.addGraph(function(){var v=nv.models.multiBarHorizontalChart().x(function(x){return x.label}).y(function(x){return x.value}).margin({top:20,right:20,bottom:20,left:175}).showValues(!0).duration(350).showControls(!0);
-v.tooltip.contentGenerator(C);v.valueFormat(z);v.yAxis.tickFormat(z);v.xAxis.tickFormat(function(x){return y._truncateLabel(x,24)});d3.select(e(f).get(0)).append("svg").attr("class","nv").datum(t).call(v);if(y.options.exploreChart&&q&&r)v.multibar.dispatch.on("elementClick",function(x){x=x.data;var E=d3.event.currentTarget.parentElement.__data__,D=E.filterKey;null===D&&(D="None");E="__other__"==E.filterIndex?r+"__belongs":r;var H=x.filterKey;null===H&&(H="None");y._chartExplore([["__other__"==x.filterIndex?
-q+"__belongs":q,H],[E,D]])});nv.utils.windowResize(v.update);return v})}},_renderSpectrum:function(a,b,c){var d=this.chart;if(d){var f=this,g=a.cells,l=a.labels;if("rows"==b){var h=a.rows;var k=a.cols;b=l.rows;var m=l.cols;var q=c[0];var r=c[1];var w=function(n,u){return g[n][u]}}else h=a.cols,k=a.rows,b=l.cols,m=l.rows,q=c[1],r=c[0],w=function(n,u){return g[u][n]};var p=function(n,u){return null===n?k[u]:null===u?h[n]:w(n,u)},t=function(n,u){u===J&&(u="silver");for(var B=[],A,F,G=0;G<k.length;G++)A=
-p(null,G),F=null===n?A[2][0]:p(n,G).v[0],!A[1]&&0<=A[2][0]&&B.push({filterIndex:A[0],filterKey:A[3],label:A[4],value:F,color:u});return B},C=[],y=0;for(c=0;c<h.length;c++){var z=p(c,null);!z[1]&&0<=z[2][0]&&(C.push({position:c,filterIndex:z[0],filterKey:z[3],label:z[4],value:z[2][0]}),y+=z[2][0])}f.chartOptions.currentDataIndex=null;e(d).removeAttr("style").closest(".pt-chart-contents").css({height:"auto"}).show();e(d).siblings(".pt-chart-title").empty();c=e('<div class="pt-spectrum-pie">').appendTo(d);
-d=e('<div class="pt-spectrum-bar">').appendTo(d);var v=this.options.numberFormatter,x=nv.models.discreteBarChart().x(function(n){return n.label}).y(function(n){return n.value}).color(["silver"]).staggerLabels(!0).showValues(!0);x.tooltip.contentGenerator(function(n){n=n.data;return'<div class="pt-tooltip"><div class="pt-tooltip-label" style="color:'+(n.color||["silver"])+'">'+n.label+'</div><div class="pt-tooltip-text">'+v(n.value)+"</div></div>"});x.valueFormat(v);x.yAxis.tickFormat(v);x.xAxis.tickFormat(function(n){return f._truncateLabel(n,
-18)});var E=d3.select(e(d).get(0)).append("svg").attr("class","nv");d=Math.floor(c.width()/2)-30;var D=nv.models.pieChart().x(function(n){return n.label}).y(function(n){return n.value}).height(280).width(d).margin({top:-20,left:20}).labelType("percent").labelThreshold(.1).showLegend(!1).donut(!0).donutRatio(.35);D.tooltip.enabled(!1);D.legend.align(!0).rightAlign(!1);D.pie.startAngle(function(n){return n.startAngle/2-Math.PI/2}).endAngle(function(n){return n.endAngle/2-Math.PI/2});D.pie.dispatch.on("elementMouseover",
-function(n){var u=n.index;if(f.chartOptions.currentDataIndex!=u){f._removeChartTooltip();f.chartOptions.currentDataIndex=u;n=n.data;var B=n.value,A=d3.event;f._renderChartTooltip(A.pageX,A.pageY,'<div class="pt-tooltip-label">'+n.label+'</div><div class="pt-tooltip-text">'+(B+" ("+Math.round(B/y*100)+"%)</div>"));e(".pt-tooltip-label").css({color:nv.utils.defaultColor()({},u)})}}).on("elementMouseout",function(){e(".pt-tooltip").remove();f.chartOptions.currentDataIndex=null;f.chartOptions.currentSeriesIndex=
-null});var H=d3.select(e(c).get(0)).append("svg").attr("class","nv").style({"min-width":d-30+"px"});d=d3.select(e(c).get(0)).append("div").attr("class","pt-spectrum-form");d.append("h4").html(l.layer+" "+l.per+" "+m);d.append("label").html(b+":");var I=d.append("select");I.append("option").attr("value","null").style("font-weight","bold").html(f.options.textAll);I.selectAll(".pt-series-item").data(C).enter().append("option").attr("class","pt-series-item").attr("value",function(n,u){return u}).html(function(n){return n.label});
-d.append("label").html(l.total+":");var M=d.append("span").text(a.total),K=function(n){if(null===n||f.chartOptions.currentSpectrumIndex==n){var u=function(F,G){return nv.utils.defaultColor()({},G)};H.selectAll(".nv-slice").style("fill",u).style("stroke",u);u=t(null);E.datum([{key:null,filterIndex:null,filterKey:null,values:u}]);x.update();f.chartOptions.currentSpectrumIndex=null;I.property("value","null");M.text(a.total)}else{var B=C[n],A=nv.utils.defaultColor()({},n);u=function(F,G){return G==n?
-A:"silver"};H.selectAll(".nv-slice").style("fill",u).style("stroke",u);u=t(B.position,A);E.datum([{key:B.position,filterIndex:B.filterIndex,filterKey:B.filterKey,values:u}]);x.update();f.chartOptions.currentSpectrumIndex=n;I.property("value",n);M.text(C[n].value)}};D.pie.dispatch.on("elementClick",function(n){K(n.index)});I.on("change.pt",function(){var n=d3.select(this).property("value");"null"==n?K(null):K(n)});nv.addGraph(function(){H.datum(C).transition().duration(1200).call(D);nv.utils.windowResize(D.update);
-return D});nv.addGraph(function(){E.datum([{key:null,filterIndex:null,filterKey:null,values:t(null)}]).transition().duration(500).call(x);if(f.options.exploreChart&&q&&r)x.discretebar.dispatch.on("elementClick",function(n){var u=n.data,B=d3.event.currentTarget.parentElement.__data__;n=B.filterIndex;B=B.filterKey;var A=u.filterIndex;u=u.filterKey;var F=[];null!==n&&F.push(["__other__"==n?q+"__belongs":q,B||"None"]);null!==A&&F.push(["__other__"==A?r+"__belongs":r,u||"None"]);f._chartExplore(F)});nv.utils.windowResize(x.update);
-return x})}},_chartExplore:function(a){var b=this.options,c=e(this.element).closest(".ui-tabs"),d=b.filterTab;if(c.length&&!1!==d)b=(b=b.filterForm)?e("#"+b):J,S3.search.setCurrentFilters(b,a),a=d?e("#"+d).index():0,c.tabs("option","active",a);else if(c=b.filterURL)a=this._updateURL(c,a),window.open(a,"_blank")},_cellExplore:function(a){if(e(".pt-cell-records",a).length)this._renderCellRecords(a,!1);else{var b=a.data("recordIDs");if(b.length){var c=e.Deferred(),d=this;c.promise().then(function(){d._renderCellRecords(a,
-b)});var f=this._updateAjaxURL({explore:"1"},null,!0),g=this.lookups,l=b.filter(function(m){return!g.hasOwnProperty(m)});if(l.length){var h=e(".pt-cell-zoom",a).hide(),k=e('<div class="inline-throbber">');k.css({display:"inline-block"}).insertAfter(h);e.ajaxS3({type:"POST",url:f,data:JSON.stringify(l),dataType:"json",contentType:"application/json; charset=utf-8",success:function(m){e.extend(d.lookups,m);c.resolve();k.remove();h.show()},error:function(){c.reject();k.remove();h.show()}})}else c.resolve()}}},
-_renderChartTooltip:function(a,b,c){e('<div class="pt-tooltip">'+c+"</div>").css({position:"absolute",display:"none",top:b-50,left:a+10,border:"1px solid #999",padding:"10px","min-height":"50px","max-width":"240px","z-index":"501","background-color":"white",color:"#000",opacity:.95}).appendTo("body").fadeIn(200)},_removeChartTooltip:function(){e(".pt-tooltip").remove();this.chartOptions.currentDataIndex=null;this.chartOptions.currentSeriesIndex=null},_getOptions:function(){var a="#"+e(this.element).attr("id");
-return{rows:e(a+"-rows").val(),cols:e(a+"-cols").val(),fact:e(a+"-fact").val(),totals:e(a+"-totals").is(":checked")?1:0}},_getFilters:function(){var a="#"+e(this.element).attr("id"),b=null;a=e(a+"-filters");if(a.length)try{b=S3.search.getCurrentFilters(a.first())}catch(c){}return b},_updateURL:function(a,b){var c=[],d={},f;if(b){var g=0;for(f=b.length;g<f;g++){var l=b[g];var h=l[0];d[h]=!0;c.push(h+"="+l[1])}}b=this.options.ajaxURL.split("?");if(1<b.length){l=b[1].split("&");b={};g=0;for(f=l.length;g<
-f;g++){var k=l[g].split("=");1<k.length&&(h=decodeURIComponent(k[0]),d[h]||(c.push(h+"="+decodeURIComponent(k[1])),b[h]=!0))}for(h in b)d[h]=!0}b=a.split("?");if(1<b.length)for(l=b[1].split("&"),g=0,f=l.length;g<f;g++)k=l[g].split("="),1<k.length&&(h=decodeURIComponent(k[0]),d[h]||c.push(h+"="+decodeURIComponent(k[1])));a=c.join("&");c=b[0];a&&(c=c+"?"+a);return c},_updateAjaxURL:function(a,b,c){var d=this.options.ajaxURL.split("?"),f=[],g=!1;if(1<d.length){var l=d[1];l=l.split("&")}else l="",l=[];
-if(a)for(m in a){var h=a[m];var k=m+"="+h;"totals"==m?this.options.showTotals=h?!0:!1:g||-1!=e.inArray(k,l)||(g=!0);f.push(k)}var m={};var q={},r;if(b){var w=function(t){var C,y,z=[];["contains","anyof","belongs","eq"].forEach(function(v){C=new RegExp("__"+v+"$","g");t.match(C)?y=C:z.push(v)});y&&z.forEach(function(v){q[t.replace(y,"__"+v)]=!0})};h=0;for(r=b.length;h<r;h++){k=b[h];var p=k[0];k=k[1];w(p);null===k?m[p]||(q[p]=!0):(q[p]&&(q[p]=!1),k=p+"="+encodeURIComponent(k),m[p]?m[p].push(k):m[p]=
-[k])}}h=0;for(r=l.length;h<r;h++)k=l[h].split("="),1<k.length&&(p=decodeURIComponent(k[0]),k=decodeURIComponent(k[1]),q[p]?g=!0:m[p]?g||-1!=e.inArray(p+"="+k,m[p])||(g=!0):"aggregate"!=p&&(a&&a.hasOwnProperty(p)||f.push(l[h])));for(p in m)for(h=0,r=m[p].length;h<r;h++)g||-1!=e.inArray(m[p][h],l)||(g=!0),f.push(m[p][h]);a=f.join("&");d=d[0];a&&(d=d+"?"+a);if(c)return d;this.options.ajaxURL=d;return g},_setExtension:function(a,b){var c=document.createElement("a");c.href=a;a=c.pathname.split("/");var d=
-[];a.length&&(a.forEach(function(g){var l=g.lastIndexOf(".");-1!=l?d.push(g.slice(0,l)):d.push(g)}),d[d.length-1]+="."+b,c.pathname=d.join("/"));var f=c.search;f&&(d=f.slice(1).split().filter(function(g){return"format"!=g.split("=")[0]}),a.length||d.push("format="+b),c.search="?"+d.join("&"));return c.href},reload:function(a,b,c){c="undefined"!=typeof c?c:!0;"undefined"==typeof b&&(b=this._getFilters());var d=this,f=this.element,g=f.find('input[type="hidden"][name="pivotdata"]');if(g.length){f.find(".pt-throbber").show();
-if(a||b)var l=this._updateAjaxURL(a,b);l||c?(a=this.options.ajaxURL,b=this.options.timeout,c=e.ajaxS3,e.searchS3!==J&&(c=e.searchS3),f.find(".pt-empty").hide(),d.openRequest&&(d.openRequest.onreadystatechange=null,d.openRequest.abort()),d.openRequest=c({timeout:b,url:a,dataType:"json",type:"GET",success:function(h){d.openRequest=null;g.first().val(JSON.stringify(h));d.refresh()},error:function(h,k,m){console.log("UNAUTHORIZED"==m?i18n.gis_requires_login:h.responseText)}})):d.refresh()}},_downloadXLSX:function(){if(this.element.find('input[type="hidden"][name="pivotdata"]').length){var a=
-this._getOptions(),b=this._getFilters();a=this._updateAjaxURL(a,b,!0);a=this._setExtension(a,"xlsx");e.searchDownloadS3!==J?e.searchDownloadS3(a,"_blank"):window.open(a)}},_bindEvents:function(){var a=this,b=e(this.element),c=this.eventNamespace,d="#"+b.attr("id");e(d+"-options legend").on("click"+c,function(){e(this).siblings().toggle();e(this).children().toggle()});e(d+"-filters legend").on("click"+c,function(){e(this).siblings().toggle();e(this).children().toggle()});e(".pt-hide-table",b).on("click"+
-c,function(){a.table_options.hidden=!0;e(".pt-table",b).hide();e(".pt-export-opt",b).hide();e(this).hide().siblings(".pt-show-table").show()});e(".pt-show-table",b).on("click"+c,function(){a.table_options.hidden=!1;e(".pt-table",b).show();e(".pt-export-opt",b).show();e(this).hide().siblings(".pt-hide-table").show()});e(".pt-export-xls",b).on("click"+c,function(){a._downloadXLSX()});e(d+"-totals").on("click"+c,function(){var g=e(this).is(":checked");a.options.showTotals!=g&&a.reload({totals:g},null,
-!1)});e(d+"-rows,"+d+"-cols,"+d+"-fact").on("change.autosubmit",function(){e(d+"-pt-form").trigger("optionChanged")});if(this.options.autoSubmit){var f=this.options.autoSubmit;e(d+"-pt-form").on("optionChanged",function(){var g=e(this);if(!g.data("noAutoSubmit")){var l=g.data("autoSubmitTimeout");l&&clearTimeout(l);l=setTimeout(function(){var h=a._getOptions(),k=a._getFilters();a.reload(h,k,!1)},f);g.data("autoSubmitTimeout",l)}})}else e(d+"-pt-form input.pt-submit").on("click"+c,function(){var g=
-a._getOptions(),l=a._getFilters();a.reload(g,l,!1)});e(d+" .pt-table .pt-cell-zoom").on("click"+c,function(g){g=e(g.currentTarget).closest(".pt-cell");g.length&&a._cellExplore(g)});e(d+"-pchart-rows").on("click"+c,function(){a._renderChart({type:"piechart",axis:"rows"})});e(d+"-vchart-rows").on("click"+c,function(){a._renderChart({type:"barchart",axis:"rows"})});e(d+"-schart-rows").on("click"+c,function(){a._renderChart({type:"spectrum",axis:"rows"})});e(d+"-hchart-rows").on("click"+c,function(){a._renderChart({type:"breakdown",
-axis:"rows"})});e(d+"-pchart-cols").on("click"+c,function(){a._renderChart({type:"piechart",axis:"cols"})});e(d+"-vchart-cols").on("click"+c,function(){a._renderChart({type:"barchart",axis:"cols"})});e(d+"-schart-cols").on("click"+c,function(){a._renderChart({type:"spectrum",axis:"cols"})});e(d+"-hchart-cols").on("click"+c,function(){a._renderChart({type:"breakdown",axis:"cols"})});e(".pt-hide-chart",b).on("click"+c,function(){a._renderChart(!1)})},_unbindEvents:function(){var a=e(this.element),b=
-"#"+a.attr("id"),c=this.eventNamespace;e(b+" .pt-table .pt-cell-zoom").off(c);e(b+"-options legend").off(c);e(b+"-filters legend").off(c);e(b+"-totals").off(c);e(b+"-rows,"+b+"-cols,"+b+"-fact").off("change.autosubmit");e(b+"-pt-form").off("optionChanged");e("input.pt-submit, .pt-export-xls",a).off(c);e(b+"-pchart-rows,"+b+"-vchart-rows,"+b+"-schart-rows,"+b+"-hchart-rows,"+b+"-pchart-cols,"+b+"-vchart-cols,"+b+"-schart-cols,"+b+"-hchart-cols").off(c);e(".pt-hide-table, .pt-show-table, .pt-hide-chart",
-a).off(c)}})})(jQuery);
+(function($,undefined){"use strict";var pivottableID=0;$.widget('s3.pivottable',{options:{showTotals:true,ajaxURL:null,defaultChart:{type:'breakdown',axis:'rows'},renderFilter:true,renderOptions:true,renderChart:true,renderTable:true,collapseFilter:false,collapseOptions:true,collapseChart:true,collapseTable:false,exploreChart:false,filterURL:null,filterForm:null,filterTab:null,autoSubmit:1000,timeout:10000,thousandSeparator:' ',thousandGrouping:'3',minTickSize:null,precision:null,textAll:'All',labelRecords:'Records',},_create:function(){this.id=pivottableID;pivottableID+=1;this.table=null;this.chart=null;this.openRequest=null;this.eventNamespace='.pt';},_init:function(){var $el=$(this.element),opts=this.options;this.data=null;this.table=null;this.chartOptions={currentChart:null,currentDataIndex:null,currentSeriesIndex:null,currentSpectrumIndex:null};this.table_options={hidden:false};var chart=$el.find('.pt-chart');if(chart.length){this.chart=chart.first();}else{this.chart=null;}
+if(!opts.renderFilter&&!opts.renderOptions){$el.find('.pt-form-container').hide();}else{var widgetID='#'+$el.attr('id');if(opts.renderOptions){$(widgetID+'-options').show();if(opts.collapseOptions){$(widgetID+'-options legend').siblings().toggle();$(widgetID+'-options legend').children().toggle();}}else{$(widgetID+'-options').hide();}
+if(opts.renderFilter){$(widgetID+'-filters').show();if(opts.collapseFilter){$(widgetID+'-filters legend').siblings().toggle();$(widgetID+'-filters legend').children().toggle();}}else{$(widgetID+'-options').hide();}}
+if(opts.collapseTable){this.table_options.hidden=true;$el.find('.pt-table').hide();$el.find('.pt-show-table').show();$el.find('.pt-hide-table').hide();}
+opts.numberFormatter=function(number){var decimals=opts.precision;if(number===null||typeof number=='undefined'){return'-';}
+var n=decimals||decimals==0?number.toFixed(decimals):number.toString();n=n.split('.');var n1=n[0],n2=n.length>1?'.'+n[1]:'';var re=new RegExp('\\B(?=(\\d{'+opts.thousandGrouping+'})+(?!\\d))','g');n1=n1.replace(re,opts.thousandSeparator);return n1+n2;};this.refresh();},_destroy:function(){if(this.table){this.table.remove();}
+if(this.chart){this.chart.empty();}},refresh:function(){var $el=$(this.element),data=null;this._unbindEvents();var pivotdata=$el.find('input[type="hidden"][name="pivotdata"]');if(pivotdata.length){data=JSON.parse($(pivotdata).first().val());}
+if(!data){data={empty:true};$el.find('.pt-hide-table').hide();$el.find('.pt-show-table').hide();$el.find('.pt-export-opt').hide();}else if(data.method=='count'){this.options.precision=0;this.options.minTickSize=1;}
+this.data=data;this.lookups={};if(data.nodata){$el.find('.pt-table').first().empty().append($('<div class="pt-no-data">'+data.nodata+'</div>'));$el.find('.pt-hide-table').hide();$el.find('.pt-show-table').hide();$el.find('.pt-export-opt').hide();this._renderChart();}else{this._renderTable();this._renderChartOptions();this._renderChart();}
+if(data.empty){$el.find('.pt-empty').show();}else{$el.find('.pt-empty').hide();}
+$el.find('.pt-freshness').remove();if(data.freshness){$el.find('.pt-table').first().after($('<div class="pt-freshness">').text(data.freshness));}
+if(this.options.autoSubmit){$el.find('.pt-submit').hide();}else{$el.find('.pt-submit').show();}
+this._bindEvents();$el.find('.pt-throbber').hide();},_renderTable:function(){var $el=$(this.element),container=$el.find('.pt-table').first().empty();this.table=null;var data=this.data;if(data.empty){return;}
+if(this.options.renderTable){var cells=data.cells.slice(0),cols=data.cols,rows=data.rows,total=data.total,labels=data.labels;var singleRow=false,singleCol=false,facts=data.facts;if(facts.length==1&&facts[0][1]!="list"){if(rows.length==1&&rows[0][4]===null){singleRow=true;}
+if(cols.length==1&&cols[0][4]===null){singleCol=true;}}
+var opts=this.options,showTotals=opts.showTotals,i;if(singleCol&&showTotals){cols=[];for(i=0;i<rows.length;i++){cells[i]=[];}}else{var notOther=function(cell,cidx){return cols[cidx][0]!='__other__';};for(i=0;i<rows.length;i++){cells[i]=cells[i].filter(notOther);}
+cols=cols.filter(function(col){return col[0]!='__other__';});}
+if(singleRow&&showTotals){rows=[];cells=[];}else{cells=cells.filter(function(row,ridx){return rows[ridx][0]!='__other__';});rows=rows.filter(function(row){return row[0]!='__other__';});}
+var table=d3.select(container.get(0)).append('table').attr('class','dataTable display report');table.append('thead').call(this._renderHeader,cols,labels,opts).call(this._renderColumns,cols,labels,singleCol);if(!singleRow||!showTotals){var pt=this;table.append('tbody').call(this._renderRows,pt,rows,cols,labels,cells,opts);}
+if(showTotals){table.append('tfoot').call(this._renderFooter,rows,cols,labels,total);}
+this.table=$(table.node());if(this.table_options.hidden){$el.find('.pt-show-table').show();$el.find('.pt-hide-table').hide();$el.find('.pt-export-opt').hide();}else{$el.find('.pt-show-table').hide();$el.find('.pt-hide-table').show();$el.find('.pt-export-opt').show();}}else{$el.find('.pt-show-table').hide();$el.find('.pt-hide-table').hide();$el.find('.pt-export-opt').hide();}},_renderHeader:function(thead,cols,labels,opts){var header=thead.append('tr');header.append('th').attr('scope','col').text(labels.layer);if(cols.length){header.append('th').attr({'scope':'col','colspan':cols.length}).text(labels.cols);}
+if(opts.showTotals){header.append('th').attr({'scope':'col','class':'pt-totals-header pt-row-total','rowspan':2}).text(labels.total);}
+return header;},_renderColumns:function(thead,cols,labels,singleCol){var columns=thead.append('tr');columns.append('th').attr({'scope':'col','class':'pt-rows-header'}).text(labels.rows);columns.selectAll('th.pt-data').data(cols).enter().append('th').attr({'scope':'col','class':'pt-col-label'}).text(function(d){if(singleCol){return'';}else{return d[4];}});return columns;},_renderRows:function(tbody,pt,rows,cols,labels,cells,opts){rows=tbody.selectAll('tr.pt-row').data(rows).enter().append('tr').attr('class',function(d,i){return i%2?'odd':'even';});rows.append('td').text(function(d){return d[4];});rows.selectAll('td.pt-cell').data(function(d,i){return cells[i];}).enter().append('td').attr('class','pt-cell').each(pt._renderCell,labels);if(opts.showTotals){rows.append('td').attr('class','pt-row-total').text(function(d){return d[2][0];});}
+return rows;},_renderCell:function(data,index,labels){var column=d3.select(this),items=data.i,layer;for(var i=0,len=items.length;i<len;i++){layer=items[i];var value=column.append('div').attr('class','pt-cell-value');if(layer===null){value.text(labels.none);}else if(Array.isArray(layer)){value.append('ul').selectAll('li').data(layer).enter().append('li').html(function(d){return d;});}else{value.text(layer);}
+if(len-i>1){value.append('span').text(' / ');}}
+var recordIDs=data.k;if(recordIDs&&recordIDs.length){$(column.node()).data('recordIDs',recordIDs);column.append('div').attr('class','pt-cell-zoom');}},_renderCellRecords:function(cell,recordIDs){var zoom=$('.pt-cell-zoom',cell).removeClass('opened'),records=$('.pt-cell-records',cell).remove();if(recordIDs){var lookups=this.lookups,recordList=[],recordRepr,keys=[];recordIDs.forEach(function(recordID){recordRepr=lookups[recordID];if(!recordRepr){return;}
+if(recordRepr.constructor===Array){var key=recordRepr[1];if(keys.indexOf(key)!=-1){return;}else{keys.push(key);}
+recordRepr=recordRepr[0];}
+if(recordRepr){recordList.push(recordRepr);}});records=$('<div class="pt-cell-records">');var list=$('<ul>').appendTo(records);if(recordList.length){recordList.sort(function(a,b){return a.localeCompare(b);});recordList.forEach(function(recordRepr){$('<li>').html(recordRepr).appendTo(list);});}else{$('<li>').text(recordIDs.length+' '+this.options.textRecords).appendTo(list);}
+zoom.addClass('opened').after(records);}},_renderFooter:function(tfoot,rows,cols,labels,total){var rowClass;if(rows.length%2){rowClass='odd';}else{rowClass='even';}
+var footer=tfoot.append('tr').attr('class',rowClass+' pt-totals-row');footer.append('th').attr({'class':'pt-totals-header','scope':'row'}).text(labels.total);footer.selectAll('td.pt-col-total').data(cols).enter().append('td').attr('class','pt-col-total').text(function(col){return col[2][0];});footer.append('td').attr('class','pt-total').text(total);return footer;},_renderChartOptions:function(){var $el=$(this.element);var container=$el.find('.pt-chart-controls').first().empty();var data=this.data;if(data.empty||!this.options.renderChart){return;}
+var labels=data.labels;var widgetID=$el.attr('id'),layerLabel=labels.layer,rowsLabel=labels.rows,colsLabel=labels.cols,per=labels.per,chartOpts=$('<div class="pt-chart-opts">');var pchartRows=widgetID+'-pchart-rows',vchartRows=widgetID+'-vchart-rows',hchartRows=widgetID+'-hchart-rows',schartRows=widgetID+'-schart-rows',pchartCols=widgetID+'-pchart-cols',vchartCols=widgetID+'-vchart-cols',hchartCols=widgetID+'-hchart-cols',schartCols=widgetID+'-schart-cols';if(layerLabel){$(chartOpts).append($('<span class="pt-chart-label">'+layerLabel+': </span>'));}
+if(rowsLabel){$(chartOpts).append($('<div id="'+pchartRows+'" class="pt-chart-icon pt-pchart"></div>'+'<div id="'+vchartRows+'" class="pt-chart-icon pt-vchart"></div>'+'<span class="pt-chart-label">'+per+' '+rowsLabel+'</span>'));}
+if(colsLabel){$(chartOpts).append($('<div id="'+pchartCols+'" class="pt-chart-icon pt-pchart"></div>'+'<div id="'+vchartCols+'" class="pt-chart-icon pt-vchart"></div>'+'<span class="pt-chart-label">'+per+' '+colsLabel+'</span>'));}
+if(rowsLabel&&colsLabel){$(chartOpts).append($('<span class="pt-chart-label">| '+labels.breakdown+': </span>'+'<div id="'+schartRows+'" class="pt-chart-icon pt-schart"></div>'+'<div id="'+hchartRows+'" class="pt-chart-icon pt-hchart"></div>'+'<span class="pt-chart-label">'+per+' '+rowsLabel+'</span>'+'<div id="'+schartCols+'"  class="pt-chart-icon pt-schart"></div>'+'<div id="'+hchartCols+'"  class="pt-chart-icon pt-hchart"></div>'+'<span class="pt-chart-label">'+per+' '+colsLabel+'</span>'));}
+$(container).append(chartOpts);},_truncateLabel:function(label,len){if(label&&label.length>len){return label.substring(0,len-3).replace(/\s+$/g,'')+'...';}else{return label;}},_renderChart:function(chartOptions){var $el=$(this.element),data=this.data;$('.pt-chart-contents',$el).hide();var chart=this.chart;if(chart){$(chart).off('plothover').off('plotclick').empty();}else{return;}
+if(data.empty||!this.options.renderChart){return;}
+if(chartOptions===false){this.options.collapseChart=true;return;}
+var collapseChart=this.options.collapseChart;if(typeof chartOptions=='undefined'||!chartOptions){if(collapseChart){return;}
+chartOptions=this.chartOptions.currentChart;}
+if(typeof chartOptions=='undefined'||!chartOptions){if(collapseChart){return;}
+chartOptions=this.options.defaultChart;}
+if(typeof chartOptions=='undefined'||!chartOptions){return;}
+this.options.collapseChart=false;this.chartOptions.currentChart=chartOptions;var chartType=chartOptions.type,chartAxis=chartOptions.axis,labels=data.labels;var per=labels.per,rowsTitle=labels.layer+' '+per+' '+labels.rows,colsTitle=labels.layer+' '+per+' '+labels.cols;var filter=data.filter;var rows_selector=filter[0],cols_selector=filter[1];if(chartType=='piechart'){if(chartAxis=='rows'){this._renderPieChart(data.rows,rowsTitle,rows_selector);}else{this._renderPieChart(data.cols,colsTitle,cols_selector);}}else if(chartType=='barchart'){if(chartAxis=='rows'){this._renderBarChart(data.rows,data.facts,rowsTitle,rows_selector);}else{this._renderBarChart(data.cols,data.facts,colsTitle,cols_selector);}}else if(chartType=='breakdown'){if(chartAxis=='rows'){this._renderBreakDown(data,0,rowsTitle,filter);}else{this._renderBreakDown(data,1,colsTitle,filter);}}else if(chartType=='spectrum'){this._renderSpectrum(data,chartAxis,filter);}},_renderPieChart:function(data,title,selector){var chart=this.chart;if(!chart){return;}
+var height=360;$(chart).css({height:height+'px'}).closest('.pt-chart-contents').show();if(title){$(chart).siblings('.pt-chart-title').html('<h4>'+title+'</h4>');}else{$(chart).siblings('.pt-chart-title').empty();}
+var items=[],total=0;for(var i=0;i<data.length;i++){var item=data[i];if(!item[1]&&item[2][0]>=0){items.push({index:item[0],label:item[4],value:item[2][0],key:item[3]});total+=item[2][0];}}
+var pt=this;pt.chartOptions.currentDataIndex=null;var onhoverTooltip=function(e){var index=e.index;if(pt.chartOptions.currentDataIndex==index){return;}
+pt._removeChartTooltip();pt.chartOptions.currentDataIndex=index;var data=e.data;var value=data.value;var percent=Math.round((value/total)*100);var tooltip='<div class="pt-tooltip-label">'+data.label+'</div>';tooltip+='<div class="pt-tooltip-text">'+value+' ('+percent+'%)</div>';var d3_event=d3.event,x=d3_event.pageX,y=d3_event.pageY;pt._renderChartTooltip(x,y,tooltip);$('.pt-tooltip-label').css({color:nv.utils.defaultColor()({},index)});};nv.addGraph(function(){var reportChart=nv.models.pieChart().x(function(d){return d.label;}).y(function(d){return d.value;}).labelsOutside(false).labelType('percent').labelThreshold(0.03).showLegend(true);reportChart.tooltip.enabled(false);reportChart.legend.align(true).rightAlign(false);reportChart.pie.dispatch.on('elementMouseover',onhoverTooltip).on('elementMouseout',function(){$('.pt-tooltip').remove();pt.chartOptions.currentDataIndex=null;pt.chartOptions.currentSeriesIndex=null;});if(pt.options.exploreChart&&selector){reportChart.pie.dispatch.on('elementClick',function(e){var data=e.data,index=data.index,key=data.key,fvar;if(index=='__other__'){fvar=selector+'__belongs';}else{fvar=selector;}
+pt._chartExplore([[fvar,key]]);});}
+d3.select($(chart).get(0)).append('svg').attr('class','nv').datum(items).transition().duration(1200).call(reportChart);nv.utils.windowResize(reportChart.update);return reportChart;});},_renderBarChart:function(data,facts,title,selector){var chart=this.chart;if(!chart){return;}
+$(chart).closest('.pt-chart-contents').show().css({width:'96%'});var items=[],series,set,item;for(var i=0;i<facts.length;i++){series={key:facts[i][2]};set=[];for(var j=0;j<data.length;j++){item=data[j];set.push({label:item[4],value:item[2][i],filterIndex:item[0],filterKey:item[3]});}
+series.values=set;items.push(series);}
+$(chart).css({height:'360px'});if(title){$(chart).siblings('.pt-chart-title').html('<h4>'+title+'</h4>');}else{$(chart).siblings('.pt-chart-title').empty();}
+var tooltipContent=function(data){data=data.data;var color=nv.utils.defaultColor()({},data.index);var tooltip='<div class="pt-tooltip">'+'<div class="pt-tooltip-label" style="color:'+color+'">'+data.label+'</div>'+'<div class="pt-tooltip-text">'+data.value+'</div>'+'</div>';return tooltip;};var pt=this,valueFormat=this.options.numberFormatter;nv.addGraph(function(){var reportChart,dispatch;if(items.length>1){reportChart=nv.models.multiBarChart().x(function(d){return d.label;}).y(function(d){return d.value;}).staggerLabels(true).showControls(false);dispatch=reportChart.multibar;}else{reportChart=nv.models.discreteBarChart().x(function(d){return d.label;}).y(function(d){return d.value;}).staggerLabels(true).showValues(true);reportChart.valueFormat(valueFormat);dispatch=reportChart.discretebar;}
+reportChart.tooltip.contentGenerator(tooltipContent);reportChart.yAxis.tickFormat(valueFormat);reportChart.xAxis.tickFormat(function(d){return pt._truncateLabel(d,18);});d3.select($(chart).get(0)).append('svg').attr('class','nv').datum(items).transition().duration(500).call(reportChart);if(pt.options.exploreChart&&selector){dispatch.dispatch.on('elementClick',function(e){var filterKey=e.data.filterKey;if(filterKey===null){filterKey='None';}
+var filterVar=selector;if(e.data.filterIndex=='__other__'){filterVar+='__belongs';}
+pt._chartExplore([[filterVar,filterKey]]);});}
+nv.utils.windowResize(reportChart.update);return reportChart;});},_renderBreakDown:function(data,dim,title,selectors){var chart=this.chart;if(!chart){return;}
+$(chart).closest('.pt-chart-contents').show().css({width:'96%'});var cells=data.cells,rdim,cdim,getData,ridx=[],cidx=[],rowsSelector,colsSelector;if(dim===0){rdim=data.rows;cdim=data.cols;getData=function(i,j){var ri=ridx[i],ci=cidx[j];return cells[ri][ci].v[0];};rowsSelector=selectors[0];colsSelector=selectors[1];}else{rdim=data.cols;cdim=data.rows;getData=function(i,j){var ri=ridx[i],ci=cidx[j];return cells[ci][ri].v[0];};rowsSelector=selectors[1];colsSelector=selectors[0];}
+var i,len,rows=[],cols=[];for(i=0,len=rdim.length;i<len;i++){if(!rdim[i][1]){rows.push(rdim[i]);ridx.push(i);}}
+for(i=0,len=cdim.length;i<len;i++){if(!cdim[i][1]){cols.push(cdim[i]);cidx.push(i);}}
+var matrix=[];for(var c=0;c<cols.length;c++){var series={key:cols[c][4],filterIndex:cols[c][0],filterKey:cols[c][3]},values=[];for(var r=0;r<rows.length;r++){values.push({label:rows[r][4],filterIndex:rows[r][0],filterKey:rows[r][3],value:getData(r,c)});}
+series.values=values;matrix.push(series);}
+var height=Math.max(rows.length*Math.max((cols.length+1)*16,50)+70,360);$(chart).css({height:height+'px'});if(title){$(chart).siblings('.pt-chart-title').html('<h4>'+title+'</h4>');}else{$(chart).siblings('.pt-chart-title').empty();}
+var tooltipContent=function(data){var series=data.series[0],item=data.data,seriesLabel=item.series;if(series){seriesLabel=series.key;}
+var color=nv.utils.defaultColor()({},item.index),tooltip='<div class="pt-tooltip">'+'<div class="pt-tooltip-label" style="color:'+color+'">'+series.key+'</div>'+'<div class="pt-tooltip-text">'+item.label+': <span class="pt-tooltip-value">'+item.value+'</span></div>'+'</div>';return tooltip;};var pt=this,valueFormat=this.options.numberFormatter;nv.addGraph(function(){var reportChart=nv.models.multiBarHorizontalChart().x(function(d){return d.label;}).y(function(d){return d.value;}).margin({top:20,right:20,bottom:20,left:175}).showValues(true).duration(350).showControls(true);reportChart.tooltip.contentGenerator(tooltipContent);reportChart.valueFormat(valueFormat);reportChart.yAxis.tickFormat(valueFormat);reportChart.xAxis.tickFormat(function(d){return pt._truncateLabel(d,24);});d3.select($(chart).get(0)).append('svg').attr('class','nv').datum(matrix).call(reportChart);if(pt.options.exploreChart&&rowsSelector&&colsSelector){reportChart.multibar.dispatch.on('elementClick',function(e){var data=e.data,series=d3.event.currentTarget.parentElement.__data__,columnKey=series.filterKey,columnFilter;if(columnKey===null){columnKey='None';}
+if(series.filterIndex=='__other__'){columnFilter=colsSelector+'__belongs';}else{columnFilter=colsSelector;}
+var rowKey=data.filterKey,rowFilter;if(rowKey===null){rowKey='None';}
+if(data.filterIndex=='__other__'){rowFilter=rowsSelector+'__belongs';}else{rowFilter=rowsSelector;}
+var filterVars=[[rowFilter,rowKey],[columnFilter,columnKey]];pt._chartExplore(filterVars);});}
+nv.utils.windowResize(reportChart.update);return reportChart;});},_renderSpectrum:function(data,axis,selectors){var chart=this.chart;if(!chart){return;}
+var pt=this,defaultColor='silver';var cells=data.cells,labels=data.labels,xAxis,yAxis,xLabel,yLabel,xSelector,ySelector,getCell;if(axis=='rows'){xAxis=data.rows;yAxis=data.cols;xLabel=labels.rows;yLabel=labels.cols;xSelector=selectors[0];ySelector=selectors[1];getCell=function(xIndex,yIndex){return cells[xIndex][yIndex];};}else{xAxis=data.cols;yAxis=data.rows;xLabel=labels.cols;yLabel=labels.rows;xSelector=selectors[1];ySelector=selectors[0];getCell=function(xIndex,yIndex){return cells[yIndex][xIndex];};}
+var getData=function(xIndex,yIndex){if(xIndex===null){return yAxis[yIndex];}else if(yIndex===null){return xAxis[xIndex];}else{return getCell(xIndex,yIndex);}};var getSeries=function(xIndex,color){if(color===undefined){color=defaultColor;}
+var items=[],item,value;for(var i=0;i<yAxis.length;i++){item=getData(null,i);if(xIndex===null){value=item[2][0];}else{value=getData(xIndex,i).v[0];}
+if(!item[1]&&item[2][0]>=0){items.push({filterIndex:item[0],filterKey:item[3],label:item[4],value:value,color:color});}}
+return items;};var xHeaders=[],total=0;for(var i=0;i<xAxis.length;i++){var item=getData(i,null);if(!item[1]&&item[2][0]>=0){xHeaders.push({position:i,filterIndex:item[0],filterKey:item[3],label:item[4],value:item[2][0]});total+=item[2][0];}}
+pt.chartOptions.currentDataIndex=null;var onhoverTooltip=function(e){var index=e.index;if(pt.chartOptions.currentDataIndex==index){return;}
+pt._removeChartTooltip();pt.chartOptions.currentDataIndex=index;var data=e.data;var value=data.value;var percent=Math.round((value/total)*100);var tooltip='<div class="pt-tooltip-label">'+data.label+'</div>';tooltip+='<div class="pt-tooltip-text">'+value+' ('+percent+'%)</div>';var d3_event=d3.event,x=d3_event.pageX,y=d3_event.pageY;pt._renderChartTooltip(x,y,tooltip);$('.pt-tooltip-label').css({color:nv.utils.defaultColor()({},index)});};$(chart).removeAttr('style').closest('.pt-chart-contents').css({'height':'auto'}).show();$(chart).siblings('.pt-chart-title').empty();var pieArea=$('<div class="pt-spectrum-pie">').appendTo(chart),barArea=$('<div class="pt-spectrum-bar">').appendTo(chart);var valueFormat=this.options.numberFormatter;var barChartTooltip=function(data){data=data.data;var color=data.color||[defaultColor];var tooltip='<div class="pt-tooltip">'+'<div class="pt-tooltip-label" style="color:'+color+'">'+data.label+'</div>'+'<div class="pt-tooltip-text">'+valueFormat(data.value)+'</div>'+'</div>';return tooltip;};var barChart=nv.models.discreteBarChart().x(function(d){return d.label;}).y(function(d){return d.value;}).color([defaultColor]).staggerLabels(true).showValues(true);barChart.tooltip.contentGenerator(barChartTooltip);barChart.valueFormat(valueFormat);barChart.yAxis.tickFormat(valueFormat);barChart.xAxis.tickFormat(function(d){return pt._truncateLabel(d,18);});var barChartContainer=d3.select($(barArea).get(0)).append('svg').attr('class','nv');var pieWidth=Math.floor(pieArea.width()/2)-30;var pieChart=nv.models.pieChart().x(function(d){return d.label;}).y(function(d){return d.value;}).height(280).width(pieWidth).margin({top:-20,left:20}).labelType('percent').labelThreshold(0.10).showLegend(false).donut(true).donutRatio(0.35);pieChart.tooltip.enabled(false);pieChart.legend.align(true).rightAlign(false);pieChart.pie.startAngle(function(d){return d.startAngle/2-Math.PI/2;}).endAngle(function(d){return d.endAngle/2-Math.PI/2;});pieChart.pie.dispatch.on('elementMouseover',onhoverTooltip).on('elementMouseout',function(){$('.pt-tooltip').remove();pt.chartOptions.currentDataIndex=null;pt.chartOptions.currentSeriesIndex=null;});var pieChartContainer=d3.select($(pieArea).get(0)).append('svg').attr('class','nv').style({'min-width':(pieWidth-30)+'px'});var formArea=d3.select($(pieArea).get(0)).append('div').attr('class','pt-spectrum-form');formArea.append('h4').html(labels.layer+' '+labels.per+' '+yLabel);formArea.append('label').html(xLabel+':');var seriesSelector=formArea.append('select');seriesSelector.append('option').attr('value','null').style('font-weight','bold').html(pt.options.textAll);seriesSelector.selectAll('.pt-series-item').data(xHeaders).enter().append('option').attr('class','pt-series-item').attr('value',function(d,i){return i;}).html(function(d){return d.label;});formArea.append('label').html(labels.total+':');var totalValue=formArea.append('span').text(data.total);var selectSeries=function(xIndex){var sliceColor,items;if(xIndex===null||pt.chartOptions.currentSpectrumIndex==xIndex){sliceColor=function(d,i){return nv.utils.defaultColor()({},i);};pieChartContainer.selectAll('.nv-slice').style('fill',sliceColor).style('stroke',sliceColor);items=getSeries(null);barChartContainer.datum([{key:null,filterIndex:null,filterKey:null,values:items}]);barChart.update();pt.chartOptions.currentSpectrumIndex=null;seriesSelector.property('value','null');totalValue.text(data.total);}else{var seriesHeader=xHeaders[xIndex],color=nv.utils.defaultColor()({},xIndex);sliceColor=function(d,i){if(i==xIndex){return color;}else{return defaultColor;}};pieChartContainer.selectAll('.nv-slice').style('fill',sliceColor).style('stroke',sliceColor);items=getSeries(seriesHeader.position,color);barChartContainer.datum([{key:seriesHeader.position,filterIndex:seriesHeader.filterIndex,filterKey:seriesHeader.filterKey,values:items}]);barChart.update();pt.chartOptions.currentSpectrumIndex=xIndex;seriesSelector.property('value',xIndex);totalValue.text(xHeaders[xIndex].value);}};pieChart.pie.dispatch.on('elementClick',function(e){selectSeries(e.index);});seriesSelector.on('change.pt',function(){var xIndex=d3.select(this).property('value');if(xIndex=='null'){selectSeries(null);}else{selectSeries(xIndex);}});nv.addGraph(function(){pieChartContainer.datum(xHeaders).transition().duration(1200).call(pieChart);nv.utils.windowResize(pieChart.update);return pieChart;});nv.addGraph(function(){barChartContainer.datum([{key:null,filterIndex:null,filterKey:null,values:getSeries(null)}]).transition().duration(500).call(barChart);if(pt.options.exploreChart&&xSelector&&ySelector){barChart.discretebar.dispatch.on('elementClick',function(e){var data=e.data,series=d3.event.currentTarget.parentElement.__data__,xIndex=series.filterIndex,xKey=series.filterKey,yIndex=data.filterIndex,yKey=data.filterKey,filters=[];var filterExpression=function(selector,index,key){if(key===null&&index!==null){key='None';}
+if(index=='__other__'){return selector+'__belongs';}else{return selector;}};if(xIndex!==null){var xFilter=filterExpression(xSelector,xIndex,xKey);filters.push([xFilter,xKey||'None']);}
+if(yIndex!==null){var yFilter=filterExpression(ySelector,yIndex,yKey);filters.push([yFilter,yKey||'None']);}
+pt._chartExplore(filters);});}
+nv.utils.windowResize(barChart.update);return barChart;});},_chartExplore:function(filter){var opts=this.options,summaryTabs=$(this.element).closest('.ui-tabs');var tab=opts.filterTab;if(summaryTabs.length&&tab!==false){var filterForm=opts.filterForm;var $filterForm=filterForm?$('#'+filterForm):undefined;S3.search.setCurrentFilters($filterForm,filter);var index=tab?$('#'+tab).index():0;summaryTabs.tabs('option','active',index);}else{var filterURL=opts.filterURL;if(filterURL){var page=this._updateURL(filterURL,filter);window.open(page,'_blank');}}
+return;},_cellExplore:function(cell){var records=$('.pt-cell-records',cell);if(records.length){this._renderCellRecords(cell,false);return;}
+var recordIDs=cell.data('recordIDs');if(recordIDs.length){var dfd=$.Deferred(),self=this;dfd.promise().then(function(){self._renderCellRecords(cell,recordIDs);});var ajaxURL=this._updateAjaxURL({'explore':'1'},null,true),lookups=this.lookups;var unknowns=recordIDs.filter(function(recordID){return!lookups.hasOwnProperty(recordID);});if(!unknowns.length){dfd.resolve();}else{var zoom=$('.pt-cell-zoom',cell).hide(),throbber=$('<div class="inline-throbber">');throbber.css({'display':'inline-block'}).insertAfter(zoom);$.ajaxS3({type:'POST',url:ajaxURL,data:JSON.stringify(unknowns),dataType:'json',contentType:'application/json; charset=utf-8',success:function(data){$.extend(self.lookups,data);dfd.resolve();throbber.remove();zoom.show();},error:function(){dfd.reject();throbber.remove();zoom.show();}});}}},_renderChartTooltip:function(x,y,contents){$('<div class="pt-tooltip">'+contents+'</div>').css({position:'absolute',display:'none',top:y-50,left:x+10,border:'1px solid #999','padding':'10px','min-height':'50px','max-width':'240px','z-index':'501','background-color':'white',color:'#000',opacity:0.95}).appendTo('body').fadeIn(200);},_removeChartTooltip:function(){$('.pt-tooltip').remove();this.chartOptions.currentDataIndex=null;this.chartOptions.currentSeriesIndex=null;},_getOptions:function(){var widgetID='#'+$(this.element).attr('id');return{rows:$(widgetID+'-rows').val(),cols:$(widgetID+'-cols').val(),fact:$(widgetID+'-fact').val(),totals:$(widgetID+'-totals').is(':checked')?1:0};},_getFilters:function(){var widgetID='#'+$(this.element).attr('id'),filters=null;var filterForm=$(widgetID+'-filters');if(filterForm.length){try{filters=S3.search.getCurrentFilters(filterForm.first());}catch(e){}}
+return filters;},_updateURL:function(url,filters){var urlParts,urlVars,queries=[],update={},seen={},i,len,f,q,k;if(filters){for(i=0,len=filters.length;i<len;i++){f=filters[i];k=f[0];update[k]=true;queries.push(k+'='+f[1]);}}
+var ajaxURL=this.options.ajaxURL;urlParts=ajaxURL.split('?');if(urlParts.length>1){urlVars=urlParts[1].split('&');seen={};for(i=0,len=urlVars.length;i<len;i++){q=urlVars[i].split('=');if(q.length>1){k=decodeURIComponent(q[0]);if(!update[k]){queries.push(k+'='+decodeURIComponent(q[1]));seen[k]=true;}}}
+for(k in seen){update[k]=true;}}
+urlParts=url.split('?');if(urlParts.length>1){urlVars=urlParts[1].split('&');seen={};for(i=0,len=urlVars.length;i<len;i++){q=urlVars[i].split('=');if(q.length>1){k=decodeURIComponent(q[0]);if(!update[k]){queries.push(k+'='+decodeURIComponent(q[1]));}}}}
+var urlQuery=queries.join('&');var filteredURL=urlParts[0];if(urlQuery){filteredURL=filteredURL+'?'+urlQuery;}
+return filteredURL;},_updateAjaxURL:function(options,filters,noupdate){var ajaxURL=this.options.ajaxURL;var urlParts=ajaxURL.split('?'),query=[],needsReload=false;var qstr,urlVars;if(urlParts.length>1){qstr=urlParts[1];urlVars=qstr.split('&');}else{qstr='';urlVars=[];}
+var option,q,newopt;if(options){for(option in options){newopt=options[option];q=option+'='+newopt;if(option=='totals'){this.options.showTotals=newopt?true:false;}else if(!(needsReload||$.inArray(q,urlVars)!=-1)){needsReload=true;}
+query.push(q);}}
+var update={},remove={},subquery,i,len,k,v;if(filters){var removeIncompatible=function(k){var exclusive=['contains','anyof','belongs','eq'],pattern,match,incompatible=[];exclusive.forEach(function(op){pattern=new RegExp('__'+op+'$','g');if(k.match(pattern)){match=pattern;}else{incompatible.push(op);}});if(match){incompatible.forEach(function(op){remove[k.replace(match,'__'+op)]=true;});}};for(i=0,len=filters.length;i<len;i++){q=filters[i];k=q[0];v=q[1];removeIncompatible(k);if(v===null){if(!update[k]){remove[k]=true;}}else{if(remove[k]){remove[k]=false;}
+subquery=k+'='+encodeURIComponent(v);if(update[k]){update[k].push(subquery);}else{update[k]=[subquery];}}}}
+for(i=0,len=urlVars.length;i<len;i++){q=urlVars[i].split('=');if(q.length>1){k=decodeURIComponent(q[0]);v=decodeURIComponent(q[1]);if(remove[k]){needsReload=true;continue;}else if(update[k]){if(!(needsReload||$.inArray(k+'='+v,update[k])!=-1)){needsReload=true;}
+continue;}else if(k=='aggregate'){continue;}else if(options&&options.hasOwnProperty(k)){continue;}else{query.push(urlVars[i]);}}}
+for(k in update){for(i=0,len=update[k].length;i<len;i++){if(!(needsReload||$.inArray(update[k][i],urlVars)!=-1)){needsReload=true;}
+query.push(update[k][i]);}}
+var urlQuery=query.join('&'),filteredURL=urlParts[0];if(urlQuery){filteredURL=filteredURL+'?'+urlQuery;}
+if(noupdate){return filteredURL;}else{this.options.ajaxURL=filteredURL;return needsReload;}},_setExtension:function(url,extension){var parser=document.createElement('a');parser.href=url;var path=parser.pathname.split('/'),items=[];if(path.length){path.forEach(function(item){var idx=item.lastIndexOf('.');if(idx!=-1){items.push(item.slice(0,idx));}else{items.push(item);}});items[items.length-1]+='.'+extension;parser.pathname=items.join('/');}
+var search=parser.search;if(search){items=search.slice(1).split().filter(function(query){return query.split('=')[0]!='format';});if(!path.length){items.push('format='+extension);}
+parser.search='?'+items.join('&');}
+return parser.href;},reload:function(options,filters,force){force=typeof force!='undefined'?force:true;if(typeof filters=='undefined'){filters=this._getFilters();}
+var pt=this,$el=(this.element),needsReload,pivotdata=$el.find('input[type="hidden"][name="pivotdata"]');if(!pivotdata.length){return;}
+$el.find('.pt-throbber').show();if(options||filters){needsReload=this._updateAjaxURL(options,filters);}
+if(needsReload||force){var ajaxURL=this.options.ajaxURL,timeout=this.options.timeout,ajaxMethod=$.ajaxS3;if($.searchS3!==undefined){ajaxMethod=$.searchS3;}
+$el.find('.pt-empty').hide();if(pt.openRequest){pt.openRequest.onreadystatechange=null;pt.openRequest.abort();}
+pt.openRequest=ajaxMethod({'timeout':timeout,'url':ajaxURL,'dataType':'json','type':'GET','success':function(data){pt.openRequest=null;pivotdata.first().val(JSON.stringify(data));pt.refresh();},'error':function(jqXHR,textStatus,errorThrown){var msg;if(errorThrown=='UNAUTHORIZED'){msg=i18n.gis_requires_login;}else{msg=jqXHR.responseText;}
+console.log(msg);}});}else{pt.refresh();}},_downloadXLSX:function(){var pivotdata=this.element.find('input[type="hidden"][name="pivotdata"]');if(!pivotdata.length){return;}
+var options=this._getOptions(),filters=this._getFilters();var ajaxURL=this._updateAjaxURL(options,filters,true);var downloadURL=this._setExtension(ajaxURL,'xlsx');if($.searchDownloadS3!==undefined){$.searchDownloadS3(downloadURL,'_blank');}else{window.open(downloadURL);}},_bindEvents:function(){var pt=this,el=$(this.element),ns=this.eventNamespace,widgetID='#'+el.attr('id');$(widgetID+'-options legend').on('click'+ns,function(){$(this).siblings().toggle();$(this).children().toggle();});$(widgetID+'-filters legend').on('click'+ns,function(){$(this).siblings().toggle();$(this).children().toggle();});$('.pt-hide-table',el).on('click'+ns,function(){pt.table_options.hidden=true;$('.pt-table',el).hide();$('.pt-export-opt',el).hide();$(this).hide().siblings('.pt-show-table').show();});$('.pt-show-table',el).on('click'+ns,function(){pt.table_options.hidden=false;$('.pt-table',el).show();$('.pt-export-opt',el).show();$(this).hide().siblings('.pt-hide-table').show();});$('.pt-export-xls',el).on('click'+ns,function(){pt._downloadXLSX();});$(widgetID+'-totals').on('click'+ns,function(){var show_totals=$(this).is(':checked');if(pt.options.showTotals!=show_totals){pt.reload({totals:show_totals},null,false);}});$(widgetID+'-rows,'+
+widgetID+'-cols,'+
+widgetID+'-fact').on('change.autosubmit',function(){$(widgetID+'-pt-form').trigger('optionChanged');});if(this.options.autoSubmit){var timeout=this.options.autoSubmit;$(widgetID+'-pt-form').on('optionChanged',function(){var that=$(this);if(that.data('noAutoSubmit')){return;}
+var timer=that.data('autoSubmitTimeout');if(timer){clearTimeout(timer);}
+timer=setTimeout(function(){var options=pt._getOptions(),filters=pt._getFilters();pt.reload(options,filters,false);},timeout);that.data('autoSubmitTimeout',timer);});}else{$(widgetID+'-pt-form input.pt-submit').on('click'+ns,function(){var options=pt._getOptions(),filters=pt._getFilters();pt.reload(options,filters,false);});}
+$(widgetID+' .pt-table .pt-cell-zoom').on('click'+ns,function(event){var zoom=$(event.currentTarget),cell=zoom.closest('.pt-cell');if(cell.length){pt._cellExplore(cell);}});$(widgetID+'-pchart-rows').on('click'+ns,function(){pt._renderChart({type:'piechart',axis:'rows'});});$(widgetID+'-vchart-rows').on('click'+ns,function(){pt._renderChart({type:'barchart',axis:'rows'});});$(widgetID+'-schart-rows').on('click'+ns,function(){pt._renderChart({type:'spectrum',axis:'rows'});});$(widgetID+'-hchart-rows').on('click'+ns,function(){pt._renderChart({type:'breakdown',axis:'rows'});});$(widgetID+'-pchart-cols').on('click'+ns,function(){pt._renderChart({type:'piechart',axis:'cols'});});$(widgetID+'-vchart-cols').on('click'+ns,function(){pt._renderChart({type:'barchart',axis:'cols'});});$(widgetID+'-schart-cols').on('click'+ns,function(){pt._renderChart({type:'spectrum',axis:'cols'});});$(widgetID+'-hchart-cols').on('click'+ns,function(){pt._renderChart({type:'breakdown',axis:'cols'});});$('.pt-hide-chart',el).on('click'+ns,function(){pt._renderChart(false);});},_unbindEvents:function(){var el=$(this.element),widgetID='#'+el.attr('id'),ns=this.eventNamespace;$(widgetID+' .pt-table .pt-cell-zoom').off(ns);$(widgetID+'-options legend').off(ns);$(widgetID+'-filters legend').off(ns);$(widgetID+'-totals').off(ns);$(widgetID+'-rows,'+
+widgetID+'-cols,'+
+widgetID+'-fact').off('change.autosubmit');$(widgetID+'-pt-form').off('optionChanged');$('input.pt-submit, .pt-export-xls',el).off(ns);$(widgetID+'-pchart-rows,'+
+widgetID+'-vchart-rows,'+
+widgetID+'-schart-rows,'+
+widgetID+'-hchart-rows,'+
+widgetID+'-pchart-cols,'+
+widgetID+'-vchart-cols,'+
+widgetID+'-schart-cols,'+
+widgetID+'-hchart-cols').off(ns);$('.pt-hide-table, .pt-show-table, .pt-hide-chart',el).off(ns);}});})(jQuery);
\ No newline at end of file
@@ -0,0 +1,15 @@
+#!/usr/bin/python
+
+# This is a script to rebuild the Affiliation Closure in the Database
+
+# Needs to be run in the web2py environment
+# python web2py.py -S eden -M -R applications/eden/static/scripts/tools/pr_rebuild_closure.py
+
+s3db.pr_affiliation_closure
+print("Rebuilt closure: %s entries" % s3db.pr_rebuild_closure())
+
+errors = s3db.pr_check_closure()
+for key in ("missing", "obsolete", "depth"):
+    print("%s: %s" % (key, errors[key]))
+
+db.commit()